@@ -2,6 +2,7 @@
 Collection of unit tests for the Brown Distortion model.
 """
 
+import numpy as np
 import pytest
 
 from pyalicevision import camera as av
@@ -12,14 +13,14 @@ from pyalicevision import camera as av
 # - DistortionBrown(double p1, double p2, double p3, double p4, double p5) => DONE
 # - EDISTORTION getType() => DONE
 # - DistortionBrown* clone() => DONE
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-#                       / unsupported by this class
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-#                       / unsupported by this class
+# - Vec2 addDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) => DONE
+# - Vec2 removeDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) => DONE
+#                       / unsupported by this class, raises a RuntimeError
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) => DONE
+#                       / unsupported by this class, raises a RuntimeError
 #
 ### Inherited functions (Distortion):
 # - bool operator==(Distortion& other) => DONE
@@ -123,18 +124,54 @@ def test_distortion_brown_clone():
         "updated values"
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_distortion_brown_add_remove_distortion():
     """ Test creating a DistortionBrown object and adding/removing the
     distortion to a point. """
-    assert True
+    point = np.array([0.2, -0.1])
+
+    # For default DistortionBrown models, the parameters are set to 0, so
+    # the distortion should not have any effect
+    distortion1 = av.DistortionBrown()
+    assert np.allclose(distortion1.addDistortion(point), point), \
+        "Adding the distortion with default parameters should not modify the point"
+    assert np.allclose(distortion1.removeDistortion(point), point), \
+        "Removing the distortion with default parameters should not modify the point"
+
+    distortion2 = av.DistortionBrown(0.1, 0.2, 0.3, 0.4, 0.5)
+    distorted = distortion2.addDistortion(point)
+    assert distorted.shape == (2,), "The distorted point should be returned as a 2D vector"
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion with non-default parameters should modify the point"
+    assert np.allclose(distortion2.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    # Any array-like object is accepted as input
+    assert np.allclose(distortion2.addDistortion(list(point)), distorted), \
+        "The distortion should be the same for a list and a NumPy array"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_brown_get_derivative_add():
     """ Test creating a DistortionBrown object, adding the distortion to a point,
     and getting the derivative with respect to that point. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionBrown(0.1, 0.2, 0.3, 0.4, 0.5)
+
+    derivative_pt = distortion.getDerivativeAddDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Compare with the numerical derivative
+    eps = 1e-6
+    for idx in range(2):
+        delta = np.zeros(2)
+        delta[idx] = eps
+        numerical = (distortion.addDistortion(point + delta) -
+                     distortion.addDistortion(point - delta)) / (2 * eps)
+        assert np.allclose(derivative_pt[:, idx], numerical, atol=1e-6), \
+            "The derivative wrt the point does not match the numerical derivative"
+
+    derivative_disto = distortion.getDerivativeAddDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 5), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
 def test_distortion_brown_get_radius():
@@ -160,3 +197,16 @@ def test_distortion_brown_compare():
     distortion1.setParameters(NON_DEFAULT_PARAMETERS)
     assert not distortion1 == distortion2, \
         "The parameters of the first object have been updated"
+
+
+def test_distortion_brown_get_derivative_remove():
+    """ Test creating a DistortionBrown object and checking that getting the derivatives
+    with the distortion removed is reported as unsupported. """
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionBrown(0.1, 0.2, 0.3, 0.4, 0.5)
+
+    with pytest.raises(RuntimeError):
+        distortion.getDerivativeRemoveDistoWrtPt(point)
+
+    with pytest.raises(RuntimeError):
+        distortion.getDerivativeRemoveDistoWrtDisto(point)
@@ -2,7 +2,7 @@
 Collection of unit tests for the Fisheye Distortion model.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import camera as av
 
@@ -12,12 +12,12 @@ from pyalicevision import camera as av
 # - DistortionFisheye(double p1, double p2, double p3, double p4) => DONE
 # - EDISTORTION getType() => DONE
 # - DistortionFisheye* clone() => DONE
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
+# - Vec2 addDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) => DONE
+# - Vec2 removeDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) => DONE
 #
 ### Inherited functions (Distortion):
 # - bool operator==(Distortion& other) => DONE
@@ -121,25 +121,75 @@ def test_distortion_fisheye_clone():
         "updated values"
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_distortion_fisheye_add_remove_distortion():
     """ Test creating a DistortionFisheye object and adding/removing the
     distortion to a point. """
-    assert True
+    point = np.array([0.2, -0.1])
+
+    # Even with default parameters, the DistortionFisheye model maps the radius to the angle
+    # of the incoming ray, so the point is modified
+    distortion1 = av.DistortionFisheye()
+    distorted = distortion1.addDistortion(point)
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion should modify the point"
+    assert np.allclose(distortion1.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    distortion2 = av.DistortionFisheye(0.1, 0.2, 0.3, 0.4)
+    distorted = distortion2.addDistortion(point)
+    assert distorted.shape == (2,), "The distorted point should be returned as a 2D vector"
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion with non-default parameters should modify the point"
+    assert np.allclose(distortion2.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    # Any array-like object is accepted as input
+    assert np.allclose(distortion2.addDistortion(list(point)), distorted), \
+        "The distortion should be the same for a list and a NumPy array"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_fisheye_get_derivative_add():
     """ Test creating a DistortionFisheye object, adding the distortion to a point,
     and getting the derivative with respect to that point. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionFisheye(0.1, 0.2, 0.3, 0.4)
+
+    derivative_pt = distortion.getDerivativeAddDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Compare with the numerical derivative
+    eps = 1e-6
+    for idx in range(2):
+        delta = np.zeros(2)
+        delta[idx] = eps
+        numerical = (distortion.addDistortion(point + delta) -
+                     distortion.addDistortion(point - delta)) / (2 * eps)
+        assert np.allclose(derivative_pt[:, idx], numerical, atol=1e-6), \
+            "The derivative wrt the point does not match the numerical derivative"
+
+    derivative_disto = distortion.getDerivativeAddDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 4), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_fisheye_get_derivative_remove():
     """ Test creating a DistortionFisheye object, and getting the derivatives with
     the distortion removed. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionFisheye(0.1, 0.2, 0.3, 0.4)
+
+    derivative_pt = distortion.getDerivativeRemoveDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Removing then adding the distortion is the identity
+    undistorted = distortion.removeDistortion(point)
+    assert np.allclose(derivative_pt @ distortion.getDerivativeAddDistoWrtPt(undistorted),
+                       np.identity(2)), \
+        "The derivatives for adding and removing the distortion should be inverse matrices"
+
+    derivative_disto = distortion.getDerivativeRemoveDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 4), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
 def test_distortion_fisheye_get_radius():
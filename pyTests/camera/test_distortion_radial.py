@@ -2,7 +2,7 @@
 Collection of unit tests for the Radial Distortion models.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import camera as av
 
@@ -13,12 +13,12 @@ from pyalicevision import camera as av
 # - DistortionRadialK1(double k1) => DONE
 # - EDISTORTION getType() => DONE
 # - DistortionRadialK1* clone() => DONE
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
+# - Vec2 addDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) => DONE
+# - Vec2 removeDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) => DONE
 # - double getUndistortedRadius(double r) => DONE
 # - [static] double distoFunction(vector<double>& params, double r2) => DONE
 #
@@ -27,12 +27,12 @@ from pyalicevision import camera as av
 # - DistortionRadialK3(double k1, double k2, double k3) => DONE
 # - EDISTORTION getType() => DONE
 # - DistortionRadialK3* clone() => DONE
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
+# - Vec2 addDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) => DONE
+# - Vec2 removeDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) => DONE
 # - double getUndistortedRadius(double r) => DONE
 # - [static] double distoFunction(vector<double>& params, double r2) => DONE
 #
@@ -41,12 +41,12 @@ from pyalicevision import camera as av
 # - DistortionRadialK3PT(double k1, double k2, double k3) => DONE
 # - EDISTORTION getType() => DONE
 # - DistortionRadialK3PT* clone() => DONE
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) / Matrix and Vec2 not binded
+# - Vec2 addDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeAddDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& p) => DONE
+# - Vec2 removeDistortion(Vec2& p) => DONE
+# - Eigen::Matrix2d getDerivativeRemoveDistoWrtPt(Vec2& p) => DONE
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& p) => DONE
 # - double getUndistortedRadius(double r) => DONE
 # - [static] double distoFunction(vector<double>& params, double r2) => DONE
 #
@@ -154,25 +154,74 @@ def test_distortion_radial_k1_clone():
         "updated values"
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_distortion_radial_k1_add_remove_distortion():
     """ Test creating a DistortionRadialK1 object and adding/removing the
     distortion to a point. """
-    assert True
+    point = np.array([0.2, -0.1])
+
+    # For default DistortionRadialK1 models, the parameters are set to 0, so
+    # the distortion should not have any effect
+    distortion1 = av.DistortionRadialK1()
+    assert np.allclose(distortion1.addDistortion(point), point), \
+        "Adding the distortion with default parameters should not modify the point"
+    assert np.allclose(distortion1.removeDistortion(point), point), \
+        "Removing the distortion with default parameters should not modify the point"
+
+    distortion2 = av.DistortionRadialK1(0.1)
+    distorted = distortion2.addDistortion(point)
+    assert distorted.shape == (2,), "The distorted point should be returned as a 2D vector"
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion with non-default parameters should modify the point"
+    assert np.allclose(distortion2.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    # Any array-like object is accepted as input
+    assert np.allclose(distortion2.addDistortion(list(point)), distorted), \
+        "The distortion should be the same for a list and a NumPy array"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k1_get_derivative_add():
     """ Test creating a DistortionRadialK1 object, adding the distortion to a point,
     and getting the derivative with respect to that point. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK1(0.1)
+
+    derivative_pt = distortion.getDerivativeAddDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Compare with the numerical derivative
+    eps = 1e-6
+    for idx in range(2):
+        delta = np.zeros(2)
+        delta[idx] = eps
+        numerical = (distortion.addDistortion(point + delta) -
+                     distortion.addDistortion(point - delta)) / (2 * eps)
+        assert np.allclose(derivative_pt[:, idx], numerical, atol=1e-6), \
+            "The derivative wrt the point does not match the numerical derivative"
+
+    derivative_disto = distortion.getDerivativeAddDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 1), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k1_get_derivative_remove():
     """ Test creating a DistortionRadialK1 object, and getting the derivatives with
     the distortion removed. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK1(0.1)
+
+    derivative_pt = distortion.getDerivativeRemoveDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Removing then adding the distortion is the identity
+    undistorted = distortion.removeDistortion(point)
+    assert np.allclose(derivative_pt @ distortion.getDerivativeAddDistoWrtPt(undistorted),
+                       np.identity(2)), \
+        "The derivatives for adding and removing the distortion should be inverse matrices"
+
+    derivative_disto = distortion.getDerivativeRemoveDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 1), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
 def test_distortion_radial_k1_get_radius():
@@ -297,25 +346,74 @@ def test_distortion_radial_k3_clone():
         "updated values"
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_distortion_radial_k3_add_remove_distortion():
     """ Test creating a DistortionRadialK3 object and adding/removing the
     distortion to a point. """
-    assert True
+    point = np.array([0.2, -0.1])
+
+    # For default DistortionRadialK3 models, the parameters are set to 0, so
+    # the distortion should not have any effect
+    distortion1 = av.DistortionRadialK3()
+    assert np.allclose(distortion1.addDistortion(point), point), \
+        "Adding the distortion with default parameters should not modify the point"
+    assert np.allclose(distortion1.removeDistortion(point), point), \
+        "Removing the distortion with default parameters should not modify the point"
+
+    distortion2 = av.DistortionRadialK3(0.1, 0.2, 0.3)
+    distorted = distortion2.addDistortion(point)
+    assert distorted.shape == (2,), "The distorted point should be returned as a 2D vector"
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion with non-default parameters should modify the point"
+    assert np.allclose(distortion2.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    # Any array-like object is accepted as input
+    assert np.allclose(distortion2.addDistortion(list(point)), distorted), \
+        "The distortion should be the same for a list and a NumPy array"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k3_get_derivative_add():
     """ Test creating a DistortionRadialK3 object, adding the distortion to a point,
     and getting the derivative with respect to that point. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK3(0.1, 0.2, 0.3)
+
+    derivative_pt = distortion.getDerivativeAddDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Compare with the numerical derivative
+    eps = 1e-6
+    for idx in range(2):
+        delta = np.zeros(2)
+        delta[idx] = eps
+        numerical = (distortion.addDistortion(point + delta) -
+                     distortion.addDistortion(point - delta)) / (2 * eps)
+        assert np.allclose(derivative_pt[:, idx], numerical, atol=1e-6), \
+            "The derivative wrt the point does not match the numerical derivative"
+
+    derivative_disto = distortion.getDerivativeAddDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 3), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k3_get_derivative_remove():
     """ Test creating a DistortionRadialK3 object, and getting the derivatives with
     the distortion removed. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK3(0.1, 0.2, 0.3)
+
+    derivative_pt = distortion.getDerivativeRemoveDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Removing then adding the distortion is the identity
+    undistorted = distortion.removeDistortion(point)
+    assert np.allclose(derivative_pt @ distortion.getDerivativeAddDistoWrtPt(undistorted),
+                       np.identity(2)), \
+        "The derivatives for adding and removing the distortion should be inverse matrices"
+
+    derivative_disto = distortion.getDerivativeRemoveDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 3), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
 def test_distortion_radial_k3_get_radius():
@@ -440,25 +538,74 @@ def test_distortion_radial_k3pt_clone():
         "updated values"
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_distortion_radial_k3pt_add_remove_distortion():
     """ Test creating a DistortionRadialK3PT object and adding/removing the
     distortion to a point. """
-    assert True
+    point = np.array([0.2, -0.1])
+
+    # For default DistortionRadialK3PT models, the parameters are set to 0, so
+    # the distortion should not have any effect
+    distortion1 = av.DistortionRadialK3PT()
+    assert np.allclose(distortion1.addDistortion(point), point), \
+        "Adding the distortion with default parameters should not modify the point"
+    assert np.allclose(distortion1.removeDistortion(point), point), \
+        "Removing the distortion with default parameters should not modify the point"
+
+    distortion2 = av.DistortionRadialK3PT(0.1, 0.2, 0.3)
+    distorted = distortion2.addDistortion(point)
+    assert distorted.shape == (2,), "The distorted point should be returned as a 2D vector"
+    assert not np.allclose(distorted, point), \
+        "Adding the distortion with non-default parameters should modify the point"
+    assert np.allclose(distortion2.removeDistortion(distorted), point), \
+        "Removing the distortion should give back the original point"
+
+    # Any array-like object is accepted as input
+    assert np.allclose(distortion2.addDistortion(list(point)), distorted), \
+        "The distortion should be the same for a list and a NumPy array"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k3pt_get_derivative_add():
     """ Test creating a DistortionRadialK3PT object, adding the distortion to a point,
     and getting the derivative with respect to that point. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK3PT(0.1, 0.2, 0.3)
+
+    derivative_pt = distortion.getDerivativeAddDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Compare with the numerical derivative
+    eps = 1e-6
+    for idx in range(2):
+        delta = np.zeros(2)
+        delta[idx] = eps
+        numerical = (distortion.addDistortion(point + delta) -
+                     distortion.addDistortion(point - delta)) / (2 * eps)
+        assert np.allclose(derivative_pt[:, idx], numerical, atol=1e-6), \
+            "The derivative wrt the point does not match the numerical derivative"
+
+    derivative_disto = distortion.getDerivativeAddDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 3), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
-@pytest.mark.skip(reason="Matrix and Vec2 not binded")
 def test_distortion_radial_k3pt_get_derivative_remove():
     """ Test creating a DistortionRadialK3PT object, and getting the derivatives with
     the distortion removed. """
-    assert True
+    point = np.array([0.2, -0.1])
+    distortion = av.DistortionRadialK3PT(0.1, 0.2, 0.3)
+
+    derivative_pt = distortion.getDerivativeRemoveDistoWrtPt(point)
+    assert derivative_pt.shape == (2, 2), "The derivative wrt the point should be a 2x2 matrix"
+
+    # Removing then adding the distortion is the identity
+    undistorted = distortion.removeDistortion(point)
+    assert np.allclose(derivative_pt @ distortion.getDerivativeAddDistoWrtPt(undistorted),
+                       np.identity(2)), \
+        "The derivatives for adding and removing the distortion should be inverse matrices"
+
+    derivative_disto = distortion.getDerivativeRemoveDistoWrtDisto(point)
+    assert derivative_disto.shape == (2, 3), \
+        "The derivative wrt the distortion should have one column per parameter"
 
 
 def test_distortion_radial_k3pt_get_radius():
@@ -2,14 +2,15 @@
 Collection of unit tests for the Pinhole intrinsics.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import camera as av
+from pyalicevision import geometry
 
 ##################
 ### List of functions:
 # - Pinhole() => DONE
-# - Pinhole(uint w, uint h, const Mat3& K) / Mat3 not binded
+# - Pinhole(uint w, uint h, const Mat3& K) => DONE
 # - Pinhole(uint w, uint h, double focalLengthPixX, double focalLengthPixY,
 #           double offsetX, double offsetY, shared_ptr<Distortion> distortion = nullptr,
 #           shared_ptr<Undistortion> undistortion = nullptr) => DONE
@@ -19,37 +20,29 @@ from pyalicevision import camera as av
 # - double getFocalLengthPixY() => DONE
 # - bool isValid() => DONE
 # - EINTRINSIC getType() => DONE
-# - Mat3 K() / Mat3 not binded
+# - Mat3 K() => DONE
 # - void setK(double focalLengthPixX, double focalLengthPixY, double ppx, double ppy)
-# - void setK(Mat3& K) / Mat3 not binded
-# - Vec2 project(geometry::Pose3& pose, Vec4& pt3D, bool applyDistortion = true) / Vec2,
-#                                                                      Pose3 and Vec4 not binded
-# - Vec2 project(Eigen::Matrix4d& pose, Vec4& pt, bool applyDistortion = true) / Vec2,
-#                                                                      Matrix4d and Vec4 not binded
+# - void setK(Mat3& K) => DONE
+# - Vec2 project(geometry::Pose3& pose, Vec4& pt3D, bool applyDistortion = true)
+# - Vec2 project(Eigen::Matrix4d& pose, Vec4& pt, bool applyDistortion = true)
 # - Eigen::Matrix<double, 2, 9> getDerivativeProjectWrtRotation(Eigen::Matrix4d& pose,
-#                                                                      Vec4& pt) / not binded
-# - Eigen::Matrix<double, 2, 16> getDerivativeProjectWrtPose(Eigen::Matrix4d& pose, Vec4& pt) /
-#                                                                      not binded
+#                                                                      Vec4& pt)
+# - Eigen::Matrix<double, 2, 16> getDerivativeProjectWrtPose(Eigen::Matrix4d& pose, Vec4& pt)
 # - Eigen::Matrix<double, 2, 16> getDerivativeProjectWrtPoseLeft(Eigen::Matrix4d& pose, Vec4& pt)
-#                                                                      / not binded
 # - Eigen::Matrix<double, 2, 4> getDerivativeProjectWrtPoint(Eigen::Matrix4d& pose, Vec4& pt)
-#                                                                      / not binded
 # - Eigen::Matrix<double, 2, 3> getDerivativeProjectWrtPoint3(Eigen::Matrix4d& pose, Vec4& pt)
-#                                                                      / not binded
 # - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeProjectWrtDisto(Eigen::Matrix4d& pose,
-#                                                                      Vec4& pt) / not binded
+#                                                                      Vec4& pt)
 # - Eigen::Matrix<double, 2, 2> getDerivativeProjectWrtPrincipalPoint(Eigen::Matrix4d& pose,
-#                                                                      Vec4& pt) / not binded
+#                                                                      Vec4& pt)
 # - Eigen::Matrix<double, 2, 2> getDerivativeProjectWrtScale(Eigen::Matrix4d& pose,Vec4& pt)
-#                                                                      / not binded
 # - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeProjectWrtParams(Eigen::Matrix4d& pose,
-#                                                                      Vec4& pt3D) / not binded
-# - Vec3 toUnitSphere(Vec2& pt) / Vec3 and Vec2 not binded
-# - Eigen::Matrix<double, 3, 2> getDerivativetoUnitSphereWrtPoint(Vec2& pt) / Matrix
-#                                                                      and Vec2 not binded
+#                                                                      Vec4& pt3D)
+# - Vec3 toUnitSphere(Vec2& pt)
+# - Eigen::Matrix<double, 3, 2> getDerivativetoUnitSphereWrtPoint(Vec2& pt)
 # - double imagePlaneToCameraPlaneError(double value)
-# - Mat34 getProjectiveEquivalent(geometry::Pose3& pose) / Mat34 and Pose3 not binded
-# - bool isVisibleRay(Vec3& ray) / Vec3 not binded
+# - Mat34 getProjectiveEquivalent(geometry::Pose3& pose)
+# - bool isVisibleRay(Vec3& ray)
 # - double getHorizontalFov() => DONE
 # - double getVerticalFov() => DONE
 #
@@ -57,10 +50,10 @@ from pyalicevision import camera as av
 # - bool operator==(const IntrinsicBase&)
 # - void setDistortionObject(shared_ptr<Distortion> object)
 # - bool hasDistortion()
-# - Vec2 addDistortion(Vec2& p) / Vec2 not binded
-# - Vec2 removeDistortion(Vec2& p) / Vec2 not binded
-# - Vec2 getUndistortedPixel(Vec2& p) / Vec2 not binded
-# - Vec2 getDistortedPixel(Vec2& p) / Vec2 not binded
+# - Vec2 addDistortion(Vec2& p)
+# - Vec2 removeDistortion(Vec2& p)
+# - Vec2 getUndistortedPixel(Vec2& p)
+# - Vec2 getDistortedPixel(Vec2& p)
 # - size_t getDistortionParamsSize()
 # - vector<double> getDistortionParams()
 # - void setDistortionParams(vector<double>& distortionParams)
@@ -70,10 +63,10 @@ from pyalicevision import camera as av
 # - size_t getParamsSize() => DONE
 # - updateFromParams(vector<double>& params) => DONE
 # - float getMaximalDistortion(double min_radius, double max_radius)
-# - Eigen::Matrix<double, 2, 2> getDerivativeAddDistoWrtPt(Vec2& pt) / Matrix and Vec2 not binded
-# - Eigen::Matrix<double, 2, 2> getDerivativeRemoveDistoWrtPt(Vec2& pt) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& pt) / Matrix and Vec2 not binded
-# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& pt) / Matrix and Vec2 not binded
+# - Eigen::Matrix<double, 2, 2> getDerivativeAddDistoWrtPt(Vec2& pt)
+# - Eigen::Matrix<double, 2, 2> getDerivativeRemoveDistoWrtPt(Vec2& pt)
+# - Eigen::MatrixXd getDerivativeAddDistoWrtDisto(Vec2& pt)
+# - Eigen::MatrixXd getDerivativeRemoveDistoWrtDisto(Vec2& pt)
 # - [inline] void setDistortionInitializationMode(EInitMode distortionInitializationMode)
 # - shared_ptr<Distortion> getDistortion()
 # - void setUndistortionObject(shared_ptr<Undistortion> object)
@@ -81,20 +74,19 @@ from pyalicevision import camera as av
 #
 ### Inherited functions (IntrinsicScaleOffset):
 # - void copyFrom(const IntrinsicScaleOffset& other)
-# - void setScale(Vec2& scale) / Vec2 not binded
-# - [inline] Vec2 getScale() / Vec2 not binded
-# - void setOffset(Vec2& offset) / Vec2 not binded
-# - [inline] Vec2 getOffset() / Vec2 not binded
-# - [inline] Vec2 getPrincipalPoint() / Vec2 not binded
-# - Vec2 cam2ima(Vec2 pt) / Vec2 not binded
-# - Eigen::Matrix<double, 2, 2> getDerivativeIma2CamWrtScale(const Vec2& p) /
-#                   Matrix and Vec2 not binded
-# - Eigen::Matrix2d getDerivativeIma2CamWrtPoint() / Matrix not binded
-# - Eigen::Matrix2d getDerivativeIma2CamWrtPrincipalPoint() / Matrix not binded
+# - void setScale(Vec2& scale)
+# - [inline] Vec2 getScale() => DONE
+# - void setOffset(Vec2& offset)
+# - [inline] Vec2 getOffset() => DONE
+# - [inline] Vec2 getPrincipalPoint()
+# - Vec2 cam2ima(Vec2 pt)
+# - Eigen::Matrix<double, 2, 2> getDerivativeIma2CamWrtScale(const Vec2& p)
+# - Eigen::Matrix2d getDerivativeIma2CamWrtPoint()
+# - Eigen::Matrix2d getDerivativeIma2CamWrtPrincipalPoint()
 # - void rescale(float factorW, float factorH)
 # - bool importFromParams(vector<double>& params, Version& inputVersion)
-# - [inine] void setInitialScale(Vec2& initialScale) / Vec2 not binded
-# - [inline] Vec2 getInitialScale() / Vec2 not binded
+# - [inine] void setInitialScale(Vec2& initialScale)
+# - [inline] Vec2 getInitialScale()
 # - [inline] void setRatioLocked(bool locked) => DONE
 # - [inline] bool isRatioLocked() => DONE
 #
@@ -107,17 +99,18 @@ from pyalicevision import camera as av
 # - [inline] string& serialNumber() => DONE
 # - [inline] EInitMode getInitializationMode() => DONE
 # - inline bool operator!=(const IntrinsicBase& other)
-# - Vec2 project(geometry::Pose3& pose, Vec4& pt3D, bool applyDistortion = true) /
-#                    Vec2, Pose3 and Vec4 not binded
+# - Vec2 project(geometry::Pose3& pose, Vec4& pt3D, bool applyDistortion = true)
 # - Vec2 project(Eigen::Matrix4d& pose, Vec4& pt3D, bool applyDistortion = true)
+# - Mat2X projectPoints(geometry::Pose3& pose, Mat3X& pts3D, bool applyDistortion = true) => DONE
 # - Vec3 backproject(Vec2& pt2D, bool applyUndistortion = true,
 #                    geometry::Pose3& pose = geometry::Pose3(),
-#                    double depth = 1.0) / Vec3, Vec2 and Pose3 not binded
-# - Vec4 getCartesianfromSphericalCoordinates(Vec3& pt) / Vec3 not binded
-# - Eigen::Matrix<double, 4, 3> getDerivativeCartesianfromSphericalCoordinates(Vec3& pt) /
-#                    Matrix and Vec3 not binded
+#                    double depth = 1.0)
+# - Mat3X backprojectPoints(Mat2X& pts2D, bool applyUndistortion = true,
+#                    geometry::Pose3& pose = geometry::Pose3(), double depth = 1.0) => DONE
+# - Vec4 getCartesianfromSphericalCoordinates(Vec3& pt)
+# - Eigen::Matrix<double, 4, 3> getDerivativeCartesianfromSphericalCoordinates(Vec3& pt)
 # - [inline] Vec2 residual(geometry::Pose3& pose, Vec4& X, Vec2& x)
-# - [inline] Mat2X residuals(const geometry::Pose3& pose, const Mat3X& X, const Mat2X& x)
+# - [inline] Mat2X residuals(const geometry::Pose3& pose, const Mat3X& X, const Mat2X& x) => DONE
 # - [inline] void lock() => DONE
 # - [inline] void unlock() => DONE
 # - [inline] void setWidth(unsigned int width) => DONE
@@ -127,8 +120,8 @@ from pyalicevision import camera as av
 # - [inline] void setSerialNumber(std::string& serialNumber) => DONE
 # - [inline] void setInitializationMode(EInitMode initializationMode) => DONE
 # - string getTypeStr() => DONE
-# - bool isVisible(Vec2& pix) / Vec2 not binded
-# - bool isVisible(Vec2f& pix) / Vec2f not binded
+# - bool isVisible(Vec2& pix)
+# - bool isVisible(Vec2f& pix)
 # - float getMaximalDistortion(double min_radius, double max_radius)
 # - std::size_t hashValue()
 # - void rescale(float factorW, float factorH)
@@ -136,7 +129,7 @@ from pyalicevision import camera as av
 # - EEstimatorParameterState getState() => DONE
 # - void setState(EEstimatorParameterState state) => DONE
 # - [inline] Vec3 applyIntrinsicExtrinsic(geometry::Pose3& pose, IntrinsicBase* intrinsic,
-#                   Vec2& x) / Vec3, Pose3 and Vec2 not binded
+#                   Vec2& x)
 ##################
 
 DEFAUT_PARAMETERS = (1.0, 1.0, 0.0, 0.0)
@@ -157,8 +150,7 @@ def test_pinhole_default_constructor():
         "The Pinhole intrinsic's focal length in Y should be 1.0"
 
     offset = intrinsic.getOffset()
-    # TODO: uncomment check on the offset when Vec2 is binded
-    # assert offset[0] == 0.0 and offset[1] == 0.0
+    assert offset[0] == 0.0 and offset[1] == 0.0
 
     assert intrinsic.sensorWidth() == 36.0
     assert intrinsic.sensorHeight() == 24.0
@@ -170,11 +162,41 @@ def test_pinhole_default_constructor():
     assert intrinsic.isValid()
 
 
-@pytest.mark.skip(reason="Matrix3 not binded")
 def test_pinhole_matrix_constructor():
     """ Test creating a Pinhole object using the constructor with a Matrix3 and checking its
     set values are correct. """
-    assert True
+    K = np.array([[900.0, 0.0, 10.0],
+                  [0.0, 700.0, -5.0],
+                  [0.0, 0.0, 1.0]])
+    intrinsic = av.Pinhole(1000, 800, K)
+
+    assert intrinsic.w() == 1000
+    assert intrinsic.h() == 800
+    assert intrinsic.getFocalLengthPixX() == 900
+    assert intrinsic.getFocalLengthPixY() == 700
+
+    # The third column of the matrix is used as the offset of the principal point
+    offset = intrinsic.getOffset()
+    assert offset[0] == 10.0 and offset[1] == -5.0
+
+
+def test_pinhole_get_set_k():
+    """ Test creating a Pinhole object and getting/setting its intrinsics matrix. """
+    intrinsic = av.Pinhole(1000, 800, 900, 700, 0, 0)
+
+    K = intrinsic.K()
+    assert K.shape == (3, 3)
+    assert np.array_equal(K, np.array([[900.0, 0.0, 500.0],
+                                       [0.0, 700.0, 400.0],
+                                       [0.0, 0.0, 1.0]]))
+
+    new_K = np.array([[1200.0, 0.0, 510.0],
+                      [0.0, 1100.0, 395.0],
+                      [0.0, 0.0, 1.0]])
+    intrinsic.setK(new_K)
+    assert np.array_equal(intrinsic.K(), new_K)
+    assert intrinsic.getFocalLengthPixX() == 1200
+    assert intrinsic.getFocalLengthPixY() == 1100
 
 
 def test_pinhole_constructor():
@@ -320,3 +342,29 @@ def test_pinhole_get_set_initialization_mode():
 
     intrinsic.setInitializationMode(av.EInitMode_ESTIMATED)
     assert intrinsic.getInitializationMode() == av.EInitMode_ESTIMATED
+
+
+def test_pinhole_project_backproject_points():
+    """ Test creating a Pinhole object and projecting/back-projecting a whole set of points
+    at once, with the points given as the columns of NumPy arrays. """
+    intrinsic = av.Pinhole(1000, 800, 900, 700, 0, 0)
+    pose = geometry.Pose3(np.identity(3), np.array([0.1, -0.2, 0.3]))
+
+    rng = np.random.default_rng(0)
+    pixels = np.column_stack([rng.uniform(0, 1000, 50), rng.uniform(0, 800, 50)])
+
+    # Points are given one per column: (2, N) for 2D points and (3, N) for 3D points
+    points = intrinsic.backprojectPoints(pixels.T, True, pose, 2.0)
+    assert points.shape == (3, 50)
+
+    projected = intrinsic.projectPoints(pose, points)
+    assert projected.shape == (2, 50)
+    assert np.allclose(projected, pixels.T), \
+        "The projection of the back-projected points should give back the initial pixels"
+
+    residuals = intrinsic.residuals(pose, points, pixels.T)
+    assert np.allclose(residuals, np.zeros((2, 50)), atol=1e-6)
+
+    # Default pose and depth
+    rays = intrinsic.backprojectPoints(pixels.T)
+    assert np.allclose(np.linalg.norm(rays, axis=0), 1.0)
@@ -0,0 +1,47 @@
+"""
+Collection of unit tests for the RemapGrid.
+"""
+
+import numpy as np
+
+from pyalicevision import camera as av
+
+##################
+### List of functions:
+# - RemapGrid(IntrinsicBase& intrinsic, int width, int height, double scale = 1.0,
+#             Vec2& offset = Vec2::Zero()) => DONE
+# - int width() => DONE
+# - int height() => DONE
+# - double scale() => DONE
+# - Vec2& offset() => DONE
+# - Mat2X& getGrid() => DONE
+# - Vec2 operator()(int x, int y) => DONE
+# - size_t memorySize() => DONE
+##################
+
+def test_remap_grid_constructor():
+    """ Test creating a RemapGrid object and checking its set values are correct. """
+    intrinsic = av.Pinhole(40, 30, 35, 35, 0, 0)
+
+    grid = av.RemapGrid(intrinsic, 20, 15, 0.5, np.array([1.0, 2.0]))
+    assert grid.width() == 20
+    assert grid.height() == 15
+    assert grid.scale() == 0.5
+    assert np.array_equal(grid.offset(), [1.0, 2.0])
+    assert grid.memorySize() == 2 * 20 * 15 * 8
+
+
+def test_remap_grid_get_grid():
+    """ Test creating a RemapGrid object for an intrinsic without distortion and checking that
+    its grid contains the coordinates of the pixels. """
+    intrinsic = av.Pinhole(40, 30, 35, 35, 0, 0)
+    grid = av.RemapGrid(intrinsic, 40, 30)
+
+    values = grid.getGrid()
+    assert values.shape == (2, 40 * 30)
+
+    # One column per pixel, in row-major order
+    xs, ys = np.meshgrid(np.arange(40), np.arange(30))
+    assert np.allclose(values.T.reshape(30, 40, 2), np.stack([xs, ys], axis=-1))
+
+    assert np.allclose(grid(5, 7), [5, 7])
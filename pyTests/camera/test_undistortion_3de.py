@@ -2,7 +2,7 @@
 Collection of unit tests for the 3DE Undistortion model.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import camera as av
 
@@ -11,28 +11,24 @@ from pyalicevision import camera as av
 # - Undistortion3DEAnamorphic4(int width, int height) => DONE
 # - EUNDISTORTION getType() => DONE
 # - Undistortion* clone() => DONE
-# - Vec2 undistortNormalized(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix<double, 2, 2> getDerivativeUndistortNormalizedwrtPoint(Vec2& p) /
-#                   Matrix and Vec2 not binded
-# - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeUndistortNormalizedwrtParameters(
-#                   Vec2& p) / Matrix and Vec2 not binded
-# - Vec2 inverseNormalized(Vec2& p) / Vec2 not binded
+# - Vec2 undistortNormalized(Vec2& p) => DONE
+# - Eigen::Matrix<double, 2, 2> getDerivativeUndistortNormalizedwrtPoint(Vec2& p)
+# - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeUndistortNormalizedwrtParameters(Vec2& p)
+# - Vec2 inverseNormalized(Vec2& p) => DONE
 #
 ### Inherited functions (Undistortion):
 # - bool operator==(Undistortion& other) => DONE
-# - void setOffset(Vec2& offset) / Vec2 not binded
+# - void setOffset(Vec2& offset) => DONE
 # - void setSize(int width, int height) => DONE
-# - [inline] Vec2 getOffset() / Vec2 not binded
-# - [inline] Vec2 getSize() / Vec2 not binded
+# - [inline] Vec2 getOffset() => DONE
+# - [inline] Vec2 getSize() => DONE
 # - vector<double>& getParameters() => DONE
 # - void setParameters(vector<double>& params)
 # - size_t getUndistortionParametersCount() => DONE
-# - Vec2 undistort(Vec2& p) / Vec2 not binded
-# - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeUndistortWrtParameters(Vec2& p) /
-#                   Matrix and Vec2 not binded
-# - Eigen::Matrix<double, 2, 2> getDerivativeUndistortWrtParameters(Vec2& p) /
-#                   Matrix and Vec2 not binded
-# - Vec2 inverse(Vec2& p) / Vec2 not binded
+# - Vec2 undistort(Vec2& p) => DONE
+# - Eigen::Matrix<double, 2, Eigen::Dynamic> getDerivativeUndistortWrtParameters(Vec2& p)
+# - Eigen::Matrix<double, 2, 2> getDerivativeUndistortWrtParameters(Vec2& p)
+# - Vec2 inverse(Vec2& p) => DONE
 ##################
 
 DEFAULT_PARAMETERS = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
@@ -46,8 +42,7 @@ def test_undistortion_3de_constructor():
     undistortion = av.Undistortion3DEAnamorphic4(WIDTH, HEIGHT)
 
     size = undistortion.getSize()
-    # TODO: uncomment when Vec2 is binded
-    # assert size[0] == WIDTH and size[1] == HEIGHT
+    assert size[0] == WIDTH and size[1] == HEIGHT
 
     assert undistortion.getType() == av.UNDISTORTION_3DEANAMORPHIC4
 
@@ -117,17 +112,47 @@ def test_undistortion_3de_get_set_size():
     size. """
     undistortion = av.Undistortion3DEAnamorphic4(WIDTH, HEIGHT)
     size = undistortion.getSize()
-    # TODO: uncomment when Vec2 is binded
-    # assert size[0] == WIDTH and size[1] == HEIGHT
+    assert size[0] == WIDTH and size[1] == HEIGHT
 
     undistortion.setSize(HEIGHT, WIDTH)
-    assert size != undistortion.getSize()
+    assert (size != undistortion.getSize()).any()
     size = undistortion.getSize()
-    # TODO: uncomment when Vec2 is binded
-    # assert size[0] == HEIGHT and size[1] == WIDTH
+    assert size[0] == HEIGHT and size[1] == WIDTH
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_undistortion_3de_get_set_offset():
     """ Test creating an Undistortion3DEAnamorphic4 object and manipulating its offset. """
-    assert True
+    undistortion = av.Undistortion3DEAnamorphic4(WIDTH, HEIGHT)
+    offset = undistortion.getOffset()
+    assert offset.shape == (2,)
+    assert offset[0] == 0.0 and offset[1] == 0.0
+
+    undistortion.setOffset(np.array([12.5, -4.0]))
+    assert (offset != undistortion.getOffset()).any()
+    offset = undistortion.getOffset()
+    assert offset[0] == 12.5 and offset[1] == -4.0
+
+    # The center of the undistortion is shifted by the offset
+    center = undistortion.getCenter()
+    assert center[0] == WIDTH / 2 + 12.5 and center[1] == HEIGHT / 2 - 4.0
+
+
+def test_undistortion_3de_undistort_inverse():
+    """ Test creating an Undistortion3DEAnamorphic4 object and undistorting/distorting points. """
+    undistortion = av.Undistortion3DEAnamorphic4(WIDTH, HEIGHT)
+    point = np.array([250.0, 600.0])
+
+    # Default parameters do not change the points
+    assert np.allclose(undistortion.undistort(point), point)
+    assert np.allclose(undistortion.inverse(point), point)
+
+    # inverse() is the inverse of undistort()
+    undistortion.setParameters(NON_DEFAULT_PARAMETERS)
+    undistorted = undistortion.undistort(point)
+    assert undistorted.shape == (2,)
+    assert not np.allclose(undistorted, point)
+    assert np.allclose(undistortion.inverse(undistorted), point, atol=1e-4)
+
+    normalized_point = np.array([-0.3, 0.2])
+    undistorted = undistortion.undistortNormalized(normalized_point)
+    assert np.allclose(undistortion.inverseNormalized(undistorted), normalized_point, atol=1e-6)
@@ -0,0 +1,120 @@
+"""
+Collection of unit tests for the Regions loaders and the FeaturesPerView class.
+"""
+
+import gc
+import os
+
+import numpy as np
+import pytest
+
+from pyalicevision import feature as av
+from pyalicevision import sfmData
+
+##################
+### List of functions:
+# - unique_ptr<ImageDescriber> createImageDescriber(EImageDescriberType type) => DONE
+# - unique_ptr<Regions> loadRegions(vector<string>& folders, IndexT viewId, ImageDescriber& imageDescriber,
+#                                   bool mapDescriptors) => DONE
+# - unique_ptr<Regions> loadFeatures(vector<string>& folders, IndexT viewId, ImageDescriber& imageDescriber) => DONE
+# - bool loadFeaturesPerView(FeaturesPerView& featuresPerView, SfMData& sfmData,
+#                            vector<string>& folders, vector<EImageDescriberType>& types) => DONE
+# - Regions.getFeaturesArray() / Regions.getDescriptorsArray() (Python) => DONE
+# - FeaturesPerView.getFeaturesArray(IndexT viewId, EImageDescriberType descType) (Python) => DONE
+##################
+
+VIEW_ID = 12
+NB_FEATURES = 50
+
+
+def write_sift_regions(folder, view_id):
+    """ Write random SIFT features and descriptors for a view, and return them. """
+    rng = np.random.default_rng(view_id)
+    features = rng.uniform(0, 100, (NB_FEATURES, 4)).astype(np.float32)
+    descriptors = rng.integers(0, 256, (NB_FEATURES, 128), dtype=np.uint8)
+
+    np.savetxt(os.path.join(folder, f"{view_id}.sift.feat"), features, fmt="%.9g")
+    with open(os.path.join(folder, f"{view_id}.sift.desc"), "wb") as desc_file:
+        desc_file.write(np.array([NB_FEATURES], dtype=np.uint64).tobytes())
+        desc_file.write(descriptors.tobytes())
+
+    return features, descriptors
+
+
+def test_regions_load(tmp_path):
+    """ Test loading the Regions of a view and accessing its features and descriptors as arrays. """
+    features, descriptors = write_sift_regions(str(tmp_path), VIEW_ID)
+    describer = av.createImageDescriber(av.EImageDescriberType_SIFT)
+    assert describer.getDescriberType() == av.EImageDescriberType_SIFT
+
+    regions = av.loadRegions([str(tmp_path)], VIEW_ID, describer)
+    assert regions.RegionCount() == regions.DescriptorCount() == NB_FEATURES
+    assert regions.DescriptorLength() == 128
+    assert regions.IsScalar() and not regions.IsBinary()
+
+    features_array = regions.getFeaturesArray()
+    descriptors_array = regions.getDescriptorsArray()
+    assert features_array.shape == (NB_FEATURES, 4) and features_array.dtype == np.float32
+    assert descriptors_array.shape == (NB_FEATURES, 128) and descriptors_array.dtype == np.uint8
+    assert np.array_equal(features_array, features)
+    assert np.array_equal(descriptors_array, descriptors)
+
+    # The arrays share the memory of the Regions, which they keep alive
+    assert not features_array.flags.writeable and not descriptors_array.flags.writeable
+    assert features_array.base is regions
+    del regions
+    gc.collect()
+    assert np.array_equal(descriptors_array, descriptors)
+
+
+def test_regions_load_mapped(tmp_path):
+    """ Test loading the Regions of a view with memory-mapped descriptors. """
+    features, descriptors = write_sift_regions(str(tmp_path), VIEW_ID)
+    describer = av.createImageDescriber(av.EImageDescriberType_SIFT)
+
+    regions = av.loadRegions([str(tmp_path)], VIEW_ID, describer, True)
+    assert regions.RegionCount() == regions.DescriptorCount() == NB_FEATURES
+    assert np.array_equal(regions.getFeaturesArray(), features)
+
+    # The descriptors array is a view of the mapped file, which stays mapped as long as the array is alive
+    descriptors_array = regions.getDescriptorsArray()
+    assert np.array_equal(descriptors_array, descriptors)
+    del regions
+    gc.collect()
+    assert np.array_equal(descriptors_array, descriptors)
+
+    with open(os.path.join(str(tmp_path), f"{VIEW_ID}.sift.desc"), "r+b") as desc_file:
+        desc_file.truncate(8 + 128 * (NB_FEATURES - 1))
+    with pytest.raises(RuntimeError):
+        av.loadRegions([str(tmp_path)], VIEW_ID, describer, True)
+
+
+def test_regions_load_features(tmp_path):
+    """ Test loading only the features of a view. """
+    features, _ = write_sift_regions(str(tmp_path), VIEW_ID)
+    describer = av.createImageDescriber(av.EImageDescriberType_SIFT)
+
+    regions = av.loadFeatures([str(tmp_path)], VIEW_ID, describer)
+    assert np.array_equal(regions.getFeaturesArray(), features)
+    assert regions.getDescriptorsArray().shape == (0, 128)
+
+    with pytest.raises(RuntimeError):
+        av.loadRegions([str(tmp_path)], VIEW_ID + 1, describer)
+
+
+def test_features_per_view(tmp_path):
+    """ Test loading the features of all the views of an SfMData and accessing them as arrays. """
+    features, _ = write_sift_regions(str(tmp_path), VIEW_ID)
+
+    data = sfmData.SfMData()
+    data.getViews()[VIEW_ID] = sfmData.View("", VIEW_ID)
+
+    features_per_view = av.FeaturesPerView()
+    assert av.loadFeaturesPerView(features_per_view, data, [str(tmp_path)],
+                                  av.EImageDescriberType_stringToEnums("sift"))
+    assert features_per_view.viewExist(VIEW_ID)
+    assert features_per_view.getNbFeatures(VIEW_ID) == NB_FEATURES
+    assert np.array_equal(features_per_view.getFeaturesArray(VIEW_ID, av.EImageDescriberType_SIFT), features)
+
+    # Unknown views do not have any feature
+    assert features_per_view.getFeaturesArray(VIEW_ID + 1, av.EImageDescriberType_SIFT).shape == (0, 4)
@@ -0,0 +1,82 @@
+"""
+Collection of unit tests for the selection of the image pairs to match.
+"""
+
+import numpy as np
+
+from pyalicevision import imageMatching as av
+from pyalicevision import sfmData
+from pyalicevision import voctree
+
+from ..voctree.test_database import write_descriptors, write_tree
+
+##################
+### List of functions:
+# - array convertAllMatchesToPairList(array allMatches, size_t numMatches) => DONE
+# - array generateSequentialMatches(SfMData sfmData, size_t nbMatches) => DONE
+# - array generateAllMatchesInOneMap(set<IndexT> viewIds) => DONE
+# - array generateAllMatchesBetweenTwoMap(set<IndexT> viewIdsA, set<IndexT> viewIdsB) => DONE
+# - array generateFromVoctree(DescriptorFiles descriptorsFiles, Database db, VocabularyTree tree,
+#                             EImageMatchingMode modeMultiSfM, size_t nbMaxDescriptors, size_t numImageQuery) => DONE
+# - string EImageMatchingMode_enumToString(EImageMatchingMode modeMultiSfM) => DONE
+# - EImageMatchingMode EImageMatchingMode_stringToEnum(string modeMultiSfM) => DONE
+##################
+
+
+def test_all_matches():
+    """ Test the exhaustive selection of pairs in one set of views and between two sets of views. """
+    pairs = av.generateAllMatchesInOneMap([3, 1, 2])
+    assert pairs.dtype == np.uint32
+    assert pairs.tolist() == [[1, 2], [1, 3], [2, 3]]
+
+    pairs = av.generateAllMatchesBetweenTwoMap([1, 4], [2, 5])
+    assert pairs.tolist() == [[1, 2], [1, 5], [4, 2], [4, 5]]
+
+    assert av.generateAllMatchesInOneMap([1]).shape == (0, 2)
+
+
+def test_sequential_matches():
+    """ Test the selection of the neighbors of each image, sorted by image path. """
+    data = sfmData.SfMData()
+    views = data.getViews()
+    for view_id, path in [(10, "c.jpg"), (20, "a.jpg"), (30, "b.jpg"), (40, "d.jpg")]:
+        views[view_id] = sfmData.View(path, view_id, 0, 0, 100, 100)
+
+    # images are matched in the order a, b, c, d
+    pairs = av.generateSequentialMatches(data, 1)
+    assert pairs.tolist() == [[10, 30], [10, 40], [20, 30]]
+
+
+def test_convert_all_matches():
+    """ Test the conversion of the matches of each image into pairs without repetitions. """
+    all_matches = np.array([[1, 1], [1, 3], [1, 2], [2, 2], [2, 1], [3, 1]], dtype=np.uint32)
+    assert av.convertAllMatchesToPairList(all_matches, 0).tolist() == [[1, 2], [1, 3]]
+    # only the best match of each image, the image itself being skipped
+    assert av.convertAllMatchesToPairList(all_matches, 1).tolist() == [[1, 3], [2, 1]]
+
+
+def test_matching_mode():
+    """ Test the conversion of the multi-SfM modes. """
+    mode = av.EImageMatchingMode_stringToEnum("a/b")
+    assert mode == av.EImageMatchingMode_A_B
+    assert av.EImageMatchingMode_enumToString(mode) == "a/b"
+
+
+def test_generate_from_voctree(tmp_path):
+    """ Test the selection of pairs from the most similar images in a vocabulary tree database. """
+    data = write_descriptors(str(tmp_path))
+    tree = voctree.VocabularyTree(write_tree(str(tmp_path)))
+    db = voctree.Database(tree.words())
+    voctree.populateDatabase(data, [str(tmp_path)], tree, db)
+    db.computeTfIdfWeights()
+
+    descriptors_files = voctree.DescriptorFiles()
+    voctree.getListOfDescriptorFiles(data, [str(tmp_path)], descriptors_files)
+
+    all_matches = av.generateFromVoctree(descriptors_files, db, tree, av.EImageMatchingMode_A_A, 0, 2)
+    assert all_matches.shape == (8, 2)
+    assert sorted(map(tuple, all_matches.tolist())) == \
+        [(1, 1), (1, 2), (2, 1), (2, 2), (3, 3), (3, 4), (4, 3), (4, 4)]
+
+    pairs = av.convertAllMatchesToPairList(all_matches, 0)
+    assert pairs.tolist() == [[1, 2], [3, 4]]
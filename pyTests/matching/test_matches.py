@@ -0,0 +1,154 @@
+"""
+Collection of unit tests for the pairwise matches and their I/O functions.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from pyalicevision import matching as av
+
+##################
+### List of functions:
+# - IndMatch(IndexT i, IndexT j, float distanceRatio, float distance) => DONE
+# - int MatchesPerDescType.getNbMatches(EImageDescriberType descType) => DONE
+# - int MatchesPerDescType.getNbAllMatches() => DONE
+# - vector<EImageDescriberType> MatchesPerDescType.getDescTypes() => DONE
+# - array MatchesPerDescType.getMatchesArray(EImageDescriberType descType) => DONE
+# - void MatchesPerDescType.setMatchesArray(EImageDescriberType descType, array) => DONE
+# - bool LoadMatchFile(PairwiseMatches& matches, string filepath, set<IndexT> viewsKeysFilter,
+#                      vector<EImageDescriberType> descTypesFilter, int maxNbMatches) => DONE
+# - size_t LoadMatchFilePerImage(PairwiseMatches& matches, set<IndexT> viewsKeys, string folder,
+#                                string extension) => DONE
+# - bool Load(PairwiseMatches& matches, set<IndexT> viewsKeysFilter, vector<string> folders,
+#             vector<EImageDescriberType> descTypesFilter, int maxNbMatches, int minNbMatches) => DONE
+# - void filterMatchesByViews(PairwiseMatches& matches, set<IndexT> viewsKeys) => DONE
+# - void filterTopMatches(PairwiseMatches& allMatches, int maxNum, int minNum) => DONE
+# - bool Save(PairwiseMatches& matches, string folder, string extension, bool matchFilePerImage,
+#             string prefix) => DONE
+##################
+
+SIFT = av.EImageDescriberType_SIFT
+AKAZE = av.EImageDescriberType_AKAZE
+
+
+def create_matches():
+    """ Create matches between the views 0, 1 and 2. """
+    matches = av.PairwiseMatches()
+
+    matches_01 = av.MatchesPerDescType()
+    matches_01.setMatchesArray(SIFT, np.array([[0, 0], [1, 1], [2, 3]], dtype=np.uint32))
+    matches_01.setMatchesArray(AKAZE, np.array([[4, 5]], dtype=np.uint32))
+    matches[(0, 1)] = matches_01
+
+    matches_12 = av.MatchesPerDescType()
+    matches_12.setMatchesArray(SIFT, np.array([[0, 0], [1, 6]], dtype=np.uint32))
+    matches[(1, 2)] = matches_12
+
+    return matches
+
+
+def assert_same_matches(matches, expected):
+    """ Check that two PairwiseMatches contain the same matches. """
+    assert sorted(matches.keys()) == sorted(expected.keys())
+    for pair in expected.keys():
+        assert sorted(matches[pair].getDescTypes()) == sorted(expected[pair].getDescTypes())
+        for desc_type in expected[pair].getDescTypes():
+            assert np.array_equal(matches[pair].getMatchesArray(desc_type),
+                                  expected[pair].getMatchesArray(desc_type))
+
+
+def test_indmatch_default_constructor():
+    """ Test creating an IndMatch object without any parameter. """
+    match = av.IndMatch()
+    assert match._i == 0 and match._j == 0
+    assert match._distanceRatio == 0.0
+
+
+def test_indmatch_constructor():
+    """ Test creating IndMatch objects and storing them in a vector. """
+    matches = av.IndMatches([av.IndMatch(1, 2), av.IndMatch(3, 4, 0.5)])
+    assert len(matches) == 2
+    assert matches[0]._i == 1 and matches[0]._j == 2
+    assert matches[1]._i == 3 and matches[1]._j == 4
+    assert matches[1]._distanceRatio == pytest.approx(0.5)
+
+
+def test_matches_arrays():
+    """ Test setting and getting the matches of a pair as NumPy arrays. """
+    matches = create_matches()
+    matches_01 = matches[(0, 1)]
+
+    assert sorted(matches_01.getDescTypes()) == sorted([SIFT, AKAZE])
+    assert matches_01.getNbMatches(SIFT) == 3
+    assert matches_01.getNbAllMatches() == 4
+
+    array = matches_01.getMatchesArray(SIFT)
+    assert array.dtype == np.uint32
+    assert np.array_equal(array, [[0, 0], [1, 1], [2, 3]])
+
+    # Descriptor types without any match give an empty array
+    assert matches_01.getMatchesArray(av.EImageDescriberType_DSPSIFT).shape == (0, 2)
+
+    # Setting the matches replaces the previous ones
+    matches_01.setMatchesArray(SIFT, np.array([[7, 8]], dtype=np.uint32))
+    assert np.array_equal(matches_01.getMatchesArray(SIFT), [[7, 8]])
+
+    with pytest.raises(ValueError):
+        matches_01.setMatchesArray(SIFT, np.zeros((2, 3), dtype=np.uint32))
+
+
+@pytest.mark.parametrize("extension", ["txt", "bin"])
+def test_save_and_load(tmp_path, extension):
+    """ Test saving matches and loading them back, with or without filters. """
+    matches = create_matches()
+    folder = str(tmp_path)
+    assert av.Save(matches, folder, extension, False)
+    filepath = os.path.join(folder, "matches." + extension)
+    assert os.path.isfile(filepath)
+
+    loaded = av.PairwiseMatches()
+    assert av.Load(loaded, [], [folder], av.EImageDescriberType_stringToEnums("sift,akaze"))
+    assert_same_matches(loaded, matches)
+
+    # Filter by descriptor type
+    loaded = av.PairwiseMatches()
+    assert av.Load(loaded, [], [folder], av.EImageDescriberType_stringToEnums("akaze"))
+    assert list(loaded.keys()) == [(0, 1)]
+    assert loaded[(0, 1)].getDescTypes() == (AKAZE,)
+
+    # Filter by views
+    loaded = av.PairwiseMatches()
+    assert av.LoadMatchFile(loaded, filepath, [1, 2])
+    assert list(loaded.keys()) == [(1, 2)]
+
+    # Keep the first matches only
+    loaded = av.PairwiseMatches()
+    assert av.LoadMatchFile(loaded, filepath, [], av.EImageDescriberType_stringToEnums("sift"), 2)
+    assert np.array_equal(loaded[(0, 1)].getMatchesArray(SIFT), [[0, 0], [1, 1]])
+
+    assert not av.LoadMatchFile(loaded, os.path.join(folder, "missing." + extension))
+
+
+def test_save_and_load_per_image(tmp_path):
+    """ Test saving one match file per image and loading them back. """
+    matches = create_matches()
+    folder = str(tmp_path)
+    assert av.Save(matches, folder, "txt", True)
+
+    loaded = av.PairwiseMatches()
+    assert av.LoadMatchFilePerImage(loaded, [0, 1, 2], folder, "matches.txt") == 2
+    assert_same_matches(loaded, matches)
+
+
+def test_filters():
+    """ Test filtering the matches by views and by number of matches. """
+    matches = create_matches()
+    av.filterMatchesByViews(matches, [0, 1])
+    assert list(matches.keys()) == [(0, 1)]
+
+    matches = create_matches()
+    av.filterTopMatches(matches, 1, 0)
+    assert matches[(0, 1)].getNbMatches(SIFT) == 1
+    assert matches[(1, 2)].getNbMatches(SIFT) == 1
@@ -11,6 +11,11 @@ from pyalicevision import sensorDB as db
 # - bool parseDatabase(string& databaseFilePath, vector<Datasheet>& databaseStructure) => DONE
 # - bool getInfo(string& brand, string& model, vector<Datasheet>& databaseStructure,
 #                Datasheet& datasheetContent) => DONE
+# - bool parseDatabase(string& databaseFilePath, SensorDatabase& database) => DONE
+# - bool getInfo(string& brand, string& model, SensorDatabase& database,
+#                Datasheet& datasheetContent) => DONE
+# - SensorDatabase::findIndex(string& brand, string& model) => DONE
+# - SensorDatabase::findIndexes(vector<string>& brands, vector<string>& models) => DONE
 ##################
 
 DB_PATH = os.path.abspath(os.path.dirname(__file__)) + \
@@ -60,3 +65,24 @@ def test_sensordb_parse_invalid_info():
     assert datasheet._brand == ""
     assert datasheet._model == ""
     assert datasheet._sensorWidth == 0
+
+
+def test_sensordb_indexed_database():
+    """ Test loading a valid database in an indexed structure and retrieving datasheets from it,
+    one by one or in batch. """
+    database = db.SensorDatabase()
+    ret = db.parseDatabase(DB_PATH, database)
+    assert ret and database.size() > 0
+
+    datasheet = db.Datasheet()
+    ret = db.getInfo("Canon", "Canon PowerShot SD900", database, datasheet)
+    assert ret
+    assert datasheet._model == "Canon PowerShot SD900"
+    assert datasheet._sensorWidth == 7.144
+
+    indexes = database.findIndexes(["Canon", "canon", "TestBrand"],
+                                   ["Canon PowerShot SD900", "powershot sd900", "TestModel"])
+    assert len(indexes) == 3
+    assert indexes[0] == indexes[1] == database.findIndex("Canon", "Canon PowerShot SD900")
+    assert database.getDatasheets()[indexes[0]]._sensorWidth == 7.144
+    assert indexes[2] == -1
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark of the numeric metadata getters of the ImageInfo class.
+
+It is not collected by pytest and can be run from the root of the repository with:
+    python -m pyTests.sfmData.benchmark_imageinfo [--views N] [--passes P]
+"""
+
+import argparse
+import time
+
+from pyalicevision import sfmData as av
+from ..constants import IMAGE_PATH, IMAGE_WIDTH, IMAGE_HEIGHT, METADATA
+
+# Getters relying on the conversion of metadata values to real numbers
+GETTERS = [
+    "getMetadataShutter",
+    "getMetadataFNumber",
+    "getMetadataISO",
+    "getMetadataFocalLength",
+    "getSensorWidth",
+    "getEv",
+]
+
+
+def run_pass(images):
+    """ Call all the getters on all the images and return the elapsed time in seconds. """
+    start = time.perf_counter()
+    for image in images:
+        for getter in GETTERS:
+            getattr(image, getter)()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--views", type=int, default=100000, help="Number of ImageInfo objects.")
+    parser.add_argument("--passes", type=int, default=3,
+                        help="Number of calls of each getter on each ImageInfo object.")
+    args = parser.parse_args()
+
+    images = [av.ImageInfo(IMAGE_PATH, IMAGE_WIDTH, IMAGE_HEIGHT, METADATA) for _ in range(args.views)]
+    nb_calls = len(images) * len(GETTERS)
+
+    for index in range(args.passes):
+        elapsed = run_pass(images)
+        print(f"Pass {index + 1}: {nb_calls} calls in {elapsed:.3f} s "
+              f"({1e6 * elapsed / nb_calls:.2f} us per call)")
+
+
+if __name__ == "__main__":
+    main()
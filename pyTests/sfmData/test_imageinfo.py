@@ -34,9 +34,9 @@ from ..constants import IMAGE_PATH, IMAGE_WIDTH, IMAGE_HEIGHT, METADATA
 # - double getMetadataFNumber() => DONE
 # - double getMetadataISO() => DONE
 # - EEXIFOrientation getMetadataOrientation() => DONE
-# - Vec3 getGpsPositionFromMetadata() !!! not correctly binded (Vec3) !!!
+# - Vec3 getGpsPositionFromMetadata()
 # - void getGpsPositionWGS84FromMetadata(double& lat, double& lon, double& alt)
-# - Vec3 getGpsPositionWGS84FromMetadata() !!! not correctly binded (Vec3) !!!
+# - Vec3 getGpsPositionWGS84FromMetadata()
 # - string getColorProfileFileName() => DONE
 # - vector<int> getCameraMultiplicator()
 # - bool getVignettingParams(vector<float> vignParam)
@@ -56,7 +56,7 @@ from ..constants import IMAGE_PATH, IMAGE_WIDTH, IMAGE_HEIGHT, METADATA
 # - void addDCPMetadata(imaage::DCPProfile& dcpProf)
 # - void addVignettingMetadata(LensParam& lensParam)
 # - void addChromaticMetadata(LensParam& lensParam)
-# - void getSensorSize(vector<sensorDB::Datasheet> sensorDB, double& sensorWidth,
+# - void getSensorSize(sensorDB::SensorDatabase& sensorDB, double& sensorWidth,
 #                      double& sensorHeight, double& focalLengthmm,
 #                      camera::EInitMode& intrinsicInitMode, bool verbose = false)
 ##################
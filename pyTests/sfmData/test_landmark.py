@@ -2,6 +2,7 @@
 Collection of unit tests for the Landmark class.
 """
 
+import numpy as np
 import pytest
 
 from pyalicevision import sfmData as av
@@ -10,8 +11,10 @@ from pyalicevision import sfmData as av
 ### List of functions:
 # - Landmark()
 # - Landmark(feature::EImageDescriberType descType)
+# - Landmark(Vec3& pos3d) => DONE
 # - Landmark(Vec3& pos3d, feature::EImageDescriberType descType,
-#            image::RGBColor& color) / not binded
+#            image::RGBColor& color) / image::RGBColor not binded
+# - Vec3 X => DONE
 # - operator==(other) => DONE
 # - [inline] operator!=(other) => DONE
 # - Observations& getObservations() / Observations (stl::flat_map) not binded
@@ -31,7 +34,31 @@ def test_landmark_feature_constructor():
     assert True
 
 
-@pytest.mark.skip(reason="feature::EImageDescriberType, Vec3 and image::RGBColor not binded")
+def test_landmark_position_constructor():
+    """ Test creating a Landmark object with a 3D position and checking it is correctly
+    initialized. """
+    position = np.array([1.0, -2.5, 10.0])
+    landmark = av.Landmark(position)
+    assert np.array_equal(landmark.X, position)
+    assert landmark == av.Landmark([1.0, -2.5, 10.0])
+
+
+def test_landmark_get_set_position():
+    """ Test creating a Landmark object and getting/setting its 3D position. """
+    landmark = av.Landmark()
+    position = np.array([1.0, -2.5, 10.0])
+
+    landmark.X = position
+    assert np.array_equal(landmark.X, position)
+
+    # The returned Vec3 is a copy: modifying it does not update the Landmark
+    returned_position = landmark.X
+    assert returned_position.shape == (3,)
+    returned_position[0] = 0.0
+    assert landmark.X[0] == position[0]
+
+
+@pytest.mark.skip(reason="feature::EImageDescriberType and image::RGBColor not binded")
 def test_landmark_constructor():
     """ Test creating a Landmark object with all possible initial values and checking they are
     correctly initialized. """
@@ -50,7 +77,14 @@ def test_landmark_compare():
     assert landmark1 == landmark2, \
         "The two Landmark objects should be equal despite their different 'state' values"
 
-    # TODO: Update the describer type, the Vec3 or the image before comparing again
+    # The positions are compared with a tolerance
+    landmark1.X = np.array([1.0, 2.0, 3.0])
+    assert landmark1 != landmark2
+
+    landmark2.X = np.array([1.0, 2.0, 3.0 + 1e-5])
+    assert landmark1 == landmark2
+
+    # TODO: Update the describer type or the image before comparing again
 
 
 @pytest.mark.skip(reason="stl::flat_map<Observation> not binded")
@@ -2,19 +2,19 @@
 Collection of unit tests for the Observation class.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import sfmData as av
 
 ##################
 ### List of functions:
 # - Observation() => DONE
-# - Observation(Vec2& p, IndexT idFeat, double scale) / Vec2 not binded
+# - Observation(Vec2& p, IndexT idFeat, double scale) => DONE
 # - operator==(other) => DONE
-# - Vec2& getCoordinates() / Vec2 not binded
+# - Vec2& getCoordinates() => DONE
 # - double getX() => DONE
 # - double getY() => DONE
-# - void setCoordinates(Vec2& coordinates) / Vec2 not binded
+# - void setCoordinates(Vec2& coordinates) => DONE
 # - void setCoordinates(double x, double y) => DONE
 # - IndexT getFeatureId() => DONE
 # - void setFeatureId(IndexT featureId) => DONE
@@ -30,11 +30,23 @@ def test_observation_default_constructor():
     assert observation.getScale() == 0.0
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_observation_constructor():
     """ Test creating an Observation object with initial values and checking
     they are correctly initialized. """
-    assert True
+    coordinates = np.array([123.345, 456.678])
+    feature_id = 98765
+    scale = 1.23
+    observation = av.Observation(coordinates, feature_id, scale)
+
+    assert np.array_equal(observation.getCoordinates(), coordinates)
+    assert observation.getX() == coordinates[0]
+    assert observation.getY() == coordinates[1]
+    assert observation.getFeatureId() == feature_id
+    assert observation.getScale() == scale
+
+    # Any array-like object with two values can be used as a Vec2
+    observation = av.Observation([1.0, 2.0], feature_id, scale)
+    assert observation.getX() == 1.0 and observation.getY() == 2.0
 
 
 def test_observation_compare():
@@ -66,10 +78,21 @@ def test_observation_compare():
     assert not observation1 == observation2
 
 
-@pytest.mark.skip(reason="Vec2 not binded")
 def test_observation_get_set_vec2_coordinates():
     """ Test creating an Observation object and getting/setting its coordinates as a Vec2. """
-    assert True
+    observation = av.Observation()
+    coordinates = np.array([123.345, 456.678])
+
+    observation.setCoordinates(coordinates)
+    assert np.array_equal(observation.getCoordinates(), coordinates)
+    assert observation.getX() == coordinates[0]
+    assert observation.getY() == coordinates[1]
+
+    # The returned Vec2 is a copy: modifying it does not update the Observation
+    returned_coordinates = observation.getCoordinates()
+    assert returned_coordinates.shape == (2,)
+    returned_coordinates[0] = 0.0
+    assert observation.getX() == coordinates[0]
 
 
 def test_observation_get_set_double_coordinates():
@@ -2,7 +2,7 @@
 Collection of unit tests for the RotationPrior structure.
 """
 
-import pytest
+import numpy as np
 
 from pyalicevision import sfmData as av
 
@@ -11,7 +11,7 @@ from pyalicevision import sfmData as av
 # - RotationPrior() => DONE
 # - RotationPrior(IndexT view_first = UndefinedIndexT, IndexT view_second = UndefinedIndexT,
 #                 Eigen::Matrix3d second_R_first = Eigen::Matrix3d::Identity())
-#                 => DONE / Eigen::Matrix3d not binded
+#                 => DONE
 # - operator==(other) => DONE
 ##################
 
@@ -23,10 +23,20 @@ def test_rotationprior_default_constructor():
     assert prior.ViewSecond == av.UndefinedIndexT
 
 
-@pytest.mark.skip(reason="Eigen::Matrix3d not binded")
 def test_rotationprior_constructor():
     """ Test creating RotationPriors with initial values and checking that they have
     correctly been initialized. """
+    rotation = np.array([[0.0, -1.0, 0.0],
+                         [1.0, 0.0, 0.0],
+                         [0.0, 0.0, 1.0]])
+    prior = av.RotationPrior(12345, 56789, rotation)
+    assert prior.ViewFirst == 12345
+    assert prior.ViewSecond == 56789
+    assert np.array_equal(prior._second_R_first, rotation)
+
+    # The default rotation is the identity
+    prior = av.RotationPrior()
+    assert np.array_equal(prior._second_R_first, np.identity(3))
 
 
 def test_rotationprior_compare():
@@ -42,3 +52,11 @@ def test_rotationprior_compare():
 
     prior1.ViewSecond = 56789
     assert not prior1 == prior2
+
+    prior2.ViewSecond = 56789
+    assert prior1 == prior2
+
+    prior1._second_R_first = np.array([[0.0, -1.0, 0.0],
+                                       [1.0, 0.0, 0.0],
+                                       [0.0, 0.0, 1.0]])
+    assert not prior1 == prior2
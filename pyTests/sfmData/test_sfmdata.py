@@ -4,6 +4,9 @@ Collection of unit tests for the SfMData class.
 
 import os
 
+import numpy as np
+import pytest
+
 from pyalicevision import sfmData as av
 from ..constants import IMAGE_PATH, VIEW_ID, INTRINSIC_ID, POSE_ID, IMAGE_WIDTH, \
     IMAGE_HEIGHT, RIG_ID, SUBPOSE_ID, METADATA
@@ -18,6 +21,7 @@ from ..constants import IMAGE_PATH, VIEW_ID, INTRINSIC_ID, POSE_ID, IMAGE_WIDTH,
 # - Rigs& getRigs() => DONE
 # - Intrinsics& getIntrinsics() => DONE / Intrinsics derived classes not fully binded
 # - Landmarks& getLandmarks() => DONE
+# - getLandmarksArray() / getObservationsArray() / setLandmarksArrays(...) (Python) => DONE
 # - Constraints2D& getConstraints2D() => DONE
 # - RotationPriors& getRotationPriors() => DONE
 # - vector<string>& getRelativeFeaturesFolders() => DONE
@@ -124,6 +128,56 @@ def test_sfmdata_get_landmarks():
         "The list of Landmarks should have been updated"
 
 
+def test_sfmdata_landmarks_arrays():
+    """ Test exporting the Landmarks and their Observations of an SfMData object as structured
+    arrays, and importing them back. """
+    data = av.SfMData()
+
+    landmarks = np.zeros(3, dtype=av.LANDMARK_DTYPE)
+    landmarks["id"] = [50, 10, 30]
+    landmarks["X"] = np.arange(9).reshape(3, 3)
+    landmarks["rgb"] = [[255, 0, 0], [0, 255, 0], [0, 0, 255]]
+    landmarks["state"] = av.EEstimatorParameterState_CONSTANT
+
+    observations = np.zeros(3, dtype=av.OBSERVATION_DTYPE)
+    observations["landmarkId"] = [30, 30, 10]
+    observations["viewId"] = [4, 2, 7]
+    observations["x"] = [1.5, 2.5, 3.5]
+    observations["y"] = [-1.0, -2.0, -3.0]
+    observations["featureId"] = [11, 12, 13]
+    observations["scale"] = [0.5, 1.0, 2.0]
+
+    data.setLandmarksArrays(landmarks, observations)
+    assert len(data.getLandmarks()) == 3
+    assert data.getLandmarks()[30].state == av.EEstimatorParameterState_CONSTANT
+
+    # Landmarks are sorted by id, Observations by landmark id then view id
+    exported_landmarks = data.getLandmarksArray()
+    assert exported_landmarks.dtype == av.LANDMARK_DTYPE
+    assert np.array_equal(exported_landmarks, np.sort(landmarks, order="id"))
+
+    exported_observations = data.getObservationsArray()
+    assert exported_observations.dtype == av.OBSERVATION_DTYPE
+    assert np.array_equal(exported_observations, observations[[2, 1, 0]])
+
+    # Columns can also be exported without the structured arrays
+    columns = av.getLandmarkColumns(data.getLandmarks())
+    assert columns.positions.shape == (3, 3)
+    assert columns.colors.dtype == np.uint8
+    assert np.array_equal(columns.ids, [10, 30, 50])
+
+    # Observations of unknown landmarks are rejected and the Landmarks are left untouched
+    observations["landmarkId"][0] = 20
+    with pytest.raises(ValueError):
+        data.setLandmarksArrays(landmarks, observations)
+    assert np.array_equal(data.getObservationsArray(), exported_observations)
+
+    # Landmarks can be imported without Observations
+    data.setLandmarksArrays(landmarks[:1])
+    assert len(data.getLandmarks()) == 1
+    assert len(data.getObservationsArray()) == 0
+
+
 def test_sfmdata_get_constraints2d():
     """" Test creating an empty SfMData object, retrieving and editing its Constraints2D. """
     data = av.SfMData()
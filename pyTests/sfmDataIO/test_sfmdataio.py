@@ -4,6 +4,8 @@ Collection of unit tests for the SfMDataIO class.
 
 import os
 
+import numpy as np
+
 import pyalicevision as av
 from ..constants import SFMDATA_PATH, IMAGE_PATH, VIEW_ID, INTRINSIC_ID, POSE_ID, \
     IMAGE_WIDTH, IMAGE_HEIGHT, RIG_ID, SUBPOSE_ID, METADATA
@@ -13,6 +15,7 @@ from ..constants import SFMDATA_PATH, IMAGE_PATH, VIEW_ID, INTRINSIC_ID, POSE_ID
 # - bool validIds(SfMData& sfmData, ESfMData partFlag) => DONE
 # - bool load(SfMData& sfmData, string& filename, ESfMData partFlag) => DONE
 # - bool save(SfMData& sfmData, string& filename, ESfMData partFlag) => DONE
+# - SfMBFile(string& filename) => DONE
 ##################
 
 def test_sfmdataio_load():
@@ -75,3 +78,47 @@ def test_sfmdataio_valid_ids():
     # Set random intrinsic ID for the View that has been added
     view.setIntrinsicId(23456)
     assert not av.sfmDataIO.validIds(data, av.sfmDataIO.ALL)
+
+
+def test_sfmdataio_sfmb_columns():
+    """ Test saving an SfMData object with Landmarks in the binary format and reading back
+    its columns as NumPy arrays. """
+    data = av.sfmData.SfMData()
+    ret = av.sfmDataIO.load(data, SFMDATA_PATH, av.sfmDataIO.ALL)
+    assert ret
+
+    landmarks = data.getLandmarks()
+    for landmark_id in (5, 12):
+        landmark = av.sfmData.Landmark()
+        landmark.X = np.array([landmark_id, 1.0, 2.0])
+        landmarks[landmark_id] = landmark
+
+    new_path = os.path.abspath(os.path.dirname(__file__)) + "/out.sfmb"
+    ret = av.sfmDataIO.save(data, new_path, av.sfmDataIO.ALL)
+    assert ret
+
+    try:
+        sfmb = av.sfmDataIO.SfMBFile(new_path)
+        assert sfmb.getLandmarkCount() == 2
+        assert sfmb.getObservationCount() == 0
+
+        ids = sfmb.getLandmarkIds()
+        positions = sfmb.getPositions()
+        assert list(ids) == [5, 12]
+        assert positions.shape == (3, 2)
+        assert np.array_equal(positions[0], [5.0, 12.0])
+        assert sfmb.getColors().shape == (3, 2)
+        assert not positions.flags.writeable, "The columns are mapped in read-only mode"
+
+        # The arrays keep the file mapped
+        del sfmb
+        assert np.array_equal(positions[1], [1.0, 1.0])
+
+        new_data = av.sfmData.SfMData()
+        ret = av.sfmDataIO.load(new_data, new_path, av.sfmDataIO.ALL)
+        assert ret
+        assert len(new_data.getViews()) == len(data.getViews())
+        assert len(new_data.getLandmarks()) == 2
+
+    finally:
+        os.remove(new_path)
@@ -0,0 +1,96 @@
+"""
+Collection of unit tests for building tracks from pairwise matches and exporting them as NumPy arrays.
+"""
+
+import numpy as np
+
+from pyalicevision import matching
+from pyalicevision import track as av
+
+##################
+### List of functions:
+# - TracksBuilder() => DONE
+# - void TracksBuilder.build(PairwiseMatches& pairwiseMatches) => DONE
+# - void TracksBuilder.filter(bool clearForks, size_t minTrackLength, bool multithreaded) => DONE
+# - size_t TracksBuilder.nbTracks() => DONE
+# - TrackColumns TracksBuilder.getTrackColumns() => DONE
+# - TracksHandler() => DONE
+# - bool TracksHandler.load(string pathJson, set<IndexT> viewIds) => NOT DONE (requires a tracks file)
+# - TrackColumns TracksHandler.getTrackColumns() => DONE
+# - TrackColumns buildTracks(PairwiseMatches matches, bool clearForks, int minTrackLength) (Python) => DONE
+##################
+
+SIFT = matching.EImageDescriberType_SIFT
+
+
+def create_matches():
+    """ Create matches between the views 0, 1 and 2:
+    A    B    C
+    0 -> 0 -> 0
+    1 -> 1 -> 6
+    2 -> 3
+    """
+    matches = matching.PairwiseMatches()
+
+    matches_01 = matching.MatchesPerDescType()
+    matches_01.setMatchesArray(SIFT, np.array([[0, 0], [1, 1], [2, 3]], dtype=np.uint32))
+    matches[(0, 1)] = matches_01
+
+    matches_12 = matching.MatchesPerDescType()
+    matches_12.setMatchesArray(SIFT, np.array([[0, 0], [1, 6]], dtype=np.uint32))
+    matches[(1, 2)] = matches_12
+
+    return matches
+
+
+def test_tracks_builder():
+    """ Test building the tracks and exporting them as CSR arrays. """
+    tracks_builder = av.TracksBuilder()
+    tracks_builder.build(create_matches())
+    assert tracks_builder.nbTracks() == 3
+
+    columns = tracks_builder.getTrackColumns()
+    assert columns.size() == 3
+    assert np.array_equal(columns.trackIds, [0, 1, 2])
+    assert np.array_equal(columns.descTypes, [SIFT] * 3)
+    assert np.array_equal(columns.offsets, [0, 3, 6, 8])
+    assert np.array_equal(columns.viewIds, [0, 1, 2, 0, 1, 2, 0, 1])
+    assert np.array_equal(columns.featureIds, [0, 0, 0, 1, 1, 6, 2, 3])
+    assert columns.offsets.dtype == np.uint64
+    assert columns.viewIds.dtype == np.uint32
+
+    # Observations of the second track
+    begin, end = columns.offsets[1], columns.offsets[2]
+    assert np.array_equal(columns.featureIds[begin:end], [1, 1, 6])
+
+
+def test_tracks_builder_filter():
+    """ Test removing the short tracks. """
+    tracks_builder = av.TracksBuilder()
+    tracks_builder.build(create_matches())
+    tracks_builder.filter(True, 3)
+    assert tracks_builder.nbTracks() == 2
+
+    columns = tracks_builder.getTrackColumns()
+    assert np.array_equal(columns.offsets, [0, 3, 6])
+    assert np.array_equal(columns.featureIds, [0, 0, 0, 1, 1, 6])
+
+
+def test_build_tracks():
+    """ Test the helper building and filtering the tracks in one call. """
+    columns = av.buildTracks(create_matches(), minTrackLength=3)
+    assert columns.size() == 2
+    assert np.array_equal(columns.viewIds, [0, 1, 2, 0, 1, 2])
+
+    columns = av.buildTracks(matching.PairwiseMatches())
+    assert columns.size() == 0
+    assert np.array_equal(columns.offsets, [0])
+
+
+def test_tracks_handler():
+    """ Test exporting the tracks of an empty TracksHandler. """
+    tracks_handler = av.TracksHandler()
+    columns = tracks_handler.getTrackColumns()
+    assert columns.size() == 0
+    assert np.array_equal(columns.offsets, [0])
+    assert columns.viewIds.shape == (0,)
@@ -0,0 +1,147 @@
+"""
+Collection of unit tests for the vocabulary tree and the database of images used to select image pairs.
+"""
+
+import os
+
+import numpy as np
+
+from pyalicevision import sfmData
+from pyalicevision import voctree as av
+
+##################
+### List of functions:
+# - VocabularyTree(string file) => DONE
+# - uint32_t VocabularyTree.levels() / splits() / words() => DONE
+# - SparseHistogram VocabularyTree.quantizeToSparse(array descriptors) => DONE
+# - Database(uint32_t num_words) => DONE
+# - DocId Database.insert(DocId doc_id, SparseHistogram document) => DONE
+# - bool Database.erase(DocId doc_id) / bool Database.contains(DocId doc_id) => DONE
+# - void Database.find(SparseHistogram query, size_t N, DocMatches matches, string distanceMethod) => DONE
+# - void Database.find(SparseHistogramPerImage queries, size_t N, DocMatchesPerImage matches, string distanceMethod) => DONE
+# - void Database.computeTfIdfWeights(float default_weight) => DONE
+# - void Database.save(string folder, size_t words_per_shard) / void Database.load(string folder) => DONE
+# - bool Database.exists(string folder) => DONE
+# - void getListOfDescriptorFiles(SfMData sfmData, vector<string> featuresFolders, DescriptorFiles descriptorsFiles) => DONE
+# - size_t populateDatabase(SfMData sfmData, vector<string> featuresFolders, VocabularyTree tree, Database db, int Nmax) => DONE
+##################
+
+# Descriptors of the 4 words of the tree created by write_tree
+WORD_DESCRIPTORS = np.zeros((4, 128), dtype=np.uint8)
+WORD_DESCRIPTORS[[2, 3], 0] = 200
+WORD_DESCRIPTORS[[1, 3], 1] = 200
+
+# Words of the features of each view
+VIEW_WORDS = {1: [0, 0, 1], 2: [0, 0, 1], 3: [2, 3, 3], 4: [2, 3]}
+
+
+def write_tree(folder):
+    """ Write a vocabulary tree with 2 levels and 2 splits: the word of a descriptor only
+    depends on its first two elements (0 or 200). """
+    centers = np.zeros((6, 128), dtype=np.float32)
+    centers[[1, 4, 5], 0] = 200
+    centers[[3, 5], 1] = 200
+    path = os.path.join(folder, "test.tree")
+    with open(path, "wb") as tree_file:
+        tree_file.write(np.array([2, 2, len(centers)], dtype=np.uint32).tobytes())
+        tree_file.write(centers.tobytes())
+        tree_file.write(np.ones(len(centers), dtype=np.uint8).tobytes())
+    return path
+
+
+def write_descriptors(folder):
+    """ Create a SfMData with the views of VIEW_WORDS and write their SIFT descriptor files. """
+    data = sfmData.SfMData()
+    views = data.getViews()
+    for view_id, words in VIEW_WORDS.items():
+        view = sfmData.View()
+        view.setViewId(view_id)
+        views[view_id] = view
+
+        with open(os.path.join(folder, str(view_id) + ".sift.desc"), "wb") as desc_file:
+            desc_file.write(np.array([len(words)], dtype=np.uint64).tobytes())
+            desc_file.write(WORD_DESCRIPTORS[words].tobytes())
+    return data
+
+
+def test_vocabulary_tree(tmp_path):
+    """ Test loading a vocabulary tree and quantizing descriptors. """
+    tree = av.VocabularyTree(write_tree(str(tmp_path)))
+    assert tree.levels() == 2
+    assert tree.splits() == 2
+    assert tree.words() == 4
+
+    histogram = tree.quantizeToSparse(WORD_DESCRIPTORS[[3, 0, 3, 1]])
+    assert dict((word, list(features)) for word, features in histogram.items()) == \
+        {0: [1], 1: [3], 3: [0, 2]}
+
+
+def test_database_find(tmp_path):
+    """ Test querying a database with single and batched queries. """
+    tree = av.VocabularyTree(write_tree(str(tmp_path)))
+    db = av.Database(tree.words())
+    histograms = av.SparseHistogramPerImage()
+    for view_id, words in VIEW_WORDS.items():
+        histograms[view_id] = tree.quantizeToSparse(WORD_DESCRIPTORS[words])
+        db.insert(view_id, histograms[view_id])
+    db.computeTfIdfWeights()
+    assert db.size() == 4
+    assert db.words() == 4
+    assert db.contains(3)
+
+    matches = av.DocMatches()
+    db.find(histograms[1], 2, matches, "commonPoints")
+    assert [m.id for m in matches] == [1, 2]
+    assert [m.score for m in matches] == [-3, -3]
+
+    all_matches = av.DocMatchesPerImage()
+    db.find(histograms, 2, all_matches, "commonPoints")
+    assert sorted(all_matches.keys()) == [1, 2, 3, 4]
+    assert [m.id for m in all_matches[3]] == [3, 4]
+    assert list(all_matches[1]) == list(matches)
+
+    assert db.erase(3)
+    assert not db.contains(3)
+    assert not db.erase(3)
+
+
+def test_database_save_load(tmp_path):
+    """ Test saving a database and loading it with its documents. """
+    folder = str(tmp_path / "database")
+    tree = av.VocabularyTree(write_tree(str(tmp_path)))
+    db = av.Database(tree.words())
+    for view_id, words in VIEW_WORDS.items():
+        db.insert(view_id, tree.quantizeToSparse(WORD_DESCRIPTORS[words]))
+
+    assert not av.Database.exists(folder)
+    db.save(folder, 2)
+    assert av.Database.exists(folder)
+
+    loaded = av.Database()
+    loaded.load(folder)
+    assert loaded.size() == 4
+    assert loaded.words() == 4
+    for view_id, histogram in db.getSparseHistogramPerImage().items():
+        loaded_histogram = loaded.getSparseHistogramPerImage()[view_id]
+        assert dict((w, list(f)) for w, f in loaded_histogram.items()) == \
+            dict((w, list(f)) for w, f in histogram.items())
+
+
+def test_populate_database(tmp_path):
+    """ Test reading the descriptor files of the views of a SfMData into a database. """
+    data = write_descriptors(str(tmp_path))
+    tree = av.VocabularyTree(write_tree(str(tmp_path)))
+
+    descriptors_files = av.DescriptorFiles()
+    av.getListOfDescriptorFiles(data, [str(tmp_path)], descriptors_files)
+    assert sorted(descriptors_files.keys()) == [1, 2, 3, 4]
+    assert descriptors_files[2] == os.path.join(str(tmp_path), "2.sift.desc")
+
+    db = av.Database(tree.words())
+    assert av.populateDatabase(data, [str(tmp_path)], tree, db) == 11
+    assert db.size() == 4
+    histogram = db.getSparseHistogramPerImage()[3]
+    assert dict((w, list(f)) for w, f in histogram.items()) == {2: [0], 3: [1, 2]}
+
+    # the views already in the database are skipped
+    assert av.populateDatabase(data, [str(tmp_path)], tree, db) == 0
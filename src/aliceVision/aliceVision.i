@@ -10,12 +10,17 @@
 %include <aliceVision/version.hpp>
 
 %import <aliceVision/camera/Camera.i>
+%import <aliceVision/feature/Feature.i>
 %import <aliceVision/geometry/Geometry.i>
 %import <aliceVision/hdr/Hdr.i>
+%import <aliceVision/imageMatching/ImageMatching.i>
+%import <aliceVision/matching/Matching.i>
 %import <aliceVision/sensorDB/SensorDB.i>
 %import <aliceVision/sfmDataIO/SfMDataIO.i>
 %import <aliceVision/sfmData/SfMData.i>
 %import <aliceVision/stl/Stl.i>
+%import <aliceVision/track/Track.i>
+%import <aliceVision/voctree/Voctree.i>
 
 %{
 #include <aliceVision/version.hpp>
@@ -8,6 +8,9 @@
 
 %include <aliceVision/global.i>
 
+// Pose3 objects are created with the geometry module
+%import <aliceVision/geometry/Geometry.i>
+
 %{
 #include <aliceVision/camera/camera.hpp>
 #include <aliceVision/camera/cameraCommon.hpp>
@@ -30,3 +33,4 @@ using namespace aliceVision::camera;
 %include <aliceVision/camera/IntrinsicInitMode.i>
 %include <aliceVision/camera/Equidistant.i>
 %include <aliceVision/camera/Pinhole.i>
+%include <aliceVision/camera/RemapGrid.i>
@@ -57,6 +57,28 @@ class Distortion
     /// Remove distortion (return p' such that disto(p') = p)
     virtual Vec2 removeDistortion(const Vec2& p) const { return p; }
 
+    /// Add distortion to a set of points, one per column (assume points are in the camera frame [normalized coordinates])
+    virtual Mat2X addDistortionPoints(const Mat2X& pts) const
+    {
+        Mat2X distorted(2, pts.cols());
+        for (Eigen::Index i = 0; i < pts.cols(); ++i)
+        {
+            distorted.col(i) = addDistortion(pts.col(i));
+        }
+        return distorted;
+    }
+
+    /// Remove distortion from a set of points, one per column
+    virtual Mat2X removeDistortionPoints(const Mat2X& pts) const
+    {
+        Mat2X undistorted(2, pts.cols());
+        for (Eigen::Index i = 0; i < pts.cols(); ++i)
+        {
+            undistorted.col(i) = removeDistortion(pts.col(i));
+        }
+        return undistorted;
+    }
+
     virtual double getUndistortedRadius(double r) const { return r; }
 
     virtual Eigen::Matrix2d getDerivativeAddDistoWrtPt(const Vec2& p) const { return Eigen::Matrix2d::Identity(); }
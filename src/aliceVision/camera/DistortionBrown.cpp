@@ -38,6 +38,33 @@ Vec2 DistortionBrown::addDistortion(const Vec2& p) const
     return result;
 }
 
+Mat2X DistortionBrown::addDistortionPoints(const Mat2X& pts) const
+{
+    const double k1 = _distortionParams[0];
+    const double k2 = _distortionParams[1];
+    const double k3 = _distortionParams[2];
+    const double t1 = _distortionParams[3];
+    const double t2 = _distortionParams[4];
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> px = pts.row(0).array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> py = pts.row(1).array();
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> r2 = px.square() + py.square();
+    const Eigen::Array<double, 1, Eigen::Dynamic> r4 = r2 * r2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> r6 = r4 * r2;
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> k_diff = (k1 * r2 + k2 * r4 + k3 * r6);
+    const Eigen::Array<double, 1, Eigen::Dynamic> t_x = t2 * (r2 + 2 * px.square()) + 2 * t1 * px * py;
+    const Eigen::Array<double, 1, Eigen::Dynamic> t_y = t1 * (r2 + 2 * py.square()) + 2 * t2 * px * py;
+
+    Mat2X result(2, pts.cols());
+
+    result.row(0) = (px + px * k_diff + t_x).matrix();
+    result.row(1) = (py + py * k_diff + t_y).matrix();
+
+    return result;
+}
+
 Eigen::Matrix2d DistortionBrown::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double k1 = _distortionParams[0];
@@ -38,6 +38,30 @@ Vec2 DistortionFisheye::addDistortion(const Vec2& p) const
     return p * cdist;
 }
 
+Mat2X DistortionFisheye::addDistortionPoints(const Mat2X& pts) const
+{
+    const double eps = 1e-8;
+    const double& k1 = _distortionParams.at(0);
+    const double& k2 = _distortionParams.at(1);
+    const double& k3 = _distortionParams.at(2);
+    const double& k4 = _distortionParams.at(3);
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> r = pts.colwise().norm().array();
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta = r.atan();
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta2 = theta * theta;
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta3 = theta2 * theta;
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta5 = theta3 * theta2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta7 = theta5 * theta2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta9 = theta7 * theta2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> theta_dist = theta + k1 * theta3 + k2 * theta5 + k3 * theta7 + k4 * theta9;
+
+    // Points too close to the optical center are left untouched
+    const Eigen::Array<double, 1, Eigen::Dynamic> cdist = (r < eps).select(1.0, theta_dist / r);
+
+    return (pts.array().rowwise() * cdist).matrix();
+}
+
 Eigen::Matrix2d DistortionFisheye::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double eps = 1e-8;
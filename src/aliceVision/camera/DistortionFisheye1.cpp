@@ -24,6 +24,18 @@ Vec2 DistortionFisheye1::addDistortion(const Vec2& p) const
     return p * coef;
 }
 
+Mat2X DistortionFisheye1::addDistortionPoints(const Mat2X& pts) const
+{
+    const double eps = 1e-8;
+    const double& k1 = _distortionParams.at(0);
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> r = pts.colwise().norm().array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> coef = ((2.0 * std::tan(0.5 * k1)) * r).atan() / k1 / r;
+
+    // Points too close to the optical center are left untouched
+    return (pts.array().rowwise() * (k1 * r < eps).select(1.0, coef)).matrix();
+}
+
 Eigen::Matrix2d DistortionFisheye1::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double& k1 = _distortionParams.at(0);
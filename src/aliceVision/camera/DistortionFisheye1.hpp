@@ -26,6 +26,9 @@ class DistortionFisheye1 : public Distortion
     /// Add distortion to the point p (assume p is in the camera frame [normalized coordinates])
     Vec2 addDistortion(const Vec2& p) const override;
 
+    /// Add distortion to a set of points, one per column
+    Mat2X addDistortionPoints(const Mat2X& pts) const override;
+
     /// Remove distortion (return p' such that disto(p') = p)
     Vec2 removeDistortion(const Vec2& p) const override;
 
@@ -23,6 +23,14 @@ Vec2 DistortionRadialK1::addDistortion(const Vec2& p) const
     return (p * r_coeff);
 }
 
+Mat2X DistortionRadialK1::addDistortionPoints(const Mat2X& pts) const
+{
+    const double k1 = _distortionParams.at(0);
+    const Eigen::Array<double, 1, Eigen::Dynamic> r2 = pts.colwise().squaredNorm().array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> r_coeff = 1. + k1 * r2;
+    return (pts.array().rowwise() * r_coeff).matrix();
+}
+
 Eigen::Matrix2d DistortionRadialK1::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double k1 = _distortionParams[0];
@@ -123,6 +131,20 @@ Vec2 DistortionRadialK3::addDistortion(const Vec2& p) const
     return (p * r_coeff);
 }
 
+Mat2X DistortionRadialK3::addDistortionPoints(const Mat2X& pts) const
+{
+    const double& k1 = _distortionParams[0];
+    const double& k2 = _distortionParams[1];
+    const double& k3 = _distortionParams[2];
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> r2 = pts.colwise().squaredNorm().array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> r4 = r2 * r2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> r6 = r4 * r2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> r_coeff = (1. + k1 * r2 + k2 * r4 + k3 * r6);
+
+    return (pts.array().rowwise() * r_coeff).matrix();
+}
+
 Eigen::Matrix2d DistortionRadialK3::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double& k1 = _distortionParams[0];
@@ -276,6 +298,20 @@ Vec2 DistortionRadialK3PT::addDistortion(const Vec2& p) const
     return (p * r_coeff);
 }
 
+Mat2X DistortionRadialK3PT::addDistortionPoints(const Mat2X& pts) const
+{
+    const double& k1 = _distortionParams[0];
+    const double& k2 = _distortionParams[1];
+    const double& k3 = _distortionParams[2];
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> r2 = pts.colwise().squaredNorm().array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> r4 = r2 * r2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> r6 = r4 * r2;
+    const Eigen::Array<double, 1, Eigen::Dynamic> r_coeff = (1.0 + k1 * r2 + k2 * r4 + k3 * r6) / (1.0 + k1 + k2 + k3);
+
+    return (pts.array().rowwise() * r_coeff).matrix();
+}
+
 Eigen::Matrix2d DistortionRadialK3PT::getDerivativeAddDistoWrtPt(const Vec2& p) const
 {
     const double& k1 = _distortionParams[0];
@@ -73,6 +73,9 @@ class DistortionRadialK1 : public Distortion
     /// Add distortion to the point p (assume p is in the camera frame [normalized coordinates])
     Vec2 addDistortion(const Vec2& p) const override;
 
+    /// Add distortion to a set of points, one per column
+    Mat2X addDistortionPoints(const Mat2X& pts) const override;
+
     Eigen::Matrix2d getDerivativeAddDistoWrtPt(const Vec2& p) const override;
 
     Eigen::MatrixXd getDerivativeAddDistoWrtDisto(const Vec2& p) const override;
@@ -120,6 +123,9 @@ class DistortionRadialK3 : public Distortion
     /// Add distortion to the point p (assume p is in the camera frame [normalized coordinates])
     Vec2 addDistortion(const Vec2& p) const override;
 
+    /// Add distortion to a set of points, one per column
+    Mat2X addDistortionPoints(const Mat2X& pts) const override;
+
     Eigen::Matrix2d getDerivativeAddDistoWrtPt(const Vec2& p) const override;
 
     Eigen::MatrixXd getDerivativeAddDistoWrtDisto(const Vec2& p) const override;
@@ -153,6 +159,9 @@ class DistortionRadialK3PT : public Distortion
     /// Add distortion to the point p (assume p is in the camera frame [normalized coordinates])
     Vec2 addDistortion(const Vec2& p) const override;
 
+    /// Add distortion to a set of points, one per column
+    Mat2X addDistortionPoints(const Mat2X& pts) const override;
+
     Eigen::Matrix2d getDerivativeAddDistoWrtPt(const Vec2& p) const override;
 
     Eigen::MatrixXd getDerivativeAddDistoWrtDisto(const Vec2& p) const override;
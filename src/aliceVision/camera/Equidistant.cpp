@@ -38,6 +38,32 @@ Vec2 Equidistant::project(const Eigen::Matrix4d& pose, const Vec4& pt, bool appl
     return pt_ima;
 }
 
+Mat2X Equidistant::projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion) const
+{
+    const double rsensor = std::min(sensorWidth(), sensorHeight());
+    const double rscale = sensorWidth() / std::max(w(), h());
+    const double fmm = _scale(0) * rscale;
+    const double fov = rsensor / fmm;
+
+    const Mat3X X = pose(pts3D);
+
+    // Compute angle with optical center
+    const Eigen::Array<double, 1, Eigen::Dynamic> len2d = X.topRows<2>().colwise().norm().array();
+    const Eigen::Array<double, 1, Eigen::Dynamic> angle_Z = len2d.binaryExpr(X.row(2).array(), [](double a, double b) { return std::atan2(a, b); });
+
+    // Ignore depth component and compute radial angle
+    const Eigen::Array<double, 1, Eigen::Dynamic> angle_radial = X.row(1).array().binaryExpr(X.row(0).array(), [](double a, double b) { return std::atan2(a, b); });
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> radius = angle_Z / (0.5 * fov);
+
+    // radius = focal * angle_Z
+    Mat2X P(2, pts3D.cols());
+    P.row(0) = (angle_radial.cos() * radius).matrix();
+    P.row(1) = (angle_radial.sin() * radius).matrix();
+
+    return this->cam2imaPoints(applyDistortion ? this->addDistortionPoints(P) : P);
+}
+
 Eigen::Matrix<double, 2, 9> Equidistant::getDerivativeProjectWrtRotation(const Eigen::Matrix4d& pose, const Vec4& pt) const
 {
     Eigen::Matrix4d T = pose;
@@ -379,6 +405,25 @@ Vec3 Equidistant::toUnitSphere(const Vec2& pt) const
     return ret;
 }
 
+Mat3X Equidistant::toUnitSpherePoints(const Mat2X& pts) const
+{
+    const double rsensor = std::min(sensorWidth(), sensorHeight());
+    const double rscale = sensorWidth() / std::max(w(), h());
+    const double fmm = _scale(0) * rscale;
+    const double fov = rsensor / fmm;
+
+    const Eigen::Array<double, 1, Eigen::Dynamic> angle_radial = pts.row(1).array().binaryExpr(pts.row(0).array(), [](double a, double b) { return std::atan2(a, b); });
+    const Eigen::Array<double, 1, Eigen::Dynamic> angle_Z = pts.colwise().norm().array() * 0.5 * fov;
+    const Eigen::Array<double, 1, Eigen::Dynamic> sin_Z = angle_Z.sin();
+
+    Mat3X ret(3, pts.cols());
+    ret.row(0) = (angle_radial.cos() * sin_Z).matrix();
+    ret.row(1) = (angle_radial.sin() * sin_Z).matrix();
+    ret.row(2) = angle_Z.cos().matrix();
+
+    return ret;
+}
+
 Eigen::Matrix<double, 3, 2> Equidistant::getDerivativetoUnitSphereWrtPoint(const Vec2& pt) const
 {
     const double rsensor = std::min(sensorWidth(), sensorHeight());
@@ -440,10 +485,14 @@ double Equidistant::imagePlaneToCameraPlaneError(double value) const { return va
 
 Vec2 Equidistant::cam2ima(const Vec2& p) const { return _circleRadius * p + getPrincipalPoint(); }
 
+Mat2X Equidistant::cam2imaPoints(const Mat2X& pts) const { return (_circleRadius * pts).colwise() + getPrincipalPoint(); }
+
 Eigen::Matrix2d Equidistant::getDerivativeCam2ImaWrtPoint() const { return Eigen::Matrix2d::Identity() * _circleRadius; }
 
 Vec2 Equidistant::ima2cam(const Vec2& p) const { return (p - getPrincipalPoint()) / _circleRadius; }
 
+Mat2X Equidistant::ima2camPoints(const Mat2X& pts) const { return (pts.colwise() - getPrincipalPoint()) / _circleRadius; }
+
 Eigen::Matrix2d Equidistant::getDerivativeIma2CamWrtPoint() const { return Eigen::Matrix2d::Identity() * (1.0 / _circleRadius); }
 
 Eigen::Matrix2d Equidistant::getDerivativeIma2CamWrtPrincipalPoint() const { return Eigen::Matrix2d::Identity() * (-1.0 / _circleRadius); }
@@ -72,6 +72,8 @@ class Equidistant : public IntrinsicScaleOffsetDisto
         return project(pose.getHomogeneous(), pt3D, applyDistortion);
     }
 
+    Mat2X projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion = true) const override;
+
     Eigen::Matrix<double, 2, 9> getDerivativeProjectWrtRotation(const Eigen::Matrix4d& pose, const Vec4& pt) const;
 
     Eigen::Matrix<double, 2, 16> getDerivativeProjectWrtPose(const Eigen::Matrix4d& pose, const Vec4& pt) const override;
@@ -92,6 +94,8 @@ class Equidistant : public IntrinsicScaleOffsetDisto
 
     Vec3 toUnitSphere(const Vec2& pt) const override;
 
+    Mat3X toUnitSpherePoints(const Mat2X& pts) const override;
+
     Eigen::Matrix<double, 3, 2> getDerivativetoUnitSphereWrtPoint(const Vec2& pt) const;
 
     Eigen::Matrix<double, 3, 2> getDerivativetoUnitSphereWrtScale(const Vec2& pt) const;
@@ -101,11 +105,15 @@ class Equidistant : public IntrinsicScaleOffsetDisto
     // Transform a point from the camera plane to the image plane
     Vec2 cam2ima(const Vec2& p) const override;
 
+    Mat2X cam2imaPoints(const Mat2X& pts) const override;
+
     Eigen::Matrix2d getDerivativeCam2ImaWrtPoint() const override;
 
     // Transform a point from the image plane to the camera plane
     Vec2 ima2cam(const Vec2& p) const override;
 
+    Mat2X ima2camPoints(const Mat2X& pts) const override;
+
     Eigen::Matrix2d getDerivativeIma2CamWrtPoint() const override;
 
     Eigen::Matrix2d getDerivativeIma2CamWrtPrincipalPoint() const override;
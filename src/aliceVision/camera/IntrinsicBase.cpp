@@ -27,6 +27,96 @@ Vec3 IntrinsicBase::backproject(const Vec2& pt2D, bool applyUndistortion, const
     return output;
 }
 
+Mat3X IntrinsicBase::backprojectPoints(const Mat2X& pts2D, bool applyUndistortion, const geometry::Pose3& pose, double depth) const
+{
+    const Mat2X pts2D_cam = ima2camPoints(pts2D);
+    const Mat2X pts2D_undist = applyUndistortion ? removeDistortionPoints(pts2D_cam) : pts2D_cam;
+
+    const Mat3X pts3d = depth * toUnitSpherePoints(pts2D_undist);
+    return pose.inverse()(pts3d);
+}
+
+Mat2X IntrinsicBase::projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion) const
+{
+    const Eigen::Matrix4d T = pose.getHomogeneous();
+    Mat2X projected(2, pts3D.cols());
+    for (Eigen::Index i = 0; i < pts3D.cols(); ++i)
+    {
+        projected.col(i) = project(T, pts3D.col(i).homogeneous(), applyDistortion);
+    }
+    return projected;
+}
+
+Mat2X IntrinsicBase::cam2imaPoints(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = cam2ima(pts.col(i));
+    }
+    return out;
+}
+
+Mat2X IntrinsicBase::ima2camPoints(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = ima2cam(pts.col(i));
+    }
+    return out;
+}
+
+Mat2X IntrinsicBase::addDistortionPoints(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = addDistortion(pts.col(i));
+    }
+    return out;
+}
+
+Mat2X IntrinsicBase::removeDistortionPoints(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = removeDistortion(pts.col(i));
+    }
+    return out;
+}
+
+Mat2X IntrinsicBase::getUndistortedPixels(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = getUndistortedPixel(pts.col(i));
+    }
+    return out;
+}
+
+Mat2X IntrinsicBase::getDistortedPixels(const Mat2X& pts) const
+{
+    Mat2X out(2, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = getDistortedPixel(pts.col(i));
+    }
+    return out;
+}
+
+Mat3X IntrinsicBase::toUnitSpherePoints(const Mat2X& pts) const
+{
+    Mat3X out(3, pts.cols());
+    for (Eigen::Index i = 0; i < pts.cols(); ++i)
+    {
+        out.col(i) = toUnitSphere(pts.col(i));
+    }
+    return out;
+}
+
 Vec4 IntrinsicBase::getCartesianfromSphericalCoordinates(const Vec3& pt)
 {
     Vec4 rpt;
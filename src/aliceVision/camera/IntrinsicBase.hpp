@@ -107,6 +107,15 @@ class IntrinsicBase
      */
     virtual Vec2 project(const Eigen::Matrix4d& pose, const Vec4& pt3D, bool applyDistortion = true) const = 0;
 
+    /**
+     * @brief Projection of a set of 3D points into the camera plane (Apply pose, disto (if any) and Intrinsics)
+     * @param[in] pose The pose
+     * @param[in] pts3D The 3D points, one per column
+     * @param[in] applyDistortion If true, apply the distortion if there is any
+     * @return The 2D projections in the camera plane, one per column
+     */
+    virtual Mat2X projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion = true) const;
+
     /**
      * @brief Back-projection of a 2D point at a specific depth into a 3D point
      * @param[in] pt2D The 2D point
@@ -117,6 +126,19 @@ class IntrinsicBase
      */
     Vec3 backproject(const Vec2& pt2D, bool applyUndistortion = true, const geometry::Pose3& pose = geometry::Pose3(), double depth = 1.0) const;
 
+    /**
+     * @brief Back-projection of a set of 2D points at a specific depth into 3D points
+     * @param[in] pts2D The 2D points, one per column
+     * @param[in] applyUndistortion If true, remove the distortion if there is any
+     * @param[in] pose The camera pose
+     * @param[in] depth The depth
+     * @return The 3D points, one per column
+     */
+    Mat3X backprojectPoints(const Mat2X& pts2D,
+                            bool applyUndistortion = true,
+                            const geometry::Pose3& pose = geometry::Pose3(),
+                            double depth = 1.0) const;
+
     Vec4 getCartesianfromSphericalCoordinates(const Vec3& pt);
 
     Eigen::Matrix<double, 4, 3> getDerivativeCartesianfromSphericalCoordinates(const Vec3& pt);
@@ -187,13 +209,8 @@ class IntrinsicBase
     inline Mat2X residuals(const geometry::Pose3& pose, const Mat3X& X, const Mat2X& x) const
     {
         assert(X.cols() == x.cols());
-        const std::size_t numPts = x.cols();
-        Mat2X residuals = Mat2X::Zero(2, numPts);
-        for (std::size_t i = 0; i < numPts; ++i)
-        {
-            residuals.col(i) = residual(pose, ((const Vec3&)X.col(i)).homogeneous(), x.col(i));
-        }
-        return residuals;
+        // We will compare to undistorted points, so always ignore the distortion when computing coordinates
+        return getUndistortedPixels(x) - projectPoints(pose, X, false);
     }
 
     /**
@@ -308,6 +325,20 @@ class IntrinsicBase
      */
     virtual Vec2 ima2cam(const Vec2& p) const = 0;
 
+    /**
+     * @brief Transform a set of points from the camera plane to the image plane
+     * @param[in] pts Points from the camera plane, one per column
+     * @return Image plane points
+     */
+    virtual Mat2X cam2imaPoints(const Mat2X& pts) const;
+
+    /**
+     * @brief Transform a set of points from the image plane to the camera plane
+     * @param[in] pts Points from the image plane, one per column
+     * @return Camera plane points
+     */
+    virtual Mat2X ima2camPoints(const Mat2X& pts) const;
+
     /**
      * @brief Camera model handles a distortion field
      * @return True if the camera model handles a distortion field
@@ -342,6 +373,34 @@ class IntrinsicBase
      */
     virtual Vec2 getDistortedPixel(const Vec2& p) const = 0;
 
+    /**
+     * @brief Add the distortion field to a set of points (that are in normalized camera frame)
+     * @param[in] pts The points, one per column
+     * @return The points with added distortion field
+     */
+    virtual Mat2X addDistortionPoints(const Mat2X& pts) const;
+
+    /**
+     * @brief Remove the distortion to a set of camera points (that are in normalized camera frame)
+     * @param[in] pts The points, one per column
+     * @return The points with removed distortion field
+     */
+    virtual Mat2X removeDistortionPoints(const Mat2X& pts) const;
+
+    /**
+     * @brief Return the undistorted pixels (with removed distortion)
+     * @param[in] pts The pixels, one per column
+     * @return The undistorted pixels
+     */
+    virtual Mat2X getUndistortedPixels(const Mat2X& pts) const;
+
+    /**
+     * @brief Return the distorted pixels (with added distortion)
+     * @param[in] pts The pixels, one per column
+     * @return The distorted pixels
+     */
+    virtual Mat2X getDistortedPixels(const Mat2X& pts) const;
+
     /**
      * @brief Set The intrinsic disto initialization mode
      * @param[in] distortionInitializationMode The intrintrinsic distortion initialization mode enum
@@ -423,6 +482,13 @@ class IntrinsicBase
      */
     virtual Vec3 toUnitSphere(const Vec2& pt) const = 0;
 
+    /**
+     * @brief Transform a set of points (in pixels) to unit sphere in meters
+     * @param pts the input points, one per column
+     * @return The points on the unit sphere, one per column
+     */
+    virtual Mat3X toUnitSpherePoints(const Mat2X& pts) const;
+
     /**
      * @brief Get the horizontal FOV in radians
      * @return Horizontal FOV in radians
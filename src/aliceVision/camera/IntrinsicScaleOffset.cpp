@@ -30,6 +30,11 @@ bool IntrinsicScaleOffset::operator==(const IntrinsicBase& otherBase) const
 
 Vec2 IntrinsicScaleOffset::cam2ima(const Vec2& p) const { return p.cwiseProduct(_scale) + getPrincipalPoint(); }
 
+Mat2X IntrinsicScaleOffset::cam2imaPoints(const Mat2X& pts) const
+{
+    return (_scale.asDiagonal() * pts).colwise() + getPrincipalPoint();
+}
+
 Eigen::Matrix2d IntrinsicScaleOffset::getDerivativeCam2ImaWrtScale(const Vec2& p) const
 {
     Eigen::Matrix2d M = Eigen::Matrix2d::Zero();
@@ -64,6 +69,11 @@ Vec2 IntrinsicScaleOffset::ima2cam(const Vec2& p) const
     return np;
 }
 
+Mat2X IntrinsicScaleOffset::ima2camPoints(const Mat2X& pts) const
+{
+    return _scale.cwiseInverse().asDiagonal() * (pts.colwise() - getPrincipalPoint());
+}
+
 Eigen::Matrix<double, 2, 2> IntrinsicScaleOffset::getDerivativeIma2CamWrtScale(const Vec2& p) const
 {
     Eigen::Matrix2d M = Eigen::Matrix2d::Zero();
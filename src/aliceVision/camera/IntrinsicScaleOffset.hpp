@@ -53,6 +53,8 @@ class IntrinsicScaleOffset : public IntrinsicBase
     // Transform a point from the camera plane to the image plane
     Vec2 cam2ima(const Vec2& p) const override;
 
+    Mat2X cam2imaPoints(const Mat2X& pts) const override;
+
     virtual Eigen::Matrix2d getDerivativeCam2ImaWrtScale(const Vec2& p) const;
 
     virtual Eigen::Matrix2d getDerivativeCam2ImaWrtPoint() const;
@@ -62,6 +64,8 @@ class IntrinsicScaleOffset : public IntrinsicBase
     // Transform a point from the image plane to the camera plane
     Vec2 ima2cam(const Vec2& p) const override;
 
+    Mat2X ima2camPoints(const Mat2X& pts) const override;
+
     virtual Eigen::Matrix<double, 2, 2> getDerivativeIma2CamWrtScale(const Vec2& p) const;
 
     virtual Eigen::Matrix2d getDerivativeIma2CamWrtPoint() const;
@@ -77,8 +77,26 @@ bool IntrinsicScaleOffsetDisto::operator==(const IntrinsicBase& otherBase) const
 
 Vec2 IntrinsicScaleOffsetDisto::getUndistortedPixel(const Vec2& p) const { return cam2ima(removeDistortion(ima2cam(p))); }
 
+Mat2X IntrinsicScaleOffsetDisto::getUndistortedPixels(const Mat2X& pts) const
+{
+    if (!hasDistortion())
+    {
+        return pts;
+    }
+    return cam2imaPoints(removeDistortionPoints(ima2camPoints(pts)));
+}
+
 Vec2 IntrinsicScaleOffsetDisto::getDistortedPixel(const Vec2& p) const { return cam2ima(addDistortion(ima2cam(p))); }
 
+Mat2X IntrinsicScaleOffsetDisto::getDistortedPixels(const Mat2X& pts) const
+{
+    if (!hasDistortion())
+    {
+        return pts;
+    }
+    return cam2imaPoints(addDistortionPoints(ima2camPoints(pts)));
+}
+
 bool IntrinsicScaleOffsetDisto::updateFromParams(const std::vector<double>& params)
 {
     if (!IntrinsicScaleOffset::updateFromParams(params))
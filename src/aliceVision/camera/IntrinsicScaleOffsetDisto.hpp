@@ -103,12 +103,54 @@ class IntrinsicScaleOffsetDisto : public IntrinsicScaleOffset
         return p;
     }
 
+    /**
+     * @brief Create new points from a set of points by adding distortion.
+     * @param[in] pts Points in the camera plane, one per column.
+     * @return Distorted points in the camera plane.
+     */
+    Mat2X addDistortionPoints(const Mat2X& pts) const override
+    {
+        if (_pDistortion)
+        {
+            return _pDistortion->addDistortionPoints(pts);
+        }
+        else if (_pUndistortion)
+        {
+            return IntrinsicScaleOffset::addDistortionPoints(pts);
+        }
+        return pts;
+    }
+
+    /**
+     * @brief Create new points from a set of points by removing distortion.
+     * @param[in] pts Points in the camera plane, one per column.
+     * @return Undistorted points in the camera plane.
+     */
+    Mat2X removeDistortionPoints(const Mat2X& pts) const override
+    {
+        if (_pUndistortion)
+        {
+            return IntrinsicScaleOffset::removeDistortionPoints(pts);
+        }
+        else if (_pDistortion)
+        {
+            return _pDistortion->removeDistortionPoints(pts);
+        }
+        return pts;
+    }
+
     /// Return the un-distorted pixel (with removed distortion)
     Vec2 getUndistortedPixel(const Vec2& p) const override;
 
+    /// Return the un-distorted pixels (with removed distortion), one per column
+    Mat2X getUndistortedPixels(const Mat2X& pts) const override;
+
     /// Return the distorted pixel (with added distortion)
     Vec2 getDistortedPixel(const Vec2& p) const override;
 
+    /// Return the distorted pixels (with added distortion), one per column
+    Mat2X getDistortedPixels(const Mat2X& pts) const override;
+
     std::size_t getDistortionParamsSize() const
     {
         if (_pDistortion)
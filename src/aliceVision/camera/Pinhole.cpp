@@ -46,6 +46,14 @@ Vec2 Pinhole::project(const Eigen::Matrix4d& pose, const Vec4& pt, bool applyDis
     return impt;
 }
 
+Mat2X Pinhole::projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion) const
+{
+    const Mat3X X = pose(pts3D);  // apply pose
+    const Mat2X P = X.colwise().hnormalized();
+
+    return this->cam2imaPoints((applyDistortion) ? this->addDistortionPoints(P) : P);
+}
+
 Eigen::Matrix<double, 2, 9> Pinhole::getDerivativeProjectWrtRotation(const Eigen::Matrix4d& pose, const Vec4& pt)
 {
     const Vec4 X = pose * pt;  // apply pose
@@ -250,6 +258,8 @@ Eigen::Matrix<double, 2, Eigen::Dynamic> Pinhole::getDerivativeProjectWrtParams(
 
 Vec3 Pinhole::toUnitSphere(const Vec2& pt) const { return pt.homogeneous().normalized(); }
 
+Mat3X Pinhole::toUnitSpherePoints(const Mat2X& pts) const { return pts.colwise().homogeneous().colwise().normalized(); }
+
 Eigen::Matrix<double, 3, 2> Pinhole::getDerivativetoUnitSphereWrtPoint(const Vec2& pt) const
 {
     const double norm2 = pt(0) * pt(0) + pt(1) * pt(1) + 1.0;
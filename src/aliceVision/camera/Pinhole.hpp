@@ -70,6 +70,8 @@ class Pinhole : public IntrinsicScaleOffsetDisto
 
     Vec2 project(const Eigen::Matrix4d& pose, const Vec4& pt, bool applyDistortion = true) const override;
 
+    Mat2X projectPoints(const geometry::Pose3& pose, const Mat3X& pts3D, bool applyDistortion = true) const override;
+
     Eigen::Matrix<double, 2, 9> getDerivativeProjectWrtRotation(const Eigen::Matrix4d& pose, const Vec4& pt);
 
     Eigen::Matrix<double, 2, 16> getDerivativeProjectWrtPose(const Eigen::Matrix4d& pose, const Vec4& pt) const override;
@@ -90,6 +92,8 @@ class Pinhole : public IntrinsicScaleOffsetDisto
 
     Vec3 toUnitSphere(const Vec2& pt) const override;
 
+    Mat3X toUnitSpherePoints(const Mat2X& pts) const override;
+
     Eigen::Matrix<double, 3, 2> getDerivativetoUnitSphereWrtPoint(const Vec2& pt) const;
 
     double imagePlaneToCameraPlaneError(double value) const override;
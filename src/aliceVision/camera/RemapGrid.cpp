@@ -0,0 +1,231 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "RemapGrid.hpp"
+
+#include <aliceVision/camera/IntrinsicScaleOffsetDisto.hpp>
+#include <aliceVision/stl/hash.hpp>
+#include <aliceVision/system/Logger.hpp>
+
+#include <algorithm>
+
+namespace aliceVision {
+namespace camera {
+
+RemapGrid::RemapGrid(const IntrinsicBase& intrinsic, int width, int height, double scale, const Vec2& offset)
+  : _width(width),
+    _height(height),
+    _scale(scale),
+    _offset(offset),
+    _grid(2, static_cast<Eigen::Index>(width) * height)
+{
+    if (width <= 0 || height <= 0 || scale <= 0.0)
+    {
+        ALICEVISION_THROW_ERROR("[camera] RemapGrid: invalid grid size " << width << "x" << height << " with scale " << scale);
+    }
+
+    // One row at a time to keep the temporaries small
+#pragma omp parallel for
+    for (int y = 0; y < height; ++y)
+    {
+        Mat2X undistorted(2, width);
+        undistorted.row(0).setLinSpaced(width, 0.0, width - 1.0);
+        undistorted.row(1).setConstant(y);
+
+        const Mat2X distorted = intrinsic.getDistortedPixels((undistorted.colwise() + offset) / scale) * scale;
+        _grid.middleCols(static_cast<Eigen::Index>(y) * width, width) = distorted;
+    }
+}
+
+std::size_t RemapGridKeyHasher::operator()(const RemapGridKey& key) const noexcept
+{
+    std::size_t seed = 0;
+    stl::hash_combine(seed, key.intrinsicHash);
+    stl::hash_combine(seed, key.width);
+    stl::hash_combine(seed, key.height);
+    stl::hash_combine(seed, key.scale);
+    stl::hash_combine(seed, key.offset(0));
+    stl::hash_combine(seed, key.offset(1));
+    return seed;
+}
+
+RemapGridCache::RemapGridCache(std::size_t capacity, std::size_t maxMemorySize)
+  : _capacity(capacity),
+    _maxMemorySize(maxMemorySize)
+{}
+
+std::shared_ptr<const RemapGrid> RemapGridCache::get(const IntrinsicBase& intrinsic, int width, int height, double scale, const Vec2& offset)
+{
+    const RemapGridKey key{hashIntrinsic(intrinsic), width, height, scale, offset};
+
+    std::shared_future<std::shared_ptr<const RemapGrid>> cachedGrid;
+    std::promise<std::shared_ptr<const RemapGrid>> promise;
+    std::size_t entryId = 0;
+
+    {
+        const std::scoped_lock<std::mutex> lock(_mutex);
+
+        const auto it = _grids.find(key);
+        if (it != _grids.end())
+        {
+            // grid becomes MRU
+            _keys.erase(std::find(_keys.begin(), _keys.end(), key));
+            _keys.push_back(key);
+
+            // copy the future before releasing the lock: the entry may be evicted meanwhile
+            cachedGrid = it->second.grid;
+        }
+        else if (_capacity > 0)
+        {
+            // placeholder entry: concurrent requests for the same grid wait for this thread to compute it
+            entryId = ++_nextEntryId;
+            _grids.emplace(key, Entry{promise.get_future().share(), 0, entryId});
+            _keys.push_back(key);
+            shrink();
+        }
+    }
+
+    // wait for the grid outside of the lock, it may still be computed by another thread
+    if (cachedGrid.valid())
+        return cachedGrid.get();
+
+    ALICEVISION_LOG_TRACE("[camera] RemapGridCache: computing grid " << width << "x" << height << " with scale " << scale);
+
+    // compute the grid without holding the lock
+    std::shared_ptr<const RemapGrid> grid;
+    try
+    {
+        grid = std::make_shared<const RemapGrid>(intrinsic, width, height, scale, offset);
+    }
+    catch (...)
+    {
+        // forward the error to the threads waiting for this grid and forget about it
+        promise.set_exception(std::current_exception());
+
+        const std::scoped_lock<std::mutex> lock(_mutex);
+        const auto it = _grids.find(key);
+        if (it != _grids.end() && it->second.id == entryId)
+            erase(key);
+        throw;
+    }
+
+    promise.set_value(grid);
+
+    if (entryId > 0)
+    {
+        const std::scoped_lock<std::mutex> lock(_mutex);
+
+        // the entry may have been evicted or replaced while the grid was computed
+        const auto it = _grids.find(key);
+        if (it != _grids.end() && it->second.id == entryId)
+        {
+            if (grid->memorySize() > _maxMemorySize)
+            {
+                // the grid alone does not fit in the cache, do not evict the other grids for it
+                erase(key);
+            }
+            else
+            {
+                it->second.memorySize = grid->memorySize();
+                _memorySize += it->second.memorySize;
+                shrink();
+            }
+        }
+    }
+
+    return grid;
+}
+
+void RemapGridCache::setCapacity(std::size_t capacity)
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    _capacity = capacity;
+    shrink();
+}
+
+std::size_t RemapGridCache::capacity() const
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    return _capacity;
+}
+
+void RemapGridCache::setMaxMemorySize(std::size_t maxMemorySize)
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    _maxMemorySize = maxMemorySize;
+    shrink();
+}
+
+std::size_t RemapGridCache::maxMemorySize() const
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    return _maxMemorySize;
+}
+
+std::size_t RemapGridCache::size() const
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    return _grids.size();
+}
+
+std::size_t RemapGridCache::memorySize() const
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    return _memorySize;
+}
+
+void RemapGridCache::clear()
+{
+    const std::scoped_lock<std::mutex> lock(_mutex);
+    _grids.clear();
+    _keys.clear();
+    _memorySize = 0;
+}
+
+std::size_t RemapGridCache::hashIntrinsic(const IntrinsicBase& intrinsic)
+{
+    std::size_t seed = intrinsic.hashValue();
+
+    const IntrinsicScaleOffsetDisto* intrinsicDisto = dynamic_cast<const IntrinsicScaleOffsetDisto*>(&intrinsic);
+    if (intrinsicDisto && intrinsicDisto->getUndistortion())
+    {
+        const std::shared_ptr<Undistortion> undistortion = intrinsicDisto->getUndistortion();
+        stl::hash_combine(seed, static_cast<int>(undistortion->getType()));
+        stl::hash_combine(seed, undistortion->getOffset()(0));
+        stl::hash_combine(seed, undistortion->getOffset()(1));
+        stl::hash_combine(seed, undistortion->getSize()(0));
+        stl::hash_combine(seed, undistortion->getSize()(1));
+        stl::hash_combine(seed, undistortion->getPixelAspectRatio());
+        for (double param : undistortion->getParameters())
+        {
+            stl::hash_combine(seed, param);
+        }
+    }
+
+    return seed;
+}
+
+void RemapGridCache::shrink()
+{
+    while (!_keys.empty() && (_grids.size() > _capacity || _memorySize > _maxMemorySize))
+    {
+        erase(_keys.front());
+    }
+}
+
+void RemapGridCache::erase(const RemapGridKey& key)
+{
+    const auto it = _grids.find(key);
+    if (it == _grids.end())
+        return;
+
+    _memorySize -= it->second.memorySize;
+    _grids.erase(it);
+    _keys.erase(std::find(_keys.begin(), _keys.end(), key));
+}
+
+}  // namespace camera
+}  // namespace aliceVision
@@ -0,0 +1,246 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/camera/IntrinsicBase.hpp>
+
+#include <cstddef>
+#include <future>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+
+namespace aliceVision {
+namespace camera {
+
+/**
+ * @brief Lookup grid giving, for each pixel of an undistorted image, the position of the corresponding pixel in the distorted image.
+ *
+ * The grid is computed once for a given intrinsic and can then be used to undistort any number of images
+ * sharing this intrinsic without evaluating the distortion model again.
+ *
+ * The undistorted pixel (x, y) of the grid corresponds to the pixel ((x, y) + offset) / scale in the intrinsic image plane,
+ * and its distorted position is expressed in the image plane scaled by the same factor.
+ */
+class RemapGrid
+{
+  public:
+    /**
+     * @brief Compute the grid of an intrinsic.
+     * @param[in] intrinsic the intrinsic holding the distortion model
+     * @param[in] width the width of the undistorted image
+     * @param[in] height the height of the undistorted image
+     * @param[in] scale the scale factor between the images and the intrinsic resolution
+     * @param[in] offset the offset (in pixels) applied to the undistorted pixel coordinates
+     */
+    RemapGrid(const IntrinsicBase& intrinsic, int width, int height, double scale = 1.0, const Vec2& offset = Vec2::Zero());
+
+    int width() const { return _width; }
+
+    int height() const { return _height; }
+
+    double scale() const { return _scale; }
+
+    const Vec2& offset() const { return _offset; }
+
+    /**
+     * @brief Get the distorted positions of all the pixels of the undistorted image.
+     * @return the distorted positions, one per column, in row-major order (column y * width + x for the pixel (x, y))
+     */
+    const Mat2X& getGrid() const { return _grid; }
+
+    /**
+     * @brief Get the distorted position of a pixel of the undistorted image.
+     * @param[in] x the column of the pixel in the undistorted image
+     * @param[in] y the row of the pixel in the undistorted image
+     * @return the position of the pixel in the distorted image
+     */
+    inline Vec2 operator()(int x, int y) const { return _grid.col(static_cast<Eigen::Index>(y) * _width + x); }
+
+    /**
+     * @return the memory used by the grid (in bytes)
+     */
+    std::size_t memorySize() const { return sizeof(double) * _grid.size(); }
+
+  private:
+    int _width;
+    int _height;
+    double _scale;
+    Vec2 _offset;
+    Mat2X _grid;
+};
+
+/**
+ * @brief A struct used to identify a RemapGrid using its intrinsic, resolution, scale and offset.
+ */
+struct RemapGridKey
+{
+    std::size_t intrinsicHash;
+    int width;
+    int height;
+    double scale;
+    Vec2 offset;
+
+    bool operator==(const RemapGridKey& other) const
+    {
+        return intrinsicHash == other.intrinsicHash && width == other.width && height == other.height && scale == other.scale &&
+               offset == other.offset;
+    }
+};
+
+struct RemapGridKeyHasher
+{
+    std::size_t operator()(const RemapGridKey& key) const noexcept;
+};
+
+/**
+ * @brief A thread-safe cache of RemapGrid objects with a Least-Recently-Used eviction policy.
+ *
+ * Grids are identified by the hash value of their intrinsic (including its undistortion parameters),
+ * their resolution, their scale and their offset.
+ * The cache is bounded both by a number of grids and by the total memory used by the grids.
+ * When one of these limits is exceeded, the Least-Recently-Used grids are removed from it; grids that are
+ * still used externally remain valid until they are released.
+ * Missing grids are computed outside of the cache lock, so that requests for different grids do not wait
+ * for each other, while concurrent requests for the same grid only compute it once.
+ */
+class RemapGridCache
+{
+  public:
+    /**
+     * @brief Create a new cache.
+     * @param[in] capacity the maximum number of grids stored in the cache
+     * @param[in] maxMemorySize the maximum memory used by the grids stored in the cache (in bytes)
+     */
+    explicit RemapGridCache(std::size_t capacity = 4, std::size_t maxMemorySize = defaultMaxMemorySize);
+
+    /**
+     * @brief Get a shared cache instance for the whole process.
+     * @note The grids of this instance are kept until they are evicted or the cache is cleared,
+     *       callers that are done with undistortion should call clear() (see ScopedClear).
+     */
+    static RemapGridCache& getInstance()
+    {
+        static RemapGridCache instance;
+        return instance;
+    }
+
+    /**
+     * @brief Clear a cache when going out of scope.
+     *        Used to release the grids of the shared instance at the end of a processing step.
+     */
+    class ScopedClear
+    {
+      public:
+        explicit ScopedClear(RemapGridCache& cache = RemapGridCache::getInstance())
+          : _cache(cache)
+        {}
+
+        ~ScopedClear() { _cache.clear(); }
+
+        ScopedClear(const ScopedClear&) = delete;
+        ScopedClear& operator=(const ScopedClear&) = delete;
+
+      private:
+        RemapGridCache& _cache;
+    };
+
+    /// make the cache class non-copyable
+    RemapGridCache(const RemapGridCache&) = delete;
+    RemapGridCache& operator=(const RemapGridCache&) = delete;
+
+    /**
+     * @brief Retrieve the grid of an intrinsic, computing it if it is not in the cache yet.
+     * @note This method is thread-safe.
+     * @note A grid larger than the maximum memory size of the cache is computed but not stored.
+     * @param[in] intrinsic the intrinsic holding the distortion model
+     * @param[in] width the width of the undistorted image
+     * @param[in] height the height of the undistorted image
+     * @param[in] scale the scale factor between the images and the intrinsic resolution
+     * @param[in] offset the offset (in pixels) applied to the undistorted pixel coordinates
+     * @return a shared pointer to the cached grid
+     */
+    std::shared_ptr<const RemapGrid> get(const IntrinsicBase& intrinsic,
+                                         int width,
+                                         int height,
+                                         double scale = 1.0,
+                                         const Vec2& offset = Vec2::Zero());
+
+    /**
+     * @brief Change the maximum number of grids stored in the cache, removing the Least-Recently-Used ones if needed.
+     * @param[in] capacity the new capacity of the cache
+     */
+    void setCapacity(std::size_t capacity);
+
+    std::size_t capacity() const;
+
+    /**
+     * @brief Change the maximum memory used by the grids stored in the cache, removing the Least-Recently-Used ones if needed.
+     * @param[in] maxMemorySize the new maximum memory size (in bytes)
+     */
+    void setMaxMemorySize(std::size_t maxMemorySize);
+
+    std::size_t maxMemorySize() const;
+
+    /**
+     * @return the number of grids currently stored in the cache (including the grids being computed)
+     */
+    std::size_t size() const;
+
+    /**
+     * @return the memory used by the grids currently stored in the cache (in bytes)
+     */
+    std::size_t memorySize() const;
+
+    /**
+     * @brief Remove all the grids from the cache.
+     */
+    void clear();
+
+    /**
+     * @brief Compute the hash value identifying the distortion of an intrinsic.
+     *        Unlike IntrinsicBase::hashValue, it takes the undistortion parameters into account.
+     * @param[in] intrinsic the intrinsic
+     * @return the hash value
+     */
+    static std::size_t hashIntrinsic(const IntrinsicBase& intrinsic);
+
+    /// default maximum memory size of a cache (in bytes)
+    static constexpr std::size_t defaultMaxMemorySize = std::size_t(1024) * 1024 * 1024;
+
+  private:
+    struct Entry
+    {
+        /// the grid, available once it has been computed
+        std::shared_future<std::shared_ptr<const RemapGrid>> grid;
+        /// the memory used by the grid (0 while it is being computed)
+        std::size_t memorySize = 0;
+        /// unique identifier of the entry, used to find back the entry after computing its grid
+        std::size_t id = 0;
+    };
+
+    /// remove the Least-Recently-Used grids until the cache fits in its capacity and maximum memory size
+    void shrink();
+
+    /// remove an entry from the cache
+    void erase(const RemapGridKey& key);
+
+    std::size_t _capacity;
+    std::size_t _maxMemorySize;
+    std::size_t _memorySize = 0;
+    std::size_t _nextEntryId = 0;
+    std::unordered_map<RemapGridKey, Entry, RemapGridKeyHasher> _grids;
+    /// ordered from LRU (Least Recently Used) to MRU (Most Recently Used)
+    std::list<RemapGridKey> _keys;
+
+    mutable std::mutex _mutex;
+};
+
+}  // namespace camera
+}  // namespace aliceVision
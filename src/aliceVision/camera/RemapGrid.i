@@ -0,0 +1,20 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/camera/IntrinsicBase.i>
+
+// The cache hands out shared pointers to const grids and is only meant to be used from C++
+%ignore aliceVision::camera::RemapGridKey;
+%ignore aliceVision::camera::RemapGridKeyHasher;
+%ignore aliceVision::camera::RemapGridCache;
+
+%include <aliceVision/camera/RemapGrid.hpp>
+
+%{
+#include <aliceVision/camera/RemapGrid.hpp>
+using namespace aliceVision;
+using namespace aliceVision::camera;
+%}
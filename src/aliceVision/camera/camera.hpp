@@ -21,6 +21,7 @@
 #include <aliceVision/camera/IntrinsicBase.hpp>
 #include <aliceVision/camera/Pinhole.hpp>
 #include <aliceVision/camera/Equidistant.hpp>
+#include <aliceVision/camera/RemapGrid.hpp>
 #include <aliceVision/camera/cameraUndistortImage.hpp>
 
 #include <memory>
@@ -15,6 +15,7 @@
 #include <aliceVision/camera/IntrinsicBase.hpp>
 #include <aliceVision/camera/IntrinsicScaleOffsetDisto.hpp>
 #include <aliceVision/camera/Pinhole.hpp>
+#include <aliceVision/camera/RemapGrid.hpp>
 #include <aliceVision/camera/Undistortion.hpp>
 #include <aliceVision/image/io.hpp>
 
@@ -77,7 +78,35 @@ void UndistortImage(const image::Image<T>& imageIn,
     }
 }
 
-/// Undistort an image according a given camera and its distortion model
+/// Undistort an image using a precomputed remap grid
+template<typename T>
+void UndistortImage(const image::Image<T>& imageIn, const camera::RemapGrid& grid, image::Image<T>& image_ud, T fillcolor)
+{
+    image_ud.resize(grid.width(), grid.height(), true, fillcolor);
+    const image::Sampler2d<image::SamplerLinear> sampler;
+
+#pragma omp parallel for
+    for (int y = 0; y < grid.height(); ++y)
+    {
+        for (int x = 0; x < grid.width(); ++x)
+        {
+            // coordinates with distortion
+            const Vec2 disto_pix = grid(x, y);
+
+            // pick pixel if it is in the image domain
+            if (imageIn.contains(disto_pix(1), disto_pix(0)))
+            {
+                image_ud(y, x) = sampler(imageIn, disto_pix(1), disto_pix(0));
+            }
+        }
+    }
+}
+
+/**
+ * @brief Undistort an image according a given camera and its distortion model
+ * @note The remap grid of the camera is retrieved from RemapGridCache::getInstance(),
+ *       so that undistorting many images sharing the same intrinsic only evaluates the distortion model once.
+ */
 template<typename T>
 void UndistortImage(const image::Image<T>& imageIn,
                     const camera::IntrinsicBase* intrinsicPtr,
@@ -117,25 +146,10 @@ void UndistortImage(const image::Image<T>& imageIn,
         yOffset = roi.ybegin;
     }
 
-    image_ud.resize(widthRoi, heightRoi, true, fillcolor);
-    const image::Sampler2d<image::SamplerLinear> sampler;
+    const std::shared_ptr<const camera::RemapGrid> grid =
+      camera::RemapGridCache::getInstance().get(*intrinsicPtr, widthRoi, heightRoi, 1.0, Vec2(xOffset, yOffset) + ppCorrection);
 
-#pragma omp parallel for
-    for (int y = 0; y < heightRoi; ++y)
-    {
-        for (int x = 0; x < widthRoi; ++x)
-        {
-            const Vec2 undisto_pix(x + xOffset, y + yOffset);
-            // compute coordinates with distortion
-            const Vec2 disto_pix = intrinsicPtr->getDistortedPixel(undisto_pix + ppCorrection);
-
-            // pick pixel if it is in the image domain
-            if (imageIn.contains(disto_pix(1), disto_pix(0)))
-            {
-                image_ud(y, x) = sampler(imageIn, disto_pix(1), disto_pix(0));
-            }
-        }
-    }
+    UndistortImage(imageIn, *grid, image_ud, fillcolor);
 }
 
 }  // namespace camera
@@ -51,3 +51,41 @@ BOOST_AUTO_TEST_CASE(distortion_distort_undistort)
         }
     }
 }
+
+//-----------------
+BOOST_AUTO_TEST_CASE(distortion_distort_undistort_points)
+{
+    makeRandomOperationsReproducible();
+
+    std::array<std::unique_ptr<Distortion>, 6> distortionsModels;
+    distortionsModels[0].reset(new DistortionBrown(-0.25349, 0.11868, -0.00028, 0.00005, 0.0000001));
+    distortionsModels[1].reset(new DistortionFisheye(0.02, -0.03, 0.1, -0.2));
+    distortionsModels[2].reset(new DistortionFisheye1(0.02));
+    distortionsModels[3].reset(new DistortionRadialK1(0.02));
+    distortionsModels[4].reset(new DistortionRadialK3(-1.8061369278146561e-01, 1.8759742680633607e-01, -2.5341468279930644e-02));
+    distortionsModels[5].reset(new DistortionRadialK3PT(-1.8061369278146561e-01, 1.8759742680633607e-01, -2.5341468279930644e-02));
+
+    const double epsilon = 1e-10;
+    const std::size_t numPts{1000};
+
+    // random points in [-lim, lim]x[-lim, lim], plus the optical center
+    const double lim{0.8};
+    Mat2X ptsImage = lim * Mat2X::Random(2, numPts);
+    ptsImage.col(0).setZero();
+
+    for (const auto& model : distortionsModels)
+    {
+        const Mat2X distorted = model->addDistortionPoints(ptsImage);
+        const Mat2X undistorted = model->removeDistortionPoints(distorted);
+
+        BOOST_CHECK_EQUAL(distorted.cols(), numPts);
+        BOOST_CHECK_EQUAL(undistorted.cols(), numPts);
+
+        // batched and single point versions give the same results
+        for (std::size_t i = 0; i < numPts; ++i)
+        {
+            EXPECT_MATRIX_NEAR(model->addDistortion(ptsImage.col(i)), distorted.col(i), epsilon);
+            EXPECT_MATRIX_NEAR(model->removeDistortion(distorted.col(i)), undistorted.col(i), epsilon);
+        }
+    }
+}
@@ -66,3 +66,43 @@ BOOST_AUTO_TEST_CASE(cameraEquidistant_disto_undisto_Radial)
         EXPECT_MATRIX_NEAR(ptImage_gt, pt2d_proj, epsilon);
     }
 }
+
+//-----------------
+// Test summary:
+//-----------------
+// - Create a Equidistant camera
+// - Generate random points inside the image domain
+// - Back-project and project them all at once
+// - Assert that the batched functions match the single point ones
+//-----------------
+BOOST_AUTO_TEST_CASE(cameraEquidistant_project_backproject_points)
+{
+    makeRandomOperationsReproducible();
+
+    std::shared_ptr<Distortion> distortion = std::make_shared<DistortionRadialK3PT>(0.3, 0.2, 0.1);
+
+    std::shared_ptr<Equidistant> cam = std::make_shared<Equidistant>(1000, 800, 800.0, 0.0, 0.0, 0.0, distortion);
+
+    const double epsilon = 1e-8;
+    const std::size_t numPts = 100;
+
+    // generate random points inside the image domain (last random to avoid 0,0)
+    const Mat2X ptsImage_gt = ((Mat2X::Random(2, numPts) * 800. / 2.).colwise() + Vec2(500, 500)) + Mat2X::Random(2, numPts);
+    const double depth_gt = std::abs(Vec2::Random()(0)) * 100.0;
+    const geometry::Pose3 pose(geometry::randomPose());
+
+    const Mat3X pts3d = cam->backprojectPoints(ptsImage_gt, true, pose, depth_gt);
+    const Mat2X pts2d_proj = cam->projectPoints(pose, pts3d, true);
+    const Mat2X residuals = cam->residuals(pose, pts3d, ptsImage_gt);
+
+    for (std::size_t i = 0; i < numPts; ++i)
+    {
+        const Vec3 pt3d = cam->backproject(ptsImage_gt.col(i), true, pose, depth_gt);
+
+        EXPECT_MATRIX_NEAR(pt3d, pts3d.col(i), epsilon);
+        EXPECT_MATRIX_NEAR(cam->project(pose, pt3d.homogeneous(), true), pts2d_proj.col(i), epsilon);
+        EXPECT_MATRIX_NEAR(cam->residual(pose, pt3d.homogeneous(), ptsImage_gt.col(i)), residuals.col(i), epsilon);
+    }
+
+    EXPECT_MATRIX_NEAR(ptsImage_gt, pts2d_proj, 1e-4);
+}
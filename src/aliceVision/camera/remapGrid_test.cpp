@@ -0,0 +1,179 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/camera/camera.hpp>
+#include <aliceVision/camera/RemapGrid.hpp>
+
+#include <vector>
+
+#define BOOST_TEST_MODULE remapGrid
+
+#include <boost/test/unit_test.hpp>
+#include <boost/test/tools/floating_point_comparison.hpp>
+#include <aliceVision/unitTest.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::camera;
+
+//-----------------
+// Test summary:
+//-----------------
+// - Create a PinholeRadialK3 camera
+// - Compute its remap grid, with and without scale and offset
+// - Assert that the grid gives the distorted pixels of the camera
+//-----------------
+BOOST_AUTO_TEST_CASE(remapGrid_distorted_pixels)
+{
+    std::shared_ptr<Distortion> distortion = std::make_shared<DistortionRadialK3>(-0.245539, 0.255195, 0.163773);
+    const Pinhole cam(400, 300, 350, 350, 2.5, -1.5, distortion);
+
+    const double epsilon = 1e-10;
+
+    const RemapGrid grid(cam, 400, 300);
+    BOOST_CHECK_EQUAL(grid.getGrid().cols(), 400 * 300);
+
+    for (int y = 0; y < 300; y += 7)
+    {
+        for (int x = 0; x < 400; x += 7)
+        {
+            EXPECT_MATRIX_NEAR(cam.getDistortedPixel(Vec2(x, y)), grid(x, y), epsilon);
+        }
+    }
+
+    // Half resolution image, shifted by an offset
+    const double scale = 0.5;
+    const Vec2 offset(10.0, -4.0);
+    const RemapGrid gridScaled(cam, 200, 150, scale, offset);
+
+    for (int y = 0; y < 150; y += 7)
+    {
+        for (int x = 0; x < 200; x += 7)
+        {
+            const Vec2 expected = cam.getDistortedPixel((Vec2(x, y) + offset) / scale) * scale;
+            EXPECT_MATRIX_NEAR(expected, gridScaled(x, y), epsilon);
+        }
+    }
+}
+
+//-----------------
+// Test summary:
+//-----------------
+// - Request grids for several cameras from a cache
+// - Assert that grids are shared for identical requests
+// - Assert that the Least-Recently-Used grids are evicted first
+//-----------------
+BOOST_AUTO_TEST_CASE(remapGrid_cache)
+{
+    std::shared_ptr<Distortion> distortion = std::make_shared<DistortionRadialK1>(0.1);
+    Pinhole cam1(40, 30, 35, 35, 0, 0, distortion);
+    Pinhole cam2(cam1);
+    cam2.setDistortionParams({0.2});
+    const Pinhole cam3(40, 30, 40, 40, 0, 0, std::make_shared<DistortionRadialK1>(0.1));
+
+    RemapGridCache cache(2);
+
+    const std::shared_ptr<const RemapGrid> grid1 = cache.get(cam1, 40, 30);
+    // same intrinsic parameters give the same grid
+    BOOST_CHECK(grid1 == cache.get(Pinhole(cam1), 40, 30));
+    BOOST_CHECK_EQUAL(cache.size(), 1);
+
+    // a different distortion, resolution or scale gives another grid
+    BOOST_CHECK(grid1 != cache.get(cam2, 40, 30));
+    BOOST_CHECK(grid1 != cache.get(cam1, 20, 15, 0.5));
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+
+    // grid1 was the LRU grid and has been evicted, but remains valid
+    BOOST_CHECK(grid1 != cache.get(cam1, 40, 30));
+    BOOST_CHECK_EQUAL(grid1->width(), 40);
+
+    // cam1 at half resolution is now the LRU grid
+    const std::shared_ptr<const RemapGrid> grid3 = cache.get(cam3, 40, 30);
+    BOOST_CHECK(grid3 == cache.get(cam3, 40, 30));
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+
+    cache.setCapacity(1);
+    BOOST_CHECK_EQUAL(cache.size(), 1);
+    BOOST_CHECK(grid3 == cache.get(cam3, 40, 30));
+
+    cache.clear();
+    BOOST_CHECK_EQUAL(cache.size(), 0);
+}
+
+//-----------------
+// Test summary:
+//-----------------
+// - Request grids from a cache bounded by memory size
+// - Assert that the Least-Recently-Used grids are evicted to fit in the memory budget
+// - Assert that a grid larger than the budget is not stored
+//-----------------
+BOOST_AUTO_TEST_CASE(remapGrid_cache_memorySize)
+{
+    const Pinhole cam(40, 30, 35, 35, 0, 0, std::make_shared<DistortionRadialK1>(0.1));
+    const std::size_t gridMemorySize = RemapGrid(cam, 40, 30).memorySize();
+
+    RemapGridCache cache(10, 2 * gridMemorySize);
+
+    const std::shared_ptr<const RemapGrid> grid1 = cache.get(cam, 40, 30);
+    const std::shared_ptr<const RemapGrid> grid2 = cache.get(cam, 40, 30, 1.0, Vec2(1.0, 0.0));
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+    BOOST_CHECK_EQUAL(cache.memorySize(), 2 * gridMemorySize);
+
+    // grid1 is the LRU grid and is evicted to make room for a third grid
+    cache.get(cam, 40, 30, 1.0, Vec2(2.0, 0.0));
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+    BOOST_CHECK_EQUAL(cache.memorySize(), 2 * gridMemorySize);
+    BOOST_CHECK(grid2 == cache.get(cam, 40, 30, 1.0, Vec2(1.0, 0.0)));
+    BOOST_CHECK(grid1 != cache.get(cam, 40, 30));
+
+    // a grid larger than the cache is computed but not stored, and does not evict the other grids
+    const std::shared_ptr<const RemapGrid> largeGrid = cache.get(cam, 80, 60, 2.0);
+    BOOST_CHECK_EQUAL(largeGrid->width(), 80);
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+    BOOST_CHECK(largeGrid != cache.get(cam, 80, 60, 2.0));
+
+    cache.setMaxMemorySize(gridMemorySize);
+    BOOST_CHECK_EQUAL(cache.size(), 1);
+    BOOST_CHECK_EQUAL(cache.memorySize(), gridMemorySize);
+
+    {
+        const RemapGridCache::ScopedClear scopedClear(cache);
+        BOOST_CHECK_EQUAL(cache.size(), 1);
+    }
+    BOOST_CHECK_EQUAL(cache.size(), 0);
+    BOOST_CHECK_EQUAL(cache.memorySize(), 0);
+}
+
+//-----------------
+// Test summary:
+//-----------------
+// - Request the same grids from several threads at once
+// - Assert that each grid is computed once and shared by all the threads
+//-----------------
+BOOST_AUTO_TEST_CASE(remapGrid_cache_concurrent)
+{
+    const Pinhole cam(400, 300, 350, 350, 0, 0, std::make_shared<DistortionRadialK1>(0.1));
+
+    RemapGridCache cache(4);
+
+    const int nbThreads = 8;
+    std::vector<std::shared_ptr<const RemapGrid>> grids(nbThreads);
+
+    // two different grids requested by half of the threads each
+#pragma omp parallel for num_threads(nbThreads)
+    for (int i = 0; i < nbThreads; ++i)
+    {
+        grids[i] = cache.get(cam, 400, 300, 1.0, Vec2(i % 2, 0.0));
+    }
+
+    BOOST_CHECK_EQUAL(cache.size(), 2);
+    BOOST_CHECK(grids[0] != grids[1]);
+
+    for (int i = 0; i < nbThreads; ++i)
+    {
+        BOOST_CHECK(grids[i] == grids[i % 2]);
+        BOOST_CHECK(grids[i] == cache.get(cam, 400, 300, 1.0, Vec2(i % 2, 0.0)));
+    }
+}
@@ -6,25 +6,64 @@
 
 #include "DepthMapEstimator.hpp"
 
+#include <aliceVision/config.hpp>
+#include <aliceVision/alicevision_omp.hpp>
 #include <aliceVision/system/Logger.hpp>
 #include <aliceVision/system/Timer.hpp>
+#include <aliceVision/gpu/gpu.hpp>
 #include <aliceVision/mvsUtils/fileIO.hpp>
 #include <aliceVision/mvsUtils/mapIO.hpp>
+#include <aliceVision/mvsUtils/ImagesCache.hpp>
 #include <aliceVision/mvsUtils/MultiViewParams.hpp>
 #include <aliceVision/depthMap/depthMapUtils.hpp>
 #include <aliceVision/depthMap/DepthMapParams.hpp>
 #include <aliceVision/depthMap/SgmDepthList.hpp>
-#include <aliceVision/depthMap/Sgm.hpp>
-#include <aliceVision/depthMap/Refine.hpp>
-#include <aliceVision/depthMap/cuda/host/utils.hpp>
-#include <aliceVision/depthMap/cuda/host/patchPattern.hpp>
-#include <aliceVision/depthMap/cuda/host/DeviceCache.hpp>
-#include <aliceVision/depthMap/cuda/host/DeviceStreamManager.hpp>
-#include <aliceVision/depthMap/cuda/planeSweeping/deviceDepthSimilarityMap.hpp>
+#include <aliceVision/depthMap/cpu/depthMapCpu.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCache.hpp>
+
+#if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_CUDA)
+    #include <aliceVision/depthMap/Sgm.hpp>
+    #include <aliceVision/depthMap/Refine.hpp>
+    #include <aliceVision/depthMap/cuda/host/depthMapUtils.hpp>
+    #include <aliceVision/depthMap/cuda/host/utils.hpp>
+    #include <aliceVision/depthMap/cuda/host/patchPattern.hpp>
+    #include <aliceVision/depthMap/cuda/host/DeviceCache.hpp>
+    #include <aliceVision/depthMap/cuda/host/DeviceStreamManager.hpp>
+    #include <aliceVision/depthMap/cuda/planeSweeping/deviceDepthSimilarityMap.hpp>
+#endif
 
 namespace aliceVision {
 namespace depthMap {
 
+namespace {
+
+/**
+ * @brief Copy a host depth/similarity map into separate depth and similarity images.
+ * @param[in] in_depthSimMap the host depth/similarity map
+ * @param[out] out_depthMap the output depth map
+ * @param[out] out_simMap the output similarity map
+ */
+void copyDepthSimMap(const HostMap<Vec2f>& in_depthSimMap, image::Image<float>& out_depthMap, image::Image<float>& out_simMap)
+{
+    const int width = int(in_depthSimMap.getWidth());
+    const int height = int(in_depthSimMap.getHeight());
+
+    out_depthMap.resize(width, height);
+    out_simMap.resize(width, height);
+
+    for (int y = 0; y < height; ++y)
+    {
+        for (int x = 0; x < width; ++x)
+        {
+            const Vec2f& depthSim = in_depthSimMap(std::size_t(x), std::size_t(y));
+            out_depthMap(y, x) = depthSim.x();
+            out_simMap(y, x) = depthSim.y();
+        }
+    }
+}
+
+}  // namespace
+
 DepthMapEstimator::DepthMapEstimator(const mvsUtils::MultiViewParams& mp,
                                      const mvsUtils::TileParams& tileParams,
                                      const DepthMapParams& depthMapParams,
@@ -54,6 +93,51 @@ DepthMapEstimator::DepthMapEstimator(const mvsUtils::MultiViewParams& mp,
                                               << "\t- stepXY: " << _refineParams.stepXY);
 }
 
+EDepthMapBackend DepthMapEstimator::getComputeBackend() const
+{
+    // note: always false if AliceVision is built without CUDA
+    const bool hasCudaDevice = gpu::gpuSupportCUDA(2, 0);
+
+    switch (_depthMapParams.backend)
+    {
+        case EDepthMapBackend::CUDA:
+        {
+            if (!hasCudaDevice)
+                ALICEVISION_THROW_ERROR("Cannot use the CUDA depth map backend, no CUDA-enabled GPU available or AliceVision built without CUDA.");
+            return EDepthMapBackend::CUDA;
+        }
+        case EDepthMapBackend::CPU:
+            return EDepthMapBackend::CPU;
+        case EDepthMapBackend::AUTO:
+            break;
+    }
+
+    if (hasCudaDevice)
+        return EDepthMapBackend::CUDA;
+
+    ALICEVISION_LOG_WARNING("No CUDA-enabled GPU available, the depth maps are computed on CPU (slower).");
+    return EDepthMapBackend::CPU;
+}
+
+void DepthMapEstimator::computeDepthMaps(const std::vector<int>& cams, int nbGPUsToUse)
+{
+    const EDepthMapBackend backend = getComputeBackend();
+
+    ALICEVISION_LOG_INFO("Depth map estimation backend: " << backend);
+
+#if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_CUDA)
+    if (backend == EDepthMapBackend::CUDA)
+    {
+        computeOnMultiGPUs(cams, *this, nbGPUsToUse);
+        return;
+    }
+#endif
+
+    computeCpu(cams);
+}
+
+#if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_CUDA)
+
 int DepthMapEstimator::getNbSimultaneousTiles() const
 {
     const int nbTilesPerCamera = _tileRoiList.size();
@@ -170,6 +254,8 @@ int DepthMapEstimator::getNbSimultaneousTiles() const
     return out_nbSimultaneousTiles;
 }
 
+#endif  // ALICEVISION_HAVE_CUDA
+
 void DepthMapEstimator::getTilesList(const std::vector<int>& cams, std::vector<Tile>& tiles) const
 {
     const int nbTilesPerCamera = _tileRoiList.size();
@@ -223,6 +309,7 @@ void DepthMapEstimator::getTilesList(const std::vector<int>& cams, std::vector<T
 
 void DepthMapEstimator::compute(int cudaDeviceId, const std::vector<int>& cams)
 {
+#if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_CUDA)
     // set the device to use for GPU executions
     // the CUDA runtime API is thread-safe, it maintains per-thread state about the current device
     setCudaDeviceId(cudaDeviceId);
@@ -509,6 +596,156 @@ void DepthMapEstimator::compute(int cudaDeviceId, const std::vector<int>& cams)
     DeviceCache::getInstance().clear();
     sgmPerStream.clear();
     refinePerStream.clear();
+#else
+    ALICEVISION_THROW_ERROR("Cannot compute depth maps on GPU, AliceVision is built without CUDA.");
+#endif
+}
+
+void DepthMapEstimator::computeCpu(const std::vector<int>& cams)
+{
+    // initialize RAM image cache
+    mvsUtils::ImagesCache<image::Image<image::RGBAfColor>> ic(_mp, image::EImageColorSpace::LINEAR);
+
+    // build tile list order by R camera
+    std::vector<Tile> tiles;
+    getTilesList(cams, tiles);
+
+    // number of R cameras in the same batch
+    // enough tiles to keep all the threads busy, the host cache only keeps the cameras of the current batch
+    const int nbTilesPerCamera = static_cast<int>(_tileRoiList.size());
+    const int nbRcPerBatch = std::max(1, divideRoundUp(omp_get_max_threads(), nbTilesPerCamera));
+    const int nbTilesPerBatch = nbRcPerBatch * nbTilesPerCamera;
+    const int nbBatches = divideRoundUp(static_cast<int>(tiles.size()), nbTilesPerBatch);
+
+    ALICEVISION_LOG_INFO("Parallelization:" << std::endl
+                                            << "\t- # tiles per image: " << nbTilesPerCamera << std::endl
+                                            << "\t- # CPU threads: " << omp_get_max_threads() << std::endl
+                                            << "\t- # depth maps per batch: " << nbRcPerBatch);
+
+    HostCache hostCache;
+
+    // compute each batch of R cameras
+    // note: the tile list contains all the tiles of each R camera, a batch always contains complete R cameras
+    for (int b = 0; b < nbBatches; ++b)
+    {
+        const int firstTileIndex = b * nbTilesPerBatch;
+        const int lastTileIndex = std::min((b + 1) * nbTilesPerBatch, static_cast<int>(tiles.size()));
+
+        std::vector<Tile> batchTiles(tiles.begin() + firstTileIndex, tiles.begin() + lastTileIndex);
+        std::vector<std::vector<float>> batchTilesDepths(batchTiles.size());
+        std::vector<std::vector<Pixel>> batchTilesDepthsTcLimits(batchTiles.size());
+        std::vector<std::pair<float, float>> batchDepthMinMaxTiles(batchTiles.size());
+
+        // build each tile SGM depth list
+        // tiles with an empty ROI, no T camera or no depth get an invalid depth/sim map
+        for (std::size_t i = 0; i < batchTiles.size(); ++i)
+        {
+            Tile& tile = batchTiles.at(i);
+
+            if (tile.roi.isEmpty() || tile.sgmTCams.empty() || (_depthMapParams.useRefine && tile.refineTCams.empty()))
+                continue;
+
+            // build tile SGM depth list
+            SgmDepthList sgmDepthList(_mp, _sgmParams, tile);
+
+            // compute the R camera depth list
+            sgmDepthList.computeListRc();
+
+            // check number of depths
+            if (sgmDepthList.getDepths().empty())  // no depth found
+                continue;
+
+            // remove T cameras with no depth found.
+            sgmDepthList.removeTcWithNoDepth(tile);
+
+            // store min/max depth
+            batchDepthMinMaxTiles.at(i) = sgmDepthList.getMinMaxDepths();
+
+            // log debug camera / depth information
+            sgmDepthList.logRcTcDepthInformation();
+
+            // check if starting and stopping depth are valid
+            sgmDepthList.checkStartingAndStoppingDepth();
+
+            batchTilesDepths.at(i) = sgmDepthList.getDepths();
+            batchTilesDepthsTcLimits.at(i) = sgmDepthList.getDepthsTcLimits();
+        }
+
+        // load tile R and corresponding T cameras in host cache
+        hostCache.clear();
+
+        for (std::size_t i = 0; i < batchTiles.size(); ++i)
+        {
+            const Tile& tile = batchTiles.at(i);
+
+            if (batchTilesDepths.at(i).empty())
+                continue;
+
+            // R camera parameters at scale 1 are required for SGM retrieve best depth
+            hostCache.addCameraParams(tile.rc, 1, _mp);
+
+            // add Sgm R and T cameras to host cache
+            hostCache.addCameraParams(tile.rc, _sgmParams.scale, _mp);
+            hostCache.addImage(tile.rc, _sgmParams.scale, ic);
+
+            for (const int tc : tile.sgmTCams)
+            {
+                hostCache.addCameraParams(tc, _sgmParams.scale, _mp);
+                hostCache.addImage(tc, _sgmParams.scale, ic);
+            }
+
+            if (_depthMapParams.useRefine)
+            {
+                // add Refine R and T cameras to host cache
+                hostCache.addCameraParams(tile.rc, _refineParams.scale, _mp);
+                hostCache.addImage(tile.rc, _refineParams.scale, ic);
+
+                for (const int tc : tile.refineTCams)
+                {
+                    hostCache.addCameraParams(tc, _refineParams.scale, _mp);
+                    hostCache.addImage(tc, _refineParams.scale, ic);
+                }
+            }
+        }
+
+        // compute batch tiles Semi-Global Matching and Refine
+        std::vector<HostMap<Vec2f>> batchDepthSimMapTiles;
+        computeTilesDepthSimMapCpu(batchTiles,
+                                   batchTilesDepths,
+                                   batchTilesDepthsTcLimits,
+                                   hostCache,
+                                   _sgmParams,
+                                   _refineParams,
+                                   _depthMapParams.useRefine,
+                                   batchDepthSimMapTiles);
+
+        // write depth/sim map result
+        for (std::size_t firstRcTile = 0; firstRcTile < batchTiles.size(); firstRcTile += nbTilesPerCamera)
+        {
+            const int rc = batchTiles.at(firstRcTile).rc;
+
+            std::vector<image::Image<float>> depthMapTiles(nbTilesPerCamera);
+            std::vector<image::Image<float>> simMapTiles(nbTilesPerCamera);
+
+            for (int j = 0; j < nbTilesPerCamera; ++j)
+                copyDepthSimMap(batchDepthSimMapTiles.at(firstRcTile + j), depthMapTiles.at(j), simMapTiles.at(j));
+
+            if (_depthMapParams.useRefine)
+                writeDepthSimMapFromTileList(
+                  rc, _mp, _tileParams, _tileRoiList, depthMapTiles, simMapTiles, _refineParams.scale, _refineParams.stepXY);
+            else
+                writeDepthSimMapFromTileList(rc, _mp, _tileParams, _tileRoiList, depthMapTiles, simMapTiles, _sgmParams.scale, _sgmParams.stepXY);
+
+            if (_depthMapParams.exportTilePattern)
+            {
+                const std::vector<std::pair<float, float>> depthMinMaxTiles(batchDepthMinMaxTiles.begin() + firstRcTile,
+                                                                            batchDepthMinMaxTiles.begin() + firstRcTile + nbTilesPerCamera);
+                exportDepthSimMapTilePatternObj(rc, _mp, _tileRoiList, depthMinMaxTiles);
+            }
+        }
+    }
+
+    hostCache.clear();
 }
 
 }  // namespace depthMap
@@ -22,7 +22,8 @@ namespace depthMap {
 /**
  * @class Depth Map Estimator
  * @brief Wrap depth maps estimation computation.
- * @note Allows muli-GPUs computation (interface IGPUJob)
+ * @note Allows muli-GPUs computation (interface IGPUJob) with the CUDA backend,
+ *       or CPU computation (see DepthMapParams::backend).
  */
 class DepthMapEstimator : public IGPUJob
 {
@@ -51,15 +52,36 @@ class DepthMapEstimator : public IGPUJob
     ~DepthMapEstimator() = default;
 
     /**
-     * @brief Compute depth/similarity maps of the given cameras.
+     * @brief Compute depth/similarity maps of the given cameras with the selected backend.
+     * @note With the AUTO backend, the CUDA backend is used if a CUDA-enabled GPU is available,
+     *       the CPU backend otherwise.
+     * @param[in] cams the list of cameras
+     * @param[in] nbGPUsToUse the number of GPUs to use with the CUDA backend (0 means all the available GPUs)
+     */
+    void computeDepthMaps(const std::vector<int>& cams, int nbGPUsToUse = 0);
+
+    /**
+     * @brief Compute depth/similarity maps of the given cameras on GPU.
      * @param[in] cudaDeviceId the CUDA device id
      * @param[in] cams the list of cameras
      */
     void compute(int cudaDeviceId, const std::vector<int>& cams) override;
 
+    /**
+     * @brief Compute depth/similarity maps of the given cameras on CPU.
+     * @param[in] cams the list of cameras
+     */
+    void computeCpu(const std::vector<int>& cams);
+
   private:
     // private methods
 
+    /**
+     * @brief Get the backend to use from the depth map parameters and the available devices.
+     * @return CUDA or CPU backend
+     */
+    EDepthMapBackend getComputeBackend() const;
+
     /**
      * @brief Compute the maximum number of tiles (volumes, buffer, images, ...)
      *        that fit in GPU memory and can be computed simultaneously.
@@ -11,9 +11,58 @@
 #include <aliceVision/depthMap/SgmParams.hpp>
 #include <aliceVision/depthMap/RefineParams.hpp>
 
+#include <iostream>
+#include <iterator>
+#include <stdexcept>
+#include <string>
+
 namespace aliceVision {
 namespace depthMap {
 
+/**
+ * @brief Depth map estimation backend
+ */
+enum class EDepthMapBackend
+{
+    AUTO = 0,  //< CUDA if a compatible device is available, CPU otherwise
+    CUDA,      //< CUDA backend (GPU)
+    CPU        //< CPU backend (custom patch pattern, consistent scale and intermediate exports are not supported)
+};
+
+inline std::string EDepthMapBackend_enumToString(EDepthMapBackend backend)
+{
+    switch (backend)
+    {
+        case EDepthMapBackend::AUTO:
+            return "auto";
+        case EDepthMapBackend::CUDA:
+            return "cuda";
+        case EDepthMapBackend::CPU:
+            return "cpu";
+    }
+    throw std::out_of_range("Invalid depth map backend enum");
+}
+
+inline EDepthMapBackend EDepthMapBackend_stringToEnum(const std::string& backend)
+{
+    if (backend == "auto")
+        return EDepthMapBackend::AUTO;
+    if (backend == "cuda")
+        return EDepthMapBackend::CUDA;
+    if (backend == "cpu")
+        return EDepthMapBackend::CPU;
+    throw std::out_of_range("Invalid depth map backend string " + backend);
+}
+
+inline std::ostream& operator<<(std::ostream& os, EDepthMapBackend e) { return os << EDepthMapBackend_enumToString(e); }
+
+inline std::istream& operator>>(std::istream& in, EDepthMapBackend& backend)
+{
+    std::string token(std::istreambuf_iterator<char>(in), {});
+    backend = EDepthMapBackend_stringToEnum(token);
+    return in;
+}
+
 /**
  * @brief Depth Map Parameters
  */
@@ -21,10 +70,11 @@ struct DepthMapParams
 {
     // user parameters
 
-    int maxTCams = 10;                 //< global T cameras maximum
-    bool chooseTCamsPerTile = true;    //< choose T cameras per R tile or for the entire R image
-    bool exportTilePattern = false;    //< export tile pattern obj
-    bool autoAdjustSmallImage = true;  //< allow program to override parameters for the single tile case
+    int maxTCams = 10;                                  //< global T cameras maximum
+    bool chooseTCamsPerTile = true;                     //< choose T cameras per R tile or for the entire R image
+    bool exportTilePattern = false;                     //< export tile pattern obj
+    bool autoAdjustSmallImage = true;                   //< allow program to override parameters for the single tile case
+    EDepthMapBackend backend = EDepthMapBackend::AUTO;  //< depth map estimation backend
 
     /// user custom patch pattern for similarity volume computation (both SGM & Refine)
     CustomPatchPatternParams customPatchPattern;
@@ -11,7 +11,7 @@
 #include <aliceVision/utils/filesIO.hpp>
 #include <aliceVision/mvsUtils/fileIO.hpp>
 #include <aliceVision/mvsUtils/mapIO.hpp>
-#include <aliceVision/depthMap/depthMapUtils.hpp>
+#include <aliceVision/depthMap/cuda/host/depthMapUtils.hpp>
 #include <aliceVision/depthMap/cuda/host/utils.hpp>
 #include <aliceVision/depthMap/cuda/host/DeviceCache.hpp>
 #include <aliceVision/depthMap/cuda/planeSweeping/deviceDepthSimilarityMap.hpp>
@@ -8,7 +8,7 @@
 
 #include <aliceVision/system/Logger.hpp>
 #include <aliceVision/mvsUtils/fileIO.hpp>
-#include <aliceVision/depthMap/depthMapUtils.hpp>
+#include <aliceVision/depthMap/cuda/host/depthMapUtils.hpp>
 #include <aliceVision/depthMap/volumeIO.hpp>
 #include <aliceVision/depthMap/cuda/host/utils.hpp>
 #include <aliceVision/depthMap/cuda/host/DeviceCache.hpp>
@@ -0,0 +1,184 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "RefineCpu.hpp"
+
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/depthMap/cpu/planeSweeping/hostDepthSimilarityMap.hpp>
+
+#include <sstream>
+
+namespace aliceVision {
+namespace depthMap {
+
+namespace {
+
+/**
+ * @brief Get the list of the requested Refine options that are not supported on CPU.
+ * @param[in] refineParams the Refine parameters
+ * @return comma-separated option names, empty if all the requested options are supported
+ */
+std::string getUnsupportedOptions(const RefineParams& refineParams)
+{
+    const std::pair<bool, const char*> options[] = {
+      {refineParams.useCustomPatchPattern, "useCustomPatchPattern"},
+      {refineParams.useConsistentScale, "useConsistentScale"},
+      {refineParams.useSgmNormalMap, "useSgmNormalMap"},
+      {refineParams.exportIntermediateDepthSimMaps, "exportIntermediateDepthSimMaps"},
+      {refineParams.exportIntermediateNormalMaps, "exportIntermediateNormalMaps"},
+      {refineParams.exportIntermediateCrossVolumes, "exportIntermediateCrossVolumes"},
+      {refineParams.exportIntermediateTopographicCutVolumes, "exportIntermediateTopographicCutVolumes"},
+      {refineParams.exportIntermediateVolume9pCsv, "exportIntermediateVolume9pCsv"},
+    };
+
+    std::ostringstream oss;
+
+    for (const auto& option : options)
+    {
+        if (option.first)
+            oss << ((oss.tellp() > 0) ? ", " : "") << option.second;
+    }
+
+    return oss.str();
+}
+
+}  // namespace
+
+RefineCpu::RefineCpu(const RefineParams& refineParams)
+  : _refineParams(refineParams)
+{}
+
+double RefineCpu::getHostMemoryConsumption() const
+{
+    size_t bytes = 0;
+
+    bytes += _sgmDepthPixSizeMap.getBytes();
+    bytes += _refinedDepthSimMap.getBytes();
+    bytes += _optimizedDepthSimMap.getBytes();
+    bytes += _volumeRefineSim.getBytes();
+
+    return (double(bytes) / (1024.0 * 1024.0));
+}
+
+void RefineCpu::refineRc(const Tile& tile, const HostMap<Vec2f>& in_sgmDepthThicknessMap, const HostCache& hostCache)
+{
+    ALICEVISION_LOG_INFO(tile << "Refine (CPU) depth/sim map of rc: " << tile.rc << ".");
+
+    // check requested options
+    {
+        const std::string unsupportedOptions = getUnsupportedOptions(_refineParams);
+
+        if (!unsupportedOptions.empty())
+            ALICEVISION_THROW_ERROR(tile << "Cannot refine on CPU, unsupported option(s): " << unsupportedOptions
+                                         << ". Use the CUDA backend or disable them.");
+    }
+
+    // downscale the region of interest
+    const ROI downscaledRoi = downscaleROI(tile.roi, _refineParams.scale * _refineParams.stepXY);
+
+    // allocate host memory for the current tile
+    {
+        const std::size_t width = downscaledRoi.width();
+        const std::size_t height = downscaledRoi.height();
+
+        _sgmDepthPixSizeMap.allocate(width, height);
+        _refinedDepthSimMap.allocate(width, height);
+        _optimizedDepthSimMap.allocate(width, height);
+    }
+
+    // compute upscaled SGM depth/pixSize map
+    // - upscale SGM depth/thickness map
+    // - filter masked pixels (alpha)
+    // - compute pixSize from SGM thickness
+    {
+        const HostImage& rcImage = hostCache.requestImage(tile.rc, _refineParams.scale);
+
+        cpu_computeSgmUpscaledDepthPixSizeMap(_sgmDepthPixSizeMap, in_sgmDepthThicknessMap, rcImage, _refineParams, downscaledRoi);
+    }
+
+    // refine and fuse depth/sim map
+    if (_refineParams.useRefineFuse)
+    {
+        // refine and fuse with volume strategy
+        refineAndFuseDepthSimMap(tile, hostCache);
+    }
+    else
+    {
+        ALICEVISION_LOG_INFO(tile << "Refine (CPU) and fuse depth/sim map volume disabled.");
+        cpu_depthSimMapCopyDepthOnly(_refinedDepthSimMap, _sgmDepthPixSizeMap, 1.0f);
+    }
+
+    // optimize depth/sim map
+    if (_refineParams.useColorOptimization && _refineParams.optimizationNbIterations > 0)
+    {
+        ALICEVISION_LOG_INFO(tile << "Color optimize (CPU) depth/sim map.");
+
+        const HostCameraParams& rcCamParams = hostCache.requestCameraParams(tile.rc, _refineParams.scale);
+        const HostImage& rcImage = hostCache.requestImage(tile.rc, _refineParams.scale);
+
+        cpu_depthSimMapOptimizeGradientDescent(
+          _optimizedDepthSimMap, _sgmDepthPixSizeMap, _refinedDepthSimMap, rcCamParams, rcImage, _refineParams, downscaledRoi);
+
+        ALICEVISION_LOG_INFO(tile << "Color optimize (CPU) depth/sim map done.");
+    }
+    else
+    {
+        ALICEVISION_LOG_INFO(tile << "Color optimize (CPU) depth/sim map disabled.");
+        _optimizedDepthSimMap = _refinedDepthSimMap;
+    }
+
+    ALICEVISION_LOG_INFO(tile << "Refine (CPU) depth/sim map done.");
+}
+
+void RefineCpu::refineAndFuseDepthSimMap(const Tile& tile, const HostCache& hostCache)
+{
+    ALICEVISION_LOG_INFO(tile << "Refine (CPU) and fuse depth/sim map volume.");
+
+    // downscale the region of interest
+    const ROI downscaledRoi = downscaleROI(tile.roi, _refineParams.scale * _refineParams.stepXY);
+
+    // allocate and initialize the similarity volume at 0
+    // each tc filtered and inverted similarity value will be summed in this volume
+    const int nbDepthsToRefine = _refineParams.halfNbDepths * 2 + 1;
+    _volumeRefineSim.allocate(downscaledRoi.width(), downscaledRoi.height(), nbDepthsToRefine);
+    cpu_volumeInitialize(_volumeRefineSim, TSimRefineHost(0.f));
+
+    // get the depth range
+    const Range depthRange(0, nbDepthsToRefine);
+
+    // get R camera parameters and image from cache
+    const HostCameraParams& rcCamParams = hostCache.requestCameraParams(tile.rc, _refineParams.scale);
+    const HostImage& rcImage = hostCache.requestImage(tile.rc, _refineParams.scale);
+
+    // compute for each RcTc each similarity value for each depth to refine
+    // sum the inverted / filtered similarity value, best value is the HIGHEST
+    for (std::size_t tci = 0; tci < tile.refineTCams.size(); ++tci)
+    {
+        const int tc = tile.refineTCams.at(tci);
+
+        // get T camera parameters and image from cache
+        const HostCameraParams& tcCamParams = hostCache.requestCameraParams(tc, _refineParams.scale);
+        const HostImage& tcImage = hostCache.requestImage(tc, _refineParams.scale);
+
+        ALICEVISION_LOG_DEBUG(tile << "Refine similarity volume (CPU):" << std::endl
+                                   << "\t- rc: " << tile.rc << std::endl
+                                   << "\t- tc: " << tc << " (" << (tci + 1) << "/" << tile.refineTCams.size() << ")" << std::endl
+                                   << "\t- tile range x: [" << downscaledRoi.x.begin << " - " << downscaledRoi.x.end << "]" << std::endl
+                                   << "\t- tile range y: [" << downscaledRoi.y.begin << " - " << downscaledRoi.y.end << "]" << std::endl);
+
+        cpu_volumeRefineSimilarity(
+          _volumeRefineSim, _sgmDepthPixSizeMap, rcCamParams, tcCamParams, rcImage, tcImage, _refineParams, depthRange, downscaledRoi);
+    }
+
+    // retrieve the best depth/sim in the volume
+    // compute sub-pixel sample using a sliding gaussian
+    cpu_volumeRefineBestDepth(_refinedDepthSimMap, _sgmDepthPixSizeMap, _volumeRefineSim, _refineParams, downscaledRoi);
+
+    ALICEVISION_LOG_INFO(tile << "Refine (CPU) and fuse depth/sim map volume done.");
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
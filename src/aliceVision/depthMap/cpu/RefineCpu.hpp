@@ -0,0 +1,81 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/depthMap/Tile.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCache.hpp>
+#include <aliceVision/depthMap/cpu/planeSweeping/hostSimilarityVolume.hpp>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @class Depth map estimation Refine on CPU
+ * @brief Manages the calculation of the Refine step in host memory.
+ * @note CPU counterpart of Refine, custom patch pattern, consistent scale, SGM normal map
+ *       and intermediate exports are not supported (refineRc throws if one of them is requested).
+ */
+class RefineCpu
+{
+  public:
+    /**
+     * @brief RefineCpu constructor.
+     * @param[in] refineParams the Refine parameters
+     */
+    explicit RefineCpu(const RefineParams& refineParams);
+
+    // no default constructor
+    RefineCpu() = delete;
+
+    // default destructor
+    ~RefineCpu() = default;
+
+    // final depth/similarity map getter
+    inline const HostMap<Vec2f>& getDepthSimMap() const { return _optimizedDepthSimMap; }
+
+    /**
+     * @brief Get memory consumption in host memory.
+     * @return host memory consumption (in MB)
+     */
+    double getHostMemoryConsumption() const;
+
+    /**
+     * @brief Refine for a single R camera the Semi-Global Matching depth/sim map.
+     * @note The R and T cameras parameters and images at Refine scale should be in the given host cache.
+     * @param[in] tile The given tile for Refine computation
+     * @param[in] in_sgmDepthThicknessMap the SGM result depth/thickness map in host memory
+     * @param[in] hostCache the host cache of camera parameters and images
+     */
+    void refineRc(const Tile& tile, const HostMap<Vec2f>& in_sgmDepthThicknessMap, const HostCache& hostCache);
+
+  private:
+    // private methods
+
+    /**
+     * @brief Refine and fuse the given depth/sim map using volume strategy.
+     * @param[in] tile The given tile for Refine computation
+     * @param[in] hostCache the host cache of camera parameters and images
+     */
+    void refineAndFuseDepthSimMap(const Tile& tile, const HostCache& hostCache);
+
+    // private members
+
+    const RefineParams& _refineParams;  //< Refine parameters
+
+    // private members in host memory
+
+    HostMap<Vec2f> _sgmDepthPixSizeMap;             //< rc upscaled SGM depth/pixSize map
+    HostMap<Vec2f> _refinedDepthSimMap;             //< rc refined and fused depth/sim map
+    HostMap<Vec2f> _optimizedDepthSimMap;           //< rc optimized depth/sim map
+    HostVolume<TSimRefineHost> _volumeRefineSim;    //< rc refine similarity volume
+};
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,213 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "SgmCpu.hpp"
+
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/depthMap/cpu/planeSweeping/hostDepthSimilarityMap.hpp>
+
+#include <sstream>
+
+namespace aliceVision {
+namespace depthMap {
+
+namespace {
+
+/**
+ * @brief Get the list of the requested SGM options that are not supported on CPU.
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] computeNormalMap normal map computation is requested
+ * @return comma-separated option names, empty if all the requested options are supported
+ */
+std::string getUnsupportedOptions(const SgmParams& sgmParams, bool computeNormalMap)
+{
+    const std::pair<bool, const char*> options[] = {
+      {sgmParams.useCustomPatchPattern, "useCustomPatchPattern"},
+      {sgmParams.useConsistentScale, "useConsistentScale"},
+      {computeNormalMap, "computeNormalMap"},
+      {sgmParams.exportIntermediateDepthSimMaps, "exportIntermediateDepthSimMaps"},
+      {sgmParams.exportIntermediateNormalMaps, "exportIntermediateNormalMaps"},
+      {sgmParams.exportIntermediateVolumes, "exportIntermediateVolumes"},
+      {sgmParams.exportIntermediateCrossVolumes, "exportIntermediateCrossVolumes"},
+      {sgmParams.exportIntermediateTopographicCutVolumes, "exportIntermediateTopographicCutVolumes"},
+      {sgmParams.exportIntermediateVolume9pCsv, "exportIntermediateVolume9pCsv"},
+    };
+
+    std::ostringstream oss;
+
+    for (const auto& option : options)
+    {
+        if (option.first)
+            oss << ((oss.tellp() > 0) ? ", " : "") << option.second;
+    }
+
+    return oss.str();
+}
+
+}  // namespace
+
+SgmCpu::SgmCpu(const SgmParams& sgmParams, bool computeDepthSimMap, bool computeNormalMap)
+  : _sgmParams(sgmParams),
+    _computeDepthSimMap(computeDepthSimMap),
+    _computeNormalMap(computeNormalMap)
+{}
+
+double SgmCpu::getHostMemoryConsumption() const
+{
+    size_t bytes = 0;
+
+    bytes += _depthThicknessMap.getBytes();
+    bytes += _depthSimMap.getBytes();
+    bytes += _volumeBestSim.getBytes();
+    bytes += _volumeSecBestSim.getBytes();
+
+    return (double(bytes) / (1024.0 * 1024.0));
+}
+
+void SgmCpu::sgmRc(const Tile& tile, const std::vector<float>& depths, const std::vector<Pixel>& depthsTcLimits, const HostCache& hostCache)
+{
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) depth/thickness map of rc: " << tile.rc << ".");
+
+    // check requested options
+    {
+        const std::string unsupportedOptions = getUnsupportedOptions(_sgmParams, _computeNormalMap);
+
+        if (!unsupportedOptions.empty())
+            ALICEVISION_THROW_ERROR(tile << "Cannot compute Semi-Global Matching on CPU, unsupported option(s): " << unsupportedOptions
+                                         << ". Use the CUDA backend or disable them.");
+    }
+
+    // check SGM depth list and T cameras
+    if (tile.sgmTCams.empty() || depths.empty())
+        ALICEVISION_THROW_ERROR(tile << "Cannot compute Semi-Global Matching, no depths or no T cameras (rc: " << tile.rc << ").");
+
+    if (depthsTcLimits.size() != tile.sgmTCams.size())
+        ALICEVISION_THROW_ERROR(tile << "Cannot compute Semi-Global Matching, invalid depth list T cameras limits (rc: " << tile.rc << ").");
+
+    // downscale the region of interest
+    const ROI downscaledRoi = downscaleROI(tile.roi, _sgmParams.scale * _sgmParams.stepXY);
+
+    // allocate host memory for the current tile
+    // note: buffers are kept between tiles, the storage only grows if a tile is bigger than the previous ones
+    {
+        const std::size_t width = downscaledRoi.width();
+        const std::size_t height = downscaledRoi.height();
+
+        _depthThicknessMap.allocate(width, height);
+
+        if (_computeDepthSimMap)
+            _depthSimMap.allocate(width, height);
+
+        _volumeBestSim.allocate(width, height, depths.size());
+        _volumeSecBestSim.allocate(width, height, depths.size());
+    }
+
+    // compute best sim and second best sim volumes
+    computeSimilarityVolumes(tile, depths, depthsTcLimits, hostCache);
+
+    // this is here for experimental purposes
+    // to show how SGGC work on non optimized depthmaps
+    // it must equals to true in normal case
+    if (_sgmParams.doSgmOptimizeVolume)
+    {
+        ALICEVISION_LOG_INFO(tile << "SGM (CPU) Optimizing volume (filtering axes: " << _sgmParams.filteringAxes << ").");
+
+        const HostImage& rcImage = hostCache.requestImage(tile.rc, _sgmParams.scale);
+
+        // reuse best sim to put optimized similarity
+        cpu_volumeOptimize(_volumeBestSim, _volumeSecBestSim, rcImage, _sgmParams, int(depths.size()), downscaledRoi);
+    }
+    else
+    {
+        // best sim volume is normally reuse to put optimized similarity
+        _volumeBestSim = _volumeSecBestSim;
+    }
+
+    // retrieve best depth
+    {
+        ALICEVISION_LOG_INFO(tile << "SGM (CPU) Retrieve best depth in volume.");
+
+        const Range depthRange(0, depths.size());
+        const HostCameraParams& rcCamParams = hostCache.requestCameraParams(tile.rc, 1);
+
+        cpu_volumeRetrieveBestDepth(_depthThicknessMap, _depthSimMap, depths, _volumeBestSim, rcCamParams, _sgmParams, depthRange, downscaledRoi);
+    }
+
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) depth/thickness map done.");
+}
+
+void SgmCpu::smoothThicknessMap(const Tile& tile, const RefineParams& refineParams)
+{
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) Smooth thickness map.");
+
+    // downscale the region of interest
+    const ROI downscaledRoi = downscaleROI(tile.roi, _sgmParams.scale * _sgmParams.stepXY);
+
+    // result thickness map smoothing with adjacent pixels
+    cpu_depthThicknessSmoothThickness(_depthThicknessMap, _sgmParams, refineParams, downscaledRoi);
+
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) Smooth thickness map done.");
+}
+
+void SgmCpu::computeSimilarityVolumes(const Tile& tile,
+                                      const std::vector<float>& depths,
+                                      const std::vector<Pixel>& depthsTcLimits,
+                                      const HostCache& hostCache)
+{
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) Compute similarity volume.");
+
+    // downscale the region of interest
+    const ROI downscaledRoi = downscaleROI(tile.roi, _sgmParams.scale * _sgmParams.stepXY);
+
+    // initialize the two similarity volumes at 255
+    cpu_volumeInitialize(_volumeBestSim, TSimHost(255));
+    cpu_volumeInitialize(_volumeSecBestSim, TSimHost(255));
+
+    // get R camera parameters and image from cache
+    const HostCameraParams& rcCamParams = hostCache.requestCameraParams(tile.rc, _sgmParams.scale);
+    const HostImage& rcImage = hostCache.requestImage(tile.rc, _sgmParams.scale);
+
+    // compute similarity volume per Rc Tc
+    for (std::size_t tci = 0; tci < tile.sgmTCams.size(); ++tci)
+    {
+        const int tc = tile.sgmTCams.at(tci);
+
+        const int firstDepth = depthsTcLimits[tci].x;
+        const int lastDepth = firstDepth + depthsTcLimits[tci].y;
+
+        const Range tcDepthRange(firstDepth, lastDepth);
+
+        // get T camera parameters and image from cache
+        const HostCameraParams& tcCamParams = hostCache.requestCameraParams(tc, _sgmParams.scale);
+        const HostImage& tcImage = hostCache.requestImage(tc, _sgmParams.scale);
+
+        ALICEVISION_LOG_DEBUG(tile << "Compute similarity volume (CPU):" << std::endl
+                                   << "\t- rc: " << tile.rc << std::endl
+                                   << "\t- tc: " << tc << " (" << (tci + 1) << "/" << tile.sgmTCams.size() << ")" << std::endl
+                                   << "\t- tc first depth: " << firstDepth << std::endl
+                                   << "\t- tc last depth: " << lastDepth << std::endl
+                                   << "\t- tile range x: [" << downscaledRoi.x.begin << " - " << downscaledRoi.x.end << "]" << std::endl
+                                   << "\t- tile range y: [" << downscaledRoi.y.begin << " - " << downscaledRoi.y.end << "]" << std::endl);
+
+        cpu_volumeComputeSimilarity(
+          _volumeBestSim, _volumeSecBestSim, depths, rcCamParams, tcCamParams, rcImage, tcImage, _sgmParams, tcDepthRange, downscaledRoi);
+    }
+
+    // update second best uninitialized similarity volume values with first best similarity volume values
+    // - allows to avoid the particular case with a single tc (second best volume has no valid similarity values)
+    // - useful if a tc alone contributes to the calculation of a subpart of the similarity volume
+    if (_sgmParams.updateUninitializedSim)  // should always be true, false for debug purposes
+    {
+        ALICEVISION_LOG_DEBUG(tile << "SGM (CPU) Update uninitialized similarity volume values from best similarity volume.");
+
+        cpu_volumeUpdateUninitializedSimilarity(_volumeBestSim, _volumeSecBestSim);
+    }
+
+    ALICEVISION_LOG_INFO(tile << "SGM (CPU) Compute similarity volume done.");
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,119 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/mvsData/Pixel.hpp>
+#include <aliceVision/depthMap/Tile.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+#include <aliceVision/depthMap/SgmParams.hpp>
+#include <aliceVision/depthMap/SgmDepthList.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCache.hpp>
+#include <aliceVision/depthMap/cpu/planeSweeping/hostSimilarityVolume.hpp>
+
+#include <vector>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @class Depth map estimation Semi-Global Matching on CPU
+ * @brief Manages the calculation of the Semi-Global Matching step in host memory.
+ * @note CPU counterpart of Sgm, custom patch pattern, consistent scale, normal map computation
+ *       and intermediate exports are not supported (sgmRc throws if one of them is requested).
+ */
+class SgmCpu
+{
+  public:
+    /**
+     * @brief SgmCpu constructor.
+     * @param[in] sgmParams the Semi Global Matching parameters
+     * @param[in] computeDepthSimMap Enable final depth/sim map computation
+     * @param[in] computeNormalMap Enable normal map computation (not supported on CPU)
+     */
+    SgmCpu(const SgmParams& sgmParams, bool computeDepthSimMap, bool computeNormalMap = false);
+
+    // no default constructor
+    SgmCpu() = delete;
+
+    // default destructor
+    ~SgmCpu() = default;
+
+    // final depth/thickness map getter
+    inline const HostMap<Vec2f>& getDepthThicknessMap() const { return _depthThicknessMap; }
+
+    // final depth/similarity map getter (optional: could be empty)
+    inline const HostMap<Vec2f>& getDepthSimMap() const { return _depthSimMap; }
+
+    /**
+     * @brief Get memory consumption in host memory.
+     * @return host memory consumption (in MB)
+     */
+    double getHostMemoryConsumption() const;
+
+    /**
+     * @brief Compute for a single R camera the Semi-Global Matching.
+     * @note The R and T cameras parameters and images at SGM scale should be in the given host cache,
+     *       as well as the R camera parameters at full resolution.
+     * @param[in] tile The given tile for SGM computation
+     * @param[in] depths the tile SGM depth list
+     * @param[in] depthsTcLimits the tile SGM depth list T cameras limits (first depth index, number of depths)
+     * @param[in] hostCache the host cache of camera parameters and images
+     */
+    void sgmRc(const Tile& tile, const std::vector<float>& depths, const std::vector<Pixel>& depthsTcLimits, const HostCache& hostCache);
+
+    /**
+     * @brief Compute for a single R camera the Semi-Global Matching.
+     * @param[in] tile The given tile for SGM computation
+     * @param[in] tileDepthList the tile SGM depth list
+     * @param[in] hostCache the host cache of camera parameters and images
+     */
+    inline void sgmRc(const Tile& tile, const SgmDepthList& tileDepthList, const HostCache& hostCache)
+    {
+        sgmRc(tile, tileDepthList.getDepths(), tileDepthList.getDepthsTcLimits(), hostCache);
+    }
+
+    /**
+     * @brief Smooth SGM result thickness map
+     * @note Important to be a proper Refine input parameter.
+     * @param[in] tile The given tile for SGM computation
+     * @param[in] refineParams the Refine parameters
+     */
+    void smoothThicknessMap(const Tile& tile, const RefineParams& refineParams);
+
+  private:
+    // private methods
+
+    /**
+     * @brief Compute for each RcTc the best / second best similarity volumes.
+     * @param[in] tile The given tile for SGM computation
+     * @param[in] depths the tile SGM depth list
+     * @param[in] depthsTcLimits the tile SGM depth list T cameras limits
+     * @param[in] hostCache the host cache of camera parameters and images
+     */
+    void computeSimilarityVolumes(const Tile& tile,
+                                  const std::vector<float>& depths,
+                                  const std::vector<Pixel>& depthsTcLimits,
+                                  const HostCache& hostCache);
+
+    // private members
+
+    const SgmParams& _sgmParams;     //< Semi Global Matching parameters
+    const bool _computeDepthSimMap;  //< needs to compute a final depth/sim map
+    const bool _computeNormalMap;    //< needs to compute a normal map (not supported on CPU)
+
+    // private members in host memory
+
+    HostMap<Vec2f> _depthThicknessMap;        //< rc result depth thickness map
+    HostMap<Vec2f> _depthSimMap;              //< rc result depth/sim map
+    HostVolume<TSimHost> _volumeBestSim;      //< rc best similarity volume
+    HostVolume<TSimHost> _volumeSecBestSim;   //< rc second best similarity volume
+};
+
+}  // namespace depthMap
+}  // namespace aliceVision
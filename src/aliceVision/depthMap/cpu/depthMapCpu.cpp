@@ -0,0 +1,105 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "depthMapCpu.hpp"
+
+#include <aliceVision/alicevision_omp.hpp>
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/depthMap/cpu/SgmCpu.hpp>
+#include <aliceVision/depthMap/cpu/RefineCpu.hpp>
+
+#include <exception>
+
+namespace aliceVision {
+namespace depthMap {
+
+void computeTilesDepthSimMapCpu(const std::vector<Tile>& tiles,
+                                const std::vector<std::vector<float>>& tilesDepths,
+                                const std::vector<std::vector<Pixel>>& tilesDepthsTcLimits,
+                                const HostCache& hostCache,
+                                const SgmParams& sgmParams,
+                                const RefineParams& refineParams,
+                                bool useRefine,
+                                std::vector<HostMap<Vec2f>>& out_tilesDepthSimMaps)
+{
+    if (tilesDepths.size() != tiles.size() || tilesDepthsTcLimits.size() != tiles.size())
+        ALICEVISION_THROW_ERROR("Cannot compute depth/sim maps on CPU, the number of depth lists does not match the number of tiles.");
+
+    out_tilesDepthSimMaps.resize(tiles.size());
+
+    // output depth/sim map downscale
+    const int downscale = (useRefine) ? (refineParams.scale * refineParams.stepXY) : (sgmParams.scale * sgmParams.stepXY);
+
+    // parallelize over tiles only if there are enough tiles for all the threads
+    // note: nested parallelism is disabled by default, inner loops are serial inside a tile thread
+    const bool parallelTiles = (tiles.size() >= std::size_t(omp_get_max_threads()));
+
+    // exceptions cannot leave the parallel region, keep the first one and rethrow it afterwards
+    std::exception_ptr firstException;
+
+#pragma omp parallel if (parallelTiles)
+    {
+        // per-thread Sgm / Refine, host buffers are reused between tiles
+        SgmCpu sgm(sgmParams, !useRefine);
+        RefineCpu refine(refineParams);
+
+#pragma omp for schedule(dynamic)
+        for (int i = 0; i < int(tiles.size()); ++i)
+        {
+            const Tile& tile = tiles.at(i);
+            HostMap<Vec2f>& tileDepthSimMap = out_tilesDepthSimMaps.at(i);
+
+            // do not compute empty ROI
+            // some images in the dataset may be smaller than others
+            if (tile.roi.isEmpty())
+                continue;
+
+            const ROI downscaledRoi = downscaleROI(tile.roi, downscale);
+            tileDepthSimMap.allocate(downscaledRoi.width(), downscaledRoi.height());
+
+            // check T cameras and depths
+            if (tile.sgmTCams.empty() || (useRefine && tile.refineTCams.empty()) || tilesDepths.at(i).empty())
+            {
+                tileDepthSimMap.fill(Vec2f(-1.f, 1.f));  // invalid depth, worst similarity value
+                continue;
+            }
+
+            try
+            {
+                // compute Semi-Global Matching
+                sgm.sgmRc(tile, tilesDepths.at(i), tilesDepthsTcLimits.at(i), hostCache);
+
+                if (useRefine)
+                {
+                    // smooth SGM thickness map
+                    // in order to be a proper Refine input parameter
+                    sgm.smoothThicknessMap(tile, refineParams);
+
+                    // compute Refine
+                    refine.refineRc(tile, sgm.getDepthThicknessMap(), hostCache);
+
+                    tileDepthSimMap = refine.getDepthSimMap();
+                }
+                else
+                {
+                    tileDepthSimMap = sgm.getDepthSimMap();
+                }
+            }
+            catch (...)
+            {
+#pragma omp critical
+                if (!firstException)
+                    firstException = std::current_exception();
+            }
+        }
+    }
+
+    if (firstException)
+        std::rethrow_exception(firstException);
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,54 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/mvsData/Pixel.hpp>
+#include <aliceVision/depthMap/Tile.hpp>
+#include <aliceVision/depthMap/SgmParams.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCache.hpp>
+
+#include <vector>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @brief Compute the depth/sim map of the given tiles on CPU (Semi-Global Matching and optionally Refine).
+ *
+ * @note Tiles are processed in parallel (one tile per thread) when there are enough tiles to use all the threads,
+ *       otherwise tiles are processed one after the other and each step is parallelized over depths and rows.
+ * @note The SGM depth lists should be computed beforehand (see SgmDepthList), with the tile T cameras
+ *       without depth already removed. Tiles with an empty ROI, no T camera or no depth get an invalid depth/sim map.
+ * @note All the needed camera parameters and images should already be in the given host cache:
+ *       - R camera parameters at full resolution
+ *       - R and T cameras parameters and images at SGM scale
+ *       - R and T cameras parameters and images at Refine scale (if Refine is enabled)
+ *
+ * @param[in] tiles the tiles to compute
+ * @param[in] tilesDepths the SGM depth list of each tile
+ * @param[in] tilesDepthsTcLimits the SGM depth list T cameras limits of each tile
+ * @param[in] hostCache the host cache of camera parameters and images
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] refineParams the Refine parameters
+ * @param[in] useRefine enable Refine process
+ * @param[out] out_tilesDepthSimMaps the output depth/sim map of each tile
+ *             (at Refine downscale if Refine is enabled, at SGM downscale otherwise)
+ */
+void computeTilesDepthSimMapCpu(const std::vector<Tile>& tiles,
+                                const std::vector<std::vector<float>>& tilesDepths,
+                                const std::vector<std::vector<Pixel>>& tilesDepthsTcLimits,
+                                const HostCache& hostCache,
+                                const SgmParams& sgmParams,
+                                const RefineParams& refineParams,
+                                bool useRefine,
+                                std::vector<HostMap<Vec2f>>& out_tilesDepthSimMaps);
+
+}  // namespace depthMap
+}  // namespace aliceVision
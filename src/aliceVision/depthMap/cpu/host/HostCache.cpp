@@ -0,0 +1,84 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "HostCache.hpp"
+
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/mvsUtils/ImagesCache.hpp>
+#include <aliceVision/mvsUtils/MultiViewParams.hpp>
+
+namespace aliceVision {
+namespace depthMap {
+
+void HostCache::addCameraParams(int camId, int downscale, const HostCameraParams& cameraParams)
+{
+    const std::lock_guard<std::mutex> lock(_mutex);
+    _cameraParams[Key(camId, downscale)] = cameraParams;
+}
+
+void HostCache::addCameraParams(int camId, int downscale, const mvsUtils::MultiViewParams& mp)
+{
+    {
+        const std::lock_guard<std::mutex> lock(_mutex);
+        if (_cameraParams.count(Key(camId, downscale)))
+            return;  // already in the cache
+    }
+
+    HostCameraParams cameraParams;
+    fillHostCameraParams(cameraParams, camId, downscale, mp);
+    addCameraParams(camId, downscale, cameraParams);
+}
+
+void HostCache::addImage(int camId, int downscale, const image::Image<image::RGBAfColor>& img)
+{
+    HostImage hostImage;
+    hostImage.fill(img, downscale);
+
+    const std::lock_guard<std::mutex> lock(_mutex);
+    _images[Key(camId, downscale)] = std::move(hostImage);
+}
+
+void HostCache::addImage(int camId, int downscale, mvsUtils::ImagesCache<image::Image<image::RGBAfColor>>& imageCache)
+{
+    {
+        const std::lock_guard<std::mutex> lock(_mutex);
+        if (_images.count(Key(camId, downscale)))
+            return;  // already in the cache
+    }
+
+    mvsUtils::ImagesCache<image::Image<image::RGBAfColor>>::ImgSharedPtr img = imageCache.getImg_sync(camId);
+    addImage(camId, downscale, *img);
+}
+
+const HostCameraParams& HostCache::requestCameraParams(int camId, int downscale) const
+{
+    const auto it = _cameraParams.find(Key(camId, downscale));
+
+    if (it == _cameraParams.end())
+        ALICEVISION_THROW_ERROR("Cannot get host camera parameters (camId: " << camId << ", downscale: " << downscale << ")");
+
+    return it->second;
+}
+
+const HostImage& HostCache::requestImage(int camId, int downscale) const
+{
+    const auto it = _images.find(Key(camId, downscale));
+
+    if (it == _images.end())
+        ALICEVISION_THROW_ERROR("Cannot get host image (camId: " << camId << ", downscale: " << downscale << ")");
+
+    return it->second;
+}
+
+void HostCache::clear()
+{
+    const std::lock_guard<std::mutex> lock(_mutex);
+    _cameraParams.clear();
+    _images.clear();
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
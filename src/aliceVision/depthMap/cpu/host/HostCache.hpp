@@ -0,0 +1,106 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/depthMap/cpu/host/HostCameraParams.hpp>
+#include <aliceVision/depthMap/cpu/host/HostImage.hpp>
+
+#include <map>
+#include <mutex>
+#include <utility>
+
+namespace aliceVision {
+namespace mvsUtils {
+class MultiViewParams;
+template<typename Image>
+class ImagesCache;
+}  // namespace mvsUtils
+
+namespace depthMap {
+
+/**
+ * @class HostCache
+ * @brief Keep camera parameters and downscaled images in host memory, CPU counterpart of DeviceCache.
+ * @note Unlike the DeviceCache, the HostCache is not a singleton and is not bounded:
+ *       the caller decides what to keep (e.g. the cameras of the current batch of tiles).
+ * @note add* functions are thread-safe, request* functions can be called concurrently
+ *       once all the cameras of the computation have been added.
+ */
+class HostCache
+{
+  public:
+    HostCache() = default;
+
+    // no copy constructor
+    HostCache(HostCache const&) = delete;
+
+    // no copy operator
+    void operator=(HostCache const&) = delete;
+
+    /**
+     * @brief Add the given camera parameters at the given downscale.
+     * @param[in] camId the camera index
+     * @param[in] downscale the camera downscale factor
+     * @param[in] cameraParams the host-side camera parameters
+     */
+    void addCameraParams(int camId, int downscale, const HostCameraParams& cameraParams);
+
+    /**
+     * @brief Add the given camera parameters at the given downscale from the multi-view parameters.
+     * @param[in] camId the camera index
+     * @param[in] downscale the camera downscale factor
+     * @param[in] mp the multi-view parameters
+     */
+    void addCameraParams(int camId, int downscale, const mvsUtils::MultiViewParams& mp);
+
+    /**
+     * @brief Add the given image at the given downscale.
+     * @param[in] camId the camera index
+     * @param[in] downscale the image downscale factor
+     * @param[in] img the full-size linear RGBA image
+     */
+    void addImage(int camId, int downscale, const image::Image<image::RGBAfColor>& img);
+
+    /**
+     * @brief Add the given camera image at the given downscale from the images cache.
+     * @param[in] camId the camera index
+     * @param[in] downscale the image downscale factor
+     * @param[in] imageCache the image cache to get the full-size image from
+     */
+    void addImage(int camId, int downscale, mvsUtils::ImagesCache<image::Image<image::RGBAfColor>>& imageCache);
+
+    /**
+     * @brief Get the camera parameters at the given downscale.
+     * @param[in] camId the camera index
+     * @param[in] downscale the camera downscale factor
+     * @return host-side camera parameters
+     */
+    const HostCameraParams& requestCameraParams(int camId, int downscale) const;
+
+    /**
+     * @brief Get the camera image at the given downscale.
+     * @param[in] camId the camera index
+     * @param[in] downscale the image downscale factor
+     * @return host image
+     */
+    const HostImage& requestImage(int camId, int downscale) const;
+
+    /**
+     * @brief Clear all the cached camera parameters and images.
+     */
+    void clear();
+
+  private:
+    using Key = std::pair<int, int>;  //< (camId, downscale)
+
+    std::map<Key, HostCameraParams> _cameraParams;
+    std::map<Key, HostImage> _images;
+    std::mutex _mutex;
+};
+
+}  // namespace depthMap
+}  // namespace aliceVision
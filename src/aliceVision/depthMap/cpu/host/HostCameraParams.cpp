@@ -0,0 +1,54 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "HostCameraParams.hpp"
+
+#include <aliceVision/mvsUtils/MultiViewParams.hpp>
+
+namespace aliceVision {
+namespace depthMap {
+
+namespace {
+
+Mat3 toEigen(const Matrix3x3& m)
+{
+    Mat3 out;
+    out << m.m11, m.m12, m.m13, m.m21, m.m22, m.m23, m.m31, m.m32, m.m33;
+    return out;
+}
+
+}  // namespace
+
+void fillHostCameraParams(HostCameraParams& cameraParams, const Matrix3x3& K, const Matrix3x3& R, const Point3d& C, int downscale)
+{
+    // same computation as the device-side camera parameters (see DeviceCache)
+    Mat3 scaleM = Mat3::Identity();
+    scaleM(0, 0) = 1.0 / double(downscale);
+    scaleM(1, 1) = 1.0 / double(downscale);
+
+    const Mat3 Kd = scaleM * toEigen(K);
+    const Mat3 Rd = toEigen(R);
+    const Vec3 Cd(C.x, C.y, C.z);
+
+    Mat34 P;
+    P.block<3, 3>(0, 0) = Kd * Rd;
+    P.col(3) = Kd * (-Rd * Cd);
+
+    const Mat3 iP = Rd.transpose() * Kd.inverse();
+
+    cameraParams.P = P.cast<float>();
+    cameraParams.iP = iP.cast<float>();
+    cameraParams.C = Cd.cast<float>();
+    cameraParams.ZVect = Rd.transpose().col(2).normalized().cast<float>();
+}
+
+void fillHostCameraParams(HostCameraParams& cameraParams, int camId, int downscale, const mvsUtils::MultiViewParams& mp)
+{
+    fillHostCameraParams(cameraParams, mp.KArr[camId], mp.RArr[camId], mp.CArr[camId], downscale);
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
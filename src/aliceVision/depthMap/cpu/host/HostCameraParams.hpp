@@ -0,0 +1,53 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/mvsData/Matrix3x3.hpp>
+#include <aliceVision/mvsData/Point3d.hpp>
+
+namespace aliceVision {
+namespace mvsUtils {
+class MultiViewParams;
+}  // namespace mvsUtils
+
+namespace depthMap {
+
+/**
+ * @struct HostCameraParams
+ * @brief Support class to maintain useful camera parameters in host memory.
+ * @note CPU counterpart of DeviceCameraParams, only the members used by the CPU kernels are kept.
+ */
+struct HostCameraParams
+{
+    Eigen::Matrix<float, 3, 4> P;  //< projection matrix (downscaled)
+    Eigen::Matrix3f iP;            //< inverse of the projection 3x3 part (downscaled)
+    Vec3f C;                       //< camera center
+    Vec3f ZVect;                   //< camera optical axis
+};
+
+/**
+ * @brief Fill the host-side camera parameters from the given intrinsics / pose.
+ * @param[out] cameraParams the host-side camera parameters
+ * @param[in] K the camera intrinsics matrix at full resolution
+ * @param[in] R the camera rotation matrix
+ * @param[in] C the camera center
+ * @param[in] downscale the camera downscale factor
+ */
+void fillHostCameraParams(HostCameraParams& cameraParams, const Matrix3x3& K, const Matrix3x3& R, const Point3d& C, int downscale);
+
+/**
+ * @brief Fill the host-side camera parameters of the given camera.
+ * @param[out] cameraParams the host-side camera parameters
+ * @param[in] camId the camera index in the multi-view parameters
+ * @param[in] downscale the camera downscale factor
+ * @param[in] mp the multi-view parameters
+ */
+void fillHostCameraParams(HostCameraParams& cameraParams, int camId, int downscale, const mvsUtils::MultiViewParams& mp);
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,128 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "HostImage.hpp"
+
+#include <aliceVision/numeric/numeric.hpp>
+
+#include <vector>
+
+namespace aliceVision {
+namespace depthMap {
+
+namespace {
+
+/**
+ * @brief Linear RGB (0..1) to CIELAB (0..255), same conversion as the device rgb2lab kernel.
+ */
+inline void rgb2lab(image::RGBAfColor& c)
+{
+    // RGB to XYZ
+    const float X = 0.4124564f * c.r() + 0.3575761f * c.g() + 0.1804375f * c.b();
+    const float Y = 0.2126729f * c.r() + 0.7151522f * c.g() + 0.0721750f * c.b();
+    const float Z = 0.0193339f * c.r() + 0.1191920f * c.g() + 0.9503041f * c.b();
+
+    // XYZ to CIELAB, assuming whitepoint D65, XYZ=(0.95047, 1.00000, 1.08883)
+    const auto f = [](float v) { return (v > 216.0f / 24389.0f) ? std::cbrt(v) : (24389.0f / 27.0f * v + 16.0f) / 116.0f; };
+
+    const float fx = f(X / 0.95047f);
+    const float fy = f(Y);
+    const float fz = f(Z / 1.08883f);
+
+    // convert values to fit into 0..255 (could be out-of-range)
+    c.r() = (116.0f * fy - 16.0f) * 2.55f;
+    c.g() = (500.0f * (fx - fy)) * 2.55f;
+    c.b() = (200.0f * (fy - fz)) * 2.55f;
+}
+
+/**
+ * @brief Bilinear fetch in the full-size image, equivalent to an unnormalized device texture fetch.
+ */
+inline image::RGBAfColor fetch(const image::Image<image::RGBAfColor>& img, float u, float v)
+{
+    const float x = u - 0.5f;
+    const float y = v - 0.5f;
+    const float xf = std::floor(x);
+    const float yf = std::floor(y);
+    const float ax = x - xf;
+    const float ay = y - yf;
+
+    const int w = img.width();
+    const int h = img.height();
+    const int x0 = std::clamp(int(xf), 0, w - 1);
+    const int y0 = std::clamp(int(yf), 0, h - 1);
+    const int x1 = std::clamp(int(xf) + 1, 0, w - 1);
+    const int y1 = std::clamp(int(yf) + 1, 0, h - 1);
+
+    image::RGBAfColor out;
+    for (int c = 0; c < 4; ++c)
+    {
+        const float top = img(y0, x0)(c) + (img(y0, x1)(c) - img(y0, x0)(c)) * ax;
+        const float bottom = img(y1, x0)(c) + (img(y1, x1)(c) - img(y1, x0)(c)) * ax;
+        out(c) = top + (bottom - top) * ay;
+    }
+    return out;
+}
+
+}  // namespace
+
+void HostImage::fill(const image::Image<image::RGBAfColor>& in_img, int downscale)
+{
+    _downscale = downscale;
+
+    const int width = divideRoundUp(in_img.width(), downscale);
+    const int height = divideRoundUp(in_img.height(), downscale);
+
+    _img.allocate(width, height);
+
+    // gaussian kernel used for the downscale, same as the device constant gaussian array
+    // radius is the downscale factor and delta is 1
+    const int gaussRadius = downscale;
+    std::vector<float> gauss(2 * gaussRadius + 1);
+    for (int i = -gaussRadius; i <= gaussRadius; ++i)
+        gauss[i + gaussRadius] = std::exp(-float(i * i) / 2.0f);
+
+    const float s = float(downscale) * 0.5f;
+
+#pragma omp parallel for
+    for (int y = 0; y < height; ++y)
+    {
+        for (int x = 0; x < width; ++x)
+        {
+            image::RGBAfColor color;
+
+            if (downscale > 1)
+            {
+                image::RGBAfColor acc(0.f, 0.f, 0.f, 0.f);
+                float sumFactor = 0.f;
+
+                for (int i = -gaussRadius; i <= gaussRadius; ++i)
+                {
+                    for (int j = -gaussRadius; j <= gaussRadius; ++j)
+                    {
+                        const float factor = gauss[i + gaussRadius] * gauss[j + gaussRadius];
+                        acc = acc + fetch(in_img, float(x * downscale + j) + s, float(y * downscale + i) + s) * factor;
+                        sumFactor += factor;
+                    }
+                }
+                color = acc * (1.f / sumFactor);
+            }
+            else
+            {
+                color = in_img(y, x);
+            }
+
+            // color in range (0, 1) to CIELAB in range (0, 255), alpha in range (0, 255)
+            rgb2lab(color);
+            color.a() *= 255.f;
+
+            _img(x, y) = color;
+        }
+    }
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
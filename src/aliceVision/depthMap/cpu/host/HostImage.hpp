@@ -0,0 +1,94 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/image/Image.hpp>
+#include <aliceVision/image/pixelTypes.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+
+#include <algorithm>
+#include <cmath>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @class HostImage
+ * @brief Downscaled CIELAB image in host memory, CPU counterpart of DeviceMipmapImage.
+ * @note Stores a single level: the one used by the Sgm or Refine step (given downscale).
+ *       Colors are in CIELAB (0, 255) and alpha in (0, 255) like the device mipmap image.
+ */
+class HostImage
+{
+  public:
+    HostImage() = default;
+
+    /**
+     * @brief Fill the host image from the given full-size linear RGBA image.
+     * @param[in] in_img the input full-size image, RGBA in range (0, 1)
+     * @param[in] downscale the downscale factor to apply
+     */
+    void fill(const image::Image<image::RGBAfColor>& in_img, int downscale);
+
+    inline int getWidth() const { return int(_img.getWidth()); }
+    inline int getHeight() const { return int(_img.getHeight()); }
+    inline int getDownscale() const { return _downscale; }
+    inline bool isEmpty() const { return _img.isEmpty(); }
+
+    /**
+     * @brief Get the bilinear interpolated color at the given image coordinates.
+     * @note Equivalent to the device texture fetch at ((x + 0.5) / width, (y + 0.5) / height),
+     *       coordinates outside the image are clamped.
+     * @param[in] x the x coordinate in the downscaled image
+     * @param[in] y the y coordinate in the downscaled image
+     * @return CIELAB color and alpha
+     */
+    inline image::RGBAfColor sample(float x, float y) const
+    {
+        const int w = getWidth();
+        const int h = getHeight();
+
+        const float xf = std::floor(x);
+        const float yf = std::floor(y);
+        const float ax = x - xf;
+        const float ay = y - yf;
+
+        const int x0 = std::clamp(int(xf), 0, w - 1);
+        const int y0 = std::clamp(int(yf), 0, h - 1);
+        const int x1 = std::clamp(int(xf) + 1, 0, w - 1);
+        const int y1 = std::clamp(int(yf) + 1, 0, h - 1);
+
+        const image::RGBAfColor& c00 = _img(x0, y0);
+        const image::RGBAfColor& c10 = _img(x1, y0);
+        const image::RGBAfColor& c01 = _img(x0, y1);
+        const image::RGBAfColor& c11 = _img(x1, y1);
+
+        image::RGBAfColor out;
+        for (int c = 0; c < 4; ++c)
+        {
+            const float top = c00(c) + (c10(c) - c00(c)) * ax;
+            const float bottom = c01(c) + (c11(c) - c01(c)) * ax;
+            out(c) = top + (bottom - top) * ay;
+        }
+        return out;
+    }
+
+    /**
+     * @brief Get the color of the given pixel (no interpolation).
+     * @param[in] x the x pixel coordinate in the downscaled image
+     * @param[in] y the y pixel coordinate in the downscaled image
+     * @return CIELAB color and alpha
+     */
+    inline const image::RGBAfColor& at(int x, int y) const { return _img(x, y); }
+
+  private:
+    HostMap<image::RGBAfColor> _img;
+    int _downscale = 1;
+};
+
+}  // namespace depthMap
+}  // namespace aliceVision
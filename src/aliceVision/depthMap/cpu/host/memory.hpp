@@ -0,0 +1,120 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <vector>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @class HostMap
+ * @brief Dense 2d buffer in host memory, CPU counterpart of CudaDeviceMemoryPitched<T, 2>.
+ * @note Elements are stored row by row without padding.
+ */
+template<typename T>
+class HostMap
+{
+  public:
+    HostMap() = default;
+
+    HostMap(std::size_t width, std::size_t height) { allocate(width, height); }
+
+    /**
+     * @brief Allocate (or reallocate) the buffer, previous values are not kept.
+     * @param[in] width the map width
+     * @param[in] height the map height
+     */
+    void allocate(std::size_t width, std::size_t height)
+    {
+        _width = width;
+        _height = height;
+        _data.resize(width * height);
+    }
+
+    /**
+     * @brief Set all the map elements to the given value.
+     * @param[in] value the value to set
+     */
+    void fill(const T& value) { std::fill(_data.begin(), _data.end(), value); }
+
+    inline std::size_t getWidth() const { return _width; }
+    inline std::size_t getHeight() const { return _height; }
+    inline bool isEmpty() const { return _data.empty(); }
+    inline std::size_t getBytes() const { return _data.size() * sizeof(T); }
+
+    inline T& operator()(std::size_t x, std::size_t y) { return _data[y * _width + x]; }
+    inline const T& operator()(std::size_t x, std::size_t y) const { return _data[y * _width + x]; }
+
+    inline T* row(std::size_t y) { return _data.data() + y * _width; }
+    inline const T* row(std::size_t y) const { return _data.data() + y * _width; }
+
+  private:
+    std::size_t _width = 0;
+    std::size_t _height = 0;
+    std::vector<T> _data;
+};
+
+/**
+ * @class HostVolume
+ * @brief Dense 3d buffer in host memory, CPU counterpart of CudaDeviceMemoryPitched<T, 3>.
+ * @note Elements are stored depth-major: for a given (x, y) all the depths are contiguous.
+ *       This layout keeps the per-pixel depth loops (best depth, refine samples, SGM path costs)
+ *       on contiguous memory so that they can be vectorized.
+ */
+template<typename T>
+class HostVolume
+{
+  public:
+    HostVolume() = default;
+
+    HostVolume(std::size_t dimX, std::size_t dimY, std::size_t dimZ) { allocate(dimX, dimY, dimZ); }
+
+    /**
+     * @brief Allocate (or reallocate) the buffer, previous values are not kept.
+     * @param[in] dimX the volume X dimension
+     * @param[in] dimY the volume Y dimension
+     * @param[in] dimZ the volume Z dimension (depths)
+     */
+    void allocate(std::size_t dimX, std::size_t dimY, std::size_t dimZ)
+    {
+        _dimX = dimX;
+        _dimY = dimY;
+        _dimZ = dimZ;
+        _data.resize(dimX * dimY * dimZ);
+    }
+
+    /**
+     * @brief Set all the volume elements to the given value.
+     * @param[in] value the value to set
+     */
+    void fill(const T& value) { std::fill(_data.begin(), _data.end(), value); }
+
+    inline std::size_t getDimX() const { return _dimX; }
+    inline std::size_t getDimY() const { return _dimY; }
+    inline std::size_t getDimZ() const { return _dimZ; }
+    inline bool isEmpty() const { return _data.empty(); }
+    inline std::size_t getBytes() const { return _data.size() * sizeof(T); }
+
+    inline T& operator()(std::size_t x, std::size_t y, std::size_t z) { return _data[(y * _dimX + x) * _dimZ + z]; }
+    inline const T& operator()(std::size_t x, std::size_t y, std::size_t z) const { return _data[(y * _dimX + x) * _dimZ + z]; }
+
+    /// @return pointer to the contiguous depth column of the given (x, y) element
+    inline T* column(std::size_t x, std::size_t y) { return _data.data() + (y * _dimX + x) * _dimZ; }
+    inline const T* column(std::size_t x, std::size_t y) const { return _data.data() + (y * _dimX + x) * _dimZ; }
+
+  private:
+    std::size_t _dimX = 0;
+    std::size_t _dimY = 0;
+    std::size_t _dimZ = 0;
+    std::vector<T> _data;
+};
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,443 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "hostDepthSimilarityMap.hpp"
+
+#include <aliceVision/depthMap/cpu/planeSweeping/hostPatch.hpp>
+
+#include <algorithm>
+#include <cmath>
+
+namespace aliceVision {
+namespace depthMap {
+
+namespace {
+
+/**
+ * @brief Get the angle (in degrees) between AB and AC.
+ */
+inline float angleBetwABandAC(const Vec3f& A, const Vec3f& B, const Vec3f& C)
+{
+    const Vec3f V1 = (B - A).normalized();
+    const Vec3f V2 = (C - A).normalized();
+
+    double a = std::acos(double(V1.dot(V2)));
+    a = std::isinf(a) ? 0.0 : a;
+    return float(std::abs(a) / (M_PI / 180.0));
+}
+
+/**
+ * @brief Get the smoothing step and the energy of the given cell.
+ * @note Neighbor depths outside the map are clamped, as the device nearest neighbor texture fetch.
+ * @return (smoothStep, energy)
+ */
+Vec2f getCellSmoothStepEnergy(const HostCameraParams& rcCamParams, const HostMap<float>& in_depthMap, int cellX, int cellY, const Vec2f& offsetRoi)
+{
+    Vec2f out(0.0f, 180.0f);
+
+    const int width = int(in_depthMap.getWidth());
+    const int height = int(in_depthMap.getHeight());
+
+    const auto getDepth = [&](int x, int y) { return in_depthMap(std::clamp(x, 0, width - 1), std::clamp(y, 0, height - 1)); };
+
+    // get pixel depth from the depth map
+    const float d0 = getDepth(cellX, cellY);
+
+    // early exit: depth is <= 0
+    if (d0 <= 0.0f)
+        return out;
+
+    // consider the neighbor pixels
+    const Vec2f cell0 = Vec2f(float(cellX), float(cellY));
+    const Vec2f cellL = cell0 + Vec2f(0.f, -1.f);  // Left
+    const Vec2f cellR = cell0 + Vec2f(0.f, 1.f);   // Right
+    const Vec2f cellU = cell0 + Vec2f(-1.f, 0.f);  // Up
+    const Vec2f cellB = cell0 + Vec2f(1.f, 0.f);   // Bottom
+
+    // get associated depths from depth map
+    const float dL = getDepth(cellX, cellY - 1);
+    const float dR = getDepth(cellX, cellY + 1);
+    const float dU = getDepth(cellX - 1, cellY);
+    const float dB = getDepth(cellX + 1, cellY);
+
+    // get associated 3D points
+    const Vec3f p0 = get3DPointForPixelAndDepthFromRC(rcCamParams, cell0 + offsetRoi, d0);
+    const Vec3f pL = get3DPointForPixelAndDepthFromRC(rcCamParams, cellL + offsetRoi, dL);
+    const Vec3f pR = get3DPointForPixelAndDepthFromRC(rcCamParams, cellR + offsetRoi, dR);
+    const Vec3f pU = get3DPointForPixelAndDepthFromRC(rcCamParams, cellU + offsetRoi, dU);
+    const Vec3f pB = get3DPointForPixelAndDepthFromRC(rcCamParams, cellB + offsetRoi, dB);
+
+    // compute the average point based on neighbors (cg)
+    Vec3f cg(0.0f, 0.0f, 0.0f);
+    float n = 0.0f;
+
+    if (dL > 0.0f)
+    {
+        cg += pL;
+        n++;
+    }
+    if (dR > 0.0f)
+    {
+        cg += pR;
+        n++;
+    }
+    if (dU > 0.0f)
+    {
+        cg += pU;
+        n++;
+    }
+    if (dB > 0.0f)
+    {
+        cg += pB;
+        n++;
+    }
+
+    // if we have at least one valid depth
+    if (n > 1.0f)
+    {
+        cg /= n;  // average of x, y, depth
+        const Vec3f vcn = (rcCamParams.C - p0).normalized();
+        // pS: projection of cg on the line from p0 to camera
+        const Vec3f pS = p0 + vcn * vcn.dot(cg - p0);
+        // keep the depth difference between pS and p0 as the smoothing step
+        out.x() = (rcCamParams.C - pS).norm() - d0;
+    }
+
+    float e = 0.0f;
+    n = 0.0f;
+
+    if (dL > 0.0f && dR > 0.0f)
+    {
+        // large angle between neighbors == flat area => low energy
+        // small angle between neighbors == non-flat area => high energy
+        e = std::max(e, (180.0f - angleBetwABandAC(p0, pL, pR)));
+        n++;
+    }
+    if (dU > 0.0f && dB > 0.0f)
+    {
+        e = std::max(e, (180.0f - angleBetwABandAC(p0, pU, pB)));
+        n++;
+    }
+    // the higher the energy, the less flat the area
+    if (n > 0.0f)
+        out.y() = e;
+
+    return out;
+}
+
+}  // namespace
+
+void cpu_depthSimMapCopyDepthOnly(HostMap<Vec2f>& out_depthSimMap, const HostMap<Vec2f>& in_depthSimMap, float defaultSim)
+{
+    const int width = int(out_depthSimMap.getWidth());
+    const int height = int(out_depthSimMap.getHeight());
+
+#pragma omp parallel for
+    for (int y = 0; y < height; ++y)
+    {
+        for (int x = 0; x < width; ++x)
+            out_depthSimMap(x, y) = Vec2f(in_depthSimMap(x, y).x(), defaultSim);
+    }
+}
+
+void cpu_depthThicknessSmoothThickness(HostMap<Vec2f>& inout_depthThicknessMap,
+                                       const SgmParams& sgmParams,
+                                       const RefineParams& refineParams,
+                                       const ROI& roi)
+{
+    const int sgmScaleStep = sgmParams.scale * sgmParams.stepXY;
+    const int refineScaleStep = refineParams.scale * refineParams.stepXY;
+
+    // min/max number of Refine samples in SGM thickness area
+    const float minNbRefineSamples = 2.f;
+    const float maxNbRefineSamples = std::max(sgmScaleStep / float(refineScaleStep), minNbRefineSamples);
+
+    // min/max SGM thickness inflate factor
+    const float minThicknessInflate = refineParams.halfNbDepths / maxNbRefineSamples;
+    const float maxThicknessInflate = refineParams.halfNbDepths / minNbRefineSamples;
+
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+
+    // neighbor thicknesses are read from a copy of the input map
+    // note: the device kernel updates the map in place, the result then depends on the thread scheduling
+    const HostMap<Vec2f> in_depthThicknessMap = inout_depthThicknessMap;
+
+#pragma omp parallel for
+    for (int roiY = 0; roiY < roiHeight; ++roiY)
+    {
+        for (int roiX = 0; roiX < roiWidth; ++roiX)
+        {
+            const Vec2f& in_depthThickness = in_depthThicknessMap(roiX, roiY);
+
+            // depth invalid or masked
+            if (in_depthThickness.x() <= 0.0f)
+                continue;
+
+            const float minThickness = minThicknessInflate * in_depthThickness.y();
+            const float maxThickness = maxThicknessInflate * in_depthThickness.y();
+
+            // compute average depth distance to the center pixel
+            float sumCenterDepthDist = 0.f;
+            int nbValidPatchPixels = 0;
+
+            // patch 3x3
+            for (int yp = -1; yp <= 1; ++yp)
+            {
+                for (int xp = -1; xp <= 1; ++xp)
+                {
+                    // compute patch coordinates
+                    const int roiXp = roiX + xp;
+                    const int roiYp = roiY + yp;
+
+                    if ((xp == 0 && yp == 0) ||                   // avoid pixel center
+                        roiXp < 0 || roiXp >= roiWidth ||         // avoid pixel outside the ROI
+                        roiYp < 0 || roiYp >= roiHeight)          // avoid pixel outside the ROI
+                    {
+                        continue;
+                    }
+
+                    // corresponding path depth/thickness
+                    const Vec2f& in_depthThicknessPatch = in_depthThicknessMap(roiXp, roiYp);
+
+                    // patch depth valid
+                    if (in_depthThicknessPatch.x() > 0.0f)
+                    {
+                        const float depthDistance = std::abs(in_depthThickness.x() - in_depthThicknessPatch.x());
+                        sumCenterDepthDist += std::max(minThickness, std::min(maxThickness, depthDistance));  // clamp (minThickness, maxThickness)
+                        ++nbValidPatchPixels;
+                    }
+                }
+            }
+
+            // we require at least 3 valid patch pixels (over 8)
+            if (nbValidPatchPixels < 3)
+                continue;
+
+            // write output smooth thickness
+            inout_depthThicknessMap(roiX, roiY).y() = sumCenterDepthDist / nbValidPatchPixels;
+        }
+    }
+}
+
+void cpu_computeSgmUpscaledDepthPixSizeMap(HostMap<Vec2f>& out_upscaledDepthPixSizeMap,
+                                           const HostMap<Vec2f>& in_sgmDepthThicknessMap,
+                                           const HostImage& rcImage,
+                                           const RefineParams& refineParams,
+                                           const ROI& roi)
+{
+    // compute upscale ratio
+    const float ratio = float(in_sgmDepthThicknessMap.getWidth()) / float(out_upscaledDepthPixSizeMap.getWidth());
+
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const int inWidth = int(in_sgmDepthThicknessMap.getWidth());
+    const int inHeight = int(in_sgmDepthThicknessMap.getHeight());
+    const float halfNbDepths = float(refineParams.halfNbDepths);
+
+#pragma omp parallel for
+    for (int roiY = 0; roiY < roiHeight; ++roiY)
+    {
+        for (int roiX = 0; roiX < roiWidth; ++roiX)
+        {
+            // corresponding image coordinates
+            const int x = (roi.x.begin + roiX) * refineParams.stepXY;
+            const int y = (roi.y.begin + roiY) * refineParams.stepXY;
+
+            // corresponding output upscaled depth/pixSize map
+            Vec2f& out_depthPixSize = out_upscaledDepthPixSizeMap(roiX, roiY);
+
+            const float oy = (float(roiY) - 0.5f) * ratio;
+            const float ox = (float(roiX) - 0.5f) * ratio;
+
+            Vec2f out_depthThickness;
+
+            if (refineParams.interpolateMiddleDepth)
+            {
+                // filter masked pixels with alpha
+                if (rcImage.sample(float(x), float(y)).a() < HOST_DEPTHMAP_RC_MIN_ALPHA)
+                {
+                    out_depthPixSize = Vec2f(-2.f, 0.f);
+                    continue;
+                }
+
+                // find adjacent pixels
+                const int xp = std::max(0, std::min(int(std::floor(ox)), std::min(int(roiWidth * ratio), inWidth) - 2));
+                const int yp = std::max(0, std::min(int(std::floor(oy)), std::min(int(roiHeight * ratio), inHeight) - 2));
+
+                const Vec2f& lu = in_sgmDepthThicknessMap(xp, yp);
+                const Vec2f& ru = in_sgmDepthThicknessMap(xp + 1, yp);
+                const Vec2f& rd = in_sgmDepthThicknessMap(xp + 1, yp + 1);
+                const Vec2f& ld = in_sgmDepthThicknessMap(xp, yp + 1);
+
+                if (lu.x() <= 0.0f || ru.x() <= 0.0f || rd.x() <= 0.0f || ld.x() <= 0.0f)
+                {
+                    // at least one corner depth is invalid
+                    // average the other corners to get a proper depth/thickness
+                    Vec2f sumDepthThickness(0.0f, 0.0f);
+                    int count = 0;
+
+                    for (const Vec2f* corner : {&lu, &ru, &rd, &ld})
+                    {
+                        if (corner->x() > 0.0f)
+                        {
+                            sumDepthThickness += *corner;
+                            ++count;
+                        }
+                    }
+
+                    if (count == 0)
+                    {
+                        // invalid depth
+                        out_depthPixSize = Vec2f(-1.0f, 1.0f);
+                        continue;
+                    }
+
+                    out_depthThickness = sumDepthThickness / float(count);
+                }
+                else
+                {
+                    // bilinear interpolation
+                    const float ui = ox - float(xp);
+                    const float vi = oy - float(yp);
+                    const Vec2f u = lu + (ru - lu) * ui;
+                    const Vec2f d = ld + (rd - ld) * ui;
+                    out_depthThickness = u + (d - u) * vi;
+                }
+            }
+            else
+            {
+                // filter masked pixels
+                // note: same threshold as the device nearest neighbor kernel
+                if (rcImage.sample(float(x), float(y)).a() < 0.9f)
+                {
+                    out_depthPixSize = Vec2f(-2.f, 0.f);
+                    continue;
+                }
+
+                // find corresponding depth/thickness
+                // nearest neighbor, no interpolation
+                const int xp = std::max(0, std::min(int(std::floor(ox + 0.5f)), std::min(int(roiWidth * ratio), inWidth) - 1));
+                const int yp = std::max(0, std::min(int(std::floor(oy + 0.5f)), std::min(int(roiHeight * ratio), inHeight) - 1));
+
+                out_depthThickness = in_sgmDepthThicknessMap(xp, yp);
+            }
+
+            // write output depth/pixSize, pixSize is computed from depth thickness
+            out_depthPixSize = Vec2f(out_depthThickness.x(), out_depthThickness.y() / halfNbDepths);
+        }
+    }
+}
+
+void cpu_depthSimMapOptimizeGradientDescent(HostMap<Vec2f>& out_optimizeDepthSimMap,
+                                            const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                                            const HostMap<Vec2f>& in_refineDepthSimMap,
+                                            const HostCameraParams& rcCamParams,
+                                            const HostImage& rcImage,
+                                            const RefineParams& refineParams,
+                                            const ROI& roi)
+{
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const Vec2f offsetRoi(float(roi.x.begin), float(roi.y.begin));
+
+    // initialize depth/sim map optimized with SGM depth/pixSize map
+    out_optimizeDepthSimMap = in_sgmDepthPixSizeMap;
+
+    // compute image gradient size of L
+    HostMap<float> imgVarianceMap(roiWidth, roiHeight);
+
+#pragma omp parallel for
+    for (int roiY = 0; roiY < roiHeight; ++roiY)
+    {
+        for (int roiX = 0; roiX < roiWidth; ++roiX)
+        {
+            // corresponding image coordinates
+            const float x = float(roi.x.begin + roiX) * float(refineParams.stepXY);
+            const float y = float(roi.y.begin + roiY) * float(refineParams.stepXY);
+
+            const float xM1 = rcImage.sample(x - 1.f, y).r();
+            const float xP1 = rcImage.sample(x + 1.f, y).r();
+            const float yM1 = rcImage.sample(x, y - 1.f).r();
+            const float yP1 = rcImage.sample(x, y + 1.f).r();
+
+            imgVarianceMap(roiX, roiY) = Vec2f(xM1 - xP1, yM1 - yP1).norm();
+        }
+    }
+
+    HostMap<float> tmpOptDepthMap(roiWidth, roiHeight);
+
+    for (int iter = 0; iter < refineParams.optimizationNbIterations; ++iter)  // default nb iterations is 100
+    {
+        // copy depths values from the optimized depth/sim map
+#pragma omp parallel for
+        for (int roiY = 0; roiY < roiHeight; ++roiY)
+        {
+            for (int roiX = 0; roiX < roiWidth; ++roiX)
+                tmpOptDepthMap(roiX, roiY) = out_optimizeDepthSimMap(roiX, roiY).x();
+        }
+
+        // adjust depth/sim by using previously computed depths
+#pragma omp parallel for
+        for (int roiY = 0; roiY < roiHeight; ++roiY)
+        {
+            for (int roiX = 0; roiX < roiWidth; ++roiX)
+            {
+                // SGM upscale (rough) depth/pixSize
+                const float sgmDepth = in_sgmDepthPixSizeMap(roiX, roiY).x();
+                const float sgmPixSize = in_sgmDepthPixSizeMap(roiX, roiY).y();
+
+                // refined and fused (fine) depth/sim
+                const float refineDepth = in_refineDepthSimMap(roiX, roiY).x();
+                const float refineSim = in_refineDepthSimMap(roiX, roiY).y();
+
+                // output optimized depth/sim
+                Vec2f& out_optDepthSim = out_optimizeDepthSimMap(roiX, roiY);
+
+                if (iter == 0)
+                    out_optDepthSim = Vec2f(sgmDepth, refineSim);
+
+                const float depthOpt = out_optDepthSim.x();
+
+                if (depthOpt <= 0.0f)
+                    continue;
+
+                const Vec2f depthSmoothStepEnergy = getCellSmoothStepEnergy(rcCamParams, tmpOptDepthMap, roiX, roiY, offsetRoi);  // (smoothStep, energy)
+                float stepToSmoothDepth = depthSmoothStepEnergy.x();
+                stepToSmoothDepth = std::copysign(std::min(std::abs(stepToSmoothDepth), sgmPixSize / 10.0f), stepToSmoothDepth);
+                const float depthEnergy = depthSmoothStepEnergy.y();  // max angle with neighbors
+                float stepToFineDM = refineDepth - depthOpt;           // distance to refined/noisy input depth map
+                stepToFineDM = std::copysign(std::min(std::abs(stepToFineDM), sgmPixSize / 10.0f), stepToFineDM);
+
+                const float stepToRoughDM = sgmDepth - depthOpt;  // distance to smooth/robust input depth map
+                const float imgColorVariance = imgVarianceMap(roiX, roiY);
+                const float colorVarianceThresholdForSmoothing = 20.0f;
+                const float angleThresholdForSmoothing = 30.0f;
+
+                const float weightedColorVariance =
+                  sigmoid2(5.0f, angleThresholdForSmoothing, 40.0f, colorVarianceThresholdForSmoothing, imgColorVariance);
+                const float fineSimWeight = sigmoid(0.0f, 1.0f, 0.7f, -0.7f, refineSim);
+
+                // if geometry variation is bigger than color variation => the fineDM is considered noisy
+                const float energyLowerThanVarianceWeight = sigmoid(0.0f, 1.0f, 30.0f, weightedColorVariance, depthEnergy);
+                const float closeToRoughWeight = 1.0f - sigmoid(0.0f, 1.0f, 10.0f, 17.0f, std::abs(stepToRoughDM / sgmPixSize));
+
+                // f(z) = c1 * s1(z_rought - z)^2 + c2 * s2(z-z_fused)^2 + coeff3 * s3*(z-z_smooth)^2
+                const float depthOptStep = closeToRoughWeight * stepToRoughDM +  // distance to smooth/robust input depth map
+                                           (1.0f - closeToRoughWeight) *
+                                             (energyLowerThanVarianceWeight * fineSimWeight * stepToFineDM +  // distance to refined/noisy
+                                              (1.0f - energyLowerThanVarianceWeight) * stepToSmoothDepth);    // max angle in current depthMap
+
+                out_optDepthSim.x() = depthOpt + depthOptStep;
+                out_optDepthSim.y() = (1.0f - closeToRoughWeight) * (energyLowerThanVarianceWeight * fineSimWeight * refineSim +
+                                                                     (1.0f - energyLowerThanVarianceWeight) * (depthEnergy / 20.0f));
+            }
+        }
+    }
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,73 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/mvsData/ROI.hpp>
+#include <aliceVision/depthMap/SgmParams.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCameraParams.hpp>
+#include <aliceVision/depthMap/cpu/host/HostImage.hpp>
+
+namespace aliceVision {
+namespace depthMap {
+
+/**
+ * @brief Copy depth and default from input depth/sim map to another depth/sim map.
+ * @param[out] out_depthSimMap the output depth/sim map
+ * @param[in] in_depthSimMap the input depth/sim map to copy
+ * @param[in] defaultSim the default similarity value to copy
+ */
+void cpu_depthSimMapCopyDepthOnly(HostMap<Vec2f>& out_depthSimMap, const HostMap<Vec2f>& in_depthSimMap, float defaultSim);
+
+/**
+ * @brief Smooth thickness map with adjacent pixels.
+ * @param[in,out] inout_depthThicknessMap the depth/thickness map
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] refineParams the Refine parameters
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_depthThicknessSmoothThickness(HostMap<Vec2f>& inout_depthThicknessMap,
+                                       const SgmParams& sgmParams,
+                                       const RefineParams& refineParams,
+                                       const ROI& roi);
+
+/**
+ * @brief Upscale the given SGM depth/thickness map, filter masked pixels and compute pixSize from thickness.
+ * @param[out] out_upscaledDepthPixSizeMap the output upscaled depth/pixSize map
+ * @param[in] in_sgmDepthThicknessMap the input SGM depth/thickness map
+ * @param[in] rcImage the R camera image at Refine downscale
+ * @param[in] refineParams the Refine parameters
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_computeSgmUpscaledDepthPixSizeMap(HostMap<Vec2f>& out_upscaledDepthPixSizeMap,
+                                           const HostMap<Vec2f>& in_sgmDepthThicknessMap,
+                                           const HostImage& rcImage,
+                                           const RefineParams& refineParams,
+                                           const ROI& roi);
+
+/**
+ * @brief Optimize a depth/sim map with the refineFused depth/sim map and the SGM depth/pixSize map.
+ * @param[out] out_optimizeDepthSimMap the output optimized depth/sim map
+ * @param[in] in_sgmDepthPixSizeMap the input SGM upscaled depth/pixSize map
+ * @param[in] in_refineDepthSimMap the input refined and fused depth/sim map
+ * @param[in] rcCamParams the R camera parameters at Refine downscale
+ * @param[in] rcImage the R camera image at Refine downscale
+ * @param[in] refineParams the Refine parameters
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_depthSimMapOptimizeGradientDescent(HostMap<Vec2f>& out_optimizeDepthSimMap,
+                                            const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                                            const HostMap<Vec2f>& in_refineDepthSimMap,
+                                            const HostCameraParams& rcCamParams,
+                                            const HostImage& rcImage,
+                                            const RefineParams& refineParams,
+                                            const ROI& roi);
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,253 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCameraParams.hpp>
+#include <aliceVision/depthMap/cpu/host/HostImage.hpp>
+
+#include <cmath>
+#include <limits>
+
+namespace aliceVision {
+namespace depthMap {
+
+// host-side versions of the device helpers used by the plane sweeping kernels
+// see: cuda/device/Patch.cuh, cuda/device/SimStat.cuh, cuda/device/color.cuh
+
+constexpr float HOST_DEPTHMAP_RC_MIN_ALPHA = 255.f * 0.9f;  // image range (0, 255)
+constexpr float HOST_DEPTHMAP_TC_MIN_ALPHA = 255.f * 0.4f;  // image range (0, 255)
+
+struct HostPatch
+{
+    Vec3f p;  //< 3d point
+    Vec3f n;  //< normal
+    Vec3f x;  //< x axis
+    Vec3f y;  //< y axis
+    float d;  //< pixel size
+};
+
+inline Vec2f project3DPoint(const HostCameraParams& camParams, const Vec3f& p)
+{
+    const Vec3f pp = camParams.P.block<3, 3>(0, 0) * p + camParams.P.col(3);
+    const float pzInv = 1.0f / pp.z();
+    return Vec2f(pp.x() * pzInv, pp.y() * pzInv);
+}
+
+inline Vec3f pixelRay(const HostCameraParams& camParams, const Vec2f& pix)
+{
+    return (camParams.iP * Vec3f(pix.x(), pix.y(), 1.f)).normalized();
+}
+
+inline float computePixSize(const HostCameraParams& camParams, const Vec3f& p)
+{
+    const Vec2f rp1 = project3DPoint(camParams, p) + Vec2f(1.f, 0.f);
+    const Vec3f refvect = pixelRay(camParams, rp1);
+    return refvect.cross(camParams.C - p).norm();
+}
+
+inline Vec3f linePlaneIntersect(const Vec3f& linePoint, const Vec3f& lineVect, const Vec3f& planePoint, const Vec3f& planeNormal)
+{
+    const float k = (planePoint.dot(planeNormal) - planeNormal.dot(linePoint)) / planeNormal.dot(lineVect);
+    return linePoint + lineVect * k;
+}
+
+inline Vec3f get3DPointForPixelAndFrontoParellePlaneRC(const HostCameraParams& camParams, const Vec2f& pix, float fpPlaneDepth)
+{
+    const Vec3f planep = camParams.C + camParams.ZVect * fpPlaneDepth;
+    return linePlaneIntersect(camParams.C, pixelRay(camParams, pix), planep, camParams.ZVect);
+}
+
+inline Vec3f get3DPointForPixelAndDepthFromRC(const HostCameraParams& camParams, const Vec2f& pix, float depth)
+{
+    return camParams.C + pixelRay(camParams, pix) * depth;
+}
+
+inline float depthPlaneToDepth(const HostCameraParams& camParams, float fpPlaneDepth, const Vec2f& pix)
+{
+    return (camParams.C - get3DPointForPixelAndFrontoParellePlaneRC(camParams, pix, fpPlaneDepth)).norm();
+}
+
+inline void computeRotCSEpip(HostPatch& patch, const HostCameraParams& rcCamParams, const HostCameraParams& tcCamParams)
+{
+    // vector from the reference camera to the 3d point
+    const Vec3f v1 = (rcCamParams.C - patch.p).normalized();
+    // vector from the target camera to the 3d point
+    const Vec3f v2 = (tcCamParams.C - patch.p).normalized();
+
+    // y has to be ortogonal to the epipolar plane
+    // n has to be on the epipolar plane
+    // x has to be on the epipolar plane
+    patch.y = v1.cross(v2).normalized();
+    patch.n = ((v1 + v2) / 2.0f).normalized();
+    patch.x = patch.y.cross(patch.n).normalized();
+}
+
+/**
+ * @brief Sigmoid function filtering
+ * @note f(x) = min + (max-min) * \frac{1}{1 + e^{10 * (x - mid) / width}}
+ */
+inline float sigmoid(float zeroVal, float endVal, float sigwidth, float sigMid, float xval)
+{
+    return zeroVal + (endVal - zeroVal) * (1.0f / (1.0f + std::exp(10.0f * ((xval - sigMid) / sigwidth))));
+}
+
+/**
+ * @brief Sigmoid function filtering
+ * @note f(x) = min + (max-min) * \frac{1}{1 + e^{10 * (mid - x) / width}}
+ */
+inline float sigmoid2(float zeroVal, float endVal, float sigwidth, float sigMid, float xval)
+{
+    return zeroVal + (endVal - zeroVal) * (1.0f / (1.0f + std::exp(10.0f * ((sigMid - xval) / sigwidth))));
+}
+
+inline float euclideanDist3(const image::RGBAfColor& c1, const image::RGBAfColor& c2)
+{
+    return (c1.head<3>() - c2.head<3>()).norm();
+}
+
+/**
+ * @brief Yoon & Kweon support weight from CIELAB color and patch position.
+ */
+inline float CostYKfromLab(int dx, int dy, const image::RGBAfColor& c1, const image::RGBAfColor& c2, float invGammaC, float invGammaP)
+{
+    const float deltaC = euclideanDist3(c1, c2) * invGammaC;
+    const float deltaP = std::sqrt(float(dx * dx + dy * dy)) * invGammaP;
+    return std::exp(-(deltaC + deltaP));
+}
+
+/**
+ * @struct HostSimStat
+ * @brief Weighted Normalized Cross-Correlation accumulator.
+ */
+struct HostSimStat
+{
+    float xsum = 0.f;
+    float ysum = 0.f;
+    float xxsum = 0.f;
+    float yysum = 0.f;
+    float xysum = 0.f;
+    float wsum = 0.f;
+
+    inline void update(float gx, float gy, float w)
+    {
+        wsum += w;
+        xsum += w * gx;
+        ysum += w * gy;
+        xxsum += w * gx * gx;
+        yysum += w * gy * gy;
+        xysum += w * gx * gy;
+    }
+
+    /**
+     * @brief Compute Normalized Cross-Correlation.
+     * @return similarity value in range (-1, 0) or 1 if infinity
+     */
+    inline float computeWSim() const
+    {
+        const float varXW = (xxsum - xsum * xsum / wsum) / wsum;
+        const float varYW = (yysum - ysum * ysum / wsum) / wsum;
+        const float varXYW = (xysum - xsum * ysum / wsum) / wsum;
+        const float rawSim = varXYW / std::sqrt(varXW * varYW);
+        return std::isfinite(rawSim) ? -rawSim : 1.0f;
+    }
+};
+
+/**
+ * @brief Compute Normalized Cross-Correlation of a full square patch at given half-width.
+ *
+ * @tparam TInvertAndFilter invert and filter output similarity value
+ *
+ * @param[in] rcCamParams the R camera parameters
+ * @param[in] tcCamParams the T camera parameters
+ * @param[in] rcImage the R camera image at the workflow downscale
+ * @param[in] tcImage the T camera image at the workflow downscale
+ * @param[in] wsh the half-width of the patch
+ * @param[in] invGammaC the inverted strength of grouping by color similarity
+ * @param[in] invGammaP the inverted strength of grouping by proximity
+ * @param[in] patch the input patch struct
+ *
+ * @return similarity value in range (-1.f, 0.f) or (0.f, 1.f) if TinvertAndFilter enabled
+ *         special cases:
+ *          -> infinite similarity value: 1
+ *          -> invalid/uninitialized/masked similarity: infinity
+ */
+template<bool TInvertAndFilter>
+inline float compNCCby3DptsYK(const HostCameraParams& rcCamParams,
+                              const HostCameraParams& tcCamParams,
+                              const HostImage& rcImage,
+                              const HostImage& tcImage,
+                              int wsh,
+                              float invGammaC,
+                              float invGammaP,
+                              const HostPatch& patch)
+{
+    constexpr float inf = std::numeric_limits<float>::infinity();
+
+    // get R and T image 2d coordinates from patch center 3d point
+    const Vec2f rp = project3DPoint(rcCamParams, patch.p);
+    const Vec2f tp = project3DPoint(tcCamParams, patch.p);
+
+    // image 2d coordinates margin
+    const float dd = wsh + 2.0f;
+
+    // check R and T image 2d coordinates
+    if ((rp.x() < dd) || (rp.x() > float(rcImage.getWidth() - 1) - dd) || (tp.x() < dd) || (tp.x() > float(tcImage.getWidth() - 1) - dd) ||
+        (rp.y() < dd) || (rp.y() > float(rcImage.getHeight() - 1) - dd) || (tp.y() < dd) || (tp.y() > float(tcImage.getHeight() - 1) - dd))
+    {
+        return inf;  // uninitialized
+    }
+
+    // compute patch center color (CIELAB)
+    const image::RGBAfColor rcCenterColor = rcImage.sample(rp.x(), rp.y());
+    const image::RGBAfColor tcCenterColor = tcImage.sample(tp.x(), tp.y());
+
+    // check the alpha values of the patch pixel center of the R and T cameras
+    if (rcCenterColor.a() < HOST_DEPTHMAP_RC_MIN_ALPHA || tcCenterColor.a() < HOST_DEPTHMAP_TC_MIN_ALPHA)
+    {
+        return inf;  // masked
+    }
+
+    HostSimStat sst;
+
+    // compute patch (wsh*2+1)x(wsh*2+1)
+    for (int yp = -wsh; yp <= wsh; ++yp)
+    {
+        for (int xp = -wsh; xp <= wsh; ++xp)
+        {
+            // get 3d point
+            const Vec3f p = patch.p + patch.x * (patch.d * float(xp)) + patch.y * (patch.d * float(yp));
+
+            // get R and T image 2d coordinates from 3d point
+            const Vec2f rpc = project3DPoint(rcCamParams, p);
+            const Vec2f tpc = project3DPoint(tcCamParams, p);
+
+            // get R and T image color (CIELAB) from 2d coordinates
+            const image::RGBAfColor rcPatchCoordColor = rcImage.sample(rpc.x(), rpc.y());
+            const image::RGBAfColor tcPatchCoordColor = tcImage.sample(tpc.x(), tpc.y());
+
+            // weighting based on color difference and distance to the center pixel of the patch
+            const float w = CostYKfromLab(xp, yp, rcCenterColor, rcPatchCoordColor, invGammaC, invGammaP) *
+                            CostYKfromLab(xp, yp, tcCenterColor, tcPatchCoordColor, invGammaC, invGammaP);
+
+            sst.update(rcPatchCoordColor.r(), tcPatchCoordColor.r(), w);
+        }
+    }
+
+    if (TInvertAndFilter)
+    {
+        // invert and filter similarity
+        // best similarity value was -1, worst was 0
+        // best similarity value is 1, worst is still 0
+        return sigmoid(0.0f, 1.0f, 0.7f, -0.7f, sst.computeWSim());
+    }
+
+    return sst.computeWSim();
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
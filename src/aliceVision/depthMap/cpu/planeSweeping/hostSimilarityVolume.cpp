@@ -0,0 +1,481 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "hostSimilarityVolume.hpp"
+
+#include <aliceVision/depthMap/cpu/planeSweeping/hostPatch.hpp>
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <limits>
+#include <map>
+
+namespace aliceVision {
+namespace depthMap {
+
+void cpu_volumeInitialize(HostVolume<TSimHost>& inout_volume, TSimHost value) { inout_volume.fill(value); }
+
+void cpu_volumeInitialize(HostVolume<TSimRefineHost>& inout_volume, TSimRefineHost value) { inout_volume.fill(value); }
+
+void cpu_volumeUpdateUninitializedSimilarity(const HostVolume<TSimHost>& in_volBestSim, HostVolume<TSimHost>& inout_volSecBestSim)
+{
+    const int volDimX = int(inout_volSecBestSim.getDimX());
+    const int volDimY = int(inout_volSecBestSim.getDimY());
+    const int volDimZ = int(inout_volSecBestSim.getDimZ());
+
+#pragma omp parallel for
+    for (int vy = 0; vy < volDimY; ++vy)
+    {
+        for (int vx = 0; vx < volDimX; ++vx)
+        {
+            const TSimHost* bestSim = in_volBestSim.column(vx, vy);
+            TSimHost* secBestSim = inout_volSecBestSim.column(vx, vy);
+
+#pragma omp simd
+            for (int vz = 0; vz < volDimZ; ++vz)
+            {
+                // invalid or uninitialized similarity value
+                // update second best similarity value with first best similarity value
+                secBestSim[vz] = (secBestSim[vz] >= 255) ? bestSim[vz] : secBestSim[vz];
+            }
+        }
+    }
+}
+
+void cpu_volumeComputeSimilarity(HostVolume<TSimHost>& out_volBestSim,
+                                 HostVolume<TSimHost>& out_volSecBestSim,
+                                 const std::vector<float>& in_depths,
+                                 const HostCameraParams& rcCamParams,
+                                 const HostCameraParams& tcCamParams,
+                                 const HostImage& rcImage,
+                                 const HostImage& tcImage,
+                                 const SgmParams& sgmParams,
+                                 const Range& depthRange,
+                                 const ROI& roi)
+{
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const int nbDepths = int(depthRange.size());
+    const float invGammaC = 1.f / float(sgmParams.gammaC);
+    const float invGammaP = 1.f / float(sgmParams.gammaP);
+
+    // we do not need positive and filtered similarity values
+    constexpr bool invertAndFilter = false;
+
+#pragma omp parallel for collapse(2) schedule(dynamic)
+    for (int roiZ = 0; roiZ < nbDepths; ++roiZ)
+    {
+        for (int vy = 0; vy < roiHeight; ++vy)
+        {
+            const int vz = int(depthRange.begin) + roiZ;
+
+            // corresponding depth plane
+            const float depthPlane = in_depths[vz];
+
+            for (int vx = 0; vx < roiWidth; ++vx)
+            {
+                // corresponding image coordinates
+                const Vec2f pix(float(roi.x.begin + vx) * float(sgmParams.stepXY), float(roi.y.begin + vy) * float(sgmParams.stepXY));
+
+                // compute patch
+                HostPatch patch;
+                patch.p = get3DPointForPixelAndFrontoParellePlaneRC(rcCamParams, pix, depthPlane);
+                patch.d = computePixSize(rcCamParams, patch.p);
+                computeRotCSEpip(patch, rcCamParams, tcCamParams);
+
+                // compute patch similarity
+                float fsim = compNCCby3DptsYK<invertAndFilter>(
+                  rcCamParams, tcCamParams, rcImage, tcImage, sgmParams.wsh, invGammaC, invGammaP, patch);
+
+                if (fsim == std::numeric_limits<float>::infinity())  // invalid similarity
+                {
+                    fsim = 255.0f;  // 255 is the invalid similarity value
+                }
+                else  // valid similarity
+                {
+                    // remap similarity value from (-1, 1) to (0, 1)
+                    fsim = std::min(1.0f, std::max(0.0f, (fsim + 1.0f) * 0.5f));
+
+                    // convert from (0, 1) to (0, 254)
+                    // 255 is reserved for the similarity initialization, i.e. undefined values
+                    fsim *= 254.0f;
+                }
+
+                TSimHost& fsim_1st = out_volBestSim(vx, vy, vz);
+                TSimHost& fsim_2nd = out_volSecBestSim(vx, vy, vz);
+
+                if (fsim < fsim_1st)
+                {
+                    fsim_2nd = fsim_1st;
+                    fsim_1st = TSimHost(fsim);
+                }
+                else if (fsim < fsim_2nd)
+                {
+                    fsim_2nd = TSimHost(fsim);
+                }
+            }
+        }
+    }
+}
+
+void cpu_volumeRefineSimilarity(HostVolume<TSimRefineHost>& inout_volSim,
+                                const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                                const HostCameraParams& rcCamParams,
+                                const HostCameraParams& tcCamParams,
+                                const HostImage& rcImage,
+                                const HostImage& tcImage,
+                                const RefineParams& refineParams,
+                                const Range& depthRange,
+                                const ROI& roi)
+{
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const int nbDepths = int(depthRange.size());
+    const int volDimZ = int(inout_volSim.getDimZ());
+    const float invGammaC = 1.f / float(refineParams.gammaC);
+    const float invGammaP = 1.f / float(refineParams.gammaP);
+
+    // we need positive and filtered similarity values
+    constexpr bool invertAndFilter = true;
+
+#pragma omp parallel for collapse(2) schedule(dynamic)
+    for (int roiZ = 0; roiZ < nbDepths; ++roiZ)
+    {
+        for (int vy = 0; vy < roiHeight; ++vy)
+        {
+            const int vz = int(depthRange.begin) + roiZ;
+
+            // compute relative depth index offset from z center
+            const int relativeDepthIndexOffset = vz - ((volDimZ - 1) / 2);
+
+            for (int vx = 0; vx < roiWidth; ++vx)
+            {
+                // corresponding input sgm depth/pixSize (middle depth)
+                const Vec2f& sgmDepthPixSize = in_sgmDepthPixSizeMap(vx, vy);
+
+                // sgm depth (middle depth) invalid or masked
+                if (sgmDepthPixSize.x() <= 0.0f)
+                    continue;
+
+                // corresponding image coordinates
+                const Vec2f pix(float(roi.x.begin + vx) * float(refineParams.stepXY), float(roi.y.begin + vy) * float(refineParams.stepXY));
+
+                // initialize rc 3d point at sgm depth (middle depth)
+                Vec3f p = get3DPointForPixelAndDepthFromRC(rcCamParams, pix, sgmDepthPixSize.x());
+
+                // move rc 3d point by relative depth index offset * sgm pixSize
+                if (relativeDepthIndexOffset != 0)
+                    p += (p - rcCamParams.C).normalized() * (relativeDepthIndexOffset * sgmDepthPixSize.y());
+
+                // compute patch
+                HostPatch patch;
+                patch.p = p;
+                patch.d = computePixSize(rcCamParams, p);
+                computeRotCSEpip(patch, rcCamParams, tcCamParams);
+
+                // compute similarity
+                const float fsimInvertedFiltered = compNCCby3DptsYK<invertAndFilter>(
+                  rcCamParams, tcCamParams, rcImage, tcImage, refineParams.wsh, invGammaC, invGammaP, patch);
+
+                if (fsimInvertedFiltered == std::numeric_limits<float>::infinity())  // invalid similarity
+                    continue;
+
+                // add the output similarity value
+                inout_volSim(vx, vy, vz) += TSimRefineHost(fsimInvertedFiltered);
+            }
+        }
+    }
+}
+
+void cpu_volumeOptimize(HostVolume<TSimHost>& out_volSimFiltered,
+                        const HostVolume<TSimHost>& in_volSim,
+                        const HostImage& rcImage,
+                        const SgmParams& sgmParams,
+                        int lastDepthIndex,
+                        const ROI& roi)
+{
+    // volume dimensions, override volume depth with the rc depth list last index
+    const std::array<int, 3> volDim = {int(in_volSim.getDimX()), int(in_volSim.getDimY()), lastDepthIndex};
+    const int volDimZ = lastDepthIndex;
+
+    const float P1 = float(sgmParams.p1);
+    const float step = float(sgmParams.stepXY);
+
+    // aggregate a single path into the output volume
+    // note: same traversal and rounding as the device implementation (see cuda_volumeAggregatePath)
+    const auto aggregatePath = [&](const std::array<int, 3>& axisT, bool invY, int filteringIndex) {
+        const int volDimX = volDim[axisT[0]];
+        const int volDimY = volDim[axisT[1]];
+        const int ySign = (invY ? -1 : 1);
+
+        // each line along the path axis is independent
+#pragma omp parallel for schedule(static)
+        for (int x = 0; x < volDimX; ++x)
+        {
+            std::vector<TSimAccHost> xzSliceForY(volDimZ);    // Y slice
+            std::vector<TSimAccHost> xzSliceForYm1(volDimZ);  // Y-1 slice
+
+            // get volume (vx, vy) coordinates from slice (x, y) coordinates
+            const auto getVolumeXY = [&](int y, int& vx, int& vy) {
+                std::array<int, 2> v;
+                v[axisT[0]] = x;
+                v[axisT[1]] = y;
+                vx = v[0];
+                vy = v[1];
+            };
+
+            int vx, vy;
+
+            // copy the first XZ plane (at Y=0) and set the first output Z column to 255
+            {
+                getVolumeXY(0, vx, vy);
+                const TSimHost* inCol = in_volSim.column(vx, vy);
+                TSimHost* outCol = out_volSimFiltered.column(vx, vy);
+
+                for (int z = 0; z < volDimZ; ++z)
+                {
+                    xzSliceForYm1[z] = TSimAccHost(inCol[z]);
+                    outCol[z] = 255;
+                }
+            }
+
+            for (int iy = 1; iy < volDimY; ++iy)
+            {
+                const int y = invY ? volDimY - 1 - iy : iy;
+
+                getVolumeXY(y, vx, vy);
+
+                // compute the best score of the previous slice column
+                const TSimAccHost bestCostInColM1 = *std::min_element(xzSliceForYm1.begin(), xzSliceForYm1.end());
+
+                // copy the current column from the input volume
+                const TSimHost* inCol = in_volSim.column(vx, vy);
+                for (int z = 0; z < volDimZ; ++z)
+                    xzSliceForY[z] = TSimAccHost(inCol[z]);
+
+                // compute P2, constant for all the depths of the current column
+                float P2 = 0;
+
+                if (sgmParams.p2Weighting < 0)
+                {
+                    // P2 convention: use negative value to skip the use of deltaC.
+                    P2 = std::abs(float(sgmParams.p2Weighting));
+                }
+                else
+                {
+                    const int imX0 = int((roi.x.begin + vx) * step);  // current
+                    const int imY0 = int((roi.y.begin + vy) * step);
+                    const int imX1 = imX0 - int(ySign * step * (axisT[1] == 0));  // M1
+                    const int imY1 = imY0 - int(ySign * step * (axisT[1] == 1));
+
+                    const float deltaC = euclideanDist3(rcImage.sample(float(imX0), float(imY0)), rcImage.sample(float(imX1), float(imY1)));
+
+                    // sigmoid f(x) = i + (a - i) * (1 / ( 1 + e^(10 * (x - P2) / w)))
+                    // best values found from tests: i = 80, a = 255, w = 80, P2 = 100
+                    P2 = sigmoid(80.f, 255.f, 80.f, float(sgmParams.p2Weighting), deltaC);
+                }
+
+                const float bestCostP2 = float(bestCostInColM1) + P2;
+                TSimHost* outCol = out_volSimFiltered.column(vx, vy);
+
+                const auto aggregate = [&](int z, float pathCost) {
+                    // fill the current slice with the new similarity score
+                    xzSliceForY[z] = TSimAccHost(pathCost);
+
+                    // clamp (TSim = uchar)
+                    pathCost = std::min(255.0f, std::max(0.0f, pathCost));
+
+                    // aggregate into the final output
+                    outCol[z] = TSimHost((float(outCol[z]) * float(filteringIndex) + pathCost) / float(filteringIndex + 1));
+                };
+
+                // first and last depths are not aggregated
+                aggregate(0, 255.0f);
+
+#pragma omp simd
+                for (int z = 1; z < volDimZ - 1; ++z)
+                {
+                    const float pathCostMDM1 = float(xzSliceForYm1[z - 1]);  // M1: minus 1 over depths
+                    const float pathCostMD = float(xzSliceForYm1[z]);
+                    const float pathCostMDP1 = float(xzSliceForYm1[z + 1]);  // P1: plus 1 over depths
+                    const float minCost = std::min(std::min(pathCostMD, pathCostMDM1 + P1), std::min(pathCostMDP1 + P1, bestCostP2));
+
+                    // if 'pathCostMD' is the minimal value of the depth
+                    aggregate(z, float(xzSliceForY[z]) + minCost - float(bestCostInColM1));
+                }
+
+                if (volDimZ > 1)
+                    aggregate(volDimZ - 1, 255.0f);
+
+                std::swap(xzSliceForYm1, xzSliceForY);
+            }
+        }
+    };
+
+    // filtering is done on the last axis
+    const std::map<char, std::array<int, 3>> mapAxes = {
+      {'X', {1, 0, 2}},  // XYZ -> YXZ
+      {'Y', {0, 1, 2}},  // XYZ
+    };
+
+    int npaths = 0;
+    for (char axis : sgmParams.filteringAxes)
+    {
+        const std::array<int, 3>& axisT = mapAxes.at(axis);
+        aggregatePath(axisT, false, npaths++);  // without transpose
+        aggregatePath(axisT, true, npaths++);   // with transpose of the last axis
+    }
+}
+
+void cpu_volumeRetrieveBestDepth(HostMap<Vec2f>& out_sgmDepthThicknessMap,
+                                 HostMap<Vec2f>& out_sgmDepthSimMap,
+                                 const std::vector<float>& in_depths,
+                                 const HostVolume<TSimHost>& in_volSim,
+                                 const HostCameraParams& rcCamParams,
+                                 const SgmParams& sgmParams,
+                                 const Range& depthRange,
+                                 const ROI& roi)
+{
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const int volDimZ = int(in_volSim.getDimZ());
+    const int scaleStep = sgmParams.scale * sgmParams.stepXY;
+    const float thicknessMultFactor = 1.f + float(sgmParams.depthThicknessInflate);
+    const float maxSimilarity = float(sgmParams.maxSimilarity) * 254.f;  // convert from (0, 1) to (0, 254)
+    const bool computeDepthSimMap = !out_sgmDepthSimMap.isEmpty();
+
+#pragma omp parallel for
+    for (int vy = 0; vy < roiHeight; ++vy)
+    {
+        for (int vx = 0; vx < roiWidth; ++vx)
+        {
+            // corresponding image coordinates
+            const Vec2f pix(float((roi.x.begin + vx) * scaleStep), float((roi.y.begin + vy) * scaleStep));
+
+            // find the best depth plane index for the current pixel
+            // - best possible similarity value is 0
+            // - worst possible similarity value is 254
+            // - invalid similarity value is 255
+            const TSimHost* simCol = in_volSim.column(vx, vy);
+            float bestSim = 255.f;
+            int bestZIdx = -1;
+
+            for (int vz = int(depthRange.begin); vz < int(depthRange.end); ++vz)
+            {
+                if (simCol[vz] < bestSim)
+                {
+                    bestSim = simCol[vz];
+                    bestZIdx = vz;
+                }
+            }
+
+            Vec2f& out_depthThickness = out_sgmDepthThicknessMap(vx, vy);
+
+            // filtering out invalid values and values with a too bad score
+            if ((bestZIdx == -1) || (bestSim > maxSimilarity))
+            {
+                out_depthThickness = Vec2f(-1.f, -1.f);  // invalid depth / thickness
+
+                if (computeDepthSimMap)
+                    out_sgmDepthSimMap(vx, vy) = Vec2f(-1.f, 1.f);  // invalid depth, worst similarity value
+
+                continue;
+            }
+
+            // find best depth plane previous and next indexes
+            const int bestZIdx_m1 = std::max(0, bestZIdx - 1);
+            const int bestZIdx_p1 = std::min(volDimZ - 1, bestZIdx + 1);
+
+            const float bestDepth = depthPlaneToDepth(rcCamParams, in_depths[bestZIdx], pix);
+            const float bestDepth_m1 = depthPlaneToDepth(rcCamParams, in_depths[bestZIdx_m1], pix);
+            const float bestDepth_p1 = depthPlaneToDepth(rcCamParams, in_depths[bestZIdx_p1], pix);
+
+            // thickness is the maximum distance between output best depth and previous or next depth
+            out_depthThickness = Vec2f(bestDepth, std::max(bestDepth_p1 - bestDepth, bestDepth - bestDepth_m1) * thicknessMultFactor);
+
+            if (computeDepthSimMap)
+                out_sgmDepthSimMap(vx, vy) = Vec2f(bestDepth, (bestSim / 255.0f) * 2.0f - 1.0f);  // convert from (0, 255) to (-1, +1)
+        }
+    }
+}
+
+void cpu_volumeRefineBestDepth(HostMap<Vec2f>& out_refineDepthSimMap,
+                               const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                               const HostVolume<TSimRefineHost>& in_volSim,
+                               const RefineParams& refineParams,
+                               const ROI& roi)
+{
+    const int roiWidth = int(roi.width());
+    const int roiHeight = int(roi.height());
+    const int volDimZ = int(in_volSim.getDimZ());
+    const int samplesPerPixSize = refineParams.nbSubsamples;
+    const int halfNbSamples = refineParams.nbSubsamples * refineParams.halfNbDepths;
+    const int halfNbDepths = refineParams.halfNbDepths;
+    const float twoTimesSigmaPowerTwo = float(2.0 * refineParams.sigma * refineParams.sigma);
+
+    // precompute the sliding gaussian weights, they only depend on the sample and the depth index
+    const int nbSamples = 2 * halfNbSamples + 1;
+    std::vector<float> gaussianWeights(nbSamples * volDimZ);
+
+    for (int sample = -halfNbSamples; sample <= halfNbSamples; ++sample)
+    {
+        for (int vz = 0; vz < volDimZ; ++vz)
+        {
+            const int zs = (vz - halfNbDepths) * samplesPerPixSize;  // relative sample offset
+            gaussianWeights[(sample + halfNbSamples) * volDimZ + vz] = std::exp(-float((zs - sample) * (zs - sample)) / twoTimesSigmaPowerTwo);
+        }
+    }
+
+#pragma omp parallel for
+    for (int vy = 0; vy < roiHeight; ++vy)
+    {
+        for (int vx = 0; vx < roiWidth; ++vx)
+        {
+            const Vec2f& sgmDepthPixSize = in_sgmDepthPixSizeMap(vx, vy);
+            Vec2f& out_bestDepthSim = out_refineDepthSimMap(vx, vy);
+
+            // sgm depth (middle depth) invalid or masked
+            if (sgmDepthPixSize.x() <= 0.0f)
+            {
+                out_bestDepthSim = Vec2f(sgmDepthPixSize.x(), 1.0f);  // -1 (invalid) or -2 (masked), similarity between (-1, +1)
+                continue;
+            }
+
+            const TSimRefineHost* invSimSumCol = in_volSim.column(vx, vy);
+
+            // find best z sample per pixel
+            float bestSampleSim = 0.f;      // all sample sim <= 0.f
+            int bestSampleOffsetIndex = 0;  // default is middle depth (SGM)
+
+            // sliding gaussian window
+            for (int sample = -halfNbSamples; sample <= halfNbSamples; ++sample)
+            {
+                const float* weights = gaussianWeights.data() + (sample + halfNbSamples) * volDimZ;
+                float sampleSim = 0.f;
+
+                // the inverted similarity sum best value is the HIGHEST, reverse it: best value is the LOWEST
+#pragma omp simd reduction(+ : sampleSim)
+                for (int vz = 0; vz < volDimZ; ++vz)
+                    sampleSim -= float(invSimSumCol[vz]) * weights[vz];
+
+                if (sampleSim < bestSampleSim)
+                {
+                    bestSampleOffsetIndex = sample;
+                    bestSampleSim = sampleSim;
+                }
+            }
+
+            // compute best depth
+            // input sgm depth (middle depth) + sample size offset from z center
+            const float sampleSize = sgmDepthPixSize.y() / samplesPerPixSize;
+            out_bestDepthSim = Vec2f(sgmDepthPixSize.x() + bestSampleOffsetIndex * sampleSize, bestSampleSim);
+        }
+    }
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
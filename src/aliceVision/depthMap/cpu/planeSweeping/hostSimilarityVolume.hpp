@@ -0,0 +1,152 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/mvsData/ROI.hpp>
+#include <aliceVision/depthMap/SgmParams.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+#include <aliceVision/depthMap/cpu/host/memory.hpp>
+#include <aliceVision/depthMap/cpu/host/HostCameraParams.hpp>
+#include <aliceVision/depthMap/cpu/host/HostImage.hpp>
+
+#include <vector>
+
+namespace aliceVision {
+namespace depthMap {
+
+/*
+ * @note TSimHost is the similarity type for volume in host memory, same as the device default TSim.
+ * @note TSimAccHost is the similarity accumulation type for volume in host memory, same as the device default TSimAcc.
+ * @note TSimRefineHost is the similarity type for volume refinement in host memory.
+ */
+using TSimHost = unsigned char;
+using TSimAccHost = unsigned int;
+using TSimRefineHost = float;
+
+/**
+ * @brief Initialize all the given similarity volume in host memory to the given value.
+ * @param[in,out] inout_volume the similarity volume in host memory
+ * @param[in] value the value to initalize with
+ */
+void cpu_volumeInitialize(HostVolume<TSimHost>& inout_volume, TSimHost value);
+
+/**
+ * @brief Initialize all the given similarity volume in host memory to the given value.
+ * @param[in,out] inout_volume the similarity volume in host memory
+ * @param[in] value the value to initalize with
+ */
+void cpu_volumeInitialize(HostVolume<TSimRefineHost>& inout_volume, TSimRefineHost value);
+
+/**
+ * @brief Update second best similarity volume uninitialized values with first best volume values.
+ * @param[in] in_volBestSim the best similarity volume in host memory
+ * @param[out] inout_volSecBestSim the second best similarity volume in host memory
+ */
+void cpu_volumeUpdateUninitializedSimilarity(const HostVolume<TSimHost>& in_volBestSim, HostVolume<TSimHost>& inout_volSecBestSim);
+
+/**
+ * @brief Compute the best / second best similarity volume for the given RC / TC.
+ * @note Parallelized over the depths and the ROI rows.
+ * @param[out] out_volBestSim the best similarity volume in host memory
+ * @param[out] out_volSecBestSim the second best similarity volume in host memory
+ * @param[in] in_depths the R camera depth list
+ * @param[in] rcCamParams the R camera parameters at Sgm downscale
+ * @param[in] tcCamParams the T camera parameters at Sgm downscale
+ * @param[in] rcImage the R camera image at Sgm downscale
+ * @param[in] tcImage the T camera image at Sgm downscale
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] depthRange the volume depth range to compute
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_volumeComputeSimilarity(HostVolume<TSimHost>& out_volBestSim,
+                                 HostVolume<TSimHost>& out_volSecBestSim,
+                                 const std::vector<float>& in_depths,
+                                 const HostCameraParams& rcCamParams,
+                                 const HostCameraParams& tcCamParams,
+                                 const HostImage& rcImage,
+                                 const HostImage& tcImage,
+                                 const SgmParams& sgmParams,
+                                 const Range& depthRange,
+                                 const ROI& roi);
+
+/**
+ * @brief Refine the best similarity volume for the given RC / TC.
+ * @note Parallelized over the depths and the ROI rows.
+ * @param[out] inout_volSim the similarity volume in host memory
+ * @param[in] in_sgmDepthPixSizeMap the SGM upscaled depth/pixSize map
+ * @param[in] rcCamParams the R camera parameters at Refine downscale
+ * @param[in] tcCamParams the T camera parameters at Refine downscale
+ * @param[in] rcImage the R camera image at Refine downscale
+ * @param[in] tcImage the T camera image at Refine downscale
+ * @param[in] refineParams the Refine parameters
+ * @param[in] depthRange the volume depth range to compute
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_volumeRefineSimilarity(HostVolume<TSimRefineHost>& inout_volSim,
+                                const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                                const HostCameraParams& rcCamParams,
+                                const HostCameraParams& tcCamParams,
+                                const HostImage& rcImage,
+                                const HostImage& tcImage,
+                                const RefineParams& refineParams,
+                                const Range& depthRange,
+                                const ROI& roi);
+
+/**
+ * @brief Filter / Optimize the given similarity volume (Semi-Global Matching path aggregation).
+ * @note Parallelized over the lines of each filtering path.
+ * @param[out] out_volSimFiltered the output similarity volume in host memory
+ * @param[in] in_volSim the input similarity volume in host memory
+ * @param[in] rcImage the R camera image at Sgm downscale
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] lastDepthIndex the R camera last depth index
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_volumeOptimize(HostVolume<TSimHost>& out_volSimFiltered,
+                        const HostVolume<TSimHost>& in_volSim,
+                        const HostImage& rcImage,
+                        const SgmParams& sgmParams,
+                        int lastDepthIndex,
+                        const ROI& roi);
+
+/**
+ * @brief Retrieve the best depth/sim in the given similarity volume.
+ * @param[out] out_sgmDepthThicknessMap the output depth/thickness map
+ * @param[out] out_sgmDepthSimMap the output best depth/sim map (optional, ignored if empty)
+ * @param[in] in_depths the R camera depth list
+ * @param[in] in_volSim the input similarity volume in host memory
+ * @param[in] rcCamParams the R camera parameters at full resolution
+ * @param[in] sgmParams the Semi Global Matching parameters
+ * @param[in] depthRange the volume depth range to compute
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_volumeRetrieveBestDepth(HostMap<Vec2f>& out_sgmDepthThicknessMap,
+                                 HostMap<Vec2f>& out_sgmDepthSimMap,
+                                 const std::vector<float>& in_depths,
+                                 const HostVolume<TSimHost>& in_volSim,
+                                 const HostCameraParams& rcCamParams,
+                                 const SgmParams& sgmParams,
+                                 const Range& depthRange,
+                                 const ROI& roi);
+
+/**
+ * @brief Retrieve the best depth/sim in the given refined similarity volume.
+ * @param[out] out_refineDepthSimMap the output refined and fused depth/sim map
+ * @param[in] in_sgmDepthPixSizeMap the SGM upscaled depth/pixSize map
+ * @param[in] in_volSim the similarity volume in host memory
+ * @param[in] refineParams the Refine parameters
+ * @param[in] roi the 2d region of interest
+ */
+void cpu_volumeRefineBestDepth(HostMap<Vec2f>& out_refineDepthSimMap,
+                               const HostMap<Vec2f>& in_sgmDepthPixSizeMap,
+                               const HostVolume<TSimRefineHost>& in_volSim,
+                               const RefineParams& refineParams,
+                               const ROI& roi);
+
+}  // namespace depthMap
+}  // namespace aliceVision
@@ -0,0 +1,372 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/depthMap/cpu/depthMapCpu.hpp>
+#include <aliceVision/depthMap/cpu/SgmCpu.hpp>
+#include <aliceVision/depthMap/cpu/RefineCpu.hpp>
+
+#include <cmath>
+#include <cstdint>
+#include <vector>
+
+#define BOOST_TEST_MODULE depthMapSgmRefineCpu
+
+#include <boost/test/unit_test.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::depthMap;
+
+namespace {
+
+// synthetic scene: 3 cameras looking at a textured fronto-parallel plane
+const int imageSize = 128;
+const double focal = 150.0;
+const double planeZ = 10.0;
+const std::vector<double> camerasX = {0.0, 1.0, -1.0};
+
+float hashNoise(int i, int j)
+{
+    std::uint32_t h = std::uint32_t(i) * 374761393u + std::uint32_t(j) * 668265263u;
+    h = (h ^ (h >> 13)) * 1274126177u;
+    return float((h ^ (h >> 16)) & 0xffff) / 65535.f;
+}
+
+float valueNoise(double x, double y)
+{
+    const double xf = std::floor(x);
+    const double yf = std::floor(y);
+    const int i = int(xf);
+    const int j = int(yf);
+    const float ax = float(x - xf);
+    const float ay = float(y - yf);
+    const float top = hashNoise(i, j) + (hashNoise(i + 1, j) - hashNoise(i, j)) * ax;
+    const float bottom = hashNoise(i, j + 1) + (hashNoise(i + 1, j + 1) - hashNoise(i, j + 1)) * ax;
+    return top + (bottom - top) * ay;
+}
+
+// plane texture in world coordinates
+float planeTexture(double x, double y) { return 0.1f + 0.5f * valueNoise(x * 1.5, y * 1.5) + 0.3f * valueNoise(x * 3.0 + 17.0, y * 3.0 + 5.0); }
+
+Matrix3x3 getK()
+{
+    Matrix3x3 K;
+    K.m11 = focal;
+    K.m12 = 0.0;
+    K.m13 = imageSize * 0.5;
+    K.m21 = 0.0;
+    K.m22 = focal;
+    K.m23 = imageSize * 0.5;
+    K.m31 = 0.0;
+    K.m32 = 0.0;
+    K.m33 = 1.0;
+    return K;
+}
+
+Matrix3x3 getR()
+{
+    Matrix3x3 R;
+    R.m11 = 1.0;
+    R.m12 = 0.0;
+    R.m13 = 0.0;
+    R.m21 = 0.0;
+    R.m22 = 1.0;
+    R.m23 = 0.0;
+    R.m31 = 0.0;
+    R.m32 = 0.0;
+    R.m33 = 1.0;
+    return R;
+}
+
+image::Image<image::RGBAfColor> renderImage(double cameraX)
+{
+    image::Image<image::RGBAfColor> img(imageSize, imageSize);
+
+    for (int y = 0; y < imageSize; ++y)
+    {
+        for (int x = 0; x < imageSize; ++x)
+        {
+            // ray / plane intersection in world coordinates
+            const double wx = cameraX + (x - imageSize * 0.5) * planeZ / focal;
+            const double wy = (y - imageSize * 0.5) * planeZ / focal;
+            const float v = planeTexture(wx, wy);
+            img(y, x) = image::RGBAfColor(v, v, v, 1.f);
+        }
+    }
+    return img;
+}
+
+// ground truth depth along the ray of the R camera (camera 0) image pixel
+float getGroundTruthDepth(int x, int y)
+{
+    const double dx = (x - imageSize * 0.5) / focal;
+    const double dy = (y - imageSize * 0.5) / focal;
+    return float(planeZ * std::sqrt(1.0 + dx * dx + dy * dy));
+}
+
+void fillHostCache(HostCache& hostCache, const std::vector<int>& downscales)
+{
+    const Matrix3x3 K = getK();
+    const Matrix3x3 R = getR();
+
+    for (int c = 0; c < int(camerasX.size()); ++c)
+    {
+        const image::Image<image::RGBAfColor> img = renderImage(camerasX.at(c));
+
+        for (int downscale : downscales)
+        {
+            HostCameraParams cameraParams;
+            fillHostCameraParams(cameraParams, K, R, Point3d(camerasX.at(c), 0.0, 0.0), downscale);
+            hostCache.addCameraParams(c, downscale, cameraParams);
+            hostCache.addImage(c, downscale, img);
+        }
+    }
+}
+
+Tile getTile()
+{
+    Tile tile;
+    tile.id = 0;
+    tile.nbTiles = 1;
+    tile.rc = 0;
+    tile.sgmTCams = {1, 2};
+    tile.refineTCams = {1, 2};
+    tile.roi = ROI(0, imageSize, 0, imageSize);
+    return tile;
+}
+
+// depth planes with a constant disparity step
+std::vector<float> getDepths()
+{
+    const int nbDepths = 48;
+    const float minDepth = 7.f;
+    const float maxDepth = 14.f;
+
+    std::vector<float> depths(nbDepths);
+    for (int i = 0; i < nbDepths; ++i)
+        depths[i] = 1.f / (1.f / minDepth + (1.f / maxDepth - 1.f / minDepth) * float(i) / float(nbDepths - 1));
+    return depths;
+}
+
+/**
+ * @brief Get the ratio of valid depths with a relative error below the given threshold.
+ */
+void checkDepthMap(const HostMap<Vec2f>& depthMap,
+                   int scaleStep,
+                   float maxRelativeError,
+                   int& out_nbValid,
+                   int& out_nbGood,
+                   double& out_meanRelativeError)
+{
+    out_nbValid = 0;
+    out_nbGood = 0;
+    out_meanRelativeError = 0.0;
+
+    for (int y = 0; y < int(depthMap.getHeight()); ++y)
+    {
+        for (int x = 0; x < int(depthMap.getWidth()); ++x)
+        {
+            const float depth = depthMap(x, y).x();
+
+            if (depth <= 0.f)
+                continue;
+
+            const float gtDepth = getGroundTruthDepth(x * scaleStep, y * scaleStep);
+            const float relativeError = std::abs(depth - gtDepth) / gtDepth;
+
+            ++out_nbValid;
+            out_meanRelativeError += relativeError;
+
+            if (relativeError < maxRelativeError)
+                ++out_nbGood;
+        }
+    }
+
+    if (out_nbValid > 0)
+        out_meanRelativeError /= out_nbValid;
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(depthMap_sgmRefineCpu_syntheticPlane)
+{
+    SgmParams sgmParams;
+    sgmParams.scale = 2;
+    sgmParams.stepXY = 2;
+
+    RefineParams refineParams;
+    refineParams.scale = 1;
+    refineParams.stepXY = 2;
+
+    HostCache hostCache;
+    fillHostCache(hostCache, {1, sgmParams.scale, refineParams.scale});
+
+    const Tile tile = getTile();
+    const std::vector<float> depths = getDepths();
+    const std::vector<Pixel> depthsTcLimits = {Pixel(0, int(depths.size())), Pixel(0, int(depths.size()))};
+
+    // Semi-Global Matching
+    SgmCpu sgm(sgmParams, true);
+    sgm.sgmRc(tile, depths, depthsTcLimits, hostCache);
+
+    const int sgmScaleStep = sgmParams.scale * sgmParams.stepXY;
+    const HostMap<Vec2f>& sgmDepthSimMap = sgm.getDepthSimMap();
+
+    BOOST_REQUIRE_EQUAL(sgmDepthSimMap.getWidth(), imageSize / sgmScaleStep);
+    BOOST_REQUIRE_EQUAL(sgmDepthSimMap.getHeight(), imageSize / sgmScaleStep);
+
+    int sgmNbValid, sgmNbGood;
+    double sgmMeanError;
+    checkDepthMap(sgmDepthSimMap, sgmScaleStep, 0.02f, sgmNbValid, sgmNbGood, sgmMeanError);
+
+    BOOST_TEST_MESSAGE("SGM: " << sgmNbGood << " / " << sgmNbValid << " good depths, mean relative error: " << sgmMeanError);
+
+    BOOST_CHECK_GT(sgmNbValid, int(sgmDepthSimMap.getWidth() * sgmDepthSimMap.getHeight()) / 2);
+    BOOST_CHECK_GT(sgmNbGood, int(0.9 * sgmNbValid));
+
+    // Refine
+    sgm.smoothThicknessMap(tile, refineParams);
+
+    RefineCpu refine(refineParams);
+    refine.refineRc(tile, sgm.getDepthThicknessMap(), hostCache);
+
+    const int refineScaleStep = refineParams.scale * refineParams.stepXY;
+    const HostMap<Vec2f>& refineDepthSimMap = refine.getDepthSimMap();
+
+    BOOST_REQUIRE_EQUAL(refineDepthSimMap.getWidth(), imageSize / refineScaleStep);
+    BOOST_REQUIRE_EQUAL(refineDepthSimMap.getHeight(), imageSize / refineScaleStep);
+
+    int refineNbValid, refineNbGood;
+    double refineMeanError;
+    checkDepthMap(refineDepthSimMap, refineScaleStep, 0.01f, refineNbValid, refineNbGood, refineMeanError);
+
+    BOOST_TEST_MESSAGE("Refine: " << refineNbGood << " / " << refineNbValid << " good depths, mean relative error: " << refineMeanError);
+
+    BOOST_CHECK_GT(refineNbValid, int(refineDepthSimMap.getWidth() * refineDepthSimMap.getHeight()) / 2);
+    BOOST_CHECK_GT(refineNbGood, int(0.9 * refineNbValid));
+    BOOST_CHECK_LT(refineMeanError, sgmMeanError);
+}
+
+BOOST_AUTO_TEST_CASE(depthMap_sgmRefineCpu_tiles)
+{
+    SgmParams sgmParams;
+    RefineParams refineParams;
+    refineParams.stepXY = 2;
+
+    HostCache hostCache;
+    fillHostCache(hostCache, {1, sgmParams.scale, refineParams.scale});
+
+    const std::vector<float> depths = getDepths();
+
+    // single tile computation
+    const Tile fullTile = getTile();
+
+    SgmCpu sgm(sgmParams, false);
+    sgm.sgmRc(fullTile, depths, {Pixel(0, int(depths.size())), Pixel(0, int(depths.size()))}, hostCache);
+    sgm.smoothThicknessMap(fullTile, refineParams);
+
+    RefineCpu refine(refineParams);
+    refine.refineRc(fullTile, sgm.getDepthThicknessMap(), hostCache);
+
+    // multiple tiles computation, the same tile is repeated so every tile should give the same result
+    const int nbTiles = 4;
+    const std::vector<Tile> tiles(nbTiles, fullTile);
+    const std::vector<std::vector<float>> tilesDepths(nbTiles, depths);
+    const std::vector<std::vector<Pixel>> tilesDepthsTcLimits(nbTiles, {Pixel(0, int(depths.size())), Pixel(0, int(depths.size()))});
+
+    std::vector<HostMap<Vec2f>> tilesDepthSimMaps;
+    computeTilesDepthSimMapCpu(tiles, tilesDepths, tilesDepthsTcLimits, hostCache, sgmParams, refineParams, true, tilesDepthSimMaps);
+
+    BOOST_REQUIRE_EQUAL(tilesDepthSimMaps.size(), nbTiles);
+
+    const HostMap<Vec2f>& expected = refine.getDepthSimMap();
+
+    for (const HostMap<Vec2f>& tileDepthSimMap : tilesDepthSimMaps)
+    {
+        BOOST_REQUIRE_EQUAL(tileDepthSimMap.getWidth(), expected.getWidth());
+        BOOST_REQUIRE_EQUAL(tileDepthSimMap.getHeight(), expected.getHeight());
+
+        int nbDifferences = 0;
+        for (std::size_t y = 0; y < expected.getHeight(); ++y)
+            for (std::size_t x = 0; x < expected.getWidth(); ++x)
+                if (tileDepthSimMap(x, y) != expected(x, y))
+                    ++nbDifferences;
+
+        BOOST_CHECK_EQUAL(nbDifferences, 0);
+    }
+
+    // tile without T camera
+    std::vector<Tile> invalidTiles(1, fullTile);
+    invalidTiles.front().sgmTCams.clear();
+
+    computeTilesDepthSimMapCpu(invalidTiles, {depths}, {{}}, hostCache, sgmParams, refineParams, true, tilesDepthSimMaps);
+
+    BOOST_REQUIRE_EQUAL(tilesDepthSimMaps.size(), 1);
+    BOOST_CHECK_EQUAL(tilesDepthSimMaps.front()(0, 0).x(), -1.f);
+}
+
+BOOST_AUTO_TEST_CASE(depthMap_sgmRefineCpu_unsupportedOptions)
+{
+    RefineParams refineParams;
+
+    HostCache hostCache;
+    fillHostCache(hostCache, {1, 2, refineParams.scale});
+
+    const Tile tile = getTile();
+    const std::vector<float> depths = getDepths();
+    const std::vector<Pixel> depthsTcLimits = {Pixel(0, int(depths.size())), Pixel(0, int(depths.size()))};
+
+    // SGM options only available with the CUDA backend
+    {
+        SgmParams sgmParams;
+        sgmParams.useCustomPatchPattern = true;
+        SgmCpu sgm(sgmParams, true);
+        BOOST_CHECK_THROW(sgm.sgmRc(tile, depths, depthsTcLimits, hostCache), std::exception);
+    }
+    {
+        SgmParams sgmParams;
+        sgmParams.useConsistentScale = true;
+        SgmCpu sgm(sgmParams, true);
+        BOOST_CHECK_THROW(sgm.sgmRc(tile, depths, depthsTcLimits, hostCache), std::exception);
+    }
+    {
+        SgmParams sgmParams;
+        sgmParams.exportIntermediateVolumes = true;
+        SgmCpu sgm(sgmParams, true);
+        BOOST_CHECK_THROW(sgm.sgmRc(tile, depths, depthsTcLimits, hostCache), std::exception);
+    }
+    {
+        SgmParams sgmParams;
+        SgmCpu sgm(sgmParams, true, true);
+        BOOST_CHECK_THROW(sgm.sgmRc(tile, depths, depthsTcLimits, hostCache), std::exception);
+    }
+
+    // Refine options only available with the CUDA backend
+    SgmParams sgmParams;
+    SgmCpu sgm(sgmParams, false);
+    sgm.sgmRc(tile, depths, depthsTcLimits, hostCache);
+    sgm.smoothThicknessMap(tile, refineParams);
+
+    {
+        RefineParams unsupportedRefineParams;
+        unsupportedRefineParams.useCustomPatchPattern = true;
+        RefineCpu refine(unsupportedRefineParams);
+        BOOST_CHECK_THROW(refine.refineRc(tile, sgm.getDepthThicknessMap(), hostCache), std::exception);
+    }
+    {
+        RefineParams unsupportedRefineParams;
+        unsupportedRefineParams.exportIntermediateDepthSimMaps = true;
+        RefineCpu refine(unsupportedRefineParams);
+        BOOST_CHECK_THROW(refine.refineRc(tile, sgm.getDepthThicknessMap(), hostCache), std::exception);
+    }
+
+    // the error is propagated by the tiles computation
+    std::vector<HostMap<Vec2f>> tilesDepthSimMaps;
+    SgmParams unsupportedSgmParams;
+    unsupportedSgmParams.useConsistentScale = true;
+    BOOST_CHECK_THROW(
+      computeTilesDepthSimMapCpu({tile}, {depths}, {depthsTcLimits}, hostCache, unsupportedSgmParams, refineParams, true, tilesDepthSimMaps),
+      std::exception);
+}
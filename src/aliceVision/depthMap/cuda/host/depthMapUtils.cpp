@@ -0,0 +1,281 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2022 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "depthMapUtils.hpp"
+
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/image/io.hpp>
+#include <aliceVision/mvsUtils/fileIO.hpp>
+#include <aliceVision/mvsUtils/mapIO.hpp>
+
+namespace aliceVision {
+namespace depthMap {
+
+void copyFloat2Map(image::Image<float>& out_mapX,
+                   image::Image<float>& out_mapY,
+                   const CudaHostMemoryHeap<float2, 2>& in_map_hmh,
+                   const ROI& roi,
+                   int downscale)
+{
+    const ROI downscaledROI = downscaleROI(roi, downscale);
+    const int width = int(downscaledROI.width());
+    const int height = int(downscaledROI.height());
+
+    // resize output images
+    out_mapX.resize(width, height);
+    out_mapY.resize(width, height);
+
+    // copy image from host memory to output images
+    for (int x = 0; x < width; ++x)
+    {
+        for (int y = 0; y < height; ++y)
+        {
+            const float2& value = in_map_hmh(size_t(x), size_t(y));
+            out_mapX(y, x) = value.x;
+            out_mapY(y, x) = value.y;
+        }
+    }
+}
+
+void copyFloat2Map(image::Image<float>& out_mapX,
+                   image::Image<float>& out_mapY,
+                   const CudaDeviceMemoryPitched<float2, 2>& in_map_dmp,
+                   const ROI& roi,
+                   int downscale)
+{
+    // copy float2 map from device pitched memory to host memory
+    CudaHostMemoryHeap<float2, 2> map_hmh(in_map_dmp.getSize());
+    map_hmh.copyFrom(in_map_dmp);
+
+    copyFloat2Map(out_mapX, out_mapY, map_hmh, roi, downscale);
+}
+
+void writeFloat2Map(int rc,
+                    const mvsUtils::MultiViewParams& mp,
+                    const mvsUtils::TileParams& tileParams,
+                    const ROI& roi,
+                    const CudaHostMemoryHeap<float2, 2>& in_map_hmh,
+                    const mvsUtils::EFileType fileTypeX,
+                    const mvsUtils::EFileType fileTypeY,
+                    int scale,
+                    int step,
+                    const std::string& name)
+{
+    const std::string customSuffix = (name.empty()) ? "" : "_" + name;
+    const int scaleStep = scale * step;
+
+    image::Image<float> mapX;
+    image::Image<float> mapY;
+
+    copyFloat2Map(mapX, mapY, in_map_hmh, roi, scaleStep);
+
+    mvsUtils::writeMap(rc, mp, fileTypeX, tileParams, roi, mapX, scale, step, customSuffix);
+    mvsUtils::writeMap(rc, mp, fileTypeY, tileParams, roi, mapY, scale, step, customSuffix);
+}
+
+void writeFloat2Map(int rc,
+                    const mvsUtils::MultiViewParams& mp,
+                    const mvsUtils::TileParams& tileParams,
+                    const ROI& roi,
+                    const CudaDeviceMemoryPitched<float2, 2>& in_map_dmp,
+                    const mvsUtils::EFileType fileTypeX,
+                    const mvsUtils::EFileType fileTypeY,
+                    int scale,
+                    int step,
+                    const std::string& name)
+{
+    const std::string customSuffix = (name.empty()) ? "" : "_" + name;
+    const int scaleStep = scale * step;
+
+    image::Image<float> mapX;
+    image::Image<float> mapY;
+
+    copyFloat2Map(mapX, mapY, in_map_dmp, roi, scaleStep);
+
+    mvsUtils::writeMap(rc, mp, fileTypeX, tileParams, roi, mapX, scale, step, customSuffix);
+    mvsUtils::writeMap(rc, mp, fileTypeY, tileParams, roi, mapY, scale, step, customSuffix);
+}
+
+void writeFloat3Map(int rc,
+                    const mvsUtils::MultiViewParams& mp,
+                    const mvsUtils::TileParams& tileParams,
+                    const ROI& roi,
+                    const CudaDeviceMemoryPitched<float3, 2>& in_map_dmp,
+                    const mvsUtils::EFileType fileType,
+                    int scale,
+                    int step,
+                    const std::string& name)
+{
+    const ROI downscaledROI = downscaleROI(roi, scale * step);
+    const int width = int(downscaledROI.width());
+    const int height = int(downscaledROI.height());
+
+    // copy map from device pitched memory to host memory
+    CudaHostMemoryHeap<float3, 2> map_hmh(in_map_dmp.getSize());
+    map_hmh.copyFrom(in_map_dmp);
+
+    // copy map from host memory to an Image
+    image::Image<image::RGBfColor> map(width, height, true, {0.f, 0.f, 0.f});
+
+    for (size_t x = 0; x < size_t(width); ++x)
+    {
+        for (size_t y = 0; y < size_t(height); ++y)
+        {
+            const float3& rgba_hmh = map_hmh(x, y);
+            image::RGBfColor& rgb = map(int(y), int(x));
+            rgb.r() = rgba_hmh.x;
+            rgb.g() = rgba_hmh.y;
+            rgb.b() = rgba_hmh.z;
+        }
+    }
+
+    // write map from the image buffer
+    mvsUtils::writeMap(rc, mp, fileType, tileParams, roi, map, scale, step, (name.empty()) ? "" : "_" + name);
+}
+
+void writeDeviceImage(const CudaDeviceMemoryPitched<CudaRGBA, 2>& in_img_dmp, const std::string& path)
+{
+    const CudaSize<2>& imgSize = in_img_dmp.getSize();
+
+    // copy image from device pitched memory to host memory
+    CudaHostMemoryHeap<CudaRGBA, 2> img_hmh(imgSize);
+    img_hmh.copyFrom(in_img_dmp);
+
+    // copy image from host memory to an Image
+    image::Image<image::RGBfColor> img(imgSize.x(), imgSize.y(), true, {0.f, 0.f, 0.f});
+
+    for (size_t x = 0; x < imgSize.x(); ++x)
+    {
+        for (size_t y = 0; y < imgSize.y(); ++y)
+        {
+            const CudaRGBA& rgba_hmh = img_hmh(x, y);
+            image::RGBfColor& rgb = img(int(y), int(x));
+            rgb.r() = rgba_hmh.x;
+            rgb.g() = rgba_hmh.y;
+            rgb.b() = rgba_hmh.z;
+        }
+    }
+
+    // write the image buffer
+    image::writeImage(
+      path, img, image::ImageWriteOptions().toColorSpace(image::EImageColorSpace::NO_CONVERSION).storageDataType(image::EStorageDataType::Float));
+}
+
+void writeNormalMap(int rc,
+                    const mvsUtils::MultiViewParams& mp,
+                    const mvsUtils::TileParams& tileParams,
+                    const ROI& roi,
+                    const CudaDeviceMemoryPitched<float3, 2>& in_normalMap_dmp,
+                    int scale,
+                    int step,
+                    const std::string& name)
+{
+    writeFloat3Map(rc, mp, tileParams, roi, in_normalMap_dmp, mvsUtils::EFileType::normalMap, scale, step, name);
+}
+
+void writeNormalMapFiltered(int rc,
+                            const mvsUtils::MultiViewParams& mp,
+                            const mvsUtils::TileParams& tileParams,
+                            const ROI& roi,
+                            const CudaDeviceMemoryPitched<float3, 2>& in_normalMap_dmp,
+                            int scale,
+                            int step,
+                            const std::string& name)
+{
+    writeFloat3Map(rc, mp, tileParams, roi, in_normalMap_dmp, mvsUtils::EFileType::normalMapFiltered, scale, step, name);
+}
+
+void writeDepthThicknessMap(int rc,
+                            const mvsUtils::MultiViewParams& mp,
+                            const mvsUtils::TileParams& tileParams,
+                            const ROI& roi,
+                            const CudaDeviceMemoryPitched<float2, 2>& in_depthThicknessMap_dmp,
+                            int scale,
+                            int step,
+                            const std::string& name)
+{
+    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
+    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::thicknessMap;
+
+    writeFloat2Map(rc, mp, tileParams, roi, in_depthThicknessMap_dmp, fileTypeX, fileTypeY, scale, step, name);
+}
+
+void writeDepthPixSizeMap(int rc,
+                          const mvsUtils::MultiViewParams& mp,
+                          const mvsUtils::TileParams& tileParams,
+                          const ROI& roi,
+                          const CudaDeviceMemoryPitched<float2, 2>& in_depthPixSize_dmp,
+                          int scale,
+                          int step,
+                          const std::string& name)
+{
+    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
+    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::pixSizeMap;
+
+    writeFloat2Map(rc, mp, tileParams, roi, in_depthPixSize_dmp, fileTypeX, fileTypeY, scale, step, name);
+}
+
+void writeDepthSimMap(int rc,
+                      const mvsUtils::MultiViewParams& mp,
+                      const mvsUtils::TileParams& tileParams,
+                      const ROI& roi,
+                      const CudaDeviceMemoryPitched<float2, 2>& in_depthSimMap_dmp,
+                      int scale,
+                      int step,
+                      const std::string& name)
+{
+    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
+    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::simMap;
+
+    writeFloat2Map(rc, mp, tileParams, roi, in_depthSimMap_dmp, fileTypeX, fileTypeY, scale, step, name);
+}
+
+void writeDepthSimMapFromTileList(int rc,
+                                  const mvsUtils::MultiViewParams& mp,
+                                  const mvsUtils::TileParams& tileParams,
+                                  const std::vector<ROI>& tileRoiList,
+                                  const std::vector<CudaHostMemoryHeap<float2, 2>>& in_depthSimMapTiles_hmh,
+                                  int scale,
+                                  int step,
+                                  const std::string& name)
+{
+    const ROI imageRoi(Range(0, mp.getWidth(rc)), Range(0, mp.getHeight(rc)));
+    const int scaleStep = scale * step;
+
+    std::vector<image::Image<float>> depthMapTiles(tileRoiList.size());
+    std::vector<image::Image<float>> simMapTiles(tileRoiList.size());
+
+    for (size_t i = 0; i < tileRoiList.size(); ++i)
+    {
+        const ROI roi = intersect(tileRoiList.at(i), imageRoi);
+
+        if (roi.isEmpty())
+            continue;
+
+        // copy tile depth/sim map from host memory
+        copyFloat2Map(depthMapTiles.at(i), simMapTiles.at(i), in_depthSimMapTiles_hmh.at(i), roi, scaleStep);
+    }
+
+    writeDepthSimMapFromTileList(rc, mp, tileParams, tileRoiList, depthMapTiles, simMapTiles, scale, step, name);
+}
+
+void resetDepthSimMap(CudaHostMemoryHeap<float2, 2>& inout_depthSimMap_hmh, float depth, float sim)
+{
+    const CudaSize<2>& depthSimMapSize = inout_depthSimMap_hmh.getSize();
+
+    for (size_t x = 0; x < depthSimMapSize.x(); ++x)
+    {
+        for (size_t y = 0; y < depthSimMapSize.y(); ++y)
+        {
+            float2& depthSim_hmh = inout_depthSimMap_hmh(x, y);
+            depthSim_hmh.x = depth;
+            depthSim_hmh.y = sim;
+        }
+    }
+}
+
+}  // namespace depthMap
+}  // namespace aliceVision
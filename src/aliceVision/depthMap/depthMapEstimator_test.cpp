@@ -0,0 +1,294 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/config.hpp>
+#include <aliceVision/gpu/gpu.hpp>
+#include <aliceVision/image/io.hpp>
+#include <aliceVision/sfmData/SfMData.hpp>
+#include <aliceVision/mvsUtils/MultiViewParams.hpp>
+#include <aliceVision/mvsUtils/TileParams.hpp>
+#include <aliceVision/mvsUtils/mapIO.hpp>
+#include <aliceVision/depthMap/DepthMapEstimator.hpp>
+#include <aliceVision/depthMap/DepthMapParams.hpp>
+#include <aliceVision/depthMap/SgmParams.hpp>
+#include <aliceVision/depthMap/RefineParams.hpp>
+
+#include <cmath>
+#include <cstdint>
+#include <filesystem>
+#include <sstream>
+#include <string>
+#include <vector>
+
+#define BOOST_TEST_MODULE depthMapEstimator
+
+#include <boost/test/unit_test.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::depthMap;
+
+namespace fs = std::filesystem;
+
+namespace {
+
+// synthetic scene: 3 cameras looking at a textured fronto-parallel plane (same scene as cpu/sgmRefineCpu_test.cpp)
+const int imageSize = 128;
+const double focal = 150.0;
+const double planeZ = 10.0;
+const std::vector<double> camerasX = {0.0, 1.0, -1.0};
+
+float hashNoise(int i, int j)
+{
+    std::uint32_t h = std::uint32_t(i) * 374761393u + std::uint32_t(j) * 668265263u;
+    h = (h ^ (h >> 13)) * 1274126177u;
+    return float((h ^ (h >> 16)) & 0xffff) / 65535.f;
+}
+
+float valueNoise(double x, double y)
+{
+    const double xf = std::floor(x);
+    const double yf = std::floor(y);
+    const int i = int(xf);
+    const int j = int(yf);
+    const float ax = float(x - xf);
+    const float ay = float(y - yf);
+    const float top = hashNoise(i, j) + (hashNoise(i + 1, j) - hashNoise(i, j)) * ax;
+    const float bottom = hashNoise(i, j + 1) + (hashNoise(i + 1, j + 1) - hashNoise(i, j + 1)) * ax;
+    return top + (bottom - top) * ay;
+}
+
+// plane texture in world coordinates
+float planeTexture(double x, double y) { return 0.1f + 0.5f * valueNoise(x * 1.5, y * 1.5) + 0.3f * valueNoise(x * 3.0 + 17.0, y * 3.0 + 5.0); }
+
+image::Image<image::RGBAfColor> renderImage(double cameraX)
+{
+    image::Image<image::RGBAfColor> img(imageSize, imageSize);
+
+    for (int y = 0; y < imageSize; ++y)
+    {
+        for (int x = 0; x < imageSize; ++x)
+        {
+            // ray / plane intersection in world coordinates
+            const double wx = cameraX + (x - imageSize * 0.5) * planeZ / focal;
+            const double wy = (y - imageSize * 0.5) * planeZ / focal;
+            const float v = planeTexture(wx, wy);
+            img(y, x) = image::RGBAfColor(v, v, v, 1.f);
+        }
+    }
+    return img;
+}
+
+// ground truth depth along the ray of any camera image pixel (all cameras are fronto-parallel to the plane)
+float getGroundTruthDepth(int x, int y)
+{
+    const double dx = (x - imageSize * 0.5) / focal;
+    const double dy = (y - imageSize * 0.5) / focal;
+    return float(planeZ * std::sqrt(1.0 + dx * dx + dy * dy));
+}
+
+/**
+ * @brief Write the synthetic scene images in the given folder and build the corresponding SfMData.
+ * @note Landmarks are spread over several depths around the plane to get a meaningful SGM depth range.
+ */
+sfmData::SfMData buildScene(const std::string& imagesFolder)
+{
+    sfmData::SfMData sfmData;
+
+    sfmData.getIntrinsics().emplace(0, std::make_shared<camera::Pinhole>(imageSize, imageSize, focal, focal, 0.0, 0.0));
+
+    for (int c = 0; c < int(camerasX.size()); ++c)
+    {
+        const std::string imagePath = (fs::path(imagesFolder) / (std::to_string(c) + ".exr")).string();
+        image::writeImage(imagePath, renderImage(camerasX.at(c)), image::ImageWriteOptions().toColorSpace(image::EImageColorSpace::NO_CONVERSION));
+
+        sfmData.getViews().emplace(c, std::make_shared<sfmData::View>(imagePath, c, 0, c, imageSize, imageSize));
+        sfmData.setPose(*sfmData.getViews().at(c), sfmData::CameraPose(geometry::Pose3(Mat3::Identity(), Vec3(camerasX.at(c), 0.0, 0.0))));
+    }
+
+    IndexT landmarkId = 0;
+
+    for (const double z : {8.0, planeZ, 12.0})
+    {
+        for (int i = -2; i <= 2; ++i)
+        {
+            for (int j = -2; j <= 2; ++j)
+            {
+                sfmData::Landmark landmark;
+                landmark.X = Vec3(i, j, z);
+
+                for (int c = 0; c < int(camerasX.size()); ++c)
+                {
+                    const Vec2 pt(focal * (i - camerasX.at(c)) / z + imageSize * 0.5, focal * j / z + imageSize * 0.5);
+                    landmark.getObservations()[c] = sfmData::Observation(pt, landmarkId, 0.0);
+                }
+
+                sfmData.getLandmarks()[landmarkId++] = landmark;
+            }
+        }
+    }
+
+    return sfmData;
+}
+
+/**
+ * @brief Estimate and read back the depth maps of all the cameras with the given backend.
+ */
+void estimateDepthMaps(const sfmData::SfMData& sfmData,
+                       const std::string& depthMapsFolder,
+                       EDepthMapBackend backend,
+                       std::vector<image::Image<float>>& out_depthMaps,
+                       int& out_scaleStep)
+{
+    fs::create_directories(depthMapsFolder);
+
+    mvsUtils::MultiViewParams mp(sfmData, "", depthMapsFolder, "");
+
+    mvsUtils::TileParams tileParams;
+    tileParams.bufferWidth = imageSize;
+    tileParams.bufferHeight = imageSize;
+
+    DepthMapParams depthMapParams;
+    depthMapParams.backend = backend;
+
+    SgmParams sgmParams;
+    sgmParams.scale = 2;
+    sgmParams.stepXY = 2;
+
+    RefineParams refineParams;
+    refineParams.scale = 1;
+    refineParams.stepXY = 2;
+
+    const std::vector<int> cams = {0, 1, 2};
+
+    DepthMapEstimator depthMapEstimator(mp, tileParams, depthMapParams, sgmParams, refineParams);
+    depthMapEstimator.computeDepthMaps(cams);
+
+    out_scaleStep = refineParams.scale * refineParams.stepXY;
+    out_depthMaps.resize(cams.size());
+
+    for (int rc : cams)
+        mvsUtils::readMap(rc, mp, mvsUtils::EFileType::depthMap, out_depthMaps.at(rc), refineParams.scale, refineParams.stepXY);
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(depthMap_depthMapEstimator_cpu)
+{
+    const fs::path folder = fs::temp_directory_path() / "depthMapEstimator_cpu";
+    fs::remove_all(folder);
+    fs::create_directories(folder);
+
+    const sfmData::SfMData sfmData = buildScene(folder.string());
+
+    std::vector<image::Image<float>> depthMaps;
+    int scaleStep;
+    estimateDepthMaps(sfmData, (folder / "depthMaps").string(), EDepthMapBackend::CPU, depthMaps, scaleStep);
+
+    for (const image::Image<float>& depthMap : depthMaps)
+    {
+        BOOST_REQUIRE_EQUAL(depthMap.width(), imageSize / scaleStep);
+        BOOST_REQUIRE_EQUAL(depthMap.height(), imageSize / scaleStep);
+
+        int nbValid = 0;
+        int nbGood = 0;
+
+        for (int y = 0; y < depthMap.height(); ++y)
+        {
+            for (int x = 0; x < depthMap.width(); ++x)
+            {
+                const float depth = depthMap(y, x);
+
+                if (depth <= 0.f)
+                    continue;
+
+                const float gtDepth = getGroundTruthDepth(x * scaleStep, y * scaleStep);
+
+                ++nbValid;
+
+                if (std::abs(depth - gtDepth) / gtDepth < 0.01f)
+                    ++nbGood;
+            }
+        }
+
+        BOOST_TEST_MESSAGE("CPU backend: " << nbGood << " / " << nbValid << " good depths.");
+
+        // T cameras only partially overlap the side cameras, half of the image should still be valid
+        BOOST_CHECK_GT(nbValid, int(depthMap.width() * depthMap.height()) / 2);
+        BOOST_CHECK_GT(nbGood, int(0.9 * nbValid));
+    }
+
+    fs::remove_all(folder);
+}
+
+BOOST_AUTO_TEST_CASE(depthMap_depthMapEstimator_cudaCpu)
+{
+#if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_CUDA)
+    if (!gpu::gpuSupportCUDA(2, 0))
+    {
+        BOOST_TEST_MESSAGE("No CUDA-enabled GPU available, skip the CUDA / CPU backends comparison.");
+        return;
+    }
+
+    const fs::path folder = fs::temp_directory_path() / "depthMapEstimator_cudaCpu";
+    fs::remove_all(folder);
+    fs::create_directories(folder);
+
+    const sfmData::SfMData sfmData = buildScene(folder.string());
+
+    std::vector<image::Image<float>> cudaDepthMaps;
+    std::vector<image::Image<float>> cpuDepthMaps;
+    int scaleStep;
+    estimateDepthMaps(sfmData, (folder / "cuda").string(), EDepthMapBackend::CUDA, cudaDepthMaps, scaleStep);
+    estimateDepthMaps(sfmData, (folder / "cpu").string(), EDepthMapBackend::CPU, cpuDepthMaps, scaleStep);
+
+    BOOST_REQUIRE_EQUAL(cudaDepthMaps.size(), cpuDepthMaps.size());
+
+    for (std::size_t i = 0; i < cudaDepthMaps.size(); ++i)
+    {
+        const image::Image<float>& cudaDepthMap = cudaDepthMaps.at(i);
+        const image::Image<float>& cpuDepthMap = cpuDepthMaps.at(i);
+
+        BOOST_REQUIRE_EQUAL(cudaDepthMap.width(), cpuDepthMap.width());
+        BOOST_REQUIRE_EQUAL(cudaDepthMap.height(), cpuDepthMap.height());
+
+        int nbCudaValid = 0;
+        int nbCpuValid = 0;
+        int nbBothValid = 0;
+        int nbClose = 0;
+
+        for (int y = 0; y < cudaDepthMap.height(); ++y)
+        {
+            for (int x = 0; x < cudaDepthMap.width(); ++x)
+            {
+                const float cudaDepth = cudaDepthMap(y, x);
+                const float cpuDepth = cpuDepthMap(y, x);
+
+                nbCudaValid += (cudaDepth > 0.f) ? 1 : 0;
+                nbCpuValid += (cpuDepth > 0.f) ? 1 : 0;
+
+                if (cudaDepth <= 0.f || cpuDepth <= 0.f)
+                    continue;
+
+                ++nbBothValid;
+
+                if (std::abs(cudaDepth - cpuDepth) / cudaDepth < 0.01f)
+                    ++nbClose;
+            }
+        }
+
+        BOOST_TEST_MESSAGE("CUDA / CPU backends (rc: " << i << "): " << nbClose << " / " << nbBothValid << " close depths (CUDA valid: "
+                                                        << nbCudaValid << ", CPU valid: " << nbCpuValid << ").");
+
+        // both backends should give the same valid area and the same depths up to floating point differences
+        BOOST_CHECK_GT(nbBothValid, int(0.9 * std::max(nbCudaValid, nbCpuValid)));
+        BOOST_CHECK_GT(nbClose, int(0.95 * nbBothValid));
+    }
+
+    fs::remove_all(folder);
+#else
+    BOOST_TEST_MESSAGE("AliceVision built without CUDA, skip the CUDA / CPU backends comparison.");
+#endif
+}
@@ -20,230 +20,12 @@
 namespace aliceVision {
 namespace depthMap {
 
-void copyFloat2Map(image::Image<float>& out_mapX,
-                   image::Image<float>& out_mapY,
-                   const CudaHostMemoryHeap<float2, 2>& in_map_hmh,
-                   const ROI& roi,
-                   int downscale)
-{
-    const ROI downscaledROI = downscaleROI(roi, downscale);
-    const int width = int(downscaledROI.width());
-    const int height = int(downscaledROI.height());
-
-    // resize output images
-    out_mapX.resize(width, height);
-    out_mapY.resize(width, height);
-
-    // copy image from host memory to output images
-    for (int x = 0; x < width; ++x)
-    {
-        for (int y = 0; y < height; ++y)
-        {
-            const float2& value = in_map_hmh(size_t(x), size_t(y));
-            out_mapX(y, x) = value.x;
-            out_mapY(y, x) = value.y;
-        }
-    }
-}
-
-void copyFloat2Map(image::Image<float>& out_mapX,
-                   image::Image<float>& out_mapY,
-                   const CudaDeviceMemoryPitched<float2, 2>& in_map_dmp,
-                   const ROI& roi,
-                   int downscale)
-{
-    // copy float2 map from device pitched memory to host memory
-    CudaHostMemoryHeap<float2, 2> map_hmh(in_map_dmp.getSize());
-    map_hmh.copyFrom(in_map_dmp);
-
-    copyFloat2Map(out_mapX, out_mapY, map_hmh, roi, downscale);
-}
-
-void writeFloat2Map(int rc,
-                    const mvsUtils::MultiViewParams& mp,
-                    const mvsUtils::TileParams& tileParams,
-                    const ROI& roi,
-                    const CudaHostMemoryHeap<float2, 2>& in_map_hmh,
-                    const mvsUtils::EFileType fileTypeX,
-                    const mvsUtils::EFileType fileTypeY,
-                    int scale,
-                    int step,
-                    const std::string& name)
-{
-    const std::string customSuffix = (name.empty()) ? "" : "_" + name;
-    const int scaleStep = scale * step;
-
-    image::Image<float> mapX;
-    image::Image<float> mapY;
-
-    copyFloat2Map(mapX, mapY, in_map_hmh, roi, scaleStep);
-
-    mvsUtils::writeMap(rc, mp, fileTypeX, tileParams, roi, mapX, scale, step, customSuffix);
-    mvsUtils::writeMap(rc, mp, fileTypeY, tileParams, roi, mapY, scale, step, customSuffix);
-}
-
-void writeFloat2Map(int rc,
-                    const mvsUtils::MultiViewParams& mp,
-                    const mvsUtils::TileParams& tileParams,
-                    const ROI& roi,
-                    const CudaDeviceMemoryPitched<float2, 2>& in_map_dmp,
-                    const mvsUtils::EFileType fileTypeX,
-                    const mvsUtils::EFileType fileTypeY,
-                    int scale,
-                    int step,
-                    const std::string& name)
-{
-    const std::string customSuffix = (name.empty()) ? "" : "_" + name;
-    const int scaleStep = scale * step;
-
-    image::Image<float> mapX;
-    image::Image<float> mapY;
-
-    copyFloat2Map(mapX, mapY, in_map_dmp, roi, scaleStep);
-
-    mvsUtils::writeMap(rc, mp, fileTypeX, tileParams, roi, mapX, scale, step, customSuffix);
-    mvsUtils::writeMap(rc, mp, fileTypeY, tileParams, roi, mapY, scale, step, customSuffix);
-}
-
-void writeFloat3Map(int rc,
-                    const mvsUtils::MultiViewParams& mp,
-                    const mvsUtils::TileParams& tileParams,
-                    const ROI& roi,
-                    const CudaDeviceMemoryPitched<float3, 2>& in_map_dmp,
-                    const mvsUtils::EFileType fileType,
-                    int scale,
-                    int step,
-                    const std::string& name)
-{
-    const ROI downscaledROI = downscaleROI(roi, scale * step);
-    const int width = int(downscaledROI.width());
-    const int height = int(downscaledROI.height());
-
-    // copy map from device pitched memory to host memory
-    CudaHostMemoryHeap<float3, 2> map_hmh(in_map_dmp.getSize());
-    map_hmh.copyFrom(in_map_dmp);
-
-    // copy map from host memory to an Image
-    image::Image<image::RGBfColor> map(width, height, true, {0.f, 0.f, 0.f});
-
-    for (size_t x = 0; x < size_t(width); ++x)
-    {
-        for (size_t y = 0; y < size_t(height); ++y)
-        {
-            const float3& rgba_hmh = map_hmh(x, y);
-            image::RGBfColor& rgb = map(int(y), int(x));
-            rgb.r() = rgba_hmh.x;
-            rgb.g() = rgba_hmh.y;
-            rgb.b() = rgba_hmh.z;
-        }
-    }
-
-    // write map from the image buffer
-    mvsUtils::writeMap(rc, mp, fileType, tileParams, roi, map, scale, step, (name.empty()) ? "" : "_" + name);
-}
-
-void writeDeviceImage(const CudaDeviceMemoryPitched<CudaRGBA, 2>& in_img_dmp, const std::string& path)
-{
-    const CudaSize<2>& imgSize = in_img_dmp.getSize();
-
-    // copy image from device pitched memory to host memory
-    CudaHostMemoryHeap<CudaRGBA, 2> img_hmh(imgSize);
-    img_hmh.copyFrom(in_img_dmp);
-
-    // copy image from host memory to an Image
-    image::Image<image::RGBfColor> img(imgSize.x(), imgSize.y(), true, {0.f, 0.f, 0.f});
-
-    for (size_t x = 0; x < imgSize.x(); ++x)
-    {
-        for (size_t y = 0; y < imgSize.y(); ++y)
-        {
-            const CudaRGBA& rgba_hmh = img_hmh(x, y);
-            image::RGBfColor& rgb = img(int(y), int(x));
-            rgb.r() = rgba_hmh.x;
-            rgb.g() = rgba_hmh.y;
-            rgb.b() = rgba_hmh.z;
-        }
-    }
-
-    // write the image buffer
-    image::writeImage(
-      path, img, image::ImageWriteOptions().toColorSpace(image::EImageColorSpace::NO_CONVERSION).storageDataType(image::EStorageDataType::Float));
-}
-
-void writeNormalMap(int rc,
-                    const mvsUtils::MultiViewParams& mp,
-                    const mvsUtils::TileParams& tileParams,
-                    const ROI& roi,
-                    const CudaDeviceMemoryPitched<float3, 2>& in_normalMap_dmp,
-                    int scale,
-                    int step,
-                    const std::string& name)
-{
-    writeFloat3Map(rc, mp, tileParams, roi, in_normalMap_dmp, mvsUtils::EFileType::normalMap, scale, step, name);
-}
-
-void writeNormalMapFiltered(int rc,
-                            const mvsUtils::MultiViewParams& mp,
-                            const mvsUtils::TileParams& tileParams,
-                            const ROI& roi,
-                            const CudaDeviceMemoryPitched<float3, 2>& in_normalMap_dmp,
-                            int scale,
-                            int step,
-                            const std::string& name)
-{
-    writeFloat3Map(rc, mp, tileParams, roi, in_normalMap_dmp, mvsUtils::EFileType::normalMapFiltered, scale, step, name);
-}
-
-void writeDepthThicknessMap(int rc,
-                            const mvsUtils::MultiViewParams& mp,
-                            const mvsUtils::TileParams& tileParams,
-                            const ROI& roi,
-                            const CudaDeviceMemoryPitched<float2, 2>& in_depthThicknessMap_dmp,
-                            int scale,
-                            int step,
-                            const std::string& name)
-{
-    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
-    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::thicknessMap;
-
-    writeFloat2Map(rc, mp, tileParams, roi, in_depthThicknessMap_dmp, fileTypeX, fileTypeY, scale, step, name);
-}
-
-void writeDepthPixSizeMap(int rc,
-                          const mvsUtils::MultiViewParams& mp,
-                          const mvsUtils::TileParams& tileParams,
-                          const ROI& roi,
-                          const CudaDeviceMemoryPitched<float2, 2>& in_depthPixSize_dmp,
-                          int scale,
-                          int step,
-                          const std::string& name)
-{
-    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
-    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::pixSizeMap;
-
-    writeFloat2Map(rc, mp, tileParams, roi, in_depthPixSize_dmp, fileTypeX, fileTypeY, scale, step, name);
-}
-
-void writeDepthSimMap(int rc,
-                      const mvsUtils::MultiViewParams& mp,
-                      const mvsUtils::TileParams& tileParams,
-                      const ROI& roi,
-                      const CudaDeviceMemoryPitched<float2, 2>& in_depthSimMap_dmp,
-                      int scale,
-                      int step,
-                      const std::string& name)
-{
-    const mvsUtils::EFileType fileTypeX = mvsUtils::EFileType::depthMap;
-    const mvsUtils::EFileType fileTypeY = mvsUtils::EFileType::simMap;
-
-    writeFloat2Map(rc, mp, tileParams, roi, in_depthSimMap_dmp, fileTypeX, fileTypeY, scale, step, name);
-}
-
 void writeDepthSimMapFromTileList(int rc,
                                   const mvsUtils::MultiViewParams& mp,
                                   const mvsUtils::TileParams& tileParams,
                                   const std::vector<ROI>& tileRoiList,
-                                  const std::vector<CudaHostMemoryHeap<float2, 2>>& in_depthSimMapTiles_hmh,
+                                  std::vector<image::Image<float>>& inout_depthMapTiles,
+                                  std::vector<image::Image<float>>& inout_simMapTiles,
                                   int scale,
                                   int step,
                                   const std::string& name)
@@ -268,15 +50,9 @@ void writeDepthSimMapFromTileList(int rc,
         if (roi.isEmpty())
             continue;
 
-        image::Image<float> tileDepthMap;
-        image::Image<float> tileSimMap;
-
-        // copy tile depth/sim map from host memory
-        copyFloat2Map(tileDepthMap, tileSimMap, in_depthSimMapTiles_hmh.at(i), roi, scaleStep);
-
         // add tile maps to the full-size maps with weighting
-        mvsUtils::addTileMapWeighted(rc, mp, tileParams, roi, scaleStep, tileDepthMap, depthMap);
-        mvsUtils::addTileMapWeighted(rc, mp, tileParams, roi, scaleStep, tileSimMap, simMap);
+        mvsUtils::addTileMapWeighted(rc, mp, tileParams, roi, scaleStep, inout_depthMapTiles.at(i), depthMap);
+        mvsUtils::addTileMapWeighted(rc, mp, tileParams, roi, scaleStep, inout_simMapTiles.at(i), simMap);
     }
 
     // write fullsize maps on disk
@@ -284,21 +60,6 @@ void writeDepthSimMapFromTileList(int rc,
     mvsUtils::writeMap(rc, mp, mvsUtils::EFileType::simMap, simMap, scale, step, customSuffix);      // write the merged similarity map
 }
 
-void resetDepthSimMap(CudaHostMemoryHeap<float2, 2>& inout_depthSimMap_hmh, float depth, float sim)
-{
-    const CudaSize<2>& depthSimMapSize = inout_depthSimMap_hmh.getSize();
-
-    for (size_t x = 0; x < depthSimMapSize.x(); ++x)
-    {
-        for (size_t y = 0; y < depthSimMapSize.y(); ++y)
-        {
-            float2& depthSim_hmh = inout_depthSimMap_hmh(x, y);
-            depthSim_hmh.x = depth;
-            depthSim_hmh.y = sim;
-        }
-    }
-}
-
 void mergeNormalMapTiles(int rc, const mvsUtils::MultiViewParams& mp, int scale, int step, const std::string& name)
 {
     const std::string customSuffix = (name.empty()) ? "" : "_" + name;
@@ -0,0 +1,46 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "Descriptor.hpp"
+
+#include <boost/iostreams/device/mapped_file.hpp>
+
+#include <cstring>
+#include <filesystem>
+#include <stdexcept>
+
+namespace aliceVision {
+namespace feature {
+
+std::shared_ptr<const char> mapDescsBinFile(const std::string& sfileNameDescs, std::size_t oneDescSize, std::size_t& cardDesc)
+{
+    namespace fs = std::filesystem;
+
+    std::error_code ec;
+    const std::uintmax_t fileSize = fs::file_size(sfileNameDescs, ec);
+    if (ec)
+        throw std::runtime_error("Can't map descriptor binary file, can't open '" + sfileNameDescs + "' !");
+    if (fileSize < sizeof(std::size_t))
+        throw std::runtime_error("Can't map descriptor binary file, '" + sfileNameDescs + "' is incorrect !");
+
+    auto file = std::make_shared<boost::iostreams::mapped_file_source>(sfileNameDescs);
+    if (!file->is_open())
+        throw std::runtime_error("Can't map descriptor binary file, can't open '" + sfileNameDescs + "' !");
+
+    // the number of descriptors is stored before the descriptors
+    std::memcpy(&cardDesc, file->data(), sizeof(std::size_t));
+    if (cardDesc > (fileSize - sizeof(std::size_t)) / oneDescSize)
+        throw std::runtime_error("Can't map descriptor binary file, '" + sfileNameDescs + "' is incorrect !");
+
+    if (cardDesc == 0)
+        return nullptr;
+
+    // aliasing constructor: the pointer to the descriptors shares the ownership of the mapping
+    return std::shared_ptr<const char>(file, file->data() + sizeof(std::size_t));
+}
+
+}  // namespace feature
+}  // namespace aliceVision
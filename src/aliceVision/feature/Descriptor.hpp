@@ -12,6 +12,7 @@
 #include <iostream>
 #include <iterator>
 #include <fstream>
+#include <memory>
 #include <string>
 #include <vector>
 #include <exception>
@@ -281,6 +282,33 @@ inline void loadDescsFromBinFile(const std::string& sfileNameDescs, std::vector<
     fileIn.close();
 }
 
+/**
+ * @brief Memory-map a binary descriptor file (.desc) instead of reading it.
+ *        The descriptors stay in the page cache and are read on demand by the system.
+ * @param[in] sfileNameDescs The file name (usually .desc)
+ * @param[in] oneDescSize The memory size of one descriptor stored in the file
+ * @param[out] cardDesc The number of descriptors in the file
+ * @return a pointer to the first descriptor, sharing the ownership of the mapping (null if the file has no descriptor)
+ */
+std::shared_ptr<const char> mapDescsBinFile(const std::string& sfileNameDescs, std::size_t oneDescSize, std::size_t& cardDesc);
+
+/**
+ * @brief Memory-map a binary descriptor file (.desc) whose descriptors have the \p DescriptorT type.
+ * @see mapDescsBinFile
+ * @param[in] sfileNameDescs The file name (usually .desc)
+ * @param[out] cardDesc The number of descriptors in the file
+ * @return a pointer to the first descriptor, sharing the ownership of the mapping (null if the file has no descriptor)
+ */
+template<typename DescriptorT>
+inline std::shared_ptr<const DescriptorT> mapDescsFromBinFile(const std::string& sfileNameDescs, std::size_t& cardDesc)
+{
+    static_assert(sizeof(DescriptorT) == DescriptorT::static_size * sizeof(typename DescriptorT::bin_type),
+                  "The descriptors must have the same layout in memory and in the file.");
+
+    const std::shared_ptr<const char> data = mapDescsBinFile(sfileNameDescs, sizeof(DescriptorT), cardDesc);
+    return std::shared_ptr<const DescriptorT>(data, reinterpret_cast<const DescriptorT*>(data.get()));
+}
+
 /// Write descriptors to file (in binary mode)
 template<typename DescriptorsT>
 inline void saveDescsToBinFile(const std::string& sfileNameDescs, DescriptorsT& vec_desc)
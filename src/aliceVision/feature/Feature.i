@@ -0,0 +1,21 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%module (module="pyalicevision") feature
+
+%include <aliceVision/global.i>
+
+%include <aliceVision/feature/imageDescriberCommon.i>
+%include <aliceVision/feature/PointFeature.i>
+%include <aliceVision/feature/Regions.i>
+%include <aliceVision/feature/ImageDescriber.i>
+%include <aliceVision/feature/FeaturesPerView.i>
+
+%include <aliceVision/sfm/pipeline/regionsIO.i>
+
+%{
+using namespace aliceVision;
+%}
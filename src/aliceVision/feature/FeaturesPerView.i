@@ -0,0 +1,39 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/feature/imageDescriberCommon.i>
+%include <aliceVision/feature/PointFeature.i>
+
+%ignore aliceVision::feature::FeaturesPerView::getFeaturesPerDesc;
+%ignore aliceVision::feature::FeaturesPerView::getDataPerDesc;
+%ignore aliceVision::feature::FeaturesPerView::getData;
+
+%include <aliceVision/feature/FeaturesPerView.hpp>
+
+%{
+#include <aliceVision/feature/FeaturesPerView.hpp>
+%}
+
+%inline %{
+PyObject* _featuresPerViewToPython(PyObject* owner,
+                                   const aliceVision::feature::FeaturesPerView& featuresPerView,
+                                   IndexT viewId,
+                                   aliceVision::feature::EImageDescriberType descType)
+{
+    return aliceVision::numpy::pointFeaturesToPython(owner, featuresPerView.getFeatures(viewId, descType));
+}
+%}
+
+%extend aliceVision::feature::FeaturesPerView {
+    %pythoncode %{
+        def getFeaturesArray(self, viewId, descType):
+            """ Get the features of a view as a read-only (n, 4) float32 array of [x, y, scale, orientation] rows,
+            sharing the memory of the container. The array keeps the container alive, but becomes invalid
+            if the features of the view are replaced. """
+            return _featuresPerViewToPython(self, self, viewId, descType)
+    %}
+};
@@ -0,0 +1,23 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/feature/imageDescriberCommon.i>
+%include <aliceVision/feature/Regions.i>
+
+%include <std_unique_ptr.i>
+
+%unique_ptr(aliceVision::feature::ImageDescriber)
+
+// Image describers are only used to load regions: the extraction itself is not bound
+%ignore aliceVision::feature::ImageDescriber::describe;
+%ignore aliceVision::feature::ImageDescriber::allocate;
+
+%include <aliceVision/feature/ImageDescriber.hpp>
+
+%{
+#include <aliceVision/feature/ImageDescriber.hpp>
+%}
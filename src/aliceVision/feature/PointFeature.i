@@ -0,0 +1,40 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+
+// Only the const getters are bound
+%ignore aliceVision::feature::PointFeature::x();
+%ignore aliceVision::feature::PointFeature::y();
+%ignore aliceVision::feature::PointFeature::coords();
+%ignore aliceVision::feature::PointFeature::scale();
+%ignore aliceVision::feature::PointFeature::orientation();
+
+%include <aliceVision/feature/PointFeature.hpp>
+
+%{
+#include <aliceVision/feature/PointFeature.hpp>
+
+namespace aliceVision {
+namespace numpy {
+
+/**
+ * @brief Expose point features as a read-only (n, 4) float32 NumPy array of [x, y, scale, orientation] rows,
+ *        sharing the memory of the features.
+ * @param[in] owner the Python object owning the features, kept alive by the array
+ * @param[in] features the point features
+ */
+inline PyObject* pointFeaturesToPython(PyObject* owner, const std::vector<aliceVision::feature::PointFeature>& features)
+{
+    static_assert(sizeof(aliceVision::feature::PointFeature) == 4 * sizeof(float), "PointFeature is expected to only store 4 floats");
+    return viewToPython(owner, reinterpret_cast<const float*>(features.data()), features.size(), 4, sizeof(aliceVision::feature::PointFeature));
+}
+
+}  // namespace numpy
+}  // namespace aliceVision
+%}
+
+%template(PointFeatures) std::vector<aliceVision::feature::PointFeature>;
@@ -15,6 +15,7 @@
 
 #include <string>
 #include <cstddef>
+#include <stdexcept>
 #include <typeinfo>
 #include <memory>
 
@@ -71,6 +72,13 @@ class Regions
 
     virtual void Load(const std::string& sfileNameFeats, const std::string& sfileNameDescs) = 0;
 
+    /**
+     * @brief Read the region features and memory-map the descriptors file instead of reading it.
+     *        The descriptors stay in the page cache and are read on demand, which keeps the memory footprint low
+     *        when the regions of many views are loaded. The descriptors file must not be modified while it is mapped.
+     */
+    virtual void LoadMapped(const std::string& sfileNameFeats, const std::string& sfileNameDescs) = 0;
+
     virtual void Save(const std::string& sfileNameFeats, const std::string& sfileNameDescs) const = 0;
 
     virtual void SaveDesc(const std::string& sfileNameDescs) const = 0;
@@ -85,10 +93,14 @@ class Regions
     virtual std::string Type_id() const = 0;
     virtual std::size_t DescriptorLength() const = 0;
 
+    /// Return the number of loaded descriptors (0 when only the features are loaded)
+    virtual std::size_t DescriptorCount() const = 0;
+
     /**
      * @brief Return a blind pointer to the container of the descriptors array.
      *
-     * @note: Descriptors are always stored as an std::vector<DescType>.
+     * @note: Descriptors are stored as an std::vector<DescType>, unless they are memory-mapped (see LoadMapped).
+     *        Throw std::logic_error on memory-mapped descriptors.
      */
     virtual const void* blindDescriptors() const = 0;
 
@@ -151,11 +163,33 @@ class FeatDescRegions : public Regions
     typedef std::vector<DescriptorT> DescsT;
 
   protected:
-    std::vector<DescriptorT> _vec_descs;  // region descriptions
+    std::vector<DescriptorT> _vec_descs;              // region descriptions
+    std::shared_ptr<const DescriptorT> _mappedDescs;  // region descriptions in a memory-mapped file
+    std::size_t _mappedDescsCount = 0;
+
+    /// Return the first descriptor, either in memory or in the memory-mapped file
+    inline const DescriptorT* descriptorData() const { return _mappedDescs ? _mappedDescs.get() : _vec_descs.data(); }
+
+    /// The descriptors vector is empty when the descriptors are memory-mapped
+    void throwIfMapped() const
+    {
+        if (_mappedDescs)
+            throw std::logic_error("The descriptors are memory-mapped, they cannot be accessed as a vector of descriptors.");
+    }
+
+    /// Copy the memory-mapped descriptors in memory and release the mapping
+    void unmapDescriptors()
+    {
+        if (_mappedDescs)
+            _vec_descs.assign(_mappedDescs.get(), _mappedDescs.get() + _mappedDescsCount);
+        _mappedDescs.reset();
+        _mappedDescsCount = 0;
+    }
 
   public:
     std::string Type_id() const override { return typeid(T).name(); }
     std::size_t DescriptorLength() const override { return static_cast<std::size_t>(L); }
+    std::size_t DescriptorCount() const override { return _mappedDescs ? _mappedDescsCount : _vec_descs.size(); }
 
     bool IsScalar() const override { return regionType == ERegionType::Scalar; }
     bool IsBinary() const override { return regionType == ERegionType::Binary; }
@@ -167,43 +201,88 @@ class FeatDescRegions : public Regions
     {
         loadFeatsFromFile(sfileNameFeats, this->_vec_feats);
         loadDescsFromBinFile(sfileNameDescs, _vec_descs);
+        _mappedDescs.reset();
+        _mappedDescsCount = 0;
+    }
+
+    /// Read from file the regions and memory-map their corresponding descriptors.
+    void LoadMapped(const std::string& sfileNameFeats, const std::string& sfileNameDescs) override
+    {
+        loadFeatsFromFile(sfileNameFeats, this->_vec_feats);
+        _vec_descs.clear();
+        _vec_descs.shrink_to_fit();
+        _mappedDescs = mapDescsFromBinFile<DescriptorT>(sfileNameDescs, _mappedDescsCount);
     }
 
     /// Export in two separate files the regions and their corresponding descriptors.
     void Save(const std::string& sfileNameFeats, const std::string& sfileNameDescs) const override
     {
         saveFeatsToFile(sfileNameFeats, this->_vec_feats);
-        saveDescsToBinFile(sfileNameDescs, _vec_descs);
+        SaveDesc(sfileNameDescs);
     }
 
-    void SaveDesc(const std::string& sfileNameDescs) const override { saveDescsToBinFile(sfileNameDescs, _vec_descs); }
+    void SaveDesc(const std::string& sfileNameDescs) const override
+    {
+        if (_mappedDescs)
+        {
+            const std::vector<DescriptorT> descs(_mappedDescs.get(), _mappedDescs.get() + _mappedDescsCount);
+            saveDescsToBinFile(sfileNameDescs, descs);
+        }
+        else
+        {
+            saveDescsToBinFile(sfileNameDescs, _vec_descs);
+        }
+    }
 
-    /// Mutable and non-mutable DescriptorT getters.
-    inline std::vector<DescriptorT>& Descriptors() { return _vec_descs; }
-    inline const std::vector<DescriptorT>& Descriptors() const { return _vec_descs; }
+    /**
+     * @brief Mutable and non-mutable DescriptorT getters.
+     * @note The mutable getter copies memory-mapped descriptors in memory,
+     *       the non-mutable getter throws on memory-mapped descriptors (use DescriptorRawData and DescriptorCount).
+     */
+    inline std::vector<DescriptorT>& Descriptors()
+    {
+        unmapDescriptors();
+        return _vec_descs;
+    }
+    inline const std::vector<DescriptorT>& Descriptors() const
+    {
+        throwIfMapped();
+        return _vec_descs;
+    }
 
-    inline const void* blindDescriptors() const override { return &_vec_descs; }
+    inline const void* blindDescriptors() const override
+    {
+        throwIfMapped();
+        return &_vec_descs;
+    }
 
-    inline const void* DescriptorRawData() const override { return &_vec_descs[0]; }
+    inline const void* DescriptorRawData() const override { return descriptorData(); }
 
-    inline void clearDescriptors() override { _vec_descs.clear(); }
+    inline void clearDescriptors() override
+    {
+        _vec_descs.clear();
+        _mappedDescs.reset();
+        _mappedDescsCount = 0;
+    }
 
     inline void swap(This& other)
     {
         this->_vec_feats.swap(other._vec_feats);
         _vec_descs.swap(other._vec_descs);
+        _mappedDescs.swap(other._mappedDescs);
+        std::swap(_mappedDescsCount, other._mappedDescsCount);
     }
 
     // Return the distance between two descriptors
     double SquaredDescriptorDistance(std::size_t i, const Regions* genericRegions, std::size_t j) const override
     {
-        assert(i < this->_vec_descs.size());
+        assert(i < DescriptorCount());
         assert(genericRegions);
         assert(j < genericRegions->RegionCount());
 
         const This* regionsT = dynamic_cast<const This*>(genericRegions);
         static typename SquaredMetric<T, regionType>::Metric metric;
-        return metric(this->_vec_descs[i].getData(), regionsT->_vec_descs[j].getData(), DescriptorT::static_size);
+        return metric(descriptorData()[i].getData(), regionsT->descriptorData()[j].getData(), DescriptorT::static_size);
     }
 
     /**
@@ -213,9 +292,9 @@ class FeatDescRegions : public Regions
      */
     void CopyRegion(std::size_t i, Regions* outRegionContainer) const override
     {
-        assert(i < this->_vec_feats.size() && i < this->_vec_descs.size());
+        assert(i < this->_vec_feats.size() && i < DescriptorCount());
         static_cast<This*>(outRegionContainer)->_vec_feats.push_back(this->_vec_feats[i]);
-        static_cast<This*>(outRegionContainer)->_vec_descs.push_back(this->_vec_descs[i]);
+        static_cast<This*>(outRegionContainer)->Descriptors().push_back(descriptorData()[i]);
     }
 
     /**
@@ -240,7 +319,7 @@ class FeatDescRegions : public Regions
         {
             const FeatureInImage& feat = featuresInImage[i];
             regionsPtr->Features().push_back(this->_vec_feats[feat._featureIndex]);
-            regionsPtr->Descriptors().push_back(this->_vec_descs[feat._featureIndex]);
+            regionsPtr->Descriptors().push_back(descriptorData()[feat._featureIndex]);
 
             // This assert should be valid in theory, but in the context of CameraLocalization
             // we can have the same 2D feature associated to different 3D points (2 in practice).
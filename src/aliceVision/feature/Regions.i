@@ -0,0 +1,86 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/feature/PointFeature.i>
+
+%include <std_unique_ptr.i>
+
+// Regions returned by the loaders are owned by Python
+%unique_ptr(aliceVision::feature::Regions)
+
+%ignore aliceVision::feature::FeatureInImage;
+%ignore aliceVision::feature::Regions::Features;
+%ignore aliceVision::feature::Regions::GetRegionsPositions;
+%ignore aliceVision::feature::Regions::blindDescriptors;
+%ignore aliceVision::feature::Regions::DescriptorRawData;
+%ignore aliceVision::feature::Regions::CopyRegion;
+%ignore aliceVision::feature::Regions::EmptyClone;
+%ignore aliceVision::feature::Regions::createFilteredRegions;
+
+%include <aliceVision/feature/Regions.hpp>
+
+%{
+#include <aliceVision/feature/Regions.hpp>
+
+#include <typeinfo>
+
+namespace aliceVision {
+namespace numpy {
+
+/**
+ * @brief Expose the descriptors of regions as a read-only (n, descriptor length) NumPy array,
+ *        sharing the memory of the descriptors.
+ * @param[in] owner the Python object owning the regions, kept alive by the array
+ * @param[in] regions the regions
+ */
+inline PyObject* descriptorsToPython(PyObject* owner, const aliceVision::feature::Regions& regions)
+{
+    const npy_intp count = regions.DescriptorCount();
+    const npy_intp length = regions.DescriptorLength();
+    const void* data = count > 0 ? regions.DescriptorRawData() : nullptr;
+
+    if (regions.Type_id() == typeid(unsigned char).name())
+        return viewToPython(owner, static_cast<const unsigned char*>(data), count, length, length * sizeof(unsigned char));
+    else if (regions.Type_id() == typeid(float).name())
+        return viewToPython(owner, static_cast<const float*>(data), count, length, length * sizeof(float));
+    else if (regions.Type_id() == typeid(double).name())
+        return viewToPython(owner, static_cast<const double*>(data), count, length, length * sizeof(double));
+
+    PyErr_Format(PyExc_TypeError, "Unsupported descriptor type: %s.", regions.Type_id().c_str());
+    return nullptr;
+}
+
+}  // namespace numpy
+}  // namespace aliceVision
+%}
+
+%inline %{
+PyObject* _regionsFeaturesToPython(PyObject* owner, const aliceVision::feature::Regions& regions)
+{
+    return aliceVision::numpy::pointFeaturesToPython(owner, regions.Features());
+}
+
+PyObject* _regionsDescriptorsToPython(PyObject* owner, const aliceVision::feature::Regions& regions)
+{
+    return aliceVision::numpy::descriptorsToPython(owner, regions);
+}
+%}
+
+// Features and descriptors are returned as read-only NumPy arrays sharing the memory of the regions.
+// The arrays keep the regions alive, but become invalid if the regions are loaded again or their descriptors cleared.
+%extend aliceVision::feature::Regions {
+    %pythoncode %{
+        def getFeaturesArray(self):
+            """ Get the features as a (n, 4) float32 array of [x, y, scale, orientation] rows. """
+            return _regionsFeaturesToPython(self, self)
+
+        def getDescriptorsArray(self):
+            """ Get the descriptors as a (n, DescriptorLength()) array of the descriptor type
+            (empty when only the features are loaded). """
+            return _regionsDescriptorsToPython(self, self)
+    %}
+};
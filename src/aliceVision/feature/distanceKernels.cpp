@@ -0,0 +1,438 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "distanceKernels.hpp"
+
+#include <aliceVision/system/cpu.hpp>
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+
+#if defined(__x86_64__) || defined(_M_X64)
+    #define ALICEVISION_DISTANCE_KERNELS_X86
+    #include <immintrin.h>
+    #if defined(_MSC_VER) && !defined(__clang__)
+        // MSVC accepts the intrinsics of all the instruction sets in any function
+        #define ALICEVISION_TARGET_AVX2
+        #define ALICEVISION_TARGET_POPCNT
+    #else
+        #define ALICEVISION_TARGET_AVX2 __attribute__((target("avx2,popcnt")))
+        #define ALICEVISION_TARGET_POPCNT __attribute__((target("popcnt")))
+    #endif
+#endif
+
+namespace aliceVision {
+namespace feature {
+namespace {
+
+inline std::size_t rowOffset(const int* rowIndices, int i, int dimension)
+{
+    return static_cast<std::size_t>(rowIndices ? rowIndices[i] : i) * dimension;
+}
+
+template<typename Metric, typename T, typename ResultT>
+void oneToManyScalar(const T* query, const T* dataset, const int* rowIndices, int nbRows, int dimension, ResultT* distances)
+{
+    Metric metric;
+    for (int i = 0; i < nbRows; ++i)
+        distances[i] = metric(query, dataset + rowOffset(rowIndices, i, dimension), dimension);
+}
+
+void squaredL2DoubleScalar(const unsigned char* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        double distance = 0.0;
+        for (int k = 0; k < dimension; ++k)
+        {
+            const double diff = static_cast<double>(query[k]) - static_cast<double>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+void squaredL2DoubleScalar(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        double distance = 0.0;
+        for (int k = 0; k < dimension; ++k)
+        {
+            const double diff = static_cast<double>(query[k]) - static_cast<double>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+
+bool useAVX2()
+{
+    static const bool avx2 = system::cpu_supports_avx2();
+    return avx2;
+}
+
+bool usePopcnt()
+{
+    static const bool popcnt = system::cpu_supports_popcnt();
+    return popcnt;
+}
+
+//
+// SSE2 kernels
+//
+
+void squaredL2SSE2(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+    const __m128i zero = _mm_setzero_si128();
+    const int vectorEnd = dimension - dimension % 16;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const unsigned char* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m128i sum = _mm_setzero_si128();
+        for (int k = 0; k < vectorEnd; k += 16)
+        {
+            const __m128i a = _mm_loadu_si128(reinterpret_cast<const __m128i*>(query + k));
+            const __m128i b = _mm_loadu_si128(reinterpret_cast<const __m128i*>(row + k));
+            const __m128i diffLow = _mm_sub_epi16(_mm_unpacklo_epi8(a, zero), _mm_unpacklo_epi8(b, zero));
+            const __m128i diffHigh = _mm_sub_epi16(_mm_unpackhi_epi8(a, zero), _mm_unpackhi_epi8(b, zero));
+            sum = _mm_add_epi32(sum, _mm_madd_epi16(diffLow, diffLow));
+            sum = _mm_add_epi32(sum, _mm_madd_epi16(diffHigh, diffHigh));
+        }
+        sum = _mm_add_epi32(sum, _mm_shuffle_epi32(sum, _MM_SHUFFLE(1, 0, 3, 2)));
+        sum = _mm_add_epi32(sum, _mm_shuffle_epi32(sum, _MM_SHUFFLE(2, 3, 0, 1)));
+        int distance = _mm_cvtsi128_si32(sum);
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const int diff = static_cast<int>(query[k]) - static_cast<int>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = static_cast<float>(distance);
+    }
+}
+
+void squaredL2SSE2(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+    const int vectorEnd = dimension - dimension % 8;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m128 sum0 = _mm_setzero_ps();
+        __m128 sum1 = _mm_setzero_ps();
+        for (int k = 0; k < vectorEnd; k += 8)
+        {
+            const __m128 diff0 = _mm_sub_ps(_mm_loadu_ps(query + k), _mm_loadu_ps(row + k));
+            const __m128 diff1 = _mm_sub_ps(_mm_loadu_ps(query + k + 4), _mm_loadu_ps(row + k + 4));
+            sum0 = _mm_add_ps(sum0, _mm_mul_ps(diff0, diff0));
+            sum1 = _mm_add_ps(sum1, _mm_mul_ps(diff1, diff1));
+        }
+        sum0 = _mm_add_ps(sum0, sum1);
+        sum0 = _mm_add_ps(sum0, _mm_movehl_ps(sum0, sum0));
+        sum0 = _mm_add_ss(sum0, _mm_shuffle_ps(sum0, sum0, 1));
+        float distance = _mm_cvtss_f32(sum0);
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const float diff = query[k] - row[k];
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+//
+// POPCNT kernel
+//
+
+ALICEVISION_TARGET_POPCNT
+void hammingPopcnt(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int nbBytes, unsigned int* distances)
+{
+    const int vectorEnd = nbBytes - nbBytes % 8;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const unsigned char* row = dataset + rowOffset(rowIndices, i, nbBytes);
+        unsigned int distance = 0;
+        for (int k = 0; k < vectorEnd; k += 8)
+        {
+            std::uint64_t a, b;
+            std::memcpy(&a, query + k, sizeof(a));
+            std::memcpy(&b, row + k, sizeof(b));
+            distance += static_cast<unsigned int>(_mm_popcnt_u64(a ^ b));
+        }
+        for (int k = vectorEnd; k < nbBytes; ++k)
+            distance += pop_count_LUT[query[k] ^ row[k]];
+        distances[i] = distance;
+    }
+}
+
+//
+// AVX2 kernels
+//
+
+ALICEVISION_TARGET_AVX2
+inline float horizontalSum(__m256 v)
+{
+    __m128 sum = _mm_add_ps(_mm256_castps256_ps128(v), _mm256_extractf128_ps(v, 1));
+    sum = _mm_add_ps(sum, _mm_movehl_ps(sum, sum));
+    sum = _mm_add_ss(sum, _mm_shuffle_ps(sum, sum, 1));
+    return _mm_cvtss_f32(sum);
+}
+
+ALICEVISION_TARGET_AVX2
+inline double horizontalSum(__m256d v)
+{
+    __m128d sum = _mm_add_pd(_mm256_castpd256_pd128(v), _mm256_extractf128_pd(v, 1));
+    sum = _mm_add_sd(sum, _mm_unpackhi_pd(sum, sum));
+    return _mm_cvtsd_f64(sum);
+}
+
+ALICEVISION_TARGET_AVX2
+void squaredL2AVX2(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+    const int vectorEnd = dimension - dimension % 32;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const unsigned char* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m256i sum = _mm256_setzero_si256();
+        for (int k = 0; k < vectorEnd; k += 32)
+        {
+            // differences of unsigned char fit in 16 bits, squares are summed by pairs in 32 bits
+            const __m256i diff0 = _mm256_sub_epi16(_mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(query + k))),
+                                                   _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(row + k))));
+            const __m256i diff1 = _mm256_sub_epi16(_mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(query + k + 16))),
+                                                   _mm256_cvtepu8_epi16(_mm_loadu_si128(reinterpret_cast<const __m128i*>(row + k + 16))));
+            sum = _mm256_add_epi32(sum, _mm256_madd_epi16(diff0, diff0));
+            sum = _mm256_add_epi32(sum, _mm256_madd_epi16(diff1, diff1));
+        }
+        __m128i sum128 = _mm_add_epi32(_mm256_castsi256_si128(sum), _mm256_extracti128_si256(sum, 1));
+        sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(1, 0, 3, 2)));
+        sum128 = _mm_add_epi32(sum128, _mm_shuffle_epi32(sum128, _MM_SHUFFLE(2, 3, 0, 1)));
+        int distance = _mm_cvtsi128_si32(sum128);
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const int diff = static_cast<int>(query[k]) - static_cast<int>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = static_cast<float>(distance);
+    }
+}
+
+ALICEVISION_TARGET_AVX2
+void squaredL2AVX2(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+    const int vectorEnd = dimension - dimension % 16;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m256 sum0 = _mm256_setzero_ps();
+        __m256 sum1 = _mm256_setzero_ps();
+        for (int k = 0; k < vectorEnd; k += 16)
+        {
+            const __m256 diff0 = _mm256_sub_ps(_mm256_loadu_ps(query + k), _mm256_loadu_ps(row + k));
+            const __m256 diff1 = _mm256_sub_ps(_mm256_loadu_ps(query + k + 8), _mm256_loadu_ps(row + k + 8));
+            sum0 = _mm256_add_ps(sum0, _mm256_mul_ps(diff0, diff0));
+            sum1 = _mm256_add_ps(sum1, _mm256_mul_ps(diff1, diff1));
+        }
+        float distance = horizontalSum(_mm256_add_ps(sum0, sum1));
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const float diff = query[k] - row[k];
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+ALICEVISION_TARGET_AVX2
+void squaredL2DoubleAVX2(const unsigned char* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+    const int vectorEnd = dimension - dimension % 8;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m256d sum0 = _mm256_setzero_pd();
+        __m256d sum1 = _mm256_setzero_pd();
+        for (int k = 0; k < vectorEnd; k += 8)
+        {
+            const __m256i a = _mm256_cvtepu8_epi32(_mm_loadl_epi64(reinterpret_cast<const __m128i*>(query + k)));
+            const __m256d diff0 = _mm256_sub_pd(_mm256_cvtepi32_pd(_mm256_castsi256_si128(a)), _mm256_cvtps_pd(_mm_loadu_ps(row + k)));
+            const __m256d diff1 = _mm256_sub_pd(_mm256_cvtepi32_pd(_mm256_extracti128_si256(a, 1)), _mm256_cvtps_pd(_mm_loadu_ps(row + k + 4)));
+            sum0 = _mm256_add_pd(sum0, _mm256_mul_pd(diff0, diff0));
+            sum1 = _mm256_add_pd(sum1, _mm256_mul_pd(diff1, diff1));
+        }
+        double distance = horizontalSum(_mm256_add_pd(sum0, sum1));
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const double diff = static_cast<double>(query[k]) - static_cast<double>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+ALICEVISION_TARGET_AVX2
+void squaredL2DoubleAVX2(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+    const int vectorEnd = dimension - dimension % 8;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const float* row = dataset + rowOffset(rowIndices, i, dimension);
+        __m256d sum0 = _mm256_setzero_pd();
+        __m256d sum1 = _mm256_setzero_pd();
+        for (int k = 0; k < vectorEnd; k += 8)
+        {
+            const __m256d diff0 = _mm256_sub_pd(_mm256_cvtps_pd(_mm_loadu_ps(query + k)), _mm256_cvtps_pd(_mm_loadu_ps(row + k)));
+            const __m256d diff1 = _mm256_sub_pd(_mm256_cvtps_pd(_mm_loadu_ps(query + k + 4)), _mm256_cvtps_pd(_mm_loadu_ps(row + k + 4)));
+            sum0 = _mm256_add_pd(sum0, _mm256_mul_pd(diff0, diff0));
+            sum1 = _mm256_add_pd(sum1, _mm256_mul_pd(diff1, diff1));
+        }
+        double distance = horizontalSum(_mm256_add_pd(sum0, sum1));
+        for (int k = vectorEnd; k < dimension; ++k)
+        {
+            const double diff = static_cast<double>(query[k]) - static_cast<double>(row[k]);
+            distance += diff * diff;
+        }
+        distances[i] = distance;
+    }
+}
+
+ALICEVISION_TARGET_AVX2
+void hammingAVX2(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int nbBytes, unsigned int* distances)
+{
+    // population count of the 4 bits values (Mula's algorithm)
+    const __m256i lookup = _mm256_setr_epi8(0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4, 0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4);
+    const __m256i lowMask = _mm256_set1_epi8(0x0f);
+    const int vectorEnd = nbBytes - nbBytes % 32;
+    for (int i = 0; i < nbRows; ++i)
+    {
+        const unsigned char* row = dataset + rowOffset(rowIndices, i, nbBytes);
+        __m256i sum = _mm256_setzero_si256();
+        for (int k = 0; k < vectorEnd; k += 32)
+        {
+            const __m256i x = _mm256_xor_si256(_mm256_loadu_si256(reinterpret_cast<const __m256i*>(query + k)),
+                                               _mm256_loadu_si256(reinterpret_cast<const __m256i*>(row + k)));
+            const __m256i count = _mm256_add_epi8(_mm256_shuffle_epi8(lookup, _mm256_and_si256(x, lowMask)),
+                                                  _mm256_shuffle_epi8(lookup, _mm256_and_si256(_mm256_srli_epi16(x, 4), lowMask)));
+            sum = _mm256_add_epi64(sum, _mm256_sad_epu8(count, _mm256_setzero_si256()));
+        }
+        const __m128i sum128 = _mm_add_epi64(_mm256_castsi256_si128(sum), _mm256_extracti128_si256(sum, 1));
+        unsigned int distance = static_cast<unsigned int>(_mm_cvtsi128_si32(sum128) + _mm_extract_epi32(sum128, 2));
+        for (int k = vectorEnd; k < nbBytes; ++k)
+            distance += static_cast<unsigned int>(_mm_popcnt_u32(query[k] ^ row[k]));
+        distances[i] = distance;
+    }
+}
+
+#endif  // ALICEVISION_DISTANCE_KERNELS_X86
+
+/// Number of bytes of the blocks of rows compared to all the queries
+const std::size_t kBlockBytes = 32 * 1024;
+
+template<typename T, typename ResultT, typename OneToMany>
+void manyToMany(const T* queries, int nbQueries, const T* dataset, int nbRows, int dimension, ResultT* distances, OneToMany oneToMany)
+{
+    const int blockRows = std::max(1, static_cast<int>(kBlockBytes / (std::max(dimension, 1) * sizeof(T))));
+    for (int firstRow = 0; firstRow < nbRows; firstRow += blockRows)
+    {
+        const int nbBlockRows = std::min(blockRows, nbRows - firstRow);
+        for (int q = 0; q < nbQueries; ++q)
+        {
+            oneToMany(queries + static_cast<std::size_t>(q) * dimension,
+                      dataset + static_cast<std::size_t>(firstRow) * dimension,
+                      nullptr,
+                      nbBlockRows,
+                      dimension,
+                      distances + static_cast<std::size_t>(q) * nbRows + firstRow);
+        }
+    }
+}
+
+}  // namespace
+
+void squaredL2OneToMany(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+    if (useAVX2())
+        return squaredL2AVX2(query, dataset, rowIndices, nbRows, dimension, distances);
+    return squaredL2SSE2(query, dataset, rowIndices, nbRows, dimension, distances);
+#else
+    oneToManyScalar<L2_Vectorized<unsigned char>>(query, dataset, rowIndices, nbRows, dimension, distances);
+#endif
+}
+
+void squaredL2OneToMany(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, float* distances)
+{
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+    if (useAVX2())
+        return squaredL2AVX2(query, dataset, rowIndices, nbRows, dimension, distances);
+    return squaredL2SSE2(query, dataset, rowIndices, nbRows, dimension, distances);
+#else
+    oneToManyScalar<L2_Simple<float>>(query, dataset, rowIndices, nbRows, dimension, distances);
+#endif
+}
+
+void squaredL2OneToMany(const unsigned char* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+    if (useAVX2())
+        return squaredL2DoubleAVX2(query, dataset, rowIndices, nbRows, dimension, distances);
+#endif
+    squaredL2DoubleScalar(query, dataset, rowIndices, nbRows, dimension, distances);
+}
+
+void squaredL2OneToMany(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances)
+{
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+    if (useAVX2())
+        return squaredL2DoubleAVX2(query, dataset, rowIndices, nbRows, dimension, distances);
+#endif
+    squaredL2DoubleScalar(query, dataset, rowIndices, nbRows, dimension, distances);
+}
+
+void hammingOneToMany(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int nbBytes, unsigned int* distances)
+{
+#ifdef ALICEVISION_DISTANCE_KERNELS_X86
+    if (useAVX2())
+        return hammingAVX2(query, dataset, rowIndices, nbRows, nbBytes, distances);
+    if (usePopcnt())
+        return hammingPopcnt(query, dataset, rowIndices, nbRows, nbBytes, distances);
+#endif
+    oneToManyScalar<Hamming<unsigned char>>(query, dataset, rowIndices, nbRows, nbBytes, distances);
+}
+
+void squaredL2ManyToMany(const unsigned char* queries, int nbQueries, const unsigned char* dataset, int nbRows, int dimension, float* distances)
+{
+    manyToMany(queries,
+               nbQueries,
+               dataset,
+               nbRows,
+               dimension,
+               distances,
+               static_cast<void (*)(const unsigned char*, const unsigned char*, const int*, int, int, float*)>(&squaredL2OneToMany));
+}
+
+void squaredL2ManyToMany(const float* queries, int nbQueries, const float* dataset, int nbRows, int dimension, float* distances)
+{
+    manyToMany(queries,
+               nbQueries,
+               dataset,
+               nbRows,
+               dimension,
+               distances,
+               static_cast<void (*)(const float*, const float*, const int*, int, int, float*)>(&squaredL2OneToMany));
+}
+
+void hammingManyToMany(const unsigned char* queries, int nbQueries, const unsigned char* dataset, int nbRows, int nbBytes, unsigned int* distances)
+{
+    manyToMany(queries, nbQueries, dataset, nbRows, nbBytes, distances, &hammingOneToMany);
+}
+
+}  // namespace feature
+}  // namespace aliceVision
@@ -0,0 +1,163 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "metric.hpp"
+
+#include <cstddef>
+
+// Batched distance kernels:
+// The distances between one query and many rows of a dataset are computed in a single call,
+// so that the query stays in registers and the rows are streamed.
+// The x86 kernels use AVX2 or SSE2 depending on the CPU (detected at runtime),
+// the other platforms use the scalar metrics.
+
+namespace aliceVision {
+namespace feature {
+
+/**
+ * @brief Squared L2 distances between a query and rows of a dataset.
+ * @param[in] query the query descriptor (dimension values)
+ * @param[in] dataset the rows of the dataset, stored contiguously (dimension values per row)
+ * @param[in] rowIndices the indices of the rows to use, or nullptr to use the nbRows first rows
+ * @param[in] nbRows the number of distances to compute
+ * @param[in] dimension the length of the descriptors
+ * @param[out] distances the nbRows distances
+ * @note The results are exact for unsigned char descriptors (up to 258 dimensions).
+ */
+void squaredL2OneToMany(const unsigned char* query,
+                        const unsigned char* dataset,
+                        const int* rowIndices,
+                        int nbRows,
+                        int dimension,
+                        float* distances);
+void squaredL2OneToMany(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, float* distances);
+
+/**
+ * @brief Squared L2 distances between a query and rows of a float dataset, accumulated in double precision.
+ * @see squaredL2OneToMany
+ */
+void squaredL2OneToMany(const unsigned char* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances);
+void squaredL2OneToMany(const float* query, const float* dataset, const int* rowIndices, int nbRows, int dimension, double* distances);
+
+/**
+ * @brief Hamming distances between a binary query and rows of a binary dataset.
+ * @param[in] query the query descriptor (nbBytes bytes)
+ * @param[in] dataset the rows of the dataset, stored contiguously (nbBytes bytes per row)
+ * @param[in] rowIndices the indices of the rows to use, or nullptr to use the nbRows first rows
+ * @param[in] nbRows the number of distances to compute
+ * @param[in] nbBytes the length of the descriptors in bytes
+ * @param[out] distances the nbRows distances
+ */
+void hammingOneToMany(const unsigned char* query,
+                      const unsigned char* dataset,
+                      const int* rowIndices,
+                      int nbRows,
+                      int nbBytes,
+                      unsigned int* distances);
+
+/**
+ * @brief Squared L2 distances between all the queries and all the rows of a dataset.
+ *
+ * The rows are processed by blocks that fit in the L1 cache, each block is compared to all the queries.
+ *
+ * @param[in] queries the query descriptors, stored contiguously
+ * @param[in] nbQueries the number of queries
+ * @param[in] dataset the rows of the dataset, stored contiguously
+ * @param[in] nbRows the number of rows
+ * @param[in] dimension the length of the descriptors
+ * @param[out] distances the distances, the distance between the query q and the row r is at q * nbRows + r
+ */
+void squaredL2ManyToMany(const unsigned char* queries, int nbQueries, const unsigned char* dataset, int nbRows, int dimension, float* distances);
+void squaredL2ManyToMany(const float* queries, int nbQueries, const float* dataset, int nbRows, int dimension, float* distances);
+
+/**
+ * @brief Hamming distances between all the queries and all the rows of a dataset.
+ * @see squaredL2ManyToMany
+ */
+void hammingManyToMany(const unsigned char* queries, int nbQueries, const unsigned char* dataset, int nbRows, int nbBytes, unsigned int* distances);
+
+/**
+ * @brief Batched evaluation of a metric.
+ *
+ * The metrics are evaluated row by row, the specializations below use the batched kernels.
+ */
+template<typename Metric>
+struct BatchedMetric
+{
+    typedef typename Metric::ResultType ResultType;
+
+    /// @see squaredL2OneToMany
+    template<typename T>
+    static void oneToMany(const T* query, const T* dataset, const int* rowIndices, int nbRows, int dimension, ResultType* distances)
+    {
+        Metric metric;
+        for (int i = 0; i < nbRows; ++i)
+        {
+            const std::size_t row = rowIndices ? rowIndices[i] : i;
+            distances[i] = metric(query, dataset + row * dimension, dimension);
+        }
+    }
+
+    /// @see squaredL2ManyToMany
+    template<typename T>
+    static void manyToMany(const T* queries, int nbQueries, const T* dataset, int nbRows, int dimension, ResultType* distances)
+    {
+        for (int q = 0; q < nbQueries; ++q)
+            oneToMany(queries + std::size_t(q) * dimension, dataset, nullptr, nbRows, dimension, distances + std::size_t(q) * nbRows);
+    }
+};
+
+/// Squared L2 metrics on unsigned char and float descriptors
+template<typename T>
+struct BatchedMetricL2
+{
+    typedef float ResultType;
+
+    static void oneToMany(const T* query, const T* dataset, const int* rowIndices, int nbRows, int dimension, ResultType* distances)
+    {
+        squaredL2OneToMany(query, dataset, rowIndices, nbRows, dimension, distances);
+    }
+
+    static void manyToMany(const T* queries, int nbQueries, const T* dataset, int nbRows, int dimension, ResultType* distances)
+    {
+        squaredL2ManyToMany(queries, nbQueries, dataset, nbRows, dimension, distances);
+    }
+};
+
+template<>
+struct BatchedMetric<L2_Simple<unsigned char>> : public BatchedMetricL2<unsigned char>
+{};
+template<>
+struct BatchedMetric<L2_Vectorized<unsigned char>> : public BatchedMetricL2<unsigned char>
+{};
+template<>
+struct BatchedMetric<L2_Simple<float>> : public BatchedMetricL2<float>
+{};
+template<>
+struct BatchedMetric<L2_Vectorized<float>> : public BatchedMetricL2<float>
+{};
+
+/// Hamming metric on raw binary descriptors
+template<>
+struct BatchedMetric<Hamming<unsigned char>>
+{
+    typedef Hamming<unsigned char>::ResultType ResultType;
+
+    static void oneToMany(const unsigned char* query, const unsigned char* dataset, const int* rowIndices, int nbRows, int nbBytes, ResultType* distances)
+    {
+        hammingOneToMany(query, dataset, rowIndices, nbRows, nbBytes, distances);
+    }
+
+    static void manyToMany(const unsigned char* queries, int nbQueries, const unsigned char* dataset, int nbRows, int nbBytes, ResultType* distances)
+    {
+        hammingManyToMany(queries, nbQueries, dataset, nbRows, nbBytes, distances);
+    }
+};
+
+}  // namespace feature
+}  // namespace aliceVision
@@ -129,3 +129,64 @@ BOOST_AUTO_TEST_CASE(descriptorIO_BINARY)
             BOOST_CHECK_EQUAL(vec_descs[i][j], vec_descs_read[i][j]);
     }
 }
+
+// Test memory-mapped descriptors
+BOOST_AUTO_TEST_CASE(descriptorIO_MAPPED)
+{
+    typedef ScalarRegions<float, DESC_LENGTH> Regions_T;
+
+    Regions_T regions;
+    for (int i = 0; i < CARD; ++i)
+    {
+        Desc_T desc;
+        for (int j = 0; j < DESC_LENGTH; ++j)
+            desc[j] = i * DESC_LENGTH + j;
+        regions.Features().push_back(Feature_T(i, i + 1, 1.f, 0.f));
+        regions.Descriptors().push_back(desc);
+    }
+    BOOST_CHECK_NO_THROW(regions.Save("tempMappedRegions.feat", "tempMappedRegions.desc"));
+
+    Regions_T mappedRegions;
+    BOOST_CHECK_NO_THROW(mappedRegions.LoadMapped("tempMappedRegions.feat", "tempMappedRegions.desc"));
+    BOOST_CHECK_EQUAL(CARD, mappedRegions.RegionCount());
+    BOOST_CHECK_EQUAL(CARD, mappedRegions.DescriptorCount());
+
+    const Desc_T* mappedDescs = static_cast<const Desc_T*>(mappedRegions.DescriptorRawData());
+    for (int i = 0; i < CARD; ++i)
+    {
+        BOOST_CHECK(mappedDescs[i] == regions.Descriptors()[i]);
+        BOOST_CHECK_EQUAL(mappedRegions.SquaredDescriptorDistance(i, &regions, i), 0.0);
+    }
+
+    // the mapped descriptors are not in a vector
+    {
+        const Regions_T& constMappedRegions = mappedRegions;
+        BOOST_CHECK_THROW(constMappedRegions.Descriptors(), std::logic_error);
+        BOOST_CHECK_THROW(constMappedRegions.blindDescriptors(), std::logic_error);
+    }
+
+    // copies of mapped regions are in memory
+    Regions_T copiedRegions;
+    mappedRegions.CopyRegion(CARD - 1, &copiedRegions);
+    BOOST_CHECK_EQUAL(1, copiedRegions.DescriptorCount());
+    BOOST_CHECK(copiedRegions.Descriptors()[0] == regions.Descriptors()[CARD - 1]);
+
+    // the mutable getter copies the mapped descriptors in memory
+    BOOST_CHECK_EQUAL(CARD, mappedRegions.Descriptors().size());
+    BOOST_CHECK(mappedRegions.Descriptors() == regions.Descriptors());
+
+    // no descriptor
+    BOOST_CHECK_NO_THROW(Regions_T().Save("tempMappedRegions.feat", "tempMappedRegions.desc"));
+    BOOST_CHECK_NO_THROW(mappedRegions.LoadMapped("tempMappedRegions.feat", "tempMappedRegions.desc"));
+    BOOST_CHECK_EQUAL(0, mappedRegions.RegionCount());
+    BOOST_CHECK_EQUAL(0, mappedRegions.DescriptorCount());
+
+    // truncated file
+    {
+        std::ofstream file("tempMappedRegions.desc", std::ios::out | std::ios::binary);
+        const std::size_t cardDesc = CARD;
+        file.write((const char*)&cardDesc, sizeof(std::size_t));
+    }
+    BOOST_CHECK_THROW(mappedRegions.LoadMapped("tempMappedRegions.feat", "tempMappedRegions.desc"), std::runtime_error);
+    BOOST_CHECK_THROW(mappedRegions.LoadMapped("tempMappedRegions.feat", "doesNotExist.desc"), std::runtime_error);
+}
@@ -98,12 +98,12 @@ inline float l2_sse(const float* b1, const float* b2, int size)
     if (size % 4 == 0)
     {
         __m128 srcA, srcB, temp, cumSum;
-        float zeros[4] = {0.f, 0.f, 0.f, 0.f};
-        cumSum = _mm_load_ps(zeros);
+        cumSum = _mm_setzero_ps();
         for (int i = 0; i < size; i += 4)
         {
-            srcA = _mm_load_ps(b1Pt + i);
-            srcB = _mm_load_ps(b2Pt + i);
+            // unaligned loads: memory-mapped descriptors are not aligned on 16 bytes
+            srcA = _mm_loadu_ps(b1Pt + i);
+            srcB = _mm_loadu_ps(b2Pt + i);
             //-- Subtract
             temp = _mm_sub_ps(srcA, srcB);
             //-- Multiply
@@ -6,9 +6,12 @@
 // You can obtain one at https://mozilla.org/MPL/2.0/.
 
 #include <aliceVision/feature/metric.hpp>
+#include <aliceVision/feature/distanceKernels.hpp>
 
 #include <iostream>
+#include <random>
 #include <string>
+#include <vector>
 
 #define BOOST_TEST_MODULE matchingMetric
 
@@ -152,3 +155,105 @@ BOOST_AUTO_TEST_CASE(Metric_HAMMING_BITSET_RAW_MEMORY_32BITS)
         }
     }
 }
+
+template<typename T>
+std::vector<T> randomArray(std::mt19937& randomNumberGenerator, std::size_t size)
+{
+    std::uniform_int_distribution<int> distribution(0, 255);
+    std::vector<T> array(size);
+    for (T& value : array)
+        value = static_cast<T>(distribution(randomNumberGenerator));
+    return array;
+}
+
+// The batched kernels must give the same distances as the scalar metrics,
+// for all the dimensions (handled by SIMD blocks and scalar tails)
+BOOST_AUTO_TEST_CASE(Metric_OneToMany)
+{
+    std::mt19937 randomNumberGenerator(0);
+    const int nbRows = 50;
+    const std::vector<int> rowIndices = {49, 0, 3, 3, 27};
+
+    for (const int dimension : {1, 7, 8, 16, 31, 32, 33, 64, 128, 130})
+    {
+        const std::vector<unsigned char> queryUChar = randomArray<unsigned char>(randomNumberGenerator, dimension);
+        const std::vector<unsigned char> datasetUChar = randomArray<unsigned char>(randomNumberGenerator, nbRows * dimension);
+        std::vector<float> queryFloat = randomArray<float>(randomNumberGenerator, dimension);
+        std::vector<float> datasetFloat = randomArray<float>(randomNumberGenerator, nbRows * dimension);
+        for (float& value : queryFloat)
+            value /= 255.f;
+        for (float& value : datasetFloat)
+            value /= 255.f;
+
+        std::vector<float> distancesUChar(nbRows), distancesFloat(nbRows);
+        std::vector<double> distancesDoubleUChar(nbRows), distancesDoubleFloat(nbRows);
+        std::vector<unsigned int> distancesHamming(nbRows);
+        squaredL2OneToMany(queryUChar.data(), datasetUChar.data(), nullptr, nbRows, dimension, distancesUChar.data());
+        squaredL2OneToMany(queryFloat.data(), datasetFloat.data(), nullptr, nbRows, dimension, distancesFloat.data());
+        squaredL2OneToMany(queryUChar.data(), datasetFloat.data(), nullptr, nbRows, dimension, distancesDoubleUChar.data());
+        squaredL2OneToMany(queryFloat.data(), datasetFloat.data(), nullptr, nbRows, dimension, distancesDoubleFloat.data());
+        hammingOneToMany(queryUChar.data(), datasetUChar.data(), nullptr, nbRows, dimension, distancesHamming.data());
+
+        L2_Simple<unsigned char> metricUChar;
+        L2_Simple<float> metricFloat;
+        L2_Simple<double> metricDouble;
+        Hamming<unsigned char> metricHamming;
+        for (int i = 0; i < nbRows; ++i)
+        {
+            const std::vector<double> queryDouble(queryFloat.begin(), queryFloat.end());
+            const std::vector<double> queryUCharDouble(queryUChar.begin(), queryUChar.end());
+            const std::vector<double> rowDouble(datasetFloat.begin() + i * dimension, datasetFloat.begin() + (i + 1) * dimension);
+
+            BOOST_CHECK_EQUAL(distancesUChar[i], metricUChar(queryUChar.data(), datasetUChar.data() + i * dimension, dimension));
+            BOOST_CHECK_CLOSE(distancesFloat[i], metricFloat(queryFloat.data(), datasetFloat.data() + i * dimension, dimension), 1e-3);
+            BOOST_CHECK_CLOSE(distancesDoubleUChar[i], metricDouble(queryUCharDouble.data(), rowDouble.data(), dimension), 1e-10);
+            BOOST_CHECK_CLOSE(distancesDoubleFloat[i], metricDouble(queryDouble.data(), rowDouble.data(), dimension), 1e-10);
+            BOOST_CHECK_EQUAL(distancesHamming[i], metricHamming(queryUChar.data(), datasetUChar.data() + i * dimension, dimension));
+        }
+
+        // rows selected by index
+        std::vector<float> distancesIndexed(rowIndices.size());
+        std::vector<unsigned int> distancesHammingIndexed(rowIndices.size());
+        squaredL2OneToMany(queryUChar.data(), datasetUChar.data(), rowIndices.data(), rowIndices.size(), dimension, distancesIndexed.data());
+        hammingOneToMany(queryUChar.data(), datasetUChar.data(), rowIndices.data(), rowIndices.size(), dimension, distancesHammingIndexed.data());
+        for (std::size_t i = 0; i < rowIndices.size(); ++i)
+        {
+            BOOST_CHECK_EQUAL(distancesIndexed[i], distancesUChar[rowIndices[i]]);
+            BOOST_CHECK_EQUAL(distancesHammingIndexed[i], distancesHamming[rowIndices[i]]);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(Metric_ManyToMany)
+{
+    std::mt19937 randomNumberGenerator(0);
+    const int nbQueries = 7;
+    // more rows than a block of rows
+    const int nbRows = 1000;
+    const int dimension = 128;
+
+    const std::vector<unsigned char> queries = randomArray<unsigned char>(randomNumberGenerator, nbQueries * dimension);
+    const std::vector<unsigned char> dataset = randomArray<unsigned char>(randomNumberGenerator, nbRows * dimension);
+    const std::vector<float> queriesFloat(queries.begin(), queries.end());
+    const std::vector<float> datasetFloat(dataset.begin(), dataset.end());
+
+    std::vector<float> distances(nbQueries * nbRows), distancesFloat(nbQueries * nbRows);
+    std::vector<unsigned int> distancesHamming(nbQueries * nbRows);
+    squaredL2ManyToMany(queries.data(), nbQueries, dataset.data(), nbRows, dimension, distances.data());
+    squaredL2ManyToMany(queriesFloat.data(), nbQueries, datasetFloat.data(), nbRows, dimension, distancesFloat.data());
+    hammingManyToMany(queries.data(), nbQueries, dataset.data(), nbRows, dimension, distancesHamming.data());
+
+    L2_Simple<unsigned char> metric;
+    Hamming<unsigned char> metricHamming;
+    for (int q = 0; q < nbQueries; ++q)
+    {
+        for (int i = 0; i < nbRows; ++i)
+        {
+            const float distance = metric(queries.data() + q * dimension, dataset.data() + i * dimension, dimension);
+            BOOST_CHECK_EQUAL(distances[q * nbRows + i], distance);
+            // integer values: the float sums are exact
+            BOOST_CHECK_EQUAL(distancesFloat[q * nbRows + i], distance);
+            BOOST_CHECK_EQUAL(distancesHamming[q * nbRows + i], metricHamming(queries.data() + q * dimension, dataset.data() + i * dimension, dimension));
+        }
+    }
+}
@@ -6,6 +6,8 @@
 
 %module (module="pyalicevision") geometry
 
+%include <aliceVision/global.i>
+
 %include <aliceVision/geometry/Frustum.i>
 %include <aliceVision/geometry/HalfPlane.i>
 %include <aliceVision/geometry/Intersection.i>
@@ -13,6 +13,27 @@
 %include <std_set.i>
 %include <std_map.i>
 %include <stl.i>
+%include <exception.i>
+
+// C++ exceptions are raised as Python exceptions instead of terminating the interpreter
+%exception {
+    try
+    {
+        $action
+    }
+    catch (const std::invalid_argument& e)
+    {
+        SWIG_exception(SWIG_ValueError, e.what());
+    }
+    catch (const std::out_of_range& e)
+    {
+        SWIG_exception(SWIG_IndexError, e.what());
+    }
+    catch (const std::exception& e)
+    {
+        SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+}
 
 
 %include <aliceVision/types.hpp>
@@ -20,6 +41,7 @@
 %{
 #include <aliceVision/types.hpp>
 #include <memory>
+#include <stdexcept>
 %}
 
 %inline %{
@@ -43,3 +65,377 @@
 %template(Pair) std::pair<IndexT, IndexT>;
 %template(PairSet) std::set<aliceVision::Pair>;
 %template(PairVec) std::vector<aliceVision::Pair>;
+
+
+// Eigen <-> NumPy conversions
+//
+// Eigen matrices are exchanged with Python as NumPy arrays:
+// - Fixed-size inputs passed by const reference are mapped directly onto the NumPy buffer (no copy) when
+//   the array already has the scalar type, shape and memory layout of the Eigen type. Dynamic-size inputs
+//   (Vec, Mat, Mat2X...) are always copied, as a const reference to a Dynamic-size Eigen matrix cannot refer
+//   to memory it does not own. Any other array-like object (lists, other dtypes, non-contiguous arrays...)
+//   is converted into a temporary.
+// - Inputs passed by non-const reference must be writeable arrays with a matching layout, so that
+//   the modifications done on the C++ side are visible in Python.
+// - Outputs are moved into a heap-allocated Eigen object which is then owned by the returned NumPy
+//   array: the data itself is never copied, even for dynamic matrices.
+// Column vectors are returned as 1D arrays, matrices as 2D arrays.
+
+%{
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#include <numpy/arrayobject.h>
+
+#include <aliceVision/numeric/numeric.hpp>
+
+#include <Eigen/Core>
+
+#include <cstdint>
+#include <utility>
+
+namespace aliceVision {
+namespace numpy {
+
+template<typename Scalar>
+struct NumPyType;
+
+template<>
+struct NumPyType<double> { static constexpr int value = NPY_DOUBLE; };
+template<>
+struct NumPyType<float> { static constexpr int value = NPY_FLOAT; };
+template<>
+struct NumPyType<int> { static constexpr int value = NPY_INT; };
+template<>
+struct NumPyType<unsigned int> { static constexpr int value = NPY_UINT; };
+template<>
+struct NumPyType<unsigned char> { static constexpr int value = NPY_UINT8; };
+template<>
+struct NumPyType<std::uint64_t> { static constexpr int value = NPY_UINT64; };
+
+/**
+ * @brief Check if the dimensions of a NumPy array are compatible with an Eigen matrix type.
+ *        Column vectors accept both 1D arrays of shape (n,) and 2D arrays of shape (n, 1).
+ */
+template<typename MatrixT>
+bool hasCompatibleShape(PyArrayObject* array)
+{
+    npy_intp rows = 0;
+    npy_intp cols = 0;
+
+    if (PyArray_NDIM(array) == 1 && MatrixT::ColsAtCompileTime == 1)
+    {
+        rows = PyArray_DIM(array, 0);
+        cols = 1;
+    }
+    else if (PyArray_NDIM(array) == 2)
+    {
+        rows = PyArray_DIM(array, 0);
+        cols = PyArray_DIM(array, 1);
+    }
+    else
+    {
+        return false;
+    }
+
+    return (MatrixT::RowsAtCompileTime == Eigen::Dynamic || rows == MatrixT::RowsAtCompileTime) &&
+           (MatrixT::ColsAtCompileTime == Eigen::Dynamic || cols == MatrixT::ColsAtCompileTime);
+}
+
+/**
+ * @brief Check if a Python object can be converted to an Eigen matrix type (used for overload resolution).
+ */
+template<typename MatrixT>
+bool isConvertible(PyObject* obj)
+{
+    PyArrayObject* array = reinterpret_cast<PyArrayObject*>(PyArray_FromAny(obj, nullptr, 1, 2, 0, nullptr));
+    if (array == nullptr)
+    {
+        PyErr_Clear();
+        return false;
+    }
+
+    const bool convertible = (PyArray_ISNUMBER(array) || PyArray_ISBOOL(array)) && hasCompatibleShape<MatrixT>(array);
+    Py_DECREF(array);
+    return convertible;
+}
+
+/**
+ * @brief Get a pointer to an Eigen matrix sharing the memory of a NumPy array.
+ *        This is only possible for fixed-size types, when the array has exactly the same scalar type,
+ *        size, memory layout and alignment as the Eigen type. Dynamic-size types always return nullptr
+ *        (a Dynamic-size matrix owns its buffer), so they are converted by fromPython.
+ * @param[in] obj the Python object
+ * @param[in] writeable true if the returned matrix will be modified
+ * @return a pointer to the data of the array seen as an Eigen matrix, nullptr if this is not possible
+ */
+template<typename MatrixT>
+MatrixT* viewOf(PyObject* obj, bool writeable)
+{
+    using Scalar = typename MatrixT::Scalar;
+
+    if constexpr (MatrixT::SizeAtCompileTime == Eigen::Dynamic)
+    {
+        return nullptr;
+    }
+    else
+    {
+        static_assert(sizeof(MatrixT) == MatrixT::SizeAtCompileTime * sizeof(Scalar),
+                      "Fixed-size Eigen matrices are expected to only store their coefficients");
+
+        if (!PyArray_Check(obj))
+            return nullptr;
+
+        PyArrayObject* array = reinterpret_cast<PyArrayObject*>(obj);
+        if (PyArray_TYPE(array) != NumPyType<Scalar>::value || !PyArray_ISNOTSWAPPED(array) || !hasCompatibleShape<MatrixT>(array))
+            return nullptr;
+
+        const bool sameLayout = MatrixT::IsVectorAtCompileTime ? (PyArray_IS_C_CONTIGUOUS(array) || PyArray_IS_F_CONTIGUOUS(array))
+                                : MatrixT::IsRowMajor      ? PyArray_IS_C_CONTIGUOUS(array)
+                                                           : PyArray_IS_F_CONTIGUOUS(array);
+        if (!sameLayout || (writeable && !PyArray_ISWRITEABLE(array)))
+            return nullptr;
+
+        void* data = PyArray_DATA(array);
+        if (reinterpret_cast<std::uintptr_t>(data) % alignof(MatrixT) != 0)
+            return nullptr;
+
+        return reinterpret_cast<MatrixT*>(data);
+    }
+}
+
+/**
+ * @brief Convert any array-like Python object into an Eigen matrix (copy).
+ * @param[in] obj the Python object
+ * @param[out] matrix the converted matrix
+ * @return false if the conversion failed, with the Python error indicator set
+ */
+template<typename MatrixT>
+bool fromPython(PyObject* obj, MatrixT& matrix)
+{
+    using Scalar = typename MatrixT::Scalar;
+
+    const int requirements = MatrixT::IsRowMajor ? NPY_ARRAY_CARRAY_RO : NPY_ARRAY_FARRAY_RO;
+    PyArrayObject* array = reinterpret_cast<PyArrayObject*>(PyArray_FROMANY(obj, NumPyType<Scalar>::value, 1, 2, requirements));
+    if (array == nullptr)
+        return false;
+
+    if (!hasCompatibleShape<MatrixT>(array))
+    {
+        PyErr_Format(PyExc_ValueError,
+                     "Array shape is incompatible with the expected matrix size (%d x %d, -1 meaning any size).",
+                     static_cast<int>(MatrixT::RowsAtCompileTime),
+                     static_cast<int>(MatrixT::ColsAtCompileTime));
+        Py_DECREF(array);
+        return false;
+    }
+
+    const npy_intp rows = PyArray_DIM(array, 0);
+    const npy_intp cols = PyArray_NDIM(array) == 2 ? PyArray_DIM(array, 1) : 1;
+    matrix = Eigen::Map<const MatrixT>(static_cast<const Scalar*>(PyArray_DATA(array)), rows, cols);
+
+    Py_DECREF(array);
+    return true;
+}
+
+/**
+ * @brief Get a pointer to an Eigen matrix holding the content of a Python object,
+ *        sharing its memory whenever possible and converting it into the provided temporary otherwise.
+ * @return nullptr if the conversion failed, with the Python error indicator set
+ */
+template<typename MatrixT>
+MatrixT* asEigen(PyObject* obj, MatrixT& temporary)
+{
+    if (MatrixT* view = viewOf<MatrixT>(obj, false))
+        return view;
+
+    if (!fromPython(obj, temporary))
+        return nullptr;
+
+    return &temporary;
+}
+
+/**
+ * @brief Hand an Eigen matrix over to a new NumPy array without copying its coefficients.
+ *        The matrix is kept alive by a capsule set as the base object of the array.
+ */
+template<typename MatrixT>
+PyObject* toPython(MatrixT matrix)
+{
+    using Scalar = typename MatrixT::Scalar;
+
+    MatrixT* owned = new MatrixT(std::move(matrix));
+    PyObject* capsule = PyCapsule_New(owned, nullptr, [](PyObject* c) { delete static_cast<MatrixT*>(PyCapsule_GetPointer(c, nullptr)); });
+    if (capsule == nullptr)
+    {
+        delete owned;
+        return nullptr;
+    }
+
+    const int ndim = MatrixT::ColsAtCompileTime == 1 ? 1 : 2;
+    npy_intp dims[2] = {owned->rows(), owned->cols()};
+    npy_intp strides[2];
+    if (MatrixT::IsRowMajor)
+    {
+        strides[0] = owned->cols() * sizeof(Scalar);
+        strides[1] = sizeof(Scalar);
+    }
+    else
+    {
+        strides[0] = sizeof(Scalar);
+        strides[1] = owned->rows() * sizeof(Scalar);
+    }
+
+    PyObject* array = PyArray_New(&PyArray_Type, ndim, dims, NumPyType<Scalar>::value, strides, owned->data(), 0,
+                                  MatrixT::IsRowMajor ? NPY_ARRAY_CARRAY : NPY_ARRAY_FARRAY, nullptr);
+    if (array == nullptr)
+    {
+        Py_DECREF(capsule);
+        return nullptr;
+    }
+
+    // Steals the reference to the capsule
+    if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), capsule) != 0)
+    {
+        Py_DECREF(array);
+        return nullptr;
+    }
+
+    return array;
+}
+
+/**
+ * @brief Expose a buffer owned by a Python object as a read-only 2D NumPy array, without copying it.
+ *        The array holds a reference on the owner, which keeps the buffer alive as long as the array is alive.
+ * @param[in] owner the Python object owning the buffer
+ * @param[in] data the first value of the buffer
+ * @param[in] rows the number of rows
+ * @param[in] cols the number of contiguous values in each row
+ * @param[in] rowStride the distance between two rows in bytes
+ */
+template<typename Scalar>
+PyObject* viewToPython(PyObject* owner, const Scalar* data, npy_intp rows, npy_intp cols, npy_intp rowStride)
+{
+    npy_intp dims[2] = {rows, cols};
+
+    // empty containers may not have any buffer
+    if (data == nullptr || rows == 0)
+        return PyArray_ZEROS(2, dims, NumPyType<Scalar>::value, 0);
+
+    npy_intp strides[2] = {rowStride, static_cast<npy_intp>(sizeof(Scalar))};
+
+    // no NPY_ARRAY_WRITEABLE flag: the buffer must not be resized or modified from Python
+    PyObject* array = PyArray_New(&PyArray_Type, 2, dims, NumPyType<Scalar>::value, strides, const_cast<Scalar*>(data), 0,
+                                  NPY_ARRAY_ALIGNED, nullptr);
+    if (array == nullptr)
+        return nullptr;
+
+    // Steals the reference to the owner
+    Py_INCREF(owner);
+    if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), owner) != 0)
+    {
+        Py_DECREF(array);
+        return nullptr;
+    }
+
+    return array;
+}
+
+}  // namespace numpy
+}  // namespace aliceVision
+%}
+
+%init %{
+    import_array();
+%}
+
+// TYPE is the name as it appears in the wrapped headers, CPPTYPE the fully qualified C++ type
+%define %eigen_typemaps(TYPE, CPPTYPE)
+%naturalvar TYPE;
+%feature("novaluewrapper") TYPE;
+
+%typemap(typecheck, precedence=SWIG_TYPECHECK_DOUBLE_ARRAY) TYPE, const TYPE&
+{
+    $1 = aliceVision::numpy::isConvertible< CPPTYPE >($input) ? 1 : 0;
+}
+
+%typemap(typecheck, precedence=SWIG_TYPECHECK_DOUBLE_ARRAY) TYPE&
+{
+    $1 = aliceVision::numpy::viewOf< CPPTYPE >($input, true) != nullptr ? 1 : 0;
+}
+
+%typemap(in) TYPE
+{
+    if (!aliceVision::numpy::fromPython< CPPTYPE >($input, $1))
+        SWIG_fail;
+}
+
+%typemap(in) const TYPE& (CPPTYPE temp)
+{
+    $1 = aliceVision::numpy::asEigen< CPPTYPE >($input, temp);
+    if (!$1)
+        SWIG_fail;
+}
+
+%typemap(in) TYPE&
+{
+    $1 = aliceVision::numpy::viewOf< CPPTYPE >($input, true);
+    if (!$1)
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected a writeable NumPy array with the scalar type, shape and memory layout of a $1_basetype.");
+        SWIG_fail;
+    }
+}
+
+%typemap(out) TYPE
+{
+    $result = aliceVision::numpy::toPython< CPPTYPE >(std::move($1));
+    if (!$result)
+        SWIG_fail;
+}
+
+%typemap(out) const TYPE&, TYPE&
+{
+    $result = aliceVision::numpy::toPython< CPPTYPE >(*$1);
+    if (!$result)
+        SWIG_fail;
+}
+%enddef
+
+// Declare the typemaps for both the unqualified and qualified names of the aliceVision aliases
+%define %eigen_matrix(NAME, CPPTYPE)
+%eigen_typemaps(NAME, CPPTYPE)
+%eigen_typemaps(aliceVision::NAME, CPPTYPE)
+%enddef
+
+%eigen_matrix(Vec2, aliceVision::Vec2)
+%eigen_matrix(Vec3, aliceVision::Vec3)
+%eigen_matrix(Vec4, aliceVision::Vec4)
+%eigen_matrix(Vec6, aliceVision::Vec6)
+%eigen_matrix(Vec, aliceVision::Vec)
+%eigen_matrix(Vec2f, aliceVision::Vec2f)
+%eigen_matrix(Vec3f, aliceVision::Vec3f)
+%eigen_matrix(Vec2i, aliceVision::Vec2i)
+%eigen_matrix(Vec3i, aliceVision::Vec3i)
+%eigen_matrix(Mat, aliceVision::Mat)
+%eigen_matrix(Mat3, aliceVision::Mat3)
+%eigen_matrix(Mat4, aliceVision::Mat4)
+%eigen_matrix(Mat23, aliceVision::Mat23)
+%eigen_matrix(Mat34, aliceVision::Mat34)
+%eigen_matrix(Mat2X, aliceVision::Mat2X)
+%eigen_matrix(Mat3X, aliceVision::Mat3X)
+
+%eigen_typemaps(Eigen::Vector2d, Eigen::Vector2d)
+%eigen_typemaps(Eigen::Vector3d, Eigen::Vector3d)
+%eigen_typemaps(Eigen::Vector4d, Eigen::Vector4d)
+%eigen_typemaps(Eigen::VectorXd, Eigen::VectorXd)
+%eigen_typemaps(Eigen::Matrix2d, Eigen::Matrix2d)
+%eigen_typemaps(Eigen::Matrix3d, Eigen::Matrix3d)
+%eigen_typemaps(Eigen::Matrix4d, Eigen::Matrix4d)
+%eigen_typemaps(Eigen::MatrixXd, Eigen::MatrixXd)
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, 2>), %arg(Eigen::Matrix<double, 2, 2>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, 3>), %arg(Eigen::Matrix<double, 2, 3>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, 4>), %arg(Eigen::Matrix<double, 2, 4>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, 9>), %arg(Eigen::Matrix<double, 2, 9>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, 16>), %arg(Eigen::Matrix<double, 2, 16>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 3, 2>), %arg(Eigen::Matrix<double, 3, 2>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 4, 3>), %arg(Eigen::Matrix<double, 4, 3>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, 2, Eigen::Dynamic>), %arg(Eigen::Matrix<double, 2, Eigen::Dynamic>))
@@ -6,10 +6,48 @@
 
 #include "ImageMatching.hpp"
 #include <aliceVision/voctree/databaseIO.hpp>
+#include <aliceVision/voctree/descriptorLoader.hpp>
+
+#include <filesystem>
 
 namespace aliceVision {
 namespace imageMatching {
 
+namespace {
+
+/**
+ * @brief Describe the data the documents of a vocabulary tree database are computed from: the vocabulary tree file,
+ *        the maximum number of descriptors per image and the describer types of the descriptor files.
+ * @param[in] treeName The vocabulary tree filepath
+ * @param[in] nbMaxDescriptors The maximum number of descriptors loaded per image
+ * @param[in] descriptorsFiles The descriptor files of the documents
+ * @return The description of the source data, saved with the database
+ */
+std::string getDatabaseSource(const std::string& treeName, std::size_t nbMaxDescriptors, const std::map<IndexT, std::string>& descriptorsFiles)
+{
+    namespace fs = std::filesystem;
+
+    // descriptor files are named <viewId>.<describerType>.desc
+    std::set<std::string> describerTypes;
+    for (const auto& descriptorsFile : descriptorsFiles)
+    {
+        const std::string extension = fs::path(descriptorsFile.second).stem().extension().string();
+        describerTypes.insert(extension.empty() ? extension : extension.substr(1));
+    }
+
+    std::stringstream ss;
+    ss << "tree: " << fs::absolute(treeName).lexically_normal().string() << ", size: " << fs::file_size(treeName)
+       << ", time: " << fs::last_write_time(treeName).time_since_epoch().count() << "\n";
+    ss << "nbMaxDescriptors: " << nbMaxDescriptors << "\n";
+    ss << "describerTypes:";
+    for (const std::string& describerType : describerTypes)
+        ss << " " << describerType;
+    ss << "\n";
+    return ss.str();
+}
+
+}  // namespace
+
 std::ostream& operator<<(std::ostream& os, const PairList& pl)
 {
     for (PairList::const_iterator plIter = pl.begin(); plIter != pl.end(); ++plIter)
@@ -254,39 +292,53 @@ void generateFromVoctree(PairList& allMatches,
             allMatches[descriptorPair.first] = {};
     }
 
-    // query each document
-#pragma omp parallel for
-    for (ptrdiff_t i = 0; i < static_cast<ptrdiff_t>(descriptorsFiles.size()); ++i)
-    {
-        auto itA = descriptorsFiles.cbegin();
-        std::advance(itA, i);
-        const IndexT viewIdA = itA->first;
-        const std::string featuresPathA = itA->second;
-
-        aliceVision::voctree::SparseHistogram imageSH;
+    // sparse histograms of the queried images
+    const aliceVision::voctree::SparseHistogramPerImage* queries = &db.getSparseHistogramPerImage();
+    aliceVision::voctree::SparseHistogramPerImage queriesSubset;
 
-        if (modeMultiSfM != EImageMatchingMode::A_B)
+    if (modeMultiSfM != EImageMatchingMode::A_B)
+    {
+        // sparse histograms of A are already computed in the DB
+        if (db.size() != descriptorsFiles.size())
         {
-            // sparse histogram of A is already computed in the DB
-            imageSH = db.getSparseHistogramPerImage().at(viewIdA);
+            for (const auto& descriptorPair : descriptorsFiles)
+                queriesSubset[descriptorPair.first] = db.getSparseHistogramPerImage().at(descriptorPair.first);
+            queries = &queriesSubset;
         }
-        else  // mode AB
+    }
+    else  // mode AB
+    {
+        // compute the sparse histogram of each image A
+        std::vector<aliceVision::voctree::SparseHistogram> histograms(descriptorsFiles.size());
+
+#pragma omp parallel for
+        for (ptrdiff_t i = 0; i < static_cast<ptrdiff_t>(descriptorsFiles.size()); ++i)
         {
-            // compute the sparse histogram of each image A
+            auto itA = descriptorsFiles.cbegin();
+            std::advance(itA, i);
+
             std::vector<DescriptorUChar> descriptors;
             // read the descriptors
-            loadDescsFromBinFile(featuresPathA, descriptors, false, nbMaxDescriptors);
-            imageSH = tree.quantizeToSparse(descriptors);
+            loadDescsFromBinFile(itA->second, descriptors, false, nbMaxDescriptors);
+            histograms[i] = tree.quantizeToSparse(descriptors);
         }
 
-        std::vector<aliceVision::voctree::DocMatch> matches;
+        auto histogramIt = histograms.begin();
+        for (const auto& descriptorPair : descriptorsFiles)
+            queriesSubset[descriptorPair.first] = std::move(*histogramIt++);
+        queries = &queriesSubset;
+    }
 
-        db.find(imageSH, numImageQuery, matches);
+    // query all the documents at once
+    std::map<std::size_t, aliceVision::voctree::DocMatches> docMatches;
+    db.find(*queries, numImageQuery, docMatches);
 
-        ListOfImageID& imgMatches = allMatches.at(viewIdA);
-        imgMatches.reserve(imgMatches.size() + matches.size());
+    for (const auto& queryMatches : docMatches)
+    {
+        ListOfImageID& imgMatches = allMatches.at(queryMatches.first);
+        imgMatches.reserve(imgMatches.size() + queryMatches.second.size());
 
-        for (const aliceVision::voctree::DocMatch& m : matches)
+        for (const aliceVision::voctree::DocMatch& m : queryMatches.second)
         {
             imgMatches.push_back(m.id);
         }
@@ -306,6 +358,7 @@ void conditionVocTree(const std::string& treeName,
                       bool useMultiSfM,
                       const std::map<IndexT, std::string>& descriptorsFilesA,
                       std::size_t numImageQuery,
+                      const std::string& databaseFolder,
                       OrderedPairList& selectedPairs)
 {
     if (treeName.empty())
@@ -347,6 +400,80 @@ void conditionVocTree(const std::string& treeName,
     if (matchingMode == EImageMatchingMode::A_A_AND_A_B)
         db2 = db;  // initialize database2 with database1 initialization
 
+    // reuse the images quantized by the previous runs
+    std::size_t nbLoadedDocumentsA = 0;
+    std::size_t nbLoadedDocumentsB = 0;
+    if (!databaseFolder.empty())
+    {
+        // the documents of the database: the images of A, except in A_B and A_AB modes
+        std::map<IndexT, std::string> databaseDescriptorsFiles;
+        if (matchingMode == EImageMatchingMode::A_B || matchingMode == EImageMatchingMode::A_AB)
+            voctree::getListOfDescriptorFiles(sfmDataB, featuresFolders, databaseDescriptorsFiles);
+        if (matchingMode != EImageMatchingMode::A_B)
+            databaseDescriptorsFiles.insert(descriptorsFilesA.begin(), descriptorsFilesA.end());
+
+        db.setSource(getDatabaseSource(treeName, nbMaxDescriptors, databaseDescriptorsFiles));
+    }
+
+    if (!databaseFolder.empty() && aliceVision::voctree::Database::exists(databaseFolder))
+    {
+        ALICEVISION_LOG_INFO("Loading the database from: " << databaseFolder);
+
+        aliceVision::voctree::Database loadedDb;
+        std::string invalidReason;
+        try
+        {
+            loadedDb.load(databaseFolder);
+            if (loadedDb.words() != tree.words() || loadedDb.getSource() != db.getSource())
+                invalidReason = "it has not been built with the same vocabulary tree, describer types or maximum number of descriptors";
+        }
+        catch (const std::exception& e)
+        {
+            invalidReason = e.what();
+        }
+
+        if (!invalidReason.empty())
+        {
+            ALICEVISION_LOG_WARNING("The database cannot be reused (" << invalidReason << "), it is built again.");
+        }
+        else
+        {
+            // remove the images which are not in the inputs of the database anymore
+            const auto isDatabaseInput = [&](IndexT viewId) {
+                const bool inA = sfmDataA.getViews().count(viewId) > 0;
+                const bool inB = sfmDataB.getViews().count(viewId) > 0;
+                if (matchingMode == EImageMatchingMode::A_B)
+                    return inB;
+                if (matchingMode == EImageMatchingMode::A_AB)
+                    return inA || inB;
+                return inA;
+            };
+
+            std::vector<voctree::DocId> removedDocIds;
+            for (const auto& doc : loadedDb.getSparseHistogramPerImage())
+            {
+                if (!isDatabaseInput(doc.first))
+                    removedDocIds.push_back(doc.first);
+            }
+            for (const voctree::DocId docId : removedDocIds)
+                loadedDb.erase(docId);
+
+            // the loaded weights are the ones of the previous run
+            if (withWeights)
+                loadedDb.loadWeights(weightsName);
+
+            db = std::move(loadedDb);
+            for (const auto& doc : db.getSparseHistogramPerImage())
+            {
+                if (sfmDataA.getViews().count(doc.first) > 0)
+                    ++nbLoadedDocumentsA;
+                if (sfmDataB.getViews().count(doc.first) > 0)
+                    ++nbLoadedDocumentsB;
+            }
+            ALICEVISION_LOG_INFO("Loaded " << db.size() << " images from the database, " << removedDocIds.size() << " removed.");
+        }
+    }
+
     // read the descriptors and populate the databases
     {
         std::stringstream ss;
@@ -368,7 +495,7 @@ void conditionVocTree(const std::string& treeName,
                 nbFeaturesLoadedInputA = voctree::populateDatabase<DescriptorUChar>(sfmDataA, featuresFolders, tree, db, nbMaxDescriptors);
                 nbSetDescriptors = db.getSparseHistogramPerImage().size();
 
-                if (nbFeaturesLoadedInputA == 0)
+                if (nbFeaturesLoadedInputA == 0 && nbLoadedDocumentsA == 0)
                 {
                     throw std::runtime_error("No descriptors loaded in '" + sfmDataFilenameA + "'");
                 }
@@ -386,7 +513,8 @@ void conditionVocTree(const std::string& treeName,
                 nbSetDescriptors += db2.getSparseHistogramPerImage().size();
             }
 
-            if (useMultiSfM && (nbFeaturesLoadedInputB == 0))
+            // in A_A_AND_A_B mode, the documents of B are in the second database, which is never loaded
+            if (useMultiSfM && (nbFeaturesLoadedInputB == 0) && (matchingMode == EImageMatchingMode::A_A_AND_A_B || nbLoadedDocumentsB == 0))
             {
                 throw std::runtime_error("No descriptors loaded in '" + sfmDataFilenameB + "'");
             }
@@ -409,6 +537,12 @@ void conditionVocTree(const std::string& treeName,
             db2.computeTfIdfWeights();
     }
 
+    if (!databaseFolder.empty())
+    {
+        ALICEVISION_LOG_INFO("Saving the database in: " << databaseFolder);
+        db.save(databaseFolder);
+    }
+
     {
         PairList allMatches;
 
@@ -140,6 +140,7 @@ void conditionVocTree(const std::string& treeName,
                       bool useMultiSfM,
                       const std::map<IndexT, std::string>& descriptorsFilesA,
                       std::size_t numImageQuery,
+                      const std::string& databaseFolder,
                       OrderedPairList& selectedPairs);
 
 EImageMatchingMethod selectImageMatchingMethod(EImageMatchingMethod method,
@@ -0,0 +1,147 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%module (module="pyalicevision") imageMatching
+
+%include <aliceVision/global.i>
+
+// The images are listed from SfMData objects and the databases are built with the voctree module
+%import <aliceVision/sfmData/SfMData.i>
+%import <aliceVision/voctree/Voctree.i>
+
+// Pair lists are exchanged as (n, 2) arrays of view ids
+%eigen_typemaps(%arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>), %arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>))
+
+%ignore aliceVision::imageMatching::operator<<;
+%ignore aliceVision::imageMatching::operator>>;
+
+// The functions filling pair lists are replaced by the functions returning arrays below
+%ignore aliceVision::imageMatching::convertAllMatchesToPairList;
+%ignore aliceVision::imageMatching::generateSequentialMatches;
+%ignore aliceVision::imageMatching::generateAllMatchesInOneMap;
+%ignore aliceVision::imageMatching::generateAllMatchesBetweenTwoMap;
+%ignore aliceVision::imageMatching::generateFromVoctree;
+%ignore aliceVision::imageMatching::conditionVocTree;
+
+%{
+#include <aliceVision/imageMatching/ImageMatching.hpp>
+
+namespace aliceVision {
+namespace imageMatching {
+namespace {
+
+/// Convert a pair list into an (n, 2) array of [viewId, matchedViewId] rows, in the order of the list
+template<typename PairListT>
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> pairListToArray(const PairListT& pairList)
+{
+    std::size_t nbPairs = 0;
+    for (const auto& imagePairs : pairList)
+        nbPairs += imagePairs.second.size();
+
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> array(nbPairs, 2);
+    Eigen::Index row = 0;
+    for (const auto& imagePairs : pairList)
+    {
+        for (const ImageID matchedImage : imagePairs.second)
+            array.row(row++) << imagePairs.first, matchedImage;
+    }
+    return array;
+}
+
+}  // namespace
+}  // namespace imageMatching
+}  // namespace aliceVision
+%}
+
+%include <aliceVision/imageMatching/ImageMatching.hpp>
+
+%inline %{
+namespace aliceVision {
+namespace imageMatching {
+namespace python {
+
+/**
+ * @brief Select the images to match with each image, without repetitions, from the matches retrieved for each image.
+ * @param[in] allMatches (n, 2) array of [viewId, matchedViewId] rows, with the matches of each image sorted from the best one
+ * @param[in] numMatches The maximum number of matching images to consider for each image (if 0, consider all matches)
+ * @return (n, 2) array of [viewId, matchedViewId] pairs, each pair being selected only once
+ */
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> convertAllMatchesToPairList(const Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>& allMatches,
+                                                                                      std::size_t numMatches)
+{
+    PairList pairList;
+    for (Eigen::Index i = 0; i < allMatches.rows(); ++i)
+        pairList[allMatches(i, 0)].push_back(allMatches(i, 1));
+
+    OrderedPairList outPairList;
+    aliceVision::imageMatching::convertAllMatchesToPairList(pairList, numMatches, outPairList);
+    return pairListToArray(outPairList);
+}
+
+/**
+ * @brief Select the image pairs with the nbMatches neighbors of each image, sorted by filename.
+ * @return (n, 2) array of [viewId, matchedViewId] pairs
+ */
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> generateSequentialMatches(const sfmData::SfMData& sfmData, std::size_t nbMatches)
+{
+    OrderedPairList outPairList;
+    aliceVision::imageMatching::generateSequentialMatches(sfmData, nbMatches, outPairList);
+    return pairListToArray(outPairList);
+}
+
+/**
+ * @brief Select all the image pairs between the given views.
+ * @return (n, 2) array of [viewId, matchedViewId] pairs
+ */
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> generateAllMatchesInOneMap(const std::set<IndexT>& viewIds)
+{
+    OrderedPairList outPairList;
+    aliceVision::imageMatching::generateAllMatchesInOneMap(viewIds, outPairList);
+    return pairListToArray(outPairList);
+}
+
+/**
+ * @brief Select all the image pairs between a view of A and a view of B.
+ * @return (n, 2) array of [viewId, matchedViewId] pairs
+ */
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> generateAllMatchesBetweenTwoMap(const std::set<IndexT>& viewIdsA, const std::set<IndexT>& viewIdsB)
+{
+    OrderedPairList outPairList;
+    aliceVision::imageMatching::generateAllMatchesBetweenTwoMap(viewIdsA, viewIdsB, outPairList);
+    return pairListToArray(outPairList);
+}
+
+/**
+ * @brief Query the vocabulary tree database with each image.
+ * @param[in] descriptorsFiles The descriptor files of the query images
+ * @param[in] db The database, populated with the images to match
+ * @param[in] tree The vocabulary tree
+ * @param[in] modeMultiSfM A_B if the query images are not in the database
+ * @param[in] nbMaxDescriptors The maximum number of descriptors loaded per image (A_B mode)
+ * @param[in] numImageQuery The number of matches retrieved for each image (if 0, all the images of the database)
+ * @return (n, 2) array of [viewId, matchedViewId] rows, with the matches of each image sorted from the best one,
+ *         to be given to convertAllMatchesToPairList
+ */
+Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> generateFromVoctree(const std::map<IndexT, std::string>& descriptorsFiles,
+                                                                              const voctree::Database& db,
+                                                                              const aliceVision::voctree::VocabularyTree<aliceVision::feature::Descriptor<float, 128>, aliceVision::voctree::L2>& tree,
+                                                                              EImageMatchingMode modeMultiSfM,
+                                                                              std::size_t nbMaxDescriptors,
+                                                                              std::size_t numImageQuery)
+{
+    PairList allMatches;
+    aliceVision::imageMatching::generateFromVoctree(allMatches, descriptorsFiles, db, tree, modeMultiSfM, nbMaxDescriptors, numImageQuery);
+    return pairListToArray(allMatches);
+}
+
+}  // namespace python
+}  // namespace imageMatching
+}  // namespace aliceVision
+%}
+
+%{
+using namespace aliceVision;
+%}
@@ -404,7 +404,7 @@ class KeyframeSelector
     unsigned int _frameHeight = 0;
 
     /// Parsed sensor database
-    std::vector<sensorDB::Datasheet> _sensorDatabase;
+    sensorDB::SensorDatabase _sensorDatabase;
     bool _parsedSensorDb = false;
 
     /// Map media path index with names of the output images (used when the input medias are videos)
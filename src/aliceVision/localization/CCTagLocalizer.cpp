@@ -287,6 +287,7 @@ bool CCTagLocalizer::localize(const feature::MapRegionsPerDesc& genQueryRegions,
     timer.reset();
     // estimate the pose
     resectionData.error_max = param->_errorMax;
+    resectionData.acRansacAdaptiveParams = param->_resectionAdaptiveParams;
     ALICEVISION_LOG_DEBUG("[poseEstimation]\tEstimating camera pose...");
     const bool bResection = sfm::SfMLocalizer::localize(imageSize,
                                                         // pass the input intrinsic if they are valid, null otherwise
@@ -11,6 +11,7 @@
 #include <aliceVision/camera/camera.hpp>
 #include <aliceVision/feature/ImageDescriber.hpp>
 #include <aliceVision/robustEstimation/estimators.hpp>
+#include <aliceVision/robustEstimation/ACRansac.hpp>
 #include <aliceVision/localization/LocalizationResult.hpp>
 
 #include <random>
@@ -47,6 +48,8 @@ struct LocalizerParameters
     double _errorMax;
     /// the type of *sac framework to use for resection
     robustEstimation::ERobustEstimator _resectionEstimator;
+    /// the early termination of the ACRansac iterations for resection
+    robustEstimation::ACRansacAdaptiveParams _resectionAdaptiveParams;
     /// the type of *sac framework to use for matching
     robustEstimation::ERobustEstimator _matchingEstimator;
     /// force the use of the rig localization without openGV
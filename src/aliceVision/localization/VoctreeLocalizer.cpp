@@ -515,6 +515,7 @@ bool VoctreeLocalizer::localizeFirstBestResult(const feature::MapRegionsPerDesc&
         // estimate the pose
         // Do the resectioning: compute the camera pose.
         resectionData.error_max = param._errorMax;
+        resectionData.acRansacAdaptiveParams = param._resectionAdaptiveParams;
         ALICEVISION_LOG_DEBUG("[poseEstimation]\tEstimating camera pose...");
         bool bResection = sfm::SfMLocalizer::localize(queryImageSize,
                                                       // pass the input intrinsic if they are valid, null otherwise
@@ -632,6 +633,7 @@ bool VoctreeLocalizer::localizeAllResults(const feature::MapRegionsPerDesc& quer
     // estimate the pose
     // Do the resectioning: compute the camera pose.
     resectionData.error_max = param._errorMax;
+    resectionData.acRansacAdaptiveParams = param._resectionAdaptiveParams;
     ALICEVISION_LOG_DEBUG("[poseEstimation]\tEstimating camera pose...");
     const bool bResection = sfm::SfMLocalizer::localize(queryImageSize,
                                                         // pass the input intrinsic if they are valid, null otherwise
@@ -10,6 +10,7 @@
 #include <aliceVision/numeric/numeric.hpp>
 #include <aliceVision/matching/ArrayMatcher.hpp>
 #include <aliceVision/feature/metric.hpp>
+#include <aliceVision/feature/distanceKernels.hpp>
 #include <aliceVision/stl/indexedSort.hpp>
 
 #include <aliceVision/config.hpp>
@@ -65,15 +66,9 @@ class ArrayMatcher_bruteForce : public ArrayMatcher<Scalar, Metric>
         if (memMapping.get() == nullptr)
             return false;
 
-        // matrix representation of the input data;
-        Eigen::Map<BaseMat> mat_query((Scalar*)query, 1, (*memMapping).cols());
-        Metric metric;
         std::vector<DistanceType> vec_dist((*memMapping).rows(), 0.0);
-        for (int i = 0; i < (*memMapping).rows(); ++i)
-        {
-            // Compute Distance Metric
-            vec_dist[i] = metric((Scalar*)query, (*memMapping).row(i).data(), (*memMapping).cols());
-        }
+        // Compute Distance Metric
+        feature::BatchedMetric<Metric>::oneToMany(query, (*memMapping).data(), nullptr, (*memMapping).rows(), (*memMapping).cols(), vec_dist.data());
         if (!vec_dist.empty())
         {
             // Find the minimum distance :
@@ -107,35 +102,41 @@ class ArrayMatcher_bruteForce : public ArrayMatcher<Scalar, Metric>
             return false;
         }
 
-        // matrix representation of the input data;
-        Eigen::Map<BaseMat> mat_query((Scalar*)query, nbQuery, (*memMapping).cols());
-        Metric metric;
+        const int nbRows = (*memMapping).rows();
+        const int dimension = (*memMapping).cols();
 
         pvec_distances->resize(nbQuery * NN);
         pvec_indices->resize(nbQuery * NN);
 
+        // The queries are processed by blocks, so that the rows of the dataset are loaded once per block of queries
+        const int blockSize = 16;
+        const int nbBlocks = (nbQuery + blockSize - 1) / blockSize;
+
 #pragma omp parallel for schedule(dynamic)
-        for (int queryIndex = 0; queryIndex < nbQuery; ++queryIndex)
+        for (int block = 0; block < nbBlocks; ++block)
         {
-            std::vector<DistanceType> vec_distance((*memMapping).rows(), 0.0);
-            const Scalar* queryPtr = mat_query.row(queryIndex).data();
-            const Scalar* rowPtr = (*memMapping).data();
-            for (int i = 0; i < (*memMapping).rows(); ++i)
-            {
-                vec_distance[i] = metric(queryPtr, rowPtr, (*memMapping).cols());
-                rowPtr += (*memMapping).cols();
-            }
+            const int firstQuery = block * blockSize;
+            const int nbBlockQueries = std::min(blockSize, nbQuery - firstQuery);
 
-            // Find the N minimum distances:
-            const int maxMinFound = (int)std::min(size_t(NN), vec_distance.size());
-            using namespace stl::indexed_sort;
-            std::vector<sort_index_packet_ascend<DistanceType, int>> packet_vec(vec_distance.size());
-            sort_index_helper(packet_vec, &vec_distance[0], maxMinFound);
+            std::vector<DistanceType> vec_distance(static_cast<std::size_t>(nbBlockQueries) * nbRows);
+            feature::BatchedMetric<Metric>::manyToMany(
+              query + static_cast<std::size_t>(firstQuery) * dimension, nbBlockQueries, (*memMapping).data(), nbRows, dimension, vec_distance.data());
 
-            for (int i = 0; i < maxMinFound; ++i)
+            for (int blockQuery = 0; blockQuery < nbBlockQueries; ++blockQuery)
             {
-                (*pvec_distances)[queryIndex * NN + i] = packet_vec[i].val;
-                (*pvec_indices)[queryIndex * NN + i] = IndMatch(queryIndex, packet_vec[i].index);
+                const int queryIndex = firstQuery + blockQuery;
+
+                // Find the N minimum distances:
+                const int maxMinFound = (int)std::min(size_t(NN), size_t(nbRows));
+                using namespace stl::indexed_sort;
+                std::vector<sort_index_packet_ascend<DistanceType, int>> packet_vec(nbRows);
+                sort_index_helper(packet_vec, &vec_distance[static_cast<std::size_t>(blockQuery) * nbRows], maxMinFound);
+
+                for (int i = 0; i < maxMinFound; ++i)
+                {
+                    (*pvec_distances)[queryIndex * NN + i] = packet_vec[i].val;
+                    (*pvec_indices)[queryIndex * NN + i] = IndMatch(queryIndex, packet_vec[i].index);
+                }
             }
         }
         return true;
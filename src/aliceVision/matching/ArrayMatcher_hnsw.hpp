@@ -0,0 +1,403 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/feature/metric.hpp>
+#include <aliceVision/matching/ArrayMatcher.hpp>
+#include <aliceVision/matching/IndMatch.hpp>
+
+#include <algorithm>
+#include <cmath>
+#include <queue>
+#include <random>
+#include <utility>
+#include <vector>
+
+namespace aliceVision {
+namespace matching {
+
+//------------------
+//-- Bibliography --
+//------------------
+//- [1] "Efficient and robust approximate nearest neighbor search using Hierarchical Navigable Small World graphs"
+//- Authors: Yu. A. Malkov, D. A. Yashunin.
+//- Date: 2018.
+//- Journal: IEEE Transactions on Pattern Analysis and Machine Intelligence.
+//
+
+/**
+ * @brief Parameters of the HNSW graph index.
+ */
+struct HnswParams
+{
+    /// Maximum number of neighbors of a descriptor in the upper layers of the graph (twice as many in the bottom layer)
+    int M = 16;
+    /// Number of candidates explored to insert a descriptor: the higher, the better the graph and the slower the build
+    int efConstruction = 100;
+    /// Number of candidates explored to search the neighbors of a query: the higher, the better the recall and the slower the search
+    int efSearch = 64;
+};
+
+// Implementation of descriptor matching in a Hierarchical Navigable Small World graph [1].
+// The graph is built sequentially from the random number generator, so the index is reproducible,
+// and the queries are searched in parallel.
+// By default compute square(L2 distance).
+template<typename Scalar = float, typename Metric = feature::L2_Vectorized<Scalar>>
+class ArrayMatcher_hnsw : public ArrayMatcher<Scalar, Metric>
+{
+  public:
+    typedef typename Metric::ResultType DistanceType;
+
+    explicit ArrayMatcher_hnsw(const HnswParams& params = HnswParams())
+      : _params(params)
+    {}
+
+    virtual ~ArrayMatcher_hnsw() = default;
+
+    /**
+     * Build the matching structure
+     *
+     * \param[in] dataset   Input data.
+     * \param[in] nbRows    The number of component.
+     * \param[in] dimension Length of the data contained in the dataset.
+     *
+     * \return True if success.
+     */
+    bool Build(std::mt19937& randomNumberGenerator, const Scalar* dataset, int nbRows, int dimension)
+    {
+        _levels.clear();
+        _links0.clear();
+        _upperLinks.clear();
+
+        if (nbRows < 1)
+        {
+            _dataset = nullptr;
+            _nbRows = 0;
+            return false;
+        }
+
+        _dataset = dataset;
+        _nbRows = nbRows;
+        _dimension = dimension;
+        _maxLinks = std::max(2, _params.M);
+        _maxLinks0 = 2 * _maxLinks;
+
+        // draw the top layer of each descriptor from an exponentially decaying distribution
+        const double levelFactor = 1.0 / std::log(static_cast<double>(_maxLinks));
+        std::uniform_real_distribution<double> uniform(0.0, 1.0);
+        _levels.resize(nbRows);
+        for (int i = 0; i < nbRows; ++i)
+            _levels[i] = static_cast<int>(-std::log(1.0 - uniform(randomNumberGenerator)) * levelFactor);
+
+        // links are stored as [count, neighbor_0, ..., neighbor_max-1] for each descriptor and layer
+        _links0.assign(static_cast<std::size_t>(nbRows) * (_maxLinks0 + 1), 0);
+        _upperLinks.resize(nbRows);
+        for (int i = 0; i < nbRows; ++i)
+            _upperLinks[i].assign(static_cast<std::size_t>(_levels[i]) * (_maxLinks + 1), 0);
+
+        _entryPoint = 0;
+        _maxLevel = _levels[0];
+
+        VisitedList visited(nbRows);
+        for (int i = 1; i < nbRows; ++i)
+            insert(i, visited);
+
+        return true;
+    }
+
+    /**
+     * Search the nearest Neighbor of the scalar array query.
+     *
+     * \param[in]   query     The query array
+     * \param[out]  indice    The indice of array in the dataset that
+     *  have been computed as the nearest array.
+     * \param[out]  distance  The distance between the two arrays.
+     *
+     * \return True if success.
+     */
+    bool SearchNeighbour(const Scalar* query, int* indice, DistanceType* distance)
+    {
+        if (_dataset == nullptr)
+            return false;
+
+        VisitedList visited(_nbRows);
+        const std::vector<Candidate> neighbors = search(query, std::max(_params.efSearch, 1), visited);
+        *indice = neighbors.front().second;
+        *distance = neighbors.front().first;
+        return true;
+    }
+
+    /**
+     * Search the N nearest Neighbor of the scalar array query.
+     * The search does not modify the graph, so several threads can search the same matcher.
+     *
+     * \param[in]   query     The query array
+     * \param[in]   nbQuery   The number of query rows
+     * \param[out]  indices   The corresponding (query, neighbor) indices
+     * \param[out]  distances The distances between the matched arrays.
+     * \param[out]  NN        The number of maximal neighbor that will be searched.
+     *
+     * \return True if success.
+     */
+    bool SearchNeighbours(const Scalar* query, int nbQuery, IndMatches* pvec_indices, std::vector<DistanceType>* pvec_distances, size_t NN)
+    {
+        if (_dataset == nullptr || NN > static_cast<std::size_t>(_nbRows) || NN < 1 || nbQuery < 1)
+            return false;
+
+        pvec_indices->resize(nbQuery * NN);
+        pvec_distances->resize(nbQuery * NN);
+
+        const int ef = std::max(_params.efSearch, static_cast<int>(NN));
+
+#pragma omp parallel
+        {
+            VisitedList visited(_nbRows);
+
+#pragma omp for schedule(dynamic)
+            for (int queryIndex = 0; queryIndex < nbQuery; ++queryIndex)
+            {
+                const std::vector<Candidate> neighbors = search(query + static_cast<std::size_t>(queryIndex) * _dimension, ef, visited);
+
+                for (std::size_t i = 0; i < NN; ++i)
+                {
+                    // if the graph search did not reach enough descriptors, repeat the last one:
+                    // equal distances are then rejected by the distance ratio test
+                    const Candidate& neighbor = neighbors[std::min(i, neighbors.size() - 1)];
+                    (*pvec_indices)[queryIndex * NN + i] = IndMatch(queryIndex, neighbor.second);
+                    (*pvec_distances)[queryIndex * NN + i] = neighbor.first;
+                }
+            }
+        }
+        return true;
+    }
+
+  private:
+    /// (distance, descriptor index), ordered by distance
+    typedef std::pair<DistanceType, int> Candidate;
+
+    /// Marks of the descriptors visited by a graph search, reset in constant time
+    class VisitedList
+    {
+      public:
+        explicit VisitedList(int size)
+          : _marks(size, 0)
+        {}
+
+        void reset()
+        {
+            if (++_currentMark == 0)
+            {
+                std::fill(_marks.begin(), _marks.end(), 0);
+                _currentMark = 1;
+            }
+        }
+
+        /// Mark a descriptor, return false if it was already visited
+        bool visit(int i)
+        {
+            if (_marks[i] == _currentMark)
+                return false;
+            _marks[i] = _currentMark;
+            return true;
+        }
+
+      private:
+        std::vector<unsigned int> _marks;
+        unsigned int _currentMark = 0;
+    };
+
+    const Scalar* row(int i) const { return _dataset + static_cast<std::size_t>(i) * _dimension; }
+
+    DistanceType distance(const Scalar* query, int i) const { return _metric(query, row(i), _dimension); }
+
+    /// Links of a descriptor in a layer: [count, neighbor_0, ..., neighbor_count-1]
+    const int* links(int i, int level) const
+    {
+        if (level == 0)
+            return &_links0[static_cast<std::size_t>(i) * (_maxLinks0 + 1)];
+        return &_upperLinks[i][(level - 1) * (_maxLinks + 1)];
+    }
+
+    int* links(int i, int level) { return const_cast<int*>(static_cast<const ArrayMatcher_hnsw*>(this)->links(i, level)); }
+
+    /// Move to the closest descriptor of the query in a layer, starting from the entry point
+    void greedySearch(const Scalar* query, int level, Candidate& entryPoint) const
+    {
+        bool changed = true;
+        while (changed)
+        {
+            changed = false;
+            const int* neighbors = links(entryPoint.second, level);
+            for (int k = 1; k <= neighbors[0]; ++k)
+            {
+                const DistanceType d = distance(query, neighbors[k]);
+                if (d < entryPoint.first)
+                {
+                    entryPoint = Candidate(d, neighbors[k]);
+                    changed = true;
+                }
+            }
+        }
+    }
+
+    /// Find the ef closest descriptors of the query in a layer, sorted by increasing distance
+    std::vector<Candidate> searchLayer(const Scalar* query, const Candidate& entryPoint, int ef, int level, VisitedList& visited) const
+    {
+        std::priority_queue<Candidate, std::vector<Candidate>, std::greater<Candidate>> candidates;
+        std::priority_queue<Candidate> results;
+
+        visited.reset();
+        visited.visit(entryPoint.second);
+        candidates.push(entryPoint);
+        results.push(entryPoint);
+
+        while (!candidates.empty())
+        {
+            const Candidate current = candidates.top();
+            if (current.first > results.top().first && static_cast<int>(results.size()) >= ef)
+                break;
+            candidates.pop();
+
+            const int* neighbors = links(current.second, level);
+            for (int k = 1; k <= neighbors[0]; ++k)
+            {
+                const int neighbor = neighbors[k];
+                if (!visited.visit(neighbor))
+                    continue;
+
+                const DistanceType d = distance(query, neighbor);
+                if (static_cast<int>(results.size()) < ef || d < results.top().first)
+                {
+                    candidates.emplace(d, neighbor);
+                    results.emplace(d, neighbor);
+                    if (static_cast<int>(results.size()) > ef)
+                        results.pop();
+                }
+            }
+        }
+
+        std::vector<Candidate> sorted(results.size());
+        for (auto it = sorted.rbegin(); it != sorted.rend(); ++it)
+        {
+            *it = results.top();
+            results.pop();
+        }
+        return sorted;
+    }
+
+    /// Find the ef closest descriptors of the query in the graph, sorted by increasing distance
+    std::vector<Candidate> search(const Scalar* query, int ef, VisitedList& visited) const
+    {
+        Candidate entryPoint(distance(query, _entryPoint), _entryPoint);
+        for (int level = _maxLevel; level > 0; --level)
+            greedySearch(query, level, entryPoint);
+        return searchLayer(query, entryPoint, ef, 0, visited);
+    }
+
+    /**
+     * @brief Select the neighbors of a descriptor among candidates sorted by increasing distance, with the heuristic of [1]:
+     *        a candidate is kept only if it is closer to the descriptor than to the neighbors already selected,
+     *        so that the links spread in all directions.
+     */
+    std::vector<Candidate> selectNeighbors(const std::vector<Candidate>& candidates, int maxCount) const
+    {
+        std::vector<Candidate> selected;
+        selected.reserve(maxCount);
+        for (const Candidate& candidate : candidates)
+        {
+            if (static_cast<int>(selected.size()) >= maxCount)
+                break;
+
+            const Scalar* candidateRow = row(candidate.second);
+            const bool keep =
+              std::none_of(selected.begin(), selected.end(), [&](const Candidate& s) { return distance(candidateRow, s.second) < candidate.first; });
+            if (keep)
+                selected.push_back(candidate);
+        }
+        return selected;
+    }
+
+    /// Add a link from a descriptor to a new neighbor, pruning its links if it has too many
+    void addLink(int i, int level, const Candidate& newNeighbor)
+    {
+        const int maxCount = level == 0 ? _maxLinks0 : _maxLinks;
+        int* neighbors = links(i, level);
+
+        if (neighbors[0] < maxCount)
+        {
+            neighbors[++neighbors[0]] = newNeighbor.second;
+            return;
+        }
+
+        const Scalar* iRow = row(i);
+        std::vector<Candidate> candidates;
+        candidates.reserve(maxCount + 1);
+        candidates.push_back(newNeighbor);
+        for (int k = 1; k <= neighbors[0]; ++k)
+            candidates.emplace_back(distance(iRow, neighbors[k]), neighbors[k]);
+        std::sort(candidates.begin(), candidates.end());
+
+        const std::vector<Candidate> selected = selectNeighbors(candidates, maxCount);
+        neighbors[0] = static_cast<int>(selected.size());
+        for (std::size_t k = 0; k < selected.size(); ++k)
+            neighbors[k + 1] = selected[k].second;
+    }
+
+    /// Insert a descriptor in the graph
+    void insert(int i, VisitedList& visited)
+    {
+        const Scalar* query = row(i);
+        const int level = _levels[i];
+
+        Candidate entryPoint(distance(query, _entryPoint), _entryPoint);
+        for (int l = _maxLevel; l > level; --l)
+            greedySearch(query, l, entryPoint);
+
+        for (int l = std::min(level, _maxLevel); l >= 0; --l)
+        {
+            const std::vector<Candidate> candidates = searchLayer(query, entryPoint, std::max(_params.efConstruction, _maxLinks), l, visited);
+            const std::vector<Candidate> neighbors = selectNeighbors(candidates, _maxLinks);
+
+            int* iLinks = links(i, l);
+            iLinks[0] = static_cast<int>(neighbors.size());
+            for (std::size_t k = 0; k < neighbors.size(); ++k)
+            {
+                iLinks[k + 1] = neighbors[k].second;
+                addLink(neighbors[k].second, l, Candidate(neighbors[k].first, i));
+            }
+
+            entryPoint = candidates.front();
+        }
+
+        if (level > _maxLevel)
+        {
+            _maxLevel = level;
+            _entryPoint = i;
+        }
+    }
+
+    HnswParams _params;
+    Metric _metric;
+
+    const Scalar* _dataset = nullptr;
+    int _nbRows = 0;
+    int _dimension = 0;
+    int _maxLinks = 0;
+    int _maxLinks0 = 0;
+
+    int _entryPoint = 0;
+    int _maxLevel = 0;
+    /// top layer of each descriptor
+    std::vector<int> _levels;
+    /// links of all the descriptors in the bottom layer
+    std::vector<int> _links0;
+    /// links of each descriptor in the layers 1 to its top layer
+    std::vector<std::vector<int>> _upperLinks;
+};
+
+}  // namespace matching
+}  // namespace aliceVision
@@ -9,6 +9,7 @@
 
 #include <aliceVision/numeric/numeric.hpp>
 #include <aliceVision/feature/metric.hpp>
+#include <aliceVision/feature/distanceKernels.hpp>
 #include <aliceVision/matching/IndMatch.hpp>
 #include <aliceVision/stl/DynamicBitset.hpp>
 
@@ -216,11 +217,15 @@ class CascadeHasher
                                   std::vector<DistanceType>* pvec_distances,
                                   const int NN = 2) const
     {
-        typedef feature::L2_Vectorized<typename MatrixT::Scalar> MetricT;
-        MetricT metric;
+        typedef feature::BatchedMetric<feature::L2_Vectorized<typename MatrixT::Scalar>> BatchedMetricT;
 
         static const int kNumTopCandidates = 10;
 
+        // Preallocate the descriptors with the best hamming distances and their euclidean distances.
+        std::vector<int> top_candidates;
+        top_candidates.reserve(kNumTopCandidates);
+        std::vector<typename BatchedMetricT::ResultType> top_distances(kNumTopCandidates);
+
         // Preallocate the candidate descriptors container.
         std::vector<int> candidate_descriptors;
         candidate_descriptors.reserve(hashed_descriptions2.hashed_desc.size());
@@ -284,20 +289,24 @@ class CascadeHasher
                 }
             }
 
-            // Compute the euclidean distance of the k descriptors with the best hamming
-            // distance.
-            candidate_euclidean_distances.reserve(kNumTopCandidates);
-            for (int j = 0; j < candidate_hamming_distances.cols() && (candidate_euclidean_distances.size() < kNumTopCandidates); ++j)
+            // Select the k descriptors with the best hamming distance.
+            top_candidates.clear();
+            for (int j = 0; j < candidate_hamming_distances.cols() && (top_candidates.size() < kNumTopCandidates); ++j)
             {
-                for (int k = 0; k < num_descriptors_with_hamming_distance(j) && (candidate_euclidean_distances.size() < kNumTopCandidates); ++k)
+                for (int k = 0; k < num_descriptors_with_hamming_distance(j) && (top_candidates.size() < kNumTopCandidates); ++k)
                 {
-                    const int candidate_id = candidate_hamming_distances(k, j);
-                    const DistanceType distance = metric(descriptions2.row(candidate_id).data(), descriptions1.row(i).data(), descriptions1.cols());
-
-                    candidate_euclidean_distances.emplace_back(distance, candidate_id);
+                    top_candidates.push_back(candidate_hamming_distances(k, j));
                 }
             }
 
+            // Compute their euclidean distance.
+            BatchedMetricT::oneToMany(
+              descriptions1.row(i).data(), descriptions2.data(), top_candidates.data(), top_candidates.size(), descriptions1.cols(), top_distances.data());
+            for (std::size_t k = 0; k < top_candidates.size(); ++k)
+            {
+                candidate_euclidean_distances.emplace_back(top_distances[k], top_candidates[k]);
+            }
+
             // Assert that each query is having at least NN retrieved neighbors
             if (candidate_euclidean_distances.size() >= NN)
             {
@@ -0,0 +1,75 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/feature/imageDescriberCommon.i>
+
+// Matches of an image pair are exchanged as (n, 2) arrays of feature indexes
+%eigen_typemaps(%arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>), %arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>))
+
+%ignore aliceVision::matching::operator<<;
+%ignore aliceVision::matching::operator>>;
+%ignore aliceVision::matching::operator==;
+%ignore aliceVision::matching::operator!=;
+%ignore aliceVision::matching::operator<;
+
+// The std::map base class is not wrapped: the matches are accessed by descriptor type through the methods below
+%warnfilter(401) aliceVision::matching::MatchesPerDescType;
+
+%{
+#include <aliceVision/matching/IndMatch.hpp>
+%}
+
+%include <aliceVision/matching/IndMatch.hpp>
+
+%template(IndMatches) std::vector<aliceVision::matching::IndMatch>;
+%template(PairwiseMatches) std::map<aliceVision::Pair, aliceVision::matching::MatchesPerDescType>;
+
+%extend aliceVision::matching::MatchesPerDescType {
+    /**
+     * @brief Get the types of descriptors with matches.
+     */
+    std::vector<aliceVision::feature::EImageDescriberType> getDescTypes() const
+    {
+        std::vector<aliceVision::feature::EImageDescriberType> descTypes;
+        descTypes.reserve($self->size());
+        for (const auto& matches : *$self)
+            descTypes.push_back(matches.first);
+        return descTypes;
+    }
+
+    /**
+     * @brief Get the matches of a type of descriptors as a (n, 2) uint32 array of [i, j] feature indexes
+     *        (empty if there is no match for this type).
+     */
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> getMatchesArray(aliceVision::feature::EImageDescriberType descType) const
+    {
+        Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor> array;
+        const auto it = $self->find(descType);
+        if (it == $self->end())
+        {
+            array.resize(0, 2);
+            return array;
+        }
+
+        array.resize(it->second.size(), 2);
+        for (std::size_t m = 0; m < it->second.size(); ++m)
+            array.row(m) << it->second[m]._i, it->second[m]._j;
+        return array;
+    }
+
+    /**
+     * @brief Replace the matches of a type of descriptors with a (n, 2) array of [i, j] feature indexes.
+     */
+    void setMatchesArray(aliceVision::feature::EImageDescriberType descType, const Eigen::Matrix<IndexT, Eigen::Dynamic, 2, Eigen::RowMajor>& array)
+    {
+        aliceVision::matching::IndMatches& matches = (*$self)[descType];
+        matches.clear();
+        matches.reserve(array.rows());
+        for (Eigen::Index m = 0; m < array.rows(); ++m)
+            matches.emplace_back(array(m, 0), array(m, 1));
+    }
+};
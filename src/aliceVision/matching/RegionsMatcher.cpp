@@ -10,6 +10,7 @@
 #include "aliceVision/matching/ArrayMatcher_bruteForce.hpp"
 #include "aliceVision/matching/ArrayMatcher_kdtreeFlann.hpp"
 #include "aliceVision/matching/ArrayMatcher_cascadeHashing.hpp"
+#include "aliceVision/matching/ArrayMatcher_hnsw.hpp"
 
 #include <aliceVision/system/Logger.hpp>
 
@@ -45,15 +46,17 @@ RegionsDatabaseMatcher::RegionsDatabaseMatcher()
 
 RegionsDatabaseMatcher::RegionsDatabaseMatcher(std::mt19937& randomNumberGenerator,
                                                matching::EMatcherType matcherType,
-                                               const feature::Regions& databaseRegions)
+                                               const feature::Regions& databaseRegions,
+                                               const HnswParams& hnswParams)
   : _matcherType(matcherType)
 {
-    _regionsMatcher = createRegionsMatcher(randomNumberGenerator, databaseRegions, matcherType);
+    _regionsMatcher = createRegionsMatcher(randomNumberGenerator, databaseRegions, matcherType, hnswParams);
 }
 
 std::unique_ptr<IRegionsMatcher> createRegionsMatcher(std::mt19937& randomNumberGenerator,
                                                       const feature::Regions& regions,
-                                                      matching::EMatcherType matcherType)
+                                                      matching::EMatcherType matcherType,
+                                                      const HnswParams& hnswParams)
 {
     std::unique_ptr<IRegionsMatcher> out;
 
@@ -91,6 +94,12 @@ std::unique_ptr<IRegionsMatcher> createRegionsMatcher(std::mt19937& randomNumber
                     out.reset(new matching::RegionsMatcher<MatcherT>(randomNumberGenerator, regions, true));
                 }
                 break;
+                case HNSW_L2:
+                {
+                    typedef ArrayMatcher_hnsw<unsigned char> MatcherT;
+                    out.reset(new matching::RegionsMatcher<MatcherT>(randomNumberGenerator, regions, true, MatcherT(hnswParams)));
+                }
+                break;
                 default:
                     ALICEVISION_LOG_WARNING("Using unknown matcher type");
             }
@@ -120,6 +129,12 @@ std::unique_ptr<IRegionsMatcher> createRegionsMatcher(std::mt19937& randomNumber
                     out.reset(new matching::RegionsMatcher<MatcherT>(randomNumberGenerator, regions, true));
                 }
                 break;
+                case HNSW_L2:
+                {
+                    typedef ArrayMatcher_hnsw<float> MatcherT;
+                    out.reset(new matching::RegionsMatcher<MatcherT>(randomNumberGenerator, regions, true, MatcherT(hnswParams)));
+                }
+                break;
                 default:
                     ALICEVISION_LOG_WARNING("Using unknown matcher type");
             }
@@ -147,6 +162,12 @@ std::unique_ptr<IRegionsMatcher> createRegionsMatcher(std::mt19937& randomNumber
                     ALICEVISION_LOG_WARNING("Not yet implemented");
                 }
                 break;
+                case HNSW_L2:
+                {
+                    typedef ArrayMatcher_hnsw<double> MatcherT;
+                    out.reset(new matching::RegionsMatcher<MatcherT>(randomNumberGenerator, regions, true, MatcherT(hnswParams)));
+                }
+                break;
                 default:
                     ALICEVISION_LOG_WARNING("Using unknown matcher type");
             }
@@ -8,6 +8,7 @@
 #pragma once
 
 #include "aliceVision/matching/matcherType.hpp"
+#include "aliceVision/matching/ArrayMatcher_hnsw.hpp"
 #include "aliceVision/matching/IndMatch.hpp"
 #include "aliceVision/matching/IndMatchDecorator.hpp"
 #include "aliceVision/matching/filters.hpp"
@@ -113,6 +114,26 @@ class RegionsMatcher : public IRegionsMatcher
         matcher_.Build(randomNumberGenerator, tab, regions_.RegionCount(), regions_.DescriptorLength());
     }
 
+    /**
+     * @brief Initialize the matcher with a Regions that will be used as database
+     *
+     * @param regions The Regions to be used as database.
+     * @param b_squared_metric Whether to use a squared metric for the ratio test
+     * when matching two Regions.
+     * @param matcher The array matcher with its parameters, built on the Regions.
+     */
+    RegionsMatcher(std::mt19937& randomNumberGenerator, const feature::Regions& regions, bool b_squared_metric, const ArrayMatcherT& matcher)
+      : IRegionsMatcher(regions),
+        matcher_(matcher),
+        b_squared_metric_(b_squared_metric)
+    {
+        if (regions_.RegionCount() == 0)
+            return;
+
+        const Scalar* tab = reinterpret_cast<const Scalar*>(regions_.DescriptorRawData());
+        matcher_.Build(randomNumberGenerator, tab, regions_.RegionCount(), regions_.DescriptorLength());
+    }
+
     /**
      * @brief Match a Regions to the internal database using the test ratio to improve
      * the robustness of the match.
@@ -195,8 +216,12 @@ class RegionsDatabaseMatcher
      * @param[in] matcherType The type of matcher to use to match the Regions.
      * @param[in] database_regions The Regions that will be used as database to
      * match other Regions (query).
+     * @param[in] hnswParams The parameters of the graph of the HNSW_L2 matcher.
      */
-    RegionsDatabaseMatcher(std::mt19937& randomNumberGenerator, matching::EMatcherType matcherType, const feature::Regions& database_regions);
+    RegionsDatabaseMatcher(std::mt19937& randomNumberGenerator,
+                           matching::EMatcherType matcherType,
+                           const feature::Regions& database_regions,
+                           const HnswParams& hnswParams = HnswParams());
 
     /**
      * @brief Find corresponding points between the query Regions and the database one
@@ -256,7 +281,8 @@ class RegionsDatabaseMatcherPerDesc
 
 std::unique_ptr<IRegionsMatcher> createRegionsMatcher(std::mt19937& randomNumberGenerator,
                                                       const feature::Regions& regions,
-                                                      matching::EMatcherType matcherType);
+                                                      matching::EMatcherType matcherType,
+                                                      const HnswParams& hnswParams = HnswParams());
 
 }  // namespace matching
 }  // namespace aliceVision
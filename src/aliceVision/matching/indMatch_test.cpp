@@ -107,6 +107,75 @@ BOOST_AUTO_TEST_CASE(IndMatch_IO)
     fs::remove_all(testFolder);
 }
 
+BOOST_AUTO_TEST_CASE(IndMatch_IO_Filters)
+{
+    const std::string testFolder = "matchingFiltersTest";
+
+    PairwiseMatches matches;
+    matches[std::make_pair(0, 1)][EImageDescriberType::SIFT] = {{0, 0}, {1, 1}, {2, 2}, {3, 3}};
+    matches[std::make_pair(0, 1)][EImageDescriberType::AKAZE] = {{5, 5}};
+    matches[std::make_pair(1, 2)][EImageDescriberType::SIFT] = {{0, 1}, {1, 2}};
+    matches[std::make_pair(2, 3)][EImageDescriberType::SIFT] = {{4, 2}, {2, 4}, {1, 1}};
+
+    for (const std::string extension : {"txt", "bin"})
+    {
+        for (const bool matchFilePerImage : {false, true})
+        {
+            fs::remove_all(testFolder);
+            fs::create_directory(testFolder);
+            BOOST_CHECK(Save(matches, testFolder, extension, matchFilePerImage));
+
+            // no filter
+            {
+                PairwiseMatches loadedMatches;
+                BOOST_CHECK(Load(loadedMatches, {}, {testFolder}, {}));
+                BOOST_CHECK_EQUAL(3, loadedMatches.size());
+                for (const auto& pairMatches : matches)
+                {
+                    for (const auto& descMatches : pairMatches.second)
+                        BOOST_CHECK(loadedMatches.at(pairMatches.first).at(descMatches.first) == descMatches.second);
+                }
+            }
+
+            // filter the views, the descriptor types and the number of matches
+            {
+                PairwiseMatches loadedMatches;
+                BOOST_CHECK(Load(loadedMatches, {0, 1, 2}, {testFolder}, {EImageDescriberType::SIFT}, 3, 2));
+                BOOST_CHECK_EQUAL(2, loadedMatches.size());
+                BOOST_CHECK_EQUAL(1, loadedMatches.at(std::make_pair(0, 1)).size());
+                const IndMatches expectedMatches = {{0, 0}, {1, 1}, {2, 2}};
+                BOOST_CHECK(loadedMatches.at(std::make_pair(0, 1)).at(EImageDescriberType::SIFT) == expectedMatches);
+                BOOST_CHECK(loadedMatches.at(std::make_pair(1, 2)).at(EImageDescriberType::SIFT) ==
+                            matches.at(std::make_pair(1, 2)).at(EImageDescriberType::SIFT));
+            }
+
+            // files written per image can also be loaded for a set of images
+            if (matchFilePerImage)
+            {
+                PairwiseMatches loadedMatches;
+                BOOST_CHECK_EQUAL(2, LoadMatchFilePerImage(loadedMatches, {0, 2, 5}, testFolder, "matches." + extension));
+                BOOST_CHECK_EQUAL(2, loadedMatches.size());
+                BOOST_CHECK_EQUAL(1, loadedMatches.count(std::make_pair(2, 3)));
+            }
+        }
+    }
+
+    // truncated binary file
+    fs::remove_all(testFolder);
+    fs::create_directory(testFolder);
+    BOOST_CHECK(Save(matches, testFolder, "bin", false));
+    const std::string matchFile = (fs::path(testFolder) / "matches.bin").string();
+    fs::resize_file(matchFile, fs::file_size(matchFile) - 1);
+    {
+        PairwiseMatches loadedMatches;
+        BOOST_CHECK(!LoadMatchFile(loadedMatches, matchFile));
+        // the filtered out pair is not read
+        BOOST_CHECK(LoadMatchFile(loadedMatches, matchFile, {0, 1, 2}));
+        BOOST_CHECK_EQUAL(2, loadedMatches.size());
+    }
+    fs::remove_all(testFolder);
+}
+
 BOOST_AUTO_TEST_CASE(IndMatch_DuplicateRemoval_NoRemoval)
 {
     std::vector<IndMatch> vec_indMatch;
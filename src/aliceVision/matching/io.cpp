@@ -13,10 +13,16 @@
 
 #include <boost/range/iterator_range.hpp>
 
+#include <algorithm>
+#include <cctype>
+#include <charconv>
+#include <cstdint>
+#include <cstring>
 #include <map>
 #include <filesystem>
 #include <fstream>
 #include <iterator>
+#include <sstream>
 #include <string>
 #include <vector>
 
@@ -25,71 +31,343 @@ namespace fs = std::filesystem;
 namespace aliceVision {
 namespace matching {
 
-bool LoadMatchFile(PairwiseMatches& matches, const std::string& filepath)
+namespace {
+
+/*
+ * Binary match file (.bin), in the native byte order:
+ *  - a MatchFileHeader,
+ *  - an index of entryCount MatchFileEntry, one per image pair and descriptor type,
+ *  - the matches of each entry, as pairs of uint32 feature indices.
+ */
+const char matchFileMagic[8] = {'A', 'V', 'M', 'A', 'T', 'C', 'H', '\0'};
+const std::uint32_t matchFileVersion = 1;
+const std::uint32_t matchFileByteOrder = 0x01020304;
+
+struct MatchFileHeader
 {
-    const std::string ext = fs::path(filepath).extension().string();
+    char magic[8];
+    std::uint32_t version;
+    std::uint32_t byteOrder;
+    std::uint64_t entryCount;
+};
 
-    if (!utils::exists(filepath))
-        return false;
+struct MatchFileEntry
+{
+    std::uint32_t I;
+    std::uint32_t J;
+    /// feature::EImageDescriberType value
+    std::uint32_t descType;
+    std::uint32_t reserved;
+    /// position of the matches in the file
+    std::uint64_t offset;
+    std::uint64_t matchesCount;
+};
 
-    if (ext == ".txt")
+static_assert(sizeof(MatchFileHeader) == 24 && sizeof(MatchFileEntry) == 32, "Unexpected padding in the match file structures.");
+
+/**
+ * @brief Filters applied while reading a match file
+ */
+struct MatchFileFilter
+{
+    const std::set<IndexT>& viewsKeys;
+    const std::vector<feature::EImageDescriberType>& descTypes;
+    int maxNbMatches;
+
+    bool acceptPair(IndexT I, IndexT J) const
+    { return viewsKeys.empty() || (viewsKeys.find(I) != viewsKeys.end() && viewsKeys.find(J) != viewsKeys.end()); }
+
+    bool acceptDescType(feature::EImageDescriberType descType) const
+    { return descTypes.empty() || std::find(descTypes.begin(), descTypes.end(), descType) != descTypes.end(); }
+
+    std::size_t nbMatchesToRead(std::size_t nbMatches) const
+    { return maxNbMatches > 0 ? std::min(nbMatches, static_cast<std::size_t>(maxNbMatches)) : nbMatches; }
+};
+
+/**
+ * @brief Whitespace separated tokens of a text file loaded in memory
+ */
+class TextTokenizer
+{
+  public:
+    explicit TextTokenizer(const std::string& text)
+      : _pos(text.data()),
+        _end(text.data() + text.size())
+    {}
+
+    bool atEnd()
     {
-        std::ifstream stream(filepath);
-        if (!stream.is_open())
+        skipSpaces();
+        return _pos == _end;
+    }
+
+    template<typename T>
+    bool read(T& value)
+    {
+        skipSpaces();
+        const std::from_chars_result result = std::from_chars(_pos, _end, value);
+        if (result.ec != std::errc())
             return false;
+        _pos = result.ptr;
+        return true;
+    }
+
+    bool read(std::string& word)
+    {
+        skipSpaces();
+        const char* wordBegin = _pos;
+        skipWord();
+        word.assign(wordBegin, _pos);
+        return !word.empty();
+    }
+
+    /// Skip the given number of tokens without parsing them
+    bool skip(std::size_t count)
+    {
+        for (std::size_t i = 0; i < count; ++i)
+        {
+            skipSpaces();
+            if (_pos == _end)
+                return false;
+            skipWord();
+        }
+        return true;
+    }
+
+  private:
+    void skipSpaces()
+    {
+        while (_pos != _end && std::isspace(static_cast<unsigned char>(*_pos)))
+            ++_pos;
+    }
 
-        // Read from the text file
-        // I J
-        // nbDescType
-        // descType matchesCount
-        // idx idx
-        // ...
-        // descType matchesCount
-        // idx idx
-        // ...
-        std::size_t I = 0;
-        std::size_t J = 0;
+    void skipWord()
+    {
+        while (_pos != _end && !std::isspace(static_cast<unsigned char>(*_pos)))
+            ++_pos;
+    }
+
+    const char* _pos;
+    const char* _end;
+};
+
+/**
+ * @brief Parse the content of a text match file.
+ * @return false if the text is not a valid list of matches
+ */
+bool parseTxtMatches(PairwiseMatches& matches, const std::string& text, const MatchFileFilter& filter)
+{
+    // Read from the text file
+    // I J
+    // nbDescType
+    // descType matchesCount
+    // idx idx
+    // ...
+    // descType matchesCount
+    // idx idx
+    // ...
+    TextTokenizer tokenizer(text);
+    std::string descTypeStr;
+    while (!tokenizer.atEnd())
+    {
+        IndexT I = 0;
+        IndexT J = 0;
         std::size_t nbDescType = 0;
-        while (stream >> I >> J >> nbDescType)
+        if (!tokenizer.read(I) || !tokenizer.read(J) || !tokenizer.read(nbDescType))
+            return false;
+
+        const bool acceptPair = filter.acceptPair(I, J);
+        for (std::size_t d = 0; d < nbDescType; ++d)
+        {
+            std::size_t nbMatches = 0;
+            // Read descType and number of matches
+            if (!tokenizer.read(descTypeStr) || !tokenizer.read(nbMatches))
+                return false;
+
+            const feature::EImageDescriberType descType = feature::EImageDescriberType_stringToEnum(descTypeStr);
+            if (!acceptPair || !filter.acceptDescType(descType))
+            {
+                if (!tokenizer.skip(2 * nbMatches))
+                    return false;
+                continue;
+            }
+
+            const std::size_t nbMatchesToRead = filter.nbMatchesToRead(nbMatches);
+            std::vector<IndMatch> matchesPerDesc(nbMatchesToRead);
+            // Read all matches
+            for (IndMatch& match : matchesPerDesc)
+            {
+                if (!tokenizer.read(match._i) || !tokenizer.read(match._j))
+                    return false;
+            }
+            if (!tokenizer.skip(2 * (nbMatches - nbMatchesToRead)))
+                return false;
+            matches[std::make_pair(I, J)][descType] = std::move(matchesPerDesc);
+        }
+    }
+    return true;
+}
+
+bool loadTxtMatchFile(PairwiseMatches& matches, const std::string& filepath, const MatchFileFilter& filter)
+{
+    std::ifstream stream(filepath, std::ios::in | std::ios::binary);
+    if (!stream.is_open())
+        return false;
+
+    // read the whole file at once and parse it in memory
+    std::string text(fs::file_size(filepath), '\0');
+    if (!stream.read(&text[0], text.size()))
+        return false;
+    stream.close();
+
+    if (!parseTxtMatches(matches, text, filter))
+    {
+        ALICEVISION_LOG_WARNING("Invalid text match file: " << filepath);
+        return false;
+    }
+    return true;
+}
+
+bool loadBinMatchFile(PairwiseMatches& matches, const std::string& filepath, const MatchFileFilter& filter)
+{
+    std::ifstream stream(filepath, std::ios::in | std::ios::binary);
+    if (!stream.is_open())
+        return false;
+
+    const std::uint64_t fileSize = fs::file_size(filepath);
+
+    MatchFileHeader header;
+    if (!stream.read(reinterpret_cast<char*>(&header), sizeof(MatchFileHeader)) ||
+        std::memcmp(header.magic, matchFileMagic, sizeof(matchFileMagic)) != 0)
+    {
+        ALICEVISION_LOG_WARNING("Invalid binary match file: " << filepath);
+        return false;
+    }
+    if (header.byteOrder != matchFileByteOrder || header.version > matchFileVersion)
+    {
+        ALICEVISION_LOG_WARNING("Unsupported binary match file (version " << header.version << "): " << filepath);
+        return false;
+    }
+    if (header.entryCount > (fileSize - sizeof(MatchFileHeader)) / sizeof(MatchFileEntry))
+    {
+        ALICEVISION_LOG_WARNING("Invalid binary match file (truncated index): " << filepath);
+        return false;
+    }
+
+    std::vector<MatchFileEntry> entries(header.entryCount);
+    if (!stream.read(reinterpret_cast<char*>(entries.data()), entries.size() * sizeof(MatchFileEntry)))
+        return false;
+
+    std::vector<std::uint32_t> indices;
+    for (const MatchFileEntry& entry : entries)
+    {
+        const feature::EImageDescriberType descType = static_cast<feature::EImageDescriberType>(entry.descType);
+
+        // skip the filtered out entries without reading their matches
+        if (!filter.acceptPair(entry.I, entry.J) || !filter.acceptDescType(descType))
+            continue;
+
+        if (entry.offset > fileSize || entry.matchesCount > (fileSize - entry.offset) / (2 * sizeof(std::uint32_t)))
+        {
+            ALICEVISION_LOG_WARNING("Invalid binary match file (truncated matches): " << filepath);
+            return false;
+        }
+
+        const std::size_t nbMatchesToRead = filter.nbMatchesToRead(entry.matchesCount);
+        indices.resize(2 * nbMatchesToRead);
+        stream.seekg(entry.offset);
+        if (!stream.read(reinterpret_cast<char*>(indices.data()), indices.size() * sizeof(std::uint32_t)))
+            return false;
+
+        std::vector<IndMatch> matchesPerDesc(nbMatchesToRead);
+        for (std::size_t i = 0; i < nbMatchesToRead; ++i)
+        {
+            matchesPerDesc[i]._i = indices[2 * i];
+            matchesPerDesc[i]._j = indices[2 * i + 1];
+        }
+        matches[std::make_pair(entry.I, entry.J)][descType] = std::move(matchesPerDesc);
+    }
+    return true;
+}
+
+/**
+ * @brief Load match files in parallel and merge them in the order of the list, as soon as the previous files are merged.
+ * @param[in] matchFiles the match files
+ * @param[in] filter the filters applied while reading the files
+ * @param[in] merge function merging the matches of a file into the output
+ * @return the number of loaded files
+ */
+template<typename MergeFunction>
+std::size_t loadMatchFiles(const std::vector<std::string>& matchFiles, const MatchFileFilter& filter, MergeFunction merge)
+{
+    const int nbFiles = static_cast<int>(matchFiles.size());
+    std::vector<PairwiseMatches> filesMatches(nbFiles);
+    std::vector<char> loaded(nbFiles, 0);
+    std::vector<char> done(nbFiles, 0);
+    int nextFileToMerge = 0;
+    std::size_t nbLoadedMatchFiles = 0;
+
+#pragma omp parallel for schedule(dynamic)
+    for (int i = 0; i < nbFiles; ++i)
+    {
+        ALICEVISION_LOG_DEBUG("Loading match file: " << matchFiles[i]);
+        loaded[i] = LoadMatchFile(filesMatches[i], matchFiles[i], filter.viewsKeys, filter.descTypes, filter.maxNbMatches);
+
+#pragma omp critical
         {
-            for (std::size_t i = 0; i < nbDescType; ++i)
+            done[i] = 1;
+            // files are merged in order, the pending ones stay in memory until the previous ones are loaded
+            for (; nextFileToMerge < nbFiles && done[nextFileToMerge]; ++nextFileToMerge)
             {
-                std::string descTypeStr;
-                std::size_t nbMatches = 0;
-                // Read descType and number of matches
-                stream >> descTypeStr >> nbMatches;
-
-                feature::EImageDescriberType descType = feature::EImageDescriberType_stringToEnum(descTypeStr);
-                std::vector<IndMatch> matchesPerDesc(nbMatches);
-                // Read all matches
-                for (std::size_t i = 0; i < nbMatches; ++i)
+                if (loaded[nextFileToMerge])
                 {
-                    stream >> matchesPerDesc[i];
+                    merge(filesMatches[nextFileToMerge]);
+                    ++nbLoadedMatchFiles;
                 }
-                matches[std::make_pair(I, J)][descType] = std::move(matchesPerDesc);
+                else
+                {
+                    ALICEVISION_LOG_DEBUG("Unable to load match file: " << matchFiles[nextFileToMerge]);
+                }
+                PairwiseMatches().swap(filesMatches[nextFileToMerge]);
             }
         }
-        stream.close();
-        return true;
     }
+    return nbLoadedMatchFiles;
+}
+
+}  // namespace
+
+bool LoadMatchFile(PairwiseMatches& matches,
+                   const std::string& filepath,
+                   const std::set<IndexT>& viewsKeysFilter,
+                   const std::vector<feature::EImageDescriberType>& descTypesFilter,
+                   int maxNbMatches)
+{
+    const std::string ext = fs::path(filepath).extension().string();
+
+    if (!utils::exists(filepath))
+        return false;
+
+    const MatchFileFilter filter{viewsKeysFilter, descTypesFilter, maxNbMatches};
+
+    if (ext == ".txt")
+        return loadTxtMatchFile(matches, filepath, filter);
+    else if (ext == ".bin")
+        return loadBinMatchFile(matches, filepath, filter);
     else
-    {
         ALICEVISION_LOG_WARNING("Unknown matching file format: " << ext);
-    }
     return false;
 }
 
 void filterMatchesByViews(PairwiseMatches& matches, const std::set<IndexT>& viewsKeys)
 {
-    matching::PairwiseMatches filteredMatches;
-    for (matching::PairwiseMatches::const_iterator iter = matches.begin(); iter != matches.end(); ++iter)
+    for (auto iter = matches.begin(); iter != matches.end();)
     {
         if (viewsKeys.find(iter->first.first) != viewsKeys.end() && viewsKeys.find(iter->first.second) != viewsKeys.end())
-        {
-            filteredMatches.insert(*iter);
-        }
+            ++iter;
+        else
+            iter = matches.erase(iter);
     }
-    matches.swap(filteredMatches);
 }
 
 void filterTopMatches(PairwiseMatches& allMatches, int maxNum, int minNum)
@@ -114,18 +392,23 @@ void filterTopMatches(PairwiseMatches& allMatches, int maxNum, int minNum)
 
 void filterMatchesByDesc(PairwiseMatches& allMatches, const std::vector<feature::EImageDescriberType>& descTypesFilter)
 {
-    matching::PairwiseMatches filteredMatches;
-    for (const auto& matchesPerDesc : allMatches)
+    for (auto matchesPerDesc = allMatches.begin(); matchesPerDesc != allMatches.end();)
     {
-        for (const auto& matches : matchesPerDesc.second)
+        MatchesPerDescType& pairMatches = matchesPerDesc->second;
+        for (auto matches = pairMatches.begin(); matches != pairMatches.end();)
         {
-            const IndMatches& m = matches.second;
             // if current descType in descTypesFilter
-            if (std::find(descTypesFilter.begin(), descTypesFilter.end(), matches.first) != descTypesFilter.end())
-                filteredMatches[matchesPerDesc.first][matches.first] = m;
+            if (std::find(descTypesFilter.begin(), descTypesFilter.end(), matches->first) != descTypesFilter.end())
+                ++matches;
+            else
+                matches = pairMatches.erase(matches);
         }
+
+        if (pairMatches.empty())
+            matchesPerDesc = allMatches.erase(matchesPerDesc);
+        else
+            ++matchesPerDesc;
     }
-    allMatches.swap(filteredMatches);
 }
 
 std::size_t LoadMatchFilePerImage(PairwiseMatches& matches,
@@ -133,89 +416,50 @@ std::size_t LoadMatchFilePerImage(PairwiseMatches& matches,
                                   const std::string& folder,
                                   const std::string& extension)
 {
-    int nbLoadedMatchFiles = 0;
-// Load one match file per image
-#pragma omp parallel for num_threads(3)
-    for (ptrdiff_t i = 0; i < static_cast<ptrdiff_t>(viewsKeys.size()); ++i)
-    {
-        std::set<IndexT>::const_iterator it = viewsKeys.begin();
-        std::advance(it, i);
-        const IndexT idView = *it;
-        const std::string matchFilename = std::to_string(idView) + "." + extension;
-        PairwiseMatches fileMatches;
-        if (!LoadMatchFile(fileMatches, (fs::path(folder) / matchFilename).string()))
-        {
-#pragma omp critical
-            {
-                ALICEVISION_LOG_DEBUG("Unable to load match file: " << matchFilename << " in: " << folder);
-            }
-            continue;
-        }
-#pragma omp critical
-        {
-            ++nbLoadedMatchFiles;
-            // merge the loaded matches into the output
-            for (const auto& v : fileMatches)
-            {
-                matches[v.first] = v.second;
-            }
-        }
-    }
-    return nbLoadedMatchFiles;
+    // Load one match file per image
+    std::vector<std::string> matchFiles;
+    matchFiles.reserve(viewsKeys.size());
+    for (const IndexT idView : viewsKeys)
+        matchFiles.push_back((fs::path(folder) / (std::to_string(idView) + "." + extension)).string());
+
+    const std::set<IndexT> noViewsKeysFilter;
+    const std::vector<feature::EImageDescriberType> noDescTypesFilter;
+    const MatchFileFilter filter{noViewsKeysFilter, noDescTypesFilter, 0};
+    return loadMatchFiles(matchFiles, filter, [&matches](PairwiseMatches& fileMatches) {
+        // merge the loaded matches into the output
+        for (auto& v : fileMatches)
+            matches[v.first] = std::move(v.second);
+    });
 }
 
 /**
- * Load and add pair-wise matches to \p matches from all files in \p folder matching \p pattern.
- * @param[out] matches PairwiseMatches to add loaded matches to
+ * List the match files in \p folder whose filename contains one of the \p patterns, sorted by name.
  * @param[in] folder Folder to load matches files from
- * @param[in] pattern Pattern that files must respect to be loaded
+ * @param[in] patterns Patterns that files must respect to be loaded
+ * @param[out] matchFiles the match files
  */
-std::size_t loadMatchesFromFolder(PairwiseMatches& matches, const std::string& folder, const std::string& pattern)
+void listMatchFiles(const std::string& folder, const std::vector<std::string>& patterns, std::vector<std::string>& matchFiles)
 {
-    std::size_t nbLoadedMatchFiles = 0;
-    std::vector<std::string> matchFiles;
+    std::vector<std::string> folderMatchFiles;
     // list all matches files in 'folder' matching (i.e containing) 'pattern'
     for (const auto& entry : boost::make_iterator_range(fs::directory_iterator(folder), {}))
     {
-        if (entry.path().string().find(pattern) != std::string::npos)
-        {
-            matchFiles.push_back(entry.path().string());
-        }
-    }
-
-#pragma omp parallel for num_threads(3)
-    for (int i = 0; i < matchFiles.size(); ++i)
-    {
-        const std::string& matchFile = matchFiles[i];
-        PairwiseMatches fileMatches;
-        ALICEVISION_LOG_DEBUG("Loading match file: " << matchFile);
-        if (!LoadMatchFile(fileMatches, matchFile))
-        {
-            ALICEVISION_LOG_WARNING("Unable to load match file: " << matchFile);
-            continue;
-        }
-#pragma omp critical
+        const std::string filename = entry.path().filename().string();
+        for (const std::string& pattern : patterns)
         {
-            for (const auto& matchesPerView : fileMatches)
+            if (filename.find(pattern) != std::string::npos)
             {
-                const Pair& pair = matchesPerView.first;
-                const MatchesPerDescType& pairMatches = matchesPerView.second;
-                for (const auto& matchesPerDescType : pairMatches)
-                {
-                    const feature::EImageDescriberType& descType = matchesPerDescType.first;
-                    const auto& pairMatches = matchesPerDescType.second;
-                    // merge in global map
-                    std::copy(std::make_move_iterator(pairMatches.begin()),
-                              std::make_move_iterator(pairMatches.end()),
-                              std::back_inserter(matches[pair][descType]));
-                }
+                folderMatchFiles.push_back(entry.path().string());
+                break;
             }
-            ++nbLoadedMatchFiles;
         }
     }
-    if (!nbLoadedMatchFiles)
-        ALICEVISION_LOG_WARNING("No matches file loaded in: " << folder);
-    return nbLoadedMatchFiles;
+
+    if (folderMatchFiles.empty())
+        ALICEVISION_LOG_WARNING("No matches file found in: " << folder);
+
+    std::sort(folderMatchFiles.begin(), folderMatchFiles.end());
+    matchFiles.insert(matchFiles.end(), folderMatchFiles.begin(), folderMatchFiles.end());
 }
 
 bool Load(PairwiseMatches& matches,
@@ -225,8 +469,7 @@ bool Load(PairwiseMatches& matches,
           int maxNbMatches,
           int minNbMatches)
 {
-    std::size_t nbLoadedMatchFiles = 0;
-    const std::string pattern = "matches.txt";
+    const std::vector<std::string> patterns = {"matches.txt", "matches.bin"};
 
     // build up a set with normalized paths to remove duplicates
     std::set<std::string> foldersSet;
@@ -239,10 +482,33 @@ bool Load(PairwiseMatches& matches,
         }
     }
 
+    // load the files of all the folders together
+    std::vector<std::string> matchFiles;
     for (const auto& folder : foldersSet)
-    {
-        nbLoadedMatchFiles += loadMatchesFromFolder(matches, folder, pattern);
-    }
+        listMatchFiles(folder, patterns, matchFiles);
+
+    // the minimum number of matches applies to the merged matches of all the files, so it is only checked after loading
+    if (maxNbMatches > 0 && minNbMatches > maxNbMatches)
+        throw std::runtime_error("The minimum number of matches is higher than the maximum.");
+    const MatchFileFilter filter{viewsKeysFilter, descTypesFilter, maxNbMatches};
+
+    const std::size_t nbLoadedMatchFiles = loadMatchFiles(matchFiles, filter, [&matches](PairwiseMatches& fileMatches) {
+        for (auto& matchesPerView : fileMatches)
+        {
+            const Pair& pair = matchesPerView.first;
+            for (auto& matchesPerDescType : matchesPerView.second)
+            {
+                const feature::EImageDescriberType& descType = matchesPerDescType.first;
+                IndMatches& pairMatches = matchesPerDescType.second;
+                // merge in global map
+                IndMatches& globalPairMatches = matches[pair][descType];
+                if (globalPairMatches.empty())
+                    globalPairMatches = std::move(pairMatches);
+                else
+                    globalPairMatches.insert(globalPairMatches.end(), pairMatches.begin(), pairMatches.end());
+            }
+        }
+    });
 
     if (!nbLoadedMatchFiles)
         return false;
@@ -261,6 +527,7 @@ bool Load(PairwiseMatches& matches,
     ALICEVISION_LOG_TRACE("Matches per image pair (before filtering):");
     logMatches(matches);
 
+    // the loaded matches are already filtered, but the input matches may not be
     if (!viewsKeysFilter.empty())
         filterMatchesByViews(matches, viewsKeysFilter);
 
@@ -305,6 +572,71 @@ class MatchExporter
         fs::rename(tmpPath, filepath);
     }
 
+    void saveBin(const std::string& filepath, const PairwiseMatches::const_iterator& matchBegin, const PairwiseMatches::const_iterator& matchEnd)
+    {
+        const fs::path bPath = fs::path(filepath);
+        const std::string tmpPath =
+          (bPath.parent_path() / bPath.stem()).string() + "." + utils::generateUniqueFilename() + bPath.extension().string();
+
+        // index of the matches, stored after the index in the same order
+        std::vector<MatchFileEntry> entries;
+        for (PairwiseMatches::const_iterator match = matchBegin; match != matchEnd; ++match)
+        {
+            for (const auto& m : match->second)
+            {
+                MatchFileEntry entry;
+                entry.I = match->first.first;
+                entry.J = match->first.second;
+                entry.descType = static_cast<std::uint32_t>(m.first);
+                entry.reserved = 0;
+                entry.offset = 0;
+                entry.matchesCount = m.second.size();
+                entries.push_back(entry);
+            }
+        }
+
+        std::uint64_t offset = sizeof(MatchFileHeader) + entries.size() * sizeof(MatchFileEntry);
+        for (MatchFileEntry& entry : entries)
+        {
+            entry.offset = offset;
+            offset += entry.matchesCount * 2 * sizeof(std::uint32_t);
+        }
+
+        MatchFileHeader header;
+        std::memcpy(header.magic, matchFileMagic, sizeof(matchFileMagic));
+        header.version = matchFileVersion;
+        header.byteOrder = matchFileByteOrder;
+        header.entryCount = entries.size();
+
+        // write temporary file
+        {
+            std::ofstream stream(tmpPath, std::ios::out | std::ios::binary);
+            stream.write(reinterpret_cast<const char*>(&header), sizeof(MatchFileHeader));
+            stream.write(reinterpret_cast<const char*>(entries.data()), entries.size() * sizeof(MatchFileEntry));
+
+            std::vector<std::uint32_t> indices;
+            for (PairwiseMatches::const_iterator match = matchBegin; match != matchEnd; ++match)
+            {
+                for (const auto& m : match->second)
+                {
+                    indices.resize(2 * m.second.size());
+                    for (std::size_t i = 0; i < m.second.size(); ++i)
+                    {
+                        indices[2 * i] = m.second[i]._i;
+                        indices[2 * i + 1] = m.second[i]._j;
+                    }
+                    stream.write(reinterpret_cast<const char*>(indices.data()), indices.size() * sizeof(std::uint32_t));
+                }
+            }
+
+            if (!stream.good())
+                throw std::runtime_error("Unable to write the match file: " + tmpPath);
+        }
+
+        // rename temporary file
+        fs::rename(tmpPath, filepath);
+    }
+
   public:
     MatchExporter(const PairwiseMatches& matches, const std::string& folder, const std::string& filename)
       : m_matches(matches),
@@ -321,6 +653,8 @@ class MatchExporter
 
         if (m_ext == ".txt")
             saveTxt(filepath, m_matches.begin(), m_matches.end());
+        else if (m_ext == ".bin")
+            saveBin(filepath, m_matches.begin(), m_matches.end());
         else
             throw std::runtime_error(std::string("Unknown matching file format: ") + m_ext);
     }
@@ -344,6 +678,8 @@ class MatchExporter
 
             if (m_ext == ".txt")
                 saveTxt(filepath, matchBegin, match);
+            else if (m_ext == ".bin")
+                saveBin(filepath, matchBegin, match);
             else
                 throw std::runtime_error(std::string("Unknown matching file format: ") + m_ext);
 
@@ -9,21 +9,33 @@
 
 #include <aliceVision/matching/IndMatch.hpp>
 
+#include <set>
 #include <string>
+#include <vector>
 
 namespace aliceVision {
 namespace matching {
 
 /**
- * @brief Load a match file.
+ * @brief Load a match file (.txt or .bin).
+ *        The filtered out image pairs and descriptor types are skipped without being parsed.
  *
  * @param[out] matches container for the output matches
  * @param[in] filepath the match file to load
+ * @param[in] viewsKeysFilter Restrict the matches to these views (empty takes all views).
+ * @param[in] descTypesFilter Restrict the matches to these types of descriptors (empty takes all types).
+ * @param[in] maxNbMatches keep at most \p maxNbMatches matches per image pair and descriptor type (0 takes all matches).
+ * @return \p false if the file cannot be loaded.
  */
-bool LoadMatchFile(PairwiseMatches& matches, const std::string& filepath);
+bool LoadMatchFile(PairwiseMatches& matches,
+                   const std::string& filepath,
+                   const std::set<IndexT>& viewsKeysFilter = std::set<IndexT>(),
+                   const std::vector<feature::EImageDescriberType>& descTypesFilter = std::vector<feature::EImageDescriberType>(),
+                   int maxNbMatches = 0);
 
 /**
  * @brief Load the match file for each image.
+ *        Files are loaded in parallel.
  * @param[out] matches container for the output matches.
  * @param[in] viewsKeys the list of views whose match files need to be loaded.
  * @param[in] folder the folder where to look for all the files.
@@ -38,6 +50,7 @@ std::size_t LoadMatchFilePerImage(PairwiseMatches& matches,
 /**
  * @brief Load all the matches from the folder. Optionally filter the view, the type of descriptors
  * and the number of matches.
+ * Files are loaded in parallel and merged in the order of their names, so the result does not depend on the threads.
  *
  * @param[out] matches container for the output matches.
  * @param[in] viewsKeysFilter Restrict the matches to these views.
@@ -76,7 +89,8 @@ void filterTopMatches(PairwiseMatches& allMatches, int maxNum, int minNum);
  *
  * @param[in] matches: container for the output matches
  * @param[in] folder: folder containing the match files
- * @param[in] extension: txt or bin file format
+ * @param[in] extension: txt or bin file format.
+ *            Binary files start with an index of the image pairs, so that filtered out pairs are not read.
  * @param[in] matchFilePerImage: do we store a global match file
  *            or one match file per image
  * @param[in] prefix: optional prefix for the output file(s)
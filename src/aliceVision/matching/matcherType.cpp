@@ -26,6 +26,8 @@ std::string EMatcherType_enumToString(EMatcherType matcherType)
             return "FAST_CASCADE_HASHING_L2";
         case EMatcherType::BRUTE_FORCE_HAMMING:
             return "BRUTE_FORCE_HAMMING";
+        case EMatcherType::HNSW_L2:
+            return "HNSW_L2";
     }
     throw std::out_of_range("Invalid matcherType enum");
 }
@@ -42,6 +44,8 @@ EMatcherType EMatcherType_stringToEnum(const std::string& matcherType)
         return EMatcherType::FAST_CASCADE_HASHING_L2;
     if (matcherType == "BRUTE_FORCE_HAMMING")
         return EMatcherType::BRUTE_FORCE_HAMMING;
+    if (matcherType == "HNSW_L2")
+        return EMatcherType::HNSW_L2;
     throw std::out_of_range("Invalid matcherType : " + matcherType);
 }
 
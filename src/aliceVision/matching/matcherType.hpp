@@ -18,7 +18,8 @@ enum EMatcherType
     ANN_L2,
     CASCADE_HASHING_L2,
     FAST_CASCADE_HASHING_L2,
-    BRUTE_FORCE_HAMMING
+    BRUTE_FORCE_HAMMING,
+    HNSW_L2
 };
 
 /**
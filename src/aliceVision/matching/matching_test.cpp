@@ -9,6 +9,9 @@
 #include "aliceVision/matching/ArrayMatcher_bruteForce.hpp"
 #include "aliceVision/matching/ArrayMatcher_kdtreeFlann.hpp"
 #include "aliceVision/matching/ArrayMatcher_cascadeHashing.hpp"
+#include "aliceVision/matching/ArrayMatcher_hnsw.hpp"
+#include "aliceVision/system/Logger.hpp"
+#include "aliceVision/system/Timer.hpp"
 #include <iostream>
 
 #define BOOST_TEST_MODULE matching
@@ -123,6 +126,191 @@ BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_kdtreeFlann_Simple__NN)
     BOOST_CHECK_EQUAL(IndMatch(0, 4), vec_nIndice[4]);
 }
 
+BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_hnsw_Simple__NN)
+{
+    std::mt19937 gen(42);
+
+    const float array[] = {0, 1, 2, 5, 6};
+    // no 3, because it involve the same dist as 1,1
+
+    ArrayMatcher_hnsw<float, feature::L2_Simple<float>> matcher;
+    BOOST_CHECK(matcher.Build(gen, array, 5, 1));
+
+    const float query[] = {2};
+    IndMatches vec_nIndice;
+    std::vector<float> vec_fDistance;
+    const int NN = 5;
+    BOOST_CHECK(matcher.SearchNeighbours(query, 1, &vec_nIndice, &vec_fDistance, NN));
+
+    BOOST_CHECK_EQUAL(5, vec_nIndice.size());
+    BOOST_CHECK_EQUAL(5, vec_fDistance.size());
+
+    // Check distances:
+    BOOST_CHECK_SMALL(static_cast<double>(vec_fDistance[0] - Square(2.0f - 2.0f)), 1e-6);
+    BOOST_CHECK_SMALL(static_cast<double>(vec_fDistance[1] - Square(1.0f - 2.0f)), 1e-6);
+    BOOST_CHECK_SMALL(static_cast<double>(vec_fDistance[2] - Square(0.0f - 2.0f)), 1e-6);
+    BOOST_CHECK_SMALL(static_cast<double>(vec_fDistance[3] - Square(5.0f - 2.0f)), 1e-6);
+    BOOST_CHECK_SMALL(static_cast<double>(vec_fDistance[4] - Square(6.0f - 2.0f)), 1e-6);
+
+    // Check indexes:
+    BOOST_CHECK_EQUAL(IndMatch(0, 2), vec_nIndice[0]);
+    BOOST_CHECK_EQUAL(IndMatch(0, 1), vec_nIndice[1]);
+    BOOST_CHECK_EQUAL(IndMatch(0, 0), vec_nIndice[2]);
+    BOOST_CHECK_EQUAL(IndMatch(0, 3), vec_nIndice[3]);
+    BOOST_CHECK_EQUAL(IndMatch(0, 4), vec_nIndice[4]);
+
+    int nIndice = -1;
+    float fDistance = -1.0f;
+    BOOST_CHECK(matcher.SearchNeighbour(query, &nIndice, &fDistance));
+    BOOST_CHECK_EQUAL(2, nIndice);
+    BOOST_CHECK_SMALL(static_cast<double>(fDistance), 1e-8);
+
+    // more neighbors than descriptors
+    BOOST_CHECK(!matcher.SearchNeighbours(query, 1, &vec_nIndice, &vec_fDistance, 6));
+}
+
+namespace {
+
+/**
+ * @brief Generate SIFT-like descriptors: noisy samples around cluster centers, and queries
+ *        made of perturbed database descriptors and of unrelated descriptors.
+ */
+void generateDescriptors(std::mt19937& gen,
+                         int nbDescriptors,
+                         int nbQueries,
+                         std::vector<unsigned char>& descriptors,
+                         std::vector<unsigned char>& queries)
+{
+    const int dimension = 128;
+    const int nbClusters = 100;
+
+    std::uniform_real_distribution<float> centerDistribution(0.f, 60.f);
+    std::vector<float> centers(nbClusters * dimension);
+    for (float& c : centers)
+        c = centerDistribution(gen);
+
+    std::uniform_int_distribution<int> clusterDistribution(0, nbClusters - 1);
+    std::normal_distribution<float> descriptorNoise(0.f, 20.f);
+    const auto sample = [&](const float* center, unsigned char* descriptor) {
+        for (int d = 0; d < dimension; ++d)
+            descriptor[d] = static_cast<unsigned char>(std::clamp(center[d] + descriptorNoise(gen), 0.f, 255.f));
+    };
+
+    descriptors.resize(nbDescriptors * dimension);
+    for (int i = 0; i < nbDescriptors; ++i)
+        sample(&centers[clusterDistribution(gen) * dimension], &descriptors[i * dimension]);
+
+    std::normal_distribution<float> queryNoise(0.f, 5.f);
+    std::uniform_int_distribution<int> descriptorDistribution(0, nbDescriptors - 1);
+    queries.resize(nbQueries * dimension);
+    for (int i = 0; i < nbQueries; ++i)
+    {
+        if (i % 2 == 0)
+        {
+            const unsigned char* descriptor = &descriptors[descriptorDistribution(gen) * dimension];
+            for (int d = 0; d < dimension; ++d)
+                queries[i * dimension + d] = static_cast<unsigned char>(std::clamp(descriptor[d] + queryNoise(gen), 0.f, 255.f));
+        }
+        else
+        {
+            sample(&centers[clusterDistribution(gen) * dimension], &queries[i * dimension]);
+        }
+    }
+}
+
+/// Fraction of the queries for which the nearest neighbor is found
+double recall(const IndMatches& expected, const IndMatches& found, std::size_t NN)
+{
+    std::size_t nbFound = 0;
+    for (std::size_t i = 0; i < expected.size(); i += NN)
+        nbFound += (found[i] == expected[i]);
+    return static_cast<double>(nbFound) * NN / expected.size();
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_hnsw_Recall)
+{
+    std::mt19937 gen(42);
+    std::vector<unsigned char> descriptors, queries;
+    generateDescriptors(gen, 2000, 500, descriptors, queries);
+
+    typedef feature::L2_Vectorized<unsigned char> MetricT;
+    IndMatches expectedIndices;
+    std::vector<float> expectedDistances;
+    ArrayMatcher_bruteForce<unsigned char, MetricT> bruteForce;
+    BOOST_CHECK(bruteForce.Build(gen, descriptors.data(), 2000, 128));
+    BOOST_CHECK(bruteForce.SearchNeighbours(queries.data(), 500, &expectedIndices, &expectedDistances, 2));
+
+    ArrayMatcher_hnsw<unsigned char> matcher;
+    BOOST_CHECK(matcher.Build(gen, descriptors.data(), 2000, 128));
+    IndMatches indices;
+    std::vector<float> distances;
+    BOOST_CHECK(matcher.SearchNeighbours(queries.data(), 500, &indices, &distances, 2));
+
+    BOOST_CHECK_EQUAL(indices.size(), expectedIndices.size());
+    BOOST_CHECK_GT(recall(expectedIndices, indices, 2), 0.95);
+
+    // the neighbors are sorted and the distances are exact
+    for (std::size_t i = 0; i < indices.size(); i += 2)
+    {
+        BOOST_CHECK_LE(distances[i], distances[i + 1]);
+        BOOST_CHECK_EQUAL(distances[i], MetricT()(&queries[indices[i]._i * 128], &descriptors[indices[i]._j * 128], 128));
+    }
+
+    // the perturbed database descriptors are found
+    for (std::size_t i = 0; i < indices.size(); i += 4)
+        BOOST_CHECK_EQUAL(indices[i], expectedIndices[i]);
+}
+
+BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_hnsw_Benchmark)
+{
+    const int nbDescriptors = 10000;
+    const int nbQueries = 10000;
+
+    std::mt19937 gen(42);
+    std::vector<unsigned char> descriptors, queries;
+    generateDescriptors(gen, nbDescriptors, nbQueries, descriptors, queries);
+
+    typedef feature::L2_Vectorized<unsigned char> MetricT;
+    IndMatches expectedIndices;
+    std::vector<float> distances;
+    ArrayMatcher_bruteForce<unsigned char, MetricT> bruteForce;
+    bruteForce.Build(gen, descriptors.data(), nbDescriptors, 128);
+    bruteForce.SearchNeighbours(queries.data(), nbQueries, &expectedIndices, &distances, 2);
+
+    const auto benchmark = [&](const std::string& name, ArrayMatcher<unsigned char, MetricT>& matcher) {
+        IndMatches indices;
+        distances.clear();
+
+        system::Timer timer;
+        matcher.Build(gen, descriptors.data(), nbDescriptors, 128);
+        const double buildDuration = timer.elapsedMs();
+        timer.reset();
+        matcher.SearchNeighbours(queries.data(), nbQueries, &indices, &distances, 2);
+        const double searchDuration = timer.elapsedMs();
+
+        const double matcherRecall = recall(expectedIndices, indices, 2);
+        ALICEVISION_LOG_INFO(name << ": recall " << matcherRecall << ", build " << system::prettyTime(buildDuration) << ", search "
+                                  << system::prettyTime(searchDuration) << " (" << static_cast<int>(nbQueries / (searchDuration / 1000.0))
+                                  << " queries/s)");
+        return matcherRecall;
+    };
+
+    ArrayMatcher_cascadeHashing<unsigned char, MetricT> cascadeHashing;
+    const double cascadeHashingRecall = benchmark("Cascade hashing", cascadeHashing);
+
+    for (int efSearch : {16, 32, 64, 128})
+    {
+        HnswParams params;
+        params.efSearch = efSearch;
+        ArrayMatcher_hnsw<unsigned char> hnsw(params);
+        const double hnswRecall = benchmark("HNSW (efSearch " + std::to_string(efSearch) + ")", hnsw);
+        if (efSearch >= 64)
+            BOOST_CHECK_GE(hnswRecall, cascadeHashingRecall);
+    }
+}
+
 //-- Test LIMIT case (empty arrays)
 
 BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_bruteForce_Simple_EmptyArrays)
@@ -166,3 +354,16 @@ BOOST_AUTO_TEST_CASE(Matching_Cascade_Hashing_Simple_EmptyArrays)
     float fDistance = -1.0f;
     BOOST_CHECK(!matcher.SearchNeighbour(&array[0], &nIndice, &fDistance));
 }
+
+BOOST_AUTO_TEST_CASE(Matching_ArrayMatcher_hnsw_Simple_EmptyArrays)
+{
+    std::mt19937 gen(42);
+
+    std::vector<float> array;
+    ArrayMatcher_hnsw<float> matcher;
+    BOOST_CHECK(!matcher.Build(gen, &array[0], 0, 4));
+
+    int nIndice = -1;
+    float fDistance = -1.0f;
+    BOOST_CHECK(!matcher.SearchNeighbour(&array[0], &nIndice, &fDistance));
+}
@@ -6,9 +6,61 @@
 
 #include "GeometricFilter.hpp"
 
+#include <aliceVision/system/Logger.hpp>
+
+#include <algorithm>
+#include <numeric>
+
 namespace aliceVision {
 namespace matchingImageCollection {
 
+std::vector<PairwiseMatches::const_iterator> sortPairsByDecreasingNbMatches(const PairwiseMatches& putativeMatches)
+{
+    std::vector<std::pair<int, PairwiseMatches::const_iterator>> nbMatchesPerPair;
+    nbMatchesPerPair.reserve(putativeMatches.size());
+    for (auto it = putativeMatches.begin(); it != putativeMatches.end(); ++it)
+    {
+        nbMatchesPerPair.emplace_back(it->second.getNbAllMatches(), it);
+    }
+
+    // stable sort: the pairs with the same number of matches keep the order of the pairs
+    std::stable_sort(nbMatchesPerPair.begin(), nbMatchesPerPair.end(), [](const auto& a, const auto& b) { return a.first > b.first; });
+
+    std::vector<PairwiseMatches::const_iterator> pairs;
+    pairs.reserve(nbMatchesPerPair.size());
+    for (const auto& nbMatchesAndPair : nbMatchesPerPair)
+    {
+        pairs.push_back(nbMatchesAndPair.second);
+    }
+    return pairs;
+}
+
+void logPairsDurations(const std::vector<PairwiseMatches::const_iterator>& pairs, const std::vector<double>& durations)
+{
+    if (pairs.empty())
+        return;
+
+    const double totalDuration = std::accumulate(durations.begin(), durations.end(), 0.0);
+    ALICEVISION_LOG_INFO("Robust model estimation of " << pairs.size() << " pairs: " << system::prettyTime(totalDuration)
+                                                       << " (cumulated over all threads).");
+
+    // longest pairs
+    const std::size_t nbLongestPairs = std::min(pairs.size(), std::size_t(10));
+    std::vector<std::size_t> order(pairs.size());
+    std::iota(order.begin(), order.end(), 0);
+    std::partial_sort(order.begin(), order.begin() + nbLongestPairs, order.end(), [&](std::size_t a, std::size_t b) {
+        return durations[a] > durations[b];
+    });
+
+    ALICEVISION_LOG_DEBUG("Longest pairs:");
+    for (std::size_t i = 0; i < nbLongestPairs; ++i)
+    {
+        const auto& pair = *pairs[order[i]];
+        ALICEVISION_LOG_DEBUG("\t- pair (" << pair.first.first << ", " << pair.first.second << "): " << pair.second.getNbAllMatches()
+                                           << " putative matches, " << system::prettyTime(durations[order[i]]));
+    }
+}
+
 void removePoorlyOverlappingImagePairs(PairwiseMatches& geometricMatches,
                                        const PairwiseMatches& putativeMatches,
                                        float minimumRatio,
@@ -13,6 +13,7 @@
 #include <aliceVision/matching/IndMatch.hpp>
 #include <aliceVision/matchingImageCollection/GeometricFilterMatrix.hpp>
 #include <aliceVision/system/ProgressDisplay.hpp>
+#include <aliceVision/system/Timer.hpp>
 
 #include <map>
 #include <random>
@@ -23,6 +24,21 @@ namespace matchingImageCollection {
 
 using namespace aliceVision::matching;
 
+/**
+ * @brief Sort the pairs by decreasing number of putative matches.
+ *        The number of matches is used as an estimation of the robust model estimation cost.
+ * @param[in] putativeMatches the putative matches of all the pairs
+ * @return the pairs, the pair with the most matches first
+ */
+std::vector<PairwiseMatches::const_iterator> sortPairsByDecreasingNbMatches(const PairwiseMatches& putativeMatches);
+
+/**
+ * @brief Log the total and the longest durations of the robust model estimation of the pairs.
+ * @param[in] pairs the processed pairs
+ * @param[in] durations the duration (in milliseconds) of each pair
+ */
+void logPairsDurations(const std::vector<PairwiseMatches::const_iterator>& pairs, const std::vector<double>& durations);
+
 /**
  * @brief Perform robust model estimation (with optional guided_matching)
  * or all the pairs and regions correspondences contained in the putativeMatches set.
@@ -49,24 +65,41 @@ void robustModelEstimation(PairwiseMatches& out_geometricMatches,
 {
     out_geometricMatches.clear();
 
+    // the most expensive pairs are processed first, so that the threads do not wait for a long pair at the end
+    const std::vector<PairwiseMatches::const_iterator> pairs = sortPairsByDecreasingNbMatches(putativeMatches);
+
+    // one seed per pair, so that the estimation of a pair does not depend on the threads scheduling
+    std::vector<std::mt19937::result_type> seeds(pairs.size());
+    for (auto& seed : seeds)
+        seed = randomNumberGenerator();
+
+    std::vector<double> durations(pairs.size(), 0.0);
+
     auto progressDisplay = system::createConsoleProgressDisplay(putativeMatches.size(), std::cout, "Robust Model Estimation\n");
 
-#pragma omp parallel for schedule(dynamic)
-    for (int i = 0; i < (int)putativeMatches.size(); ++i)
+#pragma omp parallel
     {
-        PairwiseMatches::const_iterator iter = putativeMatches.begin();
-        std::advance(iter, i);
-
-        const Pair currentPair = iter->first;
-        const MatchesPerDescType& putativeMatchesPerType = iter->second;
-        const Pair& imagePair = iter->first;
+        // per-thread random number generator, reseeded for each pair
+        std::mt19937 pairRandomNumberGenerator;
+        // per-thread ACRansac buffers, reused by all the pairs of the thread
+        robustEstimation::ACRansacBuffers acRansacBuffers;
 
-        // apply the geometric filter (robust model estimation)
+#pragma omp for schedule(dynamic, 1)
+        for (int i = 0; i < (int)pairs.size(); ++i)
         {
+            const system::Timer timer;
+
+            const Pair& imagePair = pairs[i]->first;
+            const MatchesPerDescType& putativeMatchesPerType = pairs[i]->second;
+
+            pairRandomNumberGenerator.seed(seeds[i]);
+
+            // apply the geometric filter (robust model estimation)
             MatchesPerDescType inliers;
             GeometryFunctor geometricFilter = functor;  // use a copy since we are in a multi-thread context
+            geometricFilter.m_acRansacBuffers = &acRansacBuffers;
             const EstimationStatus state =
-              geometricFilter.geometricEstimation(sfmData, regionsPerView, imagePair, putativeMatchesPerType, randomNumberGenerator, inliers);
+              geometricFilter.geometricEstimation(sfmData, regionsPerView, imagePair, putativeMatchesPerType, pairRandomNumberGenerator, inliers);
             if (state.hasStrongSupport)
             {
                 if (guidedMatching)
@@ -79,12 +112,16 @@ void robustModelEstimation(PairwiseMatches& out_geometricMatches,
 
 #pragma omp critical
                 {
-                    out_geometricMatches.emplace(currentPair, std::move(inliers));
+                    out_geometricMatches.emplace(imagePair, std::move(inliers));
                 }
             }
+
+            durations[i] = timer.elapsedMs();
+            ++progressDisplay;
         }
-        ++progressDisplay;
     }
+
+    logPairsDurations(pairs, durations);
 }
 
 /**
@@ -7,6 +7,8 @@
 
 #pragma once
 
+#include <aliceVision/robustEstimation/ACRansac.hpp>
+
 namespace aliceVision {
 
 namespace feature {
@@ -25,10 +27,14 @@ namespace matchingImageCollection {
 
 struct GeometricFilterMatrix
 {
-    GeometricFilterMatrix(double precision, double precisionRobust, std::size_t stIteration)
+    GeometricFilterMatrix(double precision,
+                          double precisionRobust,
+                          std::size_t stIteration,
+                          const robustEstimation::ACRansacAdaptiveParams& acRansacAdaptiveParams = robustEstimation::ACRansacAdaptiveParams())
       : m_dPrecision(precision),
         m_dPrecision_robust(precisionRobust),
-        m_stIteration(stIteration)
+        m_stIteration(stIteration),
+        m_acRansacAdaptiveParams(acRansacAdaptiveParams)
     {}
 
     /**
@@ -49,6 +55,8 @@ struct GeometricFilterMatrix
     double m_dPrecision;  // upper_bound precision used for robust estimation
     double m_dPrecision_robust;
     std::size_t m_stIteration;  // maximal number of iteration for robust estimation
+    robustEstimation::ACRansacAdaptiveParams m_acRansacAdaptiveParams;  // early termination of the ACRansac iterations
+    robustEstimation::ACRansacBuffers* m_acRansacBuffers = nullptr;     // buffers of the ACRansac, kept per thread by the caller
 };
 
 }  // namespace matchingImageCollection
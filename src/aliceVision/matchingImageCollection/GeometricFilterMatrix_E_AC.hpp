@@ -30,8 +30,10 @@ namespace matchingImageCollection {
  */
 struct GeometricFilterMatrix_E_AC : public GeometricFilterMatrix
 {
-    GeometricFilterMatrix_E_AC(double dPrecision = std::numeric_limits<double>::infinity(), std::size_t iteration = 1024)
-      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration),
+    GeometricFilterMatrix_E_AC(double dPrecision = std::numeric_limits<double>::infinity(),
+                               std::size_t iteration = 1024,
+                               const robustEstimation::ACRansacAdaptiveParams& acRansacAdaptiveParams = robustEstimation::ACRansacAdaptiveParams())
+      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration, acRansacAdaptiveParams),
         m_E(Mat3::Identity())
     {}
 
@@ -100,7 +102,8 @@ struct GeometricFilterMatrix_E_AC : public GeometricFilterMatrix
         std::vector<std::size_t> inliers;
         robustEstimation::Mat3Model model;
         const std::pair<double, double> ACRansacOut =
-          robustEstimation::ACRANSAC(kernel, randomNumberGenerator, inliers, m_stIteration, &model, upperBoundPrecision);
+          robustEstimation::ACRANSAC(
+            kernel, randomNumberGenerator, inliers, m_stIteration, &model, upperBoundPrecision, m_acRansacAdaptiveParams, m_acRansacBuffers);
         m_E = model.getMatrix();
 
         if (inliers.empty())
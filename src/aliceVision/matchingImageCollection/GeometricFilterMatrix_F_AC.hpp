@@ -37,8 +37,9 @@ struct GeometricFilterMatrix_F_AC : public GeometricFilterMatrix
     GeometricFilterMatrix_F_AC(double dPrecision = std::numeric_limits<double>::infinity(),
                                std::size_t iteration = 1024,
                                robustEstimation::ERobustEstimator estimator = robustEstimation::ERobustEstimator::ACRANSAC,
-                               bool estimateDistortion = false)
-      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration),
+                               bool estimateDistortion = false,
+                               const robustEstimation::ACRansacAdaptiveParams& acRansacAdaptiveParams = robustEstimation::ACRansacAdaptiveParams())
+      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration, acRansacAdaptiveParams),
         m_F(Mat3::Identity()),
         m_estimator(estimator),
         m_estimateDistortion(estimateDistortion)
@@ -239,8 +240,8 @@ struct GeometricFilterMatrix_F_AC : public GeometricFilterMatrix
         const double upper_bound_precision = m_dPrecision;
 
         robustEstimation::Mat3Model model;
-        const std::pair<double, double> ACRansacOut =
-          ACRANSAC(kernel, randomNumberGenerator, out_inliers, m_stIteration, &model, upper_bound_precision);
+        const std::pair<double, double> ACRansacOut = ACRANSAC(
+          kernel, randomNumberGenerator, out_inliers, m_stIteration, &model, upper_bound_precision, m_acRansacAdaptiveParams, m_acRansacBuffers);
 
         m_F = model.getMatrix();
 
@@ -286,8 +287,8 @@ struct GeometricFilterMatrix_F_AC : public GeometricFilterMatrix
         const double upperBoundPrecision = m_dPrecision;
 
         ModelT_ model;
-        const std::pair<double, double> ACRansacOut =
-          robustEstimation::ACRANSAC(kernel, randomNumberGenerator, out_inliers, m_stIteration, &model, upperBoundPrecision);
+        const std::pair<double, double> ACRansacOut = robustEstimation::ACRANSAC(
+          kernel, randomNumberGenerator, out_inliers, m_stIteration, &model, upperBoundPrecision, m_acRansacAdaptiveParams, m_acRansacBuffers);
         m_F = model.getMatrix();
 
         if (out_inliers.empty())
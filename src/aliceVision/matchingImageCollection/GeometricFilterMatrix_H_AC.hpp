@@ -27,8 +27,10 @@ namespace matchingImageCollection {
  */
 struct GeometricFilterMatrix_H_AC : public GeometricFilterMatrix
 {
-    GeometricFilterMatrix_H_AC(double dPrecision = std::numeric_limits<double>::infinity(), std::size_t iteration = 1024)
-      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration),
+    GeometricFilterMatrix_H_AC(double dPrecision = std::numeric_limits<double>::infinity(),
+                               std::size_t iteration = 1024,
+                               const robustEstimation::ACRansacAdaptiveParams& acRansacAdaptiveParams = robustEstimation::ACRansacAdaptiveParams())
+      : GeometricFilterMatrix(dPrecision, std::numeric_limits<double>::infinity(), iteration, acRansacAdaptiveParams),
         m_H(Mat3::Identity())
     {}
 
@@ -82,7 +84,8 @@ struct GeometricFilterMatrix_H_AC : public GeometricFilterMatrix
         std::vector<std::size_t> inliers;
         robustEstimation::Mat3Model model;
         const std::pair<double, double> ACRansacOut =
-          robustEstimation::ACRANSAC(kernel, randomNumberGenerator, inliers, m_stIteration, &model, upperBoundPrecision);
+          robustEstimation::ACRANSAC(
+            kernel, randomNumberGenerator, inliers, m_stIteration, &model, upperBoundPrecision, m_acRansacAdaptiveParams, m_acRansacBuffers);
         m_H = model.getMatrix();
 
         if (inliers.empty())
@@ -0,0 +1,42 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/matchingImageCollection/GeometricFilter.hpp>
+
+#define BOOST_TEST_MODULE matchingImageCollectionGeometricFilter
+
+#include <boost/test/unit_test.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::matchingImageCollection;
+
+BOOST_AUTO_TEST_CASE(matchingImageCollection_sortPairsByDecreasingNbMatches)
+{
+    PairwiseMatches putativeMatches;
+    // number of matches per pair, split between two describer types
+    const std::map<Pair, std::pair<int, int>> nbMatchesPerPair = {
+      {{0, 1}, {3, 0}}, {{0, 2}, {10, 5}}, {{1, 2}, {0, 0}}, {{1, 3}, {2, 1}}, {{2, 3}, {40, 0}}};
+
+    for (const auto& pairNbMatches : nbMatchesPerPair)
+    {
+        MatchesPerDescType& matches = putativeMatches[pairNbMatches.first];
+        matches[feature::EImageDescriberType::SIFT].resize(pairNbMatches.second.first);
+        if (pairNbMatches.second.second > 0)
+            matches[feature::EImageDescriberType::AKAZE].resize(pairNbMatches.second.second);
+    }
+
+    const std::vector<PairwiseMatches::const_iterator> pairs = sortPairsByDecreasingNbMatches(putativeMatches);
+
+    // the pairs with the same number of matches keep their order
+    const std::vector<Pair> expectedPairs = {{2, 3}, {0, 2}, {0, 1}, {1, 3}, {1, 2}};
+    BOOST_REQUIRE_EQUAL(pairs.size(), expectedPairs.size());
+    for (std::size_t i = 0; i < pairs.size(); ++i)
+    {
+        BOOST_CHECK(pairs[i]->first == expectedPairs[i]);
+    }
+
+    BOOST_CHECK(sortPairsByDecreasingNbMatches(PairwiseMatches()).empty());
+}
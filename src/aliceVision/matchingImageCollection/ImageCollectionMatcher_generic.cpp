@@ -11,6 +11,7 @@
 #include <aliceVision/matching/ArrayMatcher_cascadeHashing.hpp>
 #include <aliceVision/matching/RegionsMatcher.hpp>
 #include <aliceVision/matchingImageCollection/IImageCollectionMatcher.hpp>
+#include <aliceVision/matchingImageCollection/RegionsMatcherCache.hpp>
 #include <aliceVision/system/ProgressDisplay.hpp>
 #include <aliceVision/config.hpp>
 
@@ -20,11 +21,17 @@ namespace matchingImageCollection {
 using namespace aliceVision::matching;
 using namespace aliceVision::feature;
 
-ImageCollectionMatcher_generic::ImageCollectionMatcher_generic(float distRatio, bool crossMatching, EMatcherType matcherType)
+ImageCollectionMatcher_generic::ImageCollectionMatcher_generic(float distRatio,
+                                                               bool crossMatching,
+                                                               EMatcherType matcherType,
+                                                               std::size_t cacheMaxMemorySize,
+                                                               const HnswParams& hnswParams)
   : IImageCollectionMatcher(),
     _f_dist_ratio(distRatio),
     _useCrossMatching(crossMatching),
-    _matcherType(matcherType)
+    _matcherType(matcherType),
+    _cacheMaxMemorySize(cacheMaxMemorySize),
+    _hnswParams(hnswParams)
 {}
 
 void ImageCollectionMatcher_generic::Match(std::mt19937& randomNumberGenerator,
@@ -49,41 +56,77 @@ void ImageCollectionMatcher_generic::Match(std::mt19937& randomNumberGenerator,
         map_Pairs[iter->first].push_back(iter->second);
     }
 
-    // Perform matching between all the pairs
+    // Split the pairs of each first index in batches, each batch needs the matcher of I
+    // and, with cross matching, the matchers of the J views (bounded by the memory budget)
+    struct Batch
+    {
+        size_t I;
+        std::vector<size_t> indexToCompare;
+    };
+    std::vector<Batch> batches;
+    std::vector<std::vector<IndexT>> requests;
+
     for (Map_vectorT::const_iterator iter = map_Pairs.begin(); iter != map_Pairs.end(); ++iter)
     {
         const size_t I = iter->first;
-        const std::vector<size_t>& indexToCompare = iter->second;
-
         const feature::Regions& regionsI = regionsPerView.getRegions(I, descType);
-        if (regionsI.RegionCount() == 0)
+
+        std::vector<size_t> indexToCompare;
+        for (const size_t J : iter->second)
         {
-            progressDisplay += indexToCompare.size();
-            continue;
+            const feature::Regions& regionsJ = regionsPerView.getRegions(J, descType);
+            if (regionsI.RegionCount() == 0 || regionsJ.RegionCount() == 0 || regionsI.Type_id() != regionsJ.Type_id())
+                ++progressDisplay;
+            else
+                indexToCompare.push_back(J);
         }
 
-        // Initialize the matching interface
-        matching::RegionsDatabaseMatcher matcher(randomNumberGenerator, _matcherType, regionsI);
+        std::size_t batchMemorySize = 0;
+        for (const size_t J : indexToCompare)
+        {
+            const std::size_t memorySizeJ =
+              _useCrossMatching ? RegionsMatcherCache::estimateMemorySize(_matcherType, regionsPerView.getRegions(J, descType), _hnswParams) : 0;
+
+            if (batches.empty() || batches.back().I != I ||
+                (batchMemorySize + memorySizeJ > _cacheMaxMemorySize && !batches.back().indexToCompare.empty()))
+            {
+                batches.push_back({I, {}});
+                requests.push_back({static_cast<IndexT>(I)});
+                batchMemorySize = 0;
+            }
+            batches.back().indexToCompare.push_back(J);
+            batchMemorySize += memorySizeJ;
+            if (_useCrossMatching)
+                requests.back().push_back(static_cast<IndexT>(J));
+        }
+    }
+
+    RegionsMatcherCache matcherCache(_matcherType, regionsPerView, descType, _cacheMaxMemorySize, _hnswParams);
+    matcherCache.setRequests(randomNumberGenerator, requests);
+
+    // Perform matching between all the pairs
+    for (const Batch& batch : batches)
+    {
+        const size_t I = batch.I;
+        const std::vector<size_t>& indexToCompare = batch.indexToCompare;
+        const feature::Regions& regionsI = regionsPerView.getRegions(I, descType);
+
+        // Get the matching interfaces
+        const std::map<IndexT, RegionsMatcherCache::MatcherPtr> matchers = matcherCache.next();
+        const matching::RegionsDatabaseMatcher& matcher = *matchers.at(I);
 
 #pragma omp parallel for schedule(dynamic) if (b_multithreaded_pair_search)
         for (int j = 0; j < (int)indexToCompare.size(); ++j)
         {
             const size_t J = indexToCompare[j];
-
             const feature::Regions& regionsJ = regionsPerView.getRegions(J, descType);
-            if (regionsJ.RegionCount() == 0 || regionsI.Type_id() != regionsJ.Type_id())
-            {
-                ++progressDisplay;
-                continue;
-            }
 
             IndMatches vec_putatives_matches;
             matcher.Match(_f_dist_ratio, regionsJ, vec_putatives_matches);
 
             if (_useCrossMatching)
             {
-                // Initialize the matching interface
-                matching::RegionsDatabaseMatcher matcherCross(randomNumberGenerator, _matcherType, regionsJ);
+                const matching::RegionsDatabaseMatcher& matcherCross = *matchers.at(J);
 
                 IndMatches vec_putatives_matches_cross;
                 matcherCross.Match(_f_dist_ratio, regionsI, vec_putatives_matches_cross);
@@ -120,6 +163,9 @@ void ImageCollectionMatcher_generic::Match(std::mt19937& randomNumberGenerator,
             }
         }
     }
+
+    ALICEVISION_LOG_INFO(matcherCache.nbBuilds() << " matchers built for " << pairs.size() << " pairs (" << matcherCache.nbHits()
+                                                 << " reused from the cache).");
 }
 
 }  // namespace matchingImageCollection
@@ -8,6 +8,7 @@
 #pragma once
 
 #include "aliceVision/matchingImageCollection/IImageCollectionMatcher.hpp"
+#include "aliceVision/matching/ArrayMatcher_hnsw.hpp"
 
 namespace aliceVision {
 namespace matchingImageCollection {
@@ -18,12 +19,29 @@ namespace matchingImageCollection {
  * Spurious correspondences are discarded by using the
  * a threshold over the distance ratio of the 2 nearest neighbours.
  *
+ * The matcher of each view is built once and reused by all its pairs,
+ * the matchers kept for the next pairs are limited by a memory budget (see RegionsMatcherCache).
+ *
  * @warning: all descriptors are loaded in memory. You need to ensure that it can fit in RAM.
  */
 class ImageCollectionMatcher_generic : public IImageCollectionMatcher
 {
   public:
-    ImageCollectionMatcher_generic(float dist_ratio, bool crossMatching, matching::EMatcherType matcherType);
+    /**
+     * @param[in] dist_ratio the distance ratio used to discard spurious correspondences
+     * @param[in] crossMatching use the symmetric matching test
+     * @param[in] matcherType the type of matcher built for each view
+     * @param[in] cacheMaxMemorySize the memory budget (in bytes) of the matchers kept to be reused by the next pairs
+     * @param[in] hnswParams the parameters of the graphs of the HNSW_L2 matcher
+     */
+    ImageCollectionMatcher_generic(float dist_ratio,
+                                   bool crossMatching,
+                                   matching::EMatcherType matcherType,
+                                   std::size_t cacheMaxMemorySize = defaultCacheMaxMemorySize,
+                                   const matching::HnswParams& hnswParams = matching::HnswParams());
+
+    /// Default memory budget of the matchers kept to be reused by the next pairs (1 GiB)
+    static constexpr std::size_t defaultCacheMaxMemorySize = std::size_t(1) << 30;
 
     /// Find corresponding points between some pair of view Ids
     void Match(std::mt19937& randomNumberGenerator,
@@ -40,6 +58,10 @@ class ImageCollectionMatcher_generic : public IImageCollectionMatcher
     bool _useCrossMatching;
     // Matcher Type
     matching::EMatcherType _matcherType;
+    // Memory budget of the matchers kept to be reused by the next pairs
+    std::size_t _cacheMaxMemorySize;
+    // Parameters of the HNSW graphs
+    matching::HnswParams _hnswParams;
 };
 
 }  // namespace matchingImageCollection
@@ -0,0 +1,204 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "RegionsMatcherCache.hpp"
+
+#include <aliceVision/matching/ArrayMatcher_hnsw.hpp>
+#include <aliceVision/alicevision_omp.hpp>
+
+#include <algorithm>
+#include <stdexcept>
+
+namespace aliceVision {
+namespace matchingImageCollection {
+
+RegionsMatcherCache::RegionsMatcherCache(matching::EMatcherType matcherType,
+                                         const feature::RegionsPerView& regionsPerView,
+                                         feature::EImageDescriberType descType,
+                                         std::size_t maxMemorySize,
+                                         const matching::HnswParams& hnswParams)
+  : _matcherType(matcherType),
+    _regionsPerView(regionsPerView),
+    _descType(descType),
+    _maxMemorySize(maxMemorySize),
+    _hnswParams(hnswParams)
+{}
+
+void RegionsMatcherCache::setRequests(std::mt19937& randomNumberGenerator, const std::vector<std::vector<IndexT>>& requests)
+{
+    _requests = requests;
+    _nextRequest = 0;
+    _seeds.clear();
+    _nextUses.clear();
+    _matchers.clear();
+    _prefetched.clear();
+    _memorySize = 0;
+    _nbBuilds = 0;
+    _nbHits = 0;
+
+    for (std::size_t r = 0; r < _requests.size(); ++r)
+    {
+        for (const IndexT viewId : _requests[r])
+            _nextUses[viewId].push_back(r);
+    }
+
+    // seeds are drawn in the order of the view ids, so they do not depend on the order of the requests
+    for (const auto& viewUses : _nextUses)
+        _seeds[viewUses.first] = randomNumberGenerator();
+}
+
+std::map<IndexT, RegionsMatcherCache::MatcherPtr> RegionsMatcherCache::next()
+{
+    if (_nextRequest >= _requests.size())
+        throw std::out_of_range("No more requests in the matcher cache.");
+
+    const std::size_t request = _nextRequest++;
+    std::map<IndexT, MatcherPtr> out;
+    std::vector<IndexT> toBuild;
+
+    for (const IndexT viewId : _requests[request])
+    {
+        if (out.count(viewId))
+            continue;
+
+        std::deque<std::size_t>& uses = _nextUses.at(viewId);
+        while (!uses.empty() && uses.front() <= request)
+            uses.pop_front();
+
+        const auto it = _matchers.find(viewId);
+        if (it != _matchers.end())
+        {
+            out[viewId] = it->second.matcher;
+            // a prefetched matcher is used for the first time
+            if (_prefetched.erase(viewId) == 0)
+                ++_nbHits;
+        }
+        else
+        {
+            out[viewId] = nullptr;
+            toBuild.push_back(viewId);
+        }
+    }
+
+    // Prefetch the missing matchers of the next requests, so that the threads are not idle when a request
+    // only needs a single matcher (the matching without cross matching only requests the view I)
+    const std::size_t nbRequired = toBuild.size();
+    const std::size_t maxNbBuilds = std::max(nbRequired, static_cast<std::size_t>(omp_get_max_threads()));
+    if (nbRequired > 0 && nbRequired < maxNbBuilds)
+    {
+        std::size_t memorySize = _memorySize;
+        for (const IndexT viewId : toBuild)
+            memorySize += estimateMemorySize(_matcherType, _regionsPerView.getRegions(viewId, _descType), _hnswParams);
+
+        // the prefetched matchers are kept in the cache, they are only built within the memory budget
+        bool budgetExceeded = false;
+        for (std::size_t r = request + 1; r < _requests.size() && toBuild.size() < maxNbBuilds && !budgetExceeded; ++r)
+        {
+            for (const IndexT viewId : _requests[r])
+            {
+                if (toBuild.size() >= maxNbBuilds)
+                    break;
+                if (_matchers.count(viewId) || std::find(toBuild.begin(), toBuild.end(), viewId) != toBuild.end())
+                    continue;
+
+                memorySize += estimateMemorySize(_matcherType, _regionsPerView.getRegions(viewId, _descType), _hnswParams);
+                if (memorySize > _maxMemorySize)
+                {
+                    budgetExceeded = true;
+                    break;
+                }
+                toBuild.push_back(viewId);
+            }
+        }
+    }
+
+    // Build the missing matchers
+    std::vector<MatcherPtr> built(toBuild.size());
+#pragma omp parallel for schedule(dynamic)
+    for (int i = 0; i < static_cast<int>(toBuild.size()); ++i)
+    {
+        std::mt19937 randomNumberGenerator(_seeds.at(toBuild[i]));
+        built[i] = std::make_shared<const matching::RegionsDatabaseMatcher>(
+          randomNumberGenerator, _matcherType, _regionsPerView.getRegions(toBuild[i], _descType), _hnswParams);
+    }
+
+    for (std::size_t i = 0; i < toBuild.size(); ++i)
+    {
+        const IndexT viewId = toBuild[i];
+        if (i < nbRequired)
+            out[viewId] = built[i];
+        else
+            _prefetched.insert(viewId);
+        ++_nbBuilds;
+
+        const std::size_t memorySize = estimateMemorySize(_matcherType, _regionsPerView.getRegions(viewId, _descType), _hnswParams);
+        _matchers[viewId] = {built[i], memorySize};
+        _memorySize += memorySize;
+    }
+
+    // Release the matchers that are not requested anymore
+    for (const auto& viewMatcher : out)
+    {
+        if (_nextUses.at(viewMatcher.first).empty())
+        {
+            _memorySize -= _matchers.at(viewMatcher.first).memorySize;
+            _matchers.erase(viewMatcher.first);
+        }
+    }
+
+    // Evict the matchers requested the latest until the memory budget is respected
+    while (_memorySize > _maxMemorySize && !_matchers.empty())
+    {
+        auto evicted = _matchers.begin();
+        std::size_t evictedNextUse = 0;
+        for (auto it = _matchers.begin(); it != _matchers.end(); ++it)
+        {
+            const std::size_t nextUse = _nextUses.at(it->first).front();
+            if (nextUse > evictedNextUse)
+            {
+                evicted = it;
+                evictedNextUse = nextUse;
+            }
+        }
+        _memorySize -= evicted->second.memorySize;
+        _prefetched.erase(evicted->first);
+        _matchers.erase(evicted);
+    }
+
+    return out;
+}
+
+std::size_t RegionsMatcherCache::estimateMemorySize(matching::EMatcherType matcherType,
+                                                    const feature::Regions& regions,
+                                                    const matching::HnswParams& hnswParams)
+{
+    // size of the index per descriptor, the descriptors themselves are not copied by the matchers
+    std::size_t bytesPerDescriptor = 0;
+    switch (matcherType)
+    {
+        case matching::BRUTE_FORCE_L2:
+        case matching::BRUTE_FORCE_HAMMING:
+            bytesPerDescriptor = 0;
+            break;
+        case matching::ANN_L2:
+            // 4 randomized kd-trees: one leaf, one inner node and one index per descriptor in each tree
+            bytesPerDescriptor = 4 * (2 * 32 + sizeof(int));
+            break;
+        case matching::CASCADE_HASHING_L2:
+        case matching::FAST_CASCADE_HASHING_L2:
+            // hash code, bucket ids and bucket entries of each descriptor
+            bytesPerDescriptor = 112;
+            break;
+        case matching::HNSW_L2:
+            // links in the bottom layer of the graph, and the upper layers
+            bytesPerDescriptor = (2 * hnswParams.M + 1) * sizeof(int) + sizeof(int) + sizeof(std::vector<int>);
+            break;
+    }
+    return sizeof(matching::RegionsDatabaseMatcher) + regions.RegionCount() * bytesPerDescriptor;
+}
+
+}  // namespace matchingImageCollection
+}  // namespace aliceVision
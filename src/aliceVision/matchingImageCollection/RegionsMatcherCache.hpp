@@ -0,0 +1,121 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/feature/RegionsPerView.hpp>
+#include <aliceVision/matching/RegionsMatcher.hpp>
+#include <aliceVision/matching/matcherType.hpp>
+#include <aliceVision/types.hpp>
+
+#include <deque>
+#include <map>
+#include <memory>
+#include <random>
+#include <set>
+#include <vector>
+
+namespace aliceVision {
+namespace matchingImageCollection {
+
+/**
+ * @brief Cache of the matchers of the views (kd-trees, hashed descriptors...),
+ *        so that the matcher of a view is built once and reused by all the pairs of the view.
+ *
+ * The views are requested in an order known beforehand (see setRequests):
+ * - the matchers that are not requested anymore are released immediately,
+ * - when the memory budget is exceeded, the matchers requested the latest are evicted first,
+ *   which is the optimal eviction policy for a known sequence of requests,
+ * - the matchers of the next requests are built in parallel with the missing ones, up to one per thread
+ *   and within the memory budget.
+ *
+ * The matchers are built from a random seed drawn for each view, so a matcher built again after
+ * its eviction is the same and the matches do not depend on the memory budget.
+ */
+class RegionsMatcherCache
+{
+  public:
+    typedef std::shared_ptr<const matching::RegionsDatabaseMatcher> MatcherPtr;
+
+    /**
+     * @param[in] matcherType the type of matcher to build
+     * @param[in] regionsPerView the regions of the views, used as database of the matchers
+     * @param[in] descType the describer type of the regions
+     * @param[in] maxMemorySize the memory budget (in bytes) of the matchers kept for the next requests
+     * @param[in] hnswParams the parameters of the graphs of the HNSW_L2 matchers
+     */
+    RegionsMatcherCache(matching::EMatcherType matcherType,
+                        const feature::RegionsPerView& regionsPerView,
+                        feature::EImageDescriberType descType,
+                        std::size_t maxMemorySize,
+                        const matching::HnswParams& hnswParams = matching::HnswParams());
+
+    /**
+     * @brief Set the sequence of requests and clear the cache.
+     * @param[in] randomNumberGenerator the random number generator used to draw the seed of each view
+     * @param[in] requests the views needed by each request, in the order of the calls to next()
+     */
+    void setRequests(std::mt19937& randomNumberGenerator, const std::vector<std::vector<IndexT>>& requests);
+
+    /**
+     * @brief Get the matchers of the views of the next request, the missing ones are built in parallel
+     *        with the matchers prefetched for the following requests.
+     * @note The returned matchers stay valid when they are evicted from the cache.
+     */
+    std::map<IndexT, MatcherPtr> next();
+
+    /// Number of matchers in the cache
+    std::size_t size() const { return _matchers.size(); }
+
+    /// Estimated memory size of the matchers in the cache
+    std::size_t memorySize() const { return _memorySize; }
+
+    /// Number of matchers built since the last call to setRequests
+    std::size_t nbBuilds() const { return _nbBuilds; }
+
+    /// Number of matchers reused from the cache since the last call to setRequests (first uses of prefetched matchers excluded)
+    std::size_t nbHits() const { return _nbHits; }
+
+    /**
+     * @brief Approximate memory size of the index built by a matcher on top of the regions.
+     * @param[in] matcherType the type of matcher
+     * @param[in] regions the regions used as database of the matcher
+     * @param[in] hnswParams the parameters of the graph of the HNSW_L2 matcher
+     */
+    static std::size_t estimateMemorySize(matching::EMatcherType matcherType,
+                                          const feature::Regions& regions,
+                                          const matching::HnswParams& hnswParams = matching::HnswParams());
+
+  private:
+    struct Entry
+    {
+        MatcherPtr matcher;
+        std::size_t memorySize;
+    };
+
+    matching::EMatcherType _matcherType;
+    const feature::RegionsPerView& _regionsPerView;
+    feature::EImageDescriberType _descType;
+    std::size_t _maxMemorySize;
+    matching::HnswParams _hnswParams;
+
+    std::vector<std::vector<IndexT>> _requests;
+    std::size_t _nextRequest = 0;
+    /// seed of the matcher of each view
+    std::map<IndexT, std::mt19937::result_type> _seeds;
+    /// indexes of the next requests of each view
+    std::map<IndexT, std::deque<std::size_t>> _nextUses;
+
+    std::map<IndexT, Entry> _matchers;
+    /// matchers built for a next request, not returned yet
+    std::set<IndexT> _prefetched;
+    std::size_t _memorySize = 0;
+    std::size_t _nbBuilds = 0;
+    std::size_t _nbHits = 0;
+};
+
+}  // namespace matchingImageCollection
+}  // namespace aliceVision
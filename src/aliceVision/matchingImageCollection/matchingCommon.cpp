@@ -16,26 +16,33 @@
 namespace aliceVision {
 namespace matchingImageCollection {
 
-std::unique_ptr<IImageCollectionMatcher> createImageCollectionMatcher(matching::EMatcherType matcherType, float distRatio, bool crossMatching)
+std::unique_ptr<IImageCollectionMatcher> createImageCollectionMatcher(matching::EMatcherType matcherType,
+                                                                      float distRatio,
+                                                                      bool crossMatching,
+                                                                      const matching::HnswParams& hnswParams,
+                                                                      std::size_t matcherCacheMaxMemorySize)
 {
     std::unique_ptr<IImageCollectionMatcher> matcherPtr;
 
     switch (matcherType)
     {
         case matching::BRUTE_FORCE_L2:
-            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::BRUTE_FORCE_L2));
+            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::BRUTE_FORCE_L2, matcherCacheMaxMemorySize));
             break;
         case matching::ANN_L2:
-            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::ANN_L2));
+            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::ANN_L2, matcherCacheMaxMemorySize));
             break;
         case matching::CASCADE_HASHING_L2:
-            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::CASCADE_HASHING_L2));
+            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::CASCADE_HASHING_L2, matcherCacheMaxMemorySize));
             break;
         case matching::FAST_CASCADE_HASHING_L2:
             matcherPtr.reset(new ImageCollectionMatcher_cascadeHashing(distRatio));
             break;
         case matching::BRUTE_FORCE_HAMMING:
-            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::BRUTE_FORCE_HAMMING));
+            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::BRUTE_FORCE_HAMMING, matcherCacheMaxMemorySize));
+            break;
+        case matching::HNSW_L2:
+            matcherPtr.reset(new ImageCollectionMatcher_generic(distRatio, crossMatching, matching::HNSW_L2, matcherCacheMaxMemorySize, hnswParams));
             break;
 
         default:
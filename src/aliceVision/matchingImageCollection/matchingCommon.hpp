@@ -8,7 +8,9 @@
 #pragma once
 
 #include "aliceVision/matching/matcherType.hpp"
+#include "aliceVision/matching/ArrayMatcher_hnsw.hpp"
 #include "aliceVision/matchingImageCollection/IImageCollectionMatcher.hpp"
+#include "aliceVision/matchingImageCollection/ImageCollectionMatcher_generic.hpp"
 
 namespace aliceVision {
 namespace matchingImageCollection {
@@ -16,9 +18,16 @@ namespace matchingImageCollection {
 /**
  *
  * @param matcherType
+ * @param hnswParams parameters of the graphs of the HNSW_L2 matcher
+ * @param matcherCacheMaxMemorySize memory budget (in bytes) of the matchers kept to be reused by the next pairs
  * @return
  */
-std::unique_ptr<IImageCollectionMatcher> createImageCollectionMatcher(matching::EMatcherType matcherType, float distRatio, bool crossMatching);
+std::unique_ptr<IImageCollectionMatcher> createImageCollectionMatcher(
+  matching::EMatcherType matcherType,
+  float distRatio,
+  bool crossMatching,
+  const matching::HnswParams& hnswParams = matching::HnswParams(),
+  std::size_t matcherCacheMaxMemorySize = ImageCollectionMatcher_generic::defaultCacheMaxMemorySize);
 
 }  // namespace matchingImageCollection
 }  // namespace aliceVision
\ No newline at end of file
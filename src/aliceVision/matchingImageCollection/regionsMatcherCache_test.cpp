@@ -0,0 +1,182 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/matchingImageCollection/RegionsMatcherCache.hpp>
+#include <aliceVision/matchingImageCollection/ImageCollectionMatcher_generic.hpp>
+#include <aliceVision/feature/regionsFactory.hpp>
+#include <aliceVision/alicevision_omp.hpp>
+
+#include <algorithm>
+#include <random>
+
+#define BOOST_TEST_MODULE matchingImageCollectionRegionsMatcherCache
+
+#include <boost/test/unit_test.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::matchingImageCollection;
+
+// Views observing the same random descriptors with some noise
+void fillRegionsPerView(feature::RegionsPerView& regionsPerView, IndexT nbViews, int nbFeatures)
+{
+    std::mt19937 randomNumberGenerator(0);
+    std::uniform_int_distribution<int> descriptorDistribution(0, 255);
+    std::normal_distribution<float> noiseDistribution(0.f, 4.f);
+
+    std::vector<feature::SIFT_Regions::DescriptorT> descriptors(nbFeatures);
+    for (auto& descriptor : descriptors)
+    {
+        for (int k = 0; k < descriptor.size(); ++k)
+            descriptor[k] = static_cast<unsigned char>(descriptorDistribution(randomNumberGenerator));
+    }
+
+    for (IndexT viewId = 0; viewId < nbViews; ++viewId)
+    {
+        feature::SIFT_Regions* regions = new feature::SIFT_Regions();
+        for (int i = 0; i < nbFeatures; ++i)
+        {
+            regions->Features().emplace_back(static_cast<float>(i), static_cast<float>(i), 1.f, 0.f);
+            feature::SIFT_Regions::DescriptorT descriptor;
+            for (int k = 0; k < descriptor.size(); ++k)
+                descriptor[k] = static_cast<unsigned char>(std::clamp(descriptors[i][k] + noiseDistribution(randomNumberGenerator), 0.f, 255.f));
+            regions->Descriptors().push_back(descriptor);
+        }
+        regionsPerView.addRegions(viewId, feature::EImageDescriberType::SIFT, regions);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(RegionsMatcherCache_eviction)
+{
+    feature::RegionsPerView regionsPerView;
+    fillRegionsPerView(regionsPerView, 3, 100);
+
+    const std::size_t matcherSize =
+      RegionsMatcherCache::estimateMemorySize(matching::CASCADE_HASHING_L2, regionsPerView.getRegions(0, feature::EImageDescriberType::SIFT));
+    const std::vector<std::vector<IndexT>> requests = {{0, 1}, {2}, {0}, {1}, {2}};
+
+    // the budget only fits 2 matchers: the matcher of the view 2 is evicted as it is requested the latest
+    {
+        RegionsMatcherCache cache(matching::CASCADE_HASHING_L2, regionsPerView, feature::EImageDescriberType::SIFT, 2 * matcherSize);
+        std::mt19937 randomNumberGenerator;
+        cache.setRequests(randomNumberGenerator, requests);
+
+        BOOST_CHECK_EQUAL(cache.next().size(), 2);
+        BOOST_CHECK_EQUAL(cache.size(), 2);
+        BOOST_CHECK_EQUAL(cache.next().count(2), 1);
+        BOOST_CHECK_EQUAL(cache.size(), 2);
+        BOOST_CHECK_LE(cache.memorySize(), 2 * matcherSize);
+        cache.next();
+        cache.next();
+        // the matchers of the views 0 and 1 are not requested anymore
+        BOOST_CHECK_EQUAL(cache.size(), 0);
+        cache.next();
+        BOOST_CHECK_EQUAL(cache.nbBuilds(), 4);
+        BOOST_CHECK_EQUAL(cache.nbHits(), 2);
+        BOOST_CHECK_THROW(cache.next(), std::out_of_range);
+    }
+
+    // large budget: each matcher is built once
+    {
+        RegionsMatcherCache cache(matching::CASCADE_HASHING_L2, regionsPerView, feature::EImageDescriberType::SIFT, 10 * matcherSize);
+        std::mt19937 randomNumberGenerator;
+        cache.setRequests(randomNumberGenerator, requests);
+        for (std::size_t i = 0; i < requests.size(); ++i)
+            cache.next();
+        BOOST_CHECK_EQUAL(cache.nbBuilds(), 3);
+        BOOST_CHECK_EQUAL(cache.nbHits(), 3);
+        BOOST_CHECK_EQUAL(cache.size(), 0);
+        BOOST_CHECK_EQUAL(cache.memorySize(), 0);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(RegionsMatcherCache_prefetch)
+{
+    feature::RegionsPerView regionsPerView;
+    fillRegionsPerView(regionsPerView, 3, 100);
+
+    const std::size_t matcherSize =
+      RegionsMatcherCache::estimateMemorySize(matching::HNSW_L2, regionsPerView.getRegions(0, feature::EImageDescriberType::SIFT));
+    const std::vector<std::vector<IndexT>> requests = {{0}, {1}, {2}};
+
+    const int nbThreads = omp_get_max_threads();
+    omp_set_num_threads(3);
+    const std::size_t nbPrefetched = std::min(2, omp_get_max_threads() - 1);
+
+    // the matchers of the next requests are built with the first one
+    {
+        RegionsMatcherCache cache(matching::HNSW_L2, regionsPerView, feature::EImageDescriberType::SIFT, 10 * matcherSize);
+        std::mt19937 randomNumberGenerator;
+        cache.setRequests(randomNumberGenerator, requests);
+
+        BOOST_CHECK_EQUAL(cache.next().size(), 1);
+        BOOST_CHECK_EQUAL(cache.nbBuilds(), 1 + nbPrefetched);
+        BOOST_CHECK_EQUAL(cache.size(), nbPrefetched);
+        BOOST_CHECK(cache.next().at(1) != nullptr);
+        BOOST_CHECK(cache.next().at(2) != nullptr);
+        BOOST_CHECK_EQUAL(cache.nbBuilds(), 3);
+        BOOST_CHECK_EQUAL(cache.nbHits(), 0);
+        BOOST_CHECK_EQUAL(cache.size(), 0);
+    }
+
+    // no prefetch beyond the memory budget
+    {
+        RegionsMatcherCache cache(matching::HNSW_L2, regionsPerView, feature::EImageDescriberType::SIFT, matcherSize);
+        std::mt19937 randomNumberGenerator;
+        cache.setRequests(randomNumberGenerator, requests);
+
+        cache.next();
+        BOOST_CHECK_EQUAL(cache.nbBuilds(), 1);
+        BOOST_CHECK_EQUAL(cache.size(), 0);
+    }
+
+    omp_set_num_threads(nbThreads);
+}
+
+BOOST_AUTO_TEST_CASE(RegionsMatcherCache_crossMatching)
+{
+    feature::RegionsPerView regionsPerView;
+    fillRegionsPerView(regionsPerView, 5, 200);
+
+    const PairSet pairs = {{0, 1}, {0, 2}, {0, 4}, {1, 2}, {1, 3}, {2, 3}, {2, 4}, {3, 4}};
+
+    // the matches do not depend on the memory budget, as the matchers are rebuilt identically
+    for (const matching::EMatcherType matcherType : {matching::CASCADE_HASHING_L2, matching::HNSW_L2})
+    {
+        matching::PairwiseMatches matchesReference;
+        for (const std::size_t cacheMaxMemorySize : {ImageCollectionMatcher_generic::defaultCacheMaxMemorySize, std::size_t(0)})
+        {
+            ImageCollectionMatcher_generic matcher(0.8f, true, matcherType, cacheMaxMemorySize);
+            std::mt19937 randomNumberGenerator;
+            matching::PairwiseMatches matches;
+            matcher.Match(randomNumberGenerator, regionsPerView, pairs, feature::EImageDescriberType::SIFT, matches);
+
+            BOOST_CHECK_EQUAL(matches.size(), pairs.size());
+            if (matchesReference.empty())
+            {
+                matchesReference = matches;
+                continue;
+            }
+            for (const auto& pairMatches : matchesReference)
+            {
+                BOOST_CHECK(matches.at(pairMatches.first).at(feature::EImageDescriberType::SIFT) ==
+                            pairMatches.second.at(feature::EImageDescriberType::SIFT));
+            }
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(RegionsMatcherCache_hnswParams)
+{
+    feature::RegionsPerView regionsPerView;
+    fillRegionsPerView(regionsPerView, 1, 100);
+    const feature::Regions& regions = regionsPerView.getRegions(0, feature::EImageDescriberType::SIFT);
+
+    // the memory budget accounts for the number of links of the graphs
+    matching::HnswParams params;
+    params.M = 2 * matching::HnswParams().M;
+    BOOST_CHECK_GT(RegionsMatcherCache::estimateMemorySize(matching::HNSW_L2, regions, params),
+                   RegionsMatcherCache::estimateMemorySize(matching::HNSW_L2, regions));
+}
@@ -63,10 +63,10 @@ void makelogcombi_k(std::size_t k, std::size_t nmax, std::vector<Type>& l, std::
 }
 
 template<typename Type>
-void makelogcombi(std::size_t k, std::size_t n, std::vector<Type>& vec_logc_k, std::vector<Type>& vec_logc_n)
+void makelogcombi(std::size_t k, std::size_t n, std::vector<Type>& vec_logc_k, std::vector<Type>& vec_logc_n, std::vector<Type>& vec_log10)
 {
     // compute a lookuptable of log10 value for the range [0,n+1]
-    std::vector<Type> vec_log10(n + 1);
+    vec_log10.resize(n + 1);
     for (std::size_t k = 0; k <= n; ++k)
         vec_log10[k] = log10((Type)k);
 
@@ -74,6 +74,13 @@ void makelogcombi(std::size_t k, std::size_t n, std::vector<Type>& vec_logc_k, s
     makelogcombi_k(k, n, vec_logc_k, vec_log10);
 }
 
+template<typename Type>
+void makelogcombi(std::size_t k, std::size_t n, std::vector<Type>& vec_logc_k, std::vector<Type>& vec_logc_n)
+{
+    std::vector<Type> vec_log10;
+    makelogcombi(k, n, vec_logc_k, vec_logc_n, vec_log10);
+}
+
 /**
  * @brief NFA and associated index
  */
@@ -111,6 +118,66 @@ inline ErrorIndex bestNFA(int startIndex,  // number of point required for estim
     return bestIndex;
 }
 
+/**
+ * @brief Parameters of the adaptive mode of ACRANSAC.
+ *
+ * In adaptive mode, the iterations stop as soon as the probability to have drawn at least one sample
+ * without outliers reaches the confidence, using the inlier ratio of the best model found so far.
+ * The models are also first evaluated on a random subset of the data: the models that have much fewer
+ * inliers than the best model on this subset are discarded without evaluating all the data.
+ */
+struct ACRansacAdaptiveParams
+{
+    /// Enable the adaptive mode (the classic ACRANSAC runs all the iterations)
+    bool enabled = false;
+    /// Probability to have drawn at least one sample without outliers
+    double confidence = 0.99;
+    /// Number of data used to evaluate a model before the full evaluation (0 to disable)
+    std::size_t preemptiveSubsetSize = 50;
+    /// A model is fully evaluated if its number of inliers on the subset is at least
+    /// this ratio of the number of inliers of the best model
+    double preemptiveInlierRatio = 0.5;
+};
+
+/**
+ * @brief Check the parameters of the adaptive mode of ACRANSAC.
+ * @param[in] params The adaptive mode parameters
+ * @return true if the confidence is in ]0, 1[
+ */
+inline bool checkACRansacAdaptiveParams(const ACRansacAdaptiveParams& params)
+{
+    if (!(params.confidence > 0.0 && params.confidence < 1.0))
+    {
+        ALICEVISION_LOG_ERROR("Invalid ACRansac adaptive confidence: " << params.confidence << ", it must be in ]0, 1[.");
+        return false;
+    }
+    return true;
+}
+
+/**
+ * @brief Buffers of ACRANSAC, sized by the number of data.
+ *
+ * A caller running many estimations (e.g. one per image pair) can keep one instance per thread and pass it
+ * to each call, so that the buffers are only reallocated when the number of data grows.
+ */
+struct ACRansacBuffers
+{
+    /// [residual,index] of each data, sorted to find the best NFA
+    std::vector<ErrorIndex> residuals;
+    /// Residual of each data
+    std::vector<double> residualValues;
+    /// Possible sampling indices
+    std::vector<std::size_t> index;
+    /// Lookup tables of the logarithms of the binomial coefficients
+    std::vector<float> log10;
+    std::vector<float> logc_n;
+    std::vector<float> logc_k;
+    /// Sample indices
+    std::vector<std::size_t> sample;
+    /// Subset of the data used for the preemptive evaluation of the adaptive mode
+    std::vector<std::size_t> preemptiveSubset;
+};
+
 /**
  * @brief An implementation of the "Random Sample Consensus" algorithm based on a-contrario estimator
  * to automatically estimate the error threshold.
@@ -139,6 +206,8 @@ inline ErrorIndex bestNFA(int startIndex,  // number of point required for estim
  * @param[in] nIter maximum number of consecutive iterations
  * @param[out] model returned model if found
  * @param[in] precision upper bound of the precision
+ * @param[in] adaptiveParams parameters of the early termination of the iterations
+ * @param[in,out] buffers buffers reused from a previous call, or nullptr to allocate them for this call
  *
  * @return (errorMax, minNFA)
  */
@@ -148,7 +217,9 @@ std::pair<double, double> ACRANSAC(const Kernel& kernel,
                                    std::vector<size_t>& vec_inliers,
                                    std::size_t nIter = 1024,
                                    typename Kernel::ModelT* model = nullptr,
-                                   double precision = std::numeric_limits<double>::infinity())
+                                   double precision = std::numeric_limits<double>::infinity(),
+                                   const ACRansacAdaptiveParams& adaptiveParams = ACRansacAdaptiveParams(),
+                                   ACRansacBuffers* buffers = nullptr)
 {
     vec_inliers.clear();
 
@@ -161,17 +232,24 @@ std::pair<double, double> ACRANSAC(const Kernel& kernel,
                                   ? std::numeric_limits<double>::infinity()
                                   : precision * precision * kernel.thresholdNormalizer() * kernel.thresholdNormalizer();
 
-    std::vector<ErrorIndex> vec_residuals(nData);  // [residual,index]
-    std::vector<double> vec_residuals_(nData);
+    ACRansacBuffers localBuffers;
+    ACRansacBuffers& buf = buffers ? *buffers : localBuffers;
+
+    std::vector<ErrorIndex>& vec_residuals = buf.residuals;  // [residual,index]
+    std::vector<double>& vec_residuals_ = buf.residualValues;
+    vec_residuals.resize(nData);
+    vec_residuals_.resize(nData);
 
     // Possible sampling indices [0,..,nData] (will change in the optimization phase)
-    std::vector<size_t> vec_index(nData);
+    std::vector<size_t>& vec_index = buf.index;
+    vec_index.resize(nData);
     std::iota(vec_index.begin(), vec_index.end(), 0);
 
     // Precompute log combi
     const double loge0 = log10((double)kernel.getMaximumNbModels() * (nData - sizeSample));
-    std::vector<float> vec_logc_n, vec_logc_k;
-    makelogcombi(sizeSample, nData, vec_logc_k, vec_logc_n);
+    std::vector<float>& vec_logc_n = buf.logc_n;
+    std::vector<float>& vec_logc_k = buf.logc_k;
+    makelogcombi(sizeSample, nData, vec_logc_k, vec_logc_n, buf.log10);
 
     // Output parameters
     double minNFA = std::numeric_limits<double>::infinity();
@@ -183,22 +261,46 @@ std::pair<double, double> ACRANSAC(const Kernel& kernel,
 
     bool bACRansacMode = (precision == std::numeric_limits<double>::infinity());
 
+    // Buffers reused by all the iterations
+    std::vector<std::size_t>& vec_sample = buf.sample;  // Sample indices
+    vec_sample.resize(sizeSample);
+    std::vector<typename Kernel::ModelT> vec_models;  // Up to max_models solutions
+
+    // Adaptive mode: random subset used to discard the bad models before their full evaluation
+    std::vector<std::size_t>& vec_preemptiveSubset = buf.preemptiveSubset;
+    vec_preemptiveSubset.clear();
+    if (adaptiveParams.enabled && adaptiveParams.preemptiveSubsetSize > 0 && nData > 2 * adaptiveParams.preemptiveSubsetSize)
+        uniformSample(randomNumberGenerator, adaptiveParams.preemptiveSubsetSize, nData, vec_preemptiveSubset);
+
     // Main estimation loop.
     for (std::size_t iter = 0; iter < nIter; ++iter)
     {
-        std::vector<std::size_t> vec_sample(sizeSample);  // Sample indices
         if (bACRansacMode)
             uniformSample(randomNumberGenerator, sizeSample, vec_index, vec_sample);  // Get random sample
         else
             uniformSample(randomNumberGenerator, sizeSample, nData, vec_sample);  // Get random sample
 
-        std::vector<typename Kernel::ModelT> vec_models;  // Up to max_models solutions
+        vec_models.clear();
         kernel.fit(vec_sample, vec_models);
 
         // Evaluate models
         bool better = false;
         for (std::size_t k = 0; k < vec_models.size(); ++k)
         {
+            // Preemptive evaluation on the subset, against the threshold of the best model
+            if (!vec_preemptiveSubset.empty() && minNFA < 0)
+            {
+                std::size_t nSubsetInlier = 0;
+                for (const std::size_t i : vec_preemptiveSubset)
+                {
+                    if (kernel.error(i, vec_models[k]) <= errorMax)
+                        ++nSubsetInlier;
+                }
+                const double expectedSubsetInlier = vec_preemptiveSubset.size() * vec_inliers.size() / static_cast<double>(nData);
+                if (nSubsetInlier < adaptiveParams.preemptiveInlierRatio * expectedSubsetInlier)
+                    continue;
+            }
+
             // Residuals computation and ordering
             kernel.errors(vec_models[k], vec_residuals_);
 
@@ -269,6 +371,19 @@ std::pair<double, double> ACRANSAC(const Kernel& kernel,
                 }
             }
         }
+
+        // Adaptive mode: number of iterations needed to draw a sample without outliers with the given confidence
+        if (adaptiveParams.enabled && better && minNFA < 0)
+        {
+            const double inlierRatio = vec_inliers.size() / static_cast<double>(nData);
+            const double outlierFreeSampleProba = std::pow(inlierRatio, static_cast<int>(sizeSample));
+            if (outlierFreeSampleProba > 0.0)
+            {
+                const double nIterRequired = std::log(1.0 - adaptiveParams.confidence) / std::log1p(-outlierFreeSampleProba);
+                if (nIterRequired < static_cast<double>(nIter - iter - 1))
+                    nIter = iter + 1 + static_cast<std::size_t>(std::ceil(std::max(nIterRequired, 0.0)));
+            }
+        }
     }
 
     if (minNFA >= 0)
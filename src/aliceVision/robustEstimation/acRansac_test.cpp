@@ -267,3 +267,100 @@ BOOST_AUTO_TEST_CASE(RansacLineFitter_ACRANSACSimu)
         BOOST_CHECK(vec_inliers.size() <= expectedInliers);
     }
 }
+
+// line kernel counting the number of iterations of the robust estimation
+class CountingLineKernel : public LineKernel
+{
+  public:
+    using LineKernel::LineKernel;
+
+    void fit(const std::vector<std::size_t>& samples, std::vector<ModelT>& models) const override
+    {
+        ++nbFit;
+        LineKernel::fit(samples, models);
+    }
+
+    mutable std::size_t nbFit = 0;
+};
+
+// test the adaptive mode: same model as the classic ACRANSAC with fewer iterations
+BOOST_AUTO_TEST_CASE(RansacLineFitter_ACRANSACAdaptive)
+{
+    const int S = 100;
+    const double outlierRatio = 0.3;
+    Vec2 GTModel;
+    GTModel << -2, .3;
+    std::mt19937 gen;
+
+    const std::size_t numPoints = 2.0 * S * sqrt(2.0);
+    Mat2X points(2, numPoints);
+    std::vector<std::size_t> vec_inliersGT;
+    generateLine(numPoints, outlierRatio, 0.5, GTModel, gen, points, vec_inliersGT);
+
+    const std::size_t nIter = 1000;
+
+    CountingLineKernel lineKernel(points, S, S);
+    std::vector<std::size_t> vec_inliers;
+    robustEstimation::MatrixModel<Vec2> model;
+    ACRANSAC(lineKernel, gen, vec_inliers, nIter, &model);
+
+    ACRansacAdaptiveParams adaptiveParams;
+    adaptiveParams.enabled = true;
+
+    CountingLineKernel adaptiveLineKernel(points, S, S);
+    std::vector<std::size_t> vec_adaptiveInliers;
+    robustEstimation::MatrixModel<Vec2> adaptiveModel;
+    ACRANSAC(adaptiveLineKernel, gen, vec_adaptiveInliers, nIter, &adaptiveModel, std::numeric_limits<double>::infinity(), adaptiveParams);
+
+    BOOST_CHECK_LT(adaptiveLineKernel.nbFit, lineKernel.nbFit);
+    BOOST_CHECK(vec_adaptiveInliers.size() <= vec_inliersGT.size());
+    BOOST_CHECK_GE(vec_adaptiveInliers.size(), 0.9 * vec_inliers.size());
+    BOOST_CHECK_SMALL(adaptiveModel.getMatrix()[1] - GTModel[1], 0.1);
+}
+
+BOOST_AUTO_TEST_CASE(RansacLineFitter_ACRANSACAdaptiveParamsCheck)
+{
+    ACRansacAdaptiveParams adaptiveParams;
+    BOOST_CHECK(checkACRansacAdaptiveParams(adaptiveParams));
+
+    for (const double confidence : {0.0, 1.0, -0.5, 1.5, std::numeric_limits<double>::quiet_NaN()})
+    {
+        adaptiveParams.confidence = confidence;
+        BOOST_CHECK(!checkACRansacAdaptiveParams(adaptiveParams));
+    }
+}
+
+// test the reusable buffers: same results as the local buffers, whatever the previous use of the buffers
+BOOST_AUTO_TEST_CASE(RansacLineFitter_ACRANSACBuffers)
+{
+    const int S = 100;
+    Vec2 GTModel;
+    GTModel << -2, .3;
+    std::mt19937 gen;
+
+    ACRansacBuffers buffers;
+    for (const std::size_t numPoints : {282, 50, 150})
+    {
+        Mat2X points(2, numPoints);
+        std::vector<std::size_t> vec_inliersGT;
+        generateLine(numPoints, 0.3, 0.5, GTModel, gen, points, vec_inliersGT);
+
+        LineKernel lineKernel(points, S, S);
+
+        std::mt19937 genLocal(numPoints);
+        std::vector<std::size_t> vec_inliers;
+        robustEstimation::MatrixModel<Vec2> model;
+        const std::pair<double, double> ret = ACRANSAC(lineKernel, genLocal, vec_inliers, 300, &model);
+
+        std::mt19937 genBuffers(numPoints);
+        std::vector<std::size_t> vec_inliersBuffers;
+        robustEstimation::MatrixModel<Vec2> modelBuffers;
+        const std::pair<double, double> retBuffers = ACRANSAC(
+          lineKernel, genBuffers, vec_inliersBuffers, 300, &modelBuffers, std::numeric_limits<double>::infinity(), ACRansacAdaptiveParams(), &buffers);
+
+        BOOST_CHECK_EQUAL(ret.first, retBuffers.first);
+        BOOST_CHECK_EQUAL(ret.second, retBuffers.second);
+        BOOST_CHECK_EQUAL_COLLECTIONS(vec_inliers.begin(), vec_inliers.end(), vec_inliersBuffers.begin(), vec_inliersBuffers.end());
+        BOOST_CHECK(model.getMatrix() == modelBuffers.getMatrix());
+    }
+}
@@ -15,6 +15,7 @@
 #include <random>
 #include <numeric>
 #include <cassert>
+#include <vector>
 
 namespace aliceVision {
 namespace robustEstimation {
@@ -28,15 +29,16 @@ namespace robustEstimation {
  * in the range and it takes the first numSamples elements. Otherwise it proceeds
  * by drawing random numbers until the numSamples elements are generated, using
  * Robert Floyd's algorithm.
+ * The samples are written in the given vector, so that its memory can be reused by successive calls.
  *
  * @param[in] generator the random number generator to use
  * @param[in] lowerBound The lower bound of the range.
  * @param[in] upperBound The upper bound of the range (not included).
  * @param[in] numSamples Number of unique samples to draw.
- * @return samples The vector containing the samples.
+ * @param[out] samples The vector containing the samples.
  */
 template<typename IntT>
-inline std::vector<IntT> randSample(std::mt19937& randomNumberGenerator, IntT lowerBound, IntT upperBound, IntT numSamples)
+inline void randSample(std::mt19937& randomNumberGenerator, IntT lowerBound, IntT upperBound, IntT numSamples, std::vector<IntT>& samples)
 {
     const auto rangeSize = upperBound - lowerBound;
 
@@ -50,32 +52,54 @@ inline std::vector<IntT> randSample(std::mt19937& randomNumberGenerator, IntT lo
         // generate a vector with all the elements in the range, shuffle it and
         // return the first numSample elements.
         // this should be more time efficient than drawing at each time.
-        std::vector<IntT> result(rangeSize);
-        std::iota(result.begin(), result.end(), lowerBound);
-        std::shuffle(result.begin(), result.end(), randomNumberGenerator);
-        result.resize(numSamples);
-        return result;
+        samples.resize(rangeSize);
+        std::iota(samples.begin(), samples.end(), lowerBound);
+        std::shuffle(samples.begin(), samples.end(), randomNumberGenerator);
+        samples.resize(numSamples);
     }
     else
     {
         // otherwise if the number of required samples is small wrt the range
         // use the optimized Robert Floyd algorithm.
         // this has linear complexity and minimize the memory usage.
-        std::unordered_set<IntT> samples;
+        // the samples are kept in their drawing order, a hash set is only used to find the duplicates of large samples.
+        const bool useSet = numSamples > 32;
+        std::unordered_set<IntT> drawn;
+        samples.clear();
+        samples.reserve(numSamples);
         for (IntT d = upperBound - numSamples; d < upperBound; ++d)
         {
             IntT t = std::uniform_int_distribution<>(0, d)(randomNumberGenerator) + lowerBound;
-            if (samples.find(t) == samples.end())
-                samples.insert(t);
-            else
-                samples.insert(d);
+            const bool duplicate = useSet ? (drawn.count(t) > 0) : (std::find(samples.begin(), samples.end(), t) != samples.end());
+            if (duplicate)
+                t = d;
+            samples.push_back(t);
+            if (useSet)
+                drawn.insert(t);
         }
         assert(samples.size() == numSamples);
-        std::vector<IntT> result(std::make_move_iterator(samples.begin()), std::make_move_iterator(samples.end()));
-        return result;
     }
 }
 
+/**
+ * @brief Generate a unique random samples without replacement in the
+ * range [lowerBound upperBound).
+ * @see randSample
+ *
+ * @param[in] generator the random number generator to use
+ * @param[in] lowerBound The lower bound of the range.
+ * @param[in] upperBound The upper bound of the range (not included).
+ * @param[in] numSamples Number of unique samples to draw.
+ * @return samples The vector containing the samples.
+ */
+template<typename IntT>
+inline std::vector<IntT> randSample(std::mt19937& randomNumberGenerator, IntT lowerBound, IntT upperBound, IntT numSamples)
+{
+    std::vector<IntT> result;
+    randSample<IntT>(randomNumberGenerator, lowerBound, upperBound, numSamples, result);
+    return result;
+}
+
 /**
  * @brief Pick a random subset of the integers in the range [0, upperBound).
  *
@@ -114,7 +138,7 @@ inline void uniformSample(std::mt19937& randomNumberGenerator,
                           std::size_t numSamples,
                           std::vector<IntT>& samples)
 {
-    samples = randSample<IntT>(randomNumberGenerator, lowerBound, upperBound, numSamples);
+    randSample<IntT>(randomNumberGenerator, lowerBound, upperBound, numSamples, samples);
 }
 
 /**
@@ -145,7 +169,7 @@ inline void uniformSample(std::mt19937& randomNumberGenerator,
                           const std::vector<std::size_t>& elements,
                           std::vector<std::size_t>& sample)
 {
-    sample = randSample<std::size_t>(randomNumberGenerator, 0, elements.size(), sampleSize);
+    randSample<std::size_t>(randomNumberGenerator, 0, elements.size(), sampleSize, sample);
     assert(sample.size() == sampleSize);
     for (auto& s : sample)
     {
@@ -121,3 +121,23 @@ BOOST_AUTO_TEST_CASE(UniformSampleTest_randSample)
         }
     }
 }
+
+// Assert that the in-place randSample draws the same samples as the returning one, whatever the content of the reused vector
+BOOST_AUTO_TEST_CASE(UniformSampleTest_randSampleInPlace)
+{
+    std::mt19937 randomNumberGenerator;
+    std::mt19937 randomNumberGeneratorInPlace;
+
+    std::vector<std::size_t> samples;
+    for (std::size_t upperBound = 1; upperBound < 513; upperBound *= 2)
+    {
+        for (std::size_t numSamples = 1; numSamples <= upperBound; numSamples *= 2)
+        {
+            const std::size_t lowerBound = upperBound - numSamples;
+            const auto expected = randSample<std::size_t>(randomNumberGenerator, lowerBound, upperBound, numSamples);
+            randSample<std::size_t>(randomNumberGeneratorInPlace, lowerBound, upperBound, numSamples, samples);
+
+            BOOST_CHECK_EQUAL_COLLECTIONS(samples.begin(), samples.end(), expected.begin(), expected.end());
+        }
+    }
+}
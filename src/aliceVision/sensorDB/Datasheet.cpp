@@ -16,33 +16,27 @@
 namespace aliceVision {
 namespace sensorDB {
 
-bool Datasheet::operator==(const Datasheet& other) const
+std::string normalizeName(const std::string& name)
 {
-    std::string brandA = _brand;
-    std::string brandB = other._brand;
+    std::string normalized = name;
+
+    boost::algorithm::to_lower(normalized);
 
-    boost::algorithm::to_lower(brandA);
-    boost::algorithm::to_lower(brandB);
+    normalized.erase(std::remove_if(normalized.begin(), normalized.end(), ::ispunct), normalized.end());  // remove punctuation
+    normalized.erase(std::remove_if(normalized.begin(), normalized.end(), ::isspace), normalized.end());  // remove spaces
 
-    brandA.erase(std::remove_if(brandA.begin(), brandA.end(), ::ispunct), brandA.end());  // remove punctuation
-    brandB.erase(std::remove_if(brandB.begin(), brandB.end(), ::ispunct), brandB.end());  // remove punctuation
+    return normalized;
+}
 
-    brandA.erase(std::remove_if(brandA.begin(), brandA.end(), ::isspace), brandA.end());  // remove spaces
-    brandB.erase(std::remove_if(brandB.begin(), brandB.end(), ::isspace), brandB.end());  // remove spaces
+bool Datasheet::operator==(const Datasheet& other) const
+{
+    const std::string brandA = normalizeName(_brand);
+    const std::string brandB = normalizeName(other._brand);
 
     if ((brandA == brandB) || (boost::algorithm::starts_with(brandA, brandB)) || (boost::algorithm::starts_with(brandB, brandA)))
     {
-        std::string modelA = _model;
-        std::string modelB = other._model;
-
-        boost::algorithm::to_lower(modelA);
-        boost::algorithm::to_lower(modelB);
-
-        modelA.erase(std::remove_if(modelA.begin(), modelA.end(), ::ispunct), modelA.end());  // remove punctuation
-        modelB.erase(std::remove_if(modelB.begin(), modelB.end(), ::ispunct), modelB.end());  // remove punctuation
-
-        modelA.erase(std::remove_if(modelA.begin(), modelA.end(), ::isspace), modelA.end());  // remove spaces
-        modelB.erase(std::remove_if(modelB.begin(), modelB.end(), ::isspace), modelB.end());  // remove spaces
+        const std::string modelA = normalizeName(_model);
+        const std::string modelB = normalizeName(other._model);
 
         if ((modelA == modelB) || (boost::algorithm::ends_with(modelA, modelB)) || (boost::algorithm::ends_with(modelB, modelA)))
             return true;
@@ -38,5 +38,13 @@ struct Datasheet
     double _sensorWidth;
 };
 
+/**
+ * @brief Normalize a camera brand or model name to compare it with others
+ *        Letters are converted to lower case, punctuation and spaces are removed.
+ * @param[in] name The brand or model name
+ * @return The normalized name
+ */
+std::string normalizeName(const std::string& name);
+
 }  // namespace sensorDB
 }  // namespace aliceVision
@@ -7,6 +7,7 @@
 %module (module="pyalicevision") sensorDB
 
 %include <aliceVision/sensorDB/Datasheet.i>
+%include <aliceVision/sensorDB/SensorDatabase.i>
 
 %include <aliceVision/sensorDB/parseDatabase.hpp>
 
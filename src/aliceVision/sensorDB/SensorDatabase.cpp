@@ -0,0 +1,108 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "SensorDatabase.hpp"
+
+#include <algorithm>
+#include <limits>
+#include <stdexcept>
+#include <string_view>
+
+namespace aliceVision {
+namespace sensorDB {
+
+namespace {
+
+constexpr std::size_t noDatasheet = std::numeric_limits<std::size_t>::max();
+
+/**
+ * @brief Index of the first datasheet whose reversed model is a prefix of, or prefixed by, the requested reversed model
+ */
+std::size_t findModel(const std::map<std::string, std::size_t, std::less<>>& models, std::string_view reversedModel)
+{
+    std::size_t first = noDatasheet;
+
+    // models the requested one ends with (strict suffixes, the exact model is found below)
+    for (std::size_t length = 0; length < reversedModel.size(); ++length)
+    {
+        const auto it = models.find(reversedModel.substr(0, length));
+        if (it != models.end())
+            first = std::min(first, it->second);
+    }
+
+    // models ending with the requested one
+    for (auto it = models.lower_bound(reversedModel); it != models.end() && it->first.compare(0, reversedModel.size(), reversedModel) == 0; ++it)
+        first = std::min(first, it->second);
+
+    return first;
+}
+
+}  // namespace
+
+SensorDatabase::SensorDatabase(std::vector<Datasheet> datasheets)
+  : _datasheets(std::move(datasheets))
+{
+    for (std::size_t i = 0; i < _datasheets.size(); ++i)
+    {
+        std::string model = normalizeName(_datasheets[i]._model);
+        std::reverse(model.begin(), model.end());
+
+        // keep the first datasheet of duplicated brand / model pairs
+        _brands[normalizeName(_datasheets[i]._brand)].emplace(std::move(model), i);
+    }
+}
+
+int SensorDatabase::findIndex(const std::string& brand, const std::string& model) const
+{
+    const std::string normalizedBrand = normalizeName(brand);
+    std::string reversedModel = normalizeName(model);
+    std::reverse(reversedModel.begin(), reversedModel.end());
+
+    const std::string_view brandView(normalizedBrand);
+    std::size_t first = noDatasheet;
+
+    // brands the requested one starts with (strict prefixes, the exact brand is found below)
+    for (std::size_t length = 0; length < brandView.size(); ++length)
+    {
+        const auto it = _brands.find(brandView.substr(0, length));
+        if (it != _brands.end())
+            first = std::min(first, findModel(it->second, reversedModel));
+    }
+
+    // brands starting with the requested one
+    for (auto it = _brands.lower_bound(brandView); it != _brands.end() && it->first.compare(0, brandView.size(), brandView) == 0; ++it)
+        first = std::min(first, findModel(it->second, reversedModel));
+
+    return (first == noDatasheet) ? -1 : static_cast<int>(first);
+}
+
+std::vector<int> SensorDatabase::findIndexes(const std::vector<std::string>& brands, const std::vector<std::string>& models) const
+{
+    if (brands.size() != models.size())
+        throw std::invalid_argument("The number of camera brands (" + std::to_string(brands.size()) + ") and models (" +
+                                    std::to_string(models.size()) + ") are different.");
+
+    std::vector<int> indexes(brands.size());
+
+#pragma omp parallel for
+    for (int i = 0; i < brands.size(); ++i)
+        indexes[i] = findIndex(brands[i], models[i]);
+
+    return indexes;
+}
+
+bool SensorDatabase::getInfo(const std::string& brand, const std::string& model, Datasheet& datasheetContent) const
+{
+    const int index = findIndex(brand, model);
+    if (index < 0)
+        return false;
+
+    datasheetContent = _datasheets[index];
+    return true;
+}
+
+}  // namespace sensorDB
+}  // namespace aliceVision
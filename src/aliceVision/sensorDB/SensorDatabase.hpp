@@ -0,0 +1,90 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/sensorDB/Datasheet.hpp>
+
+#include <cstddef>
+#include <functional>
+#include <map>
+#include <string>
+#include <vector>
+
+namespace aliceVision {
+namespace sensorDB {
+
+/**
+ * @brief Sensor database indexed by camera brand and model
+ *
+ * Brands and models are normalized once, when the database is built, and indexed in sorted structures.
+ * Lookups give the same result as a linear search with Datasheet::operator==: the first datasheet whose brand
+ * is equal to / a prefix of / prefixed by the requested brand, and whose model is equal to / a suffix of / suffixed
+ * by the requested model.
+ */
+class SensorDatabase
+{
+  public:
+    SensorDatabase() = default;
+
+    /**
+     * @brief SensorDatabase Constructor
+     * @param[in] datasheets The datasheets of the database, in priority order
+     */
+    explicit SensorDatabase(std::vector<Datasheet> datasheets);
+
+    /**
+     * @brief Get the datasheets of the database
+     * @return The datasheets, in priority order
+     */
+    const std::vector<Datasheet>& getDatasheets() const { return _datasheets; }
+
+    /**
+     * @brief Get the number of datasheets in the database
+     */
+    std::size_t size() const { return _datasheets.size(); }
+
+    /**
+     * @brief Check if the database is empty
+     */
+    bool empty() const { return _datasheets.empty(); }
+
+    /**
+     * @brief Find the datasheet of the given camera brand / model
+     * @param[in] brand The camera brand
+     * @param[in] model The camera model
+     * @return The index of the corresponding datasheet in getDatasheets(), or -1 if there is none
+     */
+    int findIndex(const std::string& brand, const std::string& model) const;
+
+    /**
+     * @brief Find the datasheets of several camera brand / model pairs at once
+     * @param[in] brands The camera brands
+     * @param[in] models The camera models, one per brand
+     * @return For each pair, the index of the corresponding datasheet in getDatasheets(), or -1 if there is none
+     */
+    std::vector<int> findIndexes(const std::vector<std::string>& brands, const std::vector<std::string>& models) const;
+
+    /**
+     * @brief Get information for the given camera brand / model
+     * @param[in] brand The camera brand
+     * @param[in] model The camera model
+     * @param[out] datasheetContent The corresponding datasheet
+     * @return True if ok
+     */
+    bool getInfo(const std::string& brand, const std::string& model, Datasheet& datasheetContent) const;
+
+  private:
+    /// index of the first datasheet for each reversed normalized model of a brand
+    using ModelIndex = std::map<std::string, std::size_t, std::less<>>;
+
+    std::vector<Datasheet> _datasheets;
+    /// model index for each normalized brand
+    std::map<std::string, ModelIndex, std::less<>> _brands;
+};
+
+}  // namespace sensorDB
+}  // namespace aliceVision
@@ -0,0 +1,14 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/sensorDB/Datasheet.i>
+
+%include <aliceVision/sensorDB/SensorDatabase.hpp>
+
+%{
+#include <aliceVision/sensorDB/SensorDatabase.hpp>
+%}
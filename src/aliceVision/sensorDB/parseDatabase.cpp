@@ -54,6 +54,16 @@ bool parseDatabase(const std::string& databaseFilePath, std::vector<Datasheet>&
     return true;
 }
 
+bool parseDatabase(const std::string& databaseFilePath, SensorDatabase& database)
+{
+    std::vector<Datasheet> databaseStructure;
+    if (!parseDatabase(databaseFilePath, databaseStructure))
+        return false;
+
+    database = SensorDatabase(std::move(databaseStructure));
+    return true;
+}
+
 bool getInfo(const std::string& brand, const std::string& model, const std::vector<Datasheet>& databaseStructure, Datasheet& datasheetContent)
 {
     Datasheet refDatasheet(brand, model, -1.);
@@ -66,5 +76,10 @@ bool getInfo(const std::string& brand, const std::string& model, const std::vect
     return true;
 }
 
+bool getInfo(const std::string& brand, const std::string& model, const SensorDatabase& database, Datasheet& datasheetContent)
+{
+    return database.getInfo(brand, model, datasheetContent);
+}
+
 }  // namespace sensorDB
 }  // namespace aliceVision
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <aliceVision/sensorDB/Datasheet.hpp>
+#include <aliceVision/sensorDB/SensorDatabase.hpp>
 
 #include <vector>
 #include <string>
@@ -23,6 +24,14 @@ namespace sensorDB {
  */
 bool parseDatabase(const std::string& databaseFilePath, std::vector<Datasheet>& databaseStructure);
 
+/**
+ * @brief Parse the given sensor database and index it
+ * @param[in] databaseFilePath The file path of the given database
+ * @param[out] database The indexed database in memory
+ * @return True if ok
+ */
+bool parseDatabase(const std::string& databaseFilePath, SensorDatabase& database);
+
 /**
  * @brief Get information for the given camera brand / model
  * @param[in] brand The camera brand
@@ -33,5 +42,15 @@ bool parseDatabase(const std::string& databaseFilePath, std::vector<Datasheet>&
  */
 bool getInfo(const std::string& brand, const std::string& model, const std::vector<Datasheet>& databaseStructure, Datasheet& datasheetContent);
 
+/**
+ * @brief Get information for the given camera brand / model
+ * @param[in] brand The camera brand
+ * @param[in] model The camera model
+ * @param[in] database The indexed database in memory
+ * @param[out] datasheetContent The corresponding datasheet
+ * @return True if ok
+ */
+bool getInfo(const std::string& brand, const std::string& model, const SensorDatabase& database, Datasheet& datasheetContent);
+
 }  // namespace sensorDB
 }  // namespace aliceVision
@@ -7,6 +7,7 @@
 
 #include <aliceVision/sensorDB/parseDatabase.hpp>
 
+#include <algorithm>
 #include <filesystem>
 #include <string>
 
@@ -110,3 +111,47 @@ BOOST_AUTO_TEST_CASE(ParseDatabaseCanon_EOS_1100D)
     BOOST_CHECK(getInfo(sBrand, sModel, vec_database, datasheet));
     BOOST_CHECK_EQUAL(22.2, datasheet._sensorWidth);
 }
+
+BOOST_AUTO_TEST_CASE(SensorDatabaseIndex)
+{
+    std::vector<Datasheet> vec_database;
+    BOOST_CHECK(parseDatabase(sDatabase, vec_database));
+
+    SensorDatabase database;
+    BOOST_CHECK(parseDatabase(sDatabase, database));
+    BOOST_CHECK_EQUAL(database.size(), vec_database.size());
+
+    // Indexed lookups give the same datasheet as the linear search, including partial brands / models
+    std::vector<std::string> brands;
+    std::vector<std::string> models;
+    for (std::size_t i = 0; i < vec_database.size(); i += 13)
+    {
+        const std::string& brand = vec_database[i]._brand;
+        const std::string& model = vec_database[i]._model;
+
+        brands.insert(brands.end(), {brand, brand.substr(0, brand.size() / 2), brand + " Inc.", "", brand});
+        models.insert(models.end(), {model, model, model.substr(model.size() / 2), model, "x" + model});
+    }
+    brands.insert(brands.end(), {"NotExistBrand", "Canon", "canon", "SONY"});
+    models.insert(models.end(), {"NotExistModel", "EOS-5D mark ii", "Canon PowerShot A710 IS", "ILCE-7RM3"});
+
+    const std::vector<int> indexes = database.findIndexes(brands, models);
+    BOOST_CHECK_EQUAL(indexes.size(), brands.size());
+
+    for (std::size_t i = 0; i < brands.size(); ++i)
+    {
+        const Datasheet refDatasheet(brands[i], models[i], -1.);
+        const auto it = std::find(vec_database.begin(), vec_database.end(), refDatasheet);
+        const int expectedIndex = (it == vec_database.end()) ? -1 : static_cast<int>(std::distance(vec_database.begin(), it));
+
+        BOOST_CHECK_EQUAL(indexes[i], expectedIndex);
+        BOOST_CHECK_EQUAL(database.findIndex(brands[i], models[i]), expectedIndex);
+    }
+
+    Datasheet datasheet;
+    BOOST_CHECK(getInfo("Canon", "Canon EOS 550D", database, datasheet));
+    BOOST_CHECK_EQUAL(22.3, datasheet._sensorWidth);
+    BOOST_CHECK(!getInfo("NotExistBrand", "NotExistModel", database, datasheet));
+
+    BOOST_CHECK_THROW(database.findIndexes({"Canon"}, {}), std::invalid_argument);
+}
@@ -58,7 +58,13 @@ bool SfMLocalizer::localize(const Pair& imageSize,
         // robust estimation of the Projection matrix and its precision
         robustEstimation::Mat34Model model;
         const std::pair<double, double> ACRansacOut =
-          robustEstimation::ACRANSAC(kernel, randomNumberGenerator, resectionData.vec_inliers, resectionData.max_iteration, &model, precision);
+          robustEstimation::ACRANSAC(kernel,
+                                     randomNumberGenerator,
+                                     resectionData.vec_inliers,
+                                     resectionData.max_iteration,
+                                     &model,
+                                     precision,
+                                     resectionData.acRansacAdaptiveParams);
         P = model.getMatrix();
         // update the upper bound precision of the model found by AC-RANSAC
         resectionData.error_max = ACRansacOut.first;
@@ -96,8 +102,13 @@ bool SfMLocalizer::localize(const Pair& imageSize,
 
                 // robust estimation of the Projection matrix and its precision
                 robustEstimation::Mat34Model model;
-                const std::pair<double, double> ACRansacOut = robustEstimation::ACRANSAC(
-                  kernel, randomNumberGenerator, resectionData.vec_inliers, resectionData.max_iteration, &model, precision);
+                const std::pair<double, double> ACRansacOut = robustEstimation::ACRANSAC(kernel,
+                                                                                         randomNumberGenerator,
+                                                                                         resectionData.vec_inliers,
+                                                                                         resectionData.max_iteration,
+                                                                                         &model,
+                                                                                         precision,
+                                                                                         resectionData.acRansacAdaptiveParams);
 
                 P = model.getMatrix();
 
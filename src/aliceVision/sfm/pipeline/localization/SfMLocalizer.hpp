@@ -10,6 +10,7 @@
 #include <aliceVision/numeric/numeric.hpp>
 #include <aliceVision/sfmData/SfMData.hpp>
 #include <aliceVision/feature/RegionsPerView.hpp>
+#include <aliceVision/robustEstimation/ACRansac.hpp>
 #include <aliceVision/robustEstimation/estimators.hpp>
 
 #include <cstddef>
@@ -42,6 +43,8 @@ struct ImageLocalizerMatchData
     /// Upper bound pixel(s) tolerance for residual errors
     double error_max = std::numeric_limits<double>::infinity();
     size_t max_iteration = 4096;
+    /// Early termination of the ACRansac iterations
+    robustEstimation::ACRansacAdaptiveParams acRansacAdaptiveParams;
 };
 
 class SfMLocalizer
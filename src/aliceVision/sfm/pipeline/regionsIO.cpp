@@ -23,7 +23,10 @@ namespace sfm {
 
 using namespace sfmData;
 
-std::unique_ptr<feature::Regions> loadRegions(const std::vector<std::string>& folders, IndexT viewId, const feature::ImageDescriber& imageDescriber)
+std::unique_ptr<feature::Regions> loadRegions(const std::vector<std::string>& folders,
+                                              IndexT viewId,
+                                              const feature::ImageDescriber& imageDescriber,
+                                              bool mapDescriptors)
 {
     assert(!folders.empty());
 
@@ -59,7 +62,10 @@ std::unique_ptr<feature::Regions> loadRegions(const std::vector<std::string>& fo
 
     try
     {
-        regionsPtr->Load(featFilename, descFilename);
+        if (mapDescriptors)
+            regionsPtr->LoadMapped(featFilename, descFilename);
+        else
+            regionsPtr->Load(featFilename, descFilename);
     }
     catch (const std::exception& e)
     {
@@ -198,7 +204,8 @@ bool loadRegionsPerView(feature::RegionsPerView& regionsPerView,
                         const SfMData& sfmData,
                         const std::vector<std::string>& folders,
                         const std::vector<feature::EImageDescriberType>& imageDescriberTypes,
-                        const std::set<IndexT>& viewIdFilter)
+                        const std::set<IndexT>& viewIdFilter,
+                        bool mapDescriptors)
 {
     std::vector<std::string> featuresFolders = sfmData.getFeaturesFolders();        // add sfm features folders
     featuresFolders.insert(featuresFolders.end(), folders.begin(), folders.end());  // add user features folders
@@ -228,7 +235,7 @@ bool loadRegionsPerView(feature::RegionsPerView& regionsPerView,
                     std::unique_ptr<feature::Regions> regionsPtr;
                     try
                     {
-                        regionsPtr = loadRegions(featuresFolders, iter->second.get()->getViewId(), *(imageDescribers.at(i)));
+                        regionsPtr = loadRegions(featuresFolders, iter->second.get()->getViewId(), *(imageDescribers.at(i)), mapDescriptors);
                     }
                     catch (const std::exception& e)
                     {
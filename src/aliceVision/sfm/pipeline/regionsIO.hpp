@@ -24,9 +24,13 @@ namespace sfm {
  * @param[in] folders The list of featureFolders
  * @param[in] viewId The view id
  * @param[in] imageDescriber The imageDescriber type
+ * @param[in] mapDescriptors Memory-map the descriptors file instead of reading it (see feature::Regions::LoadMapped)
  * @return loaded Regions
  */
-std::unique_ptr<feature::Regions> loadRegions(const std::vector<std::string>& folders, IndexT viewId, const feature::ImageDescriber& imageDescriber);
+std::unique_ptr<feature::Regions> loadRegions(const std::vector<std::string>& folders,
+                                              IndexT viewId,
+                                              const feature::ImageDescriber& imageDescriber,
+                                              bool mapDescriptors = false);
 
 /**
  * @brief Load Features for one view.
@@ -57,13 +61,15 @@ bool loadFeaturesPerDescPerView(std::vector<std::vector<std::unique_ptr<feature:
  * @param[in] folders The feature Folders
  * @param[in] imageDescriberTypes The imageDescriber types
  * @param[in] filter To load Regions only for a sub-set of the views contained in the sfmData
+ * @param[in] mapDescriptors Memory-map the descriptors files instead of reading them (see feature::Regions::LoadMapped)
  * @return true if the regions are correctlty loaded
  */
 bool loadRegionsPerView(feature::RegionsPerView& regionsPerView,
                         const sfmData::SfMData& sfmData,
                         const std::vector<std::string>& folders,
                         const std::vector<feature::EImageDescriberType>& imageDescriberTypes,
-                        const std::set<IndexT>& filter = std::set<IndexT>());
+                        const std::set<IndexT>& filter = std::set<IndexT>(),
+                        bool mapDescriptors = false);
 
 /**
  * @brief Load Features for each view of the provided SfMData container.
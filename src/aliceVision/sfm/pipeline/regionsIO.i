@@ -0,0 +1,21 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/feature/ImageDescriber.i>
+%include <aliceVision/feature/FeaturesPerView.i>
+
+%import <aliceVision/sfmData/SfMData.i>
+
+// The containers of regions of several views hold std::unique_ptr, which cannot be exposed
+%ignore aliceVision::sfm::loadFeaturesPerDescPerView;
+%ignore aliceVision::sfm::loadRegionsPerView;
+
+%include <aliceVision/sfm/pipeline/regionsIO.hpp>
+
+%{
+#include <aliceVision/sfm/pipeline/regionsIO.hpp>
+%}
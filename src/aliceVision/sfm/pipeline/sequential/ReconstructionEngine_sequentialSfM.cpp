@@ -625,6 +625,7 @@ std::set<IndexT> ReconstructionEngine_sequentialSfM::resection(IndexT resectionI
         ResectionData newResectionData;
         newResectionData.error_max = _params.localizerEstimatorError;
         newResectionData.max_iteration = _params.localizerEstimatorMaxIterations;
+        newResectionData.acRansacAdaptiveParams = _params.localizerAdaptiveParams;
         const bool hasResected = computeResection(viewId, newResectionData);
 
 #pragma omp critical
@@ -69,6 +69,8 @@ class ReconstructionEngine_sequentialSfM : public ReconstructionEngine
         robustEstimation::ERobustEstimator localizerEstimator = robustEstimation::ERobustEstimator::ACRANSAC;
         double localizerEstimatorError = std::numeric_limits<double>::infinity();
         std::size_t localizerEstimatorMaxIterations = 50000;
+        /// early termination of the ACRansac iterations of the localizer
+        robustEstimation::ACRansacAdaptiveParams localizerAdaptiveParams;
 
         // Pyramid scoring
 
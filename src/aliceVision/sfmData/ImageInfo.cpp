@@ -10,34 +10,59 @@
 #include <aliceVision/numeric/gps.hpp>
 #include <aliceVision/sensorDB/parseDatabase.hpp>
 
+#include <cerrno>
+#include <charconv>
+#include <cstdlib>
+
 namespace aliceVision {
 namespace sfmData {
 
 double ImageInfo::getEv() const { return std::log2(1.0 / getCameraExposureSetting().getExposure()); }
 
+std::shared_ptr<const ImageInfo::NormalizedMetadataKeys> ImageInfo::getNormalizedMetadataKeys() const
+{
+    // const getters can be called concurrently: the index may be built by several threads, but it is published atomically
+    std::shared_ptr<const NormalizedMetadataKeys> normalizedKeys = std::atomic_load(&_normalizedMetadataKeys);
+    if (normalizedKeys)
+        return normalizedKeys;
+
+    auto newNormalizedKeys = std::make_shared<NormalizedMetadataKeys>();
+    newNormalizedKeys->reserve(2 * _metadata.size());
+
+    // keys are processed in order, so that each normalized name refers to the first corresponding key
+    for (const auto& metadataPair : _metadata)
+    {
+        std::string key = metadataPair.first;
+        boost::algorithm::to_lower(key);
+
+        const auto delimiterIt = key.find_last_of("/:");
+        if (delimiterIt != std::string::npos)
+            newNormalizedKeys->emplace(key.substr(delimiterIt + 1), metadataPair.first);
+
+        newNormalizedKeys->emplace(std::move(key), metadataPair.first);
+    }
+
+    normalizedKeys = std::move(newNormalizedKeys);
+    std::atomic_store(&_normalizedMetadataKeys, normalizedKeys);
+    return normalizedKeys;
+}
+
 std::map<std::string, std::string>::const_iterator ImageInfo::findMetadataIterator(const std::string& name) const
 {
     auto it = _metadata.find(name);
     if (it != _metadata.end())
         return it;
+
+    // case insensitive search, ignoring the "xxx:" or "xxx/" prefix of the metadata keys
     std::string nameLower = name;
     boost::algorithm::to_lower(nameLower);
-    for (auto mIt = _metadata.begin(); mIt != _metadata.end(); ++mIt)
-    {
-        std::string key = mIt->first;
-        boost::algorithm::to_lower(key);
-        if (key.size() > name.size())
-        {
-            auto delimiterIt = key.find_last_of("/:");
-            if (delimiterIt != std::string::npos)
-                key = key.substr(delimiterIt + 1);
-        }
-        if (key == nameLower)
-        {
-            return mIt;
-        }
-    }
-    return _metadata.end();
+
+    const std::shared_ptr<const NormalizedMetadataKeys> normalizedKeys = getNormalizedMetadataKeys();
+    const auto keyIt = normalizedKeys->find(nameLower);
+    if (keyIt == normalizedKeys->end())
+        return _metadata.end();
+
+    return _metadata.find(keyIt->second);
 }
 
 bool ImageInfo::hasMetadata(const std::vector<std::string>& names) const
@@ -87,45 +112,95 @@ const std::string& ImageInfo::getMetadata(const std::vector<std::string>& names)
 
 double ImageInfo::readRealNumber(const std::string& str) const
 {
-    try
-    {
-        std::smatch m;
-        std::regex pattern_frac("([0-9]+)\\/([0-9]+)");
+    const auto isDigit = [](char c) { return c >= '0' && c <= '9'; };
+    const char* data = str.data();
+    const std::size_t size = str.size();
 
-        if (!std::regex_search(str, m, pattern_frac))
+    // fraction: first "<digits>/<digits>" sequence of the string
+    std::size_t begin = 0;
+    while (begin < size)
+    {
+        if (!isDigit(data[begin]))
         {
-            return std::stod(str);
+            ++begin;
+            continue;
         }
 
-        const int num = std::stoi(m[1].str());
-        const int denum = std::stoi(m[2].str());
+        std::size_t end = begin;
+        while (end < size && isDigit(data[end]))
+            ++end;
 
-        if (denum != 0)
-            return double(num) / double(denum);
-        else
-            return 0.0;
+        if (end + 1 < size && data[end] == '/' && isDigit(data[end + 1]))
+        {
+            std::size_t denumEnd = end + 1;
+            while (denumEnd < size && isDigit(data[denumEnd]))
+                ++denumEnd;
+
+            int num = 0;
+            int denum = 0;
+            if (std::from_chars(data + begin, data + end, num).ec != std::errc() ||
+                std::from_chars(data + end + 1, data + denumEnd, denum).ec != std::errc())
+                return -1.0;
+
+            if (denum != 0)
+                return double(num) / double(denum);
+            else
+                return 0.0;
+        }
+
+        begin = end;
     }
-    catch (std::exception&)
-    {
+
+    // integer or floating point value, converted as std::stod does but without exceptions
+    char* numberEnd = nullptr;
+    errno = 0;
+    const double value = std::strtod(data, &numberEnd);
+    if (numberEnd == data || errno == ERANGE)
         return -1.0;
-    }
+
+    return value;
+}
+
+std::shared_ptr<const ImageInfo::RealNumberMetadata> ImageInfo::getRealNumberMetadata() const
+{
+    std::shared_ptr<const RealNumberMetadata> realNumbers = std::atomic_load(&_realNumberMetadata);
+    if (realNumbers)
+        return realNumbers;
+
+    auto newRealNumbers = std::make_shared<RealNumberMetadata>();
+    newRealNumbers->reserve(_metadata.size());
+
+    for (const auto& metadataPair : _metadata)
+        newRealNumbers->emplace(metadataPair.first, readRealNumber(metadataPair.second));
+
+    realNumbers = std::move(newRealNumbers);
+    std::atomic_store(&_realNumberMetadata, realNumbers);
+    return realNumbers;
 }
 
 double ImageInfo::getDoubleMetadata(const std::vector<std::string>& names) const
 {
-    const std::string value = getMetadata(names);
-    if (value.empty())
+    double value = -1.0;
+    if (!getDoubleMetadata(names, value))
         return -1.0;
-    return readRealNumber(value);
+    return value;
 }
 
 bool ImageInfo::getDoubleMetadata(const std::vector<std::string>& names, double& val) const
 {
-    const std::string value = getMetadata(names);
-    if (value.empty())
-        return false;
-    val = readRealNumber(value);
-    return true;
+    for (const std::string& name : names)
+    {
+        const auto it = findMetadataIterator(name);
+        if (it == _metadata.end())
+            continue;
+
+        if (it->second.empty())
+            return false;
+
+        val = getRealNumberMetadata()->at(it->first);
+        return true;
+    }
+    return false;
 }
 
 int ImageInfo::getIntMetadata(const std::vector<std::string>& names) const
@@ -181,7 +256,7 @@ Vec3 ImageInfo::getGpsPositionWGS84FromMetadata() const
     return {lat, lon, alt};
 }
 
-int ImageInfo::getSensorSize(const std::vector<sensorDB::Datasheet>& sensorDatabase,
+int ImageInfo::getSensorSize(const sensorDB::SensorDatabase& sensorDatabase,
                              double& sensorWidth,
                              double& sensorHeight,
                              double& focalLengthmm,
@@ -12,10 +12,12 @@
 #include <aliceVision/lensCorrectionProfile/lcp.hpp>
 #include <aliceVision/sfmData/ExposureSetting.hpp>
 #include <aliceVision/sfmData/exif.hpp>
-#include <aliceVision/sensorDB/Datasheet.hpp>
+#include <aliceVision/sensorDB/SensorDatabase.hpp>
 #include <aliceVision/camera/IntrinsicInitMode.hpp>
 
+#include <memory>
 #include <regex>
+#include <unordered_map>
 
 namespace aliceVision {
 namespace sfmData {
@@ -462,14 +464,33 @@ class ImageInfo
      * @brief Set view metadata
      * @param[in] metadata The metadata map
      */
-    void setMetadata(const std::map<std::string, std::string>& metadata) { _metadata = metadata; }
+    void setMetadata(const std::map<std::string, std::string>& metadata)
+    {
+        _metadata = metadata;
+        _normalizedMetadataKeys.reset();
+        _realNumberMetadata.reset();
+    }
 
     /**
      * @brief Add view metadata
      * @param[in] key The metadata key
      * @param[in] value The metadata value
      */
-    void addMetadata(const std::string& key, const std::string& value) { _metadata[key] = value; }
+    void addMetadata(const std::string& key, const std::string& value)
+    {
+        const auto [it, inserted] = _metadata.try_emplace(key, value);
+        if (inserted)
+        {
+            _normalizedMetadataKeys.reset();
+            _realNumberMetadata.reset();
+        }
+        else if (it->second != value)
+        {
+            // the index of metadata keys is only invalidated by new keys
+            it->second = value;
+            _realNumberMetadata.reset();
+        }
+    }
 
     /**
      * @brief Add DCP info in metadata
@@ -572,7 +593,7 @@ class ImageInfo
      * @param[in] verbose Enable verbosity
      * @return An Error or Warning code: 1 - Unknown sensor, 2 - No metadata, 3 - Unsure sensor, 4 - Computation from 35mm Focal
      */
-    int getSensorSize(const std::vector<sensorDB::Datasheet>& sensorDatabase,
+    int getSensorSize(const sensorDB::SensorDatabase& sensorDatabase,
                       double& sensorWidth,
                       double& sensorHeight,
                       double& focalLengthmm,
@@ -580,6 +601,22 @@ class ImageInfo
                       bool verbose = false);
 
   private:
+    using NormalizedMetadataKeys = std::unordered_map<std::string, std::string>;
+
+    /**
+     * @brief Get the index of the metadata keys by normalized name, built on first use
+     * @return for each lower case key, with and without its "xxx:" or "xxx/" prefix, the first corresponding metadata key
+     */
+    std::shared_ptr<const NormalizedMetadataKeys> getNormalizedMetadataKeys() const;
+
+    using RealNumberMetadata = std::unordered_map<std::string, double>;
+
+    /**
+     * @brief Get the metadata values converted with readRealNumber, built on first use
+     * @return the real number value of each metadata key
+     */
+    std::shared_ptr<const RealNumberMetadata> getRealNumberMetadata() const;
+
     /// image path on disk
     std::string _imagePath;
     /// image width
@@ -588,6 +625,10 @@ class ImageInfo
     std::size_t _height;
     /// map for metadata
     std::map<std::string, std::string> _metadata;
+    /// index of the metadata keys by normalized name, reset when new keys are added
+    mutable std::shared_ptr<const NormalizedMetadataKeys> _normalizedMetadataKeys;
+    /// metadata values converted to real numbers, reset when metadata are modified
+    mutable std::shared_ptr<const RealNumberMetadata> _realNumberMetadata;
 };
 
 }  // namespace sfmData
@@ -0,0 +1,150 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "LandmarkColumns.hpp"
+
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace aliceVision {
+namespace sfmData {
+
+namespace {
+
+/**
+ * @brief Landmarks are stored in a std::map: list them once to fill the columns in parallel.
+ */
+std::vector<Landmarks::const_pointer> listLandmarks(const Landmarks& landmarks)
+{
+    std::vector<Landmarks::const_pointer> landmarkList;
+    landmarkList.reserve(landmarks.size());
+    for (const auto& landmark : landmarks)
+        landmarkList.push_back(&landmark);
+    return landmarkList;
+}
+
+}  // namespace
+
+LandmarkColumns getLandmarkColumns(const Landmarks& landmarks)
+{
+    const std::vector<Landmarks::const_pointer> landmarkList = listLandmarks(landmarks);
+    const int landmarkCount = static_cast<int>(landmarkList.size());
+
+    LandmarkColumns columns;
+    columns.ids.resize(landmarkCount);
+    columns.positions.resize(landmarkCount, 3);
+    columns.colors.resize(landmarkCount, 3);
+    columns.descTypes.resize(landmarkCount);
+    columns.states.resize(landmarkCount);
+
+#pragma omp parallel for
+    for (int i = 0; i < landmarkCount; ++i)
+    {
+        const Landmark& landmark = landmarkList[i]->second;
+
+        columns.ids(i) = landmarkList[i]->first;
+        columns.positions.row(i) = landmark.X.transpose();
+        columns.colors.row(i) << landmark.rgb.r(), landmark.rgb.g(), landmark.rgb.b();
+        columns.descTypes(i) = static_cast<unsigned char>(landmark.descType);
+        columns.states(i) = static_cast<unsigned char>(landmark.state);
+    }
+
+    return columns;
+}
+
+ObservationColumns getObservationColumns(const Landmarks& landmarks)
+{
+    const std::vector<Landmarks::const_pointer> landmarkList = listLandmarks(landmarks);
+    const int landmarkCount = static_cast<int>(landmarkList.size());
+
+    // index of the first observation of each landmark
+    std::vector<Eigen::Index> offsets(landmarkCount + 1, 0);
+    for (int i = 0; i < landmarkCount; ++i)
+        offsets[i + 1] = offsets[i] + landmarkList[i]->second.getObservations().size();
+
+    const Eigen::Index observationCount = offsets.back();
+
+    ObservationColumns columns;
+    columns.landmarkIds.resize(observationCount);
+    columns.viewIds.resize(observationCount);
+    columns.coordinates.resize(observationCount, 2);
+    columns.featureIds.resize(observationCount);
+    columns.scales.resize(observationCount);
+
+#pragma omp parallel for
+    for (int i = 0; i < landmarkCount; ++i)
+    {
+        Eigen::Index o = offsets[i];
+        for (const auto& observation : landmarkList[i]->second.getObservations())
+        {
+            columns.landmarkIds(o) = landmarkList[i]->first;
+            columns.viewIds(o) = observation.first;
+            columns.coordinates.row(o) = observation.second.getCoordinates().transpose();
+            columns.featureIds(o) = observation.second.getFeatureId();
+            columns.scales(o) = observation.second.getScale();
+            ++o;
+        }
+    }
+
+    return columns;
+}
+
+void setLandmarkColumns(Landmarks& landmarks, const LandmarkColumns& landmarkColumns, const ObservationColumns& observationColumns)
+{
+    const Eigen::Index landmarkCount = landmarkColumns.ids.size();
+    if (landmarkColumns.positions.rows() != landmarkCount || landmarkColumns.colors.rows() != landmarkCount ||
+        landmarkColumns.descTypes.size() != landmarkCount || landmarkColumns.states.size() != landmarkCount)
+        throw std::invalid_argument("The landmark columns have different sizes.");
+
+    const Eigen::Index observationCount = observationColumns.landmarkIds.size();
+    if (observationColumns.viewIds.size() != observationCount || observationColumns.coordinates.rows() != observationCount ||
+        observationColumns.featureIds.size() != observationCount || observationColumns.scales.size() != observationCount)
+        throw std::invalid_argument("The observation columns have different sizes.");
+
+    Landmarks newLandmarks;
+    for (Eigen::Index i = 0; i < landmarkCount; ++i)
+    {
+        Landmark landmark(landmarkColumns.positions.row(i).transpose(),
+                          static_cast<feature::EImageDescriberType>(landmarkColumns.descTypes(i)),
+                          image::RGBColor(landmarkColumns.colors(i, 0), landmarkColumns.colors(i, 1), landmarkColumns.colors(i, 2)));
+        landmark.state = static_cast<EEstimatorParameterState>(landmarkColumns.states(i));
+
+        // constant time insertion when the landmarks are sorted by id
+        const std::size_t previousSize = newLandmarks.size();
+        newLandmarks.emplace_hint(newLandmarks.end(), landmarkColumns.ids(i), std::move(landmark));
+        if (newLandmarks.size() == previousSize)
+            throw std::invalid_argument("Duplicated landmark id: " + std::to_string(landmarkColumns.ids(i)) + ".");
+    }
+
+    auto landmarkIt = newLandmarks.end();
+    for (Eigen::Index o = 0; o < observationCount; ++o)
+    {
+        // observations of a landmark are usually contiguous
+        const IndexT landmarkId = observationColumns.landmarkIds(o);
+        if (landmarkIt == newLandmarks.end() || landmarkIt->first != landmarkId)
+        {
+            landmarkIt = newLandmarks.find(landmarkId);
+            if (landmarkIt == newLandmarks.end())
+                throw std::invalid_argument("Observation of an unknown landmark: " + std::to_string(landmarkId) + ".");
+        }
+
+        Observations& observations = landmarkIt->second.getObservations();
+        const std::size_t previousSize = observations.size();
+        observations.emplace_hint(
+          observations.end(),
+          observationColumns.viewIds(o),
+          Observation(observationColumns.coordinates.row(o).transpose(), observationColumns.featureIds(o), observationColumns.scales(o)));
+        if (observations.size() == previousSize)
+            throw std::invalid_argument("Duplicated observation of landmark " + std::to_string(landmarkId) + " in view " +
+                                        std::to_string(observationColumns.viewIds(o)) + ".");
+    }
+
+    landmarks = std::move(newLandmarks);
+}
+
+}  // namespace sfmData
+}  // namespace aliceVision
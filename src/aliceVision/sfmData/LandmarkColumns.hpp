@@ -0,0 +1,73 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/sfmData/SfMData.hpp>
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/types.hpp>
+
+namespace aliceVision {
+namespace sfmData {
+
+/**
+ * @brief Landmarks stored as contiguous columns, one row per landmark, sorted by landmark id.
+ */
+struct LandmarkColumns
+{
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> ids;
+    Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor> positions;
+    Eigen::Matrix<unsigned char, Eigen::Dynamic, 3, Eigen::RowMajor> colors;
+    /// feature::EImageDescriberType values
+    Eigen::Matrix<unsigned char, Eigen::Dynamic, 1> descTypes;
+    /// EEstimatorParameterState values
+    Eigen::Matrix<unsigned char, Eigen::Dynamic, 1> states;
+
+    std::size_t size() const { return ids.size(); }
+};
+
+/**
+ * @brief Observations of the landmarks flattened into contiguous columns, one row per observation,
+ *        sorted by landmark id then by view id.
+ */
+struct ObservationColumns
+{
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> landmarkIds;
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> viewIds;
+    Eigen::Matrix<double, Eigen::Dynamic, 2, Eigen::RowMajor> coordinates;
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> featureIds;
+    Eigen::Matrix<double, Eigen::Dynamic, 1> scales;
+
+    std::size_t size() const { return landmarkIds.size(); }
+};
+
+/**
+ * @brief Export the landmarks into columns.
+ * @param[in] landmarks The landmarks
+ * @return the landmark columns
+ */
+LandmarkColumns getLandmarkColumns(const Landmarks& landmarks);
+
+/**
+ * @brief Export the observations of the landmarks into flattened columns.
+ * @param[in] landmarks The landmarks
+ * @return the observation columns
+ */
+ObservationColumns getObservationColumns(const Landmarks& landmarks);
+
+/**
+ * @brief Replace the landmarks with the content of columns.
+ *        Observations may be given in any order, but each landmark / view pair must be unique.
+ * @note Throws std::invalid_argument if the columns have different sizes, if a landmark id is duplicated
+ *       or if an observation refers to a landmark that is not in the landmark columns.
+ * @param[out] landmarks The landmarks
+ * @param[in] landmarkColumns The landmark columns
+ * @param[in] observationColumns The observation columns
+ */
+void setLandmarkColumns(Landmarks& landmarks, const LandmarkColumns& landmarkColumns, const ObservationColumns& observationColumns);
+
+}  // namespace sfmData
+}  // namespace aliceVision
@@ -0,0 +1,82 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+
+// Columns are exchanged as NumPy arrays: 1D arrays for the ids and values, (n, 3) or (n, 2) arrays for the positions,
+// colors and coordinates
+%eigen_typemaps(%arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 1>))
+%eigen_typemaps(%arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 1>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<double, Eigen::Dynamic, 1>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, Eigen::Dynamic, 2, Eigen::RowMajor>), %arg(Eigen::Matrix<double, Eigen::Dynamic, 2, Eigen::RowMajor>))
+%eigen_typemaps(%arg(Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor>), %arg(Eigen::Matrix<double, Eigen::Dynamic, 3, Eigen::RowMajor>))
+%eigen_typemaps(%arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 3, Eigen::RowMajor>), %arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 3, Eigen::RowMajor>))
+
+%include <aliceVision/sfmData/LandmarkColumns.hpp>
+
+%{
+#include <aliceVision/sfmData/LandmarkColumns.hpp>
+%}
+
+%pythoncode %{
+import numpy
+
+# Structured array types used to exchange the landmarks and their observations with NumPy
+LANDMARK_DTYPE = numpy.dtype([("id", numpy.uint32), ("X", numpy.float64, (3,)), ("rgb", numpy.uint8, (3,)),
+                              ("descType", numpy.uint8), ("state", numpy.uint8)])
+OBSERVATION_DTYPE = numpy.dtype([("landmarkId", numpy.uint32), ("viewId", numpy.uint32), ("x", numpy.float64),
+                                 ("y", numpy.float64), ("featureId", numpy.uint32), ("scale", numpy.float64)])
+%}
+
+// Bulk accessors to the structure, without going through the Landmarks and Observations proxies
+%extend aliceVision::sfmData::SfMData {
+    %pythoncode %{
+        def getLandmarksArray(self):
+            """ Get the landmarks as a structured array of LANDMARK_DTYPE, sorted by landmark id. """
+            columns = getLandmarkColumns(self.getLandmarks())
+            array = numpy.empty(columns.size(), dtype=LANDMARK_DTYPE)
+            array["id"] = columns.ids
+            array["X"] = columns.positions
+            array["rgb"] = columns.colors
+            array["descType"] = columns.descTypes
+            array["state"] = columns.states
+            return array
+
+        def getObservationsArray(self):
+            """ Get the observations of all the landmarks as a structured array of OBSERVATION_DTYPE,
+            sorted by landmark id then by view id. """
+            columns = getObservationColumns(self.getLandmarks())
+            coordinates = columns.coordinates
+            array = numpy.empty(columns.size(), dtype=OBSERVATION_DTYPE)
+            array["landmarkId"] = columns.landmarkIds
+            array["viewId"] = columns.viewIds
+            array["x"] = coordinates[:, 0]
+            array["y"] = coordinates[:, 1]
+            array["featureId"] = columns.featureIds
+            array["scale"] = columns.scales
+            return array
+
+        def setLandmarksArrays(self, landmarks, observations=None):
+            """ Replace the landmarks with the content of structured arrays of LANDMARK_DTYPE and OBSERVATION_DTYPE
+            (or any structured arrays with the same fields). """
+            landmarkColumns = LandmarkColumns()
+            landmarkColumns.ids = landmarks["id"]
+            landmarkColumns.positions = landmarks["X"]
+            landmarkColumns.colors = landmarks["rgb"]
+            landmarkColumns.descTypes = landmarks["descType"]
+            landmarkColumns.states = landmarks["state"]
+
+            observationColumns = ObservationColumns()
+            if observations is not None:
+                observationColumns.landmarkIds = observations["landmarkId"]
+                observationColumns.viewIds = observations["viewId"]
+                observationColumns.coordinates = numpy.stack((observations["x"], observations["y"]), axis=1)
+                observationColumns.featureIds = observations["featureId"]
+                observationColumns.scales = observations["scale"]
+
+            setLandmarkColumns(self.getLandmarks(), landmarkColumns, observationColumns)
+    %}
+};
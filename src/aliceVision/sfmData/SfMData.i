@@ -20,6 +20,7 @@
 %include <aliceVision/sfmData/View.i>
 
 %include <aliceVision/sfmData/SfMData.hpp>
+%include <aliceVision/sfmData/LandmarkColumns.i>
 
 %{
 #include <aliceVision/sfmData/SfMData.hpp>
@@ -1,4 +1,5 @@
 #include <aliceVision/sfmData/SfMData.hpp>
+#include <aliceVision/sfmData/LandmarkColumns.hpp>
 
 #define BOOST_TEST_MODULE sfmData
 
@@ -50,3 +51,63 @@ BOOST_AUTO_TEST_CASE(SfMData_InternalFolders)
     BOOST_CHECK_EQUAL(sfmData.getRelativeFeaturesFolders()[0], fs::relative(refFolder, otherFolder));
     BOOST_CHECK_EQUAL(sfmData.getRelativeMatchesFolders()[0], fs::relative(refFolder, otherFolder));
 }
+
+BOOST_AUTO_TEST_CASE(SfMData_LandmarkColumns)
+{
+    sfmData::Landmarks landmarks;
+    for (IndexT landmarkId = 0; landmarkId < 100; ++landmarkId)
+    {
+        sfmData::Landmark landmark(
+          Vec3(landmarkId, 2.0 * landmarkId, -1.0), feature::EImageDescriberType::SIFT, image::RGBColor(landmarkId, 255 - landmarkId, 10));
+        landmark.state = (landmarkId % 2) ? EEstimatorParameterState::CONSTANT : EEstimatorParameterState::REFINED;
+        for (IndexT viewId = 0; viewId < landmarkId % 5; ++viewId)
+            landmark.getObservations()[viewId * 3] = sfmData::Observation(Vec2(viewId, landmarkId), landmarkId + viewId, 0.5 * viewId);
+        landmarks[landmarkId * 7] = landmark;
+    }
+
+    const sfmData::LandmarkColumns landmarkColumns = sfmData::getLandmarkColumns(landmarks);
+    const sfmData::ObservationColumns observationColumns = sfmData::getObservationColumns(landmarks);
+
+    BOOST_CHECK_EQUAL(landmarkColumns.size(), 100);
+    BOOST_CHECK_EQUAL(observationColumns.size(), 20 * (0 + 1 + 2 + 3 + 4));
+    BOOST_CHECK_EQUAL(landmarkColumns.ids(3), 21);
+    BOOST_CHECK_EQUAL(landmarkColumns.positions(3, 1), 6.0);
+    BOOST_CHECK_EQUAL(landmarkColumns.colors(3, 1), 252);
+    BOOST_CHECK_EQUAL(landmarkColumns.states(3), static_cast<unsigned char>(EEstimatorParameterState::CONSTANT));
+    BOOST_CHECK_EQUAL(observationColumns.landmarkIds(0), 7);
+    BOOST_CHECK_EQUAL(observationColumns.viewIds(2), 3);
+    BOOST_CHECK_EQUAL(observationColumns.coordinates(2, 1), 2.0);
+
+    // round trip, with the observations in reverse order
+    sfmData::ObservationColumns reversedObservationColumns = observationColumns;
+    reversedObservationColumns.landmarkIds.reverseInPlace();
+    reversedObservationColumns.viewIds.reverseInPlace();
+    reversedObservationColumns.coordinates = reversedObservationColumns.coordinates.colwise().reverse().eval();
+    reversedObservationColumns.featureIds.reverseInPlace();
+    reversedObservationColumns.scales.reverseInPlace();
+
+    sfmData::Landmarks newLandmarks;
+    sfmData::setLandmarkColumns(newLandmarks, landmarkColumns, reversedObservationColumns);
+    BOOST_CHECK(newLandmarks == landmarks);
+    BOOST_CHECK(newLandmarks.at(21).state == EEstimatorParameterState::CONSTANT);
+
+    // invalid columns
+    sfmData::LandmarkColumns invalidLandmarkColumns = landmarkColumns;
+    invalidLandmarkColumns.states.resize(10);
+    BOOST_CHECK_THROW(sfmData::setLandmarkColumns(newLandmarks, invalidLandmarkColumns, observationColumns), std::invalid_argument);
+
+    invalidLandmarkColumns = landmarkColumns;
+    invalidLandmarkColumns.ids(1) = invalidLandmarkColumns.ids(0);
+    BOOST_CHECK_THROW(sfmData::setLandmarkColumns(newLandmarks, invalidLandmarkColumns, observationColumns), std::invalid_argument);
+
+    sfmData::ObservationColumns invalidObservationColumns = observationColumns;
+    invalidObservationColumns.landmarkIds(0) = 1;
+    BOOST_CHECK_THROW(sfmData::setLandmarkColumns(newLandmarks, landmarkColumns, invalidObservationColumns), std::invalid_argument);
+
+    invalidObservationColumns = observationColumns;
+    invalidObservationColumns.viewIds(2) = invalidObservationColumns.viewIds(1);
+    BOOST_CHECK_THROW(sfmData::setLandmarkColumns(newLandmarks, landmarkColumns, invalidObservationColumns), std::invalid_argument);
+
+    // the landmarks are left untouched on error
+    BOOST_CHECK(newLandmarks == landmarks);
+}
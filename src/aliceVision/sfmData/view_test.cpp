@@ -48,6 +48,56 @@ BOOST_AUTO_TEST_CASE(View_Metadata)
         BOOST_CHECK_EQUAL(view.getImage().getMetadataFocalLength(), 5.0);
     }
 
+    {
+        sfmData::ImageInfo image;
+
+        // the first key in order wins when several keys only differ by their case or prefix
+        image.addMetadata("b/model", "B");
+        image.addMetadata("a:MODEL", "A");
+        BOOST_CHECK_EQUAL(image.getMetadataModel(), "A");
+
+        // new keys are visible after a lookup
+        image.addMetadata("Model", "C");
+        BOOST_CHECK_EQUAL(image.getMetadataModel(), "C");
+        image.addMetadata("Model", "D");
+        BOOST_CHECK_EQUAL(image.getMetadataModel(), "D");
+
+        const sfmData::ImageInfo imageCopy = image;
+
+        image.setMetadata({{"camera model", "E"}});
+        BOOST_CHECK_EQUAL(image.getMetadataModel(), "E");
+        BOOST_CHECK(!image.hasMetadata({"b/model"}));
+        BOOST_CHECK_EQUAL(imageCopy.getMetadataModel(), "D");
+    }
+
+    {
+        sfmData::ImageInfo image;
+
+        BOOST_CHECK_EQUAL(image.readRealNumber("3.5"), 3.5);
+        BOOST_CHECK_EQUAL(image.readRealNumber(" 42"), 42.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("1/250 s"), 1.0 / 250.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("x 12/4"), 3.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("1.5/2"), 2.5);
+        BOOST_CHECK_EQUAL(image.readRealNumber("10/0"), 0.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("12/"), 12.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("abc"), -1.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber(""), -1.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("1e999"), -1.0);
+        BOOST_CHECK_EQUAL(image.readRealNumber("99999999999/2"), -1.0);
+
+        // converted values follow the modifications of the metadata
+        image.addMetadata("Exif:FNumber", "28/10");
+        BOOST_CHECK_EQUAL(image.getMetadataFNumber(), 2.8);
+        image.addMetadata("Exif:FNumber", "4");
+        BOOST_CHECK_EQUAL(image.getMetadataFNumber(), 4.0);
+        image.addMetadata("FNumber", "5.6");
+        BOOST_CHECK_EQUAL(image.getMetadataFNumber(), 5.6);
+        image.addMetadata("FNumber", "");
+        BOOST_CHECK_EQUAL(image.getDoubleMetadata({"FNumber"}), -1.0);
+        image.setMetadata({{"Exif:FNumber", "8"}});
+        BOOST_CHECK_EQUAL(image.getMetadataFNumber(), 8.0);
+    }
+
     {
         sfmData::View view;
 
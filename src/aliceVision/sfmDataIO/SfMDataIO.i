@@ -8,8 +8,9 @@
 
 %include <std_string.i>
 %include <aliceVision/sfmDataIO/sfmDataIO.hpp>
+%include <aliceVision/sfmDataIO/sfmbIO.i>
 
 %{
 #include <aliceVision/sfmDataIO/sfmDataIO.hpp>
 using namespace aliceVision;
-%}
\ No newline at end of file
+%}
@@ -7,11 +7,17 @@
 #include "jsonIO.hpp"
 #include <aliceVision/camera/camera.hpp>
 #include <aliceVision/sfmDataIO/viewIO.hpp>
+#include <aliceVision/alicevision_omp.hpp>
 
 #include <boost/property_tree/json_parser.hpp>
 
-#include <memory>
+#include <algorithm>
 #include <cassert>
+#include <exception>
+#include <fstream>
+#include <memory>
+#include <sstream>
+#include <vector>
 
 namespace aliceVision {
 namespace sfmDataIO {
@@ -561,7 +567,141 @@ void loadLandmark(IndexT& landmarkId, sfmData::Landmark& landmark, bpt::ptree& l
     }
 }
 
-bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag)
+namespace {
+
+/// number of elements of a section processed by each thread at once, when saving or loading them in parallel
+constexpr int jsonElementsPerThread = 256;
+
+/**
+ * @brief Write the main JSON object of a file section by section, with the same layout as bpt::write_json.
+ *
+ * Sections made of many elements (views, landmarks...) are converted to text in parallel, by batches,
+ * then written in order: the output does not depend on the number of threads.
+ */
+class JsonStreamWriter
+{
+  public:
+    explicit JsonStreamWriter(std::ostream& stream)
+      : _stream(stream)
+    {
+        _stream << '{' << '\n';
+    }
+
+    /**
+     * @brief Write each child of the given tree as a section.
+     */
+    void writeSections(const bpt::ptree& tree)
+    {
+        for (const bpt::ptree::value_type& section : tree)
+        {
+            beginSection(section.first);
+            bpt::json_parser::write_json_helper(_stream, section.second, 1, true);
+        }
+    }
+
+    /**
+     * @brief Write a section whose elements are converted to property trees in parallel.
+     * @param[in] elements the non-empty container of elements to save
+     * @param[in] saveElement function adding the property tree of an element to a parent tree
+     */
+    template<typename ElementsT, typename SaveElementFunction>
+    void writeElements(const std::string& name, const ElementsT& elements, SaveElementFunction saveElement)
+    {
+        assert(!elements.empty());
+
+        std::vector<typename ElementsT::const_iterator> iterators;
+        iterators.reserve(elements.size());
+        for (auto it = elements.begin(); it != elements.end(); ++it)
+            iterators.push_back(it);
+
+        const int batchSize = jsonElementsPerThread * omp_get_max_threads();
+        const int nbElements = static_cast<int>(iterators.size());
+
+        // sections are arrays, unless their elements are named
+        bool isArray = true;
+        std::vector<std::string> texts;
+
+        for (int batchBegin = 0; batchBegin < nbElements; batchBegin += batchSize)
+        {
+            const int batchEnd = std::min(nbElements, batchBegin + batchSize);
+            texts.assign(batchEnd - batchBegin, std::string());
+
+            std::exception_ptr error;
+
+#pragma omp parallel for schedule(dynamic, 16)
+            for (int i = batchBegin; i < batchEnd; ++i)
+            {
+                try
+                {
+                    bpt::ptree parentTree;
+                    saveElement(*iterators[i], parentTree);
+                    const bpt::ptree::value_type& element = parentTree.front();
+
+                    if (i == 0)
+                        isArray = element.first.empty();
+
+                    std::ostringstream text;
+                    if (i > 0)
+                        text << ",\n";
+                    text << std::string(8, ' ');
+                    if (!element.first.empty())
+                        text << '"' << bpt::json_parser::create_escapes(element.first) << "\": ";
+                    bpt::json_parser::write_json_helper(text, element.second, 2, true);
+
+                    texts[i - batchBegin] = text.str();
+                }
+                catch (...)
+                {
+#pragma omp critical
+                    {
+                        if (!error)
+                            error = std::current_exception();
+                    }
+                }
+            }
+
+            if (error)
+                std::rethrow_exception(error);
+
+            if (batchBegin == 0)
+            {
+                beginSection(name);
+                _stream << (isArray ? '[' : '{') << '\n';
+            }
+
+            for (const std::string& text : texts)
+                _stream << text;
+        }
+
+        _stream << '\n' << std::string(4, ' ') << (isArray ? ']' : '}');
+    }
+
+    /**
+     * @brief Close the main object.
+     */
+    void end()
+    {
+        if (_hasSections)
+            _stream << '\n';
+        _stream << '}' << std::endl;
+    }
+
+  private:
+    void beginSection(const std::string& name)
+    {
+        if (_hasSections)
+            _stream << ",\n";
+        _hasSections = true;
+        _stream << std::string(4, ' ') << '"' << bpt::json_parser::create_escapes(name) << "\": ";
+    }
+
+    std::ostream& _stream;
+    bool _hasSections = false;
+};
+
+}  // namespace
+
+bool saveJSON(const sfmData::SfMData& sfmData, std::ostream& stream, ESfMData partFlag)
 {
     const Vec3i version = {ALICEVISION_SFMDATAIO_VERSION_MAJOR, ALICEVISION_SFMDATAIO_VERSION_MINOR, ALICEVISION_SFMDATAIO_VERSION_REVISION};
 
@@ -574,7 +714,10 @@ bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfM
     const bool saveFeatures = (partFlag & OBSERVATIONS_WITH_FEATURES) == OBSERVATIONS_WITH_FEATURES;
     const bool saveObservations = saveFeatures || ((partFlag & OBSERVATIONS) == OBSERVATIONS);
 
-    // main tree
+    // The file is written section by section, the elements of each section being converted in parallel
+    JsonStreamWriter writer(stream);
+
+    // main tree, for the small sections
     bpt::ptree fileTree;
 
     // file version
@@ -609,37 +752,31 @@ bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfM
         fileTree.add_child("matchesFolders", matchingFoldersTree);
     }
 
+    writer.writeSections(fileTree);
+
     // views
     if (saveViews && !sfmData.getViews().empty())
     {
-        bpt::ptree viewsTree;
-
-        for (const auto& viewPair : sfmData.getViews())
+        writer.writeElements("views", sfmData.getViews(), [](const sfmData::Views::value_type& viewPair, bpt::ptree& viewsTree) {
             saveView("", *(viewPair.second), viewsTree);
-
-        fileTree.add_child("views", viewsTree);
+        });
     }
 
     // ancestors
     if (saveAncestors && !sfmData.getAncestors().empty())
     {
-        bpt::ptree ancestorsTree;
-
-        for (const auto& ancestorPair : sfmData.getAncestors())
+        writer.writeElements("ancestors", sfmData.getAncestors(), [](const sfmData::ImageInfos::value_type& ancestorPair, bpt::ptree& ancestorsTree) {
             saveAncestor(std::to_string(ancestorPair.first), ancestorPair.first, ancestorPair.second, ancestorsTree);
-
-        fileTree.add_child("ancestors", ancestorsTree);
+        });
     }
 
     // intrinsics
     if (saveIntrinsics && !sfmData.getIntrinsics().empty())
     {
-        bpt::ptree intrinsicsTree;
-
-        for (const auto& intrinsicPair : sfmData.getIntrinsics())
-            saveIntrinsic("", intrinsicPair.first, intrinsicPair.second, intrinsicsTree);
-
-        fileTree.add_child("intrinsics", intrinsicsTree);
+        writer.writeElements(
+          "intrinsics", sfmData.getIntrinsics(), [](const sfmData::Intrinsics::value_type& intrinsicPair, bpt::ptree& intrinsicsTree) {
+              saveIntrinsic("", intrinsicPair.first, intrinsicPair.second, intrinsicsTree);
+          });
     }
 
     // extrinsics
@@ -648,239 +785,587 @@ bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfM
         // poses
         if (!sfmData.getPoses().empty())
         {
-            bpt::ptree posesTree;
-
-            for (const auto& posePair : sfmData.getPoses())
-            {
+            writer.writeElements("poses", sfmData.getPoses(), [](const sfmData::Poses::value_type& posePair, bpt::ptree& posesTree) {
                 bpt::ptree poseTree;
 
                 poseTree.put("poseId", posePair.first);
                 saveCameraPose("pose", posePair.second, poseTree);
                 posesTree.push_back(std::make_pair("", poseTree));
-            }
-
-            fileTree.add_child("poses", posesTree);
+            });
         }
 
         // rigs
         if (!sfmData.getRigs().empty())
         {
-            bpt::ptree rigsTree;
-
-            for (const auto& rigPair : sfmData.getRigs())
+            writer.writeElements("rigs", sfmData.getRigs(), [](const sfmData::Rigs::value_type& rigPair, bpt::ptree& rigsTree) {
                 saveRig("", rigPair.first, rigPair.second, rigsTree);
-
-            fileTree.add_child("rigs", rigsTree);
+            });
         }
     }
 
     // structure
     if (saveStructure && !sfmData.getLandmarks().empty())
     {
-        bpt::ptree structureTree;
-
-        for (const auto& structurePair : sfmData.getLandmarks())
-            saveLandmark("", structurePair.first, structurePair.second, structureTree, saveObservations, saveFeatures);
-
-        fileTree.add_child("structure", structureTree);
+        writer.writeElements(
+          "structure", sfmData.getLandmarks(), [&](const sfmData::Landmarks::value_type& structurePair, bpt::ptree& structureTree) {
+              saveLandmark("", structurePair.first, structurePair.second, structureTree, saveObservations, saveFeatures);
+          });
     }
 
-    // write the json file with the tree
+    writer.end();
 
-    bpt::write_json(filename, fileTree);
-
-    return true;
+    return stream.good();
 }
 
-bool loadJSON(sfmData::SfMData& sfmData,
-              const std::string& filename,
-              ESfMData partFlag,
-              bool incompleteViews,
-              EViewIdMethod viewIdMethod,
-              const std::string& viewIdRegex)
+bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag)
 {
-    Version version;
+    std::ofstream stream(filename);
+    if (!stream.is_open())
+    {
+        ALICEVISION_LOG_ERROR("Unable to open the JSON file: " << filename);
+        return false;
+    }
 
-    // load flags
-    const bool loadViews = (partFlag & VIEWS) == VIEWS;
-    const bool loadAncestors = (partFlag & ANCESTORS) == ANCESTORS;
-    const bool loadIntrinsics = (partFlag & INTRINSICS) == INTRINSICS;
-    const bool loadExtrinsics = (partFlag & EXTRINSICS) == EXTRINSICS;
-    const bool loadStructure = (partFlag & STRUCTURE) == STRUCTURE;
-    const bool loadFeatures = (partFlag & OBSERVATIONS_WITH_FEATURES) == OBSERVATIONS_WITH_FEATURES;
-    const bool loadObservations = loadFeatures || ((partFlag & OBSERVATIONS) == OBSERVATIONS);
+    return saveJSON(sfmData, stream, partFlag);
+}
 
-    // main tree
-    bpt::ptree fileTree;
+namespace {
+
+/**
+ * @brief Minimal pull parser walking through a JSON stream without building it in memory.
+ *
+ * Containers (objects and arrays) are entered one level at a time and their members are iterated with next().
+ * Member values can then be either skipped, or extracted as a boost property tree when they need to be loaded.
+ */
+class JsonStreamReader
+{
+  public:
+    JsonStreamReader(std::istream& stream, const std::string& filename)
+      : _buffer(*stream.rdbuf()),
+        _filename(filename)
+    {}
+
+    /**
+     * @brief Enter the object or array starting at the current position.
+     * @return false if the current value is not a container (it is then left unread)
+     */
+    bool enterContainer()
+    {
+        const int c = peek();
+        if (c != '{' && c != '[')
+            return false;
 
-    // read the json file and initialize the tree
-    bpt::read_json(filename, fileTree);
+        get();
+        _containers.push_back({c == '{', true});
+        return true;
+    }
 
-    // version
+    /**
+     * @brief Move to the next member of the current container.
+     * @param[out] key the member name if the container is an object (left empty for arrays)
+     * @return false if the end of the container has been reached (the container is then exited)
+     */
+    bool next(std::string& key)
     {
-        Vec3i v;
-        loadMatrix("version", v, fileTree);
-        version = v;
-        
-        const Vec3i currentVersion = {ALICEVISION_SFMDATAIO_VERSION_MAJOR, ALICEVISION_SFMDATAIO_VERSION_MINOR, ALICEVISION_SFMDATAIO_VERSION_REVISION};
-        if (Version(currentVersion) < version)
+        Container& container = _containers.back();
+
+        if (peek() == (container.isObject ? '}' : ']'))
         {
-            ALICEVISION_LOG_ERROR("File has a version more recent than this library");
+            get();
+            _containers.pop_back();
             return false;
         }
+
+        if (!container.first)
+            expect(',');
+        container.first = false;
+
+        key.clear();
+        if (container.isObject)
+        {
+            readString(&key);
+            expect(':');
+        }
+        return true;
     }
 
-    // folders
-    if (fileTree.count("featuresFolders"))
-        for (bpt::ptree::value_type& featureFolderNode : fileTree.get_child("featuresFolders"))
-            sfmData.addFeaturesFolder(featureFolderNode.second.get_value<std::string>());
+    /**
+     * @brief Skip the value at the current position without storing it.
+     */
+    void skipValue() { readValue(nullptr); }
 
-    if (fileTree.count("matchesFolders"))
-        for (bpt::ptree::value_type& matchingFolderNode : fileTree.get_child("matchesFolders"))
-            sfmData.addMatchesFolder(matchingFolderNode.second.get_value<std::string>());
+    /**
+     * @brief Read the raw JSON text of the value at the current position.
+     */
+    void readText(std::string& text)
+    {
+        text.clear();
+        readValue(&text);
+    }
 
-    // intrinsics
-    if (loadIntrinsics && fileTree.count("intrinsics"))
+    /**
+     * @brief Read the value at the current position as a boost property tree.
+     */
+    bpt::ptree readTree()
     {
-        sfmData::Intrinsics& intrinsics = sfmData.getIntrinsics();
+        readText(_text);
+        return parseTree(_text);
+    }
 
-        for (bpt::ptree::value_type& intrinsicNode : fileTree.get_child("intrinsics"))
-        {
-            IndexT intrinsicId;
-            std::shared_ptr<camera::IntrinsicBase> intrinsic;
+    /**
+     * @brief Convert the JSON text of a value to a boost property tree.
+     */
+    static bpt::ptree parseTree(const std::string& text)
+    {
+        std::istringstream textStream(text);
+        bpt::ptree tree;
+        bpt::read_json(textStream, tree);
+        return tree;
+    }
 
-            loadIntrinsic(version, intrinsicId, intrinsic, intrinsicNode.second);
+  private:
+    struct Container
+    {
+        bool isObject;
+        bool first;
+    };
+
+    int get()
+    {
+        const int c = _buffer.sbumpc();
+        if (c != std::char_traits<char>::eof())
+            ++_position;
+        return c;
+    }
 
-            intrinsics.emplace(intrinsicId, intrinsic);
+    /// skip whitespaces and return the next character without consuming it
+    int peek()
+    {
+        int c = _buffer.sgetc();
+        while (c == ' ' || c == '\n' || c == '\r' || c == '\t')
+        {
+            get();
+            c = _buffer.sgetc();
         }
+        return c;
     }
 
-    // ancestors
-    if (loadAncestors && fileTree.count("ancestors"))
+    void expect(char expected)
     {
-        sfmData::ImageInfos& ancestors = sfmData.getAncestors();
+        if (peek() != expected)
+            error(std::string("expected '") + expected + "'");
+        get();
+    }
 
-        for (bpt::ptree::value_type& ancestorNode : fileTree.get_child("ancestors"))
-        {
-            IndexT ancestorId;
-            sfmData::ImageInfo img;
-            std::shared_ptr<sfmData::ImageInfo> ancestor = std::make_shared<sfmData::ImageInfo>(img);
+    [[noreturn]] void error(const std::string& message) const
+    {
+        ALICEVISION_THROW_ERROR("Invalid JSON file '" << _filename << "' at character " << _position << ": " << message);
+    }
 
-            loadAncestor(ancestorId, ancestor, ancestorNode.second);
+    /**
+     * @brief Read a string, appending its raw content (without the quotes, escape sequences are kept as is) to text if provided.
+     */
+    void readString(std::string* text)
+    {
+        expect('"');
+        readStringContent(text);
+    }
 
-            ancestors.emplace(ancestorId, ancestor);
+    /**
+     * @brief Read the end of a string whose opening quote has already been consumed.
+     */
+    void readStringContent(std::string* text)
+    {
+        while (true)
+        {
+            int c = get();
+            if (c == std::char_traits<char>::eof())
+                error("unterminated string");
+            if (c == '"')
+                return;
+            if (text)
+                text->push_back(static_cast<char>(c));
+            if (c == '\\')
+            {
+                c = get();
+                if (c == std::char_traits<char>::eof())
+                    error("unterminated string");
+                if (text)
+                    text->push_back(static_cast<char>(c));
+            }
         }
     }
 
-    // views
-    if (loadViews && fileTree.count("views"))
+    /**
+     * @brief Read a whole value, appending its raw JSON text to text if provided.
+     */
+    void readValue(std::string* text)
     {
-        sfmData::Views& views = sfmData.getViews();
+        const int first = peek();
 
-        if (incompleteViews)
+        if (first == '"')
         {
-            auto children = fileTree.get_child("views");
-            // update incomplete views
-#pragma omp parallel for
-            for (int index = 0; index < children.size(); index++)
+            if (text)
+                text->push_back('"');
+            readString(text);
+            if (text)
+                text->push_back('"');
+            return;
+        }
+
+        if (first == '{' || first == '[')
+        {
+            int depth = 0;
+            do
             {
-                auto it = children.begin();
-                std::advance(it, index);
+                const int c = get();
+                if (c == std::char_traits<char>::eof())
+                    error("unexpected end of file");
 
-                auto view = std::make_shared<sfmData::View>();
-                loadView(*view, it->second);
+                if (text)
+                    text->push_back(static_cast<char>(c));
 
-                // if we have the intrinsics and the view has an valid associated intrinsics
-                // update the width and height field of View (they are mirrored)
-                if (loadIntrinsics && view->getIntrinsicId() != UndefinedIndexT)
+                if (c == '"')
                 {
-                    const auto intrinsics = sfmData.getIntrinsicPtr(view->getIntrinsicId());
+                    readStringContent(text);
+                    if (text)
+                        text->push_back('"');
+                }
+                else if (c == '{' || c == '[')
+                    ++depth;
+                else if (c == '}' || c == ']')
+                    --depth;
+            } while (depth > 0);
+            return;
+        }
 
-                    if (intrinsics == nullptr)
-                    {
-                        throw std::logic_error("View " + std::to_string(view->getViewId()) + " has a intrinsics id " +
-                                               std::to_string(view->getIntrinsicId()) +
-                                               " that cannot be found or the intrinsics are not correctly "
-                                               "loaded from the json file.");
-                    }
+        // number, boolean or null
+        std::size_t length = 0;
+        int c = _buffer.sgetc();
+        while (c != std::char_traits<char>::eof() && c != ',' && c != '}' && c != ']' && c != ' ' && c != '\n' && c != '\r' && c != '\t')
+        {
+            if (text)
+                text->push_back(static_cast<char>(c));
+            get();
+            c = _buffer.sgetc();
+            ++length;
+        }
+        if (length == 0)
+            error("value expected");
+    }
 
-                    view->getImage().setWidth(intrinsics->w());
-                    view->getImage().setHeight(intrinsics->h());
-                }
-                updateIncompleteView(*view, viewIdMethod, viewIdRegex);
+    std::streambuf& _buffer;
+    const std::string& _filename;
+    std::size_t _position = 0;
+    std::vector<Container> _containers;
+    std::string _text;
+};
+
+/**
+ * @brief Load the elements of the container that has just been entered by the reader.
+ *
+ * The text of the elements is read sequentially by batches, then the elements of each batch are parsed and loaded
+ * in parallel. Loaded elements are then inserted in the order of the file.
+ *
+ * @param[in] loadElement function converting the property tree of an element to an ElementT
+ * @param[in] insertElement function storing a loaded element
+ */
+template<typename ElementT, typename LoadElementFunction, typename InsertElementFunction>
+void loadElements(JsonStreamReader& reader, LoadElementFunction loadElement, InsertElementFunction insertElement)
+{
+    const std::size_t batchSize = jsonElementsPerThread * omp_get_max_threads();
+
+    std::vector<std::string> texts(batchSize);
+    std::vector<ElementT> elements;
+    std::string key;
+    bool hasNext = true;
+
+    while (hasNext)
+    {
+        std::size_t nbElements = 0;
+        while (nbElements < batchSize && (hasNext = reader.next(key)))
+            reader.readText(texts[nbElements++]);
 
+        elements.assign(nbElements, ElementT());
+        std::exception_ptr error;
+
+#pragma omp parallel for schedule(dynamic, 16)
+        for (int i = 0; i < nbElements; ++i)
+        {
+            try
+            {
+                bpt::ptree elementTree = JsonStreamReader::parseTree(texts[i]);
+                loadElement(elementTree, elements[i]);
+            }
+            catch (...)
+            {
 #pragma omp critical
                 {
-                    views.emplace(view->getViewId(), view);
+                    if (!error)
+                        error = std::current_exception();
                 }
             }
         }
-        else
-        {
-            // store directly in the SfMData views map
-            for (bpt::ptree::value_type& viewNode : fileTree.get_child("views"))
-            {
-                auto view = std::make_shared<sfmData::View>();
-                loadView(*view, viewNode.second);
-                views.emplace(view->getViewId(), view);
-            }
-        }
+
+        if (error)
+            std::rethrow_exception(error);
+
+        for (ElementT& element : elements)
+            insertElement(element);
     }
+}
 
-    // extrinsics
-    if (loadExtrinsics)
+/**
+ * @brief Load an SfMData from a JSON stream.
+ * @param[in] filename The name of the stream, used in error messages
+ */
+bool loadJSONStream(sfmData::SfMData& sfmData,
+                    std::istream& stream,
+                    const std::string& filename,
+                    ESfMData partFlag,
+                    bool incompleteViews,
+                    EViewIdMethod viewIdMethod,
+                    const std::string& viewIdRegex)
+{
+    Version version;
+    bool hasVersion = false;
+
+    // load flags
+    const bool loadViews = (partFlag & VIEWS) == VIEWS;
+    const bool loadAncestors = (partFlag & ANCESTORS) == ANCESTORS;
+    const bool loadIntrinsics = (partFlag & INTRINSICS) == INTRINSICS;
+    const bool loadExtrinsics = (partFlag & EXTRINSICS) == EXTRINSICS;
+    const bool loadStructure = (partFlag & STRUCTURE) == STRUCTURE;
+    const bool loadFeatures = (partFlag & OBSERVATIONS_WITH_FEATURES) == OBSERVATIONS_WITH_FEATURES;
+    const bool loadObservations = loadFeatures || ((partFlag & OBSERVATIONS) == OBSERVATIONS);
+
+    // The file is streamed section by section: sections that are not requested are skipped
+    // without being stored, and each element of the requested sections is loaded on its own.
+    JsonStreamReader reader(stream, filename);
+
+    // intrinsics can only be loaded once the version is known
+    std::vector<bpt::ptree> pendingIntrinsics;
+    // incomplete views can only be updated once the intrinsics are loaded
+    std::vector<std::shared_ptr<sfmData::View>> incompleteViewsList;
+
+    if (!reader.enterContainer())
     {
-        // poses
-        if (fileTree.count("poses"))
-        {
-            sfmData::Poses& poses = sfmData.getPoses();
+        ALICEVISION_LOG_ERROR("Invalid JSON file: " << filename);
+        return false;
+    }
 
-            for (bpt::ptree::value_type& poseNode : fileTree.get_child("poses"))
-            {
-                bpt::ptree& poseTree = poseNode.second;
-                sfmData::CameraPose pose;
+    std::string sectionName;
+    while (reader.next(sectionName))
+    {
+        const bool isElementsSection = (sectionName == "views" && loadViews) || (sectionName == "ancestors" && loadAncestors) ||
+                                       (sectionName == "intrinsics" && loadIntrinsics) ||
+                                       ((sectionName == "poses" || sectionName == "rigs") && loadExtrinsics) ||
+                                       (sectionName == "structure" && loadStructure);
 
-                loadCameraPose("pose", pose, poseTree);
+        // version
+        if (sectionName == "version")
+        {
+            bpt::ptree fileTree;
+            fileTree.add_child("version", reader.readTree());
 
-                poses.emplace(poseTree.get<IndexT>("poseId"), pose);
+            Vec3i v;
+            loadMatrix("version", v, fileTree);
+            version = v;
+            hasVersion = true;
+
+            const Vec3i currentVersion = {ALICEVISION_SFMDATAIO_VERSION_MAJOR, ALICEVISION_SFMDATAIO_VERSION_MINOR, ALICEVISION_SFMDATAIO_VERSION_REVISION};
+            if (Version(currentVersion) < version)
+            {
+                ALICEVISION_LOG_ERROR("File has a version more recent than this library");
+                return false;
             }
         }
-
-        // rigs
-        if (fileTree.count("rigs"))
+        // folders
+        else if (sectionName == "featuresFolders" || sectionName == "matchesFolders")
         {
-            sfmData::Rigs& rigs = sfmData.getRigs();
-
-            for (bpt::ptree::value_type& rigNode : fileTree.get_child("rigs"))
+            const bpt::ptree foldersTree = reader.readTree();
+            for (const bpt::ptree::value_type& folderNode : foldersTree)
             {
-                IndexT rigId;
-                sfmData::Rig rig;
+                if (sectionName == "featuresFolders")
+                    sfmData.addFeaturesFolder(folderNode.second.get_value<std::string>());
+                else
+                    sfmData.addMatchesFolder(folderNode.second.get_value<std::string>());
+            }
+        }
+        else if (isElementsSection && reader.enterContainer())
+        {
+            if (sectionName == "views")
+            {
+                loadElements<std::shared_ptr<sfmData::View>>(
+                  reader,
+                  [](bpt::ptree& viewTree, std::shared_ptr<sfmData::View>& view) {
+                      view = std::make_shared<sfmData::View>();
+                      loadView(*view, viewTree);
+                  },
+                  [&](std::shared_ptr<sfmData::View>& view) {
+                      if (incompleteViews)
+                          incompleteViewsList.push_back(view);
+                      else
+                          sfmData.getViews().emplace(view->getViewId(), view);
+                  });
+            }
+            else if (sectionName == "ancestors")
+            {
+                using AncestorPair = std::pair<IndexT, std::shared_ptr<sfmData::ImageInfo>>;
+
+                loadElements<AncestorPair>(
+                  reader,
+                  [](bpt::ptree& ancestorTree, AncestorPair& ancestorPair) {
+                      ancestorPair.second = std::make_shared<sfmData::ImageInfo>();
+                      loadAncestor(ancestorPair.first, ancestorPair.second, ancestorTree);
+                  },
+                  [&](AncestorPair& ancestorPair) { sfmData.getAncestors().emplace(ancestorPair.first, ancestorPair.second); });
+            }
+            else if (sectionName == "intrinsics")
+            {
+                using IntrinsicPair = std::pair<IndexT, std::shared_ptr<camera::IntrinsicBase>>;
 
-                loadRig(rigId, rig, rigNode.second);
+                if (hasVersion)
+                {
+                    loadElements<IntrinsicPair>(
+                      reader,
+                      [&](bpt::ptree& intrinsicTree, IntrinsicPair& intrinsicPair) {
+                          loadIntrinsic(version, intrinsicPair.first, intrinsicPair.second, intrinsicTree);
+                      },
+                      [&](IntrinsicPair& intrinsicPair) { sfmData.getIntrinsics().emplace(intrinsicPair.first, intrinsicPair.second); });
+                }
+                else
+                {
+                    // intrinsics can only be loaded once the version is known
+                    loadElements<bpt::ptree>(
+                      reader,
+                      [](bpt::ptree& intrinsicTree, bpt::ptree& pendingTree) { pendingTree.swap(intrinsicTree); },
+                      [&](bpt::ptree& pendingTree) { pendingIntrinsics.push_back(std::move(pendingTree)); });
+                }
+            }
+            else if (sectionName == "poses")
+            {
+                using PosePair = std::pair<IndexT, sfmData::CameraPose>;
+
+                loadElements<PosePair>(
+                  reader,
+                  [](bpt::ptree& poseTree, PosePair& posePair) {
+                      loadCameraPose("pose", posePair.second, poseTree);
+                      posePair.first = poseTree.get<IndexT>("poseId");
+                  },
+                  [&](PosePair& posePair) { sfmData.getPoses().emplace(posePair.first, posePair.second); });
+            }
+            else if (sectionName == "rigs")
+            {
+                using RigPair = std::pair<IndexT, sfmData::Rig>;
 
-                rigs.emplace(rigId, rig);
+                loadElements<RigPair>(
+                  reader,
+                  [](bpt::ptree& rigTree, RigPair& rigPair) { loadRig(rigPair.first, rigPair.second, rigTree); },
+                  [&](RigPair& rigPair) { sfmData.getRigs().emplace(rigPair.first, std::move(rigPair.second)); });
+            }
+            else if (sectionName == "structure")
+            {
+                using LandmarkPair = std::pair<IndexT, sfmData::Landmark>;
+
+                loadElements<LandmarkPair>(
+                  reader,
+                  [&](bpt::ptree& landmarkTree, LandmarkPair& landmarkPair) {
+                      loadLandmark(landmarkPair.first, landmarkPair.second, landmarkTree, loadObservations, loadFeatures);
+                  },
+                  [&](LandmarkPair& landmarkPair) { sfmData.getLandmarks().emplace(landmarkPair.first, std::move(landmarkPair.second)); });
             }
         }
+        else
+        {
+            reader.skipValue();
+        }
     }
 
-    // structure
-    if (loadStructure && fileTree.count("structure"))
+    if (!hasVersion)
+    {
+        ALICEVISION_LOG_ERROR("No version found in the JSON file: " << filename);
+        return false;
+    }
+
+    // intrinsics stored before the version
+    for (bpt::ptree& intrinsicTree : pendingIntrinsics)
     {
-        sfmData::Landmarks& structure = sfmData.getLandmarks();
+        IndexT intrinsicId;
+        std::shared_ptr<camera::IntrinsicBase> intrinsic;
 
-        for (bpt::ptree::value_type& landmarkNode : fileTree.get_child("structure"))
+        loadIntrinsic(version, intrinsicId, intrinsic, intrinsicTree);
+
+        sfmData.getIntrinsics().emplace(intrinsicId, intrinsic);
+    }
+
+    // update incomplete views
+    if (!incompleteViewsList.empty())
+    {
+        sfmData::Views& views = sfmData.getViews();
+
+#pragma omp parallel for
+        for (int index = 0; index < incompleteViewsList.size(); index++)
         {
-            IndexT landmarkId;
-            sfmData::Landmark landmark;
+            sfmData::View& view = *incompleteViewsList[index];
 
-            loadLandmark(landmarkId, landmark, landmarkNode.second, loadObservations, loadFeatures);
+            // if we have the intrinsics and the view has an valid associated intrinsics
+            // update the width and height field of View (they are mirrored)
+            if (loadIntrinsics && view.getIntrinsicId() != UndefinedIndexT)
+            {
+                const auto intrinsics = sfmData.getIntrinsicPtr(view.getIntrinsicId());
+
+                if (intrinsics == nullptr)
+                {
+                    throw std::logic_error("View " + std::to_string(view.getViewId()) + " has a intrinsics id " +
+                                           std::to_string(view.getIntrinsicId()) +
+                                           " that cannot be found or the intrinsics are not correctly "
+                                           "loaded from the json file.");
+                }
 
-            structure.emplace(landmarkId, landmark);
+                view.getImage().setWidth(intrinsics->w());
+                view.getImage().setHeight(intrinsics->h());
+            }
+            updateIncompleteView(view, viewIdMethod, viewIdRegex);
+
+#pragma omp critical
+            {
+                views.emplace(view.getViewId(), incompleteViewsList[index]);
+            }
         }
     }
 
     return true;
 }
 
+}  // namespace
+
+bool loadJSON(sfmData::SfMData& sfmData,
+              std::istream& stream,
+              ESfMData partFlag,
+              bool incompleteViews,
+              EViewIdMethod viewIdMethod,
+              const std::string& viewIdRegex)
+{
+    return loadJSONStream(sfmData, stream, "<stream>", partFlag, incompleteViews, viewIdMethod, viewIdRegex);
+}
+
+bool loadJSON(sfmData::SfMData& sfmData,
+              const std::string& filename,
+              ESfMData partFlag,
+              bool incompleteViews,
+              EViewIdMethod viewIdMethod,
+              const std::string& viewIdRegex)
+{
+    std::ifstream stream(filename);
+    if (!stream.is_open())
+    {
+        ALICEVISION_LOG_ERROR("Unable to open the JSON file: " << filename);
+        return false;
+    }
+
+    return loadJSONStream(sfmData, stream, filename, partFlag, incompleteViews, viewIdMethod, viewIdRegex);
+}
+
 }  // namespace sfmDataIO
 }  // namespace aliceVision
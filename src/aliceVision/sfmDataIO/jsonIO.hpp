@@ -11,6 +11,7 @@
 
 #include <boost/property_tree/ptree.hpp>
 
+#include <iosfwd>
 #include <string>
 
 namespace aliceVision {
@@ -224,8 +225,19 @@ void loadLandmark(IndexT& landmarkId, sfmData::Landmark& landmark, bpt::ptree& l
  */
 bool saveJSON(const sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag);
 
+/**
+ * @brief Save an SfMData in JSON format in a stream.
+ * @param[in] sfmData The input SfMData
+ * @param[in,out] stream The output stream
+ * @param[in] partFlag The ESfMData save flag
+ * @return true if completed
+ */
+bool saveJSON(const sfmData::SfMData& sfmData, std::ostream& stream, ESfMData partFlag);
+
 /**
  * @brief Load a JSON SfMData file.
+ *        The file is streamed section by section: the sections not requested by partFlag
+ *        are skipped without being stored and each element is parsed on its own.
  * @param[out] sfmData The output SfMData
  * @param[in] filename The filename
  * @param[in] partFlag The ESfMData load flag
@@ -241,5 +253,23 @@ bool loadJSON(sfmData::SfMData& sfmData,
               EViewIdMethod viewIdMethod = EViewIdMethod::METADATA,
               const std::string& viewIdRegex = "");
 
+/**
+ * @brief Load an SfMData from a JSON stream.
+ * @see loadJSON
+ * @param[out] sfmData The output SfMData
+ * @param[in,out] stream The input stream
+ * @param[in] partFlag The ESfMData load flag
+ * @param[in] incompleteViews If true, try to load incomplete views
+ * @param[in] viewIdMethod ViewId generation method to use if incompleteViews is true
+ * @param[in] viewIdRegex Optional regex used when viewIdMethod is FILENAME
+ * @return true if completed
+ */
+bool loadJSON(sfmData::SfMData& sfmData,
+              std::istream& stream,
+              ESfMData partFlag,
+              bool incompleteViews = false,
+              EViewIdMethod viewIdMethod = EViewIdMethod::METADATA,
+              const std::string& viewIdRegex = "");
+
 }  // namespace sfmDataIO
 }  // namespace aliceVision
@@ -12,6 +12,7 @@
 #include <aliceVision/sfmDataIO/plyIO.hpp>
 #include <aliceVision/sfmDataIO/bafIO.hpp>
 #include <aliceVision/sfmDataIO/gtIO.hpp>
+#include <aliceVision/sfmDataIO/sfmbIO.hpp>
 #include <aliceVision/utils/filesIO.hpp>
 
 #if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_ALEMBIC)
@@ -115,6 +116,10 @@ bool load(aliceVision::sfmData::SfMData& sfmData, const std::string& filename, E
     {
         status = loadJSON(sfmData, filename, partFlag);
     }
+    else if (extension == ".sfmb")  // Binary File
+    {
+        status = loadSFMB(sfmData, filename, partFlag);
+    }
     else if (extension == ".abc")  // Alembic
     {
 #if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_ALEMBIC)
@@ -159,6 +164,10 @@ bool save(const aliceVision::sfmData::SfMData& sfmData, const std::string& filen
     {
         status = saveJSON(sfmData, tmpPath, partFlag);
     }
+    else if (extension == ".sfmb")  // Binary File
+    {
+        status = saveSFMB(sfmData, tmpPath, partFlag);
+    }
     else if (extension == ".ply")  // Polygon File
     {
         status = savePLY(sfmData, tmpPath, partFlag);
@@ -8,15 +8,20 @@
 #include <aliceVision/system/Timer.hpp>
 #include <aliceVision/sfmData/SfMData.hpp>
 #include <aliceVision/sfmDataIO/sfmDataIO.hpp>
+#include <aliceVision/sfmDataIO/jsonIO.hpp>
+#include <aliceVision/sfmDataIO/sfmbIO.hpp>
 #include <aliceVision/config.hpp>
+#include <aliceVision/alicevision_omp.hpp>
 
 #include <filesystem>
+#include <fstream>
 #include <sstream>
 
 #define BOOST_TEST_MODULE sfmDataIO
 
 #include <boost/test/unit_test.hpp>
 #include <boost/test/tools/floating_point_comparison.hpp>
+#include <boost/property_tree/json_parser.hpp>
 
 using namespace aliceVision;
 using namespace aliceVision::camera;
@@ -76,7 +81,7 @@ sfmData::SfMData createTestScene(std::size_t viewsCount = 2, std::size_t observa
 
 BOOST_AUTO_TEST_CASE(SfMData_IO_SAVE_LOAD)
 {
-    std::vector<std::string> ext_Type = {"sfm", "json"};
+    std::vector<std::string> ext_Type = {"sfm", "json", "sfmb"};
 
 #if ALICEVISION_IS_DEFINED(ALICEVISION_HAVE_ALEMBIC)
     ext_Type.push_back("abc");
@@ -178,6 +183,137 @@ BOOST_AUTO_TEST_CASE(SfMData_IO_SAVE_LOAD)
     }
 }
 
+BOOST_AUTO_TEST_CASE(SfMData_IO_LOAD_JSON_SKIP_SECTIONS)
+{
+    const std::string filename = "SKIP_SECTIONS.sfm";
+    const sfmData::SfMData sfmData = createTestScene(2, 2, true);
+    BOOST_CHECK(save(sfmData, filename, ALL));
+
+    // Insert an unknown section with nested content before the known ones
+    {
+        std::ifstream in(filename);
+        std::stringstream content;
+        content << in.rdbuf();
+        std::string text = content.str();
+        text.insert(text.find('{') + 1, R"( "unknown": { "a": [1, 2, {"b": "x}]\"y"}], "c": null }, )");
+        std::ofstream out(filename);
+        out << text;
+    }
+
+    sfmData::SfMData sfmDataLoad;
+    BOOST_CHECK(load(sfmDataLoad, filename, ESfMData(ESfMData::VIEWS | ESfMData::STRUCTURE | ESfMData::OBSERVATIONS)));
+    BOOST_CHECK_EQUAL(sfmDataLoad.getViews().size(), sfmData.getViews().size());
+    BOOST_CHECK_EQUAL(sfmDataLoad.getPoses().size(), 0);
+    BOOST_CHECK_EQUAL(sfmDataLoad.getIntrinsics().size(), 0);
+    BOOST_CHECK_EQUAL(sfmDataLoad.getLandmarks().size(), sfmData.getLandmarks().size());
+    BOOST_CHECK(sfmDataLoad.getLandmarks().at(0).X == sfmData.getLandmarks().at(0).X);
+    BOOST_CHECK_EQUAL(sfmDataLoad.getLandmarks().at(0).getObservations().size(), 2);
+
+    sfmData::SfMData sfmDataLoadAll;
+    BOOST_CHECK(load(sfmDataLoadAll, filename, ALL));
+    BOOST_CHECK(sfmData == sfmDataLoadAll);
+}
+
+BOOST_AUTO_TEST_CASE(SfMData_IO_JSON_PARALLEL)
+{
+    // Enough elements to be processed in several batches
+    sfmData::SfMData sfmData = createTestScene(700, 2, false);
+    for (IndexT landmarkId = 1; landmarkId < 1000; ++landmarkId)
+    {
+        sfmData::Landmark& landmark = sfmData.getLandmarks()[landmarkId];
+        landmark.X = Vec3(landmarkId, 2.0 * landmarkId, 0.5);
+        landmark.descType = feature::EImageDescriberType::SIFT;
+        landmark.getObservations()[landmarkId % 700] = sfmData::Observation(Vec2(landmarkId, 1.0), landmarkId, 2.0);
+    }
+    sfmData.addFeaturesFolder("features");
+
+    std::ostringstream parallelStream;
+    BOOST_CHECK(saveJSON(sfmData, parallelStream, ALL));
+
+    const int maxThreads = omp_get_max_threads();
+    omp_set_num_threads(1);
+    std::ostringstream sequentialStream;
+    BOOST_CHECK(saveJSON(sfmData, sequentialStream, ALL));
+    omp_set_num_threads(maxThreads);
+
+    BOOST_CHECK(parallelStream.str() == sequentialStream.str());
+
+    // The layout is the one of the boost property tree writer
+    {
+        std::istringstream textStream(parallelStream.str());
+        bpt::ptree fileTree;
+        bpt::read_json(textStream, fileTree);
+
+        std::ostringstream treeStream;
+        bpt::write_json(treeStream, fileTree);
+        BOOST_CHECK(treeStream.str() == parallelStream.str());
+    }
+
+    std::istringstream loadStream(parallelStream.str());
+    sfmData::SfMData sfmDataLoad;
+    BOOST_CHECK(loadJSON(sfmDataLoad, loadStream, ALL));
+    BOOST_CHECK(sfmData == sfmDataLoad);
+}
+
+BOOST_AUTO_TEST_CASE(SfMData_IO_SFMB_COLUMNS)
+{
+    const std::string filename = "COLUMNS.sfmb";
+    sfmData::SfMData sfmData = createTestScene(3, 4, true);
+    sfmData.getLandmarks()[5] = sfmData::Landmark(Vec3(1, 2, 3), feature::EImageDescriberType::AKAZE, image::RGBColor(10, 20, 30));
+    sfmData.getLandmarks()[5].getObservations()[1] = sfmData::Observation(Vec2(4, 5), 6, 7.0);
+    BOOST_CHECK(save(sfmData, filename, ALL));
+
+    // each mapping is released before the file is overwritten
+    {
+        const SfMBFile file(filename);
+        BOOST_CHECK_EQUAL(file.getLandmarkCount(), 2);
+        BOOST_CHECK_EQUAL(file.getObservationCount(), 5);
+        BOOST_CHECK(file.hasObservations());
+        BOOST_CHECK(file.hasFeatures());
+
+        BOOST_CHECK_EQUAL(file.getLandmarkIds()(0), 0);
+        BOOST_CHECK_EQUAL(file.getLandmarkIds()(1), 5);
+        BOOST_CHECK(file.getPositions().col(0) == Vec3(11, 22, 33));
+        BOOST_CHECK(file.getPositions().col(1) == Vec3(1, 2, 3));
+        BOOST_CHECK_EQUAL(file.getColors()(2, 1), 30);
+        BOOST_CHECK_EQUAL(file.getDescTypes()(0), static_cast<unsigned char>(feature::EImageDescriberType::SIFT));
+        BOOST_CHECK_EQUAL(file.getDescTypes()(1), static_cast<unsigned char>(feature::EImageDescriberType::AKAZE));
+
+        BOOST_CHECK_EQUAL(file.getObservationOffsets().size(), 3);
+        BOOST_CHECK_EQUAL(file.getObservationOffsets()(1), 4);
+        BOOST_CHECK_EQUAL(file.getObservationOffsets()(2), 5);
+        BOOST_CHECK_EQUAL(file.getObservationViewIds()(3), 3);
+        BOOST_CHECK_EQUAL(file.getObservationViewIds()(4), 1);
+        BOOST_CHECK_EQUAL(file.getObservationFeatureIds()(4), 6);
+        BOOST_CHECK(file.getObservationCoordinates().col(4) == Vec2(4, 5));
+        BOOST_CHECK_EQUAL(file.getObservationScales()(4), 7.0);
+    }
+
+    // without observations
+    BOOST_CHECK(save(sfmData, filename, ESfMData(ALL & ~(OBSERVATIONS | OBSERVATIONS_WITH_FEATURES))));
+
+    {
+        const SfMBFile fileWithoutObservations(filename);
+        BOOST_CHECK_EQUAL(fileWithoutObservations.getLandmarkCount(), 2);
+        BOOST_CHECK(!fileWithoutObservations.hasObservations());
+        BOOST_CHECK_EQUAL(fileWithoutObservations.getObservationOffsets().size(), 0);
+    }
+
+    sfmData::SfMData sfmDataLoad;
+    BOOST_CHECK(load(sfmDataLoad, filename, ALL));
+    BOOST_CHECK_EQUAL(sfmDataLoad.getViews().size(), sfmData.getViews().size());
+    BOOST_CHECK_EQUAL(sfmDataLoad.getLandmarks().size(), 2);
+    BOOST_CHECK(sfmDataLoad.getLandmarks().at(5).getObservations().empty());
+
+    // invalid file
+    {
+        std::ofstream out(filename, std::ios::binary);
+        out << "not a binary sfm file, but long enough to hold a header......................................................";
+    }
+    BOOST_CHECK_THROW(SfMBFile{filename}, std::runtime_error);
+    BOOST_CHECK(!load(sfmDataLoad, filename, ALL));
+}
+
 /*
 BOOST_AUTO_TEST_CASE(SfMData_IO_BigFile) {
   const int nbViews = 1000;
@@ -0,0 +1,438 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "sfmbIO.hpp"
+#include <aliceVision/sfmDataIO/jsonIO.hpp>
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/utils/filesIO.hpp>
+
+#include <boost/iostreams/device/array.hpp>
+#include <boost/iostreams/device/mapped_file.hpp>
+#include <boost/iostreams/stream.hpp>
+
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <sstream>
+#include <vector>
+
+namespace fs = std::filesystem;
+
+namespace aliceVision {
+namespace sfmDataIO {
+
+namespace {
+
+const char sfmbMagic[8] = {'A', 'V', 'S', 'F', 'M', 'B', '\0', '\0'};
+const std::uint32_t sfmbVersion = 1;
+const std::uint32_t sfmbByteOrder = 0x01020304;
+
+/// Alignment of the JSON document and of each column in the file
+const std::uint64_t sfmbAlignment = 64;
+
+enum ESfMBFlags : std::uint32_t
+{
+    HAS_OBSERVATIONS = 1,
+    HAS_FEATURES = 2
+};
+
+/// File header, followed by the JSON document and the columns at the given offsets
+struct SfMBHeader
+{
+    char magic[8];
+    std::uint32_t version;
+    std::uint32_t byteOrder;
+    std::uint32_t flags;
+    std::uint32_t columnCount;
+    std::uint64_t jsonOffset;
+    std::uint64_t jsonSize;
+    std::uint64_t landmarkCount;
+    std::uint64_t observationCount;
+    std::uint64_t columnOffsets[SfMBFile::COLUMN_COUNT];
+};
+
+inline std::uint64_t alignOffset(std::uint64_t offset) { return (offset + sfmbAlignment - 1) / sfmbAlignment * sfmbAlignment; }
+
+/// @return the size (in bytes) of a column
+std::uint64_t columnSize(SfMBFile::EColumn column, std::uint64_t landmarkCount, std::uint64_t observationCount, std::uint32_t flags)
+{
+    const bool hasObservations = flags & HAS_OBSERVATIONS;
+    const bool hasFeatures = flags & HAS_FEATURES;
+
+    switch (column)
+    {
+        case SfMBFile::LANDMARK_IDS:
+            return landmarkCount * sizeof(IndexT);
+        case SfMBFile::POSITIONS:
+            return landmarkCount * 3 * sizeof(double);
+        case SfMBFile::COLORS:
+            return landmarkCount * 3 * sizeof(unsigned char);
+        case SfMBFile::DESC_TYPES:
+            return landmarkCount * sizeof(unsigned char);
+        case SfMBFile::OBSERVATION_OFFSETS:
+            return hasObservations ? (landmarkCount + 1) * sizeof(std::uint64_t) : 0;
+        case SfMBFile::OBSERVATION_VIEW_IDS:
+            return hasObservations ? observationCount * sizeof(IndexT) : 0;
+        case SfMBFile::OBSERVATION_FEATURE_IDS:
+            return hasFeatures ? observationCount * sizeof(IndexT) : 0;
+        case SfMBFile::OBSERVATION_COORDINATES:
+            return hasFeatures ? observationCount * 2 * sizeof(double) : 0;
+        case SfMBFile::OBSERVATION_SCALES:
+            return hasFeatures ? observationCount * sizeof(double) : 0;
+        default:
+            return 0;
+    }
+}
+
+/// Pad the stream with zeros up to the given offset
+void padTo(std::ostream& stream, std::uint64_t offset)
+{
+    const std::uint64_t position = static_cast<std::uint64_t>(stream.tellp());
+    if (position < offset)
+    {
+        const std::vector<char> zeros(offset - position, '\0');
+        stream.write(zeros.data(), zeros.size());
+    }
+}
+
+template<typename T>
+void writeColumn(std::ostream& stream, std::uint64_t offset, const std::vector<T>& values)
+{
+    padTo(stream, offset);
+    stream.write(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(T));
+}
+
+}  // namespace
+
+SfMBFile::SfMBFile(const std::string& filename)
+{
+    if (!fs::is_regular_file(filename))
+        ALICEVISION_THROW_ERROR("Unable to open the SfMB file: " << filename);
+
+    _fileSize = fs::file_size(filename);
+    if (_fileSize < sizeof(SfMBHeader))
+        ALICEVISION_THROW_ERROR("Invalid SfMB file (truncated header): " << filename);
+
+    auto file = std::make_shared<boost::iostreams::mapped_file_source>(filename);
+    if (!file->is_open())
+        ALICEVISION_THROW_ERROR("Unable to map the SfMB file: " << filename);
+
+    // aliasing constructor: the pointer to the data shares the ownership of the mapping
+    _data = std::shared_ptr<const char>(file, file->data());
+
+    SfMBHeader header;
+    std::memcpy(&header, _data.get(), sizeof(SfMBHeader));
+
+    if (std::memcmp(header.magic, sfmbMagic, sizeof(sfmbMagic)) != 0)
+        ALICEVISION_THROW_ERROR("Invalid SfMB file (wrong magic number): " << filename);
+    if (header.byteOrder != sfmbByteOrder)
+        ALICEVISION_THROW_ERROR("Invalid SfMB file (unsupported byte order): " << filename);
+    if (header.version > sfmbVersion)
+        ALICEVISION_THROW_ERROR("SfMB file has a version more recent than this library (" << header.version << "): " << filename);
+    if (header.columnCount != COLUMN_COUNT)
+        ALICEVISION_THROW_ERROR("Invalid SfMB file (unexpected number of columns): " << filename);
+    if (header.jsonOffset > _fileSize || header.jsonSize > _fileSize - header.jsonOffset)
+        ALICEVISION_THROW_ERROR("Invalid SfMB file (truncated JSON document): " << filename);
+
+    _flags = header.flags;
+    _jsonOffset = header.jsonOffset;
+    _jsonSize = header.jsonSize;
+    _landmarkCount = header.landmarkCount;
+    _observationCount = header.observationCount;
+
+    for (int c = 0; c < COLUMN_COUNT; ++c)
+    {
+        const std::uint64_t offset = header.columnOffsets[c];
+        const std::uint64_t size = columnSize(static_cast<EColumn>(c), header.landmarkCount, header.observationCount, header.flags);
+
+        if (offset % sfmbAlignment != 0 || offset > _fileSize || size > _fileSize - offset)
+            ALICEVISION_THROW_ERROR("Invalid SfMB file (truncated column " << c << "): " << filename);
+
+        _columnOffsets[c] = offset;
+    }
+
+    if (hasObservations())
+    {
+        const OffsetColumn offsets = getObservationOffsets();
+        if (offsets(0) != 0 || offsets(_landmarkCount) != _observationCount)
+            ALICEVISION_THROW_ERROR("Invalid SfMB file (inconsistent observation offsets): " << filename);
+    }
+}
+
+std::string_view SfMBFile::getJSON() const { return std::string_view(_data.get() + _jsonOffset, _jsonSize); }
+
+bool SfMBFile::hasObservations() const { return _flags & HAS_OBSERVATIONS; }
+
+bool SfMBFile::hasFeatures() const { return _flags & HAS_FEATURES; }
+
+SfMBFile::IndexColumn SfMBFile::getLandmarkIds() const { return IndexColumn(column<IndexT>(LANDMARK_IDS), _landmarkCount); }
+
+Eigen::Map<const Mat3X> SfMBFile::getPositions() const { return Eigen::Map<const Mat3X>(column<double>(POSITIONS), 3, _landmarkCount); }
+
+SfMBFile::ColorColumn SfMBFile::getColors() const { return ColorColumn(column<unsigned char>(COLORS), 3, _landmarkCount); }
+
+SfMBFile::DescTypeColumn SfMBFile::getDescTypes() const { return DescTypeColumn(column<unsigned char>(DESC_TYPES), _landmarkCount); }
+
+SfMBFile::OffsetColumn SfMBFile::getObservationOffsets() const
+{
+    return OffsetColumn(column<std::uint64_t>(OBSERVATION_OFFSETS), hasObservations() ? _landmarkCount + 1 : 0);
+}
+
+SfMBFile::IndexColumn SfMBFile::getObservationViewIds() const
+{
+    return IndexColumn(column<IndexT>(OBSERVATION_VIEW_IDS), hasObservations() ? _observationCount : 0);
+}
+
+SfMBFile::IndexColumn SfMBFile::getObservationFeatureIds() const
+{
+    return IndexColumn(column<IndexT>(OBSERVATION_FEATURE_IDS), hasFeatures() ? _observationCount : 0);
+}
+
+Eigen::Map<const Mat2X> SfMBFile::getObservationCoordinates() const
+{
+    return Eigen::Map<const Mat2X>(column<double>(OBSERVATION_COORDINATES), 2, hasFeatures() ? _observationCount : 0);
+}
+
+Eigen::Map<const Vec> SfMBFile::getObservationScales() const
+{
+    return Eigen::Map<const Vec>(column<double>(OBSERVATION_SCALES), hasFeatures() ? _observationCount : 0);
+}
+
+void SfMBFile::getLandmarks(sfmData::Landmarks& landmarks, bool loadObservations, bool loadFeatures) const
+{
+    loadObservations = (loadObservations || loadFeatures) && hasObservations();
+    loadFeatures = loadFeatures && hasFeatures();
+
+    const IndexColumn landmarkIds = getLandmarkIds();
+    const Eigen::Map<const Mat3X> positions = getPositions();
+    const ColorColumn colors = getColors();
+    const DescTypeColumn descTypes = getDescTypes();
+    const OffsetColumn offsets = getObservationOffsets();
+    const IndexColumn viewIds = getObservationViewIds();
+    const IndexColumn featureIds = getObservationFeatureIds();
+    const Eigen::Map<const Mat2X> coordinates = getObservationCoordinates();
+    const Eigen::Map<const Vec> scales = getObservationScales();
+
+    for (std::size_t i = 0; i < _landmarkCount; ++i)
+    {
+        // landmarks are stored sorted by id
+        auto it = landmarks.emplace_hint(landmarks.end(),
+                                         landmarkIds(i),
+                                         sfmData::Landmark(positions.col(i),
+                                                           static_cast<feature::EImageDescriberType>(descTypes(i)),
+                                                           image::RGBColor(colors(0, i), colors(1, i), colors(2, i))));
+
+        if (!loadObservations)
+            continue;
+
+        sfmData::Observations& observations = it->second.getObservations();
+        observations.reserve(offsets(i + 1) - offsets(i));
+
+        for (std::uint64_t o = offsets(i); o < offsets(i + 1); ++o)
+        {
+            sfmData::Observation observation;
+            if (loadFeatures)
+            {
+                observation.setFeatureId(featureIds(o));
+                observation.setCoordinates(coordinates.col(o));
+                observation.setScale(scales(o));
+            }
+            // observations are stored sorted by view id
+            observations.emplace_hint(observations.end(), viewIds(o), observation);
+        }
+    }
+}
+
+bool saveSFMB(const sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag)
+{
+    // save flags
+    const bool saveStructure = (partFlag & STRUCTURE) == STRUCTURE;
+    const bool saveFeatures = (partFlag & OBSERVATIONS_WITH_FEATURES) == OBSERVATIONS_WITH_FEATURES;
+    const bool saveObservations = saveFeatures || ((partFlag & OBSERVATIONS) == OBSERVATIONS);
+
+    // everything but the structure is stored as JSON
+    std::ostringstream jsonStream;
+    if (!saveJSON(sfmData, jsonStream, ESfMData(partFlag & ~(STRUCTURE | OBSERVATIONS | OBSERVATIONS_WITH_FEATURES))))
+        return false;
+    const std::string json = jsonStream.str();
+
+    const sfmData::Landmarks emptyLandmarks;
+    const sfmData::Landmarks& landmarks = saveStructure ? sfmData.getLandmarks() : emptyLandmarks;
+
+    std::uint64_t observationCount = 0;
+    if (saveObservations)
+    {
+        for (const auto& landmarkPair : landmarks)
+            observationCount += landmarkPair.second.getObservations().size();
+    }
+
+    SfMBHeader header;
+    std::memcpy(header.magic, sfmbMagic, sizeof(sfmbMagic));
+    header.version = sfmbVersion;
+    header.byteOrder = sfmbByteOrder;
+    header.flags = (saveObservations ? HAS_OBSERVATIONS : 0) | (saveFeatures ? HAS_FEATURES : 0);
+    header.columnCount = SfMBFile::COLUMN_COUNT;
+    header.jsonOffset = alignOffset(sizeof(SfMBHeader));
+    header.jsonSize = json.size();
+    header.landmarkCount = landmarks.size();
+    header.observationCount = observationCount;
+
+    std::uint64_t offset = header.jsonOffset + header.jsonSize;
+    for (int c = 0; c < SfMBFile::COLUMN_COUNT; ++c)
+    {
+        offset = alignOffset(offset);
+        header.columnOffsets[c] = offset;
+        offset += columnSize(static_cast<SfMBFile::EColumn>(c), header.landmarkCount, header.observationCount, header.flags);
+    }
+
+    // write to a temporary file first: the destination may still be memory-mapped by a reader
+    const fs::path filepath(filename);
+    const std::string tmpPath =
+      (filepath.parent_path() / filepath.stem()).string() + "." + utils::generateUniqueFilename() + filepath.extension().string();
+
+    std::ofstream stream(tmpPath, std::ios::binary);
+    if (!stream.is_open())
+    {
+        ALICEVISION_LOG_ERROR("Unable to open the SfMB file: " << tmpPath);
+        return false;
+    }
+
+    stream.write(reinterpret_cast<const char*>(&header), sizeof(SfMBHeader));
+    padTo(stream, header.jsonOffset);
+    stream.write(json.data(), json.size());
+
+    // columns are built and written one at a time to limit the memory overhead
+    {
+        std::vector<IndexT> ids;
+        ids.reserve(landmarks.size());
+        for (const auto& landmarkPair : landmarks)
+            ids.push_back(landmarkPair.first);
+        writeColumn(stream, header.columnOffsets[SfMBFile::LANDMARK_IDS], ids);
+    }
+    {
+        std::vector<double> positions;
+        positions.reserve(3 * landmarks.size());
+        for (const auto& landmarkPair : landmarks)
+            positions.insert(positions.end(), landmarkPair.second.X.data(), landmarkPair.second.X.data() + 3);
+        writeColumn(stream, header.columnOffsets[SfMBFile::POSITIONS], positions);
+    }
+    {
+        std::vector<unsigned char> colors;
+        colors.reserve(3 * landmarks.size());
+        for (const auto& landmarkPair : landmarks)
+            colors.insert(colors.end(), landmarkPair.second.rgb.data(), landmarkPair.second.rgb.data() + 3);
+        writeColumn(stream, header.columnOffsets[SfMBFile::COLORS], colors);
+    }
+    {
+        std::vector<unsigned char> descTypes;
+        descTypes.reserve(landmarks.size());
+        for (const auto& landmarkPair : landmarks)
+            descTypes.push_back(static_cast<unsigned char>(landmarkPair.second.descType));
+        writeColumn(stream, header.columnOffsets[SfMBFile::DESC_TYPES], descTypes);
+    }
+
+    if (saveObservations)
+    {
+        {
+            std::vector<std::uint64_t> offsets;
+            offsets.reserve(landmarks.size() + 1);
+            offsets.push_back(0);
+            for (const auto& landmarkPair : landmarks)
+                offsets.push_back(offsets.back() + landmarkPair.second.getObservations().size());
+            writeColumn(stream, header.columnOffsets[SfMBFile::OBSERVATION_OFFSETS], offsets);
+        }
+        {
+            std::vector<IndexT> viewIds;
+            viewIds.reserve(observationCount);
+            for (const auto& landmarkPair : landmarks)
+                for (const auto& observationPair : landmarkPair.second.getObservations())
+                    viewIds.push_back(observationPair.first);
+            writeColumn(stream, header.columnOffsets[SfMBFile::OBSERVATION_VIEW_IDS], viewIds);
+        }
+    }
+
+    if (saveFeatures)
+    {
+        {
+            std::vector<IndexT> featureIds;
+            featureIds.reserve(observationCount);
+            for (const auto& landmarkPair : landmarks)
+                for (const auto& observationPair : landmarkPair.second.getObservations())
+                    featureIds.push_back(observationPair.second.getFeatureId());
+            writeColumn(stream, header.columnOffsets[SfMBFile::OBSERVATION_FEATURE_IDS], featureIds);
+        }
+        {
+            std::vector<double> coordinates;
+            coordinates.reserve(2 * observationCount);
+            for (const auto& landmarkPair : landmarks)
+                for (const auto& observationPair : landmarkPair.second.getObservations())
+                    coordinates.insert(coordinates.end(), {observationPair.second.getX(), observationPair.second.getY()});
+            writeColumn(stream, header.columnOffsets[SfMBFile::OBSERVATION_COORDINATES], coordinates);
+        }
+        {
+            std::vector<double> scales;
+            scales.reserve(observationCount);
+            for (const auto& landmarkPair : landmarks)
+                for (const auto& observationPair : landmarkPair.second.getObservations())
+                    scales.push_back(observationPair.second.getScale());
+            writeColumn(stream, header.columnOffsets[SfMBFile::OBSERVATION_SCALES], scales);
+        }
+    }
+
+    // the file always spans up to the end of the last column, even if it is empty
+    padTo(stream, offset);
+    stream.close();
+
+    if (!stream.good())
+    {
+        ALICEVISION_LOG_ERROR("Failed to write the SfMB file: " << filename);
+        std::error_code ec;
+        fs::remove(tmpPath, ec);
+        return false;
+    }
+
+    // rename temporary file
+    fs::rename(tmpPath, filepath);
+    return true;
+}
+
+bool loadSFMB(sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag)
+{
+    // load flags
+    const bool loadStructure = (partFlag & STRUCTURE) == STRUCTURE;
+    const bool loadFeatures = (partFlag & OBSERVATIONS_WITH_FEATURES) == OBSERVATIONS_WITH_FEATURES;
+    const bool loadObservations = loadFeatures || ((partFlag & OBSERVATIONS) == OBSERVATIONS);
+
+    std::unique_ptr<SfMBFile> file;
+    try
+    {
+        file = std::make_unique<SfMBFile>(filename);
+    }
+    catch (const std::exception& e)
+    {
+        ALICEVISION_LOG_ERROR(e.what());
+        return false;
+    }
+
+    // the JSON document is read in place from the mapped file
+    const std::string_view json = file->getJSON();
+    boost::iostreams::stream<boost::iostreams::array_source> jsonStream(json.data(), json.size());
+    if (!loadJSON(sfmData, jsonStream, ESfMData(partFlag & ~(STRUCTURE | OBSERVATIONS | OBSERVATIONS_WITH_FEATURES))))
+    {
+        ALICEVISION_LOG_ERROR("Invalid JSON document in the SfMB file: " << filename);
+        return false;
+    }
+
+    // the structure is copied out of the mapped columns, so both coexist until the mapping is released
+    if (loadStructure)
+        file->getLandmarks(sfmData.getLandmarks(), loadObservations, loadFeatures);
+
+    file.reset();
+    return true;
+}
+
+}  // namespace sfmDataIO
+}  // namespace aliceVision
@@ -0,0 +1,168 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/sfmDataIO/sfmDataIO.hpp>
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/types.hpp>
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <string_view>
+
+namespace aliceVision {
+namespace sfmDataIO {
+
+/**
+ * @brief Read-only access to a binary SfMData file (.sfmb), memory-mapped from the disk.
+ *
+ * A .sfmb file contains:
+ * - the views, intrinsics, poses, rigs and ancestors of the scene, stored as an embedded JSON document,
+ * - the structure, stored as contiguous typed columns that are used in place without any parsing.
+ *
+ * Landmark columns (one value per landmark):
+ * - ids (IndexT), positions (3 x double), colors (3 x uint8), describer types (uint8).
+ *
+ * Observation columns (one value per observation), sorted by landmark:
+ * - view ids (IndexT), feature ids (IndexT), coordinates (2 x double), scales (double).
+ * The observations of the i-th landmark are stored in the range [offsets(i), offsets(i + 1)).
+ *
+ * The columns remain valid as long as the SfMBFile object, or a copy of it, is alive.
+ */
+class SfMBFile
+{
+  public:
+    /// Column of indexes
+    using IndexColumn = Eigen::Map<const Eigen::Matrix<IndexT, Eigen::Dynamic, 1>>;
+    /// Column of observation offsets
+    using OffsetColumn = Eigen::Map<const Eigen::Matrix<std::uint64_t, Eigen::Dynamic, 1>>;
+    /// Column of describer types (feature::EImageDescriberType values)
+    using DescTypeColumn = Eigen::Map<const Eigen::Matrix<unsigned char, Eigen::Dynamic, 1>>;
+    /// Column of RGB colors
+    using ColorColumn = Eigen::Map<const Eigen::Matrix<unsigned char, 3, Eigen::Dynamic>>;
+
+    /**
+     * @brief Map a .sfmb file in memory.
+     * @note Throws if the file cannot be opened or is not a valid .sfmb file.
+     * @param[in] filename The filename
+     */
+    explicit SfMBFile(const std::string& filename);
+
+    /**
+     * @return the JSON document describing everything but the structure
+     */
+    std::string_view getJSON() const;
+
+    std::size_t getLandmarkCount() const { return _landmarkCount; }
+
+    std::size_t getObservationCount() const { return _observationCount; }
+
+    /**
+     * @return true if the observations of the landmarks are stored in the file
+     */
+    bool hasObservations() const;
+
+    /**
+     * @return true if the feature ids, coordinates and scales of the observations are stored in the file
+     */
+    bool hasFeatures() const;
+
+    IndexColumn getLandmarkIds() const;
+
+    Eigen::Map<const Mat3X> getPositions() const;
+
+    ColorColumn getColors() const;
+
+    DescTypeColumn getDescTypes() const;
+
+    /**
+     * @return the offsets of the observations of each landmark (landmark count + 1 values, empty without observations)
+     */
+    OffsetColumn getObservationOffsets() const;
+
+    IndexColumn getObservationViewIds() const;
+
+    IndexColumn getObservationFeatureIds() const;
+
+    Eigen::Map<const Mat2X> getObservationCoordinates() const;
+
+    Eigen::Map<const Vec> getObservationScales() const;
+
+    /**
+     * @brief Fill SfMData landmarks from the mapped columns.
+     * @param[out] landmarks The output landmarks
+     * @param[in] loadObservations Load landmark observations
+     * @param[in] loadFeatures Load landmark observations features
+     */
+    void getLandmarks(sfmData::Landmarks& landmarks, bool loadObservations = true, bool loadFeatures = true) const;
+
+    /**
+     * @brief Get a pointer to the beginning of the mapped file.
+     *        Holding a copy of this pointer keeps the file mapped (used to share the columns without copying them).
+     */
+    const std::shared_ptr<const char>& getData() const { return _data; }
+
+    /// Columns stored in the file, in order
+    enum EColumn
+    {
+        LANDMARK_IDS = 0,
+        POSITIONS,
+        COLORS,
+        DESC_TYPES,
+        OBSERVATION_OFFSETS,
+        OBSERVATION_VIEW_IDS,
+        OBSERVATION_FEATURE_IDS,
+        OBSERVATION_COORDINATES,
+        OBSERVATION_SCALES,
+        COLUMN_COUNT
+    };
+
+  private:
+    template<typename T>
+    const T* column(EColumn column) const
+    {
+        return reinterpret_cast<const T*>(_data.get() + _columnOffsets[column]);
+    }
+
+    std::shared_ptr<const char> _data;
+    std::size_t _fileSize = 0;
+    std::uint32_t _flags = 0;
+    std::uint64_t _jsonOffset = 0;
+    std::uint64_t _jsonSize = 0;
+    std::size_t _landmarkCount = 0;
+    std::size_t _observationCount = 0;
+    std::array<std::uint64_t, COLUMN_COUNT> _columnOffsets;
+};
+
+/**
+ * @brief Save an SfMData in a binary .sfmb file.
+ *        The file is written to a temporary path and renamed, so an existing file can be overwritten while mapped.
+ * @see SfMBFile
+ * @param[in] sfmData The input SfMData
+ * @param[in] filename The filename
+ * @param[in] partFlag The ESfMData save flag
+ * @return true if completed
+ */
+bool saveSFMB(const sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag);
+
+/**
+ * @brief Load a binary .sfmb SfMData file.
+ *        The file is memory-mapped: the structure is read from its columns without any parsing.
+ * @note The landmarks are copied out of the mapped columns, so the peak memory is the mapped file plus the loaded
+ *       structure. The mapping is released before returning; use SfMBFile directly to access the columns without copy.
+ * @param[out] sfmData The output SfMData
+ * @param[in] filename The filename
+ * @param[in] partFlag The ESfMData load flag
+ * @return true if completed
+ */
+bool loadSFMB(sfmData::SfMData& sfmData, const std::string& filename, ESfMData partFlag);
+
+}  // namespace sfmDataIO
+}  // namespace aliceVision
@@ -0,0 +1,85 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+
+%{
+#include <aliceVision/sfmDataIO/sfmbIO.hpp>
+
+namespace aliceVision {
+namespace numpy {
+
+/**
+ * @brief Expose a column of a memory-mapped file as a read-only NumPy array, without copying it.
+ *        The array holds a reference on the mapping, which stays valid as long as the array is alive.
+ */
+template<typename MapT>
+PyObject* mappedToPython(const MapT& column, const std::shared_ptr<const char>& owner)
+{
+    using Scalar = typename MapT::Scalar;
+
+    auto* keepAlive = new std::shared_ptr<const char>(owner);
+    PyObject* capsule = PyCapsule_New(keepAlive, nullptr, [](PyObject* c) {
+        delete static_cast<std::shared_ptr<const char>*>(PyCapsule_GetPointer(c, nullptr));
+    });
+    if (capsule == nullptr)
+    {
+        delete keepAlive;
+        return nullptr;
+    }
+
+    const int ndim = MapT::ColsAtCompileTime == 1 ? 1 : 2;
+    npy_intp dims[2] = {column.rows(), column.cols()};
+    npy_intp strides[2] = {static_cast<npy_intp>(sizeof(Scalar)), static_cast<npy_intp>(column.rows() * sizeof(Scalar))};
+
+    // no NPY_ARRAY_WRITEABLE flag: the file is mapped in read-only mode
+    PyObject* array = PyArray_New(&PyArray_Type, ndim, dims, NumPyType<Scalar>::value, strides,
+                                  const_cast<Scalar*>(column.data()), 0, NPY_ARRAY_FARRAY_RO, nullptr);
+    if (array == nullptr)
+    {
+        Py_DECREF(capsule);
+        return nullptr;
+    }
+
+    // Steals the reference to the capsule
+    if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), capsule) != 0)
+    {
+        Py_DECREF(array);
+        return nullptr;
+    }
+
+    return array;
+}
+
+}  // namespace numpy
+}  // namespace aliceVision
+%}
+
+// Columns are returned as read-only NumPy arrays sharing the memory of the mapped file.
+// The C++ getters return Eigen maps, which SWIG cannot hold by value: they are replaced by extensions with the same name.
+%define %sfmb_column(NAME)
+%ignore aliceVision::sfmDataIO::SfMBFile::NAME;
+%rename(NAME) aliceVision::sfmDataIO::SfMBFile::NAME ## Array;
+%extend aliceVision::sfmDataIO::SfMBFile {
+    PyObject* NAME ## Array() const { return aliceVision::numpy::mappedToPython($self->NAME(), $self->getData()); }
+}
+%enddef
+
+%sfmb_column(getLandmarkIds)
+%sfmb_column(getPositions)
+%sfmb_column(getColors)
+%sfmb_column(getDescTypes)
+%sfmb_column(getObservationOffsets)
+%sfmb_column(getObservationViewIds)
+%sfmb_column(getObservationFeatureIds)
+%sfmb_column(getObservationCoordinates)
+%sfmb_column(getObservationScales)
+
+%ignore aliceVision::sfmDataIO::SfMBFile::getJSON;
+%ignore aliceVision::sfmDataIO::SfMBFile::getLandmarks;
+%ignore aliceVision::sfmDataIO::SfMBFile::getData;
+
+%include <aliceVision/sfmDataIO/sfmbIO.hpp>
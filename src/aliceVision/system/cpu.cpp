@@ -171,3 +171,56 @@ int get_total_cpus(void) { return 1; }
 }  // namespace aliceVision
 
 #endif /* GET_TOTAL_CPUS_DEFINED */
+
+/* cpu_supports_*() x86 instruction sets detection */
+#if defined(_MSC_VER) && (defined(_M_X64) || defined(_M_IX86))
+    #include <intrin.h>
+namespace aliceVision {
+namespace system {
+
+bool cpu_supports_popcnt(void)
+{
+    int info[4];
+    __cpuid(info, 1);
+    return (info[2] & (1 << 23)) != 0;
+}
+
+bool cpu_supports_avx2(void)
+{
+    int info[4];
+    __cpuid(info, 0);
+    if (info[0] < 7)
+        return false;
+
+    // AVX registers must be saved by the OS
+    __cpuid(info, 1);
+    const bool osxsave = (info[2] & (1 << 27)) != 0;
+    const bool avx = (info[2] & (1 << 28)) != 0;
+    if (!osxsave || !avx || (_xgetbv(0) & 0x6) != 0x6)
+        return false;
+
+    __cpuidex(info, 7, 0);
+    return (info[1] & (1 << 5)) != 0;
+}
+}  // namespace system
+}  // namespace aliceVision
+#elif (defined(__GNUC__) || defined(__clang__)) && (defined(__x86_64__) || defined(__i386__))
+namespace aliceVision {
+namespace system {
+
+// __builtin_cpu_supports also checks that the OS saves the AVX registers
+bool cpu_supports_popcnt(void) { return __builtin_cpu_supports("popcnt"); }
+
+bool cpu_supports_avx2(void) { return __builtin_cpu_supports("avx2"); }
+}  // namespace system
+}  // namespace aliceVision
+#else
+namespace aliceVision {
+namespace system {
+
+bool cpu_supports_popcnt(void) { return false; }
+
+bool cpu_supports_avx2(void) { return false; }
+}  // namespace system
+}  // namespace aliceVision
+#endif
@@ -22,5 +22,18 @@ int cpu_clock_by_os();
  */
 int get_total_cpus();
 
+/**
+ * @brief Returns true if the CPU and the OS support the POPCNT instruction.
+ */
+bool cpu_supports_popcnt();
+
+/**
+ * @brief Returns true if the CPU and the OS support the AVX2 instructions.
+ *
+ * Used to dispatch the kernels compiled for AVX2 at runtime,
+ * so that the binaries still run on CPUs without AVX2.
+ */
+bool cpu_supports_avx2();
+
 }  // namespace system
 }  // namespace aliceVision
@@ -0,0 +1,172 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "CompactTracks.hpp"
+
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+namespace aliceVision {
+namespace track {
+
+CompactTracks::CompactTracks(const TracksMap& tracks)
+{
+    std::size_t observationCount = 0;
+    for (const auto& track : tracks)
+        observationCount += track.second.featPerView.size();
+
+    _trackIds.reserve(tracks.size());
+    _descTypes.reserve(tracks.size());
+    _offsets.reserve(tracks.size() + 1);
+    _observations.reserve(observationCount);
+
+    // TracksMap and the observations of each track are already sorted
+    for (const auto& track : tracks)
+    {
+        _trackIds.push_back(track.first);
+        _descTypes.push_back(track.second.descType);
+        for (const auto& feat : track.second.featPerView)
+            _observations.push_back({static_cast<IndexT>(feat.first), static_cast<IndexT>(feat.second.featureId)});
+        _offsets.push_back(_observations.size());
+    }
+
+    buildViewIndex();
+}
+
+CompactTracks::CompactTracks(std::vector<std::size_t> trackIds,
+                             std::vector<feature::EImageDescriberType> descTypes,
+                             std::vector<std::size_t> offsets,
+                             std::vector<Observation> observations)
+  : _trackIds(std::move(trackIds)),
+    _descTypes(std::move(descTypes)),
+    _offsets(std::move(offsets)),
+    _observations(std::move(observations))
+{
+    if (_descTypes.size() != _trackIds.size() || _offsets.size() != _trackIds.size() + 1 || _offsets.front() != 0 ||
+        _offsets.back() != _observations.size())
+        throw std::invalid_argument("Inconsistent sizes of the track arrays.");
+
+    for (std::size_t i = 0; i < _trackIds.size(); ++i)
+    {
+        if (i > 0 && _trackIds[i] <= _trackIds[i - 1])
+            throw std::invalid_argument("Track ids must be strictly increasing (track id " + std::to_string(_trackIds[i]) + ").");
+        if (_offsets[i + 1] < _offsets[i])
+            throw std::invalid_argument("Track offsets must be increasing (track id " + std::to_string(_trackIds[i]) + ").");
+
+        for (std::size_t o = _offsets[i] + 1; o < _offsets[i + 1]; ++o)
+        {
+            if (_observations[o].viewId <= _observations[o - 1].viewId)
+                throw std::invalid_argument("Observations must be sorted by strictly increasing view id (track id " + std::to_string(_trackIds[i]) +
+                                            ").");
+        }
+    }
+
+    buildViewIndex();
+}
+
+void CompactTracks::buildViewIndex()
+{
+    // track indexes are stored on 32 bits in the index of the tracks per view
+    if (_trackIds.size() >= UndefinedIndexT)
+        throw std::invalid_argument("Too many tracks: " + std::to_string(_trackIds.size()) + ".");
+
+    _viewIds.resize(_observations.size());
+    std::transform(_observations.begin(), _observations.end(), _viewIds.begin(), [](const Observation& obs) { return obs.viewId; });
+    std::sort(_viewIds.begin(), _viewIds.end());
+    _viewIds.erase(std::unique(_viewIds.begin(), _viewIds.end()), _viewIds.end());
+    _viewIds.shrink_to_fit();
+
+    const auto viewIndex = [this](IndexT viewId) { return std::lower_bound(_viewIds.begin(), _viewIds.end(), viewId) - _viewIds.begin(); };
+
+    // count the observations of each view
+    _viewOffsets.assign(_viewIds.size() + 1, 0);
+    for (const Observation& obs : _observations)
+        ++_viewOffsets[viewIndex(obs.viewId) + 1];
+    for (std::size_t v = 0; v < _viewIds.size(); ++v)
+        _viewOffsets[v + 1] += _viewOffsets[v];
+
+    // tracks are visited in order, so the tracks of each view are sorted
+    std::vector<std::size_t> viewPositions(_viewOffsets.begin(), _viewOffsets.end() - 1);
+    _viewTracks.resize(_observations.size());
+    for (std::size_t i = 0; i < _trackIds.size(); ++i)
+    {
+        for (const Observation& obs : getObservations(i))
+            _viewTracks[viewPositions[viewIndex(obs.viewId)]++] = static_cast<IndexT>(i);
+    }
+}
+
+std::size_t CompactTracks::findTrack(std::size_t trackId) const
+{
+    const auto it = std::lower_bound(_trackIds.begin(), _trackIds.end(), trackId);
+    if (it == _trackIds.end() || *it != trackId)
+        return npos;
+    return it - _trackIds.begin();
+}
+
+IndexT CompactTracks::getFeatureId(std::size_t trackIndex, IndexT viewId) const
+{
+    const Range<Observation> observations = getObservations(trackIndex);
+    const Observation* it =
+      std::lower_bound(observations.begin(), observations.end(), viewId, [](const Observation& obs, IndexT id) { return obs.viewId < id; });
+    if (it == observations.end() || it->viewId != viewId)
+        return UndefinedIndexT;
+    return it->featureId;
+}
+
+CompactTracks::Range<IndexT> CompactTracks::getTracksInView(IndexT viewId) const
+{
+    const auto it = std::lower_bound(_viewIds.begin(), _viewIds.end(), viewId);
+    if (it == _viewIds.end() || *it != viewId)
+        return Range<IndexT>(nullptr, nullptr);
+
+    const std::size_t v = it - _viewIds.begin();
+    const IndexT* data = _viewTracks.data();
+    return Range<IndexT>(data + _viewOffsets[v], data + _viewOffsets[v + 1]);
+}
+
+void CompactTracks::exportToSTL(TracksMap& tracks) const
+{
+    tracks.clear();
+    tracks.reserve(size());
+
+    for (std::size_t i = 0; i < size(); ++i)
+    {
+        Track& track = tracks.emplace_hint(tracks.end(), _trackIds[i], Track())->second;
+        track.descType = _descTypes[i];
+
+        const Range<Observation> observations = getObservations(i);
+        track.featPerView.reserve(observations.size());
+        for (const Observation& obs : observations)
+            track.featPerView.emplace_hint(track.featPerView.end(), obs.viewId, TrackItem())->second.featureId = obs.featureId;
+    }
+}
+
+std::size_t CompactTracks::memorySize() const
+{
+    return _trackIds.capacity() * sizeof(std::size_t) + _descTypes.capacity() * sizeof(feature::EImageDescriberType) +
+           _offsets.capacity() * sizeof(std::size_t) + _observations.capacity() * sizeof(Observation) + _viewIds.capacity() * sizeof(IndexT) +
+           _viewOffsets.capacity() * sizeof(std::size_t) + _viewTracks.capacity() * sizeof(IndexT);
+}
+
+std::size_t memorySize(const TracksMap& tracks)
+{
+    std::size_t size = tracks.capacity() * sizeof(TracksMap::value_type);
+    for (const auto& track : tracks)
+        size += track.second.featPerView.capacity() * sizeof(Track::TrackInfoPerView::value_type);
+    return size;
+}
+
+std::size_t memorySize(const TracksPerView& tracksPerView)
+{
+    std::size_t size = tracksPerView.capacity() * sizeof(TracksPerView::value_type);
+    for (const auto& viewTracks : tracksPerView)
+        size += viewTracks.second.capacity() * sizeof(std::size_t);
+    return size;
+}
+
+}  // namespace track
+}  // namespace aliceVision
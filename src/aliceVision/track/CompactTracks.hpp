@@ -0,0 +1,181 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/track/Track.hpp>
+#include <aliceVision/types.hpp>
+
+#include <cstddef>
+#include <limits>
+#include <vector>
+
+namespace aliceVision {
+namespace track {
+
+/**
+ * @brief Compact storage of tracks, as an alternative to TracksMap for large scenes.
+ *
+ * The observations of all the tracks are stored in a single array in a CSR layout:
+ * the observations of the i-th track are observations()[offsets()[i]] to observations()[offsets()[i + 1]],
+ * sorted by view id. Tracks are sorted by track id.
+ * An index of the tracks visible in each view is built with the tracks, so it replaces both TracksMap and TracksPerView.
+ *
+ * Only the feature ids are stored: the coordinates and scales of the features are not kept.
+ */
+class CompactTracks
+{
+  public:
+    /// Observation of a track: a feature in a view
+    struct Observation
+    {
+        IndexT viewId;
+        IndexT featureId;
+    };
+
+    /// Contiguous sequence of elements stored in the tracks
+    template<typename T>
+    class Range
+    {
+      public:
+        Range(const T* first, const T* last)
+          : _first(first),
+            _last(last)
+        {}
+
+        const T* begin() const { return _first; }
+        const T* end() const { return _last; }
+        std::size_t size() const { return _last - _first; }
+        bool empty() const { return _first == _last; }
+        const T& operator[](std::size_t i) const { return _first[i]; }
+
+      private:
+        const T* _first;
+        const T* _last;
+    };
+
+    /// Returned when a track or a view is not found
+    static constexpr std::size_t npos = std::numeric_limits<std::size_t>::max();
+
+    CompactTracks() = default;
+
+    /**
+     * @brief Convert tracks stored in a TracksMap.
+     * @param[in] tracks the tracks
+     */
+    explicit CompactTracks(const TracksMap& tracks);
+
+    /**
+     * @brief Create the tracks from their CSR arrays.
+     * @note Throws std::invalid_argument if the arrays are inconsistent, if the track ids are not strictly increasing
+     *       or if the observations of a track are not sorted by strictly increasing view id.
+     * @param[in] trackIds the id of each track
+     * @param[in] descTypes the descriptor type of each track
+     * @param[in] offsets the index of the first observation of each track, followed by the number of observations
+     * @param[in] observations the observations of all the tracks
+     */
+    CompactTracks(std::vector<std::size_t> trackIds,
+                  std::vector<feature::EImageDescriberType> descTypes,
+                  std::vector<std::size_t> offsets,
+                  std::vector<Observation> observations);
+
+    /**
+     * @brief Number of tracks
+     */
+    std::size_t size() const { return _trackIds.size(); }
+
+    bool empty() const { return _trackIds.empty(); }
+
+    /**
+     * @brief Total number of observations of all the tracks
+     */
+    std::size_t nbObservations() const { return _observations.size(); }
+
+    const std::vector<std::size_t>& trackIds() const { return _trackIds; }
+    const std::vector<feature::EImageDescriberType>& descTypes() const { return _descTypes; }
+    const std::vector<std::size_t>& offsets() const { return _offsets; }
+    const std::vector<Observation>& observations() const { return _observations; }
+
+    std::size_t getTrackId(std::size_t trackIndex) const { return _trackIds[trackIndex]; }
+    feature::EImageDescriberType getDescType(std::size_t trackIndex) const { return _descTypes[trackIndex]; }
+
+    /**
+     * @brief Get the observations of a track, sorted by view id.
+     * @param[in] trackIndex the index of the track (not its id)
+     */
+    Range<Observation> getObservations(std::size_t trackIndex) const
+    {
+        const Observation* data = _observations.data();
+        return Range<Observation>(data + _offsets[trackIndex], data + _offsets[trackIndex + 1]);
+    }
+
+    /**
+     * @brief Find the index of a track from its id.
+     * @return the index of the track, npos if there is no track with this id
+     */
+    std::size_t findTrack(std::size_t trackId) const;
+
+    /**
+     * @brief Get the feature id of a track in a view.
+     * @param[in] trackIndex the index of the track (not its id)
+     * @param[in] viewId the view id
+     * @return the feature id, UndefinedIndexT if the track is not visible in the view
+     */
+    IndexT getFeatureId(std::size_t trackIndex, IndexT viewId) const;
+
+    /**
+     * @brief Ids of the views with at least one observation, sorted by view id.
+     */
+    const std::vector<IndexT>& getViewIds() const { return _viewIds; }
+
+    /**
+     * @brief Get the indexes (not the ids) of the tracks visible in a view, sorted by increasing index.
+     * @param[in] viewId the view id
+     * @return an empty range if no track is visible in the view
+     */
+    Range<IndexT> getTracksInView(IndexT viewId) const;
+
+    /**
+     * @brief Convert the tracks into a TracksMap.
+     * @param[out] tracks the tracks
+     */
+    void exportToSTL(TracksMap& tracks) const;
+
+    /**
+     * @brief Number of bytes allocated to store the tracks and the index of the tracks per view.
+     */
+    std::size_t memorySize() const;
+
+  private:
+    /// Check the CSR arrays and build the index of the tracks per view
+    void buildViewIndex();
+
+    std::vector<std::size_t> _trackIds;
+    std::vector<feature::EImageDescriberType> _descTypes;
+    std::vector<std::size_t> _offsets{0};
+    std::vector<Observation> _observations;
+
+    /// tracks per view in a CSR layout: the tracks visible in the i-th view are _viewTracks[_viewOffsets[i]] to
+    /// _viewTracks[_viewOffsets[i + 1]]
+    std::vector<IndexT> _viewIds;
+    std::vector<std::size_t> _viewOffsets{0};
+    std::vector<IndexT> _viewTracks;
+};
+
+/**
+ * @brief Approximate number of bytes allocated to store tracks in a TracksMap.
+ * @param[in] tracks the tracks
+ */
+std::size_t memorySize(const TracksMap& tracks);
+
+/**
+ * @brief Approximate number of bytes allocated to store the tracks visible in each view.
+ * @param[in] tracksPerView the tracks per view
+ */
+std::size_t memorySize(const TracksPerView& tracksPerView);
+
+}  // namespace track
+}  // namespace aliceVision
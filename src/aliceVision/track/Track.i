@@ -0,0 +1,20 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%module (module="pyalicevision") track
+
+%include <aliceVision/global.i>
+
+// PairwiseMatches are created from the matching module
+%import <aliceVision/matching/Matching.i>
+
+%include <aliceVision/track/TrackColumns.i>
+%include <aliceVision/track/TracksBuilder.i>
+%include <aliceVision/track/TracksHandler.i>
+
+%{
+using namespace aliceVision;
+%}
@@ -0,0 +1,79 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include "TrackColumns.hpp"
+
+namespace aliceVision {
+namespace track {
+
+TrackColumns getTrackColumns(const TracksMap& tracks)
+{
+    const Eigen::Index trackCount = tracks.size();
+
+    TrackColumns columns;
+    columns.trackIds.resize(trackCount);
+    columns.descTypes.resize(trackCount);
+    columns.offsets.resize(trackCount + 1);
+
+    // tracks are stored in a flat_map: the observations of the i-th track follow the ones of the previous tracks
+    columns.offsets(0) = 0;
+    for (Eigen::Index i = 0; i < trackCount; ++i)
+        columns.offsets(i + 1) = columns.offsets(i) + (tracks.begin() + i)->second.featPerView.size();
+
+    const Eigen::Index observationCount = columns.offsets(trackCount);
+    columns.viewIds.resize(observationCount);
+    columns.featureIds.resize(observationCount);
+
+#pragma omp parallel for
+    for (Eigen::Index i = 0; i < trackCount; ++i)
+    {
+        const auto& trackIt = *(tracks.begin() + i);
+
+        columns.trackIds(i) = trackIt.first;
+        columns.descTypes(i) = static_cast<unsigned char>(trackIt.second.descType);
+
+        Eigen::Index o = columns.offsets(i);
+        for (const auto& featureIt : trackIt.second.featPerView)
+        {
+            columns.viewIds(o) = featureIt.first;
+            columns.featureIds(o) = featureIt.second.featureId;
+            ++o;
+        }
+    }
+
+    return columns;
+}
+
+TrackColumns getTrackColumns(const CompactTracks& tracks)
+{
+    const Eigen::Index trackCount = tracks.size();
+    const Eigen::Index observationCount = tracks.nbObservations();
+
+    TrackColumns columns;
+    columns.trackIds.resize(trackCount);
+    columns.descTypes.resize(trackCount);
+    columns.offsets.resize(trackCount + 1);
+    columns.viewIds.resize(observationCount);
+    columns.featureIds.resize(observationCount);
+
+    for (Eigen::Index i = 0; i < trackCount; ++i)
+    {
+        columns.trackIds(i) = tracks.getTrackId(i);
+        columns.descTypes(i) = static_cast<unsigned char>(tracks.getDescType(i));
+    }
+    for (Eigen::Index i = 0; i <= trackCount; ++i)
+        columns.offsets(i) = tracks.offsets()[i];
+    for (Eigen::Index o = 0; o < observationCount; ++o)
+    {
+        columns.viewIds(o) = tracks.observations()[o].viewId;
+        columns.featureIds(o) = tracks.observations()[o].featureId;
+    }
+
+    return columns;
+}
+
+}  // namespace track
+}  // namespace aliceVision
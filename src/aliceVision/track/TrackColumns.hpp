@@ -0,0 +1,55 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <aliceVision/track/Track.hpp>
+#include <aliceVision/track/CompactTracks.hpp>
+#include <aliceVision/numeric/numeric.hpp>
+#include <aliceVision/types.hpp>
+
+#include <cstdint>
+
+namespace aliceVision {
+namespace track {
+
+/**
+ * @brief Tracks stored as contiguous columns in a CSR layout, sorted by track id:
+ *        the observations of the i-th track are the rows offsets(i) to offsets(i + 1) of the observation columns,
+ *        sorted by view id.
+ */
+struct TrackColumns
+{
+    /// one row per track
+    Eigen::Matrix<std::uint64_t, Eigen::Dynamic, 1> trackIds;
+    /// feature::EImageDescriberType values, one row per track
+    Eigen::Matrix<unsigned char, Eigen::Dynamic, 1> descTypes;
+    /// one row per track, plus the total number of observations
+    Eigen::Matrix<std::uint64_t, Eigen::Dynamic, 1> offsets;
+    /// one row per observation
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> viewIds;
+    /// one row per observation
+    Eigen::Matrix<IndexT, Eigen::Dynamic, 1> featureIds;
+
+    std::size_t size() const { return trackIds.size(); }
+};
+
+/**
+ * @brief Export the tracks into columns.
+ * @param[in] tracks The tracks
+ * @return the track columns
+ */
+TrackColumns getTrackColumns(const TracksMap& tracks);
+
+/**
+ * @brief Export the tracks stored in the compact storage into columns.
+ * @param[in] tracks The tracks
+ * @return the track columns
+ */
+TrackColumns getTrackColumns(const CompactTracks& tracks);
+
+}  // namespace track
+}  // namespace aliceVision
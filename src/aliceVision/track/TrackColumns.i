@@ -0,0 +1,21 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+
+// Columns are exchanged as 1D NumPy arrays
+%eigen_typemaps(%arg(Eigen::Matrix<std::uint64_t, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<std::uint64_t, Eigen::Dynamic, 1>))
+%eigen_typemaps(%arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 1>))
+%eigen_typemaps(%arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 1>), %arg(Eigen::Matrix<IndexT, Eigen::Dynamic, 1>))
+
+// TracksMap is not wrapped: the columns are exported from the TracksBuilder and TracksHandler classes
+%ignore aliceVision::track::getTrackColumns;
+
+%include <aliceVision/track/TrackColumns.hpp>
+
+%{
+#include <aliceVision/track/TrackColumns.hpp>
+%}
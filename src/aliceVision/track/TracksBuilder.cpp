@@ -10,6 +10,9 @@
 #include <lemon/list_graph.h>
 #include <lemon/unionfind.h>
 
+#include <algorithm>
+#include <atomic>
+
 namespace aliceVision {
 namespace track {
 
@@ -38,12 +41,84 @@ struct TracksBuilderData
     const MapNodeToIndex& getReverseMap() const { return map_nodeToIndex; }
 };
 
+namespace {
+
+/**
+ * @brief Lock-free union-find on dense indexes.
+ *        A root is always linked under a smaller root, so the root of each set is its smallest index,
+ *        whatever the order of the unions.
+ */
+class ConcurrentUnionFind
+{
+  public:
+    explicit ConcurrentUnionFind(std::size_t size)
+      : _parents(size)
+    {
+#pragma omp parallel for
+        for (std::ptrdiff_t i = 0; i < static_cast<std::ptrdiff_t>(size); ++i)
+            _parents[i].store(i, std::memory_order_relaxed);
+    }
+
+    std::size_t find(std::size_t i)
+    {
+        while (true)
+        {
+            std::size_t parent = _parents[i].load(std::memory_order_acquire);
+            if (parent == i)
+                return i;
+
+            // path halving: only shortcuts a node to an ancestor, so it never breaks a concurrent union
+            const std::size_t grandParent = _parents[parent].load(std::memory_order_acquire);
+            if (grandParent != parent)
+                _parents[i].compare_exchange_weak(parent, grandParent, std::memory_order_release, std::memory_order_relaxed);
+            i = grandParent;
+        }
+    }
+
+    void unite(std::size_t a, std::size_t b)
+    {
+        while (true)
+        {
+            std::size_t rootA = find(a);
+            std::size_t rootB = find(b);
+            if (rootA == rootB)
+                return;
+            if (rootA < rootB)
+                std::swap(rootA, rootB);
+
+            // link the largest root under the smallest one, unless it stopped being a root in the meantime
+            if (_parents[rootA].compare_exchange_strong(rootA, rootB, std::memory_order_acq_rel, std::memory_order_acquire))
+                return;
+        }
+    }
+
+  private:
+    std::vector<std::atomic<std::size_t>> _parents;
+};
+
+/// Matches of an image pair for one type of descriptor
+struct PairMatches
+{
+    std::size_t viewIndexI;
+    std::size_t viewIndexJ;
+    feature::EImageDescriberType descType;
+    const IndMatches* matches;
+};
+
+}  // namespace
+
 TracksBuilder::TracksBuilder() { _d.reset(new TracksBuilderData()); }
 
 TracksBuilder::~TracksBuilder() = default;
 
-void TracksBuilder::build(const PairwiseMatches& pairwiseMatches)
+void TracksBuilder::build(const PairwiseMatches& pairwiseMatches, bool multithreaded)
 {
+    if (multithreaded)
+    {
+        buildMultithreaded(pairwiseMatches);
+        return;
+    }
+
     typedef std::set<IndexedFeaturePair> SetIndexedPair;
 
     // set of all features of all images: (imageIndex, featureIndex)
@@ -114,6 +189,113 @@ void TracksBuilder::build(const PairwiseMatches& pairwiseMatches)
     }
 }
 
+void TracksBuilder::buildMultithreaded(const PairwiseMatches& pairwiseMatches)
+{
+    // list the views and the matches of each image pair
+    std::vector<std::size_t> viewIds;
+    for (const auto& matchesPerDescIt : pairwiseMatches)
+    {
+        viewIds.push_back(matchesPerDescIt.first.first);
+        viewIds.push_back(matchesPerDescIt.first.second);
+    }
+    std::sort(viewIds.begin(), viewIds.end());
+    viewIds.erase(std::unique(viewIds.begin(), viewIds.end()), viewIds.end());
+
+    const auto getViewIndex = [&viewIds](std::size_t viewId) { return std::lower_bound(viewIds.begin(), viewIds.end(), viewId) - viewIds.begin(); };
+
+    std::vector<PairMatches> allPairMatches;
+    std::vector<std::vector<std::size_t>> pairMatchesPerView(viewIds.size());
+    for (const auto& matchesPerDescIt : pairwiseMatches)
+    {
+        const std::size_t viewIndexI = getViewIndex(matchesPerDescIt.first.first);
+        const std::size_t viewIndexJ = getViewIndex(matchesPerDescIt.first.second);
+
+        for (const auto& matchesIt : matchesPerDescIt.second)
+        {
+            pairMatchesPerView[viewIndexI].push_back(allPairMatches.size());
+            pairMatchesPerView[viewIndexJ].push_back(allPairMatches.size());
+            allPairMatches.push_back({viewIndexI, viewIndexJ, matchesIt.first, &matchesIt.second});
+        }
+    }
+
+    // sorted features of each view: nodes are numbered in the order of (viewId, descType, featureId), like in the sequential build
+    std::vector<std::vector<KeypointId>> featuresPerView(viewIds.size());
+
+#pragma omp parallel for schedule(dynamic)
+    for (std::ptrdiff_t v = 0; v < static_cast<std::ptrdiff_t>(viewIds.size()); ++v)
+    {
+        const std::size_t viewIndex = v;
+        std::vector<KeypointId>& features = featuresPerView[viewIndex];
+        for (const std::size_t p : pairMatchesPerView[viewIndex])
+        {
+            const PairMatches& pairMatches = allPairMatches[p];
+            for (const IndMatch& m : *pairMatches.matches)
+            {
+                if (pairMatches.viewIndexI == viewIndex)
+                    features.emplace_back(pairMatches.descType, m._i);
+                if (pairMatches.viewIndexJ == viewIndex)
+                    features.emplace_back(pairMatches.descType, m._j);
+            }
+        }
+        std::sort(features.begin(), features.end());
+        features.erase(std::unique(features.begin(), features.end(), [](const KeypointId& a, const KeypointId& b) { return !(a < b) && !(b < a); }),
+                       features.end());
+    }
+
+    std::vector<std::size_t> viewOffsets(viewIds.size() + 1, 0);
+    for (std::size_t v = 0; v < viewIds.size(); ++v)
+        viewOffsets[v + 1] = viewOffsets[v] + featuresPerView[v].size();
+
+    const auto getNodeIndex = [&](std::size_t viewIndex, const KeypointId& keypoint) {
+        const std::vector<KeypointId>& features = featuresPerView[viewIndex];
+        return viewOffsets[viewIndex] + (std::lower_bound(features.begin(), features.end(), keypoint) - features.begin());
+    };
+
+    // make the union according to the pair matches, in parallel
+    ConcurrentUnionFind unionFind(viewOffsets.back());
+
+#pragma omp parallel for schedule(dynamic)
+    for (std::ptrdiff_t p = 0; p < static_cast<std::ptrdiff_t>(allPairMatches.size()); ++p)
+    {
+        const PairMatches& pairMatches = allPairMatches[p];
+        for (const IndMatch& m : *pairMatches.matches)
+        {
+            unionFind.unite(getNodeIndex(pairMatches.viewIndexI, KeypointId(pairMatches.descType, m._i)),
+                            getNodeIndex(pairMatches.viewIndexJ, KeypointId(pairMatches.descType, m._j)));
+        }
+    }
+
+    // store the sets in the lemon structures, in an order that does not depend on the threads
+    std::vector<lemon::ListDigraph::Node> nodes;
+    nodes.reserve(viewOffsets.back());
+    _d->map_nodeToIndex.reserve(viewOffsets.back());
+
+    for (std::size_t v = 0; v < viewIds.size(); ++v)
+    {
+        for (const KeypointId& keypoint : featuresPerView[v])
+        {
+            const lemon::ListDigraph::Node node = _d->graph.addNode();
+            nodes.push_back(node);
+            _d->map_nodeToIndex.insert(std::make_pair(node, IndexedFeaturePair(viewIds[v], keypoint)));
+        }
+        // release the memory as soon as possible
+        std::vector<KeypointId>().swap(featuresPerView[v]);
+    }
+
+    _d->index.reset(new IndexMap(_d->graph));
+    _d->tracksUF.reset(new UnionFindObject(*_d->index));
+
+    for (const lemon::ListDigraph::Node& node : nodes)
+        _d->tracksUF->insert(node);
+
+    for (std::size_t i = 0; i < nodes.size(); ++i)
+    {
+        const std::size_t root = unionFind.find(i);
+        if (root != i)
+            _d->tracksUF->join(nodes[root], nodes[i]);
+    }
+}
+
 void TracksBuilder::filter(bool clearForks, std::size_t minTrackLength, bool multithreaded)
 {
     // remove bad tracks:
@@ -213,6 +395,51 @@ void TracksBuilder::exportToSTL(TracksMap& allTracks, const feature::FeaturesPer
     }
 }
 
+void TracksBuilder::exportToCompact(CompactTracks& allTracks) const
+{
+    std::vector<std::size_t> trackIds;
+    std::vector<feature::EImageDescriberType> descTypes;
+    std::vector<std::size_t> offsets(1, 0);
+    std::vector<CompactTracks::Observation> observations;
+    observations.reserve(_d->map_nodeToIndex.size());
+
+    std::size_t trackIndex = 0;
+    for (lemon::UnionFindEnum<IndexMap>::ClassIt cit(*_d->tracksUF); cit != INVALID; ++cit, ++trackIndex)
+    {
+        const std::size_t trackBegin = observations.size();
+        feature::EImageDescriberType descType = feature::EImageDescriberType::UNINITIALIZED;
+
+        for (lemon::UnionFindEnum<IndexMap>::ItemIt iit(*_d->tracksUF, cit); iit != INVALID; ++iit)
+        {
+            const IndexedFeaturePair& currentPair = _d->map_nodeToIndex.at(iit);
+            // all descType inside the track will be the same
+            descType = currentPair.second.descType;
+            observations.push_back({static_cast<IndexT>(currentPair.first), static_cast<IndexT>(currentPair.second.featIndex)});
+        }
+
+        // sort by view and keep the last feature of each view, like exportToSTL
+        const auto trackObservations = observations.begin() + trackBegin;
+        std::stable_sort(trackObservations, observations.end(), [](const CompactTracks::Observation& a, const CompactTracks::Observation& b) {
+            return a.viewId < b.viewId;
+        });
+        auto last = trackObservations;
+        for (auto it = trackObservations; it != observations.end(); ++it)
+        {
+            if (it != trackObservations && it->viewId == std::prev(last)->viewId)
+                *std::prev(last) = *it;
+            else
+                *last++ = *it;
+        }
+        observations.erase(last, observations.end());
+
+        trackIds.push_back(trackIndex);
+        descTypes.push_back(descType);
+        offsets.push_back(observations.size());
+    }
+
+    allTracks = CompactTracks(std::move(trackIds), std::move(descTypes), std::move(offsets), std::move(observations));
+}
+
 std::size_t TracksBuilder::nbTracks() const
 {
     std::size_t cpt = 0;
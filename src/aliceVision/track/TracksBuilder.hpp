@@ -7,6 +7,7 @@
 #pragma once
 
 #include <aliceVision/track/Track.hpp>
+#include <aliceVision/track/CompactTracks.hpp>
 #include <aliceVision/feature/FeaturesPerView.hpp>
 
 #include <memory>
@@ -51,9 +52,11 @@ class TracksBuilder
     /**
      * @brief Build tracks for a given series of pairWise matches
      * @param[in] pairwiseMatches PairWise matches
-     * @param[in] featuresPerView all features (used for matching) in pairwiseMatches
+     * @param[in] multithreaded merge the matches of all the image pairs in parallel with a concurrent union-find.
+     *            The tracks are the same as the sequential build and do not depend on the number of threads,
+     *            but they may be exported in a different order.
      */
-    void build(const PairwiseMatches& pairwiseMatches);
+    void build(const PairwiseMatches& pairwiseMatches, bool multithreaded = false);
 
     /**
      * @brief Remove bad tracks (too short or track with ids collision)
@@ -79,6 +82,13 @@ class TracksBuilder
      */
     void exportToSTL(TracksMap& allTracks, const feature::FeaturesPerView* featuresPerView = nullptr) const;
 
+    /**
+     * @brief Export tracks in the compact CSR storage, without going through a TracksMap.
+     *        Track ids and observations are the same as the ones of exportToSTL.
+     * @param[out] allTracks output tracks
+     */
+    void exportToCompact(CompactTracks& allTracks) const;
+
     /**
      * @brief Return the number of connected set in the UnionFind structure (tree forest)
      * @return number of connected set in the UnionFind structure
@@ -86,6 +96,9 @@ class TracksBuilder
     std::size_t nbTracks() const;
 
   private:
+    /// Build the tracks with a concurrent union-find
+    void buildMultithreaded(const PairwiseMatches& pairwiseMatches);
+
     std::unique_ptr<TracksBuilderData> _d;
 };
 
@@ -0,0 +1,46 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/track/TrackColumns.i>
+
+// Track.hpp makes the matching types visible in the track namespace
+namespace aliceVision {
+namespace track {
+typedef aliceVision::matching::PairwiseMatches PairwiseMatches;
+}
+}
+
+%ignore aliceVision::track::TracksBuilder::exportToStream;
+%ignore aliceVision::track::TracksBuilder::exportToSTL;
+%ignore aliceVision::track::TracksBuilder::exportToCompact;
+
+%{
+#include <aliceVision/track/TracksBuilder.hpp>
+%}
+
+%include <aliceVision/track/TracksBuilder.hpp>
+
+%extend aliceVision::track::TracksBuilder {
+    /**
+     * @brief Export the tracks into columns, sorted by track id.
+     */
+    aliceVision::track::TrackColumns getTrackColumns() const
+    {
+        aliceVision::track::CompactTracks tracks;
+        $self->exportToCompact(tracks);
+        return aliceVision::track::getTrackColumns(tracks);
+    }
+};
+
+%pythoncode %{
+def buildTracks(matches, clearForks=True, minTrackLength=2):
+    """ Build the tracks from PairwiseMatches and return them as TrackColumns. """
+    tracksBuilder = TracksBuilder()
+    tracksBuilder.build(matches)
+    tracksBuilder.filter(clearForks, minTrackLength)
+    return tracksBuilder.getTrackColumns()
+%}
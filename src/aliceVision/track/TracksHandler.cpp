@@ -15,7 +15,7 @@ namespace aliceVision {
 namespace track {
 
 
-bool TracksHandler::load(const std::string & pathJson, const std::set<IndexT> & viewIds)
+bool TracksHandler::load(const std::string & pathJson, const std::set<IndexT> & viewIds, bool compact)
 {
     std::ifstream tracksFile(pathJson);
     if(tracksFile.is_open() == false)
@@ -30,8 +30,18 @@ bool TracksHandler::load(const std::string & pathJson, const std::set<IndexT> &
     boost::json::value jv = boost::json::parse(buffer.str());
     _mapTracks = track::TracksMap(track::flat_map_value_to<track::Track>(jv));
 
-    // Compute tracks per view
     _mapTracksPerView.clear();
+    _compactTracks = track::CompactTracks();
+
+    if (compact)
+    {
+        // the compact storage holds its own index of the tracks per view
+        _compactTracks = track::CompactTracks(_mapTracks);
+        _mapTracks = track::TracksMap();
+        return true;
+    }
+
+    // Compute tracks per view
     for(const auto& viewId : viewIds)
     {
         // create an entry in the map
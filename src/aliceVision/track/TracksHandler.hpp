@@ -7,6 +7,7 @@
 #pragma once
 
 #include "Track.hpp"
+#include "CompactTracks.hpp"
 
 namespace aliceVision {
 namespace track {
@@ -14,7 +15,15 @@ namespace track {
 class TracksHandler
 {
 public:
-    bool load(const std::string & pathJson, const std::set<IndexT> & viewIds);
+    /**
+     * @brief Load the tracks from a json file.
+     * @param[in] pathJson the tracks file
+     * @param[in] viewIds the views to list in the tracks per view, even if they have no track
+     * @param[in] compact store the tracks only in the compact storage (getCompactTracks),
+     *            instead of the TracksMap and TracksPerView
+     * @return false if the file cannot be opened
+     */
+    bool load(const std::string & pathJson, const std::set<IndexT> & viewIds, bool compact = false);
 
     const track::TracksMap & getAllTracks() const
     {
@@ -26,9 +35,15 @@ public:
         return _mapTracksPerView;
     }
 
+    const track::CompactTracks & getCompactTracks() const
+    {
+        return _compactTracks;
+    }
+
 private:
     track::TracksPerView _mapTracksPerView;
     track::TracksMap _mapTracks;
+    track::CompactTracks _compactTracks;
 };
 
 }
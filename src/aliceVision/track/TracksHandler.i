@@ -0,0 +1,30 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/track/TrackColumns.i>
+
+%ignore aliceVision::track::TracksHandler::getAllTracks;
+%ignore aliceVision::track::TracksHandler::getTracksPerView;
+%ignore aliceVision::track::TracksHandler::getCompactTracks;
+
+%{
+#include <aliceVision/track/TracksHandler.hpp>
+%}
+
+%include <aliceVision/track/TracksHandler.hpp>
+
+%extend aliceVision::track::TracksHandler {
+    /**
+     * @brief Export the loaded tracks into columns, sorted by track id.
+     */
+    aliceVision::track::TrackColumns getTrackColumns() const
+    {
+        if (!$self->getCompactTracks().empty())
+            return aliceVision::track::getTrackColumns($self->getCompactTracks());
+        return aliceVision::track::getTrackColumns($self->getAllTracks());
+    }
+};
@@ -0,0 +1,315 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+#include <aliceVision/track/CompactTracks.hpp>
+#include <aliceVision/track/TracksBuilder.hpp>
+#include <aliceVision/track/tracksUtils.hpp>
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/system/Timer.hpp>
+
+#include <random>
+#include <vector>
+
+#define BOOST_TEST_MODULE CompactTracks
+
+#include <boost/test/unit_test.hpp>
+
+using namespace aliceVision;
+using namespace aliceVision::track;
+
+namespace {
+
+/**
+ * @brief Create random tracks, each one visible in a random subset of the views.
+ */
+TracksMap createRandomTracks(std::size_t nbTracks, std::size_t nbViews, std::size_t maxTrackLength, unsigned int seed)
+{
+    std::mt19937 generator(seed);
+    std::uniform_int_distribution<std::size_t> lengthDistribution(2, maxTrackLength);
+    std::uniform_int_distribution<std::size_t> viewDistribution(0, nbViews - 1);
+    std::uniform_int_distribution<std::size_t> featureDistribution(0, 100000);
+
+    TracksMap tracks;
+    for (std::size_t trackId = 0; trackId < nbTracks; ++trackId)
+    {
+        // skip some ids, track ids are not always contiguous
+        if (trackId % 7 == 3)
+            continue;
+
+        Track& track = tracks[trackId];
+        track.descType = (trackId % 2) ? feature::EImageDescriberType::SIFT : feature::EImageDescriberType::AKAZE;
+        const std::size_t length = lengthDistribution(generator);
+        while (track.featPerView.size() < length)
+            track.featPerView[viewDistribution(generator)].featureId = featureDistribution(generator);
+    }
+    return tracks;
+}
+
+/**
+ * @brief Create matches between consecutive views of each track.
+ */
+matching::PairwiseMatches createMatches(const TracksMap& tracks)
+{
+    matching::PairwiseMatches matches;
+    for (const auto& track : tracks)
+    {
+        for (auto it = track.second.featPerView.begin(); std::next(it) != track.second.featPerView.end(); ++it)
+        {
+            const auto next = std::next(it);
+            matches[Pair(it->first, next->first)][track.second.descType].emplace_back(it->second.featureId, next->second.featureId);
+        }
+    }
+    return matches;
+}
+
+void checkSameTracks(const TracksMap& expected, const TracksMap& tracks)
+{
+    BOOST_REQUIRE_EQUAL(expected.size(), tracks.size());
+    for (auto itA = expected.begin(), itB = tracks.begin(); itA != expected.end(); ++itA, ++itB)
+    {
+        BOOST_CHECK_EQUAL(itA->first, itB->first);
+        BOOST_CHECK(itA->second.descType == itB->second.descType);
+        BOOST_REQUIRE_EQUAL(itA->second.featPerView.size(), itB->second.featPerView.size());
+        for (auto featA = itA->second.featPerView.begin(), featB = itB->second.featPerView.begin(); featA != itA->second.featPerView.end();
+             ++featA, ++featB)
+        {
+            BOOST_CHECK_EQUAL(featA->first, featB->first);
+            BOOST_CHECK_EQUAL(featA->second.featureId, featB->second.featureId);
+        }
+    }
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(CompactTracks_FromTracksMap)
+{
+    TracksMap tracks;
+    tracks[2].descType = feature::EImageDescriberType::SIFT;
+    tracks[2].featPerView[5].featureId = 50;
+    tracks[2].featPerView[1].featureId = 10;
+    tracks[7].descType = feature::EImageDescriberType::AKAZE;
+    tracks[7].featPerView[1].featureId = 11;
+    tracks[7].featPerView[3].featureId = 31;
+    tracks[7].featPerView[5].featureId = 51;
+
+    const CompactTracks compactTracks(tracks);
+
+    BOOST_CHECK_EQUAL(compactTracks.size(), 2);
+    BOOST_CHECK_EQUAL(compactTracks.nbObservations(), 5);
+    BOOST_CHECK_EQUAL(compactTracks.getTrackId(1), 7);
+    BOOST_CHECK(compactTracks.getDescType(1) == feature::EImageDescriberType::AKAZE);
+
+    BOOST_CHECK_EQUAL(compactTracks.findTrack(2), 0);
+    BOOST_CHECK_EQUAL(compactTracks.findTrack(7), 1);
+    BOOST_CHECK_EQUAL(compactTracks.findTrack(3), CompactTracks::npos);
+    BOOST_CHECK_EQUAL(compactTracks.findTrack(8), CompactTracks::npos);
+
+    // observations are sorted by view
+    const auto observations = compactTracks.getObservations(0);
+    BOOST_REQUIRE_EQUAL(observations.size(), 2);
+    BOOST_CHECK_EQUAL(observations[0].viewId, 1);
+    BOOST_CHECK_EQUAL(observations[0].featureId, 10);
+    BOOST_CHECK_EQUAL(observations[1].viewId, 5);
+
+    BOOST_CHECK_EQUAL(compactTracks.getFeatureId(1, 3), 31);
+    BOOST_CHECK_EQUAL(compactTracks.getFeatureId(0, 3), UndefinedIndexT);
+
+    BOOST_CHECK(compactTracks.getViewIds() == std::vector<IndexT>({1, 3, 5}));
+    const auto tracksInView = compactTracks.getTracksInView(5);
+    BOOST_REQUIRE_EQUAL(tracksInView.size(), 2);
+    BOOST_CHECK_EQUAL(tracksInView[0], 0);
+    BOOST_CHECK_EQUAL(tracksInView[1], 1);
+    BOOST_CHECK(compactTracks.getTracksInView(4).empty());
+
+    TracksMap exportedTracks;
+    compactTracks.exportToSTL(exportedTracks);
+    checkSameTracks(tracks, exportedTracks);
+
+    const CompactTracks emptyTracks;
+    BOOST_CHECK(emptyTracks.empty());
+    BOOST_CHECK(emptyTracks.getTracksInView(0).empty());
+    BOOST_CHECK_EQUAL(emptyTracks.findTrack(0), CompactTracks::npos);
+}
+
+BOOST_AUTO_TEST_CASE(CompactTracks_InvalidArrays)
+{
+    using Observation = CompactTracks::Observation;
+
+    // valid
+    BOOST_CHECK_NO_THROW(
+      CompactTracks({0, 1}, {feature::EImageDescriberType::SIFT, feature::EImageDescriberType::SIFT}, {0, 2, 3}, {{0, 1}, {1, 1}, {0, 2}}));
+    // wrong number of offsets
+    BOOST_CHECK_THROW(
+      CompactTracks({0, 1}, {feature::EImageDescriberType::SIFT, feature::EImageDescriberType::SIFT}, {0, 3}, {{0, 1}, {1, 1}, {0, 2}}),
+      std::invalid_argument);
+    // unsorted track ids
+    BOOST_CHECK_THROW(
+      CompactTracks({1, 0}, {feature::EImageDescriberType::SIFT, feature::EImageDescriberType::SIFT}, {0, 2, 3}, {{0, 1}, {1, 1}, {0, 2}}),
+      std::invalid_argument);
+    // observations not sorted by view
+    BOOST_CHECK_THROW(CompactTracks({0}, {feature::EImageDescriberType::SIFT}, {0, 2}, std::vector<Observation>{{1, 1}, {0, 1}}),
+                      std::invalid_argument);
+    // same view twice in a track
+    BOOST_CHECK_THROW(CompactTracks({0}, {feature::EImageDescriberType::SIFT}, {0, 2}, std::vector<Observation>{{1, 1}, {1, 2}}),
+                      std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(CompactTracks_BuilderExport)
+{
+    // A    B    C
+    // 0 -> 0 -> 0
+    // 1 -> 1 -> 6
+    // 2 -> 3
+    // 4 -> 5 -> 7 -> (A) 8: fork in A
+    matching::PairwiseMatches matches;
+    matches[Pair(0, 1)][feature::EImageDescriberType::UNKNOWN] = {{0, 0}, {1, 1}, {2, 3}, {4, 5}};
+    matches[Pair(1, 2)][feature::EImageDescriberType::UNKNOWN] = {{0, 0}, {1, 6}, {5, 7}};
+    matches[Pair(0, 2)][feature::EImageDescriberType::UNKNOWN] = {{8, 7}};
+
+    TracksBuilder tracksBuilder;
+    tracksBuilder.build(matches);
+
+    // without filtering, the forks are exported like in exportToSTL
+    {
+        TracksMap tracks;
+        tracksBuilder.exportToSTL(tracks);
+        CompactTracks compactTracks;
+        tracksBuilder.exportToCompact(compactTracks);
+
+        TracksMap exportedTracks;
+        compactTracks.exportToSTL(exportedTracks);
+        checkSameTracks(tracks, exportedTracks);
+        BOOST_CHECK_EQUAL(compactTracks.size(), 4);
+    }
+
+    tracksBuilder.filter(true, 3);
+    {
+        TracksMap tracks;
+        tracksBuilder.exportToSTL(tracks);
+        CompactTracks compactTracks;
+        tracksBuilder.exportToCompact(compactTracks);
+
+        TracksMap exportedTracks;
+        compactTracks.exportToSTL(exportedTracks);
+        checkSameTracks(tracks, exportedTracks);
+        BOOST_CHECK_EQUAL(compactTracks.size(), 2);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(CompactTracks_Queries)
+{
+    const TracksMap tracks = createRandomTracks(2000, 20, 6, 42);
+    const CompactTracks compactTracks(tracks);
+
+    TracksPerView tracksPerView;
+    computeTracksPerView(tracks, tracksPerView);
+    {
+        TracksPerView compactTracksPerView;
+        computeTracksPerView(compactTracks, compactTracksPerView);
+        BOOST_CHECK(tracksPerView == compactTracksPerView);
+    }
+
+    for (const std::set<std::size_t>& imageIndexes : std::vector<std::set<std::size_t>>{{0}, {3, 4}, {1, 7, 19}, {2, 5, 9, 12}, {0, 30}, {30}})
+    {
+        std::set<std::size_t> expected;
+        getCommonTracksInImages(imageIndexes, tracksPerView, expected);
+        std::set<std::size_t> result;
+        getCommonTracksInImages(imageIndexes, compactTracks, result);
+        BOOST_CHECK(expected == result);
+
+        getTracksInImages(imageIndexes, tracks, expected);
+        getTracksInImages(imageIndexes, compactTracks, result);
+        BOOST_CHECK(expected == result);
+
+        getTracksInImage(*imageIndexes.begin(), tracks, expected);
+        getTracksInImage(*imageIndexes.begin(), compactTracks, result);
+        BOOST_CHECK(expected == result);
+
+        std::vector<FeatureId> expectedFeatures;
+        getFeatureIdInViewPerTrack(tracks, expected, *imageIndexes.begin(), expectedFeatures);
+        std::vector<FeatureId> features;
+        getFeatureIdInViewPerTrack(compactTracks, expected, *imageIndexes.begin(), features);
+        BOOST_CHECK(expectedFeatures == features);
+    }
+
+    {
+        std::set<std::size_t> expected;
+        getTracksIdVector(tracks, &expected);
+        std::set<std::size_t> result;
+        getTracksIdVector(compactTracks, &result);
+        BOOST_CHECK(expected == result);
+
+        imageIdInTracks(tracks, expected);
+        imageIdInTracks(compactTracks, result);
+        BOOST_CHECK(expected == result);
+    }
+    {
+        std::map<std::size_t, std::size_t> expected;
+        tracksLength(tracks, expected);
+        std::map<std::size_t, std::size_t> result;
+        tracksLength(compactTracks, result);
+        BOOST_CHECK(expected == result);
+    }
+    {
+        std::map<Pair, unsigned int> expected;
+        computeCovisibility(expected, tracks);
+        std::map<Pair, unsigned int> result;
+        computeCovisibility(result, compactTracks);
+        BOOST_CHECK(expected == result);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(CompactTracks_Benchmark)
+{
+    const std::size_t nbTracks = 20000;
+    const matching::PairwiseMatches matches = createMatches(createRandomTracks(nbTracks, 200, 8, 7));
+
+    system::Timer timer;
+    TracksBuilder tracksBuilder;
+    tracksBuilder.build(matches);
+    tracksBuilder.filter(true, 2);
+    ALICEVISION_LOG_INFO("Build and filter tracks: " << system::prettyTime(timer.elapsedMs()));
+
+    timer.reset();
+    TracksMap tracks;
+    tracksBuilder.exportToSTL(tracks);
+    TracksPerView tracksPerView;
+    computeTracksPerView(tracks, tracksPerView);
+    const double mapDuration = timer.elapsedMs();
+
+    timer.reset();
+    CompactTracks compactTracks;
+    tracksBuilder.exportToCompact(compactTracks);
+    const double compactDuration = timer.elapsedMs();
+
+    const std::size_t mapSize = memorySize(tracks) + memorySize(tracksPerView);
+    const std::size_t compactSize = compactTracks.memorySize();
+
+    ALICEVISION_LOG_INFO("Tracks: " << compactTracks.size() << ", observations: " << compactTracks.nbObservations());
+    ALICEVISION_LOG_INFO("TracksMap + TracksPerView: " << mapSize / (1024 * 1024) << " MB, export: " << system::prettyTime(mapDuration));
+    ALICEVISION_LOG_INFO("CompactTracks: " << compactSize / (1024 * 1024) << " MB, export: " << system::prettyTime(compactDuration));
+
+    BOOST_CHECK_EQUAL(compactTracks.size(), tracks.size());
+    BOOST_CHECK_LT(compactSize, mapSize);
+
+    // iterate over all the observations
+    timer.reset();
+    std::size_t mapChecksum = 0;
+    for (const auto& track : tracks)
+        for (const auto& feat : track.second.featPerView)
+            mapChecksum += feat.first * feat.second.featureId;
+    const double mapIterationDuration = timer.elapsedMs();
+
+    timer.reset();
+    std::size_t compactChecksum = 0;
+    for (const CompactTracks::Observation& obs : compactTracks.observations())
+        compactChecksum += std::size_t(obs.viewId) * obs.featureId;
+    const double compactIterationDuration = timer.elapsedMs();
+
+    ALICEVISION_LOG_INFO("Iterate over the observations: TracksMap " << system::prettyTime(mapIterationDuration) << ", CompactTracks "
+                                                                     << system::prettyTime(compactIterationDuration));
+    BOOST_CHECK_EQUAL(mapChecksum, compactChecksum);
+}
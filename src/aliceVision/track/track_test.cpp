@@ -5,10 +5,14 @@
 // v. 2.0. If a copy of the MPL was not distributed with this file,
 // You can obtain one at https://mozilla.org/MPL/2.0/.
 
+#include "aliceVision/track/TrackColumns.hpp"
 #include "aliceVision/track/TracksBuilder.hpp"
 #include "aliceVision/track/tracksUtils.hpp"
 #include "aliceVision/matching/IndMatch.hpp"
+#include "aliceVision/alicevision_omp.hpp"
 
+#include <random>
+#include <set>
 #include <vector>
 #include <utility>
 
@@ -221,3 +225,131 @@ BOOST_AUTO_TEST_CASE(Track_GetCommonTracksInImages)
         BOOST_CHECK_EQUAL(base.size(), set_visibleTracks.size());
     }
 }
+
+BOOST_AUTO_TEST_CASE(Track_Columns)
+{
+    // A    B    C
+    // 0 -> 0 -> 0
+    // 1 -> 1 -> 6
+    // 2 -> 3
+    PairwiseMatches map_pairwisematches;
+    map_pairwisematches[std::make_pair(0, 1)][EImageDescriberType::UNKNOWN] = {IndMatch(0, 0), IndMatch(1, 1), IndMatch(2, 3)};
+    map_pairwisematches[std::make_pair(1, 2)][EImageDescriberType::UNKNOWN] = {IndMatch(0, 0), IndMatch(1, 6)};
+
+    TracksBuilder trackBuilder;
+    trackBuilder.build(map_pairwisematches);
+
+    TracksMap map_tracks;
+    trackBuilder.exportToSTL(map_tracks);
+
+    const TrackColumns columns = getTrackColumns(map_tracks);
+
+    BOOST_CHECK_EQUAL(columns.size(), 3);
+    BOOST_CHECK_EQUAL(columns.offsets.size(), 4);
+    BOOST_CHECK_EQUAL(columns.viewIds.size(), 8);
+    BOOST_CHECK_EQUAL(columns.featureIds.size(), 8);
+
+    const std::uint64_t GT_offsets[] = {0, 3, 6, 8};
+    const aliceVision::IndexT GT_viewIds[] = {0, 1, 2, 0, 1, 2, 0, 1};
+    const aliceVision::IndexT GT_featureIds[] = {0, 0, 0, 1, 1, 6, 2, 3};
+
+    for (int i = 0; i < 3; ++i)
+    {
+        BOOST_CHECK_EQUAL(columns.trackIds(i), i);
+        BOOST_CHECK_EQUAL(columns.descTypes(i), static_cast<unsigned char>(EImageDescriberType::UNKNOWN));
+    }
+    for (int i = 0; i < 4; ++i)
+        BOOST_CHECK_EQUAL(columns.offsets(i), GT_offsets[i]);
+    for (int o = 0; o < 8; ++o)
+    {
+        BOOST_CHECK_EQUAL(columns.viewIds(o), GT_viewIds[o]);
+        BOOST_CHECK_EQUAL(columns.featureIds(o), GT_featureIds[o]);
+    }
+
+    // no track
+    const TrackColumns emptyColumns = getTrackColumns(TracksMap());
+    BOOST_CHECK_EQUAL(emptyColumns.size(), 0);
+    BOOST_CHECK_EQUAL(emptyColumns.offsets.size(), 1);
+    BOOST_CHECK_EQUAL(emptyColumns.offsets(0), 0);
+    BOOST_CHECK_EQUAL(emptyColumns.viewIds.size(), 0);
+}
+
+namespace {
+
+/// Tracks as a set of observations, independently of the track ids
+std::set<std::vector<std::pair<std::size_t, std::size_t>>> getTracksContent(const TracksMap& tracks)
+{
+    std::set<std::vector<std::pair<std::size_t, std::size_t>>> content;
+    for (const auto& track : tracks)
+    {
+        std::vector<std::pair<std::size_t, std::size_t>> observations;
+        for (const auto& feat : track.second.featPerView)
+            observations.emplace_back(feat.first, feat.second.featureId);
+        observations.emplace_back(std::numeric_limits<std::size_t>::max(), static_cast<std::size_t>(track.second.descType));
+        content.insert(observations);
+    }
+    return content;
+}
+
+TracksMap buildTracks(const PairwiseMatches& matches, bool multithreaded, bool filter)
+{
+    TracksBuilder trackBuilder;
+    trackBuilder.build(matches, multithreaded);
+    if (filter)
+        trackBuilder.filter(true, 2);
+    TracksMap tracks;
+    trackBuilder.exportToSTL(tracks);
+    return tracks;
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(Track_Multithreaded)
+{
+    // random matches between all the pairs of views, with forks
+    std::mt19937 generator(1234);
+    std::uniform_int_distribution<aliceVision::IndexT> featureDistribution(0, 400);
+
+    PairwiseMatches matches;
+    for (std::size_t i = 0; i < 20; ++i)
+    {
+        for (std::size_t j = i + 1; j < 20; j += 1 + (i + j) % 3)
+        {
+            for (EImageDescriberType descType : {EImageDescriberType::SIFT, EImageDescriberType::AKAZE})
+            {
+                IndMatches& pairMatches = matches[std::make_pair(i, j)][descType];
+                for (int m = 0; m < 100; ++m)
+                    pairMatches.emplace_back(featureDistribution(generator), featureDistribution(generator));
+            }
+        }
+    }
+
+    for (bool filter : {false, true})
+    {
+        const TracksMap sequentialTracks = buildTracks(matches, false, filter);
+
+        omp_set_num_threads(1);
+        const TracksMap tracks1 = buildTracks(matches, true, filter);
+        omp_set_num_threads(4);
+        const TracksMap tracks4 = buildTracks(matches, true, filter);
+
+        // same tracks as the sequential build
+        BOOST_CHECK_EQUAL(sequentialTracks.size(), tracks1.size());
+        BOOST_CHECK(getTracksContent(sequentialTracks) == getTracksContent(tracks1));
+
+        // same ids whatever the number of threads
+        BOOST_REQUIRE_EQUAL(tracks1.size(), tracks4.size());
+        for (auto it1 = tracks1.begin(), it4 = tracks4.begin(); it1 != tracks1.end(); ++it1, ++it4)
+        {
+            BOOST_CHECK_EQUAL(it1->first, it4->first);
+            BOOST_CHECK(it1->second.descType == it4->second.descType);
+            BOOST_REQUIRE_EQUAL(it1->second.featPerView.size(), it4->second.featPerView.size());
+            for (auto feat1 = it1->second.featPerView.begin(), feat4 = it4->second.featPerView.begin(); feat1 != it1->second.featPerView.end();
+                 ++feat1, ++feat4)
+            {
+                BOOST_CHECK_EQUAL(feat1->first, feat4->first);
+                BOOST_CHECK_EQUAL(feat1->second.featureId, feat4->second.featureId);
+            }
+        }
+    }
+}
@@ -7,6 +7,7 @@
 
 #include "tracksUtils.hpp"
 
+#include <algorithm>
 #include <iterator>
 
 namespace aliceVision {
@@ -292,5 +293,127 @@ void computeCovisibility(std::map<Pair, unsigned int>& covisibility, const track
     }
 }
 
+void getCommonTracksInImages(const std::set<std::size_t>& imageIndexes, const CompactTracks& tracks, std::set<std::size_t>& visibleTracks)
+{
+    assert(!imageIndexes.empty());
+    visibleTracks.clear();
+
+    // start from the view with the fewest tracks and check the other views in each of its tracks
+    std::set<std::size_t>::const_iterator smallestIt = imageIndexes.cend();
+    std::size_t smallestCount = 0;
+    for (auto it = imageIndexes.cbegin(); it != imageIndexes.cend(); ++it)
+    {
+        const std::size_t count = tracks.getTracksInView(*it).size();
+        // one image is not present in the tracks, so there is no track in common
+        if (count == 0)
+            return;
+        if (smallestIt == imageIndexes.cend() || count < smallestCount)
+        {
+            smallestIt = it;
+            smallestCount = count;
+        }
+    }
+
+    for (const IndexT trackIndex : tracks.getTracksInView(*smallestIt))
+    {
+        const bool isCommon = std::all_of(imageIndexes.cbegin(), imageIndexes.cend(), [&](std::size_t imageIndex) {
+            return imageIndex == *smallestIt || tracks.getFeatureId(trackIndex, imageIndex) != UndefinedIndexT;
+        });
+        if (isCommon)
+            visibleTracks.insert(visibleTracks.end(), tracks.getTrackId(trackIndex));
+    }
+}
+
+void getTracksInImages(const std::set<std::size_t>& imagesId, const CompactTracks& tracks, std::set<std::size_t>& tracksId)
+{
+    tracksId.clear();
+    for (const std::size_t id : imagesId)
+    {
+        for (const IndexT trackIndex : tracks.getTracksInView(id))
+            tracksId.insert(tracks.getTrackId(trackIndex));
+    }
+}
+
+void getTracksInImage(const std::size_t& imageIndex, const CompactTracks& tracks, std::set<std::size_t>& tracksIds)
+{
+    tracksIds.clear();
+    for (const IndexT trackIndex : tracks.getTracksInView(imageIndex))
+        tracksIds.insert(tracksIds.end(), tracks.getTrackId(trackIndex));
+}
+
+void computeTracksPerView(const CompactTracks& tracks, TracksPerView& tracksPerView)
+{
+    for (const IndexT viewId : tracks.getViewIds())
+    {
+        const CompactTracks::Range<IndexT> viewTracks = tracks.getTracksInView(viewId);
+        TrackIdSet& tracksSet = tracksPerView[viewId];
+        tracksSet.reserve(tracksSet.size() + viewTracks.size());
+        for (const IndexT trackIndex : viewTracks)
+            tracksSet.push_back(tracks.getTrackId(trackIndex));
+    }
+}
+
+void getTracksIdVector(const CompactTracks& tracks, std::set<std::size_t>* tracksIds)
+{
+    tracksIds->clear();
+    tracksIds->insert(tracks.trackIds().begin(), tracks.trackIds().end());
+}
+
+bool getFeatureIdInViewPerTrack(const CompactTracks& allTracks,
+                                const std::set<std::size_t>& trackIds,
+                                IndexT viewId,
+                                std::vector<FeatureId>& outFeatId)
+{
+    for (std::size_t trackId : trackIds)
+    {
+        const std::size_t trackIndex = allTracks.findTrack(trackId);
+
+        // ignore it if the track doesn't exist
+        if (trackIndex == CompactTracks::npos)
+            continue;
+
+        const IndexT featureId = allTracks.getFeatureId(trackIndex, viewId);
+        if (featureId != UndefinedIndexT)
+            outFeatId.emplace_back(allTracks.getDescType(trackIndex), featureId);
+    }
+
+    return !outFeatId.empty();
+}
+
+void tracksLength(const CompactTracks& tracks, std::map<std::size_t, std::size_t>& occurenceTrackLength)
+{
+    for (std::size_t i = 0; i < tracks.size(); ++i)
+        ++occurenceTrackLength[tracks.getObservations(i).size()];
+}
+
+void imageIdInTracks(const CompactTracks& tracks, std::set<std::size_t>& imagesId)
+{
+    imagesId.insert(tracks.getViewIds().begin(), tracks.getViewIds().end());
+}
+
+void computeCovisibility(std::map<Pair, unsigned int>& covisibility, const CompactTracks& tracks)
+{
+    for (std::size_t i = 0; i < tracks.size(); ++i)
+    {
+        const CompactTracks::Range<CompactTracks::Observation> observations = tracks.getObservations(i);
+
+        for (auto it = observations.begin(); it != observations.end(); it++)
+        {
+            Pair p;
+            p.first = it->viewId;
+
+            for (auto next = std::next(it); next != observations.end(); next++)
+            {
+                p.second = next->viewId;
+
+                // same counting as the TracksMap version
+                const auto [covisibilityIt, inserted] = covisibility.emplace(p, 0);
+                if (!inserted)
+                    covisibilityIt->second++;
+            }
+        }
+    }
+}
+
 }  // namespace track
 }  // namespace aliceVision
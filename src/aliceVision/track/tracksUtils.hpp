@@ -7,6 +7,7 @@
 
 #pragma once
 #include <aliceVision/track/Track.hpp>
+#include <aliceVision/track/CompactTracks.hpp>
 
 namespace aliceVision {
 namespace track {
@@ -149,5 +150,77 @@ void imageIdInTracks(const TracksMap& tracks, std::set<std::size_t>& imagesId);
 */
 void computeCovisibility(std::map<Pair, unsigned int>& covisibility, const track::TracksMap& mapTracks);
 
+/**
+ * @brief Find common tracks among a set of images.
+ * @param[in] imageIndexes: set of images we are looking for common tracks.
+ * @param[in] tracks: all tracks of the scene.
+ * @param[out] visibleTracks: output with only the ids of the common tracks.
+ */
+void getCommonTracksInImages(const std::set<std::size_t>& imageIndexes, const CompactTracks& tracks, std::set<std::size_t>& visibleTracks);
+
+/**
+ * @brief Find all the visible tracks from a set of images.
+ * @param[in] imagesId set of images we are looking for tracks.
+ * @param[in] tracks all tracks of the scene.
+ * @param[out] tracksId the tracks in the images
+ */
+void getTracksInImages(const std::set<std::size_t>& imagesId, const CompactTracks& tracks, std::set<std::size_t>& tracksId);
+
+/**
+ * @brief Find all the visible tracks from a single image.
+ * @param[in] imageIndex of the image we are looking for tracks.
+ * @param[in] tracks all tracks of the scene.
+ * @param[out] tracksIds the tracks in the image
+ */
+void getTracksInImage(const std::size_t& imageIndex, const CompactTracks& tracks, std::set<std::size_t>& tracksIds);
+
+/**
+ * @brief Compute the visible tracks for each view
+ * @param[in] tracks all tracks of the scene
+ * @param[out] tracksPerView : for each view the id of the visible tracks as a map {viewID, vector<trackID>}
+ */
+void computeTracksPerView(const CompactTracks& tracks, TracksPerView& tracksPerView);
+
+/**
+ * @brief Return the tracksId as a set (sorted increasing)
+ * @param[in] tracks all tracks of the scene
+ * @param[out] tracksIds the tracks in the images
+ */
+void getTracksIdVector(const CompactTracks& tracks, std::set<std::size_t>* tracksIds);
+
+/**
+ * @brief Get feature id (with associated describer type) in the specified view for each TrackId
+ * @param[in] allTracks all tracks of the scene
+ * @param[in] trackIds the tracks in the images
+ * @param[in] viewId: ImageId we are looking for features
+ * @param[out] outFeatId the number of features in the image as a vector
+ * @return true if the vector of features Ids is not empty
+ */
+bool getFeatureIdInViewPerTrack(const CompactTracks& allTracks,
+                                const std::set<std::size_t>& trackIds,
+                                IndexT viewId,
+                                std::vector<FeatureId>& outFeatId);
+
+/**
+ * @brief Return the occurrence of tracks length.
+ * @param[in] tracks all tracks of the scene
+ * @param[out] occurenceTrackLength : the occurence length of each trackId in the scene
+ */
+void tracksLength(const CompactTracks& tracks, std::map<std::size_t, std::size_t>& occurenceTrackLength);
+
+/**
+ * @brief Return a set containing the image Id considered in the tracks container.
+ * @param[in] tracks all tracks of the scene
+ * @param[out] imagesId set of images considered in the tracks container.
+ */
+void imageIdInTracks(const CompactTracks& tracks, std::set<std::size_t>& imagesId);
+
+/**
+ * @brief compute the set of pairs of views which shares some observed features
+ * @param covisibility a map indexed by pair of views and whose values are the number of shared features
+ * @param tracks the input tracks
+ */
+void computeCovisibility(std::map<Pair, unsigned int>& covisibility, const CompactTracks& tracks);
+
 }  // namespace track
 }  // namespace aliceVision
@@ -5,17 +5,97 @@
 // You can obtain one at https://mozilla.org/MPL/2.0/.
 
 #include "Database.hpp"
-#include <aliceVision/system/ProgressDisplay.hpp>
+#include <aliceVision/system/Logger.hpp>
 #include <boost/accumulators/accumulators.hpp>
 #include <boost/accumulators/statistics/tail.hpp>
+#include <boost/iostreams/device/mapped_file.hpp>
+#include <algorithm>
 #include <cmath>
+#include <filesystem>
 #include <fstream>
+#include <limits>
 #include <stdexcept>
 #include <boost/format.hpp>
 
 namespace aliceVision {
 namespace voctree {
 
+namespace fs = std::filesystem;
+
+namespace {
+
+const uint32_t databaseMagic = 0x42445641;  // "AVDB"
+const uint32_t databaseVersion = 2;
+/// A new segment is only appended to a database saved in less segments
+const std::size_t maxSegments = 16;
+
+std::string headerPath(const std::string& folder) { return (fs::path(folder) / "database.bin").string(); }
+
+std::string documentsPath(const std::string& folder, uint32_t segmentId)
+{ return (fs::path(folder) / ("documents_" + std::to_string(segmentId) + ".bin")).string(); }
+
+std::string invertedFilesPath(const std::string& folder, uint32_t segmentId, std::size_t shard)
+{ return (fs::path(folder) / ("invertedFiles_" + std::to_string(segmentId) + "_" + std::to_string(shard) + ".bin")).string(); }
+
+/// Remove all the documents and inverted files of a folder, whatever their segment
+void removeSegmentFiles(const std::string& folder)
+{
+    for (const fs::directory_entry& entry : fs::directory_iterator(folder))
+    {
+        const std::string filename = entry.path().filename().string();
+        const bool isSegmentFile = filename.rfind("documents_", 0) == 0 || filename.rfind("invertedFiles_", 0) == 0;
+        if (isSegmentFile && entry.path().extension() == ".bin" && entry.is_regular_file())
+            fs::remove(entry.path());
+    }
+}
+
+std::size_t nbShards(std::size_t num_words, std::size_t words_per_shard) { return (num_words + words_per_shard - 1) / words_per_shard; }
+
+template<typename T>
+void writeArray(std::ostream& out, const std::vector<T>& values)
+{ out.write(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(T)); }
+
+/**
+ * @brief Sequential reader of the arrays stored in a memory-mapped file.
+ * Arrays are written with decreasing sizes of elements, so that each array is aligned in the mapping.
+ */
+class MappedArrays
+{
+  public:
+    explicit MappedArrays(const std::string& path)
+      : _file(path),
+        _path(path)
+    {
+        if (!_file.is_open())
+            throw std::runtime_error((boost::format("Failed to open vocabulary tree database file '%s'") % path).str());
+    }
+
+    template<typename T>
+    const T* next(std::size_t count)
+    {
+        if (count > (_file.size() - _offset) / sizeof(T))
+            throw std::runtime_error((boost::format("Invalid vocabulary tree database file '%s'") % _path).str());
+
+        const T* data = reinterpret_cast<const T*>(_file.data() + _offset);
+        _offset += count * sizeof(T);
+        return data;
+    }
+
+    /// Check that the offsets of a CSR array are increasing and end at the size of the values
+    void checkOffsets(const uint64_t* offsets, std::size_t count, std::size_t nbValues) const
+    {
+        if (offsets[0] != 0 || offsets[count] != nbValues || !std::is_sorted(offsets, offsets + count + 1))
+            throw std::runtime_error((boost::format("Invalid vocabulary tree database file '%s'") % _path).str());
+    }
+
+  private:
+    boost::iostreams::mapped_file_source _file;
+    std::string _path;
+    std::size_t _offset = 0;
+};
+
+}  // namespace
+
 std::ostream& operator<<(std::ostream& os, const SparseHistogram& dv)
 {
     for (const auto& e : dv)
@@ -59,10 +139,31 @@ DocId Database::insert(DocId doc_id, const SparseHistogram& document)
     }
 
     database_[doc_id] = document;
+    unsaved_docs_.insert(doc_id);
 
     return doc_id;
 }
 
+bool Database::erase(DocId doc_id)
+{
+    const auto docIt = database_.find(doc_id);
+    if (docIt == database_.end())
+        return false;
+
+    for (const auto& word : docIt->second)
+    {
+        InvertedFile& file = word_files_[word.first];
+        file.erase(std::remove_if(file.begin(), file.end(), [doc_id](const WordFrequency& freq) { return freq.id == doc_id; }), file.end());
+    }
+    database_.erase(docIt);
+
+    // the saved segments contain the document: they have to be rewritten
+    if (unsaved_docs_.erase(doc_id) == 0)
+        erased_saved_docs_ = true;
+
+    return true;
+}
+
 void Database::sanityCheck(std::size_t N, std::map<std::size_t, DocMatches>& matches) const
 {
     // if N is equal to zero
@@ -78,20 +179,8 @@ void Database::sanityCheck(std::size_t N, std::map<std::size_t, DocMatches>& mat
         N = std::min(N, this->size());
     }
 
-    matches.clear();
-    // since we already know the size of the vectors, in order to parallelize the
-    // query allocate the whole memory
-    auto display = system::createConsoleProgressDisplay(database_.size(), std::cout);
-
-    // #pragma omp parallel for default(none) shared(database_)
-    for (const auto& doc : database_)
-    {
-        std::vector<DocMatch> m;
-        find(doc.second, N, m);
-        //		matches.emplace_back( m );
-        matches[doc.first] = m;
-        ++display;
-    }
+    // query all the documents of the database at once
+    find(database_, N, matches);
 }
 
 /**
@@ -136,6 +225,161 @@ void Database::find(const SparseHistogram& query, std::size_t N, std::vector<Doc
     matches.resize(nMatches);
 }
 
+void Database::find(const SparseHistogramPerImage& queries,
+                    std::size_t N,
+                    std::map<std::size_t, DocMatches>& matches,
+                    const std::string& distanceMethod) const
+{
+    // create the entries of the output map, to fill them in parallel
+    matches.clear();
+    std::vector<const SparseHistogram*> queryHistograms;
+    std::vector<DocMatches*> queryMatches;
+    queryHistograms.reserve(queries.size());
+    queryMatches.reserve(queries.size());
+    for (const auto& query : queries)
+    {
+        queryHistograms.push_back(&query.second);
+        queryMatches.push_back(&matches[query.first]);
+    }
+
+    enum class EScoring
+    {
+        CLASSIC,
+        COMMON_POINTS,
+        STRONG_COMMON_POINTS,
+        INVERSED_WEIGHTED_COMMON_POINTS,
+        SINGLE_QUERY
+    };
+
+    EScoring scoring = EScoring::SINGLE_QUERY;
+    if (distanceMethod == "classic")
+        scoring = EScoring::CLASSIC;
+    else if (distanceMethod == "commonPoints")
+        scoring = EScoring::COMMON_POINTS;
+    else if (distanceMethod == "strongCommonPoints")
+        scoring = EScoring::STRONG_COMMON_POINTS;
+    else if (distanceMethod == "inversedWeightedCommonPoints")
+        scoring = EScoring::INVERSED_WEIGHTED_COMMON_POINTS;
+    else if (distanceMethod != "weightedStrongCommonPoints")
+        throw std::invalid_argument("distance method " + distanceMethod + " unknown!");
+
+    if (scoring == EScoring::SINGLE_QUERY)
+    {
+        // the score of the other methods can't be accumulated over the inverted files
+#pragma omp parallel for schedule(dynamic)
+        for (std::ptrdiff_t i = 0; i < static_cast<std::ptrdiff_t>(queryHistograms.size()); ++i)
+            find(*queryHistograms[i], N, *queryMatches[i], distanceMethod);
+        return;
+    }
+
+    // documents are indexed in the order of the database, so that ties are sorted as in the single query find()
+    std::vector<DocId> docIds;
+    std::vector<float> docSizes;
+    docIds.reserve(database_.size());
+    docSizes.reserve(database_.size());
+    for (const auto& doc : database_)
+    {
+        float size = 0.f;
+        for (const auto& word : doc.second)
+            size += word.second.size();
+        docIds.push_back(doc.first);
+        docSizes.push_back(size);
+    }
+
+    // inverted files of all the words in a CSR layout, with the indexes of the documents
+    struct Posting
+    {
+        uint32_t docIndex;
+        uint32_t count;
+    };
+
+    std::vector<std::size_t> offsets(word_files_.size() + 1, 0);
+    for (std::size_t word = 0; word < word_files_.size(); ++word)
+        offsets[word + 1] = offsets[word] + word_files_[word].size();
+
+    std::vector<Posting> postings(offsets.back());
+#pragma omp parallel for schedule(dynamic, 1024)
+    for (std::ptrdiff_t word = 0; word < static_cast<std::ptrdiff_t>(word_files_.size()); ++word)
+    {
+        Posting* posting = postings.data() + offsets[word];
+        for (const WordFrequency& frequency : word_files_[word])
+        {
+            const std::size_t docIndex = std::lower_bound(docIds.begin(), docIds.end(), frequency.id) - docIds.begin();
+            *posting++ = {static_cast<uint32_t>(docIndex), frequency.count};
+        }
+    }
+
+    const std::size_t nMatches = std::min(N, docIds.size());
+
+#pragma omp parallel
+    {
+        // scores of all the documents for the current query
+        std::vector<float> scores(docIds.size());
+
+#pragma omp for schedule(dynamic)
+        for (std::ptrdiff_t i = 0; i < static_cast<std::ptrdiff_t>(queryHistograms.size()); ++i)
+        {
+            const SparseHistogram& query = *queryHistograms[i];
+
+            if (scoring == EScoring::CLASSIC)
+            {
+                // sum of the differences of the counts of all the words:
+                // total count of both documents minus twice the counts of the common features
+                float querySize = 0.f;
+                for (const auto& word : query)
+                    querySize += word.second.size();
+                for (std::size_t d = 0; d < docIds.size(); ++d)
+                    scores[d] = querySize + docSizes[d];
+            }
+            else
+            {
+                std::fill(scores.begin(), scores.end(), 0.f);
+            }
+
+            // words are visited in increasing order, as in sparseDistance()
+            for (const auto& word : query)
+            {
+                if (word.first < 0 || static_cast<std::size_t>(word.first) >= word_files_.size())
+                    continue;
+
+                const uint32_t queryCount = word.second.size();
+                const float weight = word_weights_[word.first];
+                for (std::size_t p = offsets[word.first]; p < offsets[word.first + 1]; ++p)
+                {
+                    const Posting& posting = postings[p];
+                    const uint32_t minCount = std::min(queryCount, posting.count);
+                    switch (scoring)
+                    {
+                        case EScoring::CLASSIC:
+                            scores[posting.docIndex] -= 2.f * minCount;
+                            break;
+                        case EScoring::COMMON_POINTS:
+                            scores[posting.docIndex] -= minCount;
+                            break;
+                        case EScoring::STRONG_COMMON_POINTS:
+                            if (queryCount == 1 && posting.count == 1)
+                                scores[posting.docIndex] -= 1.f;
+                            break;
+                        case EScoring::INVERSED_WEIGHTED_COMMON_POINTS:
+                            scores[posting.docIndex] -= (1.f / minCount) * weight;
+                            break;
+                        case EScoring::SINGLE_QUERY:
+                            break;
+                    }
+                }
+            }
+
+            DocMatches& docMatches = *queryMatches[i];
+            docMatches.clear();
+            docMatches.reserve(docIds.size());
+            for (std::size_t d = 0; d < docIds.size(); ++d)
+                docMatches.emplace_back(docIds[d], scores[d]);
+            std::partial_sort(docMatches.begin(), docMatches.begin() + nMatches, docMatches.end());
+            docMatches.resize(nMatches);
+        }
+    }
+}
+
 /**
  * @brief Compute the TF-IDF weights of all the words. To be called after inserting a corpus of
  * training examples into the database.
@@ -184,6 +428,321 @@ void Database::loadWeights(const std::string& file)
     }
 }
 
+bool Database::exists(const std::string& folder) { return fs::exists(headerPath(folder)); }
+
+void Database::save(const std::string& folder, std::size_t words_per_shard)
+{
+    if (words_per_shard == 0 || words_per_shard > std::numeric_limits<uint32_t>::max())
+        throw std::invalid_argument("Invalid number of words per shard: " + std::to_string(words_per_shard));
+
+    fs::create_directories(folder);
+    const std::string absoluteFolder = fs::absolute(folder).lexically_normal().string();
+
+    uint32_t previousNumWords = 0;
+    std::vector<Segment> previousSegments;
+    std::string previousSource;
+    bool hasPrevious = false;
+    try
+    {
+        hasPrevious = readSegments(folder, previousNumWords, previousSegments, nullptr, &previousSource);
+    }
+    catch (const std::runtime_error& e)
+    {
+        // unreadable or older database: its segments are unknown, so all the segment files are replaced
+        ALICEVISION_LOG_WARNING(e.what() << ", it is replaced.");
+        previousNumWords = 0;
+        previousSegments.clear();
+        previousSource.clear();
+        removeSegmentFiles(folder);
+    }
+
+    // only write the new documents if the folder contains the saved documents of this database
+    const bool append = hasPrevious && absoluteFolder == folder_ && previousSegments == segments_ && previousNumWords == word_files_.size() &&
+                        previousSource == source_ && !erased_saved_docs_ && segments_.size() < maxSegments;
+
+    std::vector<DocId> docIds;
+    if (append)
+    {
+        docIds.assign(unsaved_docs_.begin(), unsaved_docs_.end());
+    }
+    else
+    {
+        docIds.reserve(database_.size());
+        for (const auto& doc : database_)
+            docIds.push_back(doc.first);
+    }
+
+    std::vector<Segment> segments = append ? previousSegments : std::vector<Segment>();
+    if (!docIds.empty())
+    {
+        Segment segment{0, static_cast<uint32_t>(words_per_shard)};
+        for (const Segment& previousSegment : previousSegments)
+            segment.id = std::max(segment.id, previousSegment.id + 1);
+
+        writeSegment(folder, segment, docIds);
+        segments.push_back(segment);
+    }
+
+    // the header references the segments: it is replaced once they are written
+    {
+        const std::string tmpPath = headerPath(folder) + ".tmp";
+        std::ofstream out(tmpPath, std::ios_base::binary);
+        const uint32_t num_words = word_files_.size();
+        const uint32_t num_segments = segments.size();
+        const uint32_t source_size = source_.size();
+        out.write((const char*)(&databaseMagic), sizeof(uint32_t));
+        out.write((const char*)(&databaseVersion), sizeof(uint32_t));
+        out.write((const char*)(&num_words), sizeof(uint32_t));
+        out.write((const char*)(&num_segments), sizeof(uint32_t));
+        out.write((const char*)(&source_size), sizeof(uint32_t));
+        writeArray(out, segments);
+        writeArray(out, word_weights_);
+        out.write(source_.data(), source_size);
+        out.close();
+        if (!out)
+            throw std::runtime_error((boost::format("Failed to write vocabulary tree database file '%s'") % tmpPath).str());
+        fs::rename(tmpPath, headerPath(folder));
+    }
+
+    if (!append)
+    {
+        for (const Segment& segment : previousSegments)
+        {
+            fs::remove(documentsPath(folder, segment.id));
+            for (std::size_t shard = 0; shard < nbShards(previousNumWords, segment.words_per_shard); ++shard)
+                fs::remove(invertedFilesPath(folder, segment.id, shard));
+        }
+    }
+
+    folder_ = absoluteFolder;
+    segments_ = segments;
+    unsaved_docs_.clear();
+    erased_saved_docs_ = false;
+}
+
+void Database::load(const std::string& folder)
+{
+    uint32_t num_words = 0;
+    std::vector<Segment> segments;
+    std::vector<float> weights;
+    std::string source;
+    if (!readSegments(folder, num_words, segments, &weights, &source))
+        throw std::runtime_error((boost::format("No vocabulary tree database in '%s'") % folder).str());
+
+    word_files_.assign(num_words, InvertedFile());
+    word_weights_ = std::move(weights);
+    source_ = std::move(source);
+    database_.clear();
+
+    for (const Segment& segment : segments)
+        readSegment(folder, segment);
+
+    // inverted files are sorted in each segment, but the documents of a segment can be inserted before the previous ones
+    if (segments.size() > 1)
+    {
+        const auto byId = [](const WordFrequency& a, const WordFrequency& b) { return a.id < b.id; };
+        for (InvertedFile& file : word_files_)
+        {
+            if (!std::is_sorted(file.begin(), file.end(), byId))
+                std::sort(file.begin(), file.end(), byId);
+        }
+    }
+
+    folder_ = fs::absolute(folder).lexically_normal().string();
+    segments_ = segments;
+    unsaved_docs_.clear();
+    erased_saved_docs_ = false;
+}
+
+bool Database::readSegments(const std::string& folder,
+                            uint32_t& num_words,
+                            std::vector<Segment>& segments,
+                            std::vector<float>* word_weights,
+                            std::string* source)
+{
+    const std::string path = headerPath(folder);
+    if (!fs::exists(path))
+        return false;
+
+    std::ifstream in;
+    in.exceptions(std::ifstream::eofbit | std::ifstream::failbit | std::ifstream::badbit);
+
+    try
+    {
+        in.open(path, std::ios_base::binary);
+        uint32_t magic = 0;
+        uint32_t version = 0;
+        uint32_t num_segments = 0;
+        uint32_t source_size = 0;
+        in.read((char*)(&magic), sizeof(uint32_t));
+        in.read((char*)(&version), sizeof(uint32_t));
+        if (magic != databaseMagic || version != databaseVersion)
+            throw std::runtime_error((boost::format("Unsupported vocabulary tree database file '%s'") % path).str());
+
+        in.read((char*)(&num_words), sizeof(uint32_t));
+        in.read((char*)(&num_segments), sizeof(uint32_t));
+        in.read((char*)(&source_size), sizeof(uint32_t));
+        segments.resize(num_segments);
+        in.read((char*)(segments.data()), num_segments * sizeof(Segment));
+        if (word_weights)
+        {
+            word_weights->resize(num_words);
+            in.read((char*)(word_weights->data()), num_words * sizeof(float));
+        }
+        else
+        {
+            in.seekg(num_words * sizeof(float), std::ios_base::cur);
+        }
+        if (source)
+        {
+            source->resize(source_size);
+            in.read(source->data(), source_size);
+        }
+    }
+    catch (std::ifstream::failure& e)
+    {
+        throw std::runtime_error((boost::format("Failed to load vocabulary tree database file '%s'") % path).str());
+    }
+
+    for (const Segment& segment : segments)
+    {
+        if (segment.words_per_shard == 0)
+            throw std::runtime_error((boost::format("Invalid vocabulary tree database file '%s'") % path).str());
+    }
+
+    return true;
+}
+
+void Database::writeSegment(const std::string& folder, const Segment& segment, const std::vector<DocId>& doc_ids) const
+{
+    // documents: words and features of each document in a CSR layout
+    {
+        std::vector<uint64_t> wordOffsets{0};
+        std::vector<uint64_t> featureOffsets{0};
+        std::vector<Word> words;
+        std::vector<IndexT> featureIds;
+        wordOffsets.reserve(doc_ids.size() + 1);
+
+        for (const DocId docId : doc_ids)
+        {
+            for (const auto& word : database_.at(docId))
+            {
+                words.push_back(word.first);
+                featureIds.insert(featureIds.end(), word.second.begin(), word.second.end());
+                featureOffsets.push_back(featureIds.size());
+            }
+            wordOffsets.push_back(words.size());
+        }
+
+        const std::string path = documentsPath(folder, segment.id);
+        std::ofstream out(path, std::ios_base::binary);
+        const std::vector<uint64_t> sizes{doc_ids.size(), words.size(), featureIds.size()};
+        writeArray(out, sizes);
+        writeArray(out, wordOffsets);
+        writeArray(out, featureOffsets);
+        writeArray(out, doc_ids);
+        writeArray(out, words);
+        writeArray(out, featureIds);
+        out.close();
+        if (!out)
+            throw std::runtime_error((boost::format("Failed to write vocabulary tree database file '%s'") % path).str());
+    }
+
+    // inverted files of the documents of the segment
+    std::vector<InvertedFile> segmentFiles;
+    const std::vector<InvertedFile>* files = &word_files_;
+    if (doc_ids.size() != database_.size())
+    {
+        segmentFiles.resize(word_files_.size());
+        for (const DocId docId : doc_ids)
+        {
+            for (const auto& word : database_.at(docId))
+                segmentFiles[word.first].push_back(WordFrequency(docId, word.second.size()));
+        }
+        files = &segmentFiles;
+    }
+
+    static_assert(sizeof(WordFrequency) == 2 * sizeof(uint32_t), "WordFrequency is stored as two 32-bit integers");
+
+    for (std::size_t shard = 0; shard < nbShards(files->size(), segment.words_per_shard); ++shard)
+    {
+        const std::size_t firstWord = shard * segment.words_per_shard;
+        const std::size_t lastWord = std::min(firstWord + segment.words_per_shard, files->size());
+
+        std::vector<uint64_t> offsets{firstWord, lastWord - firstWord, 0};
+        for (std::size_t word = firstWord; word < lastWord; ++word)
+            offsets.push_back(offsets.back() + (*files)[word].size());
+
+        // empty shards are not written
+        if (offsets.back() == 0)
+            continue;
+
+        const std::string path = invertedFilesPath(folder, segment.id, shard);
+        std::ofstream out(path, std::ios_base::binary);
+        writeArray(out, offsets);
+        for (std::size_t word = firstWord; word < lastWord; ++word)
+            writeArray(out, (*files)[word]);
+        out.close();
+        if (!out)
+            throw std::runtime_error((boost::format("Failed to write vocabulary tree database file '%s'") % path).str());
+    }
+}
+
+void Database::readSegment(const std::string& folder, const Segment& segment)
+{
+    {
+        const std::string path = documentsPath(folder, segment.id);
+        MappedArrays file(path);
+        const uint64_t* sizes = file.next<uint64_t>(3);
+        const uint64_t* wordOffsets = file.next<uint64_t>(sizes[0] + 1);
+        const uint64_t* featureOffsets = file.next<uint64_t>(sizes[1] + 1);
+        const DocId* docIds = file.next<DocId>(sizes[0]);
+        const Word* words = file.next<Word>(sizes[1]);
+        const IndexT* featureIds = file.next<IndexT>(sizes[2]);
+        file.checkOffsets(wordOffsets, sizes[0], sizes[1]);
+        file.checkOffsets(featureOffsets, sizes[1], sizes[2]);
+
+        for (std::size_t d = 0; d < sizes[0]; ++d)
+        {
+            const auto inserted = database_.emplace(docIds[d], SparseHistogram());
+            if (!inserted.second)
+                throw std::runtime_error(
+                  (boost::format("Document %d is saved twice in the vocabulary tree database '%s'") % docIds[d] % folder).str());
+
+            SparseHistogram& histogram = inserted.first->second;
+            for (std::size_t w = wordOffsets[d]; w < wordOffsets[d + 1]; ++w)
+            {
+                if (words[w] < 0 || static_cast<std::size_t>(words[w]) >= word_files_.size())
+                    throw std::runtime_error((boost::format("Invalid vocabulary tree database file '%s'") % path).str());
+                histogram.emplace_hint(
+                  histogram.end(), words[w], std::vector<IndexT>(featureIds + featureOffsets[w], featureIds + featureOffsets[w + 1]));
+            }
+        }
+    }
+
+    for (std::size_t shard = 0; shard < nbShards(word_files_.size(), segment.words_per_shard); ++shard)
+    {
+        const std::string path = invertedFilesPath(folder, segment.id, shard);
+        if (!fs::exists(path))
+            continue;
+
+        MappedArrays file(path);
+        const uint64_t* range = file.next<uint64_t>(2);
+        if (range[0] >= word_files_.size() || range[1] > word_files_.size() - range[0])
+            throw std::runtime_error((boost::format("Invalid vocabulary tree database file '%s'") % path).str());
+
+        const uint64_t* offsets = file.next<uint64_t>(range[1] + 1);
+        const WordFrequency* frequencies = file.next<WordFrequency>(offsets[range[1]]);
+        file.checkOffsets(offsets, range[1], offsets[range[1]]);
+
+        for (std::size_t w = 0; w < range[1]; ++w)
+        {
+            InvertedFile& invertedFile = word_files_[range[0] + w];
+            invertedFile.insert(invertedFile.end(), frequencies + offsets[w], frequencies + offsets[w + 1]);
+        }
+    }
+}
+
 ///**
 // * Normalize a document vector representing the histogram of visual words for a given image
 // *
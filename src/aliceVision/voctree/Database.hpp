@@ -11,6 +11,7 @@
 
 #include <map>
 #include <cstddef>
+#include <set>
 #include <string>
 
 namespace aliceVision {
@@ -67,6 +68,21 @@ class Database
      */
     DocId insert(DocId doc_id, const SparseHistogram& document);
 
+    /**
+     * @brief Remove a document.
+     *
+     * @param doc_id ID of the document to remove
+     * \return false if the document is not in the database.
+     */
+    bool erase(DocId doc_id);
+
+    /**
+     * @brief Check if a document is in the database.
+     *
+     * @param doc_id ID of the document
+     */
+    bool contains(DocId doc_id) const { return database_.find(doc_id) != database_.end(); }
+
     /**
      * @brief Perform a sanity check of the database by querying each document
      * of the database and finding its top N matches
@@ -102,6 +118,23 @@ class Database
               std::vector<DocMatch>& matches,
               const std::string& distanceMethod = "strongCommonPoints") const;
 
+    /**
+     * @brief Find the top N matches in the database for a batch of query documents.
+     *
+     * The queries are processed in parallel. For the distance methods which only depend on the words shared by
+     * the documents, the scores of each query are accumulated over the inverted files of its words, instead of
+     * comparing it to all the documents. The matches are the same as with the single query find().
+     *
+     * @param[in] queries The query documents, normalized sets of quantized words.
+     * @param[in] N The number of matches to return for each query.
+     * @param[out] matches IDs and scores for the top N matching database documents of each query.
+     * @param[in] distanceMethod distance method (norm L1, etc.)
+     */
+    void find(const SparseHistogramPerImage& queries,
+              std::size_t N,
+              std::map<std::size_t, DocMatches>& matches,
+              const std::string& distanceMethod = "strongCommonPoints") const;
+
     /**
      * @brief Compute the TF-IDF weights of all the words. To be called after inserting a corpus of
      * training examples into the database.
@@ -116,14 +149,55 @@ class Database
      */
     std::size_t size() const;
 
+    /**
+     * @brief Return the number of words of the vocabulary
+     */
+    std::size_t words() const { return word_files_.size(); }
+
     /// Save the vocabulary word weights to a file.
     void saveWeights(const std::string& file) const;
     /// Load the vocabulary word weights from a file.
     void loadWeights(const std::string& file);
 
-    // Save weights and documents
-    // void save(const std::string& file) const;
-    // void load(const std::string& file);
+    /**
+     * @brief Save the word weights, the documents and the inverted files in a folder.
+     *
+     * The inverted files are split in shards of \p words_per_shard consecutive words. All the files are plain arrays,
+     * so they can be memory-mapped.
+     * If the folder already contains this database (it was loaded from or saved in this folder), only the documents
+     * inserted since then are written, in a new segment of files. All the documents are rewritten in a single segment
+     * if documents have been erased or if there are too many segments.
+     * An unreadable or unsupported database in the folder is replaced, with all its segment files.
+     *
+     * @param folder The folder of the database, created if needed
+     * @param words_per_shard The number of words in each file of inverted files
+     */
+    void save(const std::string& folder, std::size_t words_per_shard = 65536);
+
+    /**
+     * @brief Load the word weights, the documents and the inverted files saved by save().
+     *
+     * @param folder The folder of the database
+     */
+    void load(const std::string& folder);
+
+    /**
+     * @brief Check if a folder contains a database saved by save().
+     *
+     * @param folder The folder of the database
+     */
+    static bool exists(const std::string& folder);
+
+    /**
+     * @brief Set the description of the data the documents are computed from (vocabulary tree, descriptors...).
+     *        It is saved with the database, so that a caller can check that a loaded database is still valid.
+     *
+     * @param source The opaque description of the source data
+     */
+    void setSource(const std::string& source) { source_ = source; }
+
+    /// @return The description of the data the documents are computed from
+    const std::string& getSource() const { return source_; }
 
     const SparseHistogramPerImage& getSparseHistogramPerImage() const { return database_; }
 
@@ -151,6 +225,30 @@ class Database
     std::vector<InvertedFile> word_files_;
     std::vector<float> word_weights_;
     SparseHistogramPerImage database_;  // Precomputed for inserted documents
+    std::string source_;
+
+    /// Segment of files written by one call to save()
+    struct Segment
+    {
+        uint32_t id;
+        uint32_t words_per_shard;
+
+        bool operator==(const Segment& other) const { return id == other.id && words_per_shard == other.words_per_shard; }
+    };
+
+    // State of the database on disk, to only save the new documents
+    std::string folder_;
+    std::vector<Segment> segments_;
+    std::set<DocId> unsaved_docs_;
+    bool erased_saved_docs_ = false;
+
+    static bool readSegments(const std::string& folder,
+                             uint32_t& num_words,
+                             std::vector<Segment>& segments,
+                             std::vector<float>* word_weights,
+                             std::string* source);
+    void writeSegment(const std::string& folder, const Segment& segment, const std::vector<DocId>& doc_ids) const;
+    void readSegment(const std::string& folder, const Segment& segment);
 
     /**
      * Normalize a document vector representing the histogram of visual words for a given image
@@ -0,0 +1,20 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/voctree/VocabularyTree.i>
+
+%ignore aliceVision::voctree::operator<<;
+%ignore aliceVision::voctree::DocMatch::operator<;
+
+%{
+#include <aliceVision/voctree/Database.hpp>
+%}
+
+%include <aliceVision/voctree/Database.hpp>
+
+%template(DocMatches) std::vector<aliceVision::voctree::DocMatch>;
+%template(DocMatchesPerImage) std::map<size_t, std::vector<aliceVision::voctree::DocMatch>>;
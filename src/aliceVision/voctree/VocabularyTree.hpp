@@ -187,26 +187,29 @@ Word VocabularyTree<Feature, Distance>::quantize(const DescriptorT& feature) con
 {
     typedef typename Distance<Feature, DescriptorT>::result_type distance_type;
 
-    //	printf("asserting\n");
     assert(initialized());
-    //	printf("initialized\n");
+    // the buffer of each thread is only allocated once, as this is called for every descriptor
+    thread_local std::vector<distance_type> distances;
+    distances.resize(splits());
     int32_t index = -1;  // virtual "root" index, which has no associated center.
     for (unsigned level = 0; level < levels_; ++level)
     {
         // Calculate the offset to the first child of the current index.
         int32_t first_child = (index + 1) * splits();
+        // Fewer than splits() children if some centers are invalid.
+        int32_t nb_children = 0;
+        while (nb_children < (int32_t)splits() && valid_centers_[first_child + nb_children])
+            ++nb_children;
         // Find the child center closest to the query.
+        DistanceOneToMany<Distance<DescriptorT, Feature>>::compute(feature, &centers_[first_child], nb_children, distances.data());
         int32_t best_child = first_child;
         distance_type best_distance = std::numeric_limits<distance_type>::max();
-        for (int32_t child = first_child; child < first_child + (int32_t)splits(); ++child)
+        for (int32_t child = 0; child < nb_children; ++child)
         {
-            if (!valid_centers_[child])
-                break;  // Fewer than splits() children.
-            distance_type child_distance = Distance<DescriptorT, Feature>()(feature, centers_[child]);
-            if (child_distance < best_distance)
+            if (distances[child] < best_distance)
             {
-                best_child = child;
-                best_distance = child_distance;
+                best_child = first_child + child;
+                best_distance = distances[child];
             }
         }
         index = best_child;
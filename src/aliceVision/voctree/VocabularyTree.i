@@ -0,0 +1,46 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%import <aliceVision/config.hpp>
+
+// Descriptors are quantized from (n, 128) uint8 arrays, as stored in the .desc files
+%eigen_typemaps(%arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 128, Eigen::RowMajor>), %arg(Eigen::Matrix<unsigned char, Eigen::Dynamic, 128, Eigen::RowMajor>))
+
+// Quantization takes std::vector of descriptors: it is replaced by quantizeToSparse(array) below
+%ignore aliceVision::voctree::IVocabularyTree::quantizeToSparse;
+%ignore aliceVision::voctree::VocabularyTree::quantizeToSparse;
+%ignore aliceVision::voctree::VocabularyTree::quantize;
+%ignore aliceVision::voctree::VocabularyTree::operator==;
+%ignore aliceVision::voctree::createVoctreeForDescriberType;
+%rename(quantizeToSparse) aliceVision::voctree::VocabularyTree::quantizeArrayToSparse;
+%ignore aliceVision::voctree::load;
+
+%{
+#include <aliceVision/voctree/VocabularyTree.hpp>
+%}
+
+%include <aliceVision/voctree/VocabularyTree.hpp>
+
+%template(SparseHistogram) std::map<aliceVision::voctree::Word, std::vector<IndexT>>;
+%template(SparseHistogramPerImage) std::map<aliceVision::voctree::DocId, std::map<aliceVision::voctree::Word, std::vector<IndexT>>>;
+
+%extend aliceVision::voctree::VocabularyTree<aliceVision::feature::Descriptor<float, 128>, aliceVision::voctree::L2> {
+    /**
+     * @brief Quantize descriptors into a sparse histogram of visual words.
+     * @param[in] descriptors (n, 128) uint8 array of descriptors
+     */
+    aliceVision::voctree::SparseHistogram quantizeArrayToSparse(const Eigen::Matrix<unsigned char, Eigen::Dynamic, 128, Eigen::RowMajor>& descriptors) const
+    {
+        std::vector<aliceVision::feature::Descriptor<unsigned char, 128>> descs(descriptors.rows());
+        for (Eigen::Index i = 0; i < descriptors.rows(); ++i)
+            std::copy(descriptors.row(i).data(), descriptors.row(i).data() + 128, descs[i].getData());
+        return $self->quantizeToSparse(descs);
+    }
+};
+
+// Vocabulary trees trained on float SIFT descriptors, as used by imageMatching
+%template(VocabularyTree) aliceVision::voctree::VocabularyTree<aliceVision::feature::Descriptor<float, 128>, aliceVision::voctree::L2>;
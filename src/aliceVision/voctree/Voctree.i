@@ -0,0 +1,21 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%module (module="pyalicevision") voctree
+
+%include <aliceVision/global.i>
+
+// The images are listed from SfMData objects
+%import <aliceVision/sfmData/SfMData.i>
+
+%include <aliceVision/voctree/VocabularyTree.i>
+%include <aliceVision/voctree/Database.i>
+%include <aliceVision/voctree/descriptorLoader.i>
+%include <aliceVision/voctree/databaseIO.i>
+
+%{
+using namespace aliceVision;
+%}
@@ -26,10 +26,10 @@ namespace voctree {
  * @param[in] fileFullPath A file containing the path the features to load, it could be a .txt or an AliceVision .json
  * @param[in] featuresFolders The folder(s) containing the descriptor files (optional)
  * @param[in] tree The vocabulary tree to be used for feature quantization
- * @param[out] db The built database
+ * @param[in,out] db The built database, the images already in the database are skipped
  * @param[out] documents A map containing for each image the list of associated visual words
  * @param[in] Nmax The maximum number of features loaded in each desc file. For Nmax = 0 (default), all the descriptors are loaded.
- * @return the number of overall features read
+ * @return the number of overall features read (in the images which were not already in the database)
  */
 template<class DescriptorT, class VocDescriptorT>
 std::size_t populateDatabase(const sfmData::SfMData& sfmData,
@@ -0,0 +1,43 @@
+// This file is part of the AliceVision project.
+// Copyright (c) 2024 AliceVision contributors.
+// This Source Code Form is subject to the terms of the Mozilla Public License,
+// v. 2.0. If a copy of the MPL was not distributed with this file,
+// You can obtain one at https://mozilla.org/MPL/2.0/.
+
+%include <aliceVision/global.i>
+%include <aliceVision/voctree/Database.i>
+
+%{
+#include <aliceVision/voctree/databaseIO.hpp>
+%}
+
+// The function templates of databaseIO.hpp are exposed for the descriptors used by imageMatching:
+// descriptors are read as uint8 and quantized with a float vocabulary tree
+%inline %{
+namespace aliceVision {
+namespace voctree {
+namespace python {
+
+/**
+ * @brief Read the descriptors of the views of a SfMData, quantize them and insert them in a database.
+ *        The views already in the database are skipped.
+ * @param[in] sfmData The SfMData with the views to insert
+ * @param[in] featuresFolders The folder(s) containing the descriptor files
+ * @param[in] tree The vocabulary tree used to quantize the descriptors
+ * @param[in,out] db The database
+ * @param[in] Nmax The maximum number of descriptors loaded per image (if 0, all the descriptors are loaded)
+ * @return the number of descriptors read
+ */
+std::size_t populateDatabase(const sfmData::SfMData& sfmData,
+                             const std::vector<std::string>& featuresFolders,
+                             const aliceVision::voctree::VocabularyTree<aliceVision::feature::Descriptor<float, 128>, aliceVision::voctree::L2>& tree,
+                             Database& db,
+                             int Nmax = 0)
+{
+    return aliceVision::voctree::populateDatabase<feature::Descriptor<unsigned char, 128>>(sfmData, featuresFolders, tree, db, Nmax);
+}
+
+}  // namespace python
+}  // namespace voctree
+}  // namespace aliceVision
+%}
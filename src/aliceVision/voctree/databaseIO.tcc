@@ -38,7 +38,13 @@ std::size_t populateDatabase(const sfmData::SfMData& sfmData,
   // Run through the path vector and read the descriptors
   for(const auto &currentFile : descriptorsFiles)
   {
-    
+    // the document has been loaded with the database
+    if(db.contains(currentFile.first))
+    {
+      ++display;
+      continue;
+    }
+
     std::vector<DescriptorT> descriptors;
 
     // Read the descriptors
@@ -6,6 +6,9 @@
 
 #pragma once
 
+#include <aliceVision/feature/Descriptor.hpp>
+#include <aliceVision/feature/distanceKernels.hpp>
+
 #include <stdint.h>
 #include <Eigen/Core>
 
@@ -51,5 +54,42 @@ struct L2<Eigen::Matrix<Scalar, Rows, Cols, Options, MaxRows, MaxCols>, Eigen::M
     result_type operator()(const feature_type& a, const feature_type& b) const { return (a - b).squaredNorm(); }
 };
 
+/**
+ * @brief Distances between a descriptor and contiguous centers.
+ *
+ * The distance is evaluated center by center, the specializations below use the batched kernels.
+ */
+template<class Distance>
+struct DistanceOneToMany
+{
+    template<class DescriptorA, class DescriptorB>
+    static void compute(const DescriptorA& a, const DescriptorB* centers, int nbCenters, typename Distance::result_type* distances)
+    {
+        const Distance distance = Distance();
+        for (int i = 0; i < nbCenters; ++i)
+            distances[i] = distance(a, centers[i]);
+    }
+};
+
+/// L2 distance between a descriptor and float centers
+template<typename T, std::size_t N>
+struct DistanceOneToManyL2
+{
+    static_assert(sizeof(feature::Descriptor<float, N>) == N * sizeof(float), "The centers must be stored contiguously.");
+
+    static void compute(const feature::Descriptor<T, N>& a, const feature::Descriptor<float, N>* centers, int nbCenters, double* distances)
+    {
+        feature::squaredL2OneToMany(a.getData(), centers->getData(), nullptr, nbCenters, N, distances);
+    }
+};
+
+template<std::size_t N>
+struct DistanceOneToMany<L2<feature::Descriptor<unsigned char, N>, feature::Descriptor<float, N>>> : public DistanceOneToManyL2<unsigned char, N>
+{};
+
+template<std::size_t N>
+struct DistanceOneToMany<L2<feature::Descriptor<float, N>, feature::Descriptor<float, N>>> : public DistanceOneToManyL2<float, N>
+{};
+
 }  // namespace voctree
 }  // namespace aliceVision
@@ -5,9 +5,14 @@
 // You can obtain one at https://mozilla.org/MPL/2.0/.
 
 #include <aliceVision/voctree/Database.hpp>
+#include <aliceVision/system/Logger.hpp>
+#include <aliceVision/system/Timer.hpp>
 
+#include <filesystem>
 #include <iostream>
 #include <fstream>
+#include <iterator>
+#include <random>
 #include <vector>
 
 #define BOOST_TEST_MODULE vocabularyTree
@@ -15,6 +20,7 @@
 #include <boost/test/unit_test.hpp>
 #include <boost/test/tools/floating_point_comparison.hpp>
 
+using namespace aliceVision;
 using namespace aliceVision::voctree;
 
 BOOST_AUTO_TEST_CASE(database)
@@ -57,3 +63,264 @@ BOOST_AUTO_TEST_CASE(database)
         BOOST_CHECK_SMALL(static_cast<double>(match[0].score), 0.001);
     }
 }
+
+namespace {
+
+std::vector<char> readFile(const std::string& path)
+{
+    std::ifstream in(path, std::ios_base::binary);
+    return std::vector<char>(std::istreambuf_iterator<char>(in), std::istreambuf_iterator<char>());
+}
+
+void checkSameDatabase(const Database& db, const Database& expected, const std::string& tmpFolder)
+{
+    BOOST_CHECK_EQUAL(db.words(), expected.words());
+    BOOST_CHECK(db.getSparseHistogramPerImage() == expected.getSparseHistogramPerImage());
+
+    // TF-IDF weights are computed from the inverted files
+    Database a(db);
+    Database b(expected);
+    a.computeTfIdfWeights();
+    b.computeTfIdfWeights();
+    a.saveWeights(tmpFolder + "/a.weights");
+    b.saveWeights(tmpFolder + "/b.weights");
+    BOOST_CHECK(readFile(tmpFolder + "/a.weights") == readFile(tmpFolder + "/b.weights"));
+
+    for (const auto& doc : expected.getSparseHistogramPerImage())
+    {
+        DocMatches matches;
+        DocMatches expectedMatches;
+        a.find(doc.second, 5, matches, "weightedStrongCommonPoints");
+        b.find(doc.second, 5, expectedMatches, "weightedStrongCommonPoints");
+        BOOST_CHECK(matches == expectedMatches);
+    }
+}
+
+/// Random documents with few words, so that the documents share words and some words appear several times
+std::vector<SparseHistogram> randomDocuments(std::size_t nbDocuments, std::size_t nbFeatures, Word cardWords, std::mt19937& generator)
+{
+    std::uniform_int_distribution<Word> wordDistribution(0, cardWords - 1);
+    std::vector<SparseHistogram> documents(nbDocuments);
+    for (SparseHistogram& histo : documents)
+    {
+        std::vector<Word> words(nbFeatures);
+        for (Word& w : words)
+            w = wordDistribution(generator);
+        computeSparseHistogram(words, histo);
+    }
+    return documents;
+}
+
+}  // namespace
+
+BOOST_AUTO_TEST_CASE(database_batchFind)
+{
+    std::mt19937 generator(7);
+    const std::vector<SparseHistogram> documents = randomDocuments(60, 40, 200, generator);
+
+    Database db(200);
+    SparseHistogramPerImage queries;
+    for (std::size_t i = 0; i < documents.size(); ++i)
+    {
+        // the queries are not all in the database
+        if (i % 4 != 0)
+            db.insert(i * 3, documents[i]);
+        queries[i * 3] = documents[i];
+    }
+    db.computeTfIdfWeights();
+
+    // weightedStrongCommonPoints is not tested: the single query find() can read past the end of the histograms
+    for (const std::string distanceMethod : {"classic", "commonPoints", "strongCommonPoints", "inversedWeightedCommonPoints"})
+    {
+        for (const std::size_t N : {std::size_t(0), std::size_t(10), db.size() + 5})
+        {
+            std::map<std::size_t, DocMatches> matches;
+            db.find(queries, N, matches, distanceMethod);
+            BOOST_CHECK_EQUAL(matches.size(), queries.size());
+
+            for (const auto& query : queries)
+            {
+                DocMatches expectedMatches;
+                db.find(query.second, N, expectedMatches, distanceMethod);
+                BOOST_CHECK(matches.at(query.first) == expectedMatches);
+            }
+        }
+    }
+
+    std::map<std::size_t, DocMatches> matches;
+    BOOST_CHECK_THROW(db.find(queries, 10, matches, "unknown"), std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(database_batchFind_benchmark)
+{
+    std::mt19937 generator(42);
+    const std::vector<SparseHistogram> documents = randomDocuments(500, 500, 100000, generator);
+
+    Database db(100000);
+    for (std::size_t i = 0; i < documents.size(); ++i)
+        db.insert(i, documents[i]);
+    db.computeTfIdfWeights();
+
+    system::Timer timer;
+    std::map<std::size_t, DocMatches> singleMatches;
+    for (const auto& doc : db.getSparseHistogramPerImage())
+        db.find(doc.second, 50, singleMatches[doc.first]);
+    const double singleDuration = timer.elapsedMs();
+
+    timer.reset();
+    std::map<std::size_t, DocMatches> batchMatches;
+    db.find(db.getSparseHistogramPerImage(), 50, batchMatches);
+    const double batchDuration = timer.elapsedMs();
+
+    BOOST_CHECK(batchMatches == singleMatches);
+    ALICEVISION_LOG_INFO("Query " << db.size() << " documents: single queries " << system::prettyTime(singleDuration) << ", batch "
+                                  << system::prettyTime(batchDuration));
+}
+
+BOOST_AUTO_TEST_CASE(database_saveLoad)
+{
+    namespace fs = std::filesystem;
+
+    const int cardWords = 100;
+    const std::string folder = (fs::temp_directory_path() / "voctree_database_saveLoad").string();
+    fs::remove_all(folder);
+
+    std::mt19937 generator(42);
+    std::uniform_int_distribution<Word> wordDistribution(0, cardWords - 1);
+    std::vector<SparseHistogram> documents(20);
+    for (SparseHistogram& histo : documents)
+    {
+        std::vector<Word> words(30);
+        for (Word& w : words)
+            w = wordDistribution(generator);
+        computeSparseHistogram(words, histo);
+    }
+
+    Database expected(cardWords);
+    Database db(cardWords);
+    for (int i = 0; i < 12; ++i)
+    {
+        expected.insert(i, documents[i]);
+        db.insert(i, documents[i]);
+    }
+
+    db.setSource("source A");
+
+    // 12 documents in a first segment, with 7 shards of inverted files
+    BOOST_CHECK(!Database::exists(folder));
+    db.save(folder, 16);
+    BOOST_CHECK(Database::exists(folder));
+    BOOST_CHECK(fs::exists(folder + "/documents_0.bin"));
+    BOOST_CHECK(fs::exists(folder + "/invertedFiles_0_6.bin"));
+    {
+        Database loaded;
+        loaded.load(folder);
+        BOOST_CHECK_EQUAL(loaded.getSource(), "source A");
+        checkSameDatabase(loaded, expected, folder);
+    }
+
+    // new documents, with ids lower than the saved ones, are saved in a second segment
+    Database incremental;
+    incremental.load(folder);
+    for (int i = 12; i < 20; ++i)
+    {
+        const DocId docId = 100 - i;
+        expected.insert(docId, documents[i]);
+        incremental.insert(docId, documents[i]);
+    }
+    const std::vector<char> firstSegment = readFile(folder + "/documents_0.bin");
+    incremental.save(folder, 16);
+    BOOST_CHECK(readFile(folder + "/documents_0.bin") == firstSegment);
+    BOOST_CHECK(fs::exists(folder + "/documents_1.bin"));
+    {
+        Database loaded;
+        loaded.load(folder);
+        BOOST_CHECK_EQUAL(loaded.size(), 20);
+        checkSameDatabase(loaded, expected, folder);
+    }
+
+    // erasing a saved document rewrites all the documents in a single segment
+    BOOST_CHECK(incremental.erase(3));
+    BOOST_CHECK(!incremental.erase(3));
+    BOOST_CHECK(expected.erase(3));
+    BOOST_CHECK(!incremental.contains(3));
+    incremental.save(folder, 32);
+    BOOST_CHECK(!fs::exists(folder + "/documents_0.bin"));
+    BOOST_CHECK(!fs::exists(folder + "/documents_1.bin"));
+    BOOST_CHECK(fs::exists(folder + "/documents_2.bin"));
+    {
+        Database loaded;
+        loaded.load(folder);
+        BOOST_CHECK_EQUAL(loaded.size(), 19);
+        checkSameDatabase(loaded, expected, folder);
+    }
+
+    // a change of source rewrites all the documents in a single segment
+    BOOST_CHECK_EQUAL(incremental.getSource(), "source A");
+    incremental.setSource("source B");
+    incremental.save(folder, 32);
+    BOOST_CHECK(!fs::exists(folder + "/documents_2.bin"));
+    BOOST_CHECK(fs::exists(folder + "/documents_3.bin"));
+    {
+        Database loaded;
+        loaded.load(folder);
+        BOOST_CHECK_EQUAL(loaded.getSource(), "source B");
+        BOOST_CHECK_EQUAL(loaded.size(), 19);
+        checkSameDatabase(loaded, expected, folder);
+    }
+
+    fs::remove_all(folder);
+}
+
+BOOST_AUTO_TEST_CASE(database_saveOverInvalid)
+{
+    namespace fs = std::filesystem;
+
+    const int cardWords = 100;
+    const std::string folder = (fs::temp_directory_path() / "voctree_database_saveOverInvalid").string();
+    fs::remove_all(folder);
+
+    std::mt19937 generator(42);
+    std::uniform_int_distribution<Word> wordDistribution(0, cardWords - 1);
+    Database db(cardWords);
+    for (int i = 0; i < 10; ++i)
+    {
+        std::vector<Word> words(30);
+        for (Word& w : words)
+            w = wordDistribution(generator);
+        SparseHistogram histo;
+        computeSparseHistogram(words, histo);
+        db.insert(i, histo);
+    }
+
+    const auto writeHeader = [&](const std::vector<uint32_t>& values) {
+        std::ofstream out(folder + "/database.bin", std::ios_base::binary);
+        out.write(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(uint32_t));
+    };
+
+    // database of another version, with stale segment files
+    for (const std::vector<uint32_t>& header : {std::vector<uint32_t>{0x42445641, 1, cardWords, 3, 0}, std::vector<uint32_t>{0x42445641}})
+    {
+        fs::create_directories(folder);
+        writeHeader(header);
+        std::ofstream(folder + "/documents_5.bin") << "stale";
+        std::ofstream(folder + "/invertedFiles_5_0.bin") << "stale";
+
+        {
+            Database loaded;
+            BOOST_CHECK_THROW(loaded.load(folder), std::runtime_error);
+        }
+
+        BOOST_CHECK_NO_THROW(db.save(folder, 16));
+        BOOST_CHECK(!fs::exists(folder + "/documents_5.bin"));
+        BOOST_CHECK(!fs::exists(folder + "/invertedFiles_5_0.bin"));
+        BOOST_CHECK(fs::exists(folder + "/documents_0.bin"));
+        {
+            Database loaded;
+            loaded.load(folder);
+            checkSameDatabase(loaded, db, folder);
+        }
+
+        fs::remove_all(folder);
+    }
+}
@@ -320,7 +320,7 @@ int aliceVision_main(int argc, char** argv)
     }
 
     // check sensor database
-    std::vector<sensorDB::Datasheet> sensorDatabase;
+    sensorDB::SensorDatabase sensorDatabase;
     if (sensorDatabasePath.empty())
     {
         const auto root = image::getAliceVisionRoot();
@@ -10,7 +10,6 @@
 #include <aliceVision/sfmData/SfMData.hpp>
 #include <aliceVision/sfmDataIO/sfmDataIO.hpp>
 #include <aliceVision/mvsUtils/MultiViewParams.hpp>
-#include <aliceVision/depthMap/computeOnMultiGPUs.hpp>
 #include <aliceVision/depthMap/DepthMapEstimator.hpp>
 #include <aliceVision/depthMap/DepthMapParams.hpp>
 #include <aliceVision/depthMap/SgmParams.hpp>
@@ -22,7 +21,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 4
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 1
 
 using namespace aliceVision;
 
@@ -215,8 +214,13 @@ int aliceVision_main(int argc, char* argv[])
          "Export intermediate volumes 9 points from the SGM and Refine steps in CSV files.")
         ("exportTilePattern", po::value<bool>(&depthMapParams.exportTilePattern)->default_value(depthMapParams.exportTilePattern),
          "Export workflow tile pattern.")
+        ("backend", po::value<depthMap::EDepthMapBackend>(&depthMapParams.backend)->default_value(depthMapParams.backend),
+         "Depth map estimation backend:\n"
+         "* auto: CUDA if a CUDA-enabled GPU is available, CPU otherwise\n"
+         "* cuda: CUDA-enabled GPU(s)\n"
+         "* cpu: CPU (slower, custom patch pattern, consistent scale and intermediate exports are not supported)")
         ("nbGPUs", po::value<int>(&nbGPUs)->default_value(nbGPUs),
-         "Number of GPUs to use (0 means use all GPUs).");
+         "Number of GPUs to use with the CUDA backend (0 means use all GPUs).");
     // clang-format on
 
     CmdLine cmdline("Dense Reconstruction.\n"
@@ -248,9 +252,10 @@ int aliceVision_main(int argc, char* argv[])
     ALICEVISION_LOG_INFO(gpu::gpuInformationCUDA());
 
     // check if the gpu suppport CUDA compute capability 2.0
-    if (!gpu::gpuSupportCUDA(2, 0))
+    // note: without CUDA-Enabled GPU, the auto backend falls back to the CPU backend
+    if (depthMapParams.backend == depthMap::EDepthMapBackend::CUDA && !gpu::gpuSupportCUDA(2, 0))
     {
-        ALICEVISION_LOG_ERROR("This program needs a CUDA-Enabled GPU (with at least compute capability 2.0).");
+        ALICEVISION_LOG_ERROR("The CUDA backend needs a CUDA-Enabled GPU (with at least compute capability 2.0).");
         return EXIT_FAILURE;
     }
 
@@ -429,7 +434,7 @@ int aliceVision_main(int argc, char* argv[])
     depthMap::DepthMapEstimator depthMapEstimator(mp, tileParams, depthMapParams, sgmParams, refineParams);
 
     // estimate depth maps
-    depthMap::computeOnMultiGPUs(cams, depthMapEstimator, nbGPUs);
+    depthMapEstimator.computeDepthMaps(cams, nbGPUs);
 
     ALICEVISION_COMMANDLINE_END
 }
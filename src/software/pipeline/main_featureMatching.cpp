@@ -43,7 +43,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 2
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 4
 
 using namespace aliceVision;
 using namespace aliceVision::camera;
@@ -104,6 +104,8 @@ int aliceVision_main(int argc, char** argv)
     int rangeStart = -1;
     int rangeSize = 0;
     std::string nearestMatchingMethod = "ANN_L2";
+    matching::HnswParams hnswParams;
+    std::size_t matcherCacheSize = ImageCollectionMatcher_generic::defaultCacheMaxMemorySize >> 20;
     robustEstimation::ERobustEstimator geometricEstimator = robustEstimation::ERobustEstimator::ACRANSAC;
     double geometricErrorMax = 0.0;  //< the maximum reprojection error allowed for image matching with geometric validation
     double knownPosesGeometricErrorMax = 4.0;
@@ -111,12 +113,14 @@ int aliceVision_main(int argc, char** argv)
     bool guidedMatching = false;
     bool crossMatching = false;
     int maxIteration = 50000;
+    robustEstimation::ACRansacAdaptiveParams acRansacAdaptiveParams;
     bool matchFilePerImage = false;
+    bool mapDescriptors = false;
     size_t numMatchesToKeep = 0;
     bool useGridSort = true;
     bool exportDebugFiles = false;
     bool matchFromKnownCameraPoses = false;
-    const std::string fileExtension = "txt";
+    std::string fileExtension = "txt";
     int randomSeed = std::mt19937::default_seed;
     double minRequired2DMotion = -1.0;
 
@@ -145,8 +149,16 @@ int aliceVision_main(int argc, char** argv)
          "* CASCADE_HASHING_L2: L2 Cascade Hashing matching\n"
          "* FAST_CASCADE_HASHING_L2: L2 Cascade Hashing with precomputed hashed regions\n"
          "(faster than CASCADE_HASHING_L2 but use more memory)\n"
+         "* HNSW_L2: L2 Approximate Nearest Neighbor matching in Hierarchical Navigable Small World graphs\n"
+         "(the graph of an image is kept for its next pairs within '--matcherCacheSize', recall is set with '--hnswEfSearch')\n"
          "For Binary based descriptor:\n"
          "* BRUTE_FORCE_HAMMING: BruteForce Hamming matching")
+        ("hnswEfSearch", po::value<int>(&hnswParams.efSearch)->default_value(hnswParams.efSearch),
+         "Number of candidates explored for each descriptor with the HNSW_L2 method: "
+         "higher values improve the recall of the nearest neighbors at the cost of speed.")
+        ("matcherCacheSize", po::value<std::size_t>(&matcherCacheSize)->default_value(matcherCacheSize),
+         "Memory budget (in MB) of the per image matchers (kd-trees, hashed descriptors, HNSW graphs) kept to be reused by the next image pairs. "
+         "It avoids rebuilding the matchers of the images with the '--crossMatching' option.")
         ("geometricEstimator", po::value<robustEstimation::ERobustEstimator>(&geometricEstimator)->default_value(geometricEstimator),
          "Geometric estimator:\n"
          "* acransac: A-Contrario Ransac\n"
@@ -168,10 +180,21 @@ int aliceVision_main(int argc, char** argv)
          "Make sure that the matching process is symmetric (same matches for I->J than fo J->I).")
         ("matchFilePerImage", po::value<bool>(&matchFilePerImage)->default_value(matchFilePerImage),
          "Save matches in a separate file per image.")
+        ("matchFileExtension", po::value<std::string>(&fileExtension)->default_value(fileExtension),
+         "Format of the match files: txt or bin. "
+         "Binary files are faster to load and index the image pairs, so that filtered out pairs are not read.")
+        ("mapDescriptors", po::value<bool>(&mapDescriptors)->default_value(mapDescriptors),
+         "Memory-map the descriptor files instead of loading them in memory. "
+         "Descriptors are read on demand from the page cache, which reduces the memory footprint on large datasets.")
         ("distanceRatio", po::value<float>(&distRatio)->default_value(distRatio),
          "Distance ratio to discard non meaningful matches.")
         ("maxIteration", po::value<int>(&maxIteration)->default_value(maxIteration),
          "Maximum number of iterations allowed in Ransac step.")
+        ("adaptiveRansac", po::value<bool>(&acRansacAdaptiveParams.enabled)->default_value(acRansacAdaptiveParams.enabled),
+         "Stop the ACRansac iterations as soon as a sample without outliers has been drawn with the confidence '--adaptiveRansacConfidence', "
+         "and discard the bad models on a subset of the matches before evaluating all the matches.")
+        ("adaptiveRansacConfidence", po::value<double>(&acRansacAdaptiveParams.confidence)->default_value(acRansacAdaptiveParams.confidence),
+         "Confidence of the adaptive ACRansac stopping criterion, in ]0, 1[.")
         ("useGridSort", po::value<bool>(&useGridSort)->default_value(useGridSort),
          "Use matching grid sort.")
         ("minRequired2DMotion", po::value<double>(&minRequired2DMotion)->default_value(minRequired2DMotion),
@@ -205,6 +228,9 @@ int aliceVision_main(int argc, char** argv)
     if (!adjustRobustEstimatorThreshold(geometricEstimator, geometricErrorMax, defaultLoRansacMatchingError))
         return EXIT_FAILURE;
 
+    if (!checkACRansacAdaptiveParams(acRansacAdaptiveParams))
+        return EXIT_FAILURE;
+
     std::mt19937 randomNumberGenerator(randomSeed == -1 ? std::random_device()() : randomSeed);
 
     // check and set input options
@@ -214,6 +240,12 @@ int aliceVision_main(int argc, char** argv)
         return EXIT_FAILURE;
     }
 
+    if (fileExtension != "txt" && fileExtension != "bin")
+    {
+        ALICEVISION_LOG_ERROR("Invalid match file extension: " + fileExtension);
+        return EXIT_FAILURE;
+    }
+
     const matchingImageCollection::EGeometricFilterType geometricFilterType =
       matchingImageCollection::EGeometricFilterType_stringToEnum(geometricFilterTypeName);
 
@@ -281,7 +313,8 @@ int aliceVision_main(int argc, char** argv)
 
     // allocate the right Matcher according the Matching requested method
     EMatcherType collectionMatcherType = EMatcherType_stringToEnum(nearestMatchingMethod);
-    std::unique_ptr<IImageCollectionMatcher> imageCollectionMatcher = createImageCollectionMatcher(collectionMatcherType, distRatio, crossMatching);
+    std::unique_ptr<IImageCollectionMatcher> imageCollectionMatcher =
+      createImageCollectionMatcher(collectionMatcherType, distRatio, crossMatching, hnswParams, matcherCacheSize << 20);
 
     const std::vector<feature::EImageDescriberType> describerTypes = feature::EImageDescriberType_stringToEnums(describerTypesName);
 
@@ -291,7 +324,7 @@ int aliceVision_main(int argc, char** argv)
 
     // load the corresponding view regions
     RegionsPerView regionPerView;
-    if (!sfm::loadRegionsPerView(regionPerView, sfmData, featuresFolders, describerTypes, filter))
+    if (!sfm::loadRegionsPerView(regionPerView, sfmData, featuresFolders, describerTypes, filter, mapDescriptors))
     {
         ALICEVISION_LOG_ERROR("Invalid regions in '" + sfmDataFilename + "'");
         return EXIT_FAILURE;
@@ -440,25 +473,27 @@ int aliceVision_main(int argc, char** argv)
 
         case EGeometricFilterType::FUNDAMENTAL_MATRIX:
         {
-            matchingImageCollection::robustModelEstimation(geometricMatches,
-                                                           &sfmData,
-                                                           regionPerView,
-                                                           GeometricFilterMatrix_F_AC(geometricErrorMax, maxIteration, geometricEstimator),
-                                                           mapPutativesMatches,
-                                                           randomNumberGenerator,
-                                                           guidedMatching);
+            matchingImageCollection::robustModelEstimation(
+              geometricMatches,
+              &sfmData,
+              regionPerView,
+              GeometricFilterMatrix_F_AC(geometricErrorMax, maxIteration, geometricEstimator, false, acRansacAdaptiveParams),
+              mapPutativesMatches,
+              randomNumberGenerator,
+              guidedMatching);
         }
         break;
 
         case EGeometricFilterType::FUNDAMENTAL_WITH_DISTORTION:
         {
-            matchingImageCollection::robustModelEstimation(geometricMatches,
-                                                           &sfmData,
-                                                           regionPerView,
-                                                           GeometricFilterMatrix_F_AC(geometricErrorMax, maxIteration, geometricEstimator, true),
-                                                           mapPutativesMatches,
-                                                           randomNumberGenerator,
-                                                           guidedMatching);
+            matchingImageCollection::robustModelEstimation(
+              geometricMatches,
+              &sfmData,
+              regionPerView,
+              GeometricFilterMatrix_F_AC(geometricErrorMax, maxIteration, geometricEstimator, true, acRansacAdaptiveParams),
+              mapPutativesMatches,
+              randomNumberGenerator,
+              guidedMatching);
         }
         break;
 
@@ -467,7 +502,7 @@ int aliceVision_main(int argc, char** argv)
             matchingImageCollection::robustModelEstimation(geometricMatches,
                                                            &sfmData,
                                                            regionPerView,
-                                                           GeometricFilterMatrix_E_AC(geometricErrorMax, maxIteration),
+                                                           GeometricFilterMatrix_E_AC(geometricErrorMax, maxIteration, acRansacAdaptiveParams),
                                                            mapPutativesMatches,
                                                            randomNumberGenerator,
                                                            guidedMatching);
@@ -482,7 +517,7 @@ int aliceVision_main(int argc, char** argv)
             matchingImageCollection::robustModelEstimation(geometricMatches,
                                                            &sfmData,
                                                            regionPerView,
-                                                           GeometricFilterMatrix_H_AC(geometricErrorMax, maxIteration),
+                                                           GeometricFilterMatrix_H_AC(geometricErrorMax, maxIteration, acRansacAdaptiveParams),
                                                            mapPutativesMatches,
                                                            randomNumberGenerator,
                                                            guidedMatching,
@@ -31,7 +31,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 1
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 1
 
 using namespace aliceVision;
 using namespace aliceVision::voctree;
@@ -66,6 +66,8 @@ int aliceVision_main(int argc, char** argv)
     std::string weightsFilepath;
     /// flag for the optional weights file
     bool withWeights = false;
+    /// the folder of the database saved between runs
+    std::string databaseFolder;
 
     // multiple SfM parameters
 
@@ -110,7 +112,10 @@ int aliceVision_main(int argc, char** argv)
          "This software is intended to be used with a generic, pre-trained vocabulary tree.")
         ("weights,w", po::value<std::string>(&weightsFilepath)->default_value(weightsFilepath),
          "Input name for the vocabulary tree weight file. "
-         "If not provided, all the voctree leaves will have the same weight.");
+         "If not provided, all the voctree leaves will have the same weight.")
+        ("databaseFolder", po::value<std::string>(&databaseFolder)->default_value(databaseFolder),
+         "Folder in which the vocabulary tree database is saved, to be reused by the next runs: "
+         "only the new images are quantized. It has to be cleared if the features or the number of descriptors change.");
 
     po::options_description multiSfMParams("Multiple SfM");
     multiSfMParams.add_options()
@@ -219,6 +224,7 @@ int aliceVision_main(int argc, char** argv)
                              useMultiSfM,
                              descriptorsFilesA,
                              numImageQuery,
+                             databaseFolder,
                              selectedPairs);
             break;
         }
@@ -245,6 +251,7 @@ int aliceVision_main(int argc, char** argv)
                              useMultiSfM,
                              descriptorsFilesA,
                              numImageQuery,
+                             databaseFolder,
                              selectedPairs);
             break;
         }
@@ -29,7 +29,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 2
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 4
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 5
 
 using namespace aliceVision;
 
@@ -170,6 +170,11 @@ int aliceVision_main(int argc, char** argv)
          "Reprojection error threshold (in pixels) for the localizer estimator (0 for default value according to the estimator).")
         ("localizerEstimatorMaxIterations", po::value<std::size_t>(&sfmParams.localizerEstimatorMaxIterations)->default_value(sfmParams.localizerEstimatorMaxIterations),
          "Maximum number of RANSAC iterations.")
+        ("localizerAdaptiveRansac", po::value<bool>(&sfmParams.localizerAdaptiveParams.enabled)->default_value(sfmParams.localizerAdaptiveParams.enabled),
+         "Stop the ACRansac iterations of the localizer as soon as a sample without outliers has been drawn with the confidence "
+         "'--localizerAdaptiveRansacConfidence', and discard the bad poses on a subset of the points before evaluating all the points.")
+        ("localizerAdaptiveRansacConfidence", po::value<double>(&sfmParams.localizerAdaptiveParams.confidence)->default_value(sfmParams.localizerAdaptiveParams.confidence),
+         "Confidence of the adaptive ACRansac stopping criterion of the localizer, in ]0, 1[.")
         ("useOnlyMatchesFromInputFolder", po::value<bool>(&useOnlyMatchesFromInputFolder)->default_value(useOnlyMatchesFromInputFolder),
          "Use only matches from the input matchesFolder parameter.\n"
          "Matches folders previously added to the SfMData file will be ignored.")
@@ -216,6 +221,11 @@ int aliceVision_main(int argc, char** argv)
         return EXIT_FAILURE;
     }
 
+    if (!robustEstimation::checkACRansacAdaptiveParams(sfmParams.localizerAdaptiveParams))
+    {
+        return EXIT_FAILURE;
+    }
+
     // load input SfMData scene
     sfmData::SfMData sfmData;
     if (!sfmDataIO::load(sfmData, sfmDataFilename, sfmDataIO::ESfMData::ALL))
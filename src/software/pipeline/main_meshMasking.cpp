@@ -354,6 +354,8 @@ void meshMasking(const mvsUtils::MultiViewParams& mp,
                  const bool usePointsVisibilities)
 {
     MaskCache maskCache(mp, masksFolders, undistortMasks, maskExtension);
+    // release the mask undistortion grids once the mesh is masked
+    const camera::RemapGridCache::ScopedClear remapGridCacheClear;
 
     // compute visibility for every vertex
     // also update inputMesh.pointsVisibilities according to the masks
@@ -129,6 +129,9 @@ bool prepareDenseScene(const SfMData& sfmData,
     const double medianCameraExposure = sfmData.getMedianCameraExposureSetting().getExposure();
     ALICEVISION_LOG_INFO("Median Camera Exposure: " << medianCameraExposure << ", Median EV: " << std::log2(1.0 / medianCameraExposure));
 
+    // release the undistortion grids once all the images are exported
+    const camera::RemapGridCache::ScopedClear remapGridCacheClear;
+
 #pragma omp parallel for num_threads(3)
     for (int i = 0; i < viewIds.size(); ++i)
     {
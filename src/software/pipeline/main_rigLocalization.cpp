@@ -16,6 +16,7 @@
 #include <aliceVision/sfmData/SfMData.hpp>
 #include <aliceVision/sfmDataIO/sfmDataIO.hpp>
 #include <aliceVision/robustEstimation/estimators.hpp>
+#include <aliceVision/robustEstimation/ACRansac.hpp>
 #include <aliceVision/system/Logger.hpp>
 #include <aliceVision/cmdline/cmdline.hpp>
 #include <aliceVision/system/main.hpp>
@@ -45,7 +46,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 1
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 1
 
 using namespace aliceVision;
 
@@ -75,6 +76,8 @@ int aliceVision_main(int argc, char** argv)
     std::vector<feature::EImageDescriberType> matchDescTypes;
     /// the estimator to use for resection
     robustEstimation::ERobustEstimator resectionEstimator = robustEstimation::ERobustEstimator::ACRANSAC;
+    /// the early termination of the ACRansac iterations for resection
+    robustEstimation::ACRansacAdaptiveParams resectionAdaptiveParams;
     /// the estimator to use for matching
     robustEstimation::ERobustEstimator matchingEstimator = robustEstimation::ERobustEstimator::ACRANSAC;
     /// the possible choices for the estimators as strings
@@ -138,6 +141,11 @@ int aliceVision_main(int argc, char** argv)
          "Preset for the feature extractor when localizing a new image {LOW,MEDIUM,NORMAL,HIGH,ULTRA}.")
         ("resectionEstimator", po::value<robustEstimation::ERobustEstimator>(&resectionEstimator)->default_value(resectionEstimator),
          std::string("The type of *sac framework to use for resection (" + str_estimatorChoices + ").").c_str())
+        ("resectionAdaptiveRansac", po::value<bool>(&resectionAdaptiveParams.enabled)->default_value(resectionAdaptiveParams.enabled),
+         "Stop the ACRansac iterations of the resection as soon as a sample without outliers has been drawn with the confidence "
+         "'--resectionAdaptiveRansacConfidence', and discard the bad poses on a subset of the points before evaluating all the points.")
+        ("resectionAdaptiveRansacConfidence", po::value<double>(&resectionAdaptiveParams.confidence)->default_value(resectionAdaptiveParams.confidence),
+         "Confidence of the adaptive ACRansac stopping criterion of the resection, in ]0, 1[.")
         ("matchingEstimator", po::value<robustEstimation::ERobustEstimator>(&matchingEstimator)->default_value(matchingEstimator),
          std::string("The type of *sac framework to use for matching (" + str_estimatorChoices + ").").c_str())
         ("refineIntrinsics", po::value<bool>(&refineIntrinsics),
@@ -205,7 +213,8 @@ int aliceVision_main(int argc, char** argv)
     const double defaultLoRansacMatchingError = 4.0;
     const double defaultLoRansacResectionError = 4.0;
     if (!adjustRobustEstimatorThreshold(matchingEstimator, matchingErrorMax, defaultLoRansacMatchingError) ||
-        !adjustRobustEstimatorThreshold(resectionEstimator, resectionErrorMax, defaultLoRansacResectionError))
+        !adjustRobustEstimatorThreshold(resectionEstimator, resectionErrorMax, defaultLoRansacResectionError) ||
+        !checkACRansacAdaptiveParams(resectionAdaptiveParams))
     {
         return EXIT_FAILURE;
     }
@@ -275,6 +284,7 @@ int aliceVision_main(int argc, char** argv)
     param->_refineIntrinsics = refineIntrinsics;
     param->_errorMax = resectionErrorMax;
     param->_resectionEstimator = resectionEstimator;
+    param->_resectionAdaptiveParams = resectionAdaptiveParams;
     param->_matchingEstimator = matchingEstimator;
     param->_useLocalizeRigNaive = useLocalizeRigNaive;
     param->_angularThreshold = degreeToRadian(angularThreshold);
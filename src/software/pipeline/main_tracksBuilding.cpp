@@ -27,7 +27,7 @@
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 1
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 1
 
 using namespace aliceVision;
 
@@ -45,6 +45,7 @@ int aliceVision_main(int argc, char** argv)
     int minInputTrackLength = 2;
     bool filterTrackForks = true;
     bool useOnlyMatchesFromInputFolder = false;
+    bool multithreadedBuild = false;
 
     // user optional parameters
     std::string describerTypesName = feature::EImageDescriberType_enumToString(feature::EImageDescriberType::SIFT);
@@ -78,7 +79,11 @@ int aliceVision_main(int argc, char** argv)
          "Matches folders previously added to the SfMData file will be ignored.")
         ("filterTrackForks", po::value<bool>(&filterTrackForks)->default_value(filterTrackForks),
          "Enable/Disable the track forks removal. "
-         "A track contains a fork when incoherent matches leads to multiple features in the same image for a single track.");
+         "A track contains a fork when incoherent matches leads to multiple features in the same image for a single track.")
+        ("multithreadedBuild", po::value<bool>(&multithreadedBuild)->default_value(multithreadedBuild),
+         "Merge the matches of all the image pairs in parallel. "
+         "The tracks do not depend on the number of threads, but they are numbered differently than with the sequential build, "
+         "so it is disabled by default to keep the outputs unchanged.");
     // clang-format on
 
     CmdLine cmdline("AliceVision tracksBuilding");
@@ -127,7 +132,7 @@ int aliceVision_main(int argc, char** argv)
     // Create tracks
     track::TracksBuilder tracksBuilder;
     ALICEVISION_LOG_INFO("Track building");
-    tracksBuilder.build(pairwiseMatches);
+    tracksBuilder.build(pairwiseMatches, multithreadedBuild);
 
     ALICEVISION_LOG_INFO("Track filtering");
     tracksBuilder.filter(filterTrackForks, minInputTrackLength);
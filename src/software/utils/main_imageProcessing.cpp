@@ -1557,7 +1557,7 @@ int aliceVision_main(int argc, char* argv[])
         LCPdatabase lcpStore(lensCorrectionProfileInfo, lensCorrectionProfileSearchIgnoreCameraModel);
 
         // check sensor database
-        std::vector<sensorDB::Datasheet> sensorDatabase;
+        sensorDB::SensorDatabase sensorDatabase;
         if (pParams.lensCorrection.enabled && (pParams.lensCorrection.geometry || pParams.lensCorrection.chromaticAberration))
         {
             if (sensorDatabasePath.empty())
@@ -21,13 +21,17 @@
 
 #include <iostream>
 #include <fstream>
+#include <map>
+#include <memory>
 #include <string>
 #include <chrono>
+#include <filesystem>
+#include <stdexcept>
 
 // These constants define the current software version.
 // They must be updated when the command line is changed.
 #define ALICEVISION_SOFTWARE_VERSION_MAJOR 1
-#define ALICEVISION_SOFTWARE_VERSION_MINOR 0
+#define ALICEVISION_SOFTWARE_VERSION_MINOR 1
 
 static const int DIMENSION = 128;
 
@@ -35,6 +39,7 @@ using namespace aliceVision;
 
 // using namespace boost::accumulators;
 namespace po = boost::program_options;
+namespace fs = std::filesystem;
 
 typedef aliceVision::feature::Descriptor<float, DIMENSION> DescriptorFloat;
 typedef aliceVision::feature::Descriptor<unsigned char, DIMENSION> DescriptorUChar;
@@ -53,6 +58,7 @@ int aliceVision_main(int argc, char** argv)
     std::uint32_t restart = 5;
     std::uint32_t LEVELS = 6;
     bool sanityCheck = true;
+    bool mapDescriptors = false;
 
     // clang-format off
     po::options_description requiredParams("Required parameters");
@@ -76,7 +82,10 @@ int aliceVision_main(int argc, char** argv)
          "Number of levels of the tree.")
         ("sanitycheck,s", po::value<bool>(&sanityCheck)->default_value(sanityCheck),
          "Perform a sanity check at the end of the creation of the vocabulary tree. "
-         "The sanity check is a query to the database with the same documents/images useed to train the vocabulary tree.");
+         "The sanity check is a query to the database with the same documents/images useed to train the vocabulary tree.")
+        ("mapDescriptors", po::value<bool>(&mapDescriptors)->default_value(mapDescriptors),
+         "Release the training descriptors once the tree is built and quantize the features of each image "
+         "from its memory-mapped descriptor file (unsigned char descriptors only).");
     // clang-format on
 
     CmdLine cmdline(
@@ -118,6 +127,25 @@ int aliceVision_main(int argc, char** argv)
     ALICEVISION_COUT("Done! " << descRead.size() << " sets of descriptors read for a total of " << numTotDescriptors << " features");
     ALICEVISION_COUT("Reading took " << detect_elapsed.count() << " sec");
 
+    // descriptor files in the order used to read the training descriptors
+    std::map<IndexT, std::string> descriptorsFiles;
+    if (mapDescriptors)
+    {
+        aliceVision::voctree::getListOfDescriptorFiles(sfmData, featuresFolders, descriptorsFiles);
+        if (descriptorsFiles.size() != descRead.size())
+            throw std::runtime_error("Cannot map the descriptor files: " + std::to_string(descriptorsFiles.size()) + " files found, " +
+                                     std::to_string(descRead.size()) + " sets of descriptors read.");
+
+        // the features are quantized from the mapped files as unsigned char descriptors
+        std::size_t i = 0;
+        for (const auto& descriptorsFile : descriptorsFiles)
+        {
+            if (fs::file_size(descriptorsFile.second) != sizeof(std::size_t) + descRead[i++] * sizeof(DescriptorUChar))
+                throw std::runtime_error("Cannot map the descriptor file '" + descriptorsFile.second +
+                                         "': only unsigned char descriptors can be memory-mapped, disable mapDescriptors.");
+        }
+    }
+
     // Create tree
     aliceVision::voctree::TreeBuilder<DescriptorFloat> builder(DescriptorFloat(0));
     builder.setVerbose(tbVerbosity);
@@ -132,6 +160,11 @@ int aliceVision_main(int argc, char** argv)
     ALICEVISION_COUT("Saving vocabulary tree as " << treeName);
     builder.tree().save(treeName);
 
+    // the training descriptors are not needed anymore, the features are read from the mapped files
+    if (mapDescriptors)
+        std::vector<DescriptorFloat>().swap(descriptors);
+    auto descriptorsFileIt = descriptorsFiles.begin();
+
     aliceVision::voctree::SparseHistogramPerImage allSparseHistograms;
     // temporary vector used to save all the visual word for each image before adding them to documents
     std::vector<aliceVision::voctree::Word> imgVisualWords;
@@ -148,11 +181,31 @@ int aliceVision_main(int argc, char** argv)
         // allocate as many visual words as the number of the features in the image
         imgVisualWords.resize(descRead[i], 0);
 
+        std::shared_ptr<const DescriptorUChar> mappedDescriptors;
+        if (mapDescriptors)
+        {
+            const std::string& descriptorsFile = (descriptorsFileIt++)->second;
+            std::size_t mappedCount = 0;
+            mappedDescriptors = aliceVision::feature::mapDescsFromBinFile<DescriptorUChar>(descriptorsFile, mappedCount);
+            if (mappedCount != descRead[i])
+                throw std::runtime_error("The descriptor file '" + descriptorsFile + "' contains " + std::to_string(mappedCount) +
+                                         " descriptors, " + std::to_string(descRead[i]) + " were read to build the tree.");
+        }
+
 #pragma omp parallel for
         for (ptrdiff_t j = 0; j < static_cast<ptrdiff_t>(descRead[i]); ++j)
         {
             //	store the visual word associated to the feature in the temporary list
-            imgVisualWords[j] = builder.tree().quantize(descriptors[j + offset]);
+            if (mappedDescriptors)
+            {
+                DescriptorFloat descriptor;
+                aliceVision::feature::convertDesc(mappedDescriptors.get()[j], descriptor);
+                imgVisualWords[j] = builder.tree().quantize(descriptor);
+            }
+            else
+            {
+                imgVisualWords[j] = builder.tree().quantize(descriptors[j + offset]);
+            }
         }
         aliceVision::voctree::SparseHistogram histo;
         aliceVision::voctree::computeSparseHistogram(imgVisualWords, histo);